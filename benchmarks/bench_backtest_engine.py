@@ -0,0 +1,177 @@
+"""
+참조 백테스트 엔진/서버 처리량 및 진행 스트림 오버헤드 벤치마크.
+
+1. 엔진: 합성 일봉에 대한 run_backtest (벡터화) 와 바 단위 Python 루프 구현의 초당 실행 수
+2. 서버: 백그라운드 참조 서버에 클라이언트 여러 개가 ExecuteBacktest → StreamBacktestProgress
+   (종료까지) → GetBacktestResult 를 반복할 때의 초당 작업 수와 작업당 지연.
+   중간 진행 이벤트 없음 / 이벤트마다 current_metrics / metrics_every_n 및 conflation 적용을
+   비교해 진행 스트림 오버헤드를 측정합니다.
+
+실행:
+    python benchmarks/bench_backtest_engine.py --jobs 200 --clients 8 --workers 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import grpc
+import numpy as np
+
+from mysingle_protos.backtest.engine import EngineConfig, run_backtest, serve_in_background
+from mysingle_protos.backtest.progress import follow_progress
+from mysingle_protos.market_data.synthetic import SyntheticConfig, SyntheticMarketData
+from mysingle_protos.protos.services.backtest.v1 import backtest_service_pb2 as bt_pb2
+from mysingle_protos.protos.services.backtest.v1 import backtest_service_pb2_grpc as bt_grpc
+
+
+def backtest_config() -> bt_pb2.BacktestConfig:
+    return bt_pb2.BacktestConfig(
+        symbol="AAPL",
+        interval="1d",
+        initial_capital=100_000.0,
+        slippage_bps=5.0,
+        commission_per_trade=1.0,
+        stop_loss_pct=5.0,
+        take_profit_pct=15.0,
+        params={"fast": "10", "slow": "30"},
+    )
+
+
+def loop_backtest(close: np.ndarray, config: bt_pb2.BacktestConfig) -> float:
+    """바 단위 루프 구현 (동일 규칙, 최종 자산만 계산)"""
+    fast, slow = int(config.params["fast"]), int(config.params["slow"])
+    slip = config.slippage_bps / 10_000.0
+    fee = config.commission_per_trade
+    cash, quantity, entry, blocked, previous = config.initial_capital, 0.0, 0.0, False, False
+    for t in range(len(close)):
+        on = t >= slow - 1 and (
+            close[t - fast + 1 : t + 1].mean() > close[t - slow + 1 : t + 1].mean()
+        )
+        if quantity > 0:
+            move = (close[t] / entry - 1.0) * 100.0
+            if not on or move <= -config.stop_loss_pct or move >= config.take_profit_pct:
+                cash += quantity * close[t] * (1.0 - slip) - fee
+                quantity, blocked = 0.0, on
+        elif on and not previous and not blocked:
+            price = close[t] * (1.0 + slip)
+            quantity = (cash - fee) / price
+            cash, entry = 0.0, close[t]
+        blocked = blocked and on
+        previous = on
+    return cash + quantity * close[-1]
+
+
+def bench_engine(args: argparse.Namespace) -> None:
+    data = SyntheticMarketData(SyntheticConfig(seed=args.seed, history_bars=args.bars))
+    bars = data.ohlcv("AAPL")
+    timestamp = bars.timestamp.astype("datetime64[ns]").astype(np.int64)
+    close = bars.close
+    config = backtest_config()
+
+    result = run_backtest(config, timestamp, close)
+    expected = loop_backtest(close, config)
+    assert abs(result.equity["equity"][-1] - expected) < 1e-6 * expected
+
+    print(f"engine ({len(close)} bars)")
+    for name, run in (
+        ("vectorized", lambda: run_backtest(config, timestamp, close)),
+        ("loop", lambda: loop_backtest(close, config)),
+    ):
+        count = args.engine_runs if name == "vectorized" else max(1, args.engine_runs // 20)
+        started = time.perf_counter()
+        for _ in range(count):
+            run()
+        elapsed = time.perf_counter() - started
+        print(f"  {name:<12} {count / elapsed:>10.1f} runs/s")
+
+
+def run_job(
+    stub: bt_grpc.BacktestServiceStub,
+    config: bt_pb2.BacktestConfig,
+    progress: bt_pb2.StreamProgressRequest,
+    user_id: str,
+) -> tuple[float, int]:
+    started = time.perf_counter()
+    job = stub.ExecuteBacktest(
+        # 같은 설정을 반복 실행하므로 메모이제이션을 우회
+        bt_pb2.ExecuteBacktestRequest(
+            user_id=user_id, strategy_id="sma_crossover", config=config, force_rerun=True
+        )
+    )
+    request = bt_pb2.StreamProgressRequest()
+    request.CopyFrom(progress)
+    request.backtest_id = job.backtest_id
+    request.user_id = user_id
+    updates = sum(1 for _ in follow_progress(stub, request))
+    stub.GetBacktestResult(
+        bt_pb2.GetBacktestResultRequest(
+            backtest_id=job.backtest_id,
+            user_id=user_id,
+            encoding=bt_pb2.RESULT_ENCODING_COLUMNAR,
+        )
+    )
+    return time.perf_counter() - started, updates
+
+
+def bench_server(args: argparse.Namespace) -> None:
+    config = backtest_config()
+    scenarios = (
+        ("no progress", 0, bt_pb2.StreamProgressRequest()),
+        ("every update", args.progress_updates, bt_pb2.StreamProgressRequest()),
+        (
+            "conflated",
+            args.progress_updates,
+            bt_pb2.StreamProgressRequest(min_progress_delta=25.0, metrics_every_n=5),
+        ),
+    )
+    print(f"server ({args.jobs} jobs, {args.clients} clients, {args.workers} workers)")
+    print(f"  {'scenario':<14} {'jobs/s':>8} {'p50_ms':>8} {'p95_ms':>8} {'updates':>8}")
+    for name, progress_updates, progress in scenarios:
+        engine = EngineConfig(
+            workers=args.workers,
+            progress_updates=progress_updates,
+            market_data=SyntheticConfig(seed=args.seed, history_bars=args.bars),
+        )
+        with serve_in_background(engine) as server:
+            channel = grpc.insecure_channel(server.address)
+            stub = bt_grpc.BacktestServiceStub(channel)
+            # 가격 캐시/채널 예열
+            run_job(stub, config, progress, "warmup")
+            started = time.perf_counter()
+            with ThreadPoolExecutor(args.clients) as pool:
+                outcomes = list(
+                    pool.map(
+                        lambda i: run_job(stub, config, progress, f"user-{i % args.clients}"),
+                        range(args.jobs),
+                    )
+                )
+            elapsed = time.perf_counter() - started
+            channel.close()
+        latencies = np.array([latency for latency, _ in outcomes]) * 1000.0
+        updates = np.mean([count for _, count in outcomes])
+        print(
+            f"  {name:<14} {args.jobs / elapsed:>8.1f} {np.percentile(latencies, 50):>8.1f}"
+            f" {np.percentile(latencies, 95):>8.1f} {updates:>8.1f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--bars", type=int, default=1260)
+    parser.add_argument("--engine-runs", type=int, default=200)
+    parser.add_argument("--jobs", type=int, default=200)
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--progress-updates", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    bench_engine(args)
+    bench_server(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+백테스트 작업 스케줄러 lane 보호 벤치마크.
+
+여러 사용자의 대량 스윕(BATCH)이 워커를 채운 상태에서 단건 실행(INTERACTIVE)이 주기적으로
+도착할 때, 모든 작업을 한 lane(FIFO)에 넣는 경우와 lane/예약 워커를 적용한 경우의
+INTERACTIVE 시작 지연(p50/p95)과 BATCH 처리량을 비교합니다. 작업은 asyncio.sleep 으로 모사합니다.
+
+실행:
+    python benchmarks/bench_backtest_queue.py --workers 8 --batch-jobs 400
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import time
+
+from mysingle_protos.backtest.scheduler import BacktestScheduler, Lane
+
+
+async def scenario(args: argparse.Namespace, lanes: bool) -> tuple[list[float], float]:
+    scheduler = BacktestScheduler(
+        args.workers, reserved_interactive=args.reserved if lanes else 0
+    )
+    rng = random.Random(args.seed)
+    waits: list[float] = []
+
+    def job(duration: float):
+        async def run() -> None:
+            await asyncio.sleep(duration)
+
+        return run
+
+    started = time.perf_counter()
+    batch = []
+    for i in range(args.batch_jobs):
+        user = f"optimizer-{i % args.batch_users}"
+        duration = rng.uniform(0.5, 1.5) * args.batch_ms / 1000.0
+        batch.append(scheduler.submit(f"b{i}", user, job(duration), Lane.BATCH))
+
+    async def interactive(i: int) -> None:
+        submitted = time.perf_counter()
+        lane = Lane.INTERACTIVE if lanes else Lane.BATCH
+
+        async def run() -> None:
+            waits.append((time.perf_counter() - submitted) * 1000.0)
+            await asyncio.sleep(args.interactive_ms / 1000.0)
+
+        await scheduler.submit(f"i{i}", f"user-{i % 10}", run, lane)
+
+    tasks = []
+    for i in range(args.interactive_jobs):
+        tasks.append(asyncio.create_task(interactive(i)))
+        await asyncio.sleep(args.interval_ms / 1000.0)
+    await asyncio.gather(*tasks, *batch)
+    return waits, args.batch_jobs / (time.perf_counter() - started)
+
+
+def percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[max(0, int(round(q / 100.0 * len(ordered))) - 1)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--reserved", type=int, default=1)
+    parser.add_argument("--batch-jobs", type=int, default=400)
+    parser.add_argument("--batch-users", type=int, default=3)
+    parser.add_argument("--batch-ms", type=float, default=40.0)
+    parser.add_argument("--interactive-jobs", type=int, default=60)
+    parser.add_argument("--interactive-ms", type=float, default=20.0)
+    parser.add_argument("--interval-ms", type=float, default=30.0)
+    parser.add_argument("--seed", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'mode':<8} {'p50_ms':>8} {'p95_ms':>8} {'max_ms':>8} {'batch/s':>8}")
+    for name, lanes in (("fifo", False), ("lanes", True)):
+        waits, throughput = asyncio.run(scenario(args, lanes))
+        print(
+            f"{name:<8} {percentile(waits, 50):>8.1f} {percentile(waits, 95):>8.1f}"
+            f" {max(waits):>8.1f} {throughput:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+파라미터 스윕 처리량 벤치마크.
+
+SMA 교차 전략의 (fast, slow) 그리드를 다음 세 방식으로 실행해 비교합니다.
+
+- naive: 변형마다 OHLCV 응답을 디코딩/변환 후 실행 (ExecuteBacktest 반복 호출과 동일한 비용)
+- sweep(1): 데이터 1회 로드, 워커 1개
+- sweep(N): 데이터 1회 로드, 공유 메모리 + 워커 N개
+
+실행:
+    python benchmarks/bench_backtest_sweep.py --bars 200000 --workers 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+
+import numpy as np
+
+from mysingle_protos.backtest.sweep import expand_variants, run_sweep
+from mysingle_protos.market_data.resample import OHLCVArrays
+from mysingle_protos.protos.services.backtest.v1 import backtest_service_pb2 as bt_pb2
+from mysingle_protos.protos.services.market_data.v1 import market_data_service_pb2 as md_pb2
+
+
+def build_payload(n: int, seed: int) -> bytes:
+    """합성 분봉 OHLCVResponse 직렬화 바이트 (서비스가 매번 로드하는 데이터 역할)"""
+    rng = np.random.default_rng(seed)
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0, 0.001, n)))
+    stamps = np.datetime64("2020-01-01T00:00", "s") + np.arange(n) * np.timedelta64(60, "s")
+    response = md_pb2.OHLCVResponse(symbol="SYN", interval="1min")
+    for ts, price in zip(np.datetime_as_string(stamps).tolist(), close.tolist()):
+        response.bars.add(timestamp=ts, open=price, high=price, low=price, close=price)
+    return response.SerializeToString()
+
+
+def load(payload: bytes) -> dict[str, np.ndarray]:
+    data = OHLCVArrays.from_bars(md_pb2.OHLCVResponse.FromString(payload).bars)
+    return {"close": data.close}
+
+
+def sma_cross(data: dict[str, np.ndarray], context, config: bt_pb2.BacktestConfig) -> float:
+    """SMA 교차 전략 총수익률"""
+    close = data["close"]
+    fast, slow = int(config.params["fast"]), int(config.params["slow"])
+    csum = np.concatenate(([0.0], np.cumsum(close)))
+    fast_ma = (csum[slow:] - csum[slow - fast : -fast]) / fast
+    slow_ma = (csum[slow:] - csum[:-slow]) / slow
+    position = (fast_ma > slow_ma).astype(np.float64)[:-1]
+    returns = np.diff(np.log(close[slow - 1 :]))
+    return float(np.expm1(np.sum(position * returns)))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--bars", type=int, default=200_000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seed", type=int, default=5)
+    args = parser.parse_args()
+
+    payload = build_payload(args.bars, args.seed)
+    request = bt_pb2.ExecuteBacktestSweepRequest(strategy_id="sma-cross")
+    request.grid.add(name="fast", values=[str(v) for v in range(5, 55, 5)])
+    request.grid.add(name="slow", values=[str(v) for v in range(60, 260, 20)])
+    configs = [config for _, config in expand_variants(request)]
+    print(f"{len(configs)} variants, {args.bars} bars, payload {len(payload) / 1e6:.1f}MB")
+
+    started = time.perf_counter()
+    naive = [sma_cross(load(payload), None, config) for config in configs]
+    elapsed = time.perf_counter() - started
+    print(f"{'naive':<12} {elapsed:8.2f}s  {len(configs) / elapsed:8.1f} variants/s")
+
+    for workers in sorted({1, args.workers}):
+        started = time.perf_counter()
+        data = load(payload)
+        results = [None] * len(configs)
+        for outcome in run_sweep(sma_cross, configs, data, max_workers=workers):
+            results[outcome.index] = outcome.result
+        elapsed = time.perf_counter() - started
+        assert np.allclose(results, naive)
+        print(
+            f"{f'sweep({workers})':<12} {elapsed:8.2f}s  {len(configs) / elapsed:8.1f} variants/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
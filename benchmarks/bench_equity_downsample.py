@@ -0,0 +1,110 @@
+"""
+자산곡선 다운샘플링 정확도/크기 벤치마크.
+
+합성 자산곡선(기본 1,000,000 점)을 방식별/목표 점 수별로 줄이고 다음을 측정합니다.
+
+- 처리 시간, 결과 점 수, 직렬화 크기(EquityPoint 기준 추정)
+- MDD 보존 여부 (원본과 축소 곡선의 최대 낙폭 일치)
+- 픽셀 열 envelope 오차: 차트 폭(기본 1,000 px) 열마다 원본 min/max 와 축소 곡선 min/max 의
+  차이를 전체 값 범위 대비 비율로 평균
+- 선형 보간 RMSE (전체 값 범위 대비)
+
+실행:
+    python benchmarks/bench_equity_downsample.py --points 1000000 --width 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+
+from mysingle_protos.backtest.downsample import METHODS, downsample_indices, drawdown_extremes
+
+
+def synthetic_equity(n: int, seed: int) -> tuple[np.ndarray, np.ndarray]:
+    """분봉 간격의 합성 자산곡선 (급락 구간 포함)"""
+    rng = np.random.default_rng(seed)
+    returns = rng.normal(0.00001, 0.0008, n)
+    crash = rng.integers(n // 4, 3 * n // 4)
+    returns[crash : crash + n // 200] -= 0.0001
+    equity = 100_000.0 * np.exp(np.cumsum(returns))
+    timestamp = np.datetime64("2020-01-01T00:00:00", "ns").astype(np.int64) + np.arange(
+        n, dtype=np.int64
+    ) * 60_000_000_000
+    return timestamp, equity
+
+
+def max_drawdown(equity: np.ndarray) -> float:
+    peak, trough = drawdown_extremes(equity)
+    return float(equity[trough] / equity[peak] - 1.0)
+
+
+def envelope_error(
+    timestamp: np.ndarray, equity: np.ndarray, index: np.ndarray, width: int
+) -> float:
+    """픽셀 열별 min/max 차이의 평균 (값 범위 대비)"""
+    span = timestamp[-1] - timestamp[0] + 1
+    column = ((timestamp - timestamp[0]) * width // span).astype(np.int64)
+    full_min = np.full(width, np.inf)
+    full_max = np.full(width, -np.inf)
+    np.minimum.at(full_min, column, equity)
+    np.maximum.at(full_max, column, equity)
+
+    # 축소 곡선은 선분으로 그려지므로 보간 값으로 열별 min/max 계산
+    interpolated = np.interp(timestamp, timestamp[index], equity[index])
+    reduced_min = np.full(width, np.inf)
+    reduced_max = np.full(width, -np.inf)
+    np.minimum.at(reduced_min, column, interpolated)
+    np.maximum.at(reduced_max, column, interpolated)
+
+    valid = np.isfinite(full_min)
+    value_range = equity.max() - equity.min()
+    error = np.abs(full_min[valid] - reduced_min[valid]) + np.abs(
+        full_max[valid] - reduced_max[valid]
+    )
+    return float(error.mean() / 2 / value_range)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--points", type=int, default=1_000_000)
+    parser.add_argument("--width", type=int, default=1000)
+    parser.add_argument("--targets", type=int, nargs="+", default=[500, 1000, 2000, 4000])
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    timestamp, equity = synthetic_equity(args.points, args.seed)
+    value_range = equity.max() - equity.min()
+    full_mdd = max_drawdown(equity)
+    # EquityPoint 1개 ≈ Timestamp(~11B) + double 4개(36B) + 태그/길이
+    point_bytes = 52
+    print(
+        f"full curve: {args.points} points, ~{args.points * point_bytes / 1e6:.1f}MB,"
+        f" mdd={full_mdd:.4%}"
+    )
+    print(
+        f"{'method':<8} {'target':>6} {'points':>6} {'time_ms':>8} {'size_kb':>8}"
+        f" {'mdd_ok':>6} {'env_err':>9} {'rmse':>9}"
+    )
+    for method in METHODS:
+        for target in args.targets:
+            started = time.perf_counter()
+            index = downsample_indices(timestamp, equity, target, method)
+            elapsed = (time.perf_counter() - started) * 1e3
+
+            reduced = equity[index]
+            interpolated = np.interp(timestamp, timestamp[index], reduced)
+            rmse = float(np.sqrt(np.mean((interpolated - equity) ** 2)) / value_range)
+            mdd_ok = np.isclose(max_drawdown(reduced), full_mdd, rtol=0, atol=1e-12)
+            env = envelope_error(timestamp, equity, index, args.width)
+            print(
+                f"{method:<8} {target:>6} {len(index):>6} {elapsed:>8.1f}"
+                f" {len(index) * point_bytes / 1e3:>8.1f} {str(mdd_ok):>6}"
+                f" {env:>9.5f} {rmse:>9.5f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Monte Carlo 거래 리샘플링 벤치마크.
+
+합성 청산 거래 pnl 에 대해 반복마다 random.shuffle 과 Python 루프로 최대 낙폭/최종 자산을
+구하는 기존 방식과 mysingle_protos.backtest.montecarlo 의 일괄 NumPy 계산을 비교합니다.
+Python 기준은 --python-iterations 만큼만 실행해 전체 반복 수로 환산합니다.
+
+실행:
+    python benchmarks/bench_monte_carlo.py --trades 2000 --iterations 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+import numpy as np
+
+from mysingle_protos.backtest.montecarlo import monte_carlo
+from mysingle_protos.protos.services.backtest.v1 import backtest_service_pb2 as bt_pb2
+
+INITIAL_EQUITY = 100_000.0
+
+
+def python_shuffle(pnl: list[float], iterations: int, seed: int) -> tuple[list[float], list[float]]:
+    """반복마다 섞고 순회하는 순수 Python 기준"""
+    rng = random.Random(seed)
+    drawdowns, finals = [], []
+    for _ in range(iterations):
+        sample = pnl[:]
+        rng.shuffle(sample)
+        equity = peak = INITIAL_EQUITY
+        worst = 0.0
+        for value in sample:
+            equity += value
+            peak = max(peak, equity)
+            worst = min(worst, equity / peak - 1.0)
+        drawdowns.append(worst * 100.0)
+        finals.append(equity)
+    return drawdowns, finals
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--trades", type=int, default=2000)
+    parser.add_argument("--iterations", type=int, default=10_000)
+    parser.add_argument("--python-iterations", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    pnl = np.random.default_rng(args.seed).normal(20.0, 500.0, args.trades)
+
+    started = time.perf_counter()
+    python_drawdowns, _ = python_shuffle(pnl.tolist(), args.python_iterations, args.seed)
+    python_s = (time.perf_counter() - started) * args.iterations / args.python_iterations
+
+    print(f"trades={args.trades} iterations={args.iterations}")
+    print(f"{'method':<28} {'seconds':>8} {'mdd_p5':>8} {'mdd_p50':>8} {'final_p50':>10}")
+    print(
+        f"{'python shuffle (scaled)':<28} {python_s:>8.2f} "
+        f"{np.percentile(python_drawdowns, 5):>8.2f} {np.percentile(python_drawdowns, 50):>8.2f}"
+        f" {INITIAL_EQUITY + pnl.sum():>10.0f}"
+    )
+    for method in (
+        bt_pb2.MONTE_CARLO_METHOD_TRADE_SHUFFLE,
+        bt_pb2.MONTE_CARLO_METHOD_BLOCK_BOOTSTRAP,
+        bt_pb2.MONTE_CARLO_METHOD_RETURN_RESAMPLING,
+    ):
+        values = pnl
+        if method == bt_pb2.MONTE_CARLO_METHOD_RETURN_RESAMPLING:
+            values = pnl / INITIAL_EQUITY
+        started = time.perf_counter()
+        result = monte_carlo(
+            values,
+            method,
+            INITIAL_EQUITY,
+            iterations=args.iterations,
+            seed=args.seed,
+            percentiles=(5, 50),
+        )
+        elapsed = time.perf_counter() - started
+        name = bt_pb2.MonteCarloMethod.Name(method).removeprefix("MONTE_CARLO_METHOD_").lower()
+        print(
+            f"{'numpy ' + name:<28} {elapsed:>8.2f} {result.max_drawdown[0]:>8.2f} "
+            f"{result.max_drawdown[1]:>8.2f} {result.final_equity[1]:>10.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+OHLCV 아카이브 랜덤 심볼 접근 벤치마크.
+
+5,000 심볼 스냅샷을 압축 방식별 아카이브로 기록한 뒤, 임의 심볼 조회 지연을
+BatchGetDailyOHLCVResponse 단일 메시지 전체 디코딩과 비교합니다.
+
+실행:
+    python benchmarks/bench_ohlcv_archive.py --symbols 5000 --bars 1260 --lookups 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+from mysingle_protos.market_data.archive import ArchiveReader, ArchiveWriter
+from mysingle_protos.protos.services.market_data.v1 import market_data_service_pb2 as md_pb2
+
+
+def build_snapshot(n_symbols: int, n_bars: int, seed: int) -> md_pb2.BatchGetDailyOHLCVResponse:
+    """합성 일봉 스냅샷 생성"""
+    rng = random.Random(seed)
+    start = date(2020, 1, 1)
+    days = [(start + timedelta(days=i)).isoformat() for i in range(n_bars)]
+    response = md_pb2.BatchGetDailyOHLCVResponse()
+    for i in range(n_symbols):
+        item = response.data.add(symbol=f"SYM{i:05d}")
+        price = rng.uniform(10, 500)
+        for day in days:
+            change = rng.gauss(0, 0.02)
+            close = price * (1 + change)
+            item.bars.add(
+                timestamp=day,
+                open=price,
+                high=max(price, close) * 1.01,
+                low=min(price, close) * 0.99,
+                close=close,
+                volume=rng.randint(1_000, 5_000_000),
+            )
+            price = close
+    return response
+
+
+def timed(fn) -> float:
+    started = time.perf_counter()
+    fn()
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--symbols", type=int, default=5000)
+    parser.add_argument("--bars", type=int, default=1260)
+    parser.add_argument("--lookups", type=int, default=500)
+    parser.add_argument("--block-size", type=int, default=1 << 16)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    print(f"building snapshot: {args.symbols} symbols x {args.bars} bars")
+    snapshot = build_snapshot(args.symbols, args.bars, args.seed)
+    blob = snapshot.SerializeToString()
+    symbols = [item.symbol for item in snapshot.data]
+    wanted = random.Random(args.seed).choices(symbols, k=args.lookups)
+
+    full = timed(lambda: md_pb2.BatchGetDailyOHLCVResponse.FromString(blob))
+    print(
+        f"{'baseline (full decode)':<24} size={len(blob) / 1e6:8.1f}MB"
+        f"  decode={full * 1e3:8.1f}ms"
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for compression in ("none", "zlib", "lzma"):
+            path = Path(tmp) / f"snapshot-{compression}.msa"
+            started = time.perf_counter()
+            with ArchiveWriter(path, compression=compression, block_size=args.block_size) as w:
+                for item in snapshot.data:
+                    w.write(item)
+            write = time.perf_counter() - started
+
+            started = time.perf_counter()
+            reader = ArchiveReader(path)
+            open_ms = (time.perf_counter() - started) * 1e3
+            # 블록 캐시 효과를 배제한 개별 조회 지연
+            latencies = []
+            for symbol in wanted:
+                reader._blocks.clear()
+                latencies.append(timed(lambda: reader.get(symbol)) * 1e3)
+            batch = timed(lambda: reader.read(wanted))
+            reader.close()
+
+            latencies.sort()
+            p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+            print(
+                f"{'archive/' + compression:<24} size={path.stat().st_size / 1e6:8.1f}MB"
+                f"  write={write:6.2f}s  open={open_ms:6.1f}ms"
+                f"  get p50={statistics.median(latencies):6.3f}ms p99={p99:6.3f}ms"
+                f"  read({args.lookups})={batch * 1e3:8.1f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
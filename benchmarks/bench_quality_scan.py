@@ -0,0 +1,127 @@
+"""
+OHLCV 품질 검사 스파이크 탐지 벤치마크.
+
+10,000 심볼 유니버스(일부는 상장 직후의 짧은 이력)의 평탄화 배열에 알려진 위치의 종가 스파이크를
+넣고, scan_arrays 전체 검사(robust z-score, 중앙값/MAD) 소요 시간과 스파이크 재현율/오탐 수를
+심볼 전체 평균/표준편차 z-score 기준선(스파이크 탐지만)과 비교합니다.
+
+실행:
+    python benchmarks/bench_quality_scan.py --symbols 10000 --bars 1260 --short-share 0.2
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+
+from mysingle_protos.market_data.quality import scan_arrays
+from mysingle_protos.market_data.resample import Interval
+
+
+def build_universe(
+    n_symbols: int, n_bars: int, short_share: float, spikes_per_symbol: int, seed: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """(lengths, timestamp, close, 스파이크 행) 생성"""
+    rng = np.random.default_rng(seed)
+    lengths = np.full(n_symbols, n_bars, dtype=np.int64)
+    short = rng.random(n_symbols) < short_share
+    lengths[short] = rng.integers(8, 40, int(short.sum()))
+    offsets = np.concatenate(([0], np.cumsum(lengths)))
+    total = int(offsets[-1])
+
+    days = np.busday_offset(np.datetime64("2020-01-01"), np.arange(n_bars), roll="forward")
+    within = np.arange(total) - np.repeat(offsets[:-1], lengths)
+    timestamp = days[within].astype("datetime64[s]")
+
+    returns = rng.normal(0.0, 0.02, total)
+    # 스파이크: 심볼마다 첫 수익률 이후 임의 위치에 +-30~60% 급등락
+    picks = [
+        offsets[i] + rng.choice(np.arange(1, lengths[i]), spikes_per_symbol, replace=False)
+        for i in range(n_symbols)
+        if lengths[i] > spikes_per_symbol
+    ]
+    spike_rows = np.sort(np.concatenate(picks))
+    returns[spike_rows] = rng.choice([-1.0, 1.0], len(spike_rows)) * rng.uniform(
+        0.3, 0.6, len(spike_rows)
+    )
+    returns[offsets[:-1]] = 0.0
+    log_close = np.cumsum(returns)
+    log_close -= np.repeat(log_close[offsets[:-1]], lengths)
+    close = np.repeat(rng.uniform(10, 500, n_symbols), lengths) * np.exp(log_close)
+    return lengths, timestamp, close, spike_rows
+
+
+def classic_spikes(lengths: np.ndarray, close: np.ndarray, z_threshold: float) -> np.ndarray:
+    """기준선: 심볼 전체 평균/표준편차 z-score"""
+    segment = np.repeat(np.arange(len(lengths)), lengths)
+    pair = np.flatnonzero(segment[1:] == segment[:-1]) + 1
+    returns = np.log(close[pair] / close[pair - 1])
+    seg = segment[pair]
+    count = np.bincount(seg, minlength=len(lengths))
+    mean = np.bincount(seg, weights=returns, minlength=len(lengths)) / np.maximum(count, 1)
+    total_sq = np.bincount(seg, weights=returns * returns, minlength=len(lengths))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        std = np.sqrt(np.maximum((total_sq - count * mean * mean) / (count - 1), 0.0))
+        z = np.abs(returns - mean[seg]) / std[seg]
+    return pair[(count[seg] >= 3) & (std[seg] > 0) & (z > z_threshold)]
+
+
+def report(
+    name: str, seconds: float, found: np.ndarray, truth: np.ndarray, short: np.ndarray
+) -> None:
+    hit = np.isin(truth, found)
+    short_truth = np.isin(truth, short)
+    false_positives = int((~np.isin(found, truth)).sum())
+    print(
+        f"{name:<12} time={seconds * 1e3:8.1f}ms  recall={hit.mean():6.1%}"
+        f"  recall(short)={hit[short_truth].mean():6.1%}  false_positives={false_positives}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--symbols", type=int, default=10_000)
+    parser.add_argument("--bars", type=int, default=1260)
+    parser.add_argument("--short-share", type=float, default=0.2)
+    parser.add_argument("--spikes", type=int, default=2)
+    parser.add_argument("--z", type=float, default=5.0)
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    lengths, timestamp, close, truth = build_universe(
+        args.symbols, args.bars, args.short_share, args.spikes, args.seed
+    )
+    high, low = close * 1.01, close * 0.99
+    symbols = [f"SYM{i:05d}" for i in range(args.symbols)]
+    offsets = np.concatenate(([0], np.cumsum(lengths)))
+    short_rows = np.concatenate(
+        [np.arange(offsets[i], offsets[i + 1]) for i in np.flatnonzero(lengths < args.bars)]
+        or [np.empty(0, dtype=np.int64)]
+    )
+    print(
+        f"universe: {args.symbols} symbols, {int(lengths.sum())} bars,"
+        f" {int((lengths < args.bars).sum())} short histories, {len(truth)} spikes"
+    )
+
+    interval = Interval.parse("1d")
+    # 첫 실행은 메모리 할당 워밍업
+    for _ in range(args.repeat + 1):
+        started = time.perf_counter()
+        result = scan_arrays(
+            symbols, lengths, timestamp, high, low, close, interval, z_threshold=args.z
+        )
+        scan_seconds = time.perf_counter() - started
+    report("scan_arrays", scan_seconds, result.rows["spikes"], truth, short_rows)
+
+    for _ in range(args.repeat + 1):
+        started = time.perf_counter()
+        found = classic_spikes(lengths, close, args.z)
+        classic_seconds = time.perf_counter() - started
+    report("mean/std", classic_seconds, found, truth, short_rows)
+
+
+if __name__ == "__main__":
+    main()
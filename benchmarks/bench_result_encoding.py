@@ -0,0 +1,98 @@
+"""
+백테스트 결과 행/열 인코딩 비교 벤치마크.
+
+합성 자산곡선(기본 1,000,000 점)과 거래(기본 100,000 건)를 행 형식(Trade / EquityPoint)과
+열 형식(TradeColumns / EquityColumns)으로 직렬화하고 다음을 측정합니다.
+
+- 직렬화 크기
+- 행 형식: 메시지 파싱 + NumPy 구조화 배열 변환 시간
+- 열 형식: 메시지 파싱 + 열 뷰 시간, 직렬화 바이트에 대한 zero-copy 뷰 시간
+
+실행:
+    python benchmarks/bench_result_encoding.py --points 1000000 --trades 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+
+from mysingle_protos.backtest.columnar import result_views, to_columnar
+from mysingle_protos.backtest.stream import _equity_rows, _trade_rows
+from mysingle_protos.protos.services.backtest.v1 import backtest_service_pb2 as bt_pb2
+
+
+def synthetic_result(points: int, trades: int, seed: int) -> bt_pb2.BacktestResultResponse:
+    """행 형식 합성 결과"""
+    rng = np.random.default_rng(seed)
+    start = 1_577_836_800
+    equity = 100_000.0 * np.exp(np.cumsum(rng.normal(0.00001, 0.0008, points)))
+    result = bt_pb2.BacktestResultResponse(backtest_id="bt-bench", status="completed")
+    for i, value in enumerate(equity.tolist()):
+        point = result.equity_curve.add(equity=value, drawdown=-0.01, cash=value * 0.2)
+        point.positions_value = value * 0.8
+        point.timestamp.seconds = start + i * 60
+    symbols = [f"SYM{i:03d}" for i in range(50)]
+    for i in range(trades):
+        trade = result.trades.add(
+            symbol=symbols[i % len(symbols)],
+            side="BUY" if i % 2 == 0 else "SELL",
+            quantity=10.0,
+            price=100.0 + i % 7,
+            pnl=float(i % 13 - 6),
+            commission=0.1,
+        )
+        trade.timestamp.seconds = start + i * 600
+    return result
+
+
+def timed(fn, repeat: int = 3) -> tuple[float, object]:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        value = fn()
+        best = min(best, time.perf_counter() - started)
+    return best * 1e3, value
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--points", type=int, default=1_000_000)
+    parser.add_argument("--trades", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=5)
+    args = parser.parse_args()
+
+    result = synthetic_result(args.points, args.trades, args.seed)
+    rows_bytes = result.SerializeToString()
+    encode_ms, columnar = timed(lambda: to_columnar(result), repeat=1)
+    columnar_bytes = columnar.SerializeToString()
+
+    def decode_rows():
+        message = bt_pb2.BacktestResultResponse.FromString(rows_bytes)
+        return _trade_rows(message.trades, {}), _equity_rows(message.equity_curve)
+
+    def decode_columns():
+        return result_views(bt_pb2.BacktestResultResponse.FromString(columnar_bytes))
+
+    rows_ms, (trade_rows, equity_rows) = timed(decode_rows, repeat=1)
+    columns_ms, _ = timed(decode_columns)
+    view_ms, (trade_cols, equity_cols) = timed(lambda: result_views(columnar_bytes))
+
+    for expected, actual in (
+        (equity_rows, equity_cols.to_records()),
+        (trade_rows, trade_cols.to_records({})),
+    ):
+        for name in expected.dtype.names:
+            assert np.array_equal(expected[name], actual[name], equal_nan=True), name
+
+    print(f"points={args.points} trades={args.trades} (row->columnar encode {encode_ms:.0f}ms)")
+    print(f"{'encoding':<20} {'size_mb':>8} {'decode_ms':>10}")
+    print(f"{'rows':<20} {len(rows_bytes) / 1e6:>8.1f} {rows_ms:>10.1f}")
+    print(f"{'columnar (message)':<20} {len(columnar_bytes) / 1e6:>8.1f} {columns_ms:>10.1f}")
+    print(f"{'columnar (zero-copy)':<20} {len(columnar_bytes) / 1e6:>8.1f} {view_ms:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
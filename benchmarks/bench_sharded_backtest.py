@@ -0,0 +1,107 @@
+"""
+시간 구간 분할(샤드) 백테스트 벤치마크.
+
+합성 분봉 수준의 긴 가격 시계열에 대해 분할하지 않은 run_backtest 와 backtest.shard.run_sharded
+(프로세스 풀, parallelism 별) 의 실행 시간과 결과 일치 여부를 비교합니다.
+
+- sma_crossover: 누적합 기반의 가벼운 신호 (이음 단계의 자산곡선 생성이 순차 구간으로 남음)
+- zscore: 창마다 표준편차를 다시 계산하는 무거운 지표 (DSL 전략 평가처럼 신호 계산이 지배적)
+
+샤드마다 두 시작 자본으로 시뮬레이션하므로 총 계산량은 늘고, 신호 계산과 구간 시뮬레이션은
+코어 수에 비례해 줄어듭니다.
+
+실행:
+    python benchmarks/bench_sharded_backtest.py --bars 2000000 --parallelism 1 2 4 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from mysingle_protos.backtest.engine import run_backtest, sma_crossover
+from mysingle_protos.backtest.shard import run_sharded
+from mysingle_protos.protos.services.backtest.v1 import backtest_service_pb2 as bt_pb2
+
+MINUTE_NS = 60 * 1_000_000_000
+
+
+def zscore(close: np.ndarray, params) -> np.ndarray:
+    """창 평균 대비 표준편차 1 배 이상 낮으면 롱 (params window, 창마다 다시 계산)"""
+    window = int(params.get("window", 240))
+    out = np.zeros(len(close))
+    if window <= len(close):
+        view = np.lib.stride_tricks.sliding_window_view(close, window)
+        score = (close[window - 1 :] - view.mean(axis=1)) / view.std(axis=1)
+        out[window - 1 :] = score < -1.0
+    return out
+
+
+def backtest_config(parallelism: int) -> bt_pb2.BacktestConfig:
+    return bt_pb2.BacktestConfig(
+        symbol="AAPL",
+        interval="1m",
+        initial_capital=100_000.0,
+        slippage_bps=1.0,
+        commission_per_trade=1.0,
+        stop_loss_pct=2.0,
+        take_profit_pct=4.0,
+        params={"fast": "60", "slow": "240", "window": "240"},
+        parallelism=parallelism,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--bars", type=int, default=2_000_000)
+    parser.add_argument("--parallelism", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--signals", nargs="+", default=["sma_crossover", "zscore"])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.0005, args.bars)))
+    timestamp = np.arange(args.bars, dtype=np.int64) * MINUTE_NS
+
+    def best(run) -> tuple[float, object]:
+        times, result = [], None
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            result = run()
+            times.append(time.perf_counter() - started)
+        return min(times), result
+
+    print(f"bars={args.bars} cpus={os.cpu_count()}")
+    print(f"{'signal':<14} {'method':<14} {'seconds':>8} {'speedup':>8} {'max_rel_err':>12}")
+    for name in args.signals:
+        signal = {"sma_crossover": sma_crossover, "zscore": zscore}[name]
+        baseline_s, baseline = best(
+            lambda: run_backtest(backtest_config(1), timestamp, close, signal)
+        )
+        expected = baseline.equity["equity"]
+        print(f"{name:<14} {'unsharded':<14} {baseline_s:>8.3f} {1.0:>8.2f} {0.0:>12.2e}")
+        for parallelism in args.parallelism:
+            config = backtest_config(parallelism)
+            with ProcessPoolExecutor(max_workers=parallelism) as pool:
+                # 워커 프로세스 예열
+                list(pool.map(abs, range(parallelism)))
+                seconds, result = best(
+                    lambda: run_sharded(
+                        config, timestamp, close, signal, min_lookback=240, executor=pool
+                    )
+                )
+            assert len(result.trades) == len(baseline.trades)
+            error = np.max(np.abs(result.equity["equity"] / expected - 1.0))
+            print(
+                f"{name:<14} {f'p={parallelism}':<14} {seconds:>8.3f}"
+                f" {baseline_s / seconds:>8.2f} {error:>12.2e}"
+            )
+
+
+if __name__ == "__main__":
+    main()
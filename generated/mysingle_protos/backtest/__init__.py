@@ -0,0 +1,5 @@
+"""
+Backtest 클라이언트/서버 공용 모듈.
+
+BacktestService 구현과 클라이언트가 함께 사용하는 참조 구현을 제공합니다.
+"""
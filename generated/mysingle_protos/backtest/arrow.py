@@ -0,0 +1,249 @@
+"""
+백테스트 결과 Arrow IPC 내보내기 모듈.
+
+ExportBacktestResultArrow 의 참조 구현입니다. 거래/자산곡선을 Arrow 레코드 배치로 묶어
+IPC 스트림 바이트(ArrowRecordBatchChunk.ipc_stream)로 보내므로 노트북에서는 행 단위
+protobuf 디코딩 없이 pyarrow.ipc 로 바로 읽어 pandas/polars 로 넘길 수 있습니다.
+
+- 스키마는 Trade / EquityPoint 디스크립터에서 생성 (Timestamp → timestamp[ns, UTC],
+  optional 필드는 nullable, 필드 번호는 필드 메타데이터 "proto.number")
+- symbol / side 는 사전(dictionary) 인코딩, 수치 열은 열 형식 뷰의 버퍼를 복사 없이 사용
+- 청크마다 스키마 + 레코드 배치 1 개 + EOS 로 된 독립 IPC 스트림
+
+사용 예시:
+    # 서버
+    for chunk in iter_arrow_chunks(result, request.tables, request.max_rows_per_batch):
+        yield chunk
+
+    # 클라이언트
+    tables = read_arrow_chunks(stub.ExportBacktestResultArrow(request))
+    trades = tables[bt_pb2.RESULT_TABLE_TRADES].to_pandas()
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Sequence
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.ipc
+from google.protobuf.descriptor import Descriptor, FieldDescriptor
+
+from ..protos.services.backtest.v1 import backtest_service_pb2 as bt_pb2
+from ..protos.services.backtest.v1 import backtest_service_pb2_grpc as bt_grpc
+from .columnar import EquityView, TradeView, result_views, to_columnar
+
+DEFAULT_MAX_ROWS_PER_BATCH = 65_536
+MAX_ROWS_PER_BATCH = 1 << 20
+DEFAULT_TABLES = (bt_pb2.RESULT_TABLE_TRADES, bt_pb2.RESULT_TABLE_EQUITY_CURVE)
+
+_COMPRESSIONS = {"": None, "none": None, "lz4": "lz4", "zstd": "zstd"}
+_TIMESTAMP_TYPE = pa.timestamp("ns", tz="UTC")
+
+_SCALAR_TYPES = {
+    FieldDescriptor.TYPE_DOUBLE: pa.float64(),
+    FieldDescriptor.TYPE_FLOAT: pa.float32(),
+    FieldDescriptor.TYPE_INT64: pa.int64(),
+    FieldDescriptor.TYPE_SINT64: pa.int64(),
+    FieldDescriptor.TYPE_SFIXED64: pa.int64(),
+    FieldDescriptor.TYPE_UINT64: pa.uint64(),
+    FieldDescriptor.TYPE_FIXED64: pa.uint64(),
+    FieldDescriptor.TYPE_INT32: pa.int32(),
+    FieldDescriptor.TYPE_SINT32: pa.int32(),
+    FieldDescriptor.TYPE_SFIXED32: pa.int32(),
+    FieldDescriptor.TYPE_UINT32: pa.uint32(),
+    FieldDescriptor.TYPE_FIXED32: pa.uint32(),
+    FieldDescriptor.TYPE_BOOL: pa.bool_(),
+    FieldDescriptor.TYPE_STRING: pa.string(),
+    FieldDescriptor.TYPE_BYTES: pa.binary(),
+}
+
+
+def _field_type(field: FieldDescriptor, dictionary: bool) -> pa.DataType:
+    if field.type == FieldDescriptor.TYPE_MESSAGE:
+        if field.message_type.full_name != "google.protobuf.Timestamp":
+            raise ValueError(f"Arrow 로 변환할 수 없는 메시지 필드: {field.full_name}")
+        value_type = _TIMESTAMP_TYPE
+    elif field.type == FieldDescriptor.TYPE_ENUM:
+        value_type = pa.dictionary(pa.int32(), pa.string())
+    else:
+        value_type = _SCALAR_TYPES[field.type]
+        if dictionary:
+            value_type = pa.dictionary(pa.int32(), value_type)
+    if field.label == FieldDescriptor.LABEL_REPEATED:
+        return pa.list_(value_type)
+    return value_type
+
+
+def message_schema(descriptor: Descriptor, dictionary_fields: Sequence[str] = ()) -> pa.Schema:
+    """protobuf 메시지 디스크립터에서 Arrow 스키마 생성 (dictionary_fields 는 사전 인코딩)"""
+    fields = [
+        pa.field(
+            field.name,
+            _field_type(field, field.name in dictionary_fields),
+            nullable=field.has_presence,
+            metadata={"proto.number": str(field.number)},
+        )
+        for field in descriptor.fields
+    ]
+    return pa.schema(fields, metadata={"proto.message": descriptor.full_name})
+
+
+TRADE_SCHEMA = message_schema(bt_pb2.Trade.DESCRIPTOR, dictionary_fields=("symbol", "side"))
+EQUITY_SCHEMA = message_schema(bt_pb2.EquityPoint.DESCRIPTOR)
+
+_SIDE_NAMES = pa.array(
+    [
+        "" if value == bt_pb2.TRADE_SIDE_UNSPECIFIED else name.removeprefix("TRADE_SIDE_")
+        for name, value in sorted(bt_pb2.TradeSide.items(), key=lambda item: item[1])
+    ]
+)
+
+
+def _timestamps(values: np.ndarray) -> pa.Array:
+    # int64 epoch ns 버퍼를 그대로 timestamp 배열로 사용
+    return pa.Array.from_buffers(_TIMESTAMP_TYPE, len(values), [None, pa.py_buffer(values)])
+
+
+def _doubles(values: np.ndarray, nullable: bool) -> pa.Array:
+    mask = np.isnan(values) if nullable else None
+    if mask is not None and not mask.any():
+        mask = None
+    return pa.array(values, type=pa.float64(), mask=mask)
+
+
+def _trade_arrays(view: TradeView) -> dict[str, pa.Array]:
+    known = view.side < len(_SIDE_NAMES)
+    return {
+        "timestamp": _timestamps(view.timestamp),
+        "symbol": pa.DictionaryArray.from_arrays(
+            pa.array(view.symbol, type=pa.int32()), pa.array(view.symbols, type=pa.string())
+        ),
+        "side": pa.DictionaryArray.from_arrays(
+            pa.array(np.where(known, view.side, 0), type=pa.int32()), _SIDE_NAMES
+        ),
+        "quantity": _doubles(view.quantity, False),
+        "price": _doubles(view.price, False),
+        "pnl": _doubles(view.pnl, False),
+        "commission": _doubles(view.commission, False),
+        "trade_id": pa.array(
+            [value or None for value in view.trade_id] if view.trade_id else [None] * len(view),
+            type=pa.string(),
+        ),
+        "portfolio_value": _doubles(view.portfolio_value, True),
+    }
+
+
+def _equity_arrays(view: EquityView) -> dict[str, pa.Array]:
+    return {
+        "timestamp": _timestamps(view.timestamp),
+        **{
+            name: _doubles(getattr(view, name), False)
+            for name in ("equity", "drawdown", "cash", "positions_value")
+        },
+    }
+
+
+def _batch(schema: pa.Schema, arrays: dict[str, pa.Array]) -> pa.RecordBatch:
+    missing = [name for name in schema.names if name not in arrays]
+    if missing:
+        raise ValueError(f"스키마 필드에 해당하는 열이 없습니다: {missing}")
+    return pa.RecordBatch.from_arrays([arrays[name] for name in schema.names], schema=schema)
+
+
+def result_batches(
+    result: bt_pb2.BacktestResultResponse,
+) -> tuple[pa.RecordBatch, pa.RecordBatch]:
+    """BacktestResultResponse (행/열 형식) 의 (거래, 자산곡선) 레코드 배치"""
+    if not result.HasField("trade_columns") and not result.HasField("equity_columns"):
+        result = to_columnar(result)
+    trades, equity = result_views(result)
+    return (
+        _batch(TRADE_SCHEMA, _trade_arrays(trades))
+        if trades is not None
+        else pa.RecordBatch.from_pylist([], schema=TRADE_SCHEMA),
+        _batch(EQUITY_SCHEMA, _equity_arrays(equity))
+        if equity is not None
+        else pa.RecordBatch.from_pylist([], schema=EQUITY_SCHEMA),
+    )
+
+
+def _ipc_stream(batch: pa.RecordBatch, options: pa.ipc.IpcWriteOptions) -> bytes:
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, batch.schema, options=options) as writer:
+        writer.write_batch(batch)
+    return sink.getvalue().to_pybytes()
+
+
+def iter_arrow_chunks(
+    result: bt_pb2.BacktestResultResponse,
+    tables: Sequence[int] = (),
+    max_rows_per_batch: int | None = None,
+    compression: str | None = None,
+) -> Iterator[bt_pb2.ArrowRecordBatchChunk]:
+    """ExportBacktestResultArrow 응답 청크 생성 (tables 순서, 테이블마다 행 순서)"""
+    rows = min(max_rows_per_batch or DEFAULT_MAX_ROWS_PER_BATCH, MAX_ROWS_PER_BATCH)
+    if rows <= 0:
+        raise ValueError(f"max_rows_per_batch 는 양수여야 합니다: {max_rows_per_batch}")
+    codec = (compression or "").lower()
+    if codec not in _COMPRESSIONS:
+        raise ValueError(f"지원하지 않는 압축 방식: {compression}")
+    options = pa.ipc.IpcWriteOptions(compression=_COMPRESSIONS[codec])
+
+    trades, equity = result_batches(result)
+    batches = {bt_pb2.RESULT_TABLE_TRADES: trades, bt_pb2.RESULT_TABLE_EQUITY_CURVE: equity}
+    order = list(tables) or list(DEFAULT_TABLES)
+    for table in order:
+        if table not in batches:
+            raise ValueError(f"지원하지 않는 테이블: {table}")
+
+    planned = [
+        (table, offset)
+        for table in order
+        # 빈 테이블도 스키마 전달을 위해 청크 1 개
+        for offset in range(0, max(batches[table].num_rows, 1), rows)
+    ]
+    for i, (table, offset) in enumerate(planned):
+        batch = batches[table].slice(offset, rows)
+        yield bt_pb2.ArrowRecordBatchChunk(
+            table=table,
+            row_offset=offset,
+            num_rows=batch.num_rows,
+            ipc_stream=_ipc_stream(batch, options),
+            last=i == len(planned) - 1,
+        )
+
+
+def read_arrow_chunks(chunks: Iterable[bt_pb2.ArrowRecordBatchChunk]) -> dict[int, pa.Table]:
+    """ArrowRecordBatchChunk 스트림을 ResultTable → pyarrow.Table 로 조립"""
+    batches: dict[int, list[pa.RecordBatch]] = {}
+    schemas: dict[int, pa.Schema] = {}
+    expected: dict[int, int] = {}
+    for chunk in chunks:
+        # protobuf bytes 를 복사 없이 Arrow 버퍼로 감싸 읽음
+        reader = pa.ipc.open_stream(pa.py_buffer(chunk.ipc_stream))
+        schemas.setdefault(chunk.table, reader.schema)
+        if chunk.row_offset != expected.get(chunk.table, 0):
+            raise ValueError(
+                f"테이블 {chunk.table} 의 row_offset 불연속: "
+                f"{chunk.row_offset} != {expected.get(chunk.table, 0)}"
+            )
+        received = batches.setdefault(chunk.table, [])
+        for batch in reader:
+            received.append(batch)
+        expected[chunk.table] = chunk.row_offset + chunk.num_rows
+        if chunk.last:
+            break
+    return {
+        table: pa.Table.from_batches(received, schema=schemas[table])
+        for table, received in batches.items()
+    }
+
+
+def export_arrow(
+    stub: bt_grpc.BacktestServiceStub,
+    request: bt_pb2.ExportBacktestResultArrowRequest,
+    timeout: float | None = None,
+) -> dict[int, pa.Table]:
+    """ExportBacktestResultArrow 호출 후 테이블별 pyarrow.Table 반환"""
+    return read_arrow_chunks(stub.ExportBacktestResultArrow(request, timeout=timeout))
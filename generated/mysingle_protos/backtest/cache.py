@@ -0,0 +1,254 @@
+"""
+완료된 백테스트 결과의 불변 디스크 캐시.
+
+completed 상태의 BacktestResultResponse 는 다시 바뀌지 않으므로 게이트웨이/내러티브
+서비스가 같은 backtest_id 를 반복 조회할 때 GetBacktestResult 왕복을 생략할 수 있습니다.
+결과는 압축 후 내용 주소(SHA-256) 파일로 저장하고, 앞단에 메모리 LRU 를 둡니다.
+진행 중인 결과와 failed 결과(ResumeBacktest 로 같은 backtest_id 가 다시 실행될 수 있음)는
+자동으로 캐시를 우회합니다.
+
+디렉터리 레이아웃:
+    objects/<digest[:2]>/<digest>.<codec>   압축된 직렬화 응답 (같은 내용은 한 번만 저장)
+    refs/<key digest>                       "<digest> <codec> <raw_size>" (요청 키 → 객체)
+
+사용 예시:
+    cache = ResultCache("~/.cache/mysingle/backtests", max_bytes=2 << 30)
+    result = cache.fetch(stub, bt_pb2.GetBacktestResultRequest(backtest_id=bid, user_id=uid))
+    print(cache.stats.hit_rate, cache.stats.bytes_saved)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import lzma
+import os
+import threading
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+from ..protos.services.backtest.v1 import backtest_service_pb2 as bt_pb2
+from ..protos.services.backtest.v1 import backtest_service_pb2_grpc as bt_grpc
+
+CACHEABLE_STATUSES = frozenset({"completed"})
+
+_CODECS = {
+    "pb": (lambda data, level: data, lambda data: data),
+    "zlib": (lambda data, level: zlib.compress(data, level), zlib.decompress),
+    "xz": (lambda data, level: lzma.compress(data, preset=level), lzma.decompress),
+}
+_CODEC_BY_COMPRESSION = {"none": "pb", "zlib": "zlib", "lzma": "xz"}
+_DEFAULT_LEVEL = {"none": 0, "zlib": 6, "lzma": 1}
+
+
+def request_key(request: bt_pb2.GetBacktestResultRequest) -> str:
+    """GetBacktestResult 요청의 캐시 키 (응답 형태를 바꾸는 옵션 포함)"""
+    parts = (
+        request.backtest_id,
+        request.user_id,
+        str(request.max_points) if request.HasField("max_points") else "",
+        str(request.downsample_method) if request.HasField("downsample_method") else "",
+        str(request.encoding) if request.HasField("encoding") else "",
+    )
+    return hashlib.sha256("\x1f".join(parts).encode()).hexdigest()
+
+
+@dataclass
+class CacheStats:
+    """캐시 카운터"""
+
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    # 진행 중 상태라 저장하지 않은 응답 수
+    bypassed: int = 0
+    stores: int = 0
+    evictions: int = 0
+    # 캐시에서 제공해 전송을 생략한 직렬화 응답 바이트
+    bytes_saved: int = 0
+
+    @property
+    def hits(self) -> int:
+        """메모리 + 디스크 적중 수"""
+        return self.memory_hits + self.disk_hits
+
+    @property
+    def hit_rate(self) -> float:
+        """캐시 적중률"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ResultCache:
+    """종료 상태 BacktestResultResponse 의 압축/내용 주소 디스크 캐시 (메모리 LRU 앞단)"""
+
+    def __init__(
+        self,
+        directory: str | Path,
+        max_bytes: int = 1 << 30,
+        memory_entries: int = 32,
+        memory_bytes: int = 256 << 20,
+        compression: str = "zlib",
+        level: int | None = None,
+    ) -> None:
+        if compression not in _CODEC_BY_COMPRESSION:
+            raise ValueError(f"지원하지 않는 압축 방식: {compression}")
+        self.directory = Path(directory).expanduser()
+        self.max_bytes = max_bytes
+        self.memory_entries = memory_entries
+        self.memory_bytes = memory_bytes
+        self.codec = _CODEC_BY_COMPRESSION[compression]
+        self.level = _DEFAULT_LEVEL[compression] if level is None else level
+        self.stats = CacheStats()
+
+        self._objects = self.directory / "objects"
+        self._refs = self.directory / "refs"
+        self._objects.mkdir(parents=True, exist_ok=True)
+        self._refs.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        # 요청 키 → 직렬화 응답 (호출자에게는 파싱한 사본 반환)
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+        self._memory_size = 0
+        self._disk_size = sum(path.stat().st_size for path in self._objects.glob("*/*"))
+
+    @property
+    def disk_bytes(self) -> int:
+        """디스크 객체 총 크기"""
+        return self._disk_size
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self._refs.iterdir())
+
+    # ========== Memory front ==========
+
+    def _remember(self, key: str, payload: bytes) -> None:
+        if len(payload) > self.memory_bytes:
+            return
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_size -= len(previous)
+        self._memory[key] = payload
+        self._memory_size += len(payload)
+        while len(self._memory) > self.memory_entries or self._memory_size > self.memory_bytes:
+            _, dropped = self._memory.popitem(last=False)
+            self._memory_size -= len(dropped)
+
+    # ========== Disk ==========
+
+    def _object_path(self, digest: str, codec: str) -> Path:
+        return self._objects / digest[:2] / f"{digest}.{codec}"
+
+    def _read_disk(self, key: str) -> bytes | None:
+        ref = self._refs / key
+        try:
+            digest, codec, raw_size = ref.read_text().split()
+            path = self._object_path(digest, codec)
+            payload = _CODECS[codec][1](path.read_bytes())
+        except (OSError, ValueError, KeyError, zlib.error, lzma.LZMAError):
+            # 축출되었거나 손상된 객체를 가리키는 참조 정리
+            ref.unlink(missing_ok=True)
+            return None
+        if len(payload) != int(raw_size) or hashlib.sha256(payload).hexdigest() != digest:
+            ref.unlink(missing_ok=True)
+            return None
+        # 접근 시각 갱신 (크기 기반 축출의 LRU 순서)
+        os.utime(path)
+        return payload
+
+    def _write_disk(self, key: str, payload: bytes) -> None:
+        digest = hashlib.sha256(payload).hexdigest()
+        path = self._object_path(digest, self.codec)
+        if path.exists():
+            os.utime(path)
+        else:
+            path.parent.mkdir(exist_ok=True)
+            data = _CODECS[self.codec][0](payload, self.level)
+            tmp = path.with_suffix(f".tmp{os.getpid()}.{threading.get_ident()}")
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+            self._disk_size += len(data)
+        tmp_ref = self._refs / f".{key}.tmp{os.getpid()}.{threading.get_ident()}"
+        tmp_ref.write_text(f"{digest} {self.codec} {len(payload)}")
+        os.replace(tmp_ref, self._refs / key)
+        self._evict()
+
+    def _evict(self) -> None:
+        """max_bytes 를 넘으면 오래 접근하지 않은 객체부터 삭제"""
+        if self._disk_size <= self.max_bytes:
+            return
+        objects = []
+        for path in self._objects.glob("*/*"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            objects.append((stat.st_mtime, stat.st_size, path))
+        objects.sort()
+        self._disk_size = sum(size for _, size, _ in objects)
+        for _, size, path in objects:
+            if self._disk_size <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            self._disk_size -= size
+            self.stats.evictions += 1
+        # 참조는 다음 조회 시 지연 정리
+
+    # ========== Public API ==========
+
+    def get(self, request: bt_pb2.GetBacktestResultRequest) -> bt_pb2.BacktestResultResponse | None:
+        """캐시 조회 (메모리 → 디스크)"""
+        key = request_key(request)
+        with self._lock:
+            payload = self._memory.get(key)
+            if payload is not None:
+                self._memory.move_to_end(key)
+                self.stats.memory_hits += 1
+            else:
+                payload = self._read_disk(key)
+                if payload is None:
+                    self.stats.misses += 1
+                    return None
+                self.stats.disk_hits += 1
+                self._remember(key, payload)
+            self.stats.bytes_saved += len(payload)
+        return bt_pb2.BacktestResultResponse.FromString(payload)
+
+    def put(
+        self, request: bt_pb2.GetBacktestResultRequest, response: bt_pb2.BacktestResultResponse
+    ) -> bool:
+        """완료 상태 응답 저장 (진행 중/실패 상태는 저장하지 않고 False)"""
+        if response.status not in CACHEABLE_STATUSES:
+            with self._lock:
+                self.stats.bypassed += 1
+            return False
+        key = request_key(request)
+        payload = response.SerializeToString(deterministic=True)
+        with self._lock:
+            self._write_disk(key, payload)
+            self._remember(key, payload)
+            self.stats.stores += 1
+        return True
+
+    def fetch(
+        self,
+        stub: bt_grpc.BacktestServiceStub,
+        request: bt_pb2.GetBacktestResultRequest,
+        timeout: float | None = None,
+    ) -> bt_pb2.BacktestResultResponse:
+        """캐시 우선 GetBacktestResult (미스 시 호출 후 완료 상태면 저장)"""
+        cached = self.get(request)
+        if cached is not None:
+            return cached
+        response = stub.GetBacktestResult(request, timeout=timeout)
+        self.put(request, response)
+        return response
+
+    def clear(self) -> None:
+        """메모리/디스크 캐시 전체 삭제"""
+        with self._lock:
+            self._memory.clear()
+            self._memory_size = 0
+            for path in [*self._refs.iterdir(), *self._objects.glob("*/*")]:
+                path.unlink(missing_ok=True)
+            self._disk_size = 0
@@ -0,0 +1,279 @@
+"""
+장시간 백테스트 체크포인트 모듈 (ResumeBacktest).
+
+워커 재시작이나 선점으로 실행이 끊긴 백테스트가 처음부터 다시 돌지 않도록, 엔진이
+snapshot_interval_seconds 마다 BacktestCheckpoint 를 워커 공용 저장소에 기록합니다.
+체크포인트에는 작업 메타데이터(사용자, 전략, 설정)가 함께 들어 있어 어느 워커든
+ResumeBacktest 로 마지막 체크포인트부터 이어서 실행할 수 있습니다.
+
+- 저장: 백테스트당 최신 체크포인트 하나, 임시 파일 → os.replace 원자적 교체
+  (기록 중 프로세스가 죽어도 직전 체크포인트가 남음)
+- 진행 seq 연속성: 재개한 워커는 체크포인트의 last_update 를 먼저 보관하고 그 다음 seq 부터
+  발행. 진행 이벤트 경계가 결정적이므로 끊긴 워커가 체크포인트 이후 발행한 seq 는 재개한
+  워커가 같은 진행률로 다시 발행
+- 리스: 실행 중인 워커가 owner_id / lease_expires_at 을 기록하고 주기적으로 갱신.
+  다른 워커는 리스가 만료되었거나 해제된 체크포인트만 넘겨받음 (held_by_other)
+- 정리: 취소/실패 후 재개되지 않은 체크포인트는 prune(ttl_seconds) 으로 삭제
+- directory 없이 만들면 프로세스 메모리에 보관 (같은 프로세스 안의 취소/실패 재개용)
+
+사용 예시 (워커):
+    store = CheckpointStore("/mnt/shared/backtest-checkpoints")
+    policy = CheckpointPolicy(checkpoint_interval(config, default_seconds=60.0))
+    for end in chunk_ends:
+        engine.advance(end)
+        update = hub.publish(backtest_id, progress)
+        if policy.due():
+            store.save(make_checkpoint(..., engine.bars_done, engine.total_bars, update, ...))
+
+사용 예시 (ResumeBacktest):
+    checkpoint = store.load(request.backtest_id)
+    if checkpoint is None or checkpoint.user_id != request.user_id:
+        await context.abort(grpc.StatusCode.NOT_FOUND, ...)
+    if held_by_other(checkpoint, worker_id):
+        await context.abort(grpc.StatusCode.FAILED_PRECONDITION, ...)
+    store.save(stamp_lease(checkpoint, worker_id, lease_seconds))
+    engine.restore(checkpoint.state)  # 같은 가격/신호로 준비한 엔진
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from google.protobuf.message import DecodeError
+
+from ..protos.services.backtest.v1 import backtest_service_pb2 as bt_pb2
+
+DEFAULT_INTERVAL_SECONDS = 60.0
+# 실행 중인 워커가 lease_seconds / 3 마다 갱신하는 리스 길이
+DEFAULT_LEASE_SECONDS = 30.0
+# 취소/실패 후 재개되지 않은 체크포인트 보관 기간
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600.0
+
+_SUFFIX = ".ckpt"
+
+
+def checkpoint_interval(
+    config: bt_pb2.BacktestConfig, default_seconds: float = DEFAULT_INTERVAL_SECONDS
+) -> float:
+    """BacktestConfig.snapshot_interval_seconds (미설정 시 default_seconds, 0 은 매 진행 이벤트)"""
+    if config.HasField("snapshot_interval_seconds"):
+        if config.snapshot_interval_seconds < 0:
+            raise ValueError(
+                f"snapshot_interval_seconds 는 0 이상이어야 합니다: "
+                f"{config.snapshot_interval_seconds}"
+            )
+        return float(config.snapshot_interval_seconds)
+    return default_seconds
+
+
+@dataclass
+class CheckpointPolicy:
+    """마지막 체크포인트 이후 interval_seconds 가 지났는지 판단"""
+
+    interval_seconds: float
+    last: float = field(default_factory=time.monotonic)
+
+    def due(self, now: float | None = None) -> bool:
+        """체크포인트 시점이면 True (호출 시각을 마지막 체크포인트로 기록)"""
+        now = time.monotonic() if now is None else now
+        if now - self.last < self.interval_seconds:
+            return False
+        self.last = now
+        return True
+
+
+def stamp_lease(
+    checkpoint: bt_pb2.BacktestCheckpoint,
+    owner_id: str,
+    lease_seconds: float,
+    now_ns: int | None = None,
+) -> bt_pb2.BacktestCheckpoint:
+    """owner_id 의 리스를 지금부터 lease_seconds 동안으로 기록 (checkpoint 를 수정해 반환)"""
+    now_ns = time.time_ns() if now_ns is None else now_ns
+    checkpoint.owner_id = owner_id
+    checkpoint.lease_expires_at.FromNanoseconds(now_ns + int(lease_seconds * 1e9))
+    return checkpoint
+
+
+def release_lease(checkpoint: bt_pb2.BacktestCheckpoint) -> bt_pb2.BacktestCheckpoint:
+    """리스 해제 (다른 워커가 바로 넘겨받을 수 있음)"""
+    checkpoint.owner_id = ""
+    checkpoint.ClearField("lease_expires_at")
+    return checkpoint
+
+
+def held_by_other(
+    checkpoint: bt_pb2.BacktestCheckpoint, owner_id: str, now_ns: int | None = None
+) -> bool:
+    """owner_id 가 아닌 워커의 리스가 아직 유효하면 True"""
+    if not checkpoint.owner_id or checkpoint.owner_id == owner_id:
+        return False
+    now_ns = time.time_ns() if now_ns is None else now_ns
+    return checkpoint.lease_expires_at.ToNanoseconds() > now_ns
+
+
+def _expired(payload: bytes, cutoff_ns: int, now_ns: int, written_ns: int) -> bool:
+    """cutoff_ns 이전에 기록되었고 유효한 리스가 없는 체크포인트 (손상된 파일은 기록 시각 기준)"""
+    try:
+        checkpoint = bt_pb2.BacktestCheckpoint.FromString(payload)
+    except DecodeError:
+        return written_ns < cutoff_ns
+    if checkpoint.owner_id and checkpoint.lease_expires_at.ToNanoseconds() > now_ns:
+        return False
+    return checkpoint.created_at.ToNanoseconds() < cutoff_ns
+
+
+@dataclass
+class CheckpointStats:
+    """체크포인트 카운터"""
+
+    saves: int = 0
+    bytes_written: int = 0
+    loads: int = 0
+    misses: int = 0
+    deletes: int = 0
+
+
+class CheckpointStore:
+    """backtest_id 별 최신 BacktestCheckpoint 저장소 (directory 가 없으면 메모리)"""
+
+    def __init__(self, directory: str | Path | None = None) -> None:
+        self.directory = Path(directory).expanduser() if directory is not None else None
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+        self.stats = CheckpointStats()
+        self._lock = threading.Lock()
+        self._memory: dict[str, bytes] = {}
+
+    def _path(self, backtest_id: str) -> Path:
+        # backtest_id 를 그대로 파일명으로 쓰지 않음 (경로 문자 방지)
+        digest = hashlib.sha256(backtest_id.encode()).hexdigest()
+        return self.directory / f"{digest}{_SUFFIX}"
+
+    def __len__(self) -> int:
+        if self.directory is None:
+            return len(self._memory)
+        return sum(1 for _ in self.directory.glob(f"*{_SUFFIX}"))
+
+    def save(self, checkpoint: bt_pb2.BacktestCheckpoint) -> int:
+        """체크포인트 기록 (같은 백테스트의 이전 체크포인트 교체), 기록한 바이트 수 반환"""
+        if not checkpoint.backtest_id:
+            raise ValueError("backtest_id 가 필요합니다")
+        payload = checkpoint.SerializeToString()
+        if self.directory is None:
+            with self._lock:
+                self._memory[checkpoint.backtest_id] = payload
+        else:
+            path = self._path(checkpoint.backtest_id)
+            tmp = path.with_suffix(f".tmp{os.getpid()}.{threading.get_ident()}")
+            tmp.write_bytes(payload)
+            os.replace(tmp, path)
+        with self._lock:
+            self.stats.saves += 1
+            self.stats.bytes_written += len(payload)
+        return len(payload)
+
+    def load(self, backtest_id: str) -> bt_pb2.BacktestCheckpoint | None:
+        """최신 체크포인트 조회 (없거나 손상되었으면 None)"""
+        if self.directory is None:
+            with self._lock:
+                payload = self._memory.get(backtest_id)
+        else:
+            try:
+                payload = self._path(backtest_id).read_bytes()
+            except OSError:
+                payload = None
+        checkpoint = None
+        if payload is not None:
+            try:
+                checkpoint = bt_pb2.BacktestCheckpoint.FromString(payload)
+            except DecodeError:
+                # 잘린/손상된 파일은 체크포인트가 없는 것으로 처리
+                checkpoint = None
+            if checkpoint is not None and checkpoint.backtest_id != backtest_id:
+                checkpoint = None
+        with self._lock:
+            if checkpoint is None:
+                self.stats.misses += 1
+            else:
+                self.stats.loads += 1
+        return checkpoint
+
+    def prune(self, ttl_seconds: float, now_ns: int | None = None) -> int:
+        """ttl_seconds 보다 오래되고 리스가 없는 체크포인트 삭제, 삭제한 수 반환"""
+        now_ns = time.time_ns() if now_ns is None else now_ns
+        cutoff_ns = now_ns - int(ttl_seconds * 1e9)
+        removed = 0
+        if self.directory is None:
+            with self._lock:
+                for backtest_id, payload in list(self._memory.items()):
+                    if _expired(payload, cutoff_ns, now_ns, now_ns):
+                        del self._memory[backtest_id]
+                        removed += 1
+        else:
+            for path in self.directory.glob(f"*{_SUFFIX}"):
+                try:
+                    payload = path.read_bytes()
+                    written_ns = path.stat().st_mtime_ns
+                except OSError:
+                    continue
+                if _expired(payload, cutoff_ns, now_ns, written_ns):
+                    path.unlink(missing_ok=True)
+                    removed += 1
+        with self._lock:
+            self.stats.deletes += removed
+        return removed
+
+    def delete(self, backtest_id: str) -> None:
+        """체크포인트 삭제 (완료된 작업)"""
+        if self.directory is None:
+            with self._lock:
+                removed = self._memory.pop(backtest_id, None) is not None
+        else:
+            path = self._path(backtest_id)
+            removed = path.exists()
+            path.unlink(missing_ok=True)
+        if removed:
+            with self._lock:
+                self.stats.deletes += 1
+
+
+def make_checkpoint(
+    backtest_id: str,
+    user_id: str,
+    strategy_id: str,
+    config: bt_pb2.BacktestConfig,
+    job_created_at_ns: int,
+    strategy_version_seq: int | None = None,
+    bars_done: int = 0,
+    total_bars: int = 0,
+    last_update: bt_pb2.ProgressUpdate | None = None,
+    state_format: str = "",
+    state: bytes = b"",
+) -> bt_pb2.BacktestCheckpoint:
+    """BacktestCheckpoint 생성 (progress_pct 는 bars_done / total_bars)"""
+    if total_bars and not 0 <= bars_done <= total_bars:
+        raise ValueError(f"bars_done 범위 오류: {bars_done} / {total_bars}")
+    checkpoint = bt_pb2.BacktestCheckpoint(
+        backtest_id=backtest_id,
+        user_id=user_id,
+        strategy_id=strategy_id,
+        config=config,
+        bars_done=bars_done,
+        total_bars=total_bars,
+        progress_pct=bars_done / total_bars * 100.0 if total_bars else 0.0,
+        state_format=state_format,
+        state=state,
+    )
+    if strategy_version_seq is not None:
+        checkpoint.strategy_version_seq = strategy_version_seq
+    if last_update is not None:
+        checkpoint.last_update.CopyFrom(last_update)
+    checkpoint.job_created_at.FromNanoseconds(job_created_at_ns)
+    checkpoint.created_at.GetCurrentTime()
+    return checkpoint
@@ -0,0 +1,401 @@
+"""
+백테스트 결과 열 지향(columnar) 인코딩 모듈.
+
+RESULT_ENCODING_COLUMNAR 로 요청하면 거래/자산곡선이 Trade / EquityPoint 행 메시지 대신
+TradeColumns / EquityColumns 의 packed 배열(sfixed64 epoch ns, double, 심볼 사전, TradeSide)로
+전달됩니다. 고정 폭 필드는 직렬화 바이트에서 그대로 NumPy 배열로 볼 수 있으므로 행마다
+메시지 객체를 만드는 비용 없이 수백만 개의 점을 디코딩합니다.
+
+서버:
+    response = to_columnar(result)      # 행 형식 결과를 열 형식으로 변환
+    columns = equity_columns(equity)    # EQUITY_DTYPE 배열에서 바로 생성
+
+클라이언트 (응답 바이트에 대한 zero-copy 뷰):
+    data = get_result_bytes(channel, bt_pb2.GetBacktestResultRequest(
+        backtest_id=bid, user_id=uid, encoding=bt_pb2.RESULT_ENCODING_COLUMNAR
+    ))
+    trades, equity = result_views(data)
+    equity.equity.max(), equity.timestamps[-1]
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+import grpc
+import numpy as np
+
+from ..protos.services.backtest.v1 import backtest_service_pb2 as bt_pb2
+from .stream import EQUITY_DTYPE, SIDE_CODES, TRADE_DTYPE, _equity_rows, _trade_rows
+
+_WIRE_VARINT = 0
+_WIRE_FIXED64 = 1
+_WIRE_LEN = 2
+_WIRE_FIXED32 = 5
+
+# TradeColumns / EquityColumns 필드 번호
+_TRADE_FIELDS = {
+    "timestamp": 1,
+    "symbol": 2,
+    "symbols": 3,
+    "side": 4,
+    "quantity": 5,
+    "price": 6,
+    "pnl": 7,
+    "commission": 8,
+    "portfolio_value": 9,
+    "trade_id": 10,
+}
+_EQUITY_FIELDS = {"timestamp": 1, "equity": 2, "drawdown": 3, "cash": 4, "positions_value": 5}
+_RESULT_TRADE_COLUMNS = 12
+_RESULT_EQUITY_COLUMNS = 13
+
+# SIDE_CODES(1/-1/0) <-> TradeSide
+_SIDE_TO_ENUM = {
+    SIDE_CODES["BUY"]: bt_pb2.TRADE_SIDE_BUY,
+    SIDE_CODES["SELL"]: bt_pb2.TRADE_SIDE_SELL,
+}
+_ENUM_TO_SIDE = np.zeros(max(bt_pb2.TradeSide.values()) + 1, dtype=np.int8)
+for _code, _side in _SIDE_TO_ENUM.items():
+    _ENUM_TO_SIDE[_side] = _code
+
+_GET_RESULT_METHOD = "/backtest.BacktestService/GetBacktestResult"
+
+
+# ========== Wire format ==========
+
+
+def _varint(value: int) -> bytes:
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _read_varint(buf: memoryview, pos: int) -> tuple[int, int]:
+    result = shift = 0
+    while True:
+        byte = buf[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def _scan(buf: memoryview) -> tuple[dict[int, list[memoryview]], set[int]]:
+    """메시지 바이트의 필드 번호별 length-delimited 슬라이스와 비패킹 필드 번호"""
+    fields: dict[int, list[memoryview]] = {}
+    unpacked: set[int] = set()
+    pos, end = 0, len(buf)
+    while pos < end:
+        key, pos = _read_varint(buf, pos)
+        number, wire = key >> 3, key & 7
+        if wire == _WIRE_LEN:
+            length, pos = _read_varint(buf, pos)
+            if pos + length > end:
+                raise ValueError("잘린 메시지 바이트입니다")
+            fields.setdefault(number, []).append(buf[pos : pos + length])
+            pos += length
+        elif wire == _WIRE_VARINT:
+            _, pos = _read_varint(buf, pos)
+            unpacked.add(number)
+        elif wire == _WIRE_FIXED64:
+            pos += 8
+            unpacked.add(number)
+        elif wire == _WIRE_FIXED32:
+            pos += 4
+            unpacked.add(number)
+        else:
+            raise ValueError(f"지원하지 않는 wire type 입니다: {wire}")
+    return fields, unpacked
+
+
+def _joined(slices: list[memoryview]) -> memoryview | bytes:
+    # 하나로 직렬화된 packed 필드는 복사 없이, 나뉘어 온 경우에만 이어 붙임
+    if len(slices) == 1:
+        return slices[0]
+    return b"".join(slices)
+
+
+def _fixed_column(slices: list[memoryview] | None, dtype: str) -> np.ndarray:
+    if not slices:
+        return np.empty(0, dtype=dtype)
+    return np.frombuffer(_joined(slices), dtype=dtype)
+
+
+def _varint_column(slices: list[memoryview] | None) -> np.ndarray:
+    """packed varint 열 (모든 값이 1바이트면 zero-copy uint8 뷰)"""
+    if not slices:
+        return np.empty(0, dtype=np.uint8)
+    raw = np.frombuffer(_joined(slices), dtype=np.uint8)
+    continuation = raw >= 0x80
+    if not continuation.any():
+        return raw
+    ends = np.flatnonzero(~continuation)
+    starts = np.concatenate(([0], ends[:-1] + 1))
+    position = np.arange(len(raw)) - np.repeat(starts, ends - starts + 1)
+    values = (raw & 0x7F).astype(np.uint64) << (7 * position).astype(np.uint64)
+    return np.add.reduceat(values, starts).astype(np.int64)
+
+
+def _strings(slices: list[memoryview] | None) -> list[str]:
+    return [bytes(s).decode() for s in slices or ()]
+
+
+def _packed(number: int, array: np.ndarray, dtype: str) -> bytes:
+    data = np.ascontiguousarray(array, dtype=dtype).tobytes()
+    if not data:
+        return b""
+    return _varint(number << 3 | _WIRE_LEN) + _varint(len(data)) + data
+
+
+def _as_buffer(source: bytes | bytearray | memoryview) -> memoryview:
+    view = memoryview(source)
+    return view.cast("B") if view.format != "B" else view
+
+
+# ========== Views ==========
+
+
+def _check_lengths(name: str, columns: dict[str, np.ndarray]) -> int:
+    lengths = {len(column) for column in columns.values()}
+    if len(lengths) > 1:
+        sizes = {key: len(column) for key, column in columns.items()}
+        raise ValueError(f"{name} 열 길이가 서로 다릅니다: {sizes}")
+    return lengths.pop() if lengths else 0
+
+
+@dataclass
+class EquityView:
+    """EquityColumns 의 열별 NumPy 뷰 (수신 버퍼를 공유하는 읽기 전용 배열)"""
+
+    timestamp: np.ndarray
+    equity: np.ndarray
+    drawdown: np.ndarray
+    cash: np.ndarray
+    positions_value: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """timestamp (datetime64[ns] 뷰)"""
+        return self.timestamp.view("datetime64[ns]")
+
+    def to_records(self) -> np.ndarray:
+        """EQUITY_DTYPE 구조화 배열로 복사 (stream / downsample 모듈과 호환)"""
+        records = np.empty(len(self), dtype=EQUITY_DTYPE)
+        for name in EQUITY_DTYPE.names:
+            records[name] = getattr(self, name)
+        return records
+
+
+@dataclass
+class TradeView:
+    """TradeColumns 의 열별 NumPy 뷰 (symbol 은 symbols 인덱스, side 는 TradeSide)"""
+
+    timestamp: np.ndarray
+    symbol: np.ndarray
+    side: np.ndarray
+    quantity: np.ndarray
+    price: np.ndarray
+    pnl: np.ndarray
+    commission: np.ndarray
+    portfolio_value: np.ndarray
+    symbols: list[str] = field(default_factory=list)
+    trade_id: list[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """timestamp (datetime64[ns] 뷰)"""
+        return self.timestamp.view("datetime64[ns]")
+
+    def trade_symbols(self) -> np.ndarray:
+        """거래별 심볼 문자열 배열"""
+        return np.asarray(self.symbols, dtype=object)[self.symbol]
+
+    def to_records(self, symbol_codes: dict[str, int] | None = None) -> np.ndarray:
+        """TRADE_DTYPE 구조화 배열로 복사 (symbol_codes 가 주어지면 해당 사전 코드로 재매핑)"""
+        records = np.empty(len(self), dtype=TRADE_DTYPE)
+        for name in ("timestamp", "quantity", "price", "pnl", "commission", "portfolio_value"):
+            records[name] = getattr(self, name)
+        known = self.side < len(_ENUM_TO_SIDE)
+        records["side"] = np.where(known, _ENUM_TO_SIDE[np.where(known, self.side, 0)], 0)
+        if symbol_codes is None:
+            records["symbol"] = self.symbol
+        else:
+            remap = np.empty(len(self.symbols), dtype=np.int32)
+            for i, symbol in enumerate(self.symbols):
+                code = symbol_codes.get(symbol)
+                if code is None:
+                    code = symbol_codes[symbol] = len(symbol_codes)
+                remap[i] = code
+            records["symbol"] = remap[self.symbol] if len(self) else 0
+        return records
+
+
+def _equity_from_fields(fields: dict[int, list[memoryview]]) -> EquityView:
+    columns = {
+        "timestamp": _fixed_column(fields.get(_EQUITY_FIELDS["timestamp"]), "<i8"),
+        **{
+            name: _fixed_column(fields.get(number), "<f8")
+            for name, number in _EQUITY_FIELDS.items()
+            if name != "timestamp"
+        },
+    }
+    _check_lengths("EquityColumns", columns)
+    return EquityView(**columns)
+
+
+def _trade_from_fields(fields: dict[int, list[memoryview]]) -> TradeView:
+    columns = {
+        "timestamp": _fixed_column(fields.get(_TRADE_FIELDS["timestamp"]), "<i8"),
+        "symbol": _varint_column(fields.get(_TRADE_FIELDS["symbol"])),
+        "side": _varint_column(fields.get(_TRADE_FIELDS["side"])),
+        **{
+            name: _fixed_column(fields.get(_TRADE_FIELDS[name]), "<f8")
+            for name in ("quantity", "price", "pnl", "commission", "portfolio_value")
+        },
+    }
+    n = _check_lengths("TradeColumns", columns)
+    symbols = _strings(fields.get(_TRADE_FIELDS["symbols"]))
+    if n and (not symbols or int(columns["symbol"].max()) >= len(symbols)):
+        raise ValueError("symbol_index 가 심볼 사전 범위를 벗어났습니다")
+    trade_id = _strings(fields.get(_TRADE_FIELDS["trade_id"]))
+    if trade_id and len(trade_id) != n:
+        raise ValueError(f"trade_id 개수가 거래 수와 다릅니다: {len(trade_id)} != {n}")
+    return TradeView(**columns, symbols=symbols, trade_id=trade_id)
+
+
+def _view_fields(
+    source: bytes | bytearray | memoryview, message_type: type
+) -> dict[int, list[memoryview]]:
+    fields, unpacked = _scan(_as_buffer(source))
+    if unpacked:
+        # 비패킹 인코딩(다른 구현의 직렬화)은 메시지로 파싱한 뒤 다시 packed 로 직렬화
+        canonical = message_type.FromString(bytes(source)).SerializeToString()
+        fields, _ = _scan(memoryview(canonical))
+    return fields
+
+
+def equity_view(source: bt_pb2.EquityColumns | bytes | bytearray | memoryview) -> EquityView:
+    """EquityColumns (메시지 또는 직렬화 바이트) 의 열별 뷰"""
+    if isinstance(source, bt_pb2.EquityColumns):
+        source = source.SerializeToString()
+    return _equity_from_fields(_view_fields(source, bt_pb2.EquityColumns))
+
+
+def trade_view(source: bt_pb2.TradeColumns | bytes | bytearray | memoryview) -> TradeView:
+    """TradeColumns (메시지 또는 직렬화 바이트) 의 열별 뷰"""
+    if isinstance(source, bt_pb2.TradeColumns):
+        source = source.SerializeToString()
+    return _trade_from_fields(_view_fields(source, bt_pb2.TradeColumns))
+
+
+def result_views(
+    source: bt_pb2.BacktestResultResponse | bytes | bytearray | memoryview,
+) -> tuple[TradeView | None, EquityView | None]:
+    """열 형식 BacktestResultResponse 의 (거래 뷰, 자산곡선 뷰), 없는 쪽은 None"""
+    if isinstance(source, bt_pb2.BacktestResultResponse):
+        trades = trade_view(source.trade_columns) if source.HasField("trade_columns") else None
+        equity = equity_view(source.equity_columns) if source.HasField("equity_columns") else None
+        return trades, equity
+    fields, _ = _scan(_as_buffer(source))
+    trade_slices = fields.get(_RESULT_TRADE_COLUMNS)
+    equity_slices = fields.get(_RESULT_EQUITY_COLUMNS)
+    return (
+        trade_view(_joined(trade_slices)) if trade_slices else None,
+        equity_view(_joined(equity_slices)) if equity_slices else None,
+    )
+
+
+def get_result_bytes(
+    channel: grpc.Channel,
+    request: bt_pb2.GetBacktestResultRequest,
+    timeout: float | None = None,
+) -> bytes:
+    """GetBacktestResult 응답을 역직렬화하지 않은 바이트로 수신 (result_views 입력용)"""
+    call = channel.unary_unary(
+        _GET_RESULT_METHOD,
+        request_serializer=bt_pb2.GetBacktestResultRequest.SerializeToString,
+        response_deserializer=None,
+    )
+    return call(request, timeout=timeout)
+
+
+# ========== Encoding ==========
+
+
+def equity_columns(equity: np.ndarray) -> bt_pb2.EquityColumns:
+    """EQUITY_DTYPE 배열에서 EquityColumns 생성"""
+    data = _packed(_EQUITY_FIELDS["timestamp"], equity["timestamp"], "<i8") + b"".join(
+        _packed(number, equity[name], "<f8")
+        for name, number in _EQUITY_FIELDS.items()
+        if name != "timestamp"
+    )
+    return bt_pb2.EquityColumns.FromString(data)
+
+
+def trade_columns(
+    trades: np.ndarray,
+    symbols: Sequence[str],
+    trade_ids: Sequence[str] | None = None,
+) -> bt_pb2.TradeColumns:
+    """TRADE_DTYPE 배열(symbol 은 symbols 인덱스)에서 TradeColumns 생성"""
+    data = _packed(_TRADE_FIELDS["timestamp"], trades["timestamp"], "<i8") + b"".join(
+        _packed(_TRADE_FIELDS[name], trades[name], "<f8")
+        for name in ("quantity", "price", "pnl", "commission", "portfolio_value")
+    )
+    columns = bt_pb2.TradeColumns.FromString(data)
+    columns.symbols.extend(symbols)
+    columns.symbol_index.extend(trades["symbol"].tolist())
+    side = np.zeros(len(trades), dtype=np.int64)
+    for code, enum_value in _SIDE_TO_ENUM.items():
+        side[trades["side"] == code] = enum_value
+    columns.side.extend(side.tolist())
+    if trade_ids is not None and any(trade_ids):
+        columns.trade_id.extend(trade_ids)
+    return columns
+
+
+def trades_to_columns(trades: Sequence[bt_pb2.Trade]) -> bt_pb2.TradeColumns:
+    """Trade 메시지 목록을 TradeColumns 로 변환"""
+    symbol_codes: dict[str, int] = {}
+    records = _trade_rows(trades, symbol_codes) if trades else np.empty(0, dtype=TRADE_DTYPE)
+    symbols = [""] * len(symbol_codes)
+    for symbol, code in symbol_codes.items():
+        symbols[code] = symbol
+    return trade_columns(records, symbols, [t.trade_id for t in trades])
+
+
+def points_to_columns(points: Sequence[bt_pb2.EquityPoint]) -> bt_pb2.EquityColumns:
+    """EquityPoint 메시지 목록을 EquityColumns 로 변환"""
+    records = _equity_rows(points) if points else np.empty(0, dtype=EQUITY_DTYPE)
+    return equity_columns(records)
+
+
+def to_columnar(result: bt_pb2.BacktestResultResponse) -> bt_pb2.BacktestResultResponse:
+    """행 형식 결과를 열 형식(trade_columns / equity_columns) 결과로 변환"""
+    columnar = bt_pb2.BacktestResultResponse()
+    for descriptor, value in result.ListFields():
+        if descriptor.name in ("trades", "equity_curve"):
+            continue
+        if descriptor.label == descriptor.LABEL_REPEATED:
+            getattr(columnar, descriptor.name).extend(value)
+        elif descriptor.message_type is not None:
+            getattr(columnar, descriptor.name).CopyFrom(value)
+        else:
+            setattr(columnar, descriptor.name, value)
+    if result.trades:
+        columnar.trade_columns.CopyFrom(trades_to_columns(result.trades))
+    if result.equity_curve:
+        columnar.equity_columns.CopyFrom(points_to_columns(result.equity_curve))
+    return columnar
@@ -0,0 +1,234 @@
+"""
+백테스트 비교 모듈 (CompareBacktests).
+
+여러 결과를 각각 받아 Python 에서 자산곡선을 맞추던 작업을 한 번의 벡터화 계산으로 대신합니다.
+
+- 자산곡선: 모든 timestamp 의 합집합 축에 정렬 (직전 값 유지, 시작 전은 NaN), 선택적으로 1.0 기준 재조정
+- 지표 차이: 백테스트별 PerformanceMetrics 와 기준(baseline) 대비 필드별 차이
+- 롤링 상관: 정렬 축의 바 수익률로 모든 쌍의 롤링/전체 상관을 누적합 한 번으로 계산
+- 거래 겹침: 쌍별로 허용 오차 안에 상대 거래가 있는 고유 거래 시각 수와 Jaccard 지수
+
+결과는 캐시된 GetBacktestResult 응답(backtest.cache)에서 만듭니다.
+
+사용 예시:
+    results = [
+        cache.fetch(stub, bt_pb2.GetBacktestResultRequest(backtest_id=bid, user_id=uid))
+        for bid in request.backtest_ids
+    ]
+    return compare_results(request, results)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from ..protos.services.backtest.v1 import backtest_service_pb2 as bt_pb2
+from .columnar import result_views, to_columnar
+from .downsample import last_indices
+from .metrics import compute_metrics
+from .portfolio import align_closes
+from .stream import EQUITY_DTYPE, TRADE_DTYPE
+
+MIN_BACKTESTS = 2
+MAX_BACKTESTS = 20
+DEFAULT_MAX_POINTS = 500
+DEFAULT_CORRELATION_WINDOW = 20
+
+# 상관 누적합 블록당 최대 원소 수 (바 × 쌍)
+_PAIR_BLOCK_ELEMENTS = 1 << 20
+
+
+@dataclass
+class ComparedBacktest:
+    """비교 입력 (자산곡선 EQUITY_DTYPE, 거래 시각, 지표)"""
+
+    backtest_id: str
+    equity: np.ndarray
+    trade_timestamps: np.ndarray
+    metrics: bt_pb2.PerformanceMetrics
+
+
+def compared_from_result(result: bt_pb2.BacktestResultResponse) -> ComparedBacktest:
+    """BacktestResultResponse (행/열 형식) 를 비교 입력으로 변환"""
+    if not result.HasField("trade_columns") and not result.HasField("equity_columns"):
+        result = to_columnar(result)
+    trades, equity = result_views(result)
+    equity_records = equity.to_records() if equity is not None else np.empty(0, EQUITY_DTYPE)
+    trade_records = trades.to_records() if trades is not None else np.empty(0, TRADE_DTYPE)
+    metrics = result.metrics if result.HasField("metrics") else None
+    if metrics is None:
+        metrics = compute_metrics(equity_records, trade_records)
+    return ComparedBacktest(
+        result.backtest_id, equity_records, trade_records["timestamp"].copy(), metrics
+    )
+
+
+def metric_delta(
+    metrics: bt_pb2.PerformanceMetrics, baseline: bt_pb2.PerformanceMetrics
+) -> bt_pb2.PerformanceMetrics:
+    """필드별 metrics - baseline"""
+    delta = bt_pb2.PerformanceMetrics()
+    for field in bt_pb2.PerformanceMetrics.DESCRIPTOR.fields:
+        setattr(delta, field.name, getattr(metrics, field.name) - getattr(baseline, field.name))
+    return delta
+
+
+def _window_sums(cumulative: np.ndarray, index: np.ndarray, window: int) -> np.ndarray:
+    """앞에 0 행을 붙인 누적합에서 index 행까지 window 개 합"""
+    return cumulative[index + 1] - cumulative[np.maximum(index + 1 - window, 0)]
+
+
+def _correlation(
+    sx: np.ndarray,
+    sy: np.ndarray,
+    sxx: np.ndarray,
+    syy: np.ndarray,
+    sxy: np.ndarray,
+    n: np.ndarray,
+) -> np.ndarray:
+    """합계들로 계산한 피어슨 상관 (분산이 0 이면 NaN)"""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cov = n * sxy - sx * sy
+        var = (n * sxx - sx * sx) * (n * syy - sy * sy)
+        corr = cov / np.sqrt(var)
+    return np.where(var > 0, np.clip(corr, -1.0, 1.0), np.nan)
+
+
+def pair_correlations(
+    returns: np.ndarray, index: np.ndarray, window: int
+) -> tuple[list[tuple[int, int]], np.ndarray, np.ndarray]:
+    """모든 열 쌍의 (쌍 목록, index 위치 롤링 상관 (len(index), P), 전체 상관 (P,))"""
+    n_bars, k = returns.shape
+    pairs = [(a, b) for a in range(k) for b in range(a + 1, k)]
+    rolling = np.full((len(index), len(pairs)), np.nan)
+    overall = np.full(len(pairs), np.nan)
+    finite = np.isfinite(returns)
+    block = max(1, _PAIR_BLOCK_ELEMENTS // max(n_bars, 1))
+
+    for start in range(0, len(pairs), block):
+        chunk = pairs[start : start + block]
+        left = np.array([a for a, _ in chunk])
+        right = np.array([b for _, b in chunk])
+        valid = finite[:, left] & finite[:, right]
+        x = np.where(valid, returns[:, left], 0.0)
+        y = np.where(valid, returns[:, right], 0.0)
+        sums = [
+            np.concatenate((np.zeros((1, len(chunk))), np.cumsum(v, axis=0)))
+            for v in (x, y, x * x, y * y, x * y, valid.astype(np.float64))
+        ]
+        windowed = [_window_sums(c, index, window) for c in sums]
+        corr = _correlation(*windowed)
+        # 창 전체가 두 곡선 모두 유효할 때만
+        rolling[:, start : start + len(chunk)] = np.where(windowed[5] == window, corr, np.nan)
+        overall[start : start + len(chunk)] = _correlation(*(c[-1] for c in sums))
+    return pairs, rolling, overall
+
+
+def trade_overlap(a: np.ndarray, b: np.ndarray, tolerance_ns: int = 0) -> int:
+    """b 의 거래가 tolerance_ns 안에 있는 a 의 고유 거래 시각 수 (a, b 는 정렬된 고유 시각)"""
+    if not len(a) or not len(b):
+        return 0
+    position = np.searchsorted(b, a - tolerance_ns, "left")
+    inside = position < len(b)
+    return int((b[np.where(inside, position, 0)] <= a + tolerance_ns)[inside].sum())
+
+
+def compare_backtests(
+    backtests: Sequence[ComparedBacktest],
+    baseline_id: str | None = None,
+    max_points: int = DEFAULT_MAX_POINTS,
+    correlation_window: int = DEFAULT_CORRELATION_WINDOW,
+    normalize: bool = True,
+    overlap_tolerance_ns: int = 0,
+) -> bt_pb2.CompareBacktestsResponse:
+    """CompareBacktestsResponse 생성"""
+    ids = [backtest.backtest_id for backtest in backtests]
+    if not MIN_BACKTESTS <= len(ids) <= MAX_BACKTESTS:
+        raise ValueError(
+            f"비교할 백테스트는 {MIN_BACKTESTS}-{MAX_BACKTESTS} 개여야 합니다: {len(ids)}"
+        )
+    if len(set(ids)) != len(ids):
+        raise ValueError(f"백테스트 ID 중복: {ids}")
+    baseline_id = baseline_id or ids[0]
+    if baseline_id not in ids:
+        raise ValueError(f"baseline_id 가 비교 대상에 없습니다: {baseline_id}")
+    if correlation_window < 2:
+        raise ValueError(f"correlation_window 는 2 이상이어야 합니다: {correlation_window}")
+    if max_points < 2:
+        raise ValueError(f"max_points 는 2 이상이어야 합니다: {max_points}")
+    empty = [backtest.backtest_id for backtest in backtests if not len(backtest.equity)]
+    if empty:
+        raise ValueError(f"자산곡선이 없는 백테스트: {empty}")
+
+    timestamp, equity = align_closes(
+        {b.backtest_id: (b.equity["timestamp"], b.equity["equity"]) for b in backtests}
+    )
+    if normalize:
+        first = np.array([b.equity["equity"][np.argmin(b.equity["timestamp"])] for b in backtests])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            equity = equity / np.where(first != 0, first, np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = np.full_like(equity, np.nan)
+        returns[1:] = equity[1:] / equity[:-1] - 1.0
+
+    n = len(timestamp)
+    index = np.union1d([0], last_indices(n, max_points - 1)) if n > max_points else np.arange(n)
+    pairs, rolling, overall = pair_correlations(returns, index, correlation_window)
+
+    response = bt_pb2.CompareBacktestsResponse(
+        backtest_ids=ids, baseline_id=baseline_id, timestamp_ns=timestamp[index].tolist()
+    )
+    for column, backtest_id in enumerate(ids):
+        response.equity.add(backtest_id=backtest_id, values=equity[index, column].tolist())
+
+    baseline = backtests[ids.index(baseline_id)].metrics
+    for backtest in backtests:
+        response.metrics.add(
+            backtest_id=backtest.backtest_id,
+            metrics=backtest.metrics,
+            delta=metric_delta(backtest.metrics, baseline),
+        )
+
+    distinct = [np.unique(backtest.trade_timestamps) for backtest in backtests]
+    for column, (a, b) in enumerate(pairs):
+        response.correlations.add(
+            backtest_id_a=ids[a],
+            backtest_id_b=ids[b],
+            rolling=rolling[:, column].tolist(),
+            overall=float(overall[column]),
+        )
+        shared = trade_overlap(distinct[a], distinct[b], overlap_tolerance_ns)
+        union = len(distinct[a]) + len(distinct[b]) - shared
+        response.trade_overlaps.add(
+            backtest_id_a=ids[a],
+            backtest_id_b=ids[b],
+            trades_a=len(distinct[a]),
+            trades_b=len(distinct[b]),
+            shared=shared,
+            jaccard=shared / union if union > 0 else 0.0,
+        )
+    return response
+
+
+def compare_results(
+    request: bt_pb2.CompareBacktestsRequest,
+    results: Sequence[bt_pb2.BacktestResultResponse],
+) -> bt_pb2.CompareBacktestsResponse:
+    """CompareBacktests 요청 처리 (results 는 request.backtest_ids 순서)"""
+    if [result.backtest_id for result in results] != list(request.backtest_ids):
+        raise ValueError("results 가 backtest_ids 와 순서/개수가 다릅니다")
+    return compare_backtests(
+        [compared_from_result(result) for result in results],
+        baseline_id=request.baseline_id if request.HasField("baseline_id") else None,
+        max_points=request.max_points if request.HasField("max_points") else DEFAULT_MAX_POINTS,
+        correlation_window=(
+            request.correlation_window
+            if request.HasField("correlation_window")
+            else DEFAULT_CORRELATION_WINDOW
+        ),
+        normalize=request.normalize if request.HasField("normalize") else True,
+        overlap_tolerance_ns=request.overlap_tolerance_ms * 1_000_000,
+    )
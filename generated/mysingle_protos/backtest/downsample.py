@@ -0,0 +1,181 @@
+"""
+자산곡선(equity curve) 다운샘플링 모듈.
+
+GetBacktestResult / ListBacktests 의 max_points, downsample_method 옵션에 대한 참조 구현입니다.
+서버와 클라이언트 모두에서 사용할 수 있으며, 모든 방식은 max_points 를 넘지 않고
+첫/마지막 점, 최대 낙폭(MDD)의 저점/고점, 자산 최고/최저점을 이 우선순위로 정확히 보존합니다
+(max_points 가 보존 점 수보다 작으면 낮은 우선순위부터 생략).
+
+- lttb: Largest-Triangle-Three-Buckets (시각적 형태 보존)
+- min_max: 버킷별 최소/최대점 (envelope 보존)
+- last: 버킷별 마지막 점
+
+사용 예시:
+    points = downsample_points(result.equity_curve, max_points=1000, method="lttb")
+    reduced = downsample_equity(streamed.equity, 1000, "min_max")
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import numpy as np
+
+from ..protos.services.backtest.v1 import backtest_service_pb2 as bt_pb2
+
+METHODS = ("lttb", "min_max", "last")
+DEFAULT_METHOD = "lttb"
+
+_METHOD_BY_ENUM = {
+    bt_pb2.DOWNSAMPLE_METHOD_UNSPECIFIED: DEFAULT_METHOD,
+    bt_pb2.DOWNSAMPLE_METHOD_LTTB: "lttb",
+    bt_pb2.DOWNSAMPLE_METHOD_MIN_MAX: "min_max",
+    bt_pb2.DOWNSAMPLE_METHOD_LAST: "last",
+}
+
+
+def method_name(method: int | str | None) -> str:
+    """DownsampleMethod enum 또는 문자열을 방식 이름으로 변환"""
+    if method is None:
+        return DEFAULT_METHOD
+    if isinstance(method, str):
+        name = method.lower().replace("-", "_")
+        if name not in METHODS:
+            raise ValueError(f"지원하지 않는 다운샘플링 방식: {method}")
+        return name
+    if method not in _METHOD_BY_ENUM:
+        raise ValueError(f"지원하지 않는 다운샘플링 방식: {method}")
+    return _METHOD_BY_ENUM[method]
+
+
+def drawdown_extremes(equity: np.ndarray) -> tuple[int, int]:
+    """최대 낙폭 구간의 (고점 인덱스, 저점 인덱스)"""
+    peaks = np.maximum.accumulate(equity)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        drawdown = np.where(peaks > 0, equity / peaks - 1.0, 0.0)
+    trough = int(np.argmin(drawdown))
+    peak = int(np.argmax(equity[: trough + 1]))
+    return peak, trough
+
+
+def _edges(start: int, stop: int, buckets: int) -> np.ndarray:
+    """[start, stop) 구간을 거의 같은 크기의 버킷으로 나누는 경계"""
+    return start + (np.arange(buckets + 1) * (stop - start)) // buckets
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """LTTB 선택 인덱스 (첫/마지막 점 포함 n_out 개)"""
+    n = len(y)
+    if n_out >= n or n <= 2:
+        return np.arange(n)
+    if n_out < 3:
+        return np.array([0, n - 1])
+
+    buckets = n_out - 2
+    edges = _edges(1, n - 1, buckets)
+    counts = np.diff(edges)
+    avg_x = np.add.reduceat(x[1 : n - 1], edges[:-1] - 1) / counts
+    avg_y = np.add.reduceat(y[1 : n - 1], edges[:-1] - 1) / counts
+    # 버킷 b 의 세 번째 꼭짓점은 다음 버킷 평균 (마지막 버킷은 마지막 점)
+    next_x = np.append(avg_x[1:], x[n - 1])
+    next_y = np.append(avg_y[1:], y[n - 1])
+
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for b in range(buckets):
+        lo, hi = edges[b], edges[b + 1]
+        ax, ay = x[a], y[a]
+        area = np.abs((ax - next_x[b]) * (y[lo:hi] - ay) - (ax - x[lo:hi]) * (next_y[b] - ay))
+        a = lo + int(np.argmax(area))
+        selected[b + 1] = a
+    return selected
+
+
+def min_max_indices(y: np.ndarray, n_out: int) -> np.ndarray:
+    """버킷별 최소/최대점 인덱스 (최대 n_out 개, 위치 순)"""
+    n = len(y)
+    if n_out >= n:
+        return np.arange(n)
+    if n_out < 2:
+        # 최소/최대 쌍을 담을 수 없으면 전체 최솟값 하나 (n_out 이 0 이면 없음)
+        return np.array([int(np.argmin(y))])[: max(n_out, 0)]
+    buckets = n_out // 2
+
+    edges = _edges(0, n, buckets)
+    bucket = np.repeat(np.arange(buckets), np.diff(edges))
+    lows = np.minimum.reduceat(y, edges[:-1])
+    highs = np.maximum.reduceat(y, edges[:-1])
+    # 버킷 최솟값/최댓값과 같은 첫 위치
+    low_pos = np.flatnonzero(y == lows[bucket])
+    high_pos = np.flatnonzero(y == highs[bucket])
+    _, first_low = np.unique(bucket[low_pos], return_index=True)
+    _, first_high = np.unique(bucket[high_pos], return_index=True)
+    return np.union1d(low_pos[first_low], high_pos[first_high])
+
+
+def last_indices(n: int, n_out: int) -> np.ndarray:
+    """버킷별 마지막 점 인덱스"""
+    if n_out >= n:
+        return np.arange(n)
+    return _edges(0, n, max(n_out, 1))[1:] - 1
+
+
+def downsample_indices(
+    timestamp: np.ndarray,
+    equity: np.ndarray,
+    max_points: int | None,
+    method: int | str | None = None,
+) -> np.ndarray:
+    """다운샘플링 후 남길 점의 인덱스 (위치 순, 최대 max_points 개)"""
+    n = len(equity)
+    if not max_points or max_points <= 0 or n <= max_points:
+        return np.arange(n)
+
+    equity = np.asarray(equity, dtype=np.float64)
+    peak, trough = drawdown_extremes(equity)
+    # 보존 점 (우선순위 순, max_points 를 넘는 낮은 우선순위 점은 생략)
+    priority = [0, n - 1, trough, peak, int(np.argmax(equity)), int(np.argmin(equity))]
+    anchors = np.unique(list(dict.fromkeys(priority))[:max_points])
+    budget = max_points - len(anchors)
+    if budget <= 0:
+        return anchors
+
+    name = method_name(method)
+    if name == "lttb":
+        x = np.asarray(timestamp, dtype=np.int64)
+        # 첫/마지막 점은 lttb 결과와 anchors 에 모두 포함되므로 예산에 2 를 더함
+        selected = lttb_indices((x - x[0]).astype(np.float64), equity, budget + 2)
+    elif name == "min_max":
+        selected = min_max_indices(equity, budget)
+    else:
+        selected = last_indices(n, budget)
+    return np.union1d(selected, anchors)
+
+
+def downsample_equity(
+    equity: np.ndarray,
+    max_points: int | None,
+    method: int | str | None = None,
+) -> np.ndarray:
+    """EQUITY_DTYPE 구조화 배열 다운샘플링 (stream.collect_result 결과 등)"""
+    index = downsample_indices(equity["timestamp"], equity["equity"], max_points, method)
+    return equity[index]
+
+
+def downsample_points(
+    points: Sequence[bt_pb2.EquityPoint],
+    max_points: int | None,
+    method: int | str | None = None,
+) -> list[bt_pb2.EquityPoint]:
+    """EquityPoint 목록 다운샘플링"""
+    n = len(points)
+    if not max_points or max_points <= 0 or n <= max_points:
+        return list(points)
+    timestamp = np.fromiter(
+        (p.timestamp.seconds * 1_000_000_000 + p.timestamp.nanos for p in points),
+        dtype=np.int64,
+        count=n,
+    )
+    equity = np.fromiter((p.equity for p in points), dtype=np.float64, count=n)
+    return [points[i] for i in downsample_indices(timestamp, equity, max_points, method).tolist()]
@@ -0,0 +1,1607 @@
+"""
+벡터화 참조 백테스트 엔진 및 BacktestService 대역 서버.
+
+실제 백테스트 서비스 없이 ExecuteBacktest → StreamBacktestProgress → GetBacktestResult 흐름을
+오프라인으로 부하 테스트하기 위한 BacktestServiceServicer 구현입니다.
+
+- 가격: market_data.synthetic 의 시드 기반 합성 봉 (price_source 로 교체 가능)
+- 신호: signal(close, params) 가 바별 목표 노출 비율(0 = 현금, 0-1 = 롱)을 반환하며
+  바 종가에 체결 (노출은 진입 시점 값으로 고정, max_position_size 로 상한)
+- 체결 비용: slippage_bps 를 불리한 방향으로 적용, 진입/청산마다 commission_per_trade
+- 손절/익절: 진입 바 종가 대비 수익률이 stop_loss_pct / take_profit_pct 에 닿는 첫 바에서 청산,
+  신호가 꺼졌다 다시 켜질 때까지 재진입하지 않음
+- 바 단위 루프 없이 포지션 구간 단위로 계산 (구간별 자산 점화식 E' = a·E + b 를 누적곱으로 풀이)
+- assets 가 설정된 포트폴리오 설정은 backtest.portfolio 로 실행
+- 같은 사용자 · 신호 · 설정의 완료된 백테스트는 backtest.memo 로 재사용 (force_rerun 이면 재실행)
+- 진행 이벤트 경계마다 바 구간 단위로 진행하고 snapshot_interval_seconds 마다 엔진 상태를
+  backtest.checkpoint 에 기록, ResumeBacktest 로 어느 워커에서든 이어서 실행
+  (포트폴리오/샤드 실행은 중간 상태 없이 처음부터 재실행). 실행 중인 워커는 체크포인트 리스를
+  갱신하고, 다른 워커의 리스가 유효한 체크포인트는 넘겨받지 않음
+- 완료된 결과의 거래는 backtest.tradeindex 로 QueryTrades 조건 조회 (시간 구간/side/심볼/pnl, 커서)
+- 롤링 샤프/변동성/낙폭/승률은 backtest.rolling 으로 GetRollingMetrics 에서 계산해 백테스트별 보관
+- BacktestConfig.parallelism > 1 이면 backtest.shard 로 기간을 나눠 shard_processes 개 프로세스에서
+  계산하고 이음 (warm-up 은 신호의 LOOKBACKS 또는 warmup_bars)
+
+사용 예시 (엔진만):
+    timestamp, close = prices
+    result = run_backtest(config, timestamp, close, sma_crossover)
+    print(result.metrics().sharpe_ratio)
+
+사용 예시 (프로세스 내부 서버):
+    with serve_in_background(EngineConfig(progress_updates=20)) as server:
+        stub = bt_grpc.BacktestServiceStub(grpc.insecure_channel(server.address))
+        job = stub.ExecuteBacktest(
+            bt_pb2.ExecuteBacktestRequest(user_id="u1", strategy_id="sma_crossover", config=config)
+        )
+        request = bt_pb2.StreamProgressRequest(backtest_id=job.backtest_id, user_id="u1")
+        for update in follow_progress(stub, request):
+            print(update.progress_pct)
+
+사용 예시 (중단 지점부터 재개):
+    run = BacktestRun.from_config(config, timestamp, close, sma_crossover)
+    run.advance(1000)
+    state = run.dumps()
+    resumed = BacktestRun.from_config(config, timestamp, close, sma_crossover)
+    resumed.restore(state)
+    resumed.advance()
+
+사용 예시 (로컬 서버, 체크포인트 공유 디렉터리):
+    python -m mysingle_protos.backtest.engine --port 50052 --workers 4 --progress-updates 20 \
+        --checkpoint-dir /tmp/backtest-checkpoints --shard-processes 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import io
+import itertools
+import math
+import multiprocessing
+import secrets
+import threading
+import time
+from collections.abc import Callable, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+import grpc
+import numpy as np
+
+from ..market_data.synthetic import SyntheticConfig, SyntheticMarketData
+from ..protos.services.backtest.v1 import backtest_service_pb2 as bt_pb2
+from ..protos.services.backtest.v1 import backtest_service_pb2_grpc as bt_grpc
+from .columnar import equity_columns
+from .checkpoint import (
+    DEFAULT_INTERVAL_SECONDS,
+    DEFAULT_LEASE_SECONDS,
+    DEFAULT_TTL_SECONDS,
+    CheckpointPolicy,
+    CheckpointStore,
+    checkpoint_interval,
+    held_by_other,
+    make_checkpoint,
+    release_lease,
+    stamp_lease,
+)
+from .compare import compare_results
+from .downsample import downsample_equity, downsample_indices
+from .memo import DEFAULT_MAX_ENTRIES, BacktestMemo, memo_key, memoized_response
+from .metrics import compute_metrics
+from .montecarlo import run_monte_carlo
+from .pagination import SummaryIndex
+from .portfolio import PortfolioResult, align_closes, portfolio_symbols, run_portfolio
+from .progress import ProgressOptions, throttle
+from .rolling import RollingSeries
+from .scheduler import BacktestScheduler, Lane
+from .stream import EQUITY_DTYPE, SIDE_CODES, TRADE_DTYPE, iter_result_chunks
+from .sweep import expand_variants, sweep_response
+from .tradeindex import TradeIndex
+from .watch import BacktestWatch, ProgressHub
+
+SERVICE_NAME = "backtest-reference"
+# BacktestRun.dumps 상태 형식 (BacktestCheckpoint.state_format)
+STATE_FORMAT = "reference-engine/v1"
+DEFAULT_SIGNAL = "sma_crossover"
+# ListBacktests 요약에 보관하는 자산곡선 점 수
+SUMMARY_POINTS = 200
+
+# signal(close, params) → 바별 목표 노출 비율
+Signal = Callable[[np.ndarray, Mapping[str, str]], np.ndarray]
+# lookback(params) → 신호 한 값을 계산하는 데 필요한 바 수 (지표 min_lookback, 샤드 warm-up)
+Lookback = Callable[[Mapping[str, str]], int]
+# price_source(symbol, interval, start_date, end_date) → (epoch ns, 종가)
+PriceSource = Callable[[str, str, str, str], tuple[np.ndarray, np.ndarray]]
+
+
+# ========== Signals ==========
+
+
+def _sma(close: np.ndarray, window: int) -> np.ndarray:
+    out = np.full(len(close), np.nan)
+    if window <= len(close):
+        cumulative = np.concatenate(([0.0], np.cumsum(close)))
+        out[window - 1 :] = (cumulative[window:] - cumulative[:-window]) / window
+    return out
+
+
+def sma_crossover(close: np.ndarray, params: Mapping[str, str]) -> np.ndarray:
+    """단순이동평균 교차 (params fast/slow, 기본 10/30): fast > slow 이면 전액 롱"""
+    fast = int(params.get("fast", 10))
+    slow = int(params.get("slow", 30))
+    if not 1 <= fast < slow:
+        raise ValueError(f"fast 는 1 이상 slow 미만이어야 합니다: fast={fast} slow={slow}")
+    with np.errstate(invalid="ignore"):
+        return (_sma(close, fast) > _sma(close, slow)).astype(np.float64)
+
+
+def buy_and_hold(close: np.ndarray, params: Mapping[str, str]) -> np.ndarray:
+    """첫 바부터 끝까지 보유 (params exposure, 기본 1.0)"""
+    return np.full(len(close), float(params.get("exposure", 1.0)))
+
+
+SIGNALS: dict[str, Signal] = {"sma_crossover": sma_crossover, "buy_and_hold": buy_and_hold}
+LOOKBACKS: dict[str, Lookback] = {
+    "sma_crossover": lambda params: int(params.get("slow", 30)),
+    "buy_and_hold": lambda params: 1,
+}
+
+
+# ========== Engine ==========
+
+
+def _position_segments(
+    active: np.ndarray,
+    close: np.ndarray,
+    stop_loss_pct: float | None,
+    take_profit_pct: float | None,
+    previous: bool = False,
+) -> tuple[np.ndarray, np.ndarray]:
+    """포지션 구간의 (진입 바, 청산 바), 끝까지 보유한 구간의 청산 바는 len(close)"""
+    # previous 는 첫 바 직전의 신호 (켜져 있었으면 첫 하강 에지는 짝이 되는 진입이 없음)
+    n = len(close)
+    edges = np.diff(active.astype(np.int8), prepend=np.int8(previous))
+    entries = np.flatnonzero(edges == 1)
+    exits = np.full(len(entries), n)
+    signal_exits = np.flatnonzero(edges == -1)[int(previous) :]
+    exits[: len(signal_exits)] = signal_exits
+    if not len(entries) or (stop_loss_pct is None and take_profit_pct is None):
+        return entries, exits
+
+    # 진입 다음 바부터 신호 청산 전까지 진입가 대비 이동률이 한도에 닿는 구간별 첫 바
+    bars = np.arange(n)
+    segment = np.searchsorted(entries, bars, "right") - 1
+    seg = np.maximum(segment, 0)
+    inside = (segment >= 0) & (bars > entries[seg]) & (bars < exits[seg])
+    move = (close / close[entries][seg] - 1.0) * 100.0
+    hit = np.zeros(n, dtype=bool)
+    if stop_loss_pct is not None:
+        hit |= move <= -stop_loss_pct
+    if take_profit_pct is not None:
+        hit |= move >= take_profit_pct
+    hits = np.flatnonzero(hit & inside)
+    stopped, first = np.unique(segment[hits], return_index=True)
+    exits[stopped] = hits[first]
+    return entries, exits
+
+
+def _carried_exit(
+    close: np.ndarray,
+    active: np.ndarray,
+    entry_close: float,
+    stop_loss_pct: float | None,
+    take_profit_pct: float | None,
+) -> int:
+    """이어받은 포지션의 청산 바 (신호가 꺼지거나 손절/익절 한도에 닿는 첫 바, 없으면 len(close))"""
+    move = (close / entry_close - 1.0) * 100.0
+    stop = ~active
+    if stop_loss_pct is not None:
+        stop |= move <= -stop_loss_pct
+    if take_profit_pct is not None:
+        stop |= move >= take_profit_pct
+    hits = np.flatnonzero(stop)
+    return int(hits[0]) if len(hits) else len(close)
+
+
+@dataclass
+class SimulationState:
+    """바 경계의 단일 심볼 시뮬레이션 상태 (다음 바부터 이어서 실행할 때의 입력)"""
+
+    cash: float
+    # 보유 수량 (0 이면 포지션 없음)
+    quantity: float = 0.0
+    # 보유 포지션의 진입 바 종가 (손절/익절 기준) 와 진입 직전 자산 (청산 pnl 기준)
+    entry_close: float = 0.0
+    entry_equity: float = 0.0
+    # 직전 바의 신호 (켜진 채로 이어받으면 다음 상승 에지까지 진입하지 않음)
+    active: bool = False
+    # 지금까지의 최고 자산 (drawdown 기준)
+    peak: float = -math.inf
+
+
+def _simulate_bars(
+    timestamp: np.ndarray,
+    close: np.ndarray,
+    exposure: np.ndarray,
+    state: SimulationState,
+    fee: float,
+    slip: float,
+    stop_loss_pct: float | None,
+    take_profit_pct: float | None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, SimulationState]:
+    """state 에서 이어서 바들을 시뮬레이션 → (자산곡선, 거래, 보유 수량, 마지막 바 이후 상태)"""
+    n = len(close)
+    active = exposure > 0
+    position = np.zeros(n)
+    cash = np.full(n, state.cash)
+    trades = [np.zeros(0, dtype=TRADE_DTYPE)]
+    start, previous, capital = 0, state.active, state.cash
+    after = SimulationState(
+        state.cash,
+        state.quantity,
+        state.entry_close,
+        state.entry_equity,
+        bool(active[-1]) if n else state.active,
+    )
+
+    if state.quantity > 0:
+        start = _carried_exit(close, active, state.entry_close, stop_loss_pct, take_profit_pct)
+        position[:start] = state.quantity
+        if start < n:
+            sell_price = close[start] * (1.0 - slip)
+            capital = state.cash + state.quantity * sell_price - fee
+            sell = np.zeros(1, dtype=TRADE_DTYPE)
+            sell["timestamp"] = timestamp[start]
+            sell["side"] = SIDE_CODES["SELL"]
+            sell["quantity"] = state.quantity
+            sell["price"] = sell_price
+            sell["pnl"] = capital - state.entry_equity
+            sell["commission"] = fee
+            sell["portfolio_value"] = capital
+            trades.append(sell)
+            cash[start:] = capital
+            previous = bool(active[start])
+            start += 1
+            after.cash, after.quantity = capital, 0.0
+
+    if start < n:
+        close_, exposure_ = close[start:], exposure[start:]
+        m = len(close_)
+        entries, exits = _position_segments(
+            exposure_ > 0, close_, stop_loss_pct, take_profit_pct, previous
+        )
+
+        def solve(entries: np.ndarray, exits: np.ndarray) -> tuple[np.ndarray, ...]:
+            # 구간 k 진입 전 자산 E_k: 수수료 뒤 f 비율 매수, 청산 시 수익배수 R 로
+            # E_{k+1} = (E_k - fee)(1 - f + f R) - fee = a_k E_k + b_k
+            fraction = exposure_[entries]
+            buy_price = close_[entries] * (1.0 + slip)
+            sell_price = close_[np.minimum(exits, m - 1)] * (1.0 - slip)
+            growth = np.where(exits < m, sell_price / buy_price, 1.0)
+            a = 1.0 - fraction + fraction * growth
+            b = np.where(exits < m, -fee * (a + 1.0), 0.0)
+            scale = np.concatenate(([1.0], np.cumprod(a)))
+            before = scale * (capital + np.concatenate(([0.0], np.cumsum(b / scale[1:]))))
+            return fraction, buy_price, sell_price, before
+
+        fraction, buy_price, sell_price, before = solve(entries, exits)
+        # 수수료를 낼 수 없는 자산에 도달하면 이후 진입 없음
+        broke = np.flatnonzero(before[:-1] <= fee)
+        if len(broke):
+            entries, exits = entries[: broke[0]], exits[: broke[0]]
+            fraction, buy_price, sell_price, before = solve(entries, exits)
+
+        invested = before[:-1] - fee
+        quantity = fraction * invested / buy_price
+        idle = invested - quantity * buy_price
+        if len(entries):
+            bars = np.arange(m)
+            segment = np.searchsorted(entries, bars, "right") - 1
+            held = (segment >= 0) & (bars < exits[np.maximum(segment, 0)])
+            position[start:] = np.where(held, quantity[segment], 0.0)
+            cash[start:] = np.where(held, idle[segment], before[segment + 1])
+
+        # 진입/청산이 번갈아 오므로 짝수 행은 매수, 홀수 행은 매도 (마지막 구간은 미청산일 수 있음)
+        closed = exits < m
+        segments = np.zeros(len(entries) + int(closed.sum()), dtype=TRADE_DTYPE)
+        buys, sells = segments[0::2], segments[1::2]
+        buys["timestamp"] = timestamp[start:][entries]
+        buys["side"] = SIDE_CODES["BUY"]
+        buys["quantity"] = quantity
+        buys["price"] = buy_price
+        buys["commission"] = fee
+        buys["portfolio_value"] = idle + quantity * close_[entries]
+        sells["timestamp"] = timestamp[start:][exits[closed]]
+        sells["side"] = SIDE_CODES["SELL"]
+        sells["quantity"] = quantity[closed]
+        sells["price"] = sell_price[closed]
+        sells["pnl"] = (before[1:] - before[:-1])[closed]
+        sells["commission"] = fee
+        sells["portfolio_value"] = before[1:][closed]
+        trades.append(segments)
+
+        if len(entries) and not closed[-1]:
+            after.cash, after.quantity = float(idle[-1]), float(quantity[-1])
+            after.entry_close = float(close_[entries[-1]])
+            after.entry_equity = float(before[-2])
+        else:
+            after.cash, after.quantity = float(before[-1]), 0.0
+
+    equity = np.zeros(n, dtype=EQUITY_DTYPE)
+    equity["timestamp"] = timestamp
+    equity["positions_value"] = position * close
+    equity["cash"] = cash
+    equity["equity"] = cash + equity["positions_value"]
+    peaks = np.maximum(np.maximum.accumulate(equity["equity"]), state.peak)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        equity["drawdown"] = np.where(peaks > 0, equity["equity"] / peaks - 1.0, 0.0) * 100.0
+    after.peak = float(peaks[-1]) if n else state.peak
+    return equity, np.concatenate(trades), position, after
+
+
+def _single_result(
+    symbol: str,
+    initial_capital: float,
+    equity: np.ndarray,
+    trades: np.ndarray,
+    position: np.ndarray,
+) -> PortfolioResult:
+    """단일 심볼 시뮬레이션 결과를 자산 1 개 PortfolioResult 로 변환"""
+    return PortfolioResult(
+        symbols=[symbol],
+        initial_capital=initial_capital,
+        equity=equity,
+        trades=trades,
+        positions=position[:, None],
+        values=equity["positions_value"][:, None],
+        pnl=(equity["equity"] - initial_capital)[:, None],
+        allocations=np.array([initial_capital]),
+    )
+
+
+class BacktestRun:
+    """바 구간 단위로 진행하는 단일 심볼 롱 온리 시뮬레이션 (상태를 직렬화해 중단한 바부터 재개)"""
+
+    def __init__(
+        self,
+        timestamp: np.ndarray,
+        close: np.ndarray,
+        exposure: np.ndarray,
+        symbol: str,
+        initial_capital: float,
+        commission_per_trade: float = 0.0,
+        slippage_bps: float = 0.0,
+        stop_loss_pct: float | None = None,
+        take_profit_pct: float | None = None,
+        max_position_size: float | None = None,
+    ) -> None:
+        n = len(close)
+        if len(timestamp) != n or len(exposure) != n:
+            raise ValueError(
+                f"입력 길이 불일치: timestamp={len(timestamp)} close={n} exposure={len(exposure)}"
+            )
+        if initial_capital <= 0:
+            raise ValueError(f"initial_capital 은 0 보다 커야 합니다: {initial_capital}")
+        if not np.all(close > 0):
+            raise ValueError("종가는 모두 양수여야 합니다")
+        cap = 1.0 if max_position_size is None else max_position_size / 100.0
+        if not 0 < cap <= 1:
+            raise ValueError(
+                f"max_position_size 는 0 초과 100 이하여야 합니다: {max_position_size}"
+            )
+        for name, value in (("stop_loss_pct", stop_loss_pct), ("take_profit_pct", take_profit_pct)):
+            if value is not None and value <= 0:
+                raise ValueError(f"{name} 은 0 보다 커야 합니다: {value}")
+
+        self.timestamp = timestamp
+        self.close = close
+        self.exposure = np.minimum(np.nan_to_num(exposure, nan=0.0), cap)
+        self.symbol = symbol
+        self.initial_capital = float(initial_capital)
+        self.fee = commission_per_trade
+        self.slip = slippage_bps / 10_000.0
+        self.stop_loss_pct = stop_loss_pct
+        self.take_profit_pct = take_profit_pct
+        self.bars_done = 0
+        # 남은 바는 시작 상태에서 한 번에 벡터화 계산하고 advance 는 커서만 이동
+        # (_prefix 는 복원한 체크포인트까지의 결과, _tail 은 _base 이후 계산 결과)
+        self._base = 0
+        self._base_state = SimulationState(self.initial_capital)
+        self._prefix = (
+            np.zeros(0, dtype=EQUITY_DTYPE),
+            np.zeros(0, dtype=TRADE_DTYPE),
+            np.zeros(0),
+        )
+        self._tail: tuple[np.ndarray, np.ndarray, np.ndarray, SimulationState] | None = None
+
+    @classmethod
+    def from_config(
+        cls,
+        config: bt_pb2.BacktestConfig,
+        timestamp: np.ndarray,
+        close: np.ndarray,
+        signal: Signal = sma_crossover,
+    ) -> BacktestRun:
+        """BacktestConfig 설정과 신호 함수로 실행 준비"""
+        close = np.asarray(close, dtype=np.float64)
+        exposure = np.asarray(signal(close, dict(config.params)), dtype=np.float64)
+        if exposure.shape != close.shape:
+            raise ValueError(f"신호 shape 이 종가와 다릅니다: {exposure.shape} != {close.shape}")
+        return cls(
+            np.asarray(timestamp, dtype=np.int64),
+            close,
+            exposure,
+            config.symbol,
+            config.initial_capital,
+            commission_per_trade=config.commission_per_trade,
+            slippage_bps=config.slippage_bps,
+            stop_loss_pct=config.stop_loss_pct if config.HasField("stop_loss_pct") else None,
+            take_profit_pct=(
+                config.take_profit_pct if config.HasField("take_profit_pct") else None
+            ),
+            max_position_size=(
+                config.max_position_size if config.HasField("max_position_size") else None
+            ),
+        )
+
+    @property
+    def total_bars(self) -> int:
+        """전체 바 수"""
+        return len(self.close)
+
+    def advance(self, bars: int | None = None) -> None:
+        """다음 bars 개 바 진행 (None 이면 끝까지)"""
+        if self._tail is None:
+            base = self._base
+            self._tail = _simulate_bars(
+                self.timestamp[base:],
+                self.close[base:],
+                self.exposure[base:],
+                self._base_state,
+                self.fee,
+                self.slip,
+                self.stop_loss_pct,
+                self.take_profit_pct,
+            )
+        start = self.bars_done
+        self.bars_done = self.total_bars if bars is None else min(start + bars, self.total_bars)
+
+    def _collect(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """진행한 바까지의 (자산곡선, 거래, 보유 수량)"""
+        done = self.bars_done - self._base
+        if not done:
+            return self._prefix
+        equity, trades, position, _ = self._tail
+        last = self.timestamp[self.bars_done - 1]
+        parts = (
+            equity[:done],
+            trades[: np.searchsorted(trades["timestamp"], last, "right")],
+            position[:done],
+        )
+        if not self._base:
+            return parts
+        return tuple(np.concatenate((head, tail)) for head, tail in zip(self._prefix, parts))
+
+    @property
+    def state(self) -> SimulationState:
+        """진행한 바 이후의 시뮬레이션 상태"""
+        done = self.bars_done - self._base
+        if not done:
+            return self._base_state
+        equity, trades, position, after = self._tail
+        if done == len(equity):
+            return after
+        base = self._base_state
+        state = SimulationState(
+            float(equity["cash"][done - 1]),
+            active=bool(self.exposure[self.bars_done - 1] > 0),
+            peak=max(base.peak, float(equity["equity"][:done].max())),
+        )
+        quantity = float(position[done - 1])
+        if quantity > 0:
+            last = self.timestamp[self.bars_done - 1]
+            trades = trades[: np.searchsorted(trades["timestamp"], last, "right")]
+            buys = trades[trades["side"] == SIDE_CODES["BUY"]]
+            state.quantity = quantity
+            if len(buys):
+                # 보유 중에는 cash 가 진입 후 남은 현금이므로 진입 전 자산 = cash + 매수 금액 + 수수료
+                entry = int(np.searchsorted(self.timestamp, buys["timestamp"][-1]))
+                state.entry_close = float(self.close[entry])
+                state.entry_equity = state.cash + quantity * float(buys["price"][-1]) + self.fee
+            else:
+                state.entry_close, state.entry_equity = base.entry_close, base.entry_equity
+        return state
+
+    def metrics(self) -> bt_pb2.PerformanceMetrics:
+        """진행한 바까지의 PerformanceMetrics"""
+        equity, trades, _ = self._collect()
+        return compute_metrics(equity, trades, initial_equity=self.initial_capital)
+
+    def result(self) -> PortfolioResult:
+        """진행한 바까지의 결과 (자산 1 개 PortfolioResult)"""
+        equity, trades, position = self._collect()
+        return _single_result(self.symbol, self.initial_capital, equity, trades, position)
+
+    def dumps(self) -> bytes:
+        """진행 상태 직렬화 (STATE_FORMAT)"""
+        equity, trades, position = self._collect()
+        state = self.state
+        buffer = io.BytesIO()
+        np.savez(
+            buffer,
+            equity=equity,
+            trades=trades,
+            positions=position,
+            state=np.array(
+                [
+                    state.cash,
+                    state.quantity,
+                    state.entry_close,
+                    state.entry_equity,
+                    float(state.active),
+                    state.peak,
+                ]
+            ),
+            bars=np.array([self.bars_done, self.total_bars], dtype=np.int64),
+        )
+        return buffer.getvalue()
+
+    def restore(self, payload: bytes) -> None:
+        """dumps 로 저장한 상태에서 이어서 진행하도록 복원 (같은 가격/신호로 만든 실행이어야 함)"""
+        with np.load(io.BytesIO(payload), allow_pickle=False) as data:
+            bars_done, total_bars = data["bars"].tolist()
+            prefix = (data["equity"], data["trades"], data["positions"])
+            cash, quantity, entry_close, entry_equity, active, peak = data["state"].tolist()
+        if total_bars != self.total_bars or len(prefix[0]) != bars_done:
+            raise ValueError(
+                f"체크포인트의 바 수가 다릅니다: {bars_done}/{total_bars} (현재 {self.total_bars})"
+            )
+        if bars_done and prefix[0]["timestamp"][-1] != self.timestamp[bars_done - 1]:
+            raise ValueError("체크포인트의 가격 시각이 현재 가격 데이터와 다릅니다")
+        self.bars_done = self._base = bars_done
+        self._base_state = SimulationState(
+            cash, quantity, entry_close, entry_equity, bool(active), peak
+        )
+        self._prefix = prefix
+        self._tail = None
+
+
+def simulate(
+    timestamp: np.ndarray,
+    close: np.ndarray,
+    exposure: np.ndarray,
+    symbol: str,
+    initial_capital: float,
+    commission_per_trade: float = 0.0,
+    slippage_bps: float = 0.0,
+    stop_loss_pct: float | None = None,
+    take_profit_pct: float | None = None,
+    max_position_size: float | None = None,
+) -> PortfolioResult:
+    """바별 목표 노출을 따르는 단일 심볼 롱 온리 시뮬레이션 (결과는 자산 1 개 PortfolioResult)"""
+    run = BacktestRun(
+        timestamp,
+        close,
+        exposure,
+        symbol,
+        initial_capital,
+        commission_per_trade,
+        slippage_bps,
+        stop_loss_pct,
+        take_profit_pct,
+        max_position_size,
+    )
+    run.advance()
+    return run.result()
+
+
+def run_backtest(
+    config: bt_pb2.BacktestConfig,
+    timestamp: np.ndarray,
+    close: np.ndarray,
+    signal: Signal = sma_crossover,
+) -> PortfolioResult:
+    """BacktestConfig 설정과 신호 함수로 단일 심볼 백테스트 실행"""
+    run = BacktestRun.from_config(config, timestamp, close, signal)
+    run.advance()
+    return run.result()
+
+
+class PrecomputedRun:
+    """포트폴리오/샤드 실행 (처음에 전체를 계산하고 진행 커서만 이동, 중간 상태는 저장하지 않음)"""
+
+    def __init__(self, result: PortfolioResult) -> None:
+        self._result = result
+        self.bars_done = 0
+
+    @property
+    def total_bars(self) -> int:
+        """전체 바 수"""
+        return len(self._result.equity)
+
+    def advance(self, bars: int | None = None) -> None:
+        """다음 bars 개 바 진행 (None 이면 끝까지)"""
+        stop = self.total_bars if bars is None else min(self.bars_done + bars, self.total_bars)
+        self.bars_done = stop
+
+    def metrics(self) -> bt_pb2.PerformanceMetrics:
+        """진행한 바까지의 PerformanceMetrics"""
+        equity = self._result.equity[: self.bars_done]
+        trades = self._result.trades
+        end = equity["timestamp"][-1] if len(equity) else np.iinfo(np.int64).min
+        trades = trades[: np.searchsorted(trades["timestamp"], end, "right")]
+        return compute_metrics(equity, trades, initial_equity=self._result.initial_capital)
+
+    def result(self) -> PortfolioResult:
+        """전체 결과"""
+        return self._result
+
+
+def progress_ends(total_bars: int, count: int) -> np.ndarray:
+    """진행 이벤트를 발행할 바 경계 (count 개 균등 분할, count <= 0 이면 마지막 바 하나)"""
+    if total_bars <= 0:
+        return np.zeros(0, dtype=np.int64)
+    if count <= 0:
+        return np.array([total_bars], dtype=np.int64)
+    return np.unique(np.linspace(0, total_bars, count + 1).round().astype(np.int64)[1:])
+
+
+# ========== Service ==========
+
+
+@dataclass
+class EngineConfig:
+    """참조 서버 설정"""
+
+    workers: int = 4
+    reserved_interactive: int = 1
+    # 실행마다 발행하는 중간 진행 이벤트 수 (이벤트마다 해당 시점까지의 current_metrics 포함)
+    progress_updates: int = 10
+    # 중간 진행 이벤트 사이 대기 (실행 시간 모사, 초)
+    progress_interval_seconds: float = 0.0
+    # strategy_id 가 등록된 신호가 아닐 때 사용할 신호
+    default_signal: str = DEFAULT_SIGNAL
+    # 메모이제이션으로 기억할 완료 백테스트 수
+    memo_entries: int = DEFAULT_MAX_ENTRIES
+    # 워커 공용 체크포인트 디렉터리 (None 이면 프로세스 메모리) 와 설정에 간격이 없을 때의 간격
+    checkpoint_dir: str | None = None
+    checkpoint_interval_seconds: float = DEFAULT_INTERVAL_SECONDS
+    # 실행 중 갱신하는 체크포인트 리스 길이와, 재개되지 않은 체크포인트 보관 기간
+    checkpoint_lease_seconds: float = DEFAULT_LEASE_SECONDS
+    checkpoint_ttl_seconds: float = DEFAULT_TTL_SECONDS
+    # parallelism > 1 설정의 샤드를 계산할 프로세스 수 (0 이면 작업 스레드에서 순차 계산,
+    # 프로세스로 보내는 신호 함수는 모듈 최상위 함수여야 함)
+    shard_processes: int = 0
+    market_data: SyntheticConfig = field(default_factory=SyntheticConfig)
+
+
+@dataclass
+class _Job:
+    backtest_id: str
+    user_id: str
+    strategy_id: str
+    config: bt_pb2.BacktestConfig
+    created_at_ns: int
+    strategy_version_seq: int | None = None
+    memo_key: str | None = None
+    status: str = "queued"
+    completed_at_ns: int | None = None
+    error_message: str | None = None
+    cancel_requested: bool = False
+    result: PortfolioResult | None = None
+    # 실행 중인 엔진과 재개할 체크포인트
+    run: BacktestRun | PrecomputedRun | None = None
+    checkpoint: bt_pb2.BacktestCheckpoint | None = None
+    # 이 워커가 마지막으로 기록한 체크포인트 (리스 갱신/해제 대상)와 리스를 잃었는지 여부
+    saved: bt_pb2.BacktestCheckpoint | None = None
+    lease_lost: bool = False
+    lease_lock: threading.Lock = field(default_factory=threading.Lock)
+    # 완료 시 생성하는 열 형식 전체 응답과, 요청 시 한 번 생성하는 행 형식 응답
+    response: bt_pb2.BacktestResultResponse | None = None
+    rows: bt_pb2.BacktestResultResponse | None = None
+    # QueryTrades 용 거래 인덱스 (처음 조회 시 생성, 정렬 순열은 정렬 키별로 지연 계산)
+    trade_index: TradeIndex | None = None
+    # GetRollingMetrics 용 롤링 지표 시계열 (처음 조회 시 생성, 윈도별 시계열 보관)
+    rolling: RollingSeries | None = None
+
+
+class ReferenceBacktestServicer(bt_grpc.BacktestServiceServicer):
+    """벡터화 참조 엔진 기반 BacktestService 구현 (grpc.aio 서버용, 상태는 메모리 보관)"""
+
+    def __init__(
+        self,
+        config: EngineConfig | None = None,
+        signals: Mapping[str, Signal] | None = None,
+        price_source: PriceSource | None = None,
+        lookbacks: Mapping[str, Lookback] | None = None,
+    ) -> None:
+        self.config = config or EngineConfig()
+        self.signals = dict(SIGNALS if signals is None else signals)
+        # 신호별 min_lookback (없는 신호는 샤드마다 처음부터 warm-up)
+        if lookbacks is None:
+            lookbacks = LOOKBACKS if signals is None else {}
+        self.lookbacks = dict(lookbacks)
+        if self.config.default_signal not in self.signals:
+            raise ValueError(f"등록되지 않은 기본 신호: {self.config.default_signal}")
+        self.data = SyntheticMarketData(self.config.market_data)
+        self.price_source = price_source or self._synthetic_prices
+        self.scheduler = BacktestScheduler(self.config.workers, self.config.reserved_interactive)
+        self.hub = ProgressHub()
+        self.jobs: dict[str, _Job] = {}
+        self._summaries: dict[str, SummaryIndex] = {}
+        self.memo = BacktestMemo(self.config.memo_entries)
+        self.checkpoints = CheckpointStore(self.config.checkpoint_dir)
+        # 체크포인트 리스 소유자이자, 체크포인트를 공유하는 다른 워커와 겹치지 않는 ID 접두사
+        self.worker_id = secrets.token_hex(3)
+        self._id_prefix = f"bt-{self.worker_id}-"
+        # 오래된 체크포인트 정리 (첫 작업에서 한 번, 이후 최대 한 시간 간격)
+        self._prune_policy = CheckpointPolicy(
+            min(self.config.checkpoint_ttl_seconds, 3600.0), last=-math.inf
+        )
+        self._ids = itertools.count(1)
+        self._started = time.monotonic()
+        self._shard_pool: ProcessPoolExecutor | None = None
+        self._shard_lock = threading.Lock()
+
+    def _synthetic_prices(
+        self, symbol: str, interval: str, start_date: str, end_date: str
+    ) -> tuple[np.ndarray, np.ndarray]:
+        bars = self.data.ohlcv(symbol, interval or "1d", start_date or None, end_date or None)
+        return bars.timestamp.astype("datetime64[ns]").astype(np.int64), bars.close
+
+    def _prices(
+        self, symbol: str, config: bt_pb2.BacktestConfig
+    ) -> tuple[np.ndarray, np.ndarray]:
+        timestamp, close = self.price_source(
+            symbol, config.interval, config.start_date, config.end_date
+        )
+        if not len(close):
+            raise ValueError(f"가격 데이터가 없습니다: {symbol} {config.interval}")
+        return timestamp, close
+
+    def _start(
+        self, job: _Job, last_update: bt_pb2.ProgressUpdate | None
+    ) -> BacktestRun | PrecomputedRun:
+        """가격 로드 → 엔진 준비 (체크포인트가 있으면 복원, 없으면 재개용 메타데이터 기록)"""
+        config = job.config
+        if config.assets:
+            symbols = portfolio_symbols(config)
+            timestamp, close = align_closes({s: self._prices(s, config) for s in symbols})
+            run = PrecomputedRun(run_portfolio(config, timestamp, close))
+        elif config.parallelism > 1:
+            from .shard import run_sharded
+
+            timestamp, close = self._prices(config.symbol, config)
+            name = self._signal_name(job.strategy_id)
+            lookback = self.lookbacks.get(name)
+            result = run_sharded(
+                config,
+                timestamp,
+                close,
+                self.signals[name],
+                min_lookback=lookback(config.params) if lookback is not None else None,
+                executor=self._shards(),
+            )
+            run = PrecomputedRun(result)
+        else:
+            timestamp, close = self._prices(config.symbol, config)
+            run = BacktestRun.from_config(config, timestamp, close, self._signal(job.strategy_id))
+        checkpoint = job.checkpoint
+        if checkpoint is not None and checkpoint.state_format == STATE_FORMAT:
+            run.restore(checkpoint.state)
+        elif checkpoint is None:
+            self._checkpoint(job, run, last_update, with_state=False)
+        return run
+
+    def _checkpoint(
+        self,
+        job: _Job,
+        run: BacktestRun | PrecomputedRun,
+        last_update: bt_pb2.ProgressUpdate | None,
+        with_state: bool,
+    ) -> None:
+        """체크포인트 기록 (with_state 가 아니면 처음부터 재개할 작업 메타데이터만)"""
+        checkpoint = make_checkpoint(
+            job.backtest_id,
+            job.user_id,
+            job.strategy_id,
+            job.config,
+            job.created_at_ns,
+            job.strategy_version_seq,
+            bars_done=run.bars_done if with_state else 0,
+            total_bars=run.total_bars,
+            last_update=last_update,
+            state_format=STATE_FORMAT if with_state else "",
+            state=run.dumps() if with_state else b"",
+        )
+        with job.lease_lock:
+            if not self._owned(job):
+                job.lease_lost = job.cancel_requested = True
+                return
+            self.checkpoints.save(stamp_lease(checkpoint, self.worker_id, self._lease_seconds))
+            job.saved = checkpoint
+
+    @property
+    def _lease_seconds(self) -> float:
+        return self.config.checkpoint_lease_seconds
+
+    def _owned(self, job: _Job) -> bool:
+        """저장소의 체크포인트가 아직 이 워커 소유인지 (다른 워커가 넘겨받았거나 지웠으면 False)"""
+        if job.saved is None:
+            return True
+        current = self.checkpoints.load(job.backtest_id)
+        return current is not None and current.owner_id == self.worker_id
+
+    def _acquire(self, job: _Job, checkpoint: bt_pb2.BacktestCheckpoint) -> None:
+        """ResumeBacktest 에서 넘겨받는 체크포인트에 이 워커의 리스 기록"""
+        with job.lease_lock:
+            self.checkpoints.save(stamp_lease(checkpoint, self.worker_id, self._lease_seconds))
+            job.saved = checkpoint
+
+    def _renew(self, job: _Job, release: bool = False) -> None:
+        """마지막 체크포인트의 리스 갱신 또는 해제 (넘겨받은 워커가 있으면 리스를 잃음)"""
+        with job.lease_lock:
+            if job.saved is None or job.lease_lost:
+                return
+            if not self._owned(job):
+                job.lease_lost = job.cancel_requested = True
+                return
+            if release:
+                release_lease(job.saved)
+            else:
+                stamp_lease(job.saved, self.worker_id, self._lease_seconds)
+            self.checkpoints.save(job.saved)
+
+    async def _heartbeat(self, job: _Job) -> None:
+        """실행 중 lease_seconds / 3 마다 리스 갱신"""
+        while not job.lease_lost:
+            await asyncio.sleep(self._lease_seconds / 3)
+            await asyncio.to_thread(self._renew, job)
+
+    def _advance(
+        self, run: BacktestRun | PrecomputedRun, end: int, metrics: bool
+    ) -> bt_pb2.PerformanceMetrics | None:
+        run.advance(end - run.bars_done)
+        return run.metrics() if metrics else None
+
+    def _complete(
+        self, job: _Job, run: BacktestRun | PrecomputedRun
+    ) -> tuple[PortfolioResult, bt_pb2.BacktestResultResponse]:
+        """최종 결과/열 형식 응답 생성 후 체크포인트 삭제 (워커 스레드에서 실행)"""
+        result = run.result()
+        columns = result.fill(
+            bt_pb2.BacktestResultResponse(),
+            encoding=bt_pb2.RESULT_ENCODING_COLUMNAR,
+            asset_results=bool(job.config.assets),
+        )
+        with job.lease_lock:
+            # 다른 워커가 넘겨받은 체크포인트는 그 워커의 것이므로 남겨 둠
+            if self._owned(job):
+                self.checkpoints.delete(job.backtest_id)
+            job.saved = None
+        return result, columns
+
+    def _shards(self) -> ProcessPoolExecutor | None:
+        """샤드 계산용 프로세스 풀 (처음 사용할 때 생성, shard_processes 가 0 이면 None)"""
+        if self.config.shard_processes <= 0:
+            return None
+        with self._shard_lock:
+            if self._shard_pool is None:
+                # gRPC 서버 스레드가 있는 프로세스는 fork 하지 않음
+                self._shard_pool = ProcessPoolExecutor(
+                    self.config.shard_processes, mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._shard_pool
+
+    def close(self) -> None:
+        """샤드 프로세스 풀 종료"""
+        with self._shard_lock:
+            pool, self._shard_pool = self._shard_pool, None
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    def _signal_name(self, strategy_id: str) -> str:
+        return strategy_id if strategy_id in self.signals else self.config.default_signal
+
+    def _signal(self, strategy_id: str) -> Signal:
+        return self.signals[self._signal_name(strategy_id)]
+
+    def _memo_key(self, user_id: str, strategy_id: str, config: bt_pb2.BacktestConfig) -> str:
+        """참조 서버의 전략 코드 해시는 실제로 실행되는 신호 함수 이름 (포트폴리오는 고정 규칙)"""
+        if config.assets:
+            code = "portfolio"
+        else:
+            signal = self._signal(strategy_id)
+            code = f"{signal.__module__}.{signal.__qualname__}"
+        return memo_key(user_id, config, code, SERVICE_NAME)
+
+    # ----- job lifecycle -----
+
+    def _validate(self, config: bt_pb2.BacktestConfig) -> None:
+        if not config.symbol and not config.assets:
+            raise ValueError("symbol 또는 assets 가 필요합니다")
+        if config.initial_capital <= 0:
+            raise ValueError(f"initial_capital 은 0 보다 커야 합니다: {config.initial_capital}")
+        from .shard import shard_parallelism, shard_warmup
+
+        shard_parallelism(config)
+        shard_warmup(config, None)
+
+    def _submit(
+        self,
+        user_id: str,
+        strategy_id: str,
+        config: bt_pb2.BacktestConfig,
+        lane: Lane,
+        priority: int | None,
+        strategy_version_seq: int | None,
+        key: str | None = None,
+    ) -> _Job:
+        self._validate(config)
+        job = _Job(
+            backtest_id=f"{self._id_prefix}{next(self._ids):08d}",
+            user_id=user_id,
+            strategy_id=strategy_id,
+            config=config,
+            created_at_ns=time.time_ns(),
+            strategy_version_seq=strategy_version_seq,
+            memo_key=key or self._memo_key(user_id, strategy_id, config),
+        )
+        self._register(job)
+        self.scheduler.submit(job.backtest_id, user_id, lambda: self._run(job), lane, priority)
+        return job
+
+    def _register(self, job: _Job, last_update: bt_pb2.ProgressUpdate | None = None) -> None:
+        self.jobs[job.backtest_id] = job
+        self.hub.register(job.backtest_id, job.user_id, job.strategy_id, last_update)
+        self._summaries.setdefault(job.user_id, SummaryIndex()).put(self._summary(job))
+
+    def _adopt(self, checkpoint: bt_pb2.BacktestCheckpoint) -> _Job:
+        """다른 워커에서 끊긴 백테스트를 체크포인트의 메타데이터로 재구성 (등록 전)"""
+        config = checkpoint.config
+        return _Job(
+            backtest_id=checkpoint.backtest_id,
+            user_id=checkpoint.user_id,
+            strategy_id=checkpoint.strategy_id,
+            config=config,
+            created_at_ns=checkpoint.job_created_at.ToNanoseconds(),
+            strategy_version_seq=(
+                checkpoint.strategy_version_seq
+                if checkpoint.HasField("strategy_version_seq")
+                else None
+            ),
+            memo_key=self._memo_key(checkpoint.user_id, checkpoint.strategy_id, config),
+        )
+
+    def _publish(
+        self,
+        job: _Job,
+        progress_pct: float,
+        message: str,
+        metrics: bt_pb2.PerformanceMetrics | None = None,
+    ) -> None:
+        update = bt_pb2.ProgressUpdate(
+            status=job.status, progress_pct=progress_pct, message=message
+        )
+        if metrics is not None:
+            update.current_metrics.CopyFrom(metrics)
+        self.hub.publish(job.backtest_id, update)
+
+    async def _run(self, job: _Job) -> None:
+        if self._prune_policy.due():
+            await asyncio.to_thread(self.checkpoints.prune, self.config.checkpoint_ttl_seconds)
+        heartbeat = asyncio.get_running_loop().create_task(self._heartbeat(job))
+        try:
+            await self._execute(job)
+        finally:
+            heartbeat.cancel()
+        if job.status != "completed":
+            # 취소/실패한 작업은 리스를 풀어 다른 워커가 바로 재개할 수 있게 함
+            await asyncio.to_thread(self._renew, job, True)
+
+    def _stop(self, job: _Job) -> None:
+        """취소 요청 또는 리스를 잃은 작업 종료"""
+        if job.lease_lost:
+            self._finish(job, "failed", error_message="다른 워커가 체크포인트 리스를 넘겨받았습니다")
+        else:
+            self._finish(job, "cancelled")
+
+    async def _execute(self, job: _Job) -> None:
+        job.status = "running"
+        self._summaries[job.user_id].put(self._summary(job))
+        log = self.hub.get(job.backtest_id).log
+        # 재개한 작업은 체크포인트의 seq 다음부터 같은 진행 경계로 이어서 발행
+        if job.checkpoint is None:
+            self._publish(job, 0.0, "started")
+        try:
+            job.run = run = await asyncio.to_thread(self._start, job, log.latest)
+        except Exception as e:
+            self._finish(job, "failed", error_message=f"{type(e).__name__}: {e}")
+            return
+        policy = CheckpointPolicy(
+            checkpoint_interval(job.config, self.config.checkpoint_interval_seconds)
+        )
+        publish = self.config.progress_updates > 0
+        ends = progress_ends(run.total_bars, self.config.progress_updates)
+        for end in ends[ends > run.bars_done].tolist():
+            if self.config.progress_interval_seconds > 0:
+                await asyncio.sleep(self.config.progress_interval_seconds)
+            if job.cancel_requested:
+                self._stop(job)
+                return
+            try:
+                metrics = await asyncio.to_thread(self._advance, run, end, publish)
+            except Exception as e:
+                self._finish(job, "failed", error_message=f"{type(e).__name__}: {e}")
+                return
+            if publish:
+                progress_pct = end / run.total_bars * 100.0
+                self._publish(job, progress_pct, f"{progress_pct:.0f}% of bars", metrics)
+            if isinstance(run, BacktestRun) and end < run.total_bars and policy.due():
+                await asyncio.to_thread(self._checkpoint, job, run, log.latest, True)
+        if job.cancel_requested:
+            self._stop(job)
+            return
+        try:
+            result, columns = await asyncio.to_thread(self._complete, job, run)
+        except Exception as e:
+            self._finish(job, "failed", error_message=f"{type(e).__name__}: {e}")
+            return
+        self._finish(job, "completed", result, columns)
+
+    def _finish(
+        self,
+        job: _Job,
+        status: str,
+        result: PortfolioResult | None = None,
+        columns: bt_pb2.BacktestResultResponse | None = None,
+        error_message: str | None = None,
+    ) -> None:
+        job.status = status
+        job.completed_at_ns = time.time_ns()
+        job.error_message = error_message
+        job.result = result
+        job.run = job.checkpoint = None
+        job.response = self._response(job, columns)
+        if status == "completed":
+            self.memo.record(job.memo_key, job.backtest_id)
+        self._summaries[job.user_id].put(self._summary(job))
+        self._publish(
+            job,
+            100.0 if status == "completed" else 0.0,
+            error_message or status,
+            job.response.metrics if job.response.HasField("metrics") else None,
+        )
+
+    def _response(
+        self, job: _Job, filled: bt_pb2.BacktestResultResponse | None = None
+    ) -> bt_pb2.BacktestResultResponse:
+        """작업 메타데이터를 채운 BacktestResultResponse (filled 는 결과가 기록된 응답)"""
+        response = filled if filled is not None else bt_pb2.BacktestResultResponse()
+        response.backtest_id = job.backtest_id
+        response.strategy_id = job.strategy_id
+        response.status = job.status
+        response.config.CopyFrom(job.config)
+        response.created_at.FromNanoseconds(job.created_at_ns)
+        if job.strategy_version_seq is not None:
+            response.strategy_version_seq = job.strategy_version_seq
+        if job.completed_at_ns is not None:
+            response.completed_at.FromNanoseconds(job.completed_at_ns)
+        if job.error_message is not None:
+            response.error_message = job.error_message
+        return response
+
+    def _summary(self, job: _Job) -> bt_pb2.BacktestSummary:
+        config = job.config
+        summary = bt_pb2.BacktestSummary(
+            backtest_id=job.backtest_id,
+            strategy_id=job.strategy_id,
+            status=job.status,
+            symbol=",".join(portfolio_symbols(config)) if config.assets else config.symbol,
+            interval=config.interval,
+        )
+        summary.created_at.FromNanoseconds(job.created_at_ns)
+        if job.strategy_version_seq is not None:
+            summary.strategy_version_seq = job.strategy_version_seq
+        if job.completed_at_ns is not None:
+            summary.completed_at.FromNanoseconds(job.completed_at_ns)
+        if job.result is not None:
+            summary.metrics.CopyFrom(job.response.metrics)
+            for row in downsample_equity(job.result.equity, SUMMARY_POINTS):
+                point = summary.equity_curve.add(
+                    equity=float(row["equity"]),
+                    drawdown=float(row["drawdown"]),
+                    cash=float(row["cash"]),
+                    positions_value=float(row["positions_value"]),
+                )
+                point.timestamp.FromNanoseconds(int(row["timestamp"]))
+        return summary
+
+    async def _rows(self, job: _Job) -> bt_pb2.BacktestResultResponse:
+        """행 형식 응답 (완료된 작업은 처음 요청 시 워커 스레드에서 생성 후 보관)"""
+        if job.result is None:
+            return job.response or self._response(job)
+        if job.rows is None:
+
+            def fill() -> bt_pb2.BacktestResultResponse:
+                filled = job.result.fill(
+                    bt_pb2.BacktestResultResponse(), asset_results=bool(job.config.assets)
+                )
+                return self._response(job, filled)
+
+            job.rows = await asyncio.to_thread(fill)
+        return job.rows
+
+    async def _job(
+        self, backtest_id: str, user_id: str, context: grpc.aio.ServicerContext
+    ) -> _Job:
+        """백테스트 조회 (다른 사용자의 백테스트는 없는 것으로 처리)"""
+        job = self.jobs.get(backtest_id)
+        if job is None or (user_id and job.user_id != user_id):
+            await context.abort(grpc.StatusCode.NOT_FOUND, f"백테스트 없음: {backtest_id}")
+        return job
+
+    async def _completed(
+        self, backtest_id: str, user_id: str, context: grpc.aio.ServicerContext
+    ) -> _Job:
+        job = await self._job(backtest_id, user_id, context)
+        if job.result is None:
+            await context.abort(
+                grpc.StatusCode.FAILED_PRECONDITION,
+                f"완료되지 않은 백테스트입니다: {backtest_id} ({job.status})",
+            )
+        return job
+
+    async def _invalid(self, context: grpc.aio.ServicerContext, error: Exception) -> None:
+        await context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(error))
+
+    # ========== Execution ==========
+
+    async def ExecuteBacktest(self, request, context):
+        try:
+            lane = Lane.resolve(request.lane, Lane.INTERACTIVE)
+            self._validate(request.config)
+            key = self._memo_key(request.user_id, request.strategy_id, request.config)
+            if request.force_rerun:
+                self.memo.skip()
+            else:
+                backtest_id = self.memo.lookup(key)
+                if backtest_id is not None:
+                    response = memoized_response(backtest_id, int(lane))
+                    response.created_at.FromNanoseconds(self.jobs[backtest_id].created_at_ns)
+                    return response
+            job = self._submit(
+                request.user_id,
+                request.strategy_id,
+                request.config,
+                lane,
+                request.priority if request.HasField("priority") else None,
+                request.strategy_version_seq if request.HasField("strategy_version_seq") else None,
+                key,
+            )
+        except ValueError as e:
+            await self._invalid(context, e)
+        position = self.scheduler.position(job.backtest_id)
+        response = bt_pb2.ExecuteBacktestResponse(
+            backtest_id=job.backtest_id,
+            status="running" if position is None else "queued",
+            message="backtest scheduled",
+            lane=int(lane),
+            queue_position=position or 0,
+        )
+        response.created_at.FromNanoseconds(job.created_at_ns)
+        return response
+
+    async def ExecuteBacktestSweep(self, request, context):
+        # max_parallelism 은 서버 전역 스케줄러 워커 수로 대신함
+        try:
+            variants = expand_variants(request)
+            lane = Lane.resolve(request.lane, Lane.BATCH)
+            for _, config in variants:
+                self._validate(config)
+            seq = request.strategy_version_seq if request.HasField("strategy_version_seq") else None
+            jobs = [
+                self._submit(request.user_id, request.strategy_id, config, lane, None, seq)
+                for _, config in variants
+            ]
+        except ValueError as e:
+            await self._invalid(context, e)
+        return sweep_response(
+            f"sweep-{jobs[0].backtest_id}", variants, [job.backtest_id for job in jobs]
+        )
+
+    async def CancelBacktest(self, request, context):
+        job = await self._job(request.backtest_id, request.user_id, context)
+        if job.status in ("completed", "failed", "cancelled"):
+            message = f"already {job.status}"
+        elif self.scheduler.cancel(job.backtest_id):
+            job.cancel_requested = True
+            self._finish(job, "cancelled")
+            message = "removed from queue"
+        else:
+            # 실행 중인 작업은 다음 진행 이벤트 시점에 중단
+            job.cancel_requested = True
+            message = "cancellation requested"
+        return bt_pb2.CancelBacktestResponse(
+            backtest_id=job.backtest_id, status=job.status, message=message
+        )
+
+    async def ResumeBacktest(self, request, context):
+        checkpoint = await asyncio.to_thread(self.checkpoints.load, request.backtest_id)
+        job = self.jobs.get(request.backtest_id)
+        adopted = (
+            job is None
+            and checkpoint is not None
+            and (not request.user_id or checkpoint.user_id == request.user_id)
+        )
+        if adopted:
+            job = self._adopt(checkpoint)
+        else:
+            job = await self._job(request.backtest_id, request.user_id, context)
+            if job.status not in ("failed", "cancelled"):
+                await context.abort(
+                    grpc.StatusCode.FAILED_PRECONDITION,
+                    f"재개할 수 없는 상태입니다: {job.backtest_id} ({job.status})",
+                )
+        if checkpoint is not None:
+            if held_by_other(checkpoint, self.worker_id):
+                await context.abort(
+                    grpc.StatusCode.FAILED_PRECONDITION,
+                    f"다른 워커({checkpoint.owner_id})가 실행 중인 백테스트입니다: "
+                    f"{job.backtest_id}",
+                )
+            await asyncio.to_thread(self._acquire, job, checkpoint)
+        try:
+            lane = Lane.resolve(request.lane, Lane.INTERACTIVE)
+            self.scheduler.submit(
+                job.backtest_id,
+                job.user_id,
+                lambda: self._run(job),
+                lane,
+                request.priority if request.HasField("priority") else None,
+            )
+        except ValueError as e:
+            await self._invalid(context, e)
+
+        # 작업은 다음 await 이후에 시작하므로 여기서 상태를 되돌려도 경쟁 없음
+        job.status = "queued"
+        job.completed_at_ns = job.error_message = None
+        job.cancel_requested = job.lease_lost = False
+        job.result = job.response = job.rows = job.trade_index = job.rolling = None
+        job.checkpoint = checkpoint
+        if adopted:
+            self._register(
+                job, checkpoint.last_update if checkpoint.HasField("last_update") else None
+            )
+        else:
+            self.hub.get(job.backtest_id).log.reopen()
+            self._summaries[job.user_id].put(self._summary(job))
+
+        position = self.scheduler.position(job.backtest_id)
+        resumable = checkpoint is not None and checkpoint.state_format == STATE_FORMAT
+        response = bt_pb2.ResumeBacktestResponse(
+            backtest_id=job.backtest_id,
+            status="running" if position is None else "queued",
+            message="resumed from checkpoint" if resumable else "restarted from the beginning",
+            lane=int(lane),
+            queue_position=position or 0,
+            resumed_from_bar=checkpoint.bars_done if resumable else 0,
+            resumed_from_pct=checkpoint.progress_pct if resumable else 0.0,
+            last_seq=self.hub.get(job.backtest_id).log.last_seq,
+        )
+        if resumable:
+            response.checkpoint_at.CopyFrom(checkpoint.created_at)
+        return response
+
+    async def GetQueueStats(self, request, context):
+        return self.scheduler.stats(request.lane if request.HasField("lane") else None)
+
+    # ========== Progress ==========
+
+    async def StreamBacktestProgress(self, request, context):
+        await self._job(request.backtest_id, request.user_id, context)
+        log = self.hub.get(request.backtest_id).log
+        updates = log.follow(request.resume_after_seq)
+        async for update in throttle(updates, ProgressOptions.from_request(request)):
+            yield update
+
+    async def WatchBacktests(self, request_iterator, context):
+        try:
+            async for response in BacktestWatch(self.hub).serve(request_iterator):
+                yield response
+        except (ValueError, KeyError) as e:
+            await self._invalid(context, e)
+
+    # ========== Results ==========
+
+    async def GetBacktestResult(self, request, context):
+        job = await self._job(request.backtest_id, request.user_id, context)
+        columnar = request.encoding == bt_pb2.RESULT_ENCODING_COLUMNAR
+        if job.result is None or columnar:
+            response = job.response or self._response(job)
+        else:
+            response = await self._rows(job)
+        equity = job.result.equity if job.result is not None else None
+        if equity is None or request.max_points <= 0 or len(equity) <= request.max_points:
+            return response
+
+        try:
+            index = downsample_indices(
+                equity["timestamp"],
+                equity["equity"],
+                request.max_points,
+                request.downsample_method,
+            )
+        except ValueError as e:
+            await self._invalid(context, e)
+        downsampled = bt_pb2.BacktestResultResponse()
+        downsampled.CopyFrom(response)
+        if columnar:
+            downsampled.equity_columns.CopyFrom(equity_columns(equity[index]))
+        else:
+            del downsampled.equity_curve[:]
+            downsampled.equity_curve.extend(response.equity_curve[i] for i in index.tolist())
+        return downsampled
+
+    async def StreamBacktestResult(self, request, context):
+        job = await self._job(request.backtest_id, request.user_id, context)
+        response = await self._rows(job)
+        try:
+            chunks = iter_result_chunks(
+                response,
+                request.max_rows_per_chunk or None,
+                include_trades=request.include_trades
+                if request.HasField("include_trades")
+                else True,
+                include_equity_curve=request.include_equity_curve
+                if request.HasField("include_equity_curve")
+                else True,
+                encoding=request.encoding,
+            )
+            for chunk in chunks:
+                yield chunk
+        except ValueError as e:
+            await self._invalid(context, e)
+
+    async def ExportBacktestResultArrow(self, request, context):
+        # pyarrow 는 arrow extra 의존성이므로 지연 import
+        from .arrow import iter_arrow_chunks
+
+        job = await self._completed(request.backtest_id, request.user_id, context)
+        try:
+            chunks = iter_arrow_chunks(
+                job.response,
+                request.tables,
+                request.max_rows_per_batch or None,
+                request.compression or None,
+            )
+            for chunk in chunks:
+                yield chunk
+        except ValueError as e:
+            await self._invalid(context, e)
+
+    async def QueryTrades(self, request, context):
+        job = await self._completed(request.backtest_id, request.user_id, context)
+        if job.trade_index is None:
+            job.trade_index = TradeIndex(job.result.trades, job.result.symbols, job.backtest_id)
+        try:
+            return await asyncio.to_thread(job.trade_index.query, request)
+        except ValueError as e:
+            await self._invalid(context, e)
+
+    async def GetBacktestMetrics(self, request, context):
+        job = await self._completed(request.backtest_id, request.user_id, context)
+        response = bt_pb2.MetricsResponse(
+            backtest_id=job.backtest_id, metrics=job.response.metrics
+        )
+        response.calculated_at.FromNanoseconds(job.completed_at_ns)
+        return response
+
+    async def GetRollingMetrics(self, request, context):
+        job = await self._completed(request.backtest_id, request.user_id, context)
+        if job.rolling is None:
+            result = job.result
+            job.rolling = await asyncio.to_thread(
+                RollingSeries, result.equity, result.trades, job.backtest_id
+            )
+        try:
+            return await asyncio.to_thread(job.rolling.response, request)
+        except ValueError as e:
+            await self._invalid(context, e)
+
+    async def RunMonteCarlo(self, request, context):
+        job = await self._completed(request.backtest_id, request.user_id, context)
+        try:
+            return await asyncio.to_thread(
+                run_monte_carlo,
+                request,
+                job.result.trades,
+                job.result.equity,
+                job.config.initial_capital,
+            )
+        except ValueError as e:
+            await self._invalid(context, e)
+
+    async def CompareBacktests(self, request, context):
+        jobs = [
+            await self._completed(backtest_id, request.user_id, context)
+            for backtest_id in request.backtest_ids
+        ]
+        try:
+            return await asyncio.to_thread(
+                compare_results, request, [job.response for job in jobs]
+            )
+        except ValueError as e:
+            await self._invalid(context, e)
+
+    async def ListBacktests(self, request, context):
+        try:
+            return self._summaries.get(request.user_id, SummaryIndex()).page(request)
+        except ValueError as e:
+            await self._invalid(context, e)
+
+    async def ExportBacktests(self, request, context):
+        try:
+            for page in self._summaries.get(request.user_id, SummaryIndex()).export(request):
+                yield page
+        except ValueError as e:
+            await self._invalid(context, e)
+
+    # ========== Service Management ==========
+
+    async def HealthCheck(self, request, context):
+        response = bt_pb2.HealthCheckResponse(
+            status="healthy",
+            service_name=SERVICE_NAME,
+            version="reference",
+            details={
+                "jobs": str(len(self.jobs)),
+                "workers": str(self.scheduler.workers),
+                "busy_workers": str(self.scheduler.busy),
+                "uptime_seconds": str(int(time.monotonic() - self._started)),
+                "worker_id": self.worker_id,
+                "checkpoint_saves": str(self.checkpoints.stats.saves),
+                "checkpoint_bytes_written": str(self.checkpoints.stats.bytes_written),
+                "memo_entries": str(len(self.memo)),
+                **self.memo.stats.details(),
+            },
+        )
+        response.timestamp.GetCurrentTime()
+        return response
+
+
+async def start_server(
+    servicer: ReferenceBacktestServicer | None = None,
+    address: str = "127.0.0.1:0",
+) -> tuple[grpc.aio.Server, int]:
+    """현재 이벤트 루프에서 참조 서버 시작 (포트 0 이면 임의 포트)"""
+    server = grpc.aio.server()
+    bt_grpc.add_BacktestServiceServicer_to_server(
+        servicer or ReferenceBacktestServicer(), server
+    )
+    port = server.add_insecure_port(address)
+    await server.start()
+    return server, port
+
+
+class BackgroundServer:
+    """별도 스레드 이벤트 루프에서 실행되는 참조 서버 (동기 클라이언트 벤치마크용)"""
+
+    def __init__(
+        self,
+        config: EngineConfig | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        signals: Mapping[str, Signal] | None = None,
+    ) -> None:
+        self.servicer = ReferenceBacktestServicer(config, signals)
+        self.host = host
+        self.port = port
+        self._loop = asyncio.new_event_loop()
+        self._server: grpc.aio.Server | None = None
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+
+    @property
+    def address(self) -> str:
+        """클라이언트 접속 주소"""
+        return f"{self.host}:{self.port}"
+
+    def start(self) -> BackgroundServer:
+        """서버 시작"""
+        self._thread.start()
+        future = asyncio.run_coroutine_threadsafe(
+            start_server(self.servicer, f"{self.host}:{self.port}"), self._loop
+        )
+        self._server, self.port = future.result()
+        return self
+
+    async def _shutdown(self, grace: float | None) -> None:
+        # 루프를 닫기 전에 gRPC 서버, 스케줄러 작업, 남은 태스크를 모두 정리
+        if self._server is not None:
+            await self._server.stop(grace)
+            self._server = None
+        await self.servicer.scheduler.close()
+        current = asyncio.current_task()
+        tasks = [task for task in asyncio.all_tasks() if task is not current]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await self._loop.shutdown_asyncgens()
+
+    def stop(self, grace: float | None = None) -> None:
+        """서버 및 이벤트 루프 종료"""
+        if self._thread.is_alive():
+            asyncio.run_coroutine_threadsafe(self._shutdown(grace), self._loop).result()
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+        self.servicer.close()
+        self._loop.close()
+
+    def __enter__(self) -> BackgroundServer:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+
+def serve_in_background(
+    config: EngineConfig | None = None,
+    host: str = "127.0.0.1",
+    port: int = 0,
+    signals: Mapping[str, Signal] | None = None,
+) -> BackgroundServer:
+    """백그라운드 스레드에서 참조 서버 시작"""
+    return BackgroundServer(config, host, port, signals).start()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="참조 BacktestService 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=50052)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--reserved-interactive", type=int, default=1)
+    parser.add_argument("--progress-updates", type=int, default=10)
+    parser.add_argument("--progress-interval-ms", type=float, default=0.0)
+    parser.add_argument("--default-signal", default=DEFAULT_SIGNAL, choices=sorted(SIGNALS))
+    parser.add_argument("--end-date", default="2024-12-31")
+    parser.add_argument("--history-bars", type=int, default=1260)
+    parser.add_argument("--checkpoint-dir", default=None)
+    parser.add_argument(
+        "--checkpoint-interval-seconds", type=float, default=DEFAULT_INTERVAL_SECONDS
+    )
+    parser.add_argument("--checkpoint-lease-seconds", type=float, default=DEFAULT_LEASE_SECONDS)
+    parser.add_argument("--checkpoint-ttl-seconds", type=float, default=DEFAULT_TTL_SECONDS)
+    parser.add_argument("--shard-processes", type=int, default=0)
+    args = parser.parse_args()
+
+    config = EngineConfig(
+        workers=args.workers,
+        reserved_interactive=args.reserved_interactive,
+        progress_updates=args.progress_updates,
+        progress_interval_seconds=args.progress_interval_ms / 1000.0,
+        default_signal=args.default_signal,
+        checkpoint_dir=args.checkpoint_dir,
+        checkpoint_interval_seconds=args.checkpoint_interval_seconds,
+        checkpoint_lease_seconds=args.checkpoint_lease_seconds,
+        checkpoint_ttl_seconds=args.checkpoint_ttl_seconds,
+        shard_processes=args.shard_processes,
+        market_data=SyntheticConfig(
+            seed=args.seed, end_date=args.end_date, history_bars=args.history_bars
+        ),
+    )
+
+    async def _serve() -> None:
+        servicer = ReferenceBacktestServicer(config)
+        server, port = await start_server(servicer, f"{args.host}:{args.port}")
+        print(f"reference backtest server listening on {args.host}:{port}")
+        try:
+            await server.wait_for_termination()
+        finally:
+            servicer.close()
+
+    asyncio.run(_serve())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""
+결정적 백테스트 메모이제이션 모듈.
+
+같은 전략 코드와 같은 BacktestConfig 로 다시 실행하면 결과도 같으므로, 완료된 백테스트를
+내용 주소 키로 기억해 두었다가 ExecuteBacktest 가 새로 계산하지 않고 기존 backtest_id 를
+status="completed", memoized=true 로 돌려줍니다 (force_rerun 이면 우회).
+
+- 키: SHA-256(사용자, 전략 dsl_code_hash, 엔진 버전 salt, BacktestConfig 결정적 직렬화)
+- 전략 ID/버전 번호 대신 코드 해시를 쓰므로 내용이 같은 버전끼리도 적중
+- 결과 조회 권한이 사용자 단위이므로 키도 사용자별
+- completed 로 끝난 작업만 기록 (failed / cancelled 는 다시 실행)
+
+사용 예시:
+    memo = BacktestMemo(max_entries=100_000)
+
+    async def ExecuteBacktest(self, request, context):
+        version = await strategy_stub.GetStrategyVersion(...)
+        key = memo_key(request.user_id, request.config, version.dsl_code_hash, ENGINE_VERSION)
+        if not request.force_rerun:
+            backtest_id = memo.lookup(key)
+            if backtest_id is not None:
+                return memoized_response(backtest_id)
+        ...
+        memo.record(key, backtest_id)          # 작업이 completed 로 끝났을 때
+
+    details.update(memo.stats.details())       # HealthCheckResponse.details
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from ..protos.services.backtest.v1 import backtest_service_pb2 as bt_pb2
+
+DEFAULT_MAX_ENTRIES = 100_000
+
+
+def canonical_config(config: bt_pb2.BacktestConfig) -> bytes:
+    """BacktestConfig 의 결정적 직렬화 (map 키 정렬, optional 필드 존재 여부 보존)"""
+    return config.SerializeToString(deterministic=True)
+
+
+def memo_key(
+    user_id: str,
+    config: bt_pb2.BacktestConfig,
+    dsl_code_hash: str,
+    salt: str = "",
+) -> str:
+    """메모이제이션 키 (salt 는 결과를 바꾸는 엔진 버전 등)"""
+    if not dsl_code_hash:
+        raise ValueError("dsl_code_hash 가 필요합니다")
+    digest = hashlib.sha256()
+    for part in (user_id.encode(), dsl_code_hash.encode(), salt.encode()):
+        digest.update(len(part).to_bytes(4, "big"))
+        digest.update(part)
+    digest.update(canonical_config(config))
+    return digest.hexdigest()
+
+
+@dataclass
+class MemoStats:
+    """메모이제이션 카운터"""
+
+    hits: int = 0
+    misses: int = 0
+    # force_rerun 으로 조회를 건너뛴 요청 수
+    forced: int = 0
+    stores: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """조회 적중률 (force_rerun 제외)"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def details(self, prefix: str = "memo_") -> dict[str, str]:
+        """HealthCheckResponse.details 항목"""
+        return {
+            f"{prefix}hits": str(self.hits),
+            f"{prefix}misses": str(self.misses),
+            f"{prefix}forced": str(self.forced),
+            f"{prefix}stores": str(self.stores),
+            f"{prefix}evictions": str(self.evictions),
+            f"{prefix}hit_rate": f"{self.hit_rate:.4f}",
+        }
+
+
+class BacktestMemo:
+    """메모이제이션 키 → 완료된 backtest_id 의 메모리 내 LRU 맵"""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        if max_entries < 1:
+            raise ValueError(f"max_entries 는 1 이상이어야 합니다: {max_entries}")
+        self.max_entries = max_entries
+        self.stats = MemoStats()
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._keys: dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, key: str) -> str | None:
+        """완료된 backtest_id 조회 (적중/미스 집계)"""
+        with self._lock:
+            backtest_id = self._entries.get(key)
+            if backtest_id is None:
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return backtest_id
+
+    def skip(self) -> None:
+        """force_rerun 요청 집계"""
+        with self._lock:
+            self.stats.forced += 1
+
+    def record(self, key: str, backtest_id: str) -> None:
+        """completed 로 끝난 백테스트 기록 (같은 키는 최신 backtest_id 로 교체)"""
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._keys.pop(previous, None)
+            self._entries[key] = backtest_id
+            self._keys[backtest_id] = key
+            self.stats.stores += 1
+            while len(self._entries) > self.max_entries:
+                _, dropped = self._entries.popitem(last=False)
+                self._keys.pop(dropped, None)
+                self.stats.evictions += 1
+
+    def forget(self, backtest_id: str) -> None:
+        """삭제/만료된 백테스트 제거"""
+        with self._lock:
+            key = self._keys.pop(backtest_id, None)
+            if key is not None:
+                self._entries.pop(key, None)
+
+
+def memoized_response(
+    backtest_id: str, lane: int = bt_pb2.BACKTEST_LANE_UNSPECIFIED
+) -> bt_pb2.ExecuteBacktestResponse:
+    """기존 완료 백테스트를 가리키는 ExecuteBacktest 응답"""
+    response = bt_pb2.ExecuteBacktestResponse(
+        backtest_id=backtest_id,
+        status="completed",
+        message="identical backtest already completed",
+        lane=lane,
+        memoized=True,
+    )
+    response.created_at.GetCurrentTime()
+    return response
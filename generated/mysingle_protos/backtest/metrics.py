@@ -0,0 +1,399 @@
+"""
+클라이언트 측 PerformanceMetrics 계산 모듈 (NumPy 벡터화).
+
+이미 받은 자산곡선(EQUITY_DTYPE)과 거래(TRADE_DTYPE) 배열로 backtest.PerformanceMetrics 의
+모든 필드를 계산하므로 GetBacktestMetrics 왕복 없이 수수료 변경, 부분 기간 등
+what-if 분석을 반복할 수 있습니다. 서비스 값과의 검증은 compare_metrics 로 합니다.
+
+계산 규약:
+- 수익률은 자산곡선의 단순 수익률, 연환산 주기(periods_per_year)는 관측 기간 대비 바 수로 추정
+- total_return / annual_return / max_drawdown / win_rate 는 %, max_drawdown 은 음수
+- 거래 통계는 청산 거래(SELL)의 pnl 기준, 보유 기간은 심볼별 FIFO 로트 매칭의 수량 가중 평균
+- 롤링 지표(rolling_metrics)의 max_drawdown 은 윈도 안 최대 낙폭, drawdown 은 윈도 안 최고
+  자산 대비 윈도 끝 자산의 낙폭, win_rate 는 윈도 바 구간에 체결된 청산 거래의 승률
+
+사용 예시:
+    result = collect_result(chunks)
+    metrics = compute_metrics(result.equity, result.trades)
+    mismatches = compare_metrics(service_metrics, metrics)
+
+    trades, equity = apply_fee_rate(result.trades, result.equity, fee_rate=0.0005)
+    q1 = compute_metrics(equity, trades, start="2024-01-01", end="2024-04-01")
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+from ..protos.services.backtest.v1 import backtest_service_pb2 as bt_pb2
+from .stream import SIDE_CODES, TRADE_DTYPE
+
+NS_PER_HOUR = 3_600_000_000_000
+NS_PER_YEAR = int(365.25 * 24 * NS_PER_HOUR)
+
+ROLLING_DTYPE = np.dtype(
+    [
+        ("timestamp", "<i8"),
+        ("total_return", "<f8"),
+        ("volatility", "<f8"),
+        ("sharpe_ratio", "<f8"),
+        ("sortino_ratio", "<f8"),
+        ("max_drawdown", "<f8"),
+        ("drawdown", "<f8"),
+        ("win_rate", "<f8"),
+    ]
+)
+
+# math.expm1 이 OverflowError 없이 계산하는 최대 지수
+_MAX_EXPONENT = math.log(np.finfo(np.float64).max)
+
+# 롤링 최대 낙폭 계산 시 한 번에 펼칠 최대 원소 수 (메모리 상한)
+_ROLLING_BLOCK_ELEMENTS = 1 << 22
+
+
+def _to_ns(value: int | str | np.datetime64 | None) -> int | None:
+    if value is None:
+        return None
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    return int(np.datetime64(value, "ns").astype(np.int64))
+
+
+def slice_period(
+    equity: np.ndarray,
+    trades: np.ndarray,
+    start: int | str | np.datetime64 | None = None,
+    end: int | str | np.datetime64 | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """[start, end) 기간의 자산곡선/거래 (epoch ns 또는 날짜 문자열)"""
+    start_ns, end_ns = _to_ns(start), _to_ns(end)
+    lo = 0 if start_ns is None else np.searchsorted(equity["timestamp"], start_ns, "left")
+    hi = len(equity) if end_ns is None else np.searchsorted(equity["timestamp"], end_ns, "left")
+    mask = np.ones(len(trades), dtype=bool)
+    if start_ns is not None:
+        mask &= trades["timestamp"] >= start_ns
+    if end_ns is not None:
+        mask &= trades["timestamp"] < end_ns
+    return equity[lo:hi], trades[mask]
+
+
+def periods_per_year(timestamp: np.ndarray) -> float:
+    """관측 기간 대비 바 수로 추정한 연간 주기 수 (일봉 거래일 데이터는 약 252)"""
+    if len(timestamp) < 2:
+        return 0.0
+    span = int(timestamp[-1]) - int(timestamp[0])
+    if span <= 0:
+        return 0.0
+    return (len(timestamp) - 1) * NS_PER_YEAR / span
+
+
+def _annualize(growth: float, years: float) -> float:
+    """기간 성장 배수의 연환산 수익률 (로그 공간 계산, 표현 범위를 넘으면 inf)"""
+    # 짧은 기간의 큰 수익은 growth ** (1 / years) 가 OverflowError 를 내므로 로그로 계산
+    exponent = math.log(growth) / years
+    if exponent > _MAX_EXPONENT:
+        return math.inf
+    return math.expm1(exponent)
+
+
+def _returns(equity: np.ndarray) -> np.ndarray:
+    values = np.asarray(equity, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = values[1:] / values[:-1] - 1.0
+    return np.where(np.isfinite(returns), returns, 0.0)
+
+
+def _ratios(returns: np.ndarray, ppy: float, risk_free_rate: float) -> tuple[float, float, float]:
+    """(연환산 변동성, 샤프, 소르티노)"""
+    if len(returns) < 2 or ppy <= 0:
+        return 0.0, 0.0, 0.0
+    excess = returns - risk_free_rate / ppy
+    std = float(np.std(returns, ddof=1))
+    downside = float(np.sqrt(np.mean(np.minimum(excess, 0.0) ** 2)))
+    scale = math.sqrt(ppy)
+    mean = float(np.mean(excess))
+    sharpe = mean / std * scale if std > 0 else 0.0
+    sortino = mean / downside * scale if downside > 0 else 0.0
+    return std * scale, sharpe, sortino
+
+
+def max_drawdown(equity: np.ndarray) -> float:
+    """최대 낙폭 (%, 음수)"""
+    values = np.asarray(equity, dtype=np.float64)
+    if len(values) == 0:
+        return 0.0
+    peaks = np.maximum.accumulate(values)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        drawdown = np.where(peaks > 0, values / peaks - 1.0, 0.0)
+    return float(drawdown.min()) * 100.0
+
+
+def _max_run(flags: np.ndarray) -> int:
+    """True 가 연속되는 최대 길이"""
+    if not flags.any():
+        return 0
+    padded = np.concatenate(([False], flags, [False])).astype(np.int8)
+    edges = np.flatnonzero(np.diff(padded))
+    return int((edges[1::2] - edges[::2]).max())
+
+
+def holding_periods_ns(trades: np.ndarray) -> np.ndarray:
+    """청산 거래별 수량 가중 평균 보유 기간 (체결 순서 거래, 심볼별 FIFO, ns; 보유분 없으면 NaN)"""
+    sells = np.flatnonzero(trades["side"] == SIDE_CODES["SELL"])
+    periods = np.full(len(sells), np.nan)
+    if len(sells) == 0:
+        return periods
+    origin = int(trades["timestamp"].min())
+
+    for symbol in np.unique(trades["symbol"][sells]):
+        rows = trades[trades["symbol"] == symbol]
+        is_buy = rows["side"] == SIDE_CODES["BUY"]
+        is_sell = rows["side"] == SIDE_CODES["SELL"]
+        if not is_buy.any():
+            continue
+        # 보유 수량을 넘는 매도는 보유분만 청산 (0 하한 누적합: pos = S - min(0, min S))
+        quantity = np.abs(rows["quantity"])
+        signed = np.cumsum(np.where(is_buy, quantity, np.where(is_sell, -quantity, 0.0)))
+        position = signed - np.minimum.accumulate(np.minimum(signed, 0.0))
+        previous = np.concatenate(([0.0], position[:-1]))
+        closed = (previous - position)[is_sell]
+
+        # 매수 누적 수량 구간 [B_{k-1}, B_k) 의 진입 시각 t_k 에 대한 누적 적분 F(x)
+        buy_qty = quantity[is_buy]
+        buy_time = (rows["timestamp"][is_buy] - origin).astype(np.float64)
+        bought = np.concatenate(([0.0], np.cumsum(buy_qty)))
+        integral = np.concatenate(([0.0], np.cumsum(buy_qty * buy_time)))
+
+        def entry_integral(x: np.ndarray) -> np.ndarray:
+            k = np.clip(np.searchsorted(bought, x, "right"), 1, len(buy_qty))
+            return integral[k - 1] + (x - bought[k - 1]) * buy_time[k - 1]
+
+        hi = np.cumsum(closed)
+        lo = hi - closed
+        with np.errstate(divide="ignore", invalid="ignore"):
+            entry = (entry_integral(hi) - entry_integral(lo)) / closed
+        exit_time = (rows["timestamp"][is_sell] - origin).astype(np.float64)
+        positions = np.flatnonzero(trades["symbol"][sells] == symbol)
+        periods[positions] = np.where(closed > 0, exit_time - entry, np.nan)
+    return periods
+
+
+def compute_metrics(
+    equity: np.ndarray,
+    trades: np.ndarray | None = None,
+    start: int | str | np.datetime64 | None = None,
+    end: int | str | np.datetime64 | None = None,
+    initial_equity: float | None = None,
+    risk_free_rate: float = 0.0,
+    ppy: float | None = None,
+) -> bt_pb2.PerformanceMetrics:
+    """자산곡선/거래 배열로 PerformanceMetrics 계산 (start/end 로 부분 기간)"""
+    if trades is None:
+        trades = np.empty(0, dtype=TRADE_DTYPE)
+    if start is not None or end is not None:
+        equity, trades = slice_period(equity, trades, start, end)
+    metrics = bt_pb2.PerformanceMetrics()
+    if len(equity):
+        values = equity["equity"]
+        first = float(initial_equity if initial_equity is not None else values[0])
+        last = float(values[-1])
+        ppy = periods_per_year(equity["timestamp"]) if ppy is None else ppy
+        growth = last / first if first > 0 else 0.0
+        metrics.total_return = (growth - 1.0) * 100.0
+        years = (int(equity["timestamp"][-1]) - int(equity["timestamp"][0])) / NS_PER_YEAR
+        if years > 0 and growth > 0:
+            metrics.annual_return = _annualize(growth, years) * 100.0
+        (
+            metrics.volatility,
+            metrics.sharpe_ratio,
+            metrics.sortino_ratio,
+        ) = _ratios(_returns(values), ppy, risk_free_rate)
+        metrics.max_drawdown = max_drawdown(values)
+        metrics.final_equity = last
+    _trade_statistics(metrics, trades)
+    return metrics
+
+
+def _trade_statistics(metrics: bt_pb2.PerformanceMetrics, trades: np.ndarray) -> None:
+    metrics.total_fees = float(trades["commission"].sum())
+    pnl = trades["pnl"][trades["side"] == SIDE_CODES["SELL"]]
+    metrics.total_trades = len(pnl)
+    if len(pnl) == 0:
+        return
+    wins = pnl > 0
+    losses = pnl < 0
+    metrics.winning_trades = int(wins.sum())
+    metrics.losing_trades = int(losses.sum())
+    metrics.win_rate = metrics.winning_trades / len(pnl) * 100.0
+
+    gross_profit = float(pnl[wins].sum())
+    gross_loss = float(-pnl[losses].sum())
+    if gross_loss > 0:
+        metrics.profit_factor = gross_profit / gross_loss
+    elif gross_profit > 0:
+        metrics.profit_factor = math.inf
+    if wins.any():
+        metrics.average_win = float(pnl[wins].mean())
+        metrics.largest_win = float(pnl.max())
+    if losses.any():
+        metrics.average_loss = float(pnl[losses].mean())
+        metrics.largest_loss = float(pnl.min())
+    metrics.max_consecutive_wins = _max_run(wins)
+    metrics.max_consecutive_losses = _max_run(losses)
+
+    periods = holding_periods_ns(trades)
+    if np.isfinite(periods).any():
+        metrics.average_holding_period_hours = float(np.nanmean(periods)) / NS_PER_HOUR
+
+
+def apply_fee_rate(
+    trades: np.ndarray, equity: np.ndarray, fee_rate: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """거래대금 대비 fee_rate 수수료로 다시 계산한 (거래, 자산곡선) 사본"""
+    # 수수료 차이를 거래 시점 이후 자산곡선과 청산 거래 pnl 에 반영
+    adjusted = trades.copy()
+    adjusted["commission"] = np.abs(trades["quantity"] * trades["price"]) * fee_rate
+    delta = adjusted["commission"] - trades["commission"]
+    sells = adjusted["side"] == SIDE_CODES["SELL"]
+    adjusted["pnl"][sells] -= delta[sells]
+
+    order = np.argsort(trades["timestamp"], kind="stable")
+    executed = trades["timestamp"][order]
+    cumulative = np.concatenate(([0.0], np.cumsum(delta[order])))
+    applied = cumulative[np.searchsorted(executed, equity["timestamp"], "right")]
+    shifted = equity.copy()
+    shifted["equity"] -= applied
+    shifted["cash"] -= applied
+    adjusted["portfolio_value"] -= cumulative[
+        np.searchsorted(executed, trades["timestamp"], "right")
+    ]
+
+    peaks = np.maximum.accumulate(shifted["equity"])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        shifted["drawdown"] = np.where(peaks > 0, shifted["equity"] / peaks - 1.0, 0.0) * 100.0
+    return adjusted, shifted
+
+
+def rolling_max(values: np.ndarray, window: int) -> np.ndarray:
+    """values[i - window + 1 : i + 1] 의 최댓값 (윈도가 차기 전은 NaN)"""
+    n = len(values)
+    out = np.full(n, np.nan)
+    if n < window:
+        return out
+    # window 크기 블록의 앞/뒤 누적 최댓값 두 개로 임의 구간 최댓값 (van Herk / Gil-Werman)
+    blocks = np.concatenate((values, np.full(-n % window, -np.inf))).reshape(-1, window)
+    prefix = np.maximum.accumulate(blocks, axis=1).ravel()
+    suffix = np.maximum.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].ravel()
+    np.maximum(suffix[: n - window + 1], prefix[window - 1 : n], out=out[window - 1 :])
+    return out
+
+
+def rolling_metrics(
+    equity: np.ndarray,
+    window: int,
+    step: int = 1,
+    risk_free_rate: float = 0.0,
+    ppy: float | None = None,
+    trades: np.ndarray | None = None,
+    with_max_drawdown: bool = True,
+) -> np.ndarray:
+    """window 개 바 단위 롤링 수익률/변동성/샤프/소르티노/낙폭/승률 (ROLLING_DTYPE)
+
+    win_rate 는 trades 가 있을 때만 계산 (청산 거래가 없는 윈도는 NaN), with_max_drawdown 이
+    False 면 O(n · window) 인 max_drawdown 계산을 생략하고 NaN 으로 둡니다.
+    """
+    n = len(equity)
+    if window < 2:
+        raise ValueError(f"window 는 2 이상이어야 합니다: {window}")
+    if step < 1:
+        raise ValueError(f"step 은 1 이상이어야 합니다: {step}")
+    if n < window:
+        return np.empty(0, dtype=ROLLING_DTYPE)
+
+    values = np.asarray(equity["equity"], dtype=np.float64)
+    ppy = periods_per_year(equity["timestamp"]) if ppy is None else ppy
+    ends = np.arange(window - 1, n, step)
+    out = np.zeros(len(ends), dtype=ROLLING_DTYPE)
+    out["timestamp"] = equity["timestamp"][ends]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out["total_return"] = (values[ends] / values[ends - window + 1] - 1.0) * 100.0
+
+    # 윈도 수익률 합/제곱합/하방 제곱합을 누적합으로 O(n) 계산
+    returns = _returns(values)
+    per_period_rf = risk_free_rate / ppy if ppy > 0 else 0.0
+    downside = np.minimum(returns - per_period_rf, 0.0) ** 2
+    cum = np.concatenate(([0.0], np.cumsum(returns)))
+    cum_sq = np.concatenate(([0.0], np.cumsum(returns**2)))
+    cum_down = np.concatenate(([0.0], np.cumsum(downside)))
+    m = window - 1
+    hi, lo = ends, ends - m
+    total = cum[hi] - cum[lo]
+    mean = total / m
+    variance = np.maximum((cum_sq[hi] - cum_sq[lo]) - total * mean, 0.0) / max(m - 1, 1)
+    std = np.sqrt(variance)
+    down = np.sqrt((cum_down[hi] - cum_down[lo]) / m)
+    excess_mean = mean - per_period_rf
+    scale = math.sqrt(ppy) if ppy > 0 else 0.0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out["volatility"] = std * scale
+        out["sharpe_ratio"] = np.where(std > 1e-12, excess_mean / std * scale, 0.0)
+        out["sortino_ratio"] = np.where(down > 1e-12, excess_mean / down * scale, 0.0)
+
+        # 윈도 최고 자산 대비 윈도 끝 자산 낙폭 (블록 prefix/suffix 최댓값으로 O(n))
+        peaks = rolling_max(values, window)[ends]
+        out["drawdown"] = np.where(peaks > 0, values[ends] / peaks - 1.0, 0.0) * 100.0
+    out["win_rate"] = _rolling_win_rate(equity["timestamp"], trades, window, ends)
+
+    if not with_max_drawdown:
+        out["max_drawdown"] = np.nan
+        return out
+    # 최대 낙폭은 윈도 블록 단위로 펼쳐 누적 최댓값 계산
+    windows = np.lib.stride_tricks.sliding_window_view(values, window)[::step]
+    block = max(1, _ROLLING_BLOCK_ELEMENTS // window)
+    for i in range(0, len(windows), block):
+        part = windows[i : i + block]
+        peaks = np.maximum.accumulate(part, axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            drawdown = np.where(peaks > 0, part / peaks - 1.0, 0.0)
+        out["max_drawdown"][i : i + block] = drawdown.min(axis=1) * 100.0
+    return out
+
+
+def _rolling_win_rate(
+    timestamp: np.ndarray, trades: np.ndarray | None, window: int, ends: np.ndarray
+) -> np.ndarray:
+    """윈도 바 구간 [end - window + 1, end] 에 배정된 청산 거래 중 pnl > 0 비율 (%)"""
+    if trades is None:
+        return np.full(len(ends), np.nan)
+    # 청산 거래는 체결 시각 이후 첫 바에 배정 (마지막 바 이후 체결은 제외)
+    n = len(timestamp)
+    closing = trades[trades["side"] == SIDE_CODES["SELL"]]
+    bars = np.searchsorted(timestamp, closing["timestamp"], "left")
+    cum_closed = np.concatenate(([0], np.cumsum(np.bincount(bars, minlength=n + 1)[:n])))
+    wins = np.bincount(bars, weights=closing["pnl"] > 0, minlength=n + 1)[:n]
+    cum_wins = np.concatenate(([0.0], np.cumsum(wins)))
+    closed = cum_closed[ends + 1] - cum_closed[ends - window + 1]
+    won = cum_wins[ends + 1] - cum_wins[ends - window + 1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(closed > 0, won / closed * 100.0, np.nan)
+
+
+def compare_metrics(
+    expected: bt_pb2.PerformanceMetrics,
+    actual: bt_pb2.PerformanceMetrics,
+    rtol: float = 1e-6,
+    atol: float = 1e-9,
+) -> dict[str, tuple[float, float]]:
+    """두 PerformanceMetrics 의 허용 오차를 벗어난 필드 {이름: (기대값, 계산값)}"""
+    mismatches = {}
+    for descriptor in bt_pb2.PerformanceMetrics.DESCRIPTOR.fields:
+        a = getattr(expected, descriptor.name)
+        b = getattr(actual, descriptor.name)
+        if math.isinf(a) or math.isinf(b):
+            if a != b:
+                mismatches[descriptor.name] = (a, b)
+        elif not math.isclose(a, b, rel_tol=rtol, abs_tol=atol):
+            mismatches[descriptor.name] = (a, b)
+    return mismatches
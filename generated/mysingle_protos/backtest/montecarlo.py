@@ -0,0 +1,243 @@
+"""
+백테스트 Monte Carlo 리샘플링 모듈 (NumPy 일괄 계산).
+
+RunMonteCarlo 의 참조 구현이자 클라이언트 측 라이브러리입니다. 반복마다 Python 루프를 도는
+대신 (반복 × 거래) 행렬 블록 단위로 경로를 한꺼번에 만들고 누적합/누적곱, 최대 낙폭,
+백분위수를 축 연산으로 계산합니다.
+
+리샘플링 방법:
+- TRADE_SHUFFLE: 청산 거래(SELL) pnl 순서 섞기 (최종 자산은 같고 낙폭 분포만 달라짐)
+- BLOCK_BOOTSTRAP: 연속된 block_size 개 거래 pnl 묶음을 복원 추출 (순환, 자기상관 보존)
+- RETURN_RESAMPLING: 자산곡선 바 수익률을 복원 추출해 복리로 누적
+
+거래 기반 방법의 경로는 초기 자산 + 누적 청산 pnl 이므로 미청산 포지션 평가 손익은 포함하지 않습니다.
+
+사용 예시:
+    result = collect_result(chunks)
+    method = bt_pb2.MONTE_CARLO_METHOD_BLOCK_BOOTSTRAP
+    mc = monte_carlo(
+        monte_carlo_inputs(method, result.trades, result.equity),
+        method,
+        initial_equity=100_000.0,
+        iterations=10_000,
+        seed=7,
+    )
+    print(mc.percentiles, mc.max_drawdown, mc.probability_of_loss)
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from ..protos.services.backtest.v1 import backtest_service_pb2 as bt_pb2
+from .metrics import _returns
+from .stream import SIDE_CODES
+
+DEFAULT_ITERATIONS = 1000
+MAX_ITERATIONS = 100_000
+DEFAULT_PERCENTILES = (5.0, 25.0, 50.0, 75.0, 95.0)
+DEFAULT_MAX_POINTS = 200
+# 밴드 샘플 버퍼는 iterations × max_points × 8 바이트 (최대 약 800MB)
+MAX_POINTS = 1000
+
+# 경로 블록당 최대 원소 수 (버퍼 2 개 × 8 바이트 × 이 값이 캐시에 머무는 크기)
+_PATH_BLOCK_ELEMENTS = 1 << 18
+
+_TRADE_METHODS = frozenset(
+    {bt_pb2.MONTE_CARLO_METHOD_TRADE_SHUFFLE, bt_pb2.MONTE_CARLO_METHOD_BLOCK_BOOTSTRAP}
+)
+
+
+@dataclass
+class MonteCarloResult:
+    """Monte Carlo 백분위수 요약 (백분위수별 배열은 percentiles 순서)"""
+
+    method: int
+    iterations: int
+    seed: int
+    initial_equity: float
+    percentiles: np.ndarray
+    # 밴드 점의 경로 단계 (0 = 초기 자산)
+    steps: np.ndarray
+    # (len(percentiles), len(steps))
+    bands: np.ndarray
+    max_drawdown: np.ndarray
+    final_equity: np.ndarray
+    probability_of_loss: float
+    original_max_drawdown: float
+    original_final_equity: float
+
+    @property
+    def total_return(self) -> np.ndarray:
+        """백분위수별 총수익률 (%)"""
+        return (self.final_equity / self.initial_equity - 1.0) * 100.0
+
+    def to_response(self, backtest_id: str = "") -> bt_pb2.MonteCarloResponse:
+        """MonteCarloResponse 생성"""
+        response = bt_pb2.MonteCarloResponse(
+            backtest_id=backtest_id,
+            method=self.method,
+            iterations=self.iterations,
+            seed=self.seed,
+            percentiles=self.percentiles.tolist(),
+            steps=self.steps.tolist(),
+            max_drawdown=self.max_drawdown.tolist(),
+            final_equity=self.final_equity.tolist(),
+            total_return=self.total_return.tolist(),
+            probability_of_loss=self.probability_of_loss,
+            original_max_drawdown=self.original_max_drawdown,
+            original_final_equity=self.original_final_equity,
+        )
+        for percentile, values in zip(self.percentiles.tolist(), self.bands):
+            response.equity_bands.add(percentile=percentile, values=values.tolist())
+        return response
+
+
+def monte_carlo_inputs(method: int, trades: np.ndarray, equity: np.ndarray) -> np.ndarray:
+    """방법별 리샘플링 대상 (거래 방법: 시간순 청산 pnl, RETURN_RESAMPLING: 바 수익률)"""
+    if method == bt_pb2.MONTE_CARLO_METHOD_RETURN_RESAMPLING:
+        return _returns(equity["equity"])
+    if method not in _TRADE_METHODS:
+        raise ValueError(f"지원하지 않는 Monte Carlo 방법: {method}")
+    order = np.argsort(trades["timestamp"], kind="stable")
+    ordered = trades[order]
+    return ordered["pnl"][ordered["side"] == SIDE_CODES["SELL"]].astype(np.float64)
+
+
+def _fill_paths(
+    paths: np.ndarray,
+    values: np.ndarray,
+    method: int,
+    rng: np.random.Generator,
+    block_size: int,
+    initial_equity: float,
+) -> None:
+    """paths (count, n + 1) 에 리샘플링 경로 기록, 첫 열은 초기 자산"""
+    count, n = len(paths), len(values)
+    sampled = paths[:, 1:]
+    if method == bt_pb2.MONTE_CARLO_METHOD_TRADE_SHUFFLE:
+        sampled[:] = values
+        rng.permuted(sampled, axis=1, out=sampled)
+    elif method == bt_pb2.MONTE_CARLO_METHOD_BLOCK_BOOTSTRAP:
+        blocks = -(-n // block_size)
+        starts = rng.integers(0, n, size=(count, blocks, 1))
+        index = (starts + np.arange(block_size)) % n
+        np.take(values, index.reshape(count, blocks * block_size)[:, :n], out=sampled)
+    else:
+        np.take(values, rng.integers(0, n, size=(count, n)), out=sampled)
+
+    paths[:, 0] = initial_equity
+    if method == bt_pb2.MONTE_CARLO_METHOD_RETURN_RESAMPLING:
+        sampled += 1.0
+        np.cumprod(sampled, axis=1, out=sampled)
+        sampled *= initial_equity
+    else:
+        np.cumsum(sampled, axis=1, out=sampled)
+        sampled += initial_equity
+
+
+def _max_drawdowns(paths: np.ndarray, work: np.ndarray | None = None) -> np.ndarray:
+    """경로별 최대 낙폭 (%, 음수), 첫 열(초기 자산)이 양수인 경로 기준"""
+    # 고점은 항상 초기 자산 이상이라 0 으로 나누지 않음
+    peaks = np.maximum.accumulate(paths, axis=1, out=work)
+    np.divide(paths, peaks, out=peaks)
+    return (peaks.min(axis=1) - 1.0) * 100.0
+
+
+def monte_carlo(
+    values: np.ndarray,
+    method: int,
+    initial_equity: float,
+    iterations: int = DEFAULT_ITERATIONS,
+    seed: int | None = None,
+    block_size: int | None = None,
+    percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+    max_points: int = DEFAULT_MAX_POINTS,
+) -> MonteCarloResult:
+    """청산 pnl 또는 바 수익률(monte_carlo_inputs)을 iterations 번 리샘플링한 백분위수 요약"""
+    values = np.asarray(values, dtype=np.float64)
+    n = len(values)
+    if method not in _TRADE_METHODS and method != bt_pb2.MONTE_CARLO_METHOD_RETURN_RESAMPLING:
+        raise ValueError(f"지원하지 않는 Monte Carlo 방법: {method}")
+    if n == 0:
+        raise ValueError("리샘플링할 거래/수익률이 없습니다")
+    if not 1 <= iterations <= MAX_ITERATIONS:
+        raise ValueError(f"iterations 는 1-{MAX_ITERATIONS} 범위여야 합니다: {iterations}")
+    if initial_equity <= 0:
+        raise ValueError(f"initial_equity 는 0 보다 커야 합니다: {initial_equity}")
+    q = np.asarray(percentiles, dtype=np.float64)
+    if len(q) == 0 or ((q < 0) | (q > 100)).any():
+        raise ValueError(f"percentiles 는 0-100 범위여야 합니다: {q.tolist()}")
+    if not 2 <= max_points <= MAX_POINTS:
+        raise ValueError(f"max_points 는 2-{MAX_POINTS} 범위여야 합니다: {max_points}")
+    block_size = max(1, round(math.sqrt(n))) if block_size is None else block_size
+    if block_size < 1:
+        raise ValueError(f"block_size 는 1 이상이어야 합니다: {block_size}")
+
+    if seed is None:
+        seed = int(np.random.SeedSequence().entropy % (1 << 63))
+    rng = np.random.default_rng(seed)
+    steps = np.unique(np.linspace(0, n, min(max_points, n + 1)).round().astype(np.int64))
+
+    sampled_steps = np.empty((iterations, len(steps)))
+    drawdowns = np.empty(iterations)
+    batch = min(iterations, max(1, _PATH_BLOCK_ELEMENTS // (n + 1)))
+    # 블록마다 새로 할당하지 않고 경로/작업 버퍼 재사용
+    paths_buffer = np.empty((batch, n + 1))
+    work_buffer = np.empty((batch, n + 1))
+    for start in range(0, iterations, batch):
+        stop = min(start + batch, iterations)
+        paths = paths_buffer[: stop - start]
+        _fill_paths(paths, values, method, rng, block_size, initial_equity)
+        sampled_steps[start:stop] = paths[:, steps]
+        drawdowns[start:stop] = _max_drawdowns(paths, work_buffer[: stop - start])
+
+    if method == bt_pb2.MONTE_CARLO_METHOD_RETURN_RESAMPLING:
+        original_path = initial_equity * np.concatenate(([1.0], np.cumprod(1.0 + values)))
+    else:
+        original_path = initial_equity + np.concatenate(([0.0], np.cumsum(values)))
+
+    finals = sampled_steps[:, -1]
+    return MonteCarloResult(
+        method=method,
+        iterations=iterations,
+        seed=seed,
+        initial_equity=float(initial_equity),
+        percentiles=q,
+        steps=steps,
+        bands=np.percentile(sampled_steps, q, axis=0),
+        max_drawdown=np.percentile(drawdowns, q),
+        final_equity=np.percentile(finals, q),
+        probability_of_loss=float((finals < initial_equity).mean()),
+        original_max_drawdown=float(_max_drawdowns(original_path[None, :])[0]),
+        original_final_equity=float(original_path[-1]),
+    )
+
+
+def run_monte_carlo(
+    request: bt_pb2.RunMonteCarloRequest,
+    trades: np.ndarray,
+    equity: np.ndarray,
+    initial_equity: float | None = None,
+) -> bt_pb2.MonteCarloResponse:
+    """RunMonteCarlo 요청 처리 (initial_equity 기본값은 자산곡선 첫 값)"""
+    method = request.method or bt_pb2.MONTE_CARLO_METHOD_TRADE_SHUFFLE
+    if initial_equity is None:
+        if not len(equity):
+            raise ValueError("initial_equity 또는 자산곡선이 필요합니다")
+        initial_equity = float(equity["equity"][0])
+    result = monte_carlo(
+        monte_carlo_inputs(method, trades, equity),
+        method,
+        initial_equity,
+        iterations=request.iterations if request.HasField("iterations") else DEFAULT_ITERATIONS,
+        seed=request.seed if request.HasField("seed") else None,
+        block_size=request.block_size if request.HasField("block_size") else None,
+        percentiles=list(request.percentiles) or DEFAULT_PERCENTILES,
+        max_points=request.max_points if request.HasField("max_points") else DEFAULT_MAX_POINTS,
+    )
+    return result.to_response(request.backtest_id)
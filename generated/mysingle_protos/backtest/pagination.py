@@ -0,0 +1,268 @@
+"""
+백테스트 목록 커서 페이지네이션 모듈.
+
+ListBacktests / ExportBacktests 의 불투명 page_token(created_at, backtest_id 키셋),
+include_metrics 프로젝션, 그리고 다음 페이지를 미리 요청하는 클라이언트 반복자를 제공합니다.
+skip 기반 offset 과 달리 키셋 커서는 페이지 깊이와 무관하게 일정한 비용으로 다음 페이지를 찾습니다.
+
+서버 (사용자별 인덱스, 최신순):
+    index = SummaryIndex(summaries)
+    response = index.page(request)
+
+    async def ExportBacktests(self, request, context):
+        for page in index.export(request):
+            yield page
+
+클라이언트:
+    for summary in iter_backtests(stub, bt_pb2.ListBacktestsRequest(user_id=uid, limit=200)):
+        print(summary.backtest_id)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import bisect
+import hashlib
+import struct
+from collections.abc import AsyncIterator, Iterable, Iterator
+from dataclasses import dataclass
+
+from ..protos.services.backtest.v1 import backtest_service_pb2 as bt_pb2
+from ..protos.services.backtest.v1 import backtest_service_pb2_grpc as bt_grpc
+from .downsample import downsample_points
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 1000
+EXPORT_PAGE_SIZE = 500
+
+_TOKEN_VERSION = 1
+# version(1B) + created_at ns(8B) + 필터 지문(8B) + backtest_id(UTF-8)
+_TOKEN_HEADER = struct.Struct(">Bq8s")
+
+
+@dataclass(frozen=True, order=True)
+class PageCursor:
+    """키셋 커서 (마지막으로 반환한 요약의 정렬 키)"""
+
+    created_at_ns: int
+    backtest_id: str
+
+
+def sort_key(summary: bt_pb2.BacktestSummary) -> PageCursor:
+    """요약의 정렬 키 (created_at, backtest_id)"""
+    created_at = summary.created_at
+    return PageCursor(created_at.seconds * 1_000_000_000 + created_at.nanos, summary.backtest_id)
+
+
+def _fingerprint(request: bt_pb2.ListBacktestsRequest) -> bytes:
+    """토큰을 발급한 요청의 필터 지문 (다른 필터로 재사용 방지)"""
+    parts = (
+        request.user_id,
+        request.strategy_id if request.HasField("strategy_id") else "\0",
+        request.status if request.HasField("status") else "\0",
+    )
+    return hashlib.blake2b("\x1f".join(parts).encode(), digest_size=8).digest()
+
+
+def encode_page_token(cursor: PageCursor, request: bt_pb2.ListBacktestsRequest) -> str:
+    """커서를 불투명 page_token 으로 인코딩"""
+    raw = _TOKEN_HEADER.pack(_TOKEN_VERSION, cursor.created_at_ns, _fingerprint(request))
+    raw += cursor.backtest_id.encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_page_token(token: str, request: bt_pb2.ListBacktestsRequest) -> PageCursor:
+    """page_token 을 커서로 디코딩 (형식/필터 불일치 시 ValueError)"""
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        version, created_at_ns, fingerprint = _TOKEN_HEADER.unpack_from(raw)
+        backtest_id = raw[_TOKEN_HEADER.size :].decode()
+    except (ValueError, struct.error) as e:
+        raise ValueError(f"잘못된 page_token 입니다: {token}") from e
+    if version != _TOKEN_VERSION:
+        raise ValueError(f"지원하지 않는 page_token 버전입니다: {version}")
+    if fingerprint != _fingerprint(request):
+        raise ValueError("page_token 을 발급한 요청과 필터가 다릅니다")
+    return PageCursor(created_at_ns, backtest_id)
+
+
+def project_summary(
+    summary: bt_pb2.BacktestSummary, request: bt_pb2.ListBacktestsRequest
+) -> bt_pb2.BacktestSummary:
+    """include_metrics / max_points 요청에 맞춘 요약 사본"""
+    projected = bt_pb2.BacktestSummary()
+    projected.CopyFrom(summary)
+    if request.HasField("include_metrics") and not request.include_metrics:
+        projected.ClearField("metrics")
+    if request.max_points > 0 and len(summary.equity_curve) > request.max_points:
+        points = downsample_points(
+            summary.equity_curve, request.max_points, request.downsample_method
+        )
+        del projected.equity_curve[:]
+        projected.equity_curve.extend(points)
+    elif request.max_points <= 0:
+        projected.ClearField("equity_curve")
+    return projected
+
+
+def _page_limit(request: bt_pb2.ListBacktestsRequest, default: int = DEFAULT_LIMIT) -> int:
+    if not request.HasField("limit"):
+        return default
+    if request.limit <= 0:
+        raise ValueError(f"limit 는 양수여야 합니다: {request.limit}")
+    return min(request.limit, MAX_LIMIT)
+
+
+class SummaryIndex:
+    """한 사용자의 BacktestSummary 를 정렬 키 순서로 보관하는 메모리 내 참조 구현"""
+
+    def __init__(self, summaries: Iterable[bt_pb2.BacktestSummary] = ()) -> None:
+        # 오름차순 보관, 조회는 최신순(역방향)
+        self._keys: list[PageCursor] = []
+        self._rows: list[bt_pb2.BacktestSummary] = []
+        self._positions: dict[str, PageCursor] = {}
+        for summary in summaries:
+            self.put(summary)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def put(self, summary: bt_pb2.BacktestSummary) -> None:
+        """요약 추가 또는 교체 (같은 backtest_id)"""
+        self.remove(summary.backtest_id)
+        key = sort_key(summary)
+        i = bisect.bisect_left(self._keys, key)
+        self._keys.insert(i, key)
+        self._rows.insert(i, summary)
+        self._positions[summary.backtest_id] = key
+
+    def remove(self, backtest_id: str) -> None:
+        """요약 제거"""
+        key = self._positions.pop(backtest_id, None)
+        if key is None:
+            return
+        i = bisect.bisect_left(self._keys, key)
+        del self._keys[i]
+        del self._rows[i]
+
+    @staticmethod
+    def _matches(summary: bt_pb2.BacktestSummary, request: bt_pb2.ListBacktestsRequest) -> bool:
+        if request.HasField("strategy_id") and summary.strategy_id != request.strategy_id:
+            return False
+        if request.HasField("status") and summary.status != request.status:
+            return False
+        return True
+
+    def count(self, request: bt_pb2.ListBacktestsRequest) -> int:
+        """필터에 맞는 요약 수"""
+        if not request.HasField("strategy_id") and not request.HasField("status"):
+            return len(self._rows)
+        return sum(1 for summary in self._rows if self._matches(summary, request))
+
+    def page(
+        self, request: bt_pb2.ListBacktestsRequest, default_limit: int = DEFAULT_LIMIT
+    ) -> bt_pb2.ListBacktestsResponse:
+        """요청의 page_token(또는 skip) 위치부터 최신순 한 페이지"""
+        limit = _page_limit(request, default_limit)
+        skip = 0
+        if request.page_token:
+            cursor = decode_page_token(request.page_token, request)
+            start = bisect.bisect_left(self._keys, cursor) - 1
+        else:
+            start = len(self._rows) - 1
+            skip = max(request.skip, 0)
+
+        response = bt_pb2.ListBacktestsResponse()
+        last: bt_pb2.BacktestSummary | None = None
+        i = start
+        while i >= 0:
+            summary = self._rows[i]
+            i -= 1
+            if not self._matches(summary, request):
+                continue
+            if skip:
+                skip -= 1
+                continue
+            if len(response.backtests) == limit:
+                # limit 을 채운 뒤 남은 항목이 있을 때만 다음 커서 발급
+                response.next_page_token = encode_page_token(sort_key(last), request)
+                break
+            response.backtests.append(project_summary(summary, request))
+            last = summary
+
+        if not request.HasField("include_total_count") or request.include_total_count:
+            response.total_count = self.count(request)
+        return response
+
+    def export(self, request: bt_pb2.ListBacktestsRequest) -> Iterator[bt_pb2.ListBacktestsResponse]:
+        """필터에 맞는 전체 요약을 페이지 단위로 생성 (ExportBacktests)"""
+        page_request = bt_pb2.ListBacktestsRequest()
+        page_request.CopyFrom(request)
+        page_request.ClearField("skip")
+        while True:
+            page = self.page(page_request, default_limit=EXPORT_PAGE_SIZE)
+            yield page
+            if not page.next_page_token:
+                return
+            page_request.page_token = page.next_page_token
+            # total_count 는 첫 페이지에만 계산
+            page_request.include_total_count = False
+
+
+def _next_request(
+    request: bt_pb2.ListBacktestsRequest, page_token: str
+) -> bt_pb2.ListBacktestsRequest:
+    following = bt_pb2.ListBacktestsRequest()
+    following.CopyFrom(request)
+    following.ClearField("skip")
+    following.page_token = page_token
+    following.include_total_count = False
+    return following
+
+
+def iter_backtests(
+    stub: bt_grpc.BacktestServiceStub,
+    request: bt_pb2.ListBacktestsRequest,
+    timeout: float | None = None,
+) -> Iterator[bt_pb2.BacktestSummary]:
+    """ListBacktests 페이지를 따라가며 요약 순회 (현재 페이지 처리 중 다음 페이지를 미리 요청)"""
+    pending = stub.ListBacktests.future(request, timeout=timeout)
+    try:
+        while pending is not None:
+            page = pending.result()
+            pending = None
+            if page.next_page_token:
+                pending = stub.ListBacktests.future(
+                    _next_request(request, page.next_page_token), timeout=timeout
+                )
+            yield from page.backtests
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+
+async def aiter_backtests(
+    stub: bt_grpc.BacktestServiceStub,
+    request: bt_pb2.ListBacktestsRequest,
+    timeout: float | None = None,
+) -> AsyncIterator[bt_pb2.BacktestSummary]:
+    """grpc.aio 스텁용 iter_backtests"""
+    pending: asyncio.Future | None = asyncio.ensure_future(
+        stub.ListBacktests(request, timeout=timeout)
+    )
+    try:
+        while pending is not None:
+            page = await pending
+            pending = None
+            if page.next_page_token:
+                pending = asyncio.ensure_future(
+                    stub.ListBacktests(
+                        _next_request(request, page.next_page_token), timeout=timeout
+                    )
+                )
+            for summary in page.backtests:
+                yield summary
+    finally:
+        if pending is not None:
+            pending.cancel()
@@ -0,0 +1,443 @@
+"""
+다중 심볼 포트폴리오 백테스트 모듈 (NumPy 벡터화).
+
+BacktestConfig.assets 의 여러 심볼을 한 작업에서 현금을 공유하며 리밸런싱합니다.
+모든 심볼의 종가를 한 번에 (바 × 자산) 행렬로 정렬하고, 리밸런싱 사이 구간의 평가액/가중치
+이탈은 자산 축으로 벡터화해 계산하므로 Python 반복은 리밸런싱 횟수만큼만 돕니다.
+심볼마다 별도 작업을 만들고 데이터를 다시 로드하던 N 배 비용이 한 번의 계산으로 줄어듭니다.
+
+계산 규약:
+- 리밸런싱 바의 종가에 slippage_bps 를 불리하게 적용해 체결, commission_per_trade 는 체결 건당 부과
+- 목표 평가액은 예상 거래 비용을 뺀 자산 기준이고, 그래도 현금이 부족하면 매수를 줄이거나 빼며
+  매도 대금이 수수료에도 못 미치는 리밸런싱은 건너뛰므로 현금이 음수가 되지 않음
+- 가중치 합이 1 미만이면 나머지는 현금, max_weight 초과분도 재분배하지 않고 현금
+- 가격이 아직 없는 자산(상장 전)은 목표 가중치 0
+- 자산 sleeve = 첫 목표 배분액 + 해당 자산의 누적 평가 손익(수수료 차감)
+
+사용 예시:
+    timestamp, close = align_closes({s: load(s) for s in portfolio_symbols(config)})
+    result = run_portfolio(config, timestamp, close)
+    result.fill(response, encoding=request.encoding)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+import numpy as np
+
+from ..protos.services.backtest.v1 import backtest_service_pb2 as bt_pb2
+from .columnar import equity_columns, trade_columns
+from .metrics import compute_metrics
+from .stream import EQUITY_DTYPE, SIDE_CODES, SIDE_NAMES, TRADE_DTYPE
+
+DEFAULT_VOLATILITY_LOOKBACK = 20
+
+# 평가액 대비 이보다 작은 주문은 체결하지 않음
+_MIN_ORDER_FRACTION = 1e-9
+
+
+def portfolio_assets(config: bt_pb2.BacktestConfig) -> list[bt_pb2.PortfolioAsset]:
+    """포트폴리오 자산 목록 (assets 가 없으면 symbol 단일 자산)"""
+    if config.assets:
+        assets = list(config.assets)
+    elif config.symbol:
+        assets = [bt_pb2.PortfolioAsset(symbol=config.symbol, weight=1.0)]
+    else:
+        raise ValueError("symbol 또는 assets 가 필요합니다")
+    symbols = [asset.symbol for asset in assets]
+    if len(set(symbols)) != len(symbols):
+        raise ValueError(f"포트폴리오 심볼 중복: {symbols}")
+    return assets
+
+
+def portfolio_symbols(config: bt_pb2.BacktestConfig) -> list[str]:
+    """포트폴리오 심볼 목록 (데이터 로드 순서 = 가격 행렬 열 순서)"""
+    return [asset.symbol for asset in portfolio_assets(config)]
+
+
+def allocation_method(config: bt_pb2.BacktestConfig) -> int:
+    """AllocationMethod 결정 (미지정 시 모든 자산에 weight 가 있으면 FIXED_WEIGHT)"""
+    if config.HasField("allocation") and config.allocation:
+        return config.allocation
+    assets = portfolio_assets(config)
+    if all(asset.HasField("weight") for asset in assets):
+        return bt_pb2.ALLOCATION_METHOD_FIXED_WEIGHT
+    return bt_pb2.ALLOCATION_METHOD_EQUAL_WEIGHT
+
+
+def align_closes(
+    series: Mapping[str, tuple[np.ndarray, np.ndarray]],
+) -> tuple[np.ndarray, np.ndarray]:
+    """심볼별 (timestamp_ns, close) 를 합집합 시각의 (T,) 시각 / (T, N) 종가 행렬로 정렬"""
+    # 빈 바는 직전 종가로 채우고, 첫 가격 이전은 NaN
+    if not series:
+        raise ValueError("정렬할 가격 데이터가 없습니다")
+    timestamp = np.unique(
+        np.concatenate([np.asarray(ts, dtype=np.int64) for ts, _ in series.values()])
+    )
+    close = np.full((len(timestamp), len(series)), np.nan)
+    for column, (ts, values) in enumerate(series.values()):
+        ts = np.asarray(ts, dtype=np.int64)
+        values = np.asarray(values, dtype=np.float64)
+        if len(ts) != len(values):
+            raise ValueError(f"timestamp/close 길이가 다릅니다: {len(ts)} != {len(values)}")
+        order = np.argsort(ts, kind="stable")
+        ts, values = ts[order], values[order]
+        index = np.searchsorted(ts, timestamp, "right") - 1
+        valid = index >= 0
+        close[valid, column] = values[index[valid]]
+    return timestamp, close
+
+
+def _rolling_volatility(close: np.ndarray, lookback: int) -> np.ndarray:
+    """바 t 까지의 lookback 개 로그 수익률 표준편차 (데이터 부족 시 NaN)"""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = np.diff(np.log(close), axis=0, prepend=np.nan)
+    valid = np.isfinite(returns)
+    filled = np.where(valid, returns, 0.0)
+    zeros = np.zeros((1, close.shape[1]))
+
+    def window_sum(values: np.ndarray) -> np.ndarray:
+        cumulative = np.concatenate((zeros, np.cumsum(values, axis=0)))
+        start = np.maximum(np.arange(1, len(close) + 1) - lookback, 0)
+        return cumulative[1:] - cumulative[start]
+
+    count = window_sum(valid.astype(np.float64))
+    total = window_sum(filled)
+    squares = window_sum(filled * filled)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        variance = (squares - total * total / count) / (count - 1)
+    variance = np.where(count >= lookback, np.maximum(variance, 0.0), np.nan)
+    return np.sqrt(variance)
+
+
+def target_weights(config: bt_pb2.BacktestConfig, close: np.ndarray) -> np.ndarray:
+    """바별 목표 가중치 (T, N)"""
+    assets = portfolio_assets(config)
+    if close.ndim != 2 or close.shape[1] != len(assets):
+        raise ValueError(f"종가 행렬 shape 가 자산 수({len(assets)})와 맞지 않습니다: {close.shape}")
+    available = np.isfinite(close) & (close > 0)
+    method = allocation_method(config)
+
+    if method == bt_pb2.ALLOCATION_METHOD_FIXED_WEIGHT:
+        fixed = np.array([asset.weight for asset in assets])
+        if (fixed < 0).any() or fixed.sum() > 1.0 + 1e-9:
+            raise ValueError(f"weight 는 0 이상이고 합이 1 이하여야 합니다: {fixed.tolist()}")
+        weights = np.where(available, fixed, 0.0)
+    elif method in (
+        bt_pb2.ALLOCATION_METHOD_EQUAL_WEIGHT,
+        bt_pb2.ALLOCATION_METHOD_INVERSE_VOLATILITY,
+    ):
+        count = available.sum(axis=1, keepdims=True)
+        weights = np.where(available, 1.0 / np.maximum(count, 1), 0.0)
+        if method == bt_pb2.ALLOCATION_METHOD_INVERSE_VOLATILITY:
+            lookback = config.volatility_lookback_bars or DEFAULT_VOLATILITY_LOOKBACK
+            if lookback < 2:
+                raise ValueError(f"volatility_lookback_bars 는 2 이상이어야 합니다: {lookback}")
+            with np.errstate(divide="ignore"):
+                inverse = 1.0 / _rolling_volatility(close, lookback)
+            inverse = np.where(available & np.isfinite(inverse), inverse, 0.0)
+            total = inverse.sum(axis=1, keepdims=True)
+            # 변동성 추정이 끝난 자산이 전부 준비된 바부터 역변동성, 그 전은 동일 가중
+            ready = (inverse > 0).sum(axis=1, keepdims=True) == count
+            inverse /= np.where(total > 0, total, 1.0)
+            weights = np.where(ready & (total > 0), inverse, weights)
+    else:
+        raise ValueError(f"지원하지 않는 allocation: {method}")
+
+    caps = np.array([asset.max_weight if asset.HasField("max_weight") else 1.0 for asset in assets])
+    return np.minimum(weights, caps)
+
+
+@dataclass
+class PortfolioResult:
+    """포트폴리오 백테스트 결과 (포트폴리오 자산곡선/거래 + 자산별 보유/손익 행렬)"""
+
+    symbols: list[str]
+    initial_capital: float
+    # EQUITY_DTYPE (포트폴리오)
+    equity: np.ndarray
+    # TRADE_DTYPE (symbol 은 symbols 인덱스)
+    trades: np.ndarray
+    # (T, N) 보유 수량
+    positions: np.ndarray
+    # (T, N) 자산 평가액
+    values: np.ndarray
+    # (T, N) 자산별 누적 손익 (수수료 차감)
+    pnl: np.ndarray
+    # (N,) 자산 sleeve 기준 금액
+    allocations: np.ndarray
+
+    def metrics(self, risk_free_rate: float = 0.0) -> bt_pb2.PerformanceMetrics:
+        """포트폴리오 PerformanceMetrics"""
+        return compute_metrics(
+            self.equity,
+            self.trades,
+            initial_equity=self.initial_capital,
+            risk_free_rate=risk_free_rate,
+        )
+
+    def asset_equity(self, column: int) -> np.ndarray:
+        """자산 sleeve 자산곡선 (EQUITY_DTYPE, cash 는 sleeve 의 비투자분)"""
+        sleeve = np.zeros(len(self.equity), dtype=EQUITY_DTYPE)
+        sleeve["timestamp"] = self.equity["timestamp"]
+        sleeve["equity"] = self.allocations[column] + self.pnl[:, column]
+        sleeve["positions_value"] = self.values[:, column]
+        sleeve["cash"] = sleeve["equity"] - sleeve["positions_value"]
+        peaks = np.maximum.accumulate(sleeve["equity"])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sleeve["drawdown"] = np.where(peaks > 0, sleeve["equity"] / peaks - 1.0, 0.0) * 100.0
+        return sleeve
+
+    def asset_results(self, risk_free_rate: float = 0.0) -> list[bt_pb2.AssetResult]:
+        """자산별 AssetResult 목록"""
+        final_equity = float(self.equity["equity"][-1]) if len(self.equity) else 0.0
+        results = []
+        for column, symbol in enumerate(self.symbols):
+            trades = self.trades[self.trades["symbol"] == column]
+            final_value = float(self.values[-1, column]) if len(self.values) else 0.0
+            pnl = float(self.pnl[-1, column]) if len(self.pnl) else 0.0
+            results.append(
+                bt_pb2.AssetResult(
+                    symbol=symbol,
+                    metrics=compute_metrics(
+                        self.asset_equity(column),
+                        trades,
+                        initial_equity=float(self.allocations[column]),
+                        risk_free_rate=risk_free_rate,
+                    ),
+                    final_value=final_value,
+                    final_weight=final_value / final_equity if final_equity > 0 else 0.0,
+                    pnl=pnl,
+                    total_fees=float(trades["commission"].sum()),
+                    trade_count=len(trades),
+                    contribution=pnl / self.initial_capital * 100.0,
+                )
+            )
+        return results
+
+    def fill(
+        self,
+        response: bt_pb2.BacktestResultResponse,
+        encoding: int = bt_pb2.RESULT_ENCODING_ROWS,
+        risk_free_rate: float = 0.0,
+        asset_results: bool = True,
+    ) -> bt_pb2.BacktestResultResponse:
+        """BacktestResultResponse 에 포트폴리오 metrics/거래/자산곡선과 asset_results 기록"""
+        response.metrics.CopyFrom(self.metrics(risk_free_rate))
+        del response.asset_results[:]
+        if asset_results:
+            response.asset_results.extend(self.asset_results(risk_free_rate))
+        if encoding == bt_pb2.RESULT_ENCODING_COLUMNAR:
+            response.trade_columns.CopyFrom(trade_columns(self.trades, self.symbols))
+            response.equity_columns.CopyFrom(equity_columns(self.equity))
+            return response
+
+        for row in self.trades:
+            trade = response.trades.add(
+                symbol=self.symbols[row["symbol"]],
+                side=SIDE_NAMES[int(row["side"])],
+                quantity=float(row["quantity"]),
+                price=float(row["price"]),
+                pnl=float(row["pnl"]),
+                commission=float(row["commission"]),
+                portfolio_value=float(row["portfolio_value"]),
+            )
+            trade.timestamp.FromNanoseconds(int(row["timestamp"]))
+        for row in self.equity:
+            point = response.equity_curve.add(
+                equity=float(row["equity"]),
+                drawdown=float(row["drawdown"]),
+                cash=float(row["cash"]),
+                positions_value=float(row["positions_value"]),
+            )
+            point.timestamp.FromNanoseconds(int(row["timestamp"]))
+        return response
+
+
+def _next_rebalance(
+    start: int,
+    stop: int,
+    cash: float,
+    holdings: np.ndarray,
+    prices: np.ndarray,
+    weights: np.ndarray,
+    threshold: float | None,
+) -> int:
+    """start 다음 바부터 stop 전까지 가중치 이탈이 threshold 를 넘는 첫 바 (없으면 stop)"""
+    if threshold is None or stop - start <= 1:
+        return stop
+    values = prices[start + 1 : stop] * holdings
+    equity = cash + values.sum(axis=1, keepdims=True)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        drift = np.abs(values / equity - weights[start + 1 : stop]).max(axis=1)
+    exceeded = np.flatnonzero(drift > threshold)
+    return start + 1 + int(exceeded[0]) if len(exceeded) else stop
+
+
+def _affordable(
+    columns: np.ndarray, qty: np.ndarray, executed: np.ndarray, commission: float, cash: float
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """현금이 음수가 되지 않도록 조정한 주문 (columns, qty, executed)"""
+    notional = qty * executed
+    shortfall = float(notional.sum()) + commission * len(columns) - cash
+    if shortfall <= 0:
+        return columns, qty, executed
+    # 비용 추정 오차로 현금이 부족하면 매수 수량을 줄이고, 그래도 부족하면 매수를 뺌
+    buys = qty > 0
+    bought = float(notional[buys].sum())
+    if shortfall < bought:
+        return columns, np.where(buys, qty * (1.0 - shortfall / bought), qty), executed
+    columns, qty, executed = columns[~buys], qty[~buys], executed[~buys]
+    # 매도 대금이 수수료에도 못 미치면 이번 리밸런싱은 건너뜀
+    if float((qty * executed).sum()) + commission * len(columns) > cash:
+        return columns[:0], qty[:0], executed[:0]
+    return columns, qty, executed
+
+
+def simulate_portfolio(
+    timestamp: np.ndarray,
+    close: np.ndarray,
+    weights: np.ndarray,
+    symbols: list[str],
+    initial_capital: float,
+    commission_per_trade: float = 0.0,
+    slippage_bps: float = 0.0,
+    rebalance_interval_bars: int = 0,
+    rebalance_threshold: float | None = None,
+) -> PortfolioResult:
+    """목표 가중치 (T, N) 를 따라 현금을 공유하며 리밸런싱하는 포트폴리오 시뮬레이션"""
+    n_bars, n_assets = close.shape
+    if weights.shape != close.shape or len(timestamp) != n_bars or len(symbols) != n_assets:
+        raise ValueError(
+            f"입력 shape 불일치: timestamp={len(timestamp)} close={close.shape} "
+            f"weights={weights.shape} symbols={len(symbols)}"
+        )
+    if initial_capital <= 0:
+        raise ValueError(f"initial_capital 은 0 보다 커야 합니다: {initial_capital}")
+    if rebalance_interval_bars < 0:
+        raise ValueError(f"rebalance_interval_bars 는 0 이상이어야 합니다: {rebalance_interval_bars}")
+
+    # 가격이 없는 바의 평가액은 0 (해당 자산 보유량도 0)
+    prices = np.where(np.isfinite(close), close, 0.0)
+    slip = slippage_bps / 10_000.0
+    positions = np.zeros((n_bars, n_assets))
+    flows = np.zeros((n_bars, n_assets))
+    cash_curve = np.zeros(n_bars)
+    allocations = np.zeros(n_assets)
+    allocated = np.zeros(n_assets, dtype=bool)
+
+    cash = float(initial_capital)
+    holdings = np.zeros(n_assets)
+    cost_basis = np.zeros(n_assets)
+    invested = np.zeros(n_assets)
+    trade_blocks: list[np.ndarray] = []
+
+    t = 0
+    while t < n_bars:
+        price = prices[t]
+        tradable = price > 0
+        equity_before = cash + float(holdings @ price)
+        target = np.where(tradable, weights[t], 0.0)
+        # 상장 폐지 등으로 가격이 사라진 자산은 보유 유지
+        target_qty = np.where(
+            tradable, target * equity_before / np.where(tradable, price, 1.0), holdings
+        )
+        delta = target_qty - holdings
+        traded = np.abs(delta * price) > _MIN_ORDER_FRACTION * equity_before
+        cost = float((np.abs(delta * price) * slip)[traded].sum()) + commission_per_trade * int(
+            traded.sum()
+        )
+        if cost > 0 and equity_before > 0:
+            scale = max(equity_before - cost, 0.0) / equity_before
+            target_qty = np.where(tradable, target_qty * scale, holdings)
+            delta = target_qty - holdings
+            traded = np.abs(delta * price) > _MIN_ORDER_FRACTION * equity_before
+
+        columns = np.flatnonzero(traded)
+        qty = delta[columns]
+        executed = price[columns] * (1.0 + np.sign(qty) * slip)
+        columns, qty, executed = _affordable(columns, qty, executed, commission_per_trade, cash)
+        if len(columns):
+            commission = np.full(len(columns), commission_per_trade)
+            notional = qty * executed
+            # 매수 축소로 현금이 정확히 0 이 되는 경우의 반올림 오차
+            cash = max(cash - float(notional.sum() + commission.sum()), 0.0)
+            invested[columns] += notional + commission
+
+            # 평균 단가 기준 실현 손익 (매도), 매수 수수료는 단가에 포함
+            held = holdings[columns]
+            average_cost = np.divide(
+                cost_basis[columns], held, out=np.zeros(len(columns)), where=held > 0
+            )
+            sells = qty < 0
+            pnl = np.where(sells, -qty * (executed - average_cost) - commission, 0.0)
+            cost_basis[columns] += np.where(sells, qty * average_cost, notional + commission)
+            holdings[columns] += qty
+
+            block = np.zeros(len(columns), dtype=TRADE_DTYPE)
+            block["timestamp"] = timestamp[t]
+            block["symbol"] = columns
+            block["side"] = np.where(sells, SIDE_CODES["SELL"], SIDE_CODES["BUY"])
+            block["quantity"] = np.abs(qty)
+            block["price"] = executed
+            block["pnl"] = pnl
+            block["commission"] = commission
+            block["portfolio_value"] = cash + float(holdings @ price)
+            trade_blocks.append(block)
+
+            first = np.zeros(n_assets, dtype=bool)
+            first[columns] = ~allocated[columns]
+            allocations[first] = target[first] * initial_capital
+            allocated |= first
+
+        stop = min(t + rebalance_interval_bars, n_bars) if rebalance_interval_bars else n_bars
+        stop = _next_rebalance(t, stop, cash, holdings, prices, weights, rebalance_threshold)
+        positions[t:stop] = holdings
+        flows[t:stop] = invested
+        cash_curve[t:stop] = cash
+        t = stop
+
+    # 한 번도 거래하지 않은 자산의 sleeve 기준 금액은 균등 배분액
+    allocations[~allocated] = initial_capital / n_assets
+    values = positions * prices
+    equity = np.zeros(n_bars, dtype=EQUITY_DTYPE)
+    equity["timestamp"] = timestamp
+    equity["positions_value"] = values.sum(axis=1)
+    equity["cash"] = cash_curve
+    equity["equity"] = cash_curve + equity["positions_value"]
+    peaks = np.maximum.accumulate(equity["equity"])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        equity["drawdown"] = np.where(peaks > 0, equity["equity"] / peaks - 1.0, 0.0) * 100.0
+
+    trades = np.concatenate(trade_blocks) if trade_blocks else np.empty(0, dtype=TRADE_DTYPE)
+    return PortfolioResult(
+        symbols=list(symbols),
+        initial_capital=float(initial_capital),
+        equity=equity,
+        trades=trades,
+        positions=positions,
+        values=values,
+        pnl=values - flows,
+        allocations=allocations,
+    )
+
+
+def run_portfolio(
+    config: bt_pb2.BacktestConfig, timestamp: np.ndarray, close: np.ndarray
+) -> PortfolioResult:
+    """BacktestConfig 설정으로 포트폴리오 백테스트 실행 (close 열 순서 = portfolio_symbols)"""
+    threshold = config.rebalance_threshold if config.HasField("rebalance_threshold") else None
+    return simulate_portfolio(
+        np.asarray(timestamp, dtype=np.int64),
+        np.asarray(close, dtype=np.float64),
+        target_weights(config, close),
+        portfolio_symbols(config),
+        config.initial_capital,
+        commission_per_trade=config.commission_per_trade,
+        slippage_bps=config.slippage_bps,
+        rebalance_interval_bars=config.rebalance_interval_bars,
+        rebalance_threshold=threshold,
+    )
@@ -0,0 +1,262 @@
+"""
+백테스트 진행 상황 스트림 모듈.
+
+StreamBacktestProgress 의 seq 기반 재개(resume_after_seq)와 클라이언트 요청 기반
+conflation(min_interval_ms / min_progress_delta), metrics_every_n 을 제공합니다.
+
+서버:
+    log = ProgressLog(backtest_id)
+    log.publish(bt_pb2.ProgressUpdate(status="running", progress_pct=12.5))
+
+    async def StreamBacktestProgress(self, request, context):
+        updates = log.follow(request.resume_after_seq)
+        async for update in throttle(updates, ProgressOptions.from_request(request)):
+            yield update
+
+클라이언트 (끊기면 마지막 seq 부터 재연결):
+    for update in follow_progress(stub, bt_pb2.StreamProgressRequest(backtest_id=bid)):
+        print(update.seq, update.progress_pct)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterator
+from dataclasses import dataclass
+
+import grpc
+
+from ..protos.services.backtest.v1 import backtest_service_pb2 as bt_pb2
+from ..protos.services.backtest.v1 import backtest_service_pb2_grpc as bt_grpc
+
+TERMINAL_STATUSES = frozenset({"completed", "failed", "cancelled"})
+
+# 재연결로 복구 가능한 스트림 오류
+RETRYABLE_CODES = frozenset(
+    {
+        grpc.StatusCode.UNAVAILABLE,
+        grpc.StatusCode.DEADLINE_EXCEEDED,
+        grpc.StatusCode.RESOURCE_EXHAUSTED,
+        grpc.StatusCode.INTERNAL,
+    }
+)
+
+
+@dataclass(frozen=True)
+class ProgressOptions:
+    """클라이언트 요청 기반 진행 스트림 옵션"""
+
+    min_interval_ms: int = 0
+    min_progress_delta: float = 0.0
+    # current_metrics 를 N번째 전송마다 포함 (0/1 은 매번)
+    metrics_every_n: int = 1
+
+    @classmethod
+    def from_request(cls, request: bt_pb2.StreamProgressRequest) -> ProgressOptions:
+        """StreamProgressRequest 에서 옵션 추출"""
+        return cls(
+            min_interval_ms=max(request.min_interval_ms, 0),
+            min_progress_delta=max(request.min_progress_delta, 0.0),
+            metrics_every_n=max(request.metrics_every_n, 1)
+            if request.HasField("metrics_every_n")
+            else 1,
+        )
+
+
+class ProgressLog:
+    """백테스트 하나의 진행 이벤트 로그 (seq 부여, 최근 capacity 개 보관)"""
+
+    def __init__(
+        self,
+        backtest_id: str,
+        capacity: int = 1024,
+        last_update: bt_pb2.ProgressUpdate | None = None,
+    ) -> None:
+        # last_update: 다른 워커에서 재개한 백테스트의 체크포인트 이벤트 (seq 를 이어서 부여)
+        self.backtest_id = backtest_id
+        self._updates: deque[bt_pb2.ProgressUpdate] = deque(maxlen=capacity)
+        self._last_seq = 0
+        if last_update is not None and last_update.seq:
+            self._updates.append(last_update)
+            self._last_seq = last_update.seq
+        self._reopened = False
+        self._changed = asyncio.Event()
+
+    @property
+    def last_seq(self) -> int:
+        """마지막으로 부여한 seq"""
+        return self._last_seq
+
+    @property
+    def latest(self) -> bt_pb2.ProgressUpdate | None:
+        """마지막 이벤트"""
+        return self._updates[-1] if self._updates else None
+
+    @property
+    def finished(self) -> bool:
+        """종료 상태 이벤트 발행 여부"""
+        return (
+            not self._reopened
+            and bool(self._updates)
+            and self._updates[-1].status in TERMINAL_STATUSES
+        )
+
+    def reopen(self) -> None:
+        """종료된 로그에 이어서 발행 허용 (재개한 백테스트, seq 는 계속 증가)"""
+        self._reopened = True
+
+    def publish(self, update: bt_pb2.ProgressUpdate) -> bt_pb2.ProgressUpdate:
+        """seq/timestamp 를 채워 이벤트 기록 (이벤트 루프 스레드에서 호출)"""
+        if self.finished:
+            raise ValueError(f"이미 종료된 백테스트입니다: {self.backtest_id}")
+        self._reopened = False
+        self._last_seq += 1
+        stored = bt_pb2.ProgressUpdate()
+        stored.CopyFrom(update)
+        stored.backtest_id = self.backtest_id
+        stored.seq = self._last_seq
+        if not stored.HasField("timestamp"):
+            stored.timestamp.GetCurrentTime()
+        self._updates.append(stored)
+
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+        return stored
+
+    def since(self, seq: int) -> list[bt_pb2.ProgressUpdate]:
+        """seq 이후의 보관 이벤트 (보관 범위를 벗어난 이벤트는 seq 공백으로 드러남)"""
+        if not self._updates or seq >= self._last_seq:
+            return []
+        first = self._updates[0].seq
+        start = max(seq + 1 - first, 0)
+        return list(self._updates)[start:]
+
+    async def follow(self, resume_after_seq: int = 0) -> AsyncIterator[bt_pb2.ProgressUpdate]:
+        """resume_after_seq 이후 이벤트를 재생한 뒤 종료 상태까지 새 이벤트를 대기/전달"""
+        # 재개(reopen)로 뒤에 이벤트가 이어진 종료 이벤트는 건너뛰고, 로그의 마지막 종료 이벤트에서만 끝냄
+        seq = resume_after_seq
+        while True:
+            changed = self._changed
+            for update in self.since(seq):
+                seq = update.seq
+                if update.status in TERMINAL_STATUSES:
+                    if update.seq == self._last_seq and self.finished:
+                        yield update
+                        return
+                    continue
+                yield update
+            # yield 사이에 발행된 종료 이벤트는 다음 반복에서 전달
+            if self.finished and seq >= self._last_seq:
+                return
+            await changed.wait()
+
+
+def _with_metrics_policy(
+    update: bt_pb2.ProgressUpdate, sent: int, options: ProgressOptions
+) -> bt_pb2.ProgressUpdate:
+    if (
+        options.metrics_every_n <= 1
+        or not update.HasField("current_metrics")
+        or update.status in TERMINAL_STATUSES
+        or sent % options.metrics_every_n == 0
+    ):
+        return update
+    stripped = bt_pb2.ProgressUpdate()
+    stripped.CopyFrom(update)
+    stripped.ClearField("current_metrics")
+    return stripped
+
+
+async def throttle(
+    updates: AsyncIterator[bt_pb2.ProgressUpdate],
+    options: ProgressOptions,
+    clock: Callable[[], float] = time.monotonic,
+) -> AsyncIterator[bt_pb2.ProgressUpdate]:
+    """min_interval_ms / min_progress_delta conflation 및 metrics_every_n 적용"""
+    # 상태 변경(종료 포함)은 즉시 전달하고, 보류 이벤트는 최신 것 하나만 유지
+    interval = options.min_interval_ms / 1000.0
+    last_sent_at = -math.inf
+    last_sent: bt_pb2.ProgressUpdate | None = None
+    pending: bt_pb2.ProgressUpdate | None = None
+    sent = 0
+
+    def eligible(update: bt_pb2.ProgressUpdate) -> bool:
+        if last_sent is None or update.status != last_sent.status:
+            return True
+        delta = abs(update.progress_pct - last_sent.progress_pct)
+        return delta >= options.min_progress_delta
+
+    def urgent(update: bt_pb2.ProgressUpdate) -> bool:
+        return last_sent is None or update.status != last_sent.status
+
+    iterator = updates.__aiter__()
+    next_item: asyncio.Future | None = None
+    try:
+        while True:
+            if next_item is None:
+                next_item = asyncio.ensure_future(iterator.__anext__())
+            timeout = None
+            if pending is not None and eligible(pending):
+                timeout = max(0.0, last_sent_at + interval - clock())
+            done, _ = await asyncio.wait({next_item}, timeout=timeout)
+
+            if not done:
+                # 보류 이벤트의 전송 가능 시점 도달
+                update, pending = pending, None
+            else:
+                try:
+                    pending = next_item.result()
+                except StopAsyncIteration:
+                    if pending is not None and eligible(pending):
+                        yield _with_metrics_policy(pending, sent, options)
+                    return
+                finally:
+                    next_item = None
+                if not eligible(pending):
+                    continue
+                if not urgent(pending) and clock() - last_sent_at < interval:
+                    continue
+                update, pending = pending, None
+
+            yield _with_metrics_policy(update, sent, options)
+            sent += 1
+            last_sent, last_sent_at = update, clock()
+            if update.status in TERMINAL_STATUSES:
+                return
+    finally:
+        if next_item is not None:
+            next_item.cancel()
+
+
+def follow_progress(
+    stub: bt_grpc.BacktestServiceStub,
+    request: bt_pb2.StreamProgressRequest,
+    max_retries: int = 5,
+    backoff_seconds: float = 0.5,
+    sleep: Callable[[float], None] = time.sleep,
+) -> Iterator[bt_pb2.ProgressUpdate]:
+    """StreamBacktestProgress 를 따라가며 끊기면 마지막 seq 부터 재연결"""
+    last_seq = request.resume_after_seq
+    retries = 0
+    while True:
+        attempt = bt_pb2.StreamProgressRequest()
+        attempt.CopyFrom(request)
+        if last_seq:
+            attempt.resume_after_seq = last_seq
+        try:
+            for update in stub.StreamBacktestProgress(attempt):
+                if update.seq and update.seq <= last_seq:
+                    continue
+                last_seq = update.seq or last_seq
+                retries = 0
+                yield update
+            # 서버는 로그의 마지막 종료 이벤트 뒤에 스트림을 닫음 (재개로 대체된 종료 이벤트는 보내지 않음)
+            return
+        except grpc.RpcError as e:
+            if e.code() not in RETRYABLE_CODES or retries >= max_retries:
+                raise
+            sleep(backoff_seconds * (2**retries))
+            retries += 1
@@ -0,0 +1,120 @@
+"""
+롤링 지표 시계열 모듈 (GetRollingMetrics).
+
+리스크 화면이 자산곡선 전체를 받아 클라이언트마다 다시 계산하던 롤링 지표를, 서버가 완료된
+결과에서 한 번 계산해 보관하고 요청한 윈도들의 시계열을 같은 시간축에 맞춘 packed 배열로 돌려줍니다.
+
+- 지표 정의와 계산은 metrics.rolling_metrics (무위험 수익률 0, step 1) 를 그대로 사용
+  (sharpe_ratio / volatility / drawdown / win_rate 열, max_drawdown 계산은 생략)
+- 윈도가 차기 전 바는 NaN 으로 채워 자산곡선 바마다 한 값
+- 윈도별 전체 해상도 시계열은 백테스트의 RollingSeries 에 보관 (최대 MAX_CACHED_WINDOWS 개)
+- 시간축은 자산곡선 바 (max_points 지정 시 downsample_indices 로 자산곡선과 같은 점 선택)
+
+서버:
+    rolling = RollingSeries(result.equity, result.trades, backtest_id)   # 백테스트당 한 번
+    response = rolling.response(request)
+
+클라이언트:
+    request = bt_pb2.GetRollingMetricsRequest(
+        backtest_id=bid, user_id=uid, windows=[20, 60, 252], max_points=500
+    )
+    response = stub.GetRollingMetrics(request)
+    for series in response.series:
+        sharpe = np.asarray(series.sharpe_ratio)
+"""
+
+from __future__ import annotations
+
+import threading
+
+import numpy as np
+
+from ..protos.services.backtest.v1 import backtest_service_pb2 as bt_pb2
+from .downsample import downsample_indices
+from .metrics import periods_per_year, rolling_metrics
+
+DEFAULT_WINDOWS = (20, 60)
+MAX_WINDOWS = 16
+# 백테스트별로 보관할 윈도 시계열 수 (초과 시 오래된 윈도부터 제거)
+MAX_CACHED_WINDOWS = 32
+
+ROLLING_SERIES_DTYPE = np.dtype(
+    [
+        ("sharpe_ratio", "<f8"),
+        ("volatility", "<f8"),
+        ("drawdown", "<f8"),
+        ("win_rate", "<f8"),
+    ]
+)
+
+
+def request_windows(request: bt_pb2.GetRollingMetricsRequest) -> list[int]:
+    """요청 윈도 목록 (요청 순서, 중복 제거)"""
+    windows = list(dict.fromkeys(request.windows)) or list(DEFAULT_WINDOWS)
+    if len(windows) > MAX_WINDOWS:
+        raise ValueError(f"windows 는 최대 {MAX_WINDOWS} 개입니다: {len(windows)}")
+    for window in windows:
+        if window < 2:
+            raise ValueError(f"window 는 2 이상이어야 합니다: {window}")
+    return windows
+
+
+class RollingSeries:
+    """한 백테스트의 롤링 지표 시계열 (metrics.rolling_metrics 결과를 윈도별로 보관)"""
+
+    def __init__(self, equity: np.ndarray, trades: np.ndarray, backtest_id: str = "") -> None:
+        self.backtest_id = backtest_id
+        self.equity = equity
+        self.trades = trades
+        self.timestamp = np.asarray(equity["timestamp"], dtype=np.int64)
+        self.values = np.asarray(equity["equity"], dtype=np.float64)
+        self.ppy = periods_per_year(self.timestamp)
+        self._series: dict[int, np.ndarray] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def _compute(self, window: int) -> np.ndarray:
+        out = np.empty(len(self.values), dtype=ROLLING_SERIES_DTYPE)
+        rows = rolling_metrics(
+            self.equity, window, ppy=self.ppy, trades=self.trades, with_max_drawdown=False
+        )
+        for name in ROLLING_SERIES_DTYPE.names:
+            out[name][: window - 1] = np.nan
+            out[name][window - 1 :] = rows[name]
+        return out
+
+    def series(self, window: int) -> np.ndarray:
+        """window 바 롤링 시계열 (ROLLING_SERIES_DTYPE, 자산곡선 바마다 한 값)"""
+        with self._lock:
+            cached = self._series.get(window)
+            if cached is not None:
+                return cached
+            computed = self._compute(window)
+            if len(self._series) >= MAX_CACHED_WINDOWS:
+                del self._series[next(iter(self._series))]
+            self._series[window] = computed
+            return computed
+
+    def response(self, request: bt_pb2.GetRollingMetricsRequest) -> bt_pb2.RollingMetricsResponse:
+        """요청 윈도들의 시계열을 (다운샘플링한) 자산곡선 시간축에 맞춘 응답"""
+        windows = request_windows(request)
+        max_points = request.max_points if request.HasField("max_points") else None
+        index = downsample_indices(
+            self.timestamp, self.values, max_points, request.downsample_method
+        )
+        response = bt_pb2.RollingMetricsResponse(
+            backtest_id=self.backtest_id,
+            timestamp_ns=self.timestamp[index].tolist(),
+            periods_per_year=self.ppy,
+        )
+        for window in windows:
+            self._fill(response.series.add(window=window), self.series(window)[index])
+        return response
+
+    @staticmethod
+    def _fill(series: bt_pb2.RollingWindowSeries, values: np.ndarray) -> None:
+        for name in ROLLING_SERIES_DTYPE.names:
+            getattr(series, name).extend(values[name].tolist())
+
@@ -0,0 +1,311 @@
+"""
+백테스트 작업 스케줄러 (lane/우선순위/사용자 공정성).
+
+ExecuteBacktest 의 lane / priority 에 대한 참조 구현입니다.
+
+- INTERACTIVE lane 은 BATCH 보다 항상 먼저 시작하며, reserved_interactive 개의 워커는
+  BATCH 가 사용할 수 없어 대량 스윕 중에도 단건 실행의 시작 지연이 보호됩니다.
+- 같은 lane 안에서는 실행 중인 작업이 가장 적은 사용자(동률이면 가장 오래 기다린 작업)를
+  먼저 시작하고, 사용자 큐 안에서는 priority 가 높은 작업이 먼저입니다.
+- GetQueueStats 용 lane 별 대기 깊이, 대기 시간 백분위수, 실행 수, 워커 사용률을 집계합니다.
+
+사용 예시:
+    scheduler = BacktestScheduler(workers=8, reserved_interactive=2)
+
+    async def ExecuteBacktest(self, request, context):
+        lane = Lane.resolve(request.lane, Lane.INTERACTIVE)
+        future = scheduler.submit(backtest_id, request.user_id, run, lane, request.priority)
+
+    async def GetQueueStats(self, request, context):
+        return scheduler.stats(request.lane if request.HasField("lane") else None)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import math
+import time
+from collections import Counter, deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any
+
+from ..protos.services.backtest.v1 import backtest_service_pb2 as bt_pb2
+
+DEFAULT_PRIORITY = 5
+MAX_PRIORITY = 9
+
+
+class Lane(IntEnum):
+    """스케줄링 lane (BacktestLane 값과 동일)"""
+
+    INTERACTIVE = bt_pb2.BACKTEST_LANE_INTERACTIVE
+    BATCH = bt_pb2.BACKTEST_LANE_BATCH
+
+    @classmethod
+    def resolve(cls, value: int, default: Lane) -> Lane:
+        """BacktestLane 값을 Lane 으로 변환 (UNSPECIFIED 는 default)"""
+        if value == bt_pb2.BACKTEST_LANE_UNSPECIFIED:
+            return default
+        try:
+            return cls(value)
+        except ValueError:
+            raise ValueError(f"지원하지 않는 lane: {value}") from None
+
+
+@dataclass(order=True)
+class _QueuedJob:
+    sort_key: tuple[int, int]
+    backtest_id: str = field(compare=False)
+    user_id: str = field(compare=False)
+    lane: Lane = field(compare=False)
+    run: Callable[[], Awaitable[Any]] = field(compare=False)
+    future: asyncio.Future = field(compare=False)
+    enqueued_at: float = field(compare=False)
+
+    @property
+    def seq(self) -> int:
+        return self.sort_key[1]
+
+
+@dataclass
+class _LaneState:
+    # 사용자별 (-priority, seq) 힙
+    queues: dict[str, list[_QueuedJob]] = field(default_factory=dict)
+    running_by_user: Counter = field(default_factory=Counter)
+    running: int = 0
+    started: int = 0
+    finished: int = 0
+    waits: deque = field(default_factory=lambda: deque(maxlen=2048))
+    # 사용률 계산용 (시작, 종료) 구간
+    intervals: deque = field(default_factory=deque)
+
+    @property
+    def depth(self) -> int:
+        return sum(len(queue) for queue in self.queues.values())
+
+
+def _percentile(values: deque, q: float) -> float:
+    """nearest-rank 백분위수"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, math.ceil(q / 100.0 * len(ordered)) - 1)
+    return float(ordered[rank])
+
+
+class BacktestScheduler:
+    """lane 우선순위, INTERACTIVE 예약 워커, 사용자 공정성을 적용하는 비동기 작업 스케줄러"""
+
+    def __init__(
+        self,
+        workers: int,
+        reserved_interactive: int = 1,
+        window_seconds: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if workers < 1:
+            raise ValueError(f"workers 는 1 이상이어야 합니다: {workers}")
+        if not 0 <= reserved_interactive < workers:
+            raise ValueError(
+                f"reserved_interactive 는 0 이상 workers 미만이어야 합니다: {reserved_interactive}"
+            )
+        self.workers = workers
+        self.reserved_interactive = reserved_interactive
+        self.window_seconds = window_seconds
+        self._clock = clock
+        self._created_at = clock()
+        self._seq = itertools.count()
+        self._lanes = {lane: _LaneState() for lane in Lane}
+        self._queued: dict[str, _QueuedJob] = {}
+        # backtest_id → (lane, 시작 시각)
+        self._running: dict[str, tuple[Lane, float]] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    @property
+    def busy(self) -> int:
+        """실행 중인 작업 수"""
+        return len(self._running)
+
+    def submit(
+        self,
+        backtest_id: str,
+        user_id: str,
+        run: Callable[[], Awaitable[Any]],
+        lane: Lane = Lane.INTERACTIVE,
+        priority: int | None = None,
+    ) -> asyncio.Future:
+        """작업 예약 (run 결과를 담는 Future 반환, 여유 워커가 있으면 즉시 시작)"""
+        if backtest_id in self._queued or backtest_id in self._running:
+            raise ValueError(f"이미 예약된 작업입니다: {backtest_id}")
+        priority = DEFAULT_PRIORITY if priority is None else priority
+        if not 0 <= priority <= MAX_PRIORITY:
+            raise ValueError(f"priority 는 0-{MAX_PRIORITY} 범위여야 합니다: {priority}")
+
+        job = _QueuedJob(
+            (-priority, next(self._seq)),
+            backtest_id,
+            user_id,
+            lane,
+            run,
+            asyncio.get_running_loop().create_future(),
+            self._clock(),
+        )
+        heapq.heappush(self._lanes[lane].queues.setdefault(user_id, []), job)
+        self._queued[backtest_id] = job
+        self._dispatch()
+        return job.future
+
+    def position(self, backtest_id: str) -> int | None:
+        """lane 안에서 먼저 예약된 대기 작업 수 (실행 중/미등록이면 None)"""
+        job = self._queued.get(backtest_id)
+        if job is None:
+            return None
+        return sum(
+            1
+            for queue in self._lanes[job.lane].queues.values()
+            for other in queue
+            if other.seq < job.seq
+        )
+
+    def cancel(self, backtest_id: str) -> bool:
+        """대기 중인 작업 취소 (이미 시작한 작업은 False)"""
+        job = self._queued.pop(backtest_id, None)
+        if job is None:
+            return False
+        state = self._lanes[job.lane]
+        queue = state.queues[job.user_id]
+        queue.remove(job)
+        heapq.heapify(queue)
+        if not queue:
+            del state.queues[job.user_id]
+        job.future.cancel()
+        return True
+
+    async def close(self) -> None:
+        """대기 작업을 취소하고 실행 중인 작업 태스크를 취소한 뒤 종료까지 대기"""
+        for backtest_id in list(self._queued):
+            self.cancel(backtest_id)
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _pick(self, lane: Lane) -> _QueuedJob | None:
+        """실행 중인 작업이 가장 적은 사용자의 최우선 작업"""
+        state = self._lanes[lane]
+        best_user = None
+        best_key = None
+        for user_id, queue in state.queues.items():
+            key = (state.running_by_user[user_id], queue[0].seq)
+            if best_key is None or key < best_key:
+                best_user, best_key = user_id, key
+        if best_user is None:
+            return None
+        queue = state.queues[best_user]
+        job = heapq.heappop(queue)
+        if not queue:
+            del state.queues[best_user]
+        del self._queued[job.backtest_id]
+        return job
+
+    def _dispatch(self) -> None:
+        while self.busy < self.workers:
+            job = self._pick(Lane.INTERACTIVE)
+            if job is None:
+                # 예약 워커만 남았으면 BATCH 는 대기
+                if self.workers - self.busy <= self.reserved_interactive:
+                    return
+                job = self._pick(Lane.BATCH)
+            if job is None:
+                return
+            if job.future.cancelled():
+                continue
+            self._start(job)
+
+    def _start(self, job: _QueuedJob) -> None:
+        now = self._clock()
+        state = self._lanes[job.lane]
+        state.running += 1
+        state.running_by_user[job.user_id] += 1
+        state.started += 1
+        state.waits.append((now, (now - job.enqueued_at) * 1000.0))
+        self._running[job.backtest_id] = (job.lane, now)
+        task = asyncio.get_running_loop().create_task(self._run(job))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, job: _QueuedJob) -> None:
+        try:
+            result = await job.run()
+        except Exception as e:
+            if not job.future.done():
+                job.future.set_exception(e)
+        else:
+            if not job.future.done():
+                job.future.set_result(result)
+        finally:
+            # 작업 태스크가 취소되면 Future 도 취소
+            if not job.future.done():
+                job.future.cancel()
+            _, started_at = self._running.pop(job.backtest_id)
+            state = self._lanes[job.lane]
+            state.running -= 1
+            state.running_by_user[job.user_id] -= 1
+            if not state.running_by_user[job.user_id]:
+                del state.running_by_user[job.user_id]
+            state.finished += 1
+            state.intervals.append((started_at, self._clock()))
+            self._dispatch()
+
+    def _busy_seconds(self, lane: Lane, since: float, now: float) -> float:
+        state = self._lanes[lane]
+        while state.intervals and state.intervals[0][1] < since:
+            state.intervals.popleft()
+        busy = sum(min(end, now) - max(start, since) for start, end in state.intervals)
+        busy += sum(
+            now - max(started_at, since)
+            for running_lane, started_at in self._running.values()
+            if running_lane == lane
+        )
+        return max(busy, 0.0)
+
+    def stats(self, lane: int | None = None) -> bt_pb2.QueueStats:
+        """GetQueueStats 응답 생성"""
+        now = self._clock()
+        window = min(self.window_seconds, now - self._created_at)
+        since = now - window
+        capacity = self.workers * window
+        response = bt_pb2.QueueStats(
+            workers=self.workers,
+            busy_workers=self.busy,
+            reserved_interactive_workers=self.reserved_interactive,
+            window_seconds=window,
+        )
+        response.timestamp.GetCurrentTime()
+
+        total_busy = 0.0
+        for item in Lane:
+            busy = self._busy_seconds(item, since, now)
+            total_busy += busy
+            if lane is not None and lane != bt_pb2.BACKTEST_LANE_UNSPECIFIED and item != lane:
+                continue
+            state = self._lanes[item]
+            waits = deque(wait for started_at, wait in state.waits if started_at >= since)
+            response.lanes.add(
+                lane=int(item),
+                queue_depth=state.depth,
+                running=state.running,
+                queued_users=len(state.queues),
+                started=state.started,
+                finished=state.finished,
+                wait_ms_p50=_percentile(waits, 50),
+                wait_ms_p95=_percentile(waits, 95),
+                wait_ms_p99=_percentile(waits, 99),
+                utilization=busy / capacity if capacity > 0 else 0.0,
+            )
+        response.utilization = total_busy / capacity if capacity > 0 else 0.0
+        return response
@@ -0,0 +1,317 @@
+"""
+시간 구간 분할(샤드) 백테스트 실행 모듈.
+
+긴 기간의 단일 심볼 백테스트를 BacktestConfig.parallelism 개의 연속 바 구간으로 나눠 워커
+프로세스(또는 노드)에서 동시에 계산하고, 구간 경계의 시뮬레이션 상태를 순서대로 넘겨받는
+이음 단계로 포지션/자산곡선/거래를 잇습니다. 결과는 분할하지 않은 실행과 같습니다
+(부동소수점 오차 범위).
+
+- 분할: 구간마다 앞쪽 warm-up 바 (전략 지표의 min_lookback, BacktestConfig.warmup_bars 로 지정)
+  를 더 읽어 신호를 계산하고 자기 구간의 신호만 사용
+- 구간 계산 (병렬): 포지션 없이 시작한다고 가정하고 서로 다른 두 시작 자본으로 시뮬레이션.
+  포지션 없이 시작한 구간의 현금/수량/자산은 시작 현금의 1 차 함수이므로 두 결과로 임의의
+  시작 현금에 대한 결과를 복원
+- 이음 (순차, 구간당 벡터 연산 몇 번): 이전 구간의 마지막 상태를 받아
+  - 포지션 없음: 받은 현금으로 두 결과를 보간
+  - 보유 포지션: 청산 바까지 이어받은 포지션을 계산하고 이후 바는 청산 후 현금으로 보간
+    (포지션을 이어받았으면 직전 신호가 켜져 있으므로 가정한 실행도 다음 상승 에지까지 진입 없음)
+  - 경계 신호 불일치, 수수료를 낼 수 없는 자산 도달 등 1 차 함수 가정이 깨진 구간은
+    받은 상태에서 다시 계산
+- drawdown 은 이은 자산곡선 전체의 최고점 기준으로 다시 계산
+
+사용 예시 (프로세스 풀):
+    with ProcessPoolExecutor(max_workers=8) as pool:
+        result = run_sharded(config, timestamp, close, signal, min_lookback=30, executor=pool)
+
+사용 예시 (노드 분산, 노드에는 직렬화한 BacktestConfig 를 보내고 ShardResult 는 pickle 로 회수):
+    shards = plan_shards(len(close), 16, warmup_bars=30)
+    parts = [node.run_shard(config, shard, timestamp[shard.window], close[shard.window], signal)
+             for node, shard in zip(nodes, shards)]
+    result = stitch(config, timestamp, close, parts)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from concurrent.futures import Executor
+from dataclasses import dataclass
+
+import numpy as np
+
+from ..protos.services.backtest.v1 import backtest_service_pb2 as bt_pb2
+from .engine import (
+    BacktestRun,
+    Signal,
+    SimulationState,
+    _carried_exit,
+    _simulate_bars,
+    _single_result,
+)
+from .portfolio import PortfolioResult
+from .stream import EQUITY_DTYPE, SIDE_CODES
+
+# (바별 현금, 거래, 바별 보유 수량, 마지막 바 이후 상태), 자산곡선은 이음 단계에서 한 번 생성
+_Part = tuple[np.ndarray, np.ndarray, np.ndarray, SimulationState]
+# (commission_per_trade, 슬리피지 비율, stop_loss_pct, take_profit_pct)
+_Costs = tuple[float, float, float | None, float | None]
+
+# 시작 자본에 대해 1 차 함수인 거래 필드
+_TRADE_FIELDS = ("quantity", "pnl", "portfolio_value")
+
+
+def shard_parallelism(config: bt_pb2.BacktestConfig) -> int:
+    """BacktestConfig.parallelism (미설정 시 1)"""
+    if not config.HasField("parallelism"):
+        return 1
+    if config.parallelism < 1:
+        raise ValueError(f"parallelism 은 1 이상이어야 합니다: {config.parallelism}")
+    if config.parallelism > 1 and config.assets:
+        raise ValueError("parallelism 은 단일 심볼 백테스트에서만 지원합니다")
+    return config.parallelism
+
+
+def shard_warmup(config: bt_pb2.BacktestConfig, min_lookback: int | None) -> int | None:
+    """구간별 warm-up 바 수 (BacktestConfig.warmup_bars, 미설정 시 전략의 min_lookback)"""
+    if config.HasField("warmup_bars"):
+        if config.warmup_bars < 1:
+            raise ValueError(f"warmup_bars 는 1 이상이어야 합니다: {config.warmup_bars}")
+        return config.warmup_bars
+    return min_lookback
+
+
+@dataclass(frozen=True)
+class Shard:
+    """샤드 하나의 바 구간 [start, end) 와 신호 계산을 시작하는 warm-up 바"""
+
+    index: int
+    start: int
+    end: int
+    warmup_start: int
+
+    @property
+    def window(self) -> slice:
+        """샤드가 읽는 가격 구간 (warm-up 포함)"""
+        return slice(self.warmup_start, self.end)
+
+
+def plan_shards(total_bars: int, parallelism: int, warmup_bars: int | None) -> list[Shard]:
+    """전체 바를 parallelism 개 구간으로 균등 분할 (warmup_bars 가 None 이면 처음부터 warm-up)"""
+    if parallelism < 1:
+        raise ValueError(f"parallelism 은 1 이상이어야 합니다: {parallelism}")
+    if warmup_bars is not None and warmup_bars < 1:
+        raise ValueError(f"warmup_bars 는 1 이상이어야 합니다: {warmup_bars}")
+    if total_bars <= 0:
+        return []
+    bounds = np.unique(np.linspace(0, total_bars, min(parallelism, total_bars) + 1).round())
+    bounds = bounds.astype(np.int64).tolist()
+    return [
+        Shard(
+            index=i,
+            start=start,
+            end=end,
+            warmup_start=0 if warmup_bars is None else max(0, start - warmup_bars),
+        )
+        for i, (start, end) in enumerate(zip(bounds[:-1], bounds[1:]))
+    ]
+
+
+@dataclass
+class ShardResult:
+    """포지션 없이 시작한다고 가정한 샤드 구간의 두 시작 자본 실행 결과"""
+
+    shard: Shard
+    # 샤드 구간의 노출 (max_position_size 상한 적용 후) 과 구간 직전 바의 신호
+    exposure: np.ndarray
+    previous: bool
+    costs: _Costs
+    # 첫 값이 BacktestConfig.initial_capital
+    capitals: tuple[float, float]
+    runs: tuple[_Part, _Part]
+    # 두 실행의 거래 구조가 같고 수수료를 낼 수 없는 자산에 닿지 않았는지 (1 차 함수 보간 가능)
+    affine: bool
+
+
+def run_shard(
+    config: bt_pb2.BacktestConfig,
+    shard: Shard,
+    timestamp: np.ndarray,
+    close: np.ndarray,
+    signal: Signal,
+) -> ShardResult:
+    """샤드 계산 (timestamp/close 는 shard.window 구간, 워커 프로세스에서 실행 가능)"""
+    if len(close) != shard.end - shard.warmup_start:
+        raise ValueError(
+            f"샤드 {shard.index} 가격 길이 불일치: {len(close)} != {shard.end - shard.warmup_start}"
+        )
+    run = BacktestRun.from_config(config, timestamp, close, signal)
+    skip = shard.start - shard.warmup_start
+    previous = bool(run.exposure[skip - 1] > 0) if skip else False
+    exposure = run.exposure[skip:]
+    costs = (run.fee, run.slip, run.stop_loss_pct, run.take_profit_pct)
+    capitals = (run.initial_capital, 2.0 * run.initial_capital)
+    low, high = (
+        _simulate_bars(
+            run.timestamp[skip:],
+            run.close[skip:],
+            exposure,
+            SimulationState(capital, active=previous),
+            *costs,
+        )
+        for capital in capitals
+    )
+    affine = (
+        len(low[1]) == len(high[1])
+        and np.array_equal(low[1]["timestamp"], high[1]["timestamp"])
+        and not any(len(part[0]) and part[0]["equity"].min() <= run.fee for part in (low, high))
+    )
+    runs = tuple((part[0]["cash"], *part[1:]) for part in (low, high))
+    return ShardResult(shard, exposure, previous, costs, capitals, runs, affine)
+
+
+def _run_shard_payload(
+    payload: bytes, shard: Shard, timestamp: np.ndarray, close: np.ndarray, signal: Signal
+) -> ShardResult:
+    # 생성된 메시지 클래스는 pickle 할 수 없으므로 프로세스에는 직렬화한 설정을 전달
+    return run_shard(bt_pb2.BacktestConfig.FromString(payload), shard, timestamp, close, signal)
+
+
+def _interpolate(part: ShardResult, skip: int, cash: float) -> _Part | None:
+    """skip 번째 바부터 포지션 없이 cash 로 이어간 결과 (1 차 함수 가정이 깨지면 None)"""
+    # 가정한 실행은 skip 전까지 거래가 없어야 함 (호출 측 확인)
+    (cash_low, trades_low, position_low, after_low) = part.runs[0]
+    (cash_high, trades_high, position_high, after_high) = part.runs[1]
+    low, high = part.capitals
+    weight = (cash - low) / (high - low)
+
+    def mix(a, b):
+        return a + (b - a) * weight
+
+    trades = trades_low.copy()
+    for name in _TRADE_FIELDS:
+        trades[name] = mix(trades_low[name], trades_high[name])
+    # 수수료를 낼 수 없는 현금으로 진입하는 구간이 생기면 엔진은 이후 진입을 멈춤
+    if np.any(trades["quantity"][trades["side"] == SIDE_CODES["BUY"]] <= 0):
+        return None
+    after = SimulationState(
+        mix(after_low.cash, after_high.cash),
+        mix(after_low.quantity, after_high.quantity),
+        after_low.entry_close,
+        mix(after_low.entry_equity, after_high.entry_equity),
+        after_low.active,
+    )
+    return (
+        mix(cash_low[skip:], cash_high[skip:]),
+        trades,
+        mix(position_low[skip:], position_high[skip:]),
+        after,
+    )
+
+
+def _resimulate(
+    part: ShardResult,
+    timestamp: np.ndarray,
+    close: np.ndarray,
+    state: SimulationState,
+    bars: int | None = None,
+) -> _Part:
+    """state 에서 처음 bars 개 바를 다시 계산 (None 이면 샤드 전체)"""
+    window = slice(0, bars)
+    equity, trades, position, after = _simulate_bars(
+        timestamp[window], close[window], part.exposure[window], state, *part.costs
+    )
+    return equity["cash"], trades, position, after
+
+
+def _hand_off(
+    part: ShardResult, timestamp: np.ndarray, close: np.ndarray, state: SimulationState
+) -> _Part:
+    """이전 샤드의 마지막 상태 state 에서 이어지는 샤드 결과"""
+    if state.active == part.previous and part.affine:
+        if state.quantity == 0:
+            tail = _interpolate(part, 0, state.cash)
+            if tail is not None:
+                return tail
+        else:
+            # 이어받은 포지션은 청산 바까지 따로 계산하고 이후 바는 청산 후 현금으로 보간
+            exit_bar = _carried_exit(
+                close, part.exposure > 0, state.entry_close, part.costs[2], part.costs[3]
+            )
+            skip = min(exit_bar + 1, len(close))
+            head = _resimulate(part, timestamp, close, state, skip)
+            if skip == len(close):
+                return head
+            trades = part.runs[0][1]
+            if not len(trades) or trades["timestamp"][0] > timestamp[skip - 1]:
+                tail = _interpolate(part, skip, head[3].cash)
+                if tail is not None:
+                    cash, trades, position = (
+                        np.concatenate(pair) for pair in zip(head[:3], tail[:3])
+                    )
+                    return cash, trades, position, tail[3]
+    return _resimulate(part, timestamp, close, state)
+
+
+def stitch(
+    config: bt_pb2.BacktestConfig,
+    timestamp: np.ndarray,
+    close: np.ndarray,
+    parts: Iterable[ShardResult],
+) -> PortfolioResult:
+    """샤드 결과를 순서대로 이어 분할하지 않은 실행과 같은 결과 생성 (상태 인계 단계)"""
+    parts = sorted(parts, key=lambda part: part.shard.start)
+    timestamp = np.asarray(timestamp, dtype=np.int64)
+    close = np.asarray(close, dtype=np.float64)
+    if not parts or parts[0].shard.start != 0 or parts[-1].shard.end != len(close):
+        raise ValueError("샤드가 전체 바 구간을 덮지 않습니다")
+    initial_capital = parts[0].capitals[0]
+    state = SimulationState(initial_capital)
+    cash, trades, positions = [], [], []
+    for previous, part in zip([None] + parts[:-1], parts):
+        shard = part.shard
+        if previous is not None and previous.shard.end != shard.start:
+            raise ValueError(f"샤드 {shard.index} 가 이전 샤드와 이어지지 않습니다")
+        bars = slice(shard.start, shard.end)
+        shard_cash, shard_trades, position, state = _hand_off(
+            part, timestamp[bars], close[bars], state
+        )
+        cash.append(shard_cash)
+        trades.append(shard_trades)
+        positions.append(position)
+
+    position = np.concatenate(positions)
+    equity = np.zeros(len(close), dtype=EQUITY_DTYPE)
+    equity["timestamp"] = timestamp
+    equity["positions_value"] = position * close
+    equity["cash"] = np.concatenate(cash)
+    equity["equity"] = equity["cash"] + equity["positions_value"]
+    peaks = np.maximum.accumulate(equity["equity"])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        equity["drawdown"] = np.where(peaks > 0, equity["equity"] / peaks - 1.0, 0.0) * 100.0
+    return _single_result(config.symbol, initial_capital, equity, np.concatenate(trades), position)
+
+
+def run_sharded(
+    config: bt_pb2.BacktestConfig,
+    timestamp: np.ndarray,
+    close: np.ndarray,
+    signal: Signal,
+    min_lookback: int | None = None,
+    executor: Executor | None = None,
+) -> PortfolioResult:
+    """config.parallelism 개 샤드로 나눠 실행 후 이음 (executor 가 없으면 현재 스레드에서 순차 실행)"""
+    # min_lookback 을 모르는 신호는 샤드마다 처음부터 warm-up (신호 계산은 중복, 시뮬레이션만 분할)
+    timestamp = np.asarray(timestamp, dtype=np.int64)
+    close = np.asarray(close, dtype=np.float64)
+    shards = plan_shards(len(close), shard_parallelism(config), shard_warmup(config, min_lookback))
+    mapper: Callable = map if executor is None else executor.map
+    parts = list(
+        mapper(
+            _run_shard_payload,
+            [config.SerializeToString()] * len(shards),
+            shards,
+            [timestamp[shard.window] for shard in shards],
+            [close[shard.window] for shard in shards],
+            [signal] * len(shards),
+        )
+    )
+    return stitch(config, timestamp, close, parts)
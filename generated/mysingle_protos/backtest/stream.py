@@ -0,0 +1,300 @@
+"""
+백테스트 결과 청크 스트리밍 모듈.
+
+StreamBacktestResult 의 서버 측 청크 생성과 클라이언트 측 조립을 제공합니다.
+클라이언트는 청크를 메시지 목록으로 모으지 않고 NumPy 구조화 배열(메모리) 또는
+.npy 파일(memmap)에 바로 기록하므로, 수백만 개의 EquityPoint 도 일정한 메모리로 수신합니다.
+
+사용 예시:
+    chunks = stub.StreamBacktestResult(
+        backtest_pb2.StreamBacktestResultRequest(backtest_id=bid, user_id=uid)
+    )
+    result = collect_result(chunks)
+    equity = result.equity["equity"]
+
+    write_result(chunks, "results/bt-123")      # 파일로 직접 기록
+    result = load_result("results/bt-123")      # memmap 으로 다시 열기
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+
+from ..protos.services.backtest.v1 import backtest_service_pb2 as bt_pb2
+
+DEFAULT_MAX_ROWS_PER_CHUNK = 10_000
+MAX_ROWS_PER_CHUNK = 100_000
+
+SIDE_CODES = {"BUY": 1, "SELL": -1}
+SIDE_NAMES = {code: name for name, code in SIDE_CODES.items()}
+
+# timestamp 는 epoch nanoseconds, side 는 SIDE_CODES, symbol 은 심볼 테이블 인덱스
+TRADE_DTYPE = np.dtype(
+    [
+        ("timestamp", "<i8"),
+        ("symbol", "<i4"),
+        ("side", "i1"),
+        ("quantity", "<f8"),
+        ("price", "<f8"),
+        ("pnl", "<f8"),
+        ("commission", "<f8"),
+        ("portfolio_value", "<f8"),
+    ]
+)
+EQUITY_DTYPE = np.dtype(
+    [
+        ("timestamp", "<i8"),
+        ("equity", "<f8"),
+        ("drawdown", "<f8"),
+        ("cash", "<f8"),
+        ("positions_value", "<f8"),
+    ]
+)
+
+_HEADER_FILE = "header.pb"
+_SYMBOLS_FILE = "symbols.json"
+_TRADES_FILE = "trades.npy"
+_EQUITY_FILE = "equity.npy"
+
+
+# ========== Server side ==========
+
+
+def result_header(
+    result: bt_pb2.BacktestResultResponse,
+    include_trades: bool = True,
+    include_equity_curve: bool = True,
+) -> bt_pb2.BacktestResultHeader:
+    """BacktestResultResponse 의 헤더 프레임 생성"""
+    header = bt_pb2.BacktestResultHeader(
+        backtest_id=result.backtest_id,
+        strategy_id=result.strategy_id,
+        status=result.status,
+        config=result.config,
+        created_at=result.created_at,
+        total_trades=len(result.trades) if include_trades else 0,
+        total_equity_points=len(result.equity_curve) if include_equity_curve else 0,
+    )
+    if result.HasField("strategy_version_seq"):
+        header.strategy_version_seq = result.strategy_version_seq
+    if result.HasField("metrics"):
+        header.metrics.CopyFrom(result.metrics)
+    if result.HasField("completed_at"):
+        header.completed_at.CopyFrom(result.completed_at)
+    if result.HasField("error_message"):
+        header.error_message = result.error_message
+    header.asset_results.extend(result.asset_results)
+    return header
+
+
+def iter_result_chunks(
+    result: bt_pb2.BacktestResultResponse,
+    max_rows_per_chunk: int | None = None,
+    include_trades: bool = True,
+    include_equity_curve: bool = True,
+    encoding: int | None = None,
+) -> Iterator[bt_pb2.BacktestResultChunk]:
+    """헤더 → 거래 청크 → 자산곡선 청크 순서의 스트림 프레임 생성"""
+    # columnar 는 이 모듈의 dtype 을 사용하므로 지연 import
+    from .columnar import points_to_columns, trades_to_columns
+
+    columnar = encoding == bt_pb2.RESULT_ENCODING_COLUMNAR
+    rows = min(max_rows_per_chunk or DEFAULT_MAX_ROWS_PER_CHUNK, MAX_ROWS_PER_CHUNK)
+    if rows <= 0:
+        raise ValueError(f"max_rows_per_chunk 는 양수여야 합니다: {max_rows_per_chunk}")
+
+    trades = result.trades if include_trades else []
+    points = result.equity_curve if include_equity_curve else []
+    total_frames = 1 + -(-len(trades) // rows) + -(-len(points) // rows)
+
+    seq = 0
+    yield bt_pb2.BacktestResultChunk(
+        seq=seq,
+        header=result_header(result, include_trades, include_equity_curve),
+        last=total_frames == 1,
+    )
+    for offset in range(0, len(trades), rows):
+        seq += 1
+        chunk = bt_pb2.BacktestResultChunk(seq=seq, last=seq == total_frames - 1)
+        chunk.trades.offset = offset
+        if columnar:
+            chunk.trades.columns.CopyFrom(trades_to_columns(trades[offset : offset + rows]))
+        else:
+            chunk.trades.trades.extend(trades[offset : offset + rows])
+        yield chunk
+    for offset in range(0, len(points), rows):
+        seq += 1
+        chunk = bt_pb2.BacktestResultChunk(seq=seq, last=seq == total_frames - 1)
+        chunk.equity.offset = offset
+        if columnar:
+            chunk.equity.columns.CopyFrom(points_to_columns(points[offset : offset + rows]))
+        else:
+            chunk.equity.points.extend(points[offset : offset + rows])
+        yield chunk
+
+
+# ========== Client side ==========
+
+
+@dataclass
+class StreamedResult:
+    """조립된 백테스트 결과 (거래/자산곡선은 구조화 배열)"""
+
+    header: bt_pb2.BacktestResultHeader
+    trades: np.ndarray
+    equity: np.ndarray
+    symbols: list[str] = field(default_factory=list)
+
+    @property
+    def equity_timestamps(self) -> np.ndarray:
+        """자산곡선 timestamp (datetime64[ns] 뷰)"""
+        return self.equity["timestamp"].view("datetime64[ns]")
+
+    @property
+    def trade_timestamps(self) -> np.ndarray:
+        """거래 timestamp (datetime64[ns] 뷰)"""
+        return self.trades["timestamp"].view("datetime64[ns]")
+
+    def trade_symbols(self) -> np.ndarray:
+        """거래별 심볼 문자열 배열"""
+        return np.asarray(self.symbols, dtype=object)[self.trades["symbol"]]
+
+
+def _trade_rows(trades, symbol_codes: dict[str, int]) -> np.ndarray:
+    nan = float("nan")
+    rows = []
+    for t in trades:
+        code = symbol_codes.get(t.symbol)
+        if code is None:
+            code = symbol_codes[t.symbol] = len(symbol_codes)
+        rows.append(
+            (
+                t.timestamp.seconds * 1_000_000_000 + t.timestamp.nanos,
+                code,
+                SIDE_CODES.get(t.side.upper(), 0),
+                t.quantity,
+                t.price,
+                t.pnl,
+                t.commission,
+                t.portfolio_value if t.HasField("portfolio_value") else nan,
+            )
+        )
+    return np.array(rows, dtype=TRADE_DTYPE)
+
+
+def _equity_rows(points) -> np.ndarray:
+    return np.array(
+        [
+            (
+                p.timestamp.seconds * 1_000_000_000 + p.timestamp.nanos,
+                p.equity,
+                p.drawdown,
+                p.cash,
+                p.positions_value,
+            )
+            for p in points
+        ],
+        dtype=EQUITY_DTYPE,
+    )
+
+
+def _consume(
+    chunks: Iterable[bt_pb2.BacktestResultChunk],
+    allocate: Callable[[str, np.dtype, int], np.ndarray],
+) -> StreamedResult:
+    """청크 순서/오프셋을 검증하며 allocate 가 반환한 배열에 기록"""
+    from .columnar import equity_view, trade_view
+
+    iterator = iter(chunks)
+    first = next(iterator, None)
+    if first is None or first.WhichOneof("payload") != "header" or first.seq != 0:
+        raise ValueError("첫 프레임은 seq=0 헤더여야 합니다")
+
+    header = first.header
+    trades = allocate("trades", TRADE_DTYPE, header.total_trades)
+    equity = allocate("equity", EQUITY_DTYPE, header.total_equity_points)
+    symbol_codes: dict[str, int] = {}
+    written = {"trades": 0, "equity": 0}
+    seq = 0
+    last = first.last
+
+    for chunk in iterator:
+        if last:
+            raise ValueError(f"마지막 프레임 이후 추가 프레임 수신: seq={chunk.seq}")
+        if chunk.seq != seq + 1:
+            raise ValueError(f"프레임 순서 오류: 기대 seq={seq + 1}, 수신 seq={chunk.seq}")
+        seq = chunk.seq
+        last = chunk.last
+
+        kind = chunk.WhichOneof("payload")
+        if kind == "trades":
+            if chunk.trades.HasField("columns"):
+                rows = trade_view(chunk.trades.columns).to_records(symbol_codes)
+            else:
+                rows = _trade_rows(chunk.trades.trades, symbol_codes)
+            target, offset = trades, chunk.trades.offset
+        elif kind == "equity":
+            if chunk.equity.HasField("columns"):
+                rows = equity_view(chunk.equity.columns).to_records()
+            else:
+                rows = _equity_rows(chunk.equity.points)
+            target, offset = equity, chunk.equity.offset
+        else:
+            raise ValueError(f"예상하지 못한 프레임: seq={seq}, payload={kind}")
+
+        if offset != written[kind] or offset + len(rows) > len(target):
+            raise ValueError(f"{kind} 오프셋 오류: 기대 {written[kind]}, 수신 {offset}")
+        target[offset : offset + len(rows)] = rows
+        written[kind] += len(rows)
+
+    if not last:
+        raise ValueError("스트림이 마지막 프레임 전에 종료되었습니다")
+    if written["trades"] != len(trades) or written["equity"] != len(equity):
+        raise ValueError("수신한 행 수가 헤더의 total_* 와 다릅니다")
+
+    symbols = [""] * len(symbol_codes)
+    for symbol, code in symbol_codes.items():
+        symbols[code] = symbol
+    return StreamedResult(header=header, trades=trades, equity=equity, symbols=symbols)
+
+
+def collect_result(chunks: Iterable[bt_pb2.BacktestResultChunk]) -> StreamedResult:
+    """스트림을 메모리 내 NumPy 구조화 배열로 조립"""
+    return _consume(chunks, lambda name, dtype, n: np.empty(n, dtype=dtype))
+
+
+def write_result(
+    chunks: Iterable[bt_pb2.BacktestResultChunk], directory: str | Path
+) -> StreamedResult:
+    """스트림을 디렉터리의 .npy 파일(memmap)에 직접 기록"""
+    path = Path(directory)
+    path.mkdir(parents=True, exist_ok=True)
+    files = {"trades": _TRADES_FILE, "equity": _EQUITY_FILE}
+
+    def allocate(name: str, dtype: np.dtype, n: int) -> np.ndarray:
+        return np.lib.format.open_memmap(path / files[name], mode="w+", dtype=dtype, shape=(n,))
+
+    result = _consume(chunks, allocate)
+    for array in (result.trades, result.equity):
+        if isinstance(array, np.memmap):
+            array.flush()
+    (path / _HEADER_FILE).write_bytes(result.header.SerializeToString())
+    (path / _SYMBOLS_FILE).write_text(json.dumps(result.symbols), encoding="utf-8")
+    return result
+
+
+def load_result(directory: str | Path, mmap: bool = True) -> StreamedResult:
+    """write_result 로 기록한 결과 읽기"""
+    path = Path(directory)
+    mode = "r" if mmap else None
+    return StreamedResult(
+        header=bt_pb2.BacktestResultHeader.FromString((path / _HEADER_FILE).read_bytes()),
+        trades=np.load(path / _TRADES_FILE, mmap_mode=mode),
+        equity=np.load(path / _EQUITY_FILE, mmap_mode=mode),
+        symbols=json.loads((path / _SYMBOLS_FILE).read_text(encoding="utf-8")),
+    )
@@ -0,0 +1,271 @@
+"""
+완료된 백테스트의 거래 조회 인덱스 모듈 (QueryTrades).
+
+거래 탐색 UI 가 BacktestResultResponse.trades 전체를 내려받지 않도록, 서버가 완료된 결과의
+거래 배열(TRADE_DTYPE)에 한 번 인덱스를 만들고 시간 구간 / side / 심볼 / pnl 조건에 맞는
+거래만 정렬해 페이지 단위로 돌려줍니다.
+
+- 인덱스: 정렬 키/방향별 안정 정렬 순열(동률은 체결 순서)을 처음 사용할 때 한 번 계산해 보관
+  (거래 결과는 완료 후 바뀌지 않으므로 재계산 없음)
+- 시간 구간: 체결 시각 순열에서 이진 탐색 (TIMESTAMP 정렬이면 구간 안만 훑음)
+- 페이지: 순열을 블록 단위로 훑으며 조건을 벡터 연산으로 평가, limit + 1 개를 찾으면 중단
+  (깊은 페이지도 커서 위치부터 시작하므로 비용이 페이지 깊이와 무관)
+- page_token: 마지막으로 반환한 거래의 체결 순서 + 백테스트/필터/정렬 지문 (다른 조건으로 재사용 방지)
+
+서버:
+    index = TradeIndex(result.trades, result.symbols, backtest_id)   # 완료 시 또는 첫 조회 시
+    response = index.query(request)
+
+클라이언트:
+    request = bt_pb2.QueryTradesRequest(
+        backtest_id=bid, user_id=uid, side=bt_pb2.TRADE_SIDE_SELL, max_pnl=0.0,
+        sort_by=bt_pb2.TRADE_SORT_FIELD_PNL, limit=500,
+    )
+    for trade in iter_trades(stub, request):
+        print(trade.timestamp.ToDatetime(), trade.pnl)
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import struct
+from collections.abc import Iterator, Sequence
+
+import numpy as np
+
+from ..protos.services.backtest.v1 import backtest_service_pb2 as bt_pb2
+from ..protos.services.backtest.v1 import backtest_service_pb2_grpc as bt_grpc
+from .columnar import trade_columns
+from .stream import SIDE_CODES, SIDE_NAMES
+
+DEFAULT_LIMIT = 1000
+MAX_LIMIT = 10_000
+# 첫 블록 크기 (조건에 맞는 거래가 드물면 블록마다 두 배)
+_SCAN_BLOCK = 4096
+
+_TOKEN_VERSION = 1
+# version(1B) + 필터/정렬 지문(8B) + 마지막 거래의 체결 순서(8B)
+_TOKEN = struct.Struct(">B8sq")
+
+_SORT_COLUMNS = {
+    bt_pb2.TRADE_SORT_FIELD_TIMESTAMP: "timestamp",
+    bt_pb2.TRADE_SORT_FIELD_PNL: "pnl",
+    bt_pb2.TRADE_SORT_FIELD_QUANTITY: "quantity",
+    bt_pb2.TRADE_SORT_FIELD_PRICE: "price",
+    bt_pb2.TRADE_SORT_FIELD_PORTFOLIO_VALUE: "portfolio_value",
+}
+_SIDE_FILTERS = {
+    bt_pb2.TRADE_SIDE_BUY: SIDE_CODES["BUY"],
+    bt_pb2.TRADE_SIDE_SELL: SIDE_CODES["SELL"],
+}
+
+
+def _sort_field(request: bt_pb2.QueryTradesRequest) -> int:
+    if not request.sort_by:
+        return bt_pb2.TRADE_SORT_FIELD_TIMESTAMP
+    if request.sort_by not in _SORT_COLUMNS:
+        raise ValueError(f"지원하지 않는 sort_by 입니다: {request.sort_by}")
+    return request.sort_by
+
+
+def _limit(request: bt_pb2.QueryTradesRequest) -> int:
+    if not request.HasField("limit"):
+        return DEFAULT_LIMIT
+    if request.limit <= 0:
+        raise ValueError(f"limit 는 양수여야 합니다: {request.limit}")
+    return min(request.limit, MAX_LIMIT)
+
+
+def _fingerprint(request: bt_pb2.QueryTradesRequest) -> bytes:
+    """토큰을 발급한 요청의 백테스트/필터/정렬 지문"""
+    query = bt_pb2.QueryTradesRequest()
+    query.CopyFrom(request)
+    for name in ("user_id", "limit", "page_token", "encoding", "include_total_count"):
+        query.ClearField(name)
+    query.sort_by = _sort_field(request)
+    payload = query.SerializeToString(deterministic=True)
+    return hashlib.blake2b(payload, digest_size=8).digest()
+
+
+def encode_page_token(position: int, request: bt_pb2.QueryTradesRequest) -> str:
+    """마지막으로 반환한 거래의 체결 순서를 불투명 page_token 으로 인코딩"""
+    raw = _TOKEN.pack(_TOKEN_VERSION, _fingerprint(request), position)
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_page_token(token: str, request: bt_pb2.QueryTradesRequest) -> int:
+    """page_token 을 마지막 거래의 체결 순서로 디코딩 (형식/조건 불일치 시 ValueError)"""
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        version, fingerprint, position = _TOKEN.unpack(raw)
+    except (ValueError, struct.error) as e:
+        raise ValueError(f"잘못된 page_token 입니다: {token}") from e
+    if version != _TOKEN_VERSION:
+        raise ValueError(f"지원하지 않는 page_token 버전입니다: {version}")
+    if fingerprint != _fingerprint(request):
+        raise ValueError("page_token 을 발급한 요청과 조건이 다릅니다")
+    return position
+
+
+class TradeIndex:
+    """한 백테스트의 거래 배열(TRADE_DTYPE, symbol 은 symbols 인덱스)에 대한 조회 인덱스"""
+
+    def __init__(self, trades: np.ndarray, symbols: Sequence[str], backtest_id: str = "") -> None:
+        self.trades = trades
+        self.symbols = list(symbols)
+        self.backtest_id = backtest_id
+        # (정렬 키, 내림차순) 별 순열과 역순열, 동률은 체결 순서
+        self._orders: dict[tuple[str, bool], np.ndarray] = {}
+        self._ranks: dict[tuple[str, bool], np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self.trades)
+
+    def _order(self, column: str, descending: bool = False) -> np.ndarray:
+        order = self._orders.get((column, descending))
+        if order is None:
+            values = self.trades[column]
+            if not descending and np.all(values[1:] >= values[:-1]):
+                order = np.arange(len(values))
+            elif not descending:
+                order = np.argsort(values, kind="stable")
+            else:
+                # 뒤집은 배열의 안정 정렬을 다시 뒤집으면 값 내림차순 + 동률은 체결 순서
+                order = len(values) - 1 - np.argsort(values[::-1], kind="stable")[::-1]
+            self._orders[(column, descending)] = order
+        return order
+
+    def _rank(self, column: str, descending: bool) -> np.ndarray:
+        rank = self._ranks.get((column, descending))
+        if rank is None:
+            order = self._order(column, descending)
+            rank = np.empty_like(order)
+            rank[order] = np.arange(len(order))
+            self._ranks[(column, descending)] = rank
+        return rank
+
+    def _time_bounds(self, request: bt_pb2.QueryTradesRequest) -> tuple[int, int]:
+        """시간 구간에 속하는 거래의 체결 시각 순위 범위 [lo, hi)"""
+        times = self.trades["timestamp"][self._order("timestamp")]
+        lo, hi = 0, len(times)
+        if request.HasField("start_time"):
+            lo = int(np.searchsorted(times, request.start_time.ToNanoseconds(), "left"))
+        if request.HasField("end_time"):
+            hi = int(np.searchsorted(times, request.end_time.ToNanoseconds(), "left"))
+        return lo, max(lo, hi)
+
+    def _matches(
+        self, positions: np.ndarray, request: bt_pb2.QueryTradesRequest, check_time: bool
+    ) -> np.ndarray:
+        """positions 거래 중 조건에 맞는 것의 마스크"""
+        rows = self.trades[positions]
+        mask = np.ones(len(rows), dtype=bool)
+        if check_time and request.HasField("start_time"):
+            mask &= rows["timestamp"] >= request.start_time.ToNanoseconds()
+        if check_time and request.HasField("end_time"):
+            mask &= rows["timestamp"] < request.end_time.ToNanoseconds()
+        if request.side:
+            mask &= rows["side"] == _SIDE_FILTERS.get(request.side, 0)
+        if request.symbols:
+            wanted = set(request.symbols)
+            codes = [i for i, symbol in enumerate(self.symbols) if symbol in wanted]
+            mask &= np.isin(rows["symbol"], codes)
+        if request.HasField("min_pnl"):
+            mask &= rows["pnl"] >= request.min_pnl
+        if request.HasField("max_pnl"):
+            mask &= rows["pnl"] <= request.max_pnl
+        return mask
+
+    def count(self, request: bt_pb2.QueryTradesRequest) -> int:
+        """조건에 맞는 거래 수"""
+        lo, hi = self._time_bounds(request)
+        positions = self._order("timestamp")[lo:hi]
+        return int(self._matches(positions, request, check_time=False).sum())
+
+    def query(self, request: bt_pb2.QueryTradesRequest) -> bt_pb2.QueryTradesResponse:
+        """요청의 page_token 위치부터 조건에 맞는 거래 한 페이지"""
+        if (
+            request.HasField("min_pnl")
+            and request.HasField("max_pnl")
+            and request.min_pnl > request.max_pnl
+        ):
+            raise ValueError(f"min_pnl 이 max_pnl 보다 큽니다: {request.min_pnl} > {request.max_pnl}")
+        limit = _limit(request)
+        column = _SORT_COLUMNS[_sort_field(request)]
+        descending = request.descending
+        order = self._order(column, descending)
+        # 순열에서 훑을 순위 범위 [first, stop), TIMESTAMP 정렬은 시간 구간으로 좁힘
+        by_time = column == "timestamp"
+        first, stop = 0, len(order)
+        if by_time:
+            lo, hi = self._time_bounds(request)
+            first, stop = (len(order) - hi, len(order) - lo) if descending else (lo, hi)
+        if request.page_token:
+            rank = int(self._rank(column, descending)[self._position(request)])
+            first = max(first, rank + 1)
+
+        found: list[np.ndarray] = []
+        total = 0
+        block = max(_SCAN_BLOCK, limit + 1)
+        while first < stop and total <= limit:
+            positions = order[first : min(stop, first + block)]
+            first += len(positions)
+            positions = positions[self._matches(positions, request, check_time=not by_time)]
+            found.append(positions)
+            total += len(positions)
+            block *= 2
+        matches = np.concatenate(found) if found else np.zeros(0, dtype=np.int64)
+
+        page = matches[:limit]
+        response = bt_pb2.QueryTradesResponse(backtest_id=self.backtest_id)
+        response.trade_index.extend(page.tolist())
+        self._fill(response, page, request.encoding)
+        if len(matches) > limit:
+            response.next_page_token = encode_page_token(int(page[-1]), request)
+        if not request.HasField("include_total_count") or request.include_total_count:
+            response.total_count = self.count(request)
+        return response
+
+    def _position(self, request: bt_pb2.QueryTradesRequest) -> int:
+        position = decode_page_token(request.page_token, request)
+        if not 0 <= position < len(self.trades):
+            raise ValueError(f"page_token 이 이 백테스트의 거래를 가리키지 않습니다: {position}")
+        return position
+
+    def _fill(
+        self, response: bt_pb2.QueryTradesResponse, positions: np.ndarray, encoding: int
+    ) -> None:
+        rows = self.trades[positions]
+        if encoding == bt_pb2.RESULT_ENCODING_COLUMNAR:
+            response.trade_columns.CopyFrom(trade_columns(rows, self.symbols))
+            return
+        for row in rows:
+            trade = response.trades.add(
+                symbol=self.symbols[row["symbol"]],
+                side=SIDE_NAMES[int(row["side"])],
+                quantity=float(row["quantity"]),
+                price=float(row["price"]),
+                pnl=float(row["pnl"]),
+                commission=float(row["commission"]),
+                portfolio_value=float(row["portfolio_value"]),
+            )
+            trade.timestamp.FromNanoseconds(int(row["timestamp"]))
+
+
+def iter_trades(
+    stub: bt_grpc.BacktestServiceStub,
+    request: bt_pb2.QueryTradesRequest,
+    timeout: float | None = None,
+) -> Iterator[bt_pb2.Trade]:
+    """QueryTrades 페이지를 따라가며 거래 순회 (행 형식, 다음 페이지부터 total_count 생략)"""
+    page_request = bt_pb2.QueryTradesRequest()
+    page_request.CopyFrom(request)
+    page_request.ClearField("encoding")
+    while True:
+        page = stub.QueryTrades(page_request, timeout=timeout)
+        yield from page.trades
+        if not page.next_page_token:
+            return
+        page_request.page_token = page.next_page_token
+        page_request.include_total_count = False
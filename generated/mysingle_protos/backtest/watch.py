@@ -0,0 +1,303 @@
+"""
+다중 백테스트 진행 상황 감시(WatchBacktests) 모듈.
+
+여러 백테스트의 ProgressUpdate 를 하나의 양방향 스트림으로 다중화합니다.
+백테스트별로 스트림을 여는 대신 스트림 하나가 구독 집합(ID 목록 또는 user/strategy 필터)을
+유지하고, 백테스트별 최신 이벤트만 남기는 coalescing 으로 min_interval_ms 마다 묶어 전송합니다.
+클라이언트가 요청 스트림을 닫아도(half-close) ID 로 구독한 백테스트가 모두 종료 이벤트를 받을
+때까지 전송을 계속합니다 (필터 구독이 남아 있으면 RPC 취소 시까지).
+
+서버:
+    hub = ProgressHub()
+    hub.register(backtest_id, user_id=uid, strategy_id=sid)
+    hub.publish(backtest_id, bt_pb2.ProgressUpdate(status="running", progress_pct=12.5))
+
+    async def WatchBacktests(self, request_iterator, context):
+        async for response in BacktestWatch(hub).serve(request_iterator):
+            yield response
+
+클라이언트:
+    requests = asyncio.Queue()
+    await requests.put(bt_pb2.WatchBacktestsRequest(user_id=uid, add_backtest_ids=ids))
+    async for response in stub.WatchBacktests(queue_iterator(requests)):
+        for update in response.updates:
+            print(update.backtest_id, update.progress_pct)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
+
+from ..protos.services.backtest.v1 import backtest_service_pb2 as bt_pb2
+from .progress import TERMINAL_STATUSES, ProgressLog, ProgressOptions, _with_metrics_policy
+
+DEFAULT_MIN_INTERVAL_MS = 250
+# 스트림 하나가 명시적으로 구독할 수 있는 최대 백테스트 수
+MAX_WATCHED = 10_000
+
+Listener = Callable[["WatchedJob", "bt_pb2.ProgressUpdate | None"], None]
+
+
+@dataclass
+class WatchedJob:
+    """허브에 등록된 백테스트와 소유 정보"""
+
+    backtest_id: str
+    user_id: str
+    strategy_id: str
+    log: ProgressLog
+
+
+class ProgressHub:
+    """서버 전역 진행 로그 레지스트리 (이벤트 루프 스레드에서 사용)"""
+
+    def __init__(self, capacity: int = 1024) -> None:
+        self._capacity = capacity
+        self._jobs: dict[str, WatchedJob] = {}
+        self._listeners: list[Listener] = []
+
+    def register(
+        self,
+        backtest_id: str,
+        user_id: str,
+        strategy_id: str = "",
+        last_update: bt_pb2.ProgressUpdate | None = None,
+    ) -> ProgressLog:
+        """백테스트 등록 (필터 구독 중인 스트림에 새 백테스트로 알림, last_update 는 재개 시점 이벤트)"""
+        if backtest_id in self._jobs:
+            raise ValueError(f"이미 등록된 백테스트입니다: {backtest_id}")
+        job = WatchedJob(
+            backtest_id,
+            user_id,
+            strategy_id,
+            ProgressLog(backtest_id, self._capacity, last_update),
+        )
+        self._jobs[backtest_id] = job
+        for listener in list(self._listeners):
+            listener(job, None)
+        return job.log
+
+    def unregister(self, backtest_id: str) -> None:
+        """백테스트 제거 (결과 보관 기간 종료 등)"""
+        self._jobs.pop(backtest_id, None)
+
+    def get(self, backtest_id: str) -> WatchedJob | None:
+        """등록된 백테스트 조회"""
+        return self._jobs.get(backtest_id)
+
+    def jobs(self, user_id: str, strategy_id: str | None = None) -> list[WatchedJob]:
+        """사용자(및 전략)의 등록된 백테스트"""
+        return [
+            job
+            for job in self._jobs.values()
+            if job.user_id == user_id and (strategy_id is None or job.strategy_id == strategy_id)
+        ]
+
+    def publish(self, backtest_id: str, update: bt_pb2.ProgressUpdate) -> bt_pb2.ProgressUpdate:
+        """진행 이벤트 기록 후 구독 스트림에 전달"""
+        job = self._jobs.get(backtest_id)
+        if job is None:
+            raise KeyError(f"등록되지 않은 백테스트입니다: {backtest_id}")
+        stored = job.log.publish(update)
+        for listener in list(self._listeners):
+            listener(job, stored)
+        return stored
+
+    def add_listener(self, listener: Listener) -> None:
+        """등록/진행 이벤트 리스너 추가"""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Listener) -> None:
+        """리스너 제거"""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+
+class BacktestWatch:
+    """WatchBacktests 스트림 하나의 구독 상태와 백테스트별 coalescing"""
+
+    def __init__(
+        self,
+        hub: ProgressHub,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._hub = hub
+        self._clock = clock
+        self._user_id: str | None = None
+        self._ids: set[str] = set()
+        self._strategy_ids: set[str] = set()
+        self._watch_all = False
+        self._options = ProgressOptions(min_interval_ms=DEFAULT_MIN_INTERVAL_MS)
+        # 백테스트별 아직 보내지 않은 최신 이벤트와 전송 횟수
+        self._pending: dict[str, bt_pb2.ProgressUpdate] = {}
+        self._sent: dict[str, int] = {}
+        self._wake = asyncio.Event()
+        self._last_flush = -float("inf")
+
+    @property
+    def watching(self) -> list[str]:
+        """현재 구독 중인 백테스트 ID (필터 매칭 포함)"""
+        ids = set(self._ids)
+        if self._user_id is not None and (self._watch_all or self._strategy_ids):
+            # 필터는 진행 중인 백테스트에만 적용 (종료된 백테스트는 ID 로 명시 구독)
+            ids.update(
+                job.backtest_id
+                for job in self._hub.jobs(self._user_id)
+                if self._matches(job) and not job.log.finished
+            )
+        return sorted(ids)
+
+    def _matches(self, job: WatchedJob) -> bool:
+        if job.user_id != self._user_id:
+            return False
+        return (
+            job.backtest_id in self._ids
+            or self._watch_all
+            or job.strategy_id in self._strategy_ids
+        )
+
+    def _snapshot(self, job: WatchedJob) -> None:
+        """구독 시점의 최신 이벤트를 보류 목록에 추가"""
+        latest = job.log.since(job.log.last_seq - 1)
+        if latest:
+            self._pending[job.backtest_id] = latest[-1]
+
+    def apply(self, request: bt_pb2.WatchBacktestsRequest) -> bt_pb2.WatchBacktestsResponse:
+        """구독 변경 요청 적용 후 확인 응답 반환"""
+        if self._user_id is None:
+            if not request.user_id:
+                raise ValueError("첫 요청에는 user_id 가 필요합니다")
+            self._user_id = request.user_id
+        elif request.user_id and request.user_id != self._user_id:
+            raise ValueError(f"스트림의 user_id 를 변경할 수 없습니다: {request.user_id}")
+
+        if request.HasField("min_interval_ms") or request.HasField("metrics_every_n"):
+            self._options = ProgressOptions(
+                min_interval_ms=max(request.min_interval_ms, 0)
+                if request.HasField("min_interval_ms")
+                else self._options.min_interval_ms,
+                metrics_every_n=max(request.metrics_every_n, 1)
+                if request.HasField("metrics_every_n")
+                else self._options.metrics_every_n,
+            )
+
+        if request.clear_filters:
+            self._watch_all = False
+            self._strategy_ids.clear()
+        if request.watch_all:
+            self._watch_all = True
+        if request.HasField("strategy_id") and request.strategy_id:
+            self._strategy_ids.add(request.strategy_id)
+
+        for backtest_id in request.remove_backtest_ids:
+            self._ids.discard(backtest_id)
+
+        not_found = []
+        for backtest_id in request.add_backtest_ids:
+            job = self._hub.get(backtest_id)
+            # 다른 사용자의 백테스트는 존재 여부를 드러내지 않음
+            if job is None or job.user_id != self._user_id:
+                not_found.append(backtest_id)
+                continue
+            self._ids.add(backtest_id)
+        if len(self._ids) > MAX_WATCHED:
+            raise ValueError(f"구독 백테스트 수가 최대치({MAX_WATCHED})를 초과합니다")
+
+        # 구독 해제된 백테스트의 보류 이벤트는 버리고, 새로 매칭된 백테스트는 현재 상태를 전달
+        watching = self.watching
+        current = set(watching)
+        for backtest_id in list(self._pending):
+            if backtest_id not in current:
+                del self._pending[backtest_id]
+        for backtest_id in watching:
+            if backtest_id not in self._sent and backtest_id not in self._pending:
+                job = self._hub.get(backtest_id)
+                if job is not None:
+                    self._snapshot(job)
+        if self._pending:
+            self._wake.set()
+        return bt_pb2.WatchBacktestsResponse(watching=watching, not_found=not_found)
+
+    def _done(self) -> bool:
+        """ID 구독이 모두 종료 이벤트를 받았고 필터 구독과 보류 이벤트가 없는지"""
+        if self._pending or self._watch_all or self._strategy_ids:
+            return False
+        # 허브에서 제거된 백테스트는 종료 이벤트가 오지 않으므로 기다리지 않음
+        return all(self._hub.get(backtest_id) is None for backtest_id in self._ids)
+
+    def _on_event(self, job: WatchedJob, update: bt_pb2.ProgressUpdate | None) -> None:
+        if self._user_id is None or not self._matches(job):
+            return
+        if update is None:
+            # 새 백테스트 등록: 첫 이벤트부터 필터 매칭으로 전달됨
+            return
+        # 같은 배치 안에서는 백테스트별 최신 이벤트만 남음 (종료 이벤트는 항상 마지막)
+        self._pending[job.backtest_id] = update
+        self._wake.set()
+
+    def drain(self) -> bt_pb2.WatchBacktestsResponse:
+        """보류 중인 백테스트별 최신 이벤트를 한 배치로 반환"""
+        response = bt_pb2.WatchBacktestsResponse()
+        for backtest_id in sorted(self._pending):
+            update = self._pending[backtest_id]
+            sent = self._sent.get(backtest_id, 0)
+            response.updates.append(_with_metrics_policy(update, sent, self._options))
+            self._sent[backtest_id] = sent + 1
+            if update.status in TERMINAL_STATUSES:
+                # 종료된 백테스트는 구독 상태에서 정리
+                self._ids.discard(backtest_id)
+                del self._sent[backtest_id]
+        self._pending.clear()
+        self._last_flush = self._clock()
+        return response
+
+    async def serve(
+        self, requests: AsyncIterator[bt_pb2.WatchBacktestsRequest]
+    ) -> AsyncIterator[bt_pb2.WatchBacktestsResponse]:
+        """요청 스트림을 적용하며 확인 응답과 coalescing 배치를 생성"""
+        # 클라이언트가 요청 스트림을 닫으면 구독한 백테스트가 모두 종료될 때까지 계속 전송
+        acks: asyncio.Queue[bt_pb2.WatchBacktestsResponse | BaseException] = asyncio.Queue()
+        closed = False
+
+        async def read() -> None:
+            nonlocal closed
+            try:
+                async for request in requests:
+                    acks.put_nowait(self.apply(request))
+                    self._wake.set()
+            except (ValueError, KeyError) as e:
+                acks.put_nowait(e)
+            finally:
+                closed = True
+                self._wake.set()
+
+        self._hub.add_listener(self._on_event)
+        reader = asyncio.ensure_future(read())
+        try:
+            while True:
+                timeout = None
+                if self._pending:
+                    interval = self._options.min_interval_ms / 1000.0
+                    timeout = max(0.0, self._last_flush + interval - self._clock())
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+                self._wake.clear()
+
+                while not acks.empty():
+                    ack = acks.get_nowait()
+                    if isinstance(ack, BaseException):
+                        raise ack
+                    yield ack
+                interval = self._options.min_interval_ms / 1000.0
+                if self._pending and self._clock() >= self._last_flush + interval:
+                    yield self.drain()
+                if closed and self._done():
+                    return
+        finally:
+            reader.cancel()
+            self._hub.remove_listener(self._on_event)
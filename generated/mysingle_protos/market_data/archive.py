@@ -0,0 +1,302 @@
+"""
+SymbolOHLCVData 대량 스냅샷 아카이브 포맷.
+
+길이 접두(varint) 직렬화 메시지를 블록 단위로 기록하고, 파일 끝에 심볼 → 위치 인덱스를
+둡니다. 블록은 선택적으로 압축(zlib / lzma)되며, 리더는 파일을 mmap 으로 열어 요청한
+심볼이 속한 블록만 해제/디코딩합니다.
+
+파일 레이아웃:
+    header  : MAGIC(8) | version(u16) | compression(u16) | reserved(u32)
+    blocks  : [block payload] ...   (payload = varint(len) + message 의 연속)
+    index   : entry ...             (entry = u16 len + symbol + u64 block_offset
+                                     + u32 block_length + u32 raw_length
+                                     + u32 record_offset + u32 record_length)
+    footer  : u64 index_offset | u64 index_length | u32 entry_count | MAGIC(8)
+
+사용 예시:
+    with ArchiveWriter("snapshot.msa", compression="zlib") as writer:
+        for item in batch_response.data:
+            writer.write(item)
+
+    with ArchiveReader("snapshot.msa") as reader:
+        aapl, msft = reader.read(["AAPL", "MSFT"])
+"""
+
+from __future__ import annotations
+
+import lzma
+import mmap
+import struct
+import zlib
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+from ..protos.services.market_data.v1 import market_data_service_pb2 as md_pb2
+
+MAGIC = b"MSOHLCV\x01"
+VERSION = 1
+
+_HEADER = struct.Struct("<8sHHI")
+_FOOTER = struct.Struct("<QQI8s")
+_ENTRY = struct.Struct("<QIIII")
+_SYMBOL_LEN = struct.Struct("<H")
+
+COMPRESSION_CODES = {"none": 0, "zlib": 1, "lzma": 2}
+_COMPRESSION_NAMES = {code: name for name, code in COMPRESSION_CODES.items()}
+
+
+def _compress(payload: bytes, compression: str, level: int | None) -> bytes:
+    if compression == "zlib":
+        return zlib.compress(payload, 6 if level is None else level)
+    if compression == "lzma":
+        return lzma.compress(payload, preset=6 if level is None else level)
+    return payload
+
+
+def _decompress(payload: bytes | memoryview, compression: str) -> bytes | memoryview:
+    if compression == "zlib":
+        return zlib.decompress(payload)
+    if compression == "lzma":
+        return lzma.decompress(payload)
+    return payload
+
+
+def _encode_varint(value: int) -> bytes:
+    out = bytearray()
+    while True:
+        bits = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(bits | 0x80)
+        else:
+            out.append(bits)
+            return bytes(out)
+
+
+def _decode_varint(buffer: bytes | memoryview, position: int) -> tuple[int, int]:
+    result = 0
+    shift = 0
+    while True:
+        byte = buffer[position]
+        position += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, position
+        shift += 7
+
+
+@dataclass(frozen=True)
+class IndexEntry:
+    """심볼 하나의 아카이브 내 위치"""
+
+    block_offset: int
+    block_length: int
+    raw_length: int
+    record_offset: int
+    record_length: int
+
+
+class ArchiveWriter:
+    """SymbolOHLCVData 아카이브 작성기"""
+
+    def __init__(
+        self,
+        path: str | Path,
+        compression: str = "none",
+        block_size: int = 1 << 16,
+        level: int | None = None,
+    ) -> None:
+        if compression not in COMPRESSION_CODES:
+            raise ValueError(f"지원하지 않는 압축 방식: {compression}")
+        self.path = Path(path)
+        self.compression = compression
+        self.block_size = block_size
+        self.level = level
+        self._file = self.path.open("wb")
+        self._file.write(_HEADER.pack(MAGIC, VERSION, COMPRESSION_CODES[compression], 0))
+        self._block = bytearray()
+        self._pending: list[tuple[str, int, int]] = []
+        self._index: dict[str, IndexEntry] = {}
+        self._symbols: set[str] = set()
+        self._closed = False
+
+    def __enter__(self) -> ArchiveWriter:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self._file.close()
+
+    def write(self, data: md_pb2.SymbolOHLCVData) -> None:
+        """심볼 데이터 한 건 기록"""
+        self.write_serialized(data.symbol, data.SerializeToString())
+
+    def write_serialized(self, symbol: str, payload: bytes) -> None:
+        """이미 직렬화된 SymbolOHLCVData 기록"""
+        if symbol in self._symbols:
+            raise ValueError(f"중복 심볼: {symbol}")
+        self._symbols.add(symbol)
+        offset = len(self._block)
+        self._block += _encode_varint(len(payload))
+        self._block += payload
+        self._pending.append((symbol, offset, len(self._block) - offset))
+        if len(self._block) >= self.block_size:
+            self._flush_block()
+
+    def _flush_block(self) -> None:
+        if not self._pending:
+            return
+        raw = bytes(self._block)
+        stored = _compress(raw, self.compression, self.level)
+        block_offset = self._file.tell()
+        self._file.write(stored)
+        for symbol, record_offset, record_length in self._pending:
+            self._index[symbol] = IndexEntry(
+                block_offset, len(stored), len(raw), record_offset, record_length
+            )
+        self._block = bytearray()
+        self._pending = []
+
+    def close(self) -> None:
+        """마지막 블록, 인덱스, footer 기록"""
+        if self._closed:
+            return
+        self._flush_block()
+        index_offset = self._file.tell()
+        chunks: list[bytes] = []
+        for symbol, entry in self._index.items():
+            encoded = symbol.encode("utf-8")
+            chunks.append(_SYMBOL_LEN.pack(len(encoded)))
+            chunks.append(encoded)
+            chunks.append(
+                _ENTRY.pack(
+                    entry.block_offset,
+                    entry.block_length,
+                    entry.raw_length,
+                    entry.record_offset,
+                    entry.record_length,
+                )
+            )
+        index = b"".join(chunks)
+        self._file.write(index)
+        self._file.write(_FOOTER.pack(index_offset, len(index), len(self._index), MAGIC))
+        self._file.close()
+        self._closed = True
+
+
+class ArchiveReader:
+    """mmap 기반 SymbolOHLCVData 아카이브 리더 (요청 심볼만 디코딩)"""
+
+    def __init__(self, path: str | Path, block_cache_size: int = 8) -> None:
+        self.path = Path(path)
+        self._file = self.path.open("rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map)
+        self._blocks: OrderedDict[int, bytes | memoryview] = OrderedDict()
+        self._block_cache_size = block_cache_size
+        self.compression = "none"
+        try:
+            self._index = self._open()
+        except BaseException:
+            self.close()
+            raise
+
+    def _open(self) -> dict[str, IndexEntry]:
+        """header/footer 검증 후 인덱스 로드 (형식 오류 시 ValueError)"""
+        if len(self._map) < _HEADER.size + _FOOTER.size:
+            raise ValueError(f"아카이브 파일이 너무 짧습니다: {self.path}")
+        magic, version, compression, _ = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            raise ValueError(f"아카이브 파일이 아닙니다: {self.path}")
+        if version != VERSION:
+            raise ValueError(f"지원하지 않는 아카이브 버전: {version}")
+        if compression not in _COMPRESSION_NAMES:
+            raise ValueError(f"지원하지 않는 압축 코드: {compression}")
+        self.compression = _COMPRESSION_NAMES[compression]
+
+        index_offset, index_length, count, tail = _FOOTER.unpack_from(
+            self._map, len(self._map) - _FOOTER.size
+        )
+        if tail != MAGIC:
+            raise ValueError(f"손상된 아카이브 footer: {self.path}")
+        if index_offset + index_length > len(self._map) - _FOOTER.size:
+            raise ValueError(f"손상된 아카이브 인덱스: {self.path}")
+        return self._read_index(index_offset, index_length, count)
+
+    def _read_index(self, offset: int, length: int, count: int) -> dict[str, IndexEntry]:
+        index: dict[str, IndexEntry] = {}
+        position = offset
+        end = offset + length
+        while position < end and len(index) < count:
+            (size,) = _SYMBOL_LEN.unpack_from(self._map, position)
+            position += _SYMBOL_LEN.size
+            symbol = bytes(self._view[position : position + size]).decode("utf-8")
+            position += size
+            index[symbol] = IndexEntry(*_ENTRY.unpack_from(self._map, position))
+            position += _ENTRY.size
+        return index
+
+    def __enter__(self) -> ArchiveReader:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, symbol: object) -> bool:
+        return symbol in self._index
+
+    def __iter__(self) -> Iterator[md_pb2.SymbolOHLCVData]:
+        # 블록 순서대로 읽어 블록 해제를 한 번씩만 수행
+        for symbol in sorted(self._index, key=lambda s: self._index[s].block_offset):
+            yield self.get(symbol)
+
+    def symbols(self) -> list[str]:
+        """아카이브에 포함된 심볼 목록"""
+        return list(self._index)
+
+    def _block(self, entry: IndexEntry) -> bytes | memoryview:
+        block = self._blocks.get(entry.block_offset)
+        if block is not None:
+            self._blocks.move_to_end(entry.block_offset)
+            return block
+        stored = self._view[entry.block_offset : entry.block_offset + entry.block_length]
+        block = _decompress(stored, self.compression)
+        if self.compression != "none":
+            self._blocks[entry.block_offset] = block
+            while len(self._blocks) > self._block_cache_size:
+                self._blocks.popitem(last=False)
+        return block
+
+    def get_serialized(self, symbol: str) -> bytes:
+        """심볼의 직렬화된 SymbolOHLCVData 반환"""
+        entry = self._index[symbol]
+        block = self._block(entry)
+        length, start = _decode_varint(block, entry.record_offset)
+        return bytes(block[start : start + length])
+
+    def get(self, symbol: str) -> md_pb2.SymbolOHLCVData:
+        """심볼 하나 디코딩"""
+        return md_pb2.SymbolOHLCVData.FromString(self.get_serialized(symbol))
+
+    def read(self, symbols: Iterable[str]) -> list[md_pb2.SymbolOHLCVData]:
+        """여러 심볼을 요청 순서대로 디코딩 (같은 블록은 한 번만 해제)"""
+        wanted = list(symbols)
+        order = sorted(range(len(wanted)), key=lambda i: self._index[wanted[i]].block_offset)
+        result: list[md_pb2.SymbolOHLCVData | None] = [None] * len(wanted)
+        for i in order:
+            result[i] = self.get(wanted[i])
+        return result
+
+    def close(self) -> None:
+        """mmap 및 파일 닫기"""
+        self._blocks.clear()
+        self._view.release()
+        self._map.close()
+        self._file.close()
@@ -0,0 +1,357 @@
+"""
+OHLCV 데이터 품질 검사 모듈.
+
+OHLCVResponse / SymbolOHLCVData 목록 전체를 하나의 평탄화된 배열로 모아
+단일 벡터화 패스로 다음 항목을 검사합니다.
+
+- 누락 세션(gap, 거래일 캘린더 기준)
+- 중복 타임스탬프
+- 역순(non-monotonic) 타임스탬프
+- high < low 봉
+- 종가 로그수익률 robust z-score (심볼별 중앙값/MAD) 스파이크
+
+사용 예시:
+    report = scan(batch_response.data)
+    for item in report.flagged():
+        print(item.symbol, item.missing_sessions, item.spikes)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from ..protos.services.market_data.v1 import market_data_service_pb2 as md_pb2
+from .resample import Interval, parse_timestamps
+
+ISSUE_KINDS = (
+    "missing_sessions",
+    "duplicates",
+    "non_monotonic",
+    "high_below_low",
+    "spikes",
+)
+
+_WEEK_ORIGIN = np.datetime64("1970-01-05", "D")
+# 정규분포에서 MAD 를 표준편차로 환산하는 계수 (sigma ~= MAD / 0.6745)
+_MAD_TO_STD = 0.6744897501960817
+
+
+@dataclass(frozen=True)
+class TradingCalendar:
+    """거래일 캘린더 (weekmask: 월~일 7자리, holidays: YYYY-MM-DD)"""
+
+    weekmask: str = "1111100"
+    holidays: tuple[str, ...] = ()
+
+    def busdaycalendar(self) -> np.busdaycalendar:
+        """numpy 영업일 캘린더 생성"""
+        return np.busdaycalendar(weekmask=self.weekmask, holidays=list(self.holidays))
+
+
+# 주식 (월~금) / 24시간 시장 (암호화폐, 일부 외환)
+EQUITY_CALENDAR = TradingCalendar()
+ALWAYS_OPEN_CALENDAR = TradingCalendar(weekmask="1111111")
+
+
+@dataclass
+class SymbolQuality:
+    """심볼 하나의 품질 검사 결과"""
+
+    symbol: str
+    bars: int
+    missing_sessions: int = 0
+    duplicates: int = 0
+    non_monotonic: int = 0
+    high_below_low: int = 0
+    spikes: int = 0
+
+    @property
+    def ok(self) -> bool:
+        """이상 항목 없음 여부"""
+        return not any(getattr(self, kind) for kind in ISSUE_KINDS)
+
+
+@dataclass
+class QualityReport:
+    """유니버스 전체 품질 검사 결과 (심볼별 카운트 배열)"""
+
+    symbols: list[str]
+    bars: np.ndarray
+    counts: dict[str, np.ndarray]
+    offsets: np.ndarray
+    rows: dict[str, np.ndarray] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def __getitem__(self, symbol: str) -> SymbolQuality:
+        return self._item(self.symbols.index(symbol))
+
+    def _item(self, index: int) -> SymbolQuality:
+        return SymbolQuality(
+            symbol=self.symbols[index],
+            bars=int(self.bars[index]),
+            **{kind: int(self.counts[kind][index]) for kind in ISSUE_KINDS},
+        )
+
+    @property
+    def ok(self) -> bool:
+        """전체 유니버스 이상 없음 여부"""
+        return not any(self.counts[kind].any() for kind in ISSUE_KINDS)
+
+    def flagged(self) -> list[SymbolQuality]:
+        """이상 항목이 있는 심볼만 반환"""
+        mask = np.zeros(len(self.symbols), dtype=bool)
+        for kind in ISSUE_KINDS:
+            mask |= self.counts[kind] > 0
+        return [self._item(int(i)) for i in np.flatnonzero(mask)]
+
+    def positions(self, symbol: str, kind: str) -> np.ndarray:
+        """심볼 내 이상 봉 인덱스 (missing_sessions는 gap 직후 봉)"""
+        index = self.symbols.index(symbol)
+        start, end = self.offsets[index], self.offsets[index + 1]
+        rows = self.rows.get(kind, np.empty(0, dtype=np.int64))
+        return rows[(rows >= start) & (rows < end)] - start
+
+    def summary(self) -> dict[str, int]:
+        """항목별 전체 합계"""
+        totals = {kind: int(self.counts[kind].sum()) for kind in ISSUE_KINDS}
+        totals["symbols"] = len(self.symbols)
+        totals["flagged_symbols"] = len(self.flagged())
+        totals["bars"] = int(self.bars.sum())
+        return totals
+
+
+def _collect(
+    data: md_pb2.OHLCVResponse
+    | md_pb2.SymbolOHLCVData
+    | md_pb2.BatchGetDailyOHLCVResponse
+    | Iterable[md_pb2.OHLCVResponse | md_pb2.SymbolOHLCVData],
+) -> list[md_pb2.OHLCVResponse | md_pb2.SymbolOHLCVData]:
+    if isinstance(data, md_pb2.BatchGetDailyOHLCVResponse):
+        return list(data.data)
+    if isinstance(data, (md_pb2.OHLCVResponse, md_pb2.SymbolOHLCVData)):
+        return [data]
+    return list(data)
+
+
+def scan(
+    data: md_pb2.OHLCVResponse
+    | md_pb2.SymbolOHLCVData
+    | md_pb2.BatchGetDailyOHLCVResponse
+    | Iterable[md_pb2.OHLCVResponse | md_pb2.SymbolOHLCVData],
+    interval: str | Interval | None = None,
+    calendar: TradingCalendar = EQUITY_CALENDAR,
+    z_threshold: float = 5.0,
+) -> QualityReport:
+    """OHLCV 응답 목록의 품질 검사 (간격 미지정 시 응답의 interval, 없으면 1d)"""
+    series = _collect(data)
+    if interval is None:
+        interval = next(
+            (s.interval for s in series if isinstance(s, md_pb2.OHLCVResponse) and s.interval),
+            "1d",
+        )
+
+    # 검사에 필요한 필드만 심볼 단위로 추출 (메시지 필드 접근이 전체 비용의 대부분)
+    lengths = np.fromiter((len(s.bars) for s in series), dtype=np.int64, count=len(series))
+    prices = np.empty((int(lengths.sum()), 3), dtype=np.float64)
+    timestamps: list[str] = []
+    position = 0
+    for s, n in zip(series, lengths.tolist()):
+        bars = s.bars
+        if n:
+            prices[position : position + n] = [(b.high, b.low, b.close) for b in bars]
+            timestamps.extend([b.timestamp for b in bars])
+            position += n
+    stamps = parse_timestamps(timestamps)
+
+    return scan_arrays(
+        [s.symbol for s in series],
+        lengths,
+        stamps,
+        prices[:, 0],
+        prices[:, 1],
+        prices[:, 2],
+        interval if isinstance(interval, Interval) else Interval.parse(interval),
+        calendar,
+        z_threshold,
+    )
+
+
+def scan_arrays(
+    symbols: list[str],
+    lengths: np.ndarray,
+    timestamp: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    interval: Interval,
+    calendar: TradingCalendar = EQUITY_CALENDAR,
+    z_threshold: float = 5.0,
+) -> QualityReport:
+    """평탄화된 컬럼 배열(심볼별 연속 구간)에 대한 품질 검사"""
+    n_symbols = len(symbols)
+    offsets = np.concatenate(([0], np.cumsum(lengths))).astype(np.int64)
+    segment = np.repeat(np.arange(n_symbols), lengths)
+
+    # 역순은 수신 순서 그대로, 나머지 검사는 심볼 내 시간순 정렬 후 수행
+    adjacent = np.flatnonzero(segment[1:] == segment[:-1]) + 1
+    rows: dict[str, np.ndarray] = {
+        "non_monotonic": adjacent[timestamp[adjacent] < timestamp[adjacent - 1]],
+        "high_below_low": np.flatnonzero(high < low),
+    }
+
+    if rows["non_monotonic"].size:
+        order = np.lexsort((timestamp, segment))
+        ts = timestamp[order]
+    else:
+        order = np.arange(timestamp.shape[0])
+        ts = timestamp
+    pair = adjacent
+    prev_ts, cur_ts = ts[pair - 1], ts[pair]
+    pair_segment = segment[pair]
+
+    rows["duplicates"] = order[pair[cur_ts == prev_ts]]
+
+    forward = cur_ts > prev_ts
+    missing = np.zeros(pair.shape[0], dtype=np.int64)
+    missing[forward] = _missing_sessions(
+        prev_ts[forward], cur_ts[forward], interval, calendar
+    )
+    rows["missing_sessions"] = order[pair[missing > 0]]
+    rows["spikes"] = order[
+        _spikes(close[order], pair[forward], pair_segment[forward], n_symbols, z_threshold)
+    ]
+
+    counts = {
+        kind: np.bincount(segment[rows[kind]], minlength=n_symbols)
+        for kind in ("duplicates", "non_monotonic", "high_below_low", "spikes")
+    }
+    counts["missing_sessions"] = np.bincount(
+        pair_segment, weights=missing, minlength=n_symbols
+    ).astype(np.int64)
+
+    return QualityReport(
+        symbols=list(symbols),
+        bars=np.asarray(lengths, dtype=np.int64),
+        counts=counts,
+        offsets=offsets,
+        rows={kind: np.sort(index) for kind, index in rows.items()},
+    )
+
+
+def _missing_sessions(
+    prev_ts: np.ndarray,
+    cur_ts: np.ndarray,
+    interval: Interval,
+    calendar: TradingCalendar,
+) -> np.ndarray:
+    """인접 봉 사이에서 누락된 세션(봉) 수 계산"""
+    prev_day = prev_ts.astype("datetime64[D]")
+    cur_day = cur_ts.astype("datetime64[D]")
+
+    if interval.is_monthly:
+        months = (cur_day.astype("datetime64[M]") - prev_day.astype("datetime64[M]")).astype(
+            np.int64
+        )
+        return np.maximum(months // interval.count - 1, 0)
+
+    if interval.unit == "w":
+        weeks = ((cur_day - _WEEK_ORIGIN).astype(np.int64) // 7) - (
+            (prev_day - _WEEK_ORIGIN).astype(np.int64) // 7
+        )
+        return np.maximum(weeks // interval.count - 1, 0)
+
+    # 영업일 캘린더 기준으로 두 봉 사이에 빠진 거래일 수 (연속 일자는 계산 생략)
+    skipped_days = np.zeros(prev_day.shape[0], dtype=np.int64)
+    apart = np.flatnonzero((cur_day - prev_day).astype(np.int64) > 1)
+    skipped_days[apart] = np.busday_count(
+        prev_day[apart] + 1, cur_day[apart], busdaycal=calendar.busdaycalendar()
+    )
+
+    if not interval.is_intraday:
+        return np.maximum(skipped_days // interval.count, 0)
+
+    # 장중 봉: 같은 거래일 안에서의 간격 누락 + 빠진 거래일 수
+    step = interval.seconds
+    same_day = prev_day == cur_day
+    delta = (cur_ts - prev_ts).astype(np.int64)
+    intraday_missing = np.where(same_day, delta // step - 1, 0)
+    return np.maximum(intraday_missing, 0) + np.maximum(skipped_days, 0)
+
+
+def _segment_median_mad(
+    values: np.ndarray, count: np.ndarray, start: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """심볼별 연속 구간 [start, start + count) 의 중앙값과 MAD (값이 없는 심볼은 NaN)"""
+    # 심볼마다 길이를 2 의 거듭제곱으로 올린 행에 NaN 을 채워 펼치고, 같은 폭의 행끼리 정렬
+    # (전체 lexsort 보다 훨씬 빠르고, 채움 크기는 값 수의 2 배 이하)
+    median = np.full(count.shape[0], np.nan)
+    mad = np.full(count.shape[0], np.nan)
+    present = np.flatnonzero(count > 0)
+    if not present.size:
+        return median, mad
+    widths = 1 << np.ceil(np.log2(count[present])).astype(np.int64)
+    by_width = np.argsort(widths, kind="stable")
+    present, widths = present[by_width], widths[by_width]
+    lengths = count[present]
+    base = np.concatenate(([0], np.cumsum(widths)))
+    row_start = np.zeros(count.shape[0], dtype=np.int64)
+    row_start[present] = base[:-1]
+
+    padded = np.full(int(base[-1]), np.nan)
+    padded[np.repeat(row_start - start, count) + np.arange(values.shape[0])] = values
+    runs = np.concatenate(([0], np.flatnonzero(np.diff(widths)) + 1, [len(widths)]))
+    rows = [
+        padded[base[first] : base[last]].reshape(-1, int(widths[first]))
+        for first, last in zip(runs[:-1], runs[1:])
+    ]
+    lo, hi = base[:-1] + (lengths - 1) // 2, base[:-1] + lengths // 2
+
+    # NaN 은 정렬 시 뒤로 가므로 각 행 앞쪽 lengths 개가 실제 값
+    for block in rows:
+        block.sort(axis=1)
+    center = (padded[lo] + padded[hi]) / 2.0
+    for block, first, last in zip(rows, runs[:-1], runs[1:]):
+        np.abs(block - center[first:last, None], out=block)
+        block.sort(axis=1)
+    median[present] = center
+    mad[present] = (padded[lo] + padded[hi]) / 2.0
+    return median, mad
+
+
+def _spikes(
+    close: np.ndarray,
+    pair: np.ndarray,
+    pair_segment: np.ndarray,
+    n_symbols: int,
+    z_threshold: float,
+) -> np.ndarray:
+    """심볼별 로그수익률 robust z-score (중앙값/MAD) 가 임계값을 넘는 봉 인덱스"""
+    # 평균/표준편차 z-score 는 스파이크 자신이 표준편차를 키워 가려지고, n 개 수익률의 최대 z 가
+    # (n-1)/sqrt(n) 이라 짧은 구간에서는 임계값에 닿지 못함
+    prev_close, cur_close = close[pair - 1], close[pair]
+    valid = (prev_close > 0) & (cur_close > 0)
+    if not valid.any():
+        return np.empty(0, dtype=np.int64)
+
+    returns = np.log(cur_close[valid] / prev_close[valid])
+    seg = pair_segment[valid]
+    count = np.bincount(seg, minlength=n_symbols)
+    start = np.concatenate(([0], np.cumsum(count)[:-1]))
+    median, mad = _segment_median_mad(returns, count, start)
+    deviation = np.abs(returns - median[seg])
+    scale = mad / _MAD_TO_STD
+    with np.errstate(invalid="ignore", divide="ignore"):
+        # MAD 가 0 (절반 이상의 수익률이 같은 저유동성 심볼) 이면 표준편차로 대체
+        total = np.bincount(seg, weights=returns, minlength=n_symbols)
+        total_sq = np.bincount(seg, weights=returns * returns, minlength=n_symbols)
+        var = (total_sq - total * total / count) / (count - 1)
+        scale = np.where(scale > 0, scale, np.sqrt(np.maximum(var, 0.0)))
+        z = deviation / scale[seg]
+
+    flagged = (count[seg] >= 3) & (scale[seg] > 0) & (z > z_threshold)
+    return pair[valid][flagged]
@@ -0,0 +1,389 @@
+"""
+OHLCV 리샘플링 모듈.
+
+GetResampledOHLCV 서버 구현과 클라이언트 라이브러리가 공유하는 벡터화 집계 로직입니다.
+원본 봉(예: 60min, 1d)을 임의 간격(예: 2h, 4h, 3d, 2w, 3mo)으로 한 번에 집계합니다.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import time
+import warnings
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+import numpy as np
+
+from ..protos.services.market_data.v1 import market_data_service_pb2 as md_pb2
+
+_INTERVAL_RE = re.compile(r"^\s*(\d+)\s*(min|m|h|d|wk|w|mo)\s*$", re.IGNORECASE)
+_UNIT_ALIASES = {"m": "min", "wk": "w"}
+_UNIT_SECONDS = {"min": 60, "h": 3600, "d": 86400, "w": 7 * 86400}
+
+# 마지막 봉이 아직 바뀔 수 있는 응답(열린 구간)의 기본 캐시 유효 시간
+DEFAULT_LIVE_TTL_SECONDS = 60.0
+
+# 1970-01-01은 목요일이므로 주간 버킷은 1970-01-05(월요일)를 기준으로 정렬
+_EPOCH = np.datetime64("1970-01-01T00:00:00", "s")
+_WEEK_ORIGIN = np.datetime64("1970-01-05T00:00:00", "s")
+
+
+@dataclass(frozen=True)
+class Interval:
+    """봉 간격 표현식 (예: "90min", "4h", "3d", "2w", "3mo")"""
+
+    count: int
+    unit: str
+
+    @classmethod
+    def parse(cls, expr: str) -> Interval:
+        """간격 문자열 파싱"""
+        match = _INTERVAL_RE.match(expr or "")
+        if not match or int(match.group(1)) <= 0:
+            raise ValueError(f"지원하지 않는 간격 표현식: {expr!r}")
+        unit = match.group(2).lower()
+        return cls(int(match.group(1)), _UNIT_ALIASES.get(unit, unit))
+
+    @property
+    def is_monthly(self) -> bool:
+        """달력 월 단위 간격 여부"""
+        return self.unit == "mo"
+
+    @property
+    def seconds(self) -> int | None:
+        """고정 길이 간격의 초 단위 길이 (월 단위는 None)"""
+        if self.is_monthly:
+            return None
+        return self.count * _UNIT_SECONDS[self.unit]
+
+    @property
+    def is_intraday(self) -> bool:
+        """일 미만 간격 여부"""
+        return self.seconds is not None and self.seconds < _UNIT_SECONDS["d"]
+
+    def __str__(self) -> str:
+        return f"{self.count}{self.unit}"
+
+
+def check_compatible(source: Interval, target: Interval) -> None:
+    """원본 간격으로 대상 간격을 정확히 만들 수 있는지 확인"""
+    if target.is_monthly:
+        if source.is_monthly:
+            ok = target.count % source.count == 0
+        else:
+            ok = source.seconds is not None and source.seconds <= _UNIT_SECONDS["d"]
+    elif source.is_monthly:
+        ok = False
+    else:
+        ok = target.seconds >= source.seconds and target.seconds % source.seconds == 0
+    if not ok:
+        raise ValueError(f"{source} 봉으로 {target} 봉을 생성할 수 없습니다")
+
+
+@dataclass
+class OHLCVArrays:
+    """OHLCV 봉의 컬럼 배열 표현 (결측 optional 값은 NaN)"""
+
+    timestamp: np.ndarray  # datetime64[s]
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray  # int64
+    adjusted_close: np.ndarray
+    dividend_amount: np.ndarray
+    split_coefficient: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.timestamp.shape[0])
+
+    @classmethod
+    def from_bars(cls, bars: Sequence[md_pb2.OHLCVBar]) -> OHLCVArrays:
+        """OHLCVBar 목록을 컬럼 배열로 변환"""
+        n = len(bars)
+        nan = float("nan")
+        values = np.array(
+            [
+                (
+                    b.open,
+                    b.high,
+                    b.low,
+                    b.close,
+                    b.adjusted_close if b.HasField("adjusted_close") else nan,
+                    b.dividend_amount if b.HasField("dividend_amount") else nan,
+                    b.split_coefficient if b.HasField("split_coefficient") else nan,
+                )
+                for b in bars
+            ],
+            dtype=np.float64,
+        ).reshape(n, 7)
+        return cls(
+            timestamp=parse_timestamps([b.timestamp for b in bars]),
+            open=values[:, 0].copy(),
+            high=values[:, 1].copy(),
+            low=values[:, 2].copy(),
+            close=values[:, 3].copy(),
+            volume=np.fromiter((b.volume for b in bars), dtype=np.int64, count=n),
+            adjusted_close=values[:, 4].copy(),
+            dividend_amount=values[:, 5].copy(),
+            split_coefficient=values[:, 6].copy(),
+        )
+
+    def take(self, index: np.ndarray) -> OHLCVArrays:
+        """인덱스(또는 불리언 마스크)로 행 선택"""
+        return OHLCVArrays(
+            **{name: getattr(self, name)[index] for name in self.__dataclass_fields__}
+        )
+
+    def to_bars(self, intraday: bool = True) -> list[md_pb2.OHLCVBar]:
+        """컬럼 배열을 OHLCVBar 목록으로 변환"""
+        stamps = format_timestamps(self.timestamp, intraday)
+        bars: list[md_pb2.OHLCVBar] = []
+        optional = (
+            ("adjusted_close", self.adjusted_close),
+            ("dividend_amount", self.dividend_amount),
+            ("split_coefficient", self.split_coefficient),
+        )
+        for i in range(len(self)):
+            bar = md_pb2.OHLCVBar(
+                timestamp=stamps[i],
+                open=float(self.open[i]),
+                high=float(self.high[i]),
+                low=float(self.low[i]),
+                close=float(self.close[i]),
+                volume=int(self.volume[i]),
+            )
+            for name, column in optional:
+                value = column[i]
+                if not np.isnan(value):
+                    setattr(bar, name, float(value))
+            bars.append(bar)
+        return bars
+
+
+def parse_timestamps(values: Sequence[str]) -> np.ndarray:
+    """ISO 8601 타임스탬프 문자열을 datetime64[s] (UTC) 배열로 변환"""
+    if not values:
+        return np.empty(0, dtype="datetime64[s]")
+    with warnings.catch_warnings():
+        # 타임존 포함 문자열은 numpy가 경고와 함께 처리하므로 느린 경로로 넘김
+        warnings.simplefilter("error")
+        try:
+            return np.array(values, dtype="datetime64[s]")
+        except (ValueError, Warning):
+            pass
+
+    def _to_utc(value: str) -> np.datetime64:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        if parsed.tzinfo is not None:
+            parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+        return np.datetime64(parsed, "s")
+
+    return np.array([_to_utc(v) for v in values], dtype="datetime64[s]")
+
+
+def format_timestamps(stamps: np.ndarray, intraday: bool) -> list[str]:
+    """datetime64 배열을 ISO 8601 문자열 목록으로 변환"""
+    return np.datetime_as_string(stamps, unit="s" if intraday else "D").tolist()
+
+
+def bucket_starts(
+    stamps: np.ndarray, interval: Interval, anchor: np.datetime64 | None = None
+) -> np.ndarray:
+    """각 타임스탬프가 속하는 버킷의 시작 시각 계산"""
+    if interval.is_monthly:
+        months = stamps.astype("datetime64[M]")
+        origin = (anchor if anchor is not None else _EPOCH).astype("datetime64[M]")
+        index = (months - origin).astype(np.int64) // interval.count
+        return (origin + index * interval.count).astype("datetime64[s]")
+
+    if anchor is None:
+        anchor = _WEEK_ORIGIN if interval.unit == "w" else _EPOCH
+    width = interval.seconds
+    offset = (stamps - anchor).astype(np.int64)
+    return anchor + (offset // width) * width
+
+
+def bucket_end(start: np.datetime64, interval: Interval) -> np.datetime64:
+    """버킷 시작 시각으로부터 종료 시각(배타) 계산"""
+    if interval.is_monthly:
+        month = start.astype("datetime64[M]") + interval.count
+        return month.astype("datetime64[s]")
+    return start + np.timedelta64(interval.seconds, "s")
+
+
+def resample(
+    data: OHLCVArrays,
+    interval: Interval,
+    anchor: np.datetime64 | None = None,
+    drop_partial: bool = False,
+    as_of: np.datetime64 | None = None,
+) -> OHLCVArrays:
+    """OHLCV 컬럼 배열을 대상 간격으로 집계 (단일 벡터화 패스)"""
+    if len(data) == 0:
+        return data
+
+    if np.any(data.timestamp[1:] < data.timestamp[:-1]):
+        data = data.take(np.argsort(data.timestamp, kind="stable"))
+
+    starts = bucket_starts(data.timestamp, interval, anchor)
+    boundaries = np.flatnonzero(starts[1:] != starts[:-1]) + 1
+    first = np.concatenate(([0], boundaries))
+    last = np.concatenate((boundaries - 1, [len(data) - 1]))
+
+    def _sum_present(column: np.ndarray, identity: float, ufunc: np.ufunc) -> np.ndarray:
+        present = ~np.isnan(column)
+        result = ufunc.reduceat(np.where(present, column, identity), first)
+        result[np.add.reduceat(present.astype(np.int64), first) == 0] = np.nan
+        return result
+
+    result = OHLCVArrays(
+        timestamp=starts[first],
+        open=data.open[first],
+        high=np.maximum.reduceat(data.high, first),
+        low=np.minimum.reduceat(data.low, first),
+        close=data.close[last],
+        volume=np.add.reduceat(data.volume, first),
+        adjusted_close=data.adjusted_close[last],
+        dividend_amount=_sum_present(data.dividend_amount, 0.0, np.add),
+        split_coefficient=_sum_present(data.split_coefficient, 1.0, np.multiply),
+    )
+
+    if drop_partial:
+        if as_of is None:
+            as_of = np.datetime64(datetime.now(timezone.utc).replace(tzinfo=None), "s")
+        if bucket_end(result.timestamp[-1], interval) > as_of:
+            result = result.take(slice(0, len(result) - 1))
+
+    return result
+
+
+def resample_bars(
+    bars: Sequence[md_pb2.OHLCVBar],
+    interval: str | Interval,
+    anchor: str | None = None,
+    drop_partial: bool = False,
+) -> list[md_pb2.OHLCVBar]:
+    """OHLCVBar 목록을 대상 간격으로 리샘플링"""
+    target = interval if isinstance(interval, Interval) else Interval.parse(interval)
+    origin = parse_timestamps([anchor])[0] if anchor else None
+    arrays = resample(OHLCVArrays.from_bars(bars), target, origin, drop_partial)
+    return arrays.to_bars(intraday=target.is_intraday)
+
+
+def resample_response(
+    response: md_pb2.OHLCVResponse,
+    interval: str | Interval,
+    source_interval: str | Interval | None = None,
+    anchor: str | None = None,
+    drop_partial: bool = False,
+) -> md_pb2.OHLCVResponse:
+    """OHLCVResponse를 대상 간격으로 리샘플링한 새 응답 생성"""
+    target = interval if isinstance(interval, Interval) else Interval.parse(interval)
+    source = source_interval or response.interval
+    if source:
+        check_compatible(
+            source if isinstance(source, Interval) else Interval.parse(source), target
+        )
+
+    bars = resample_bars(response.bars, target, anchor, drop_partial)
+    return md_pb2.OHLCVResponse(
+        symbol=response.symbol,
+        interval=str(target),
+        bars=bars,
+        count=len(bars),
+        cached=False,
+        source=response.source,
+    )
+
+
+def request_key(request: md_pb2.GetResampledOHLCVRequest) -> tuple:
+    """GetResampledOHLCV 요청의 캐시 키 생성 (간격 표현식 정규화 포함)"""
+    return (
+        request.symbol.upper(),
+        str(Interval.parse(request.interval)),
+        str(Interval.parse(request.source_interval)),
+        request.start_date if request.HasField("start_date") else "",
+        request.end_date if request.HasField("end_date") else "",
+        request.adjusted if request.HasField("adjusted") else False,
+        request.anchor if request.HasField("anchor") else "",
+        request.drop_partial if request.HasField("drop_partial") else False,
+    )
+
+
+def is_live(request: md_pb2.GetResampledOHLCVRequest, today: str | None = None) -> bool:
+    """end_date 가 없거나 오늘 이후라 새 원본 봉이 결과를 바꿀 수 있는 요청 여부"""
+    if not request.HasField("end_date"):
+        return True
+    today = today or datetime.now(timezone.utc).date().isoformat()
+    return request.end_date[:10] >= today
+
+
+class ResampledBarCache:
+    """GetResampledOHLCV 결과 LRU 캐시 (백테스트/지표 작업의 반복 요청용)
+
+    end_date 가 지난 닫힌 구간은 결과가 바뀌지 않으므로 LRU 로만 밀려나고,
+    열린 구간(is_live)은 live_ttl_seconds 뒤 만료됩니다 (0 이하면 캐시하지 않음).
+    """
+
+    def __init__(
+        self, max_entries: int = 1024, live_ttl_seconds: float = DEFAULT_LIVE_TTL_SECONDS
+    ) -> None:
+        self.max_entries = max_entries
+        self.live_ttl_seconds = live_ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        # 키 -> (직렬화 응답, 저장 시각, 만료 monotonic 시각)
+        self._entries: OrderedDict[tuple, tuple[bytes, str, float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, request: md_pb2.GetResampledOHLCVRequest) -> md_pb2.OHLCVResponse | None:
+        """캐시 조회 (적중 시 cached=True 로 표시된 사본 반환)"""
+        key = request_key(request)
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() >= entry[2]:
+            del self._entries[key]
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        payload, stored_at, _ = entry
+        response = md_pb2.OHLCVResponse.FromString(payload)
+        response.cached = True
+        response.cache_timestamp = stored_at
+        return response
+
+    def put(
+        self, request: md_pb2.GetResampledOHLCVRequest, response: md_pb2.OHLCVResponse
+    ) -> None:
+        """집계 결과 저장 (열린 구간은 live_ttl_seconds 동안만)"""
+        expires_at = math.inf
+        if is_live(request):
+            if self.live_ttl_seconds <= 0:
+                return
+            expires_at = time.monotonic() + self.live_ttl_seconds
+        key = request_key(request)
+        stored_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        self._entries[key] = (response.SerializeToString(), stored_at, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def size_bytes(self) -> int:
+        """저장된 직렬화 응답의 총 크기"""
+        return sum(len(payload) for payload, _, _ in self._entries.values())
+
+    @property
+    def hit_rate(self) -> float:
+        """캐시 적중률"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
@@ -0,0 +1,334 @@
+"""
+업스트림 데이터 제공자 요청 스케줄러.
+
+제공자별 토큰 버킷 예산, 우선순위 클래스(interactive / warm / batch),
+동일 요청 병합(coalescing), 큐 깊이/지연 통계를 제공합니다.
+대량 갱신 작업이 실행 중이어도 interactive 요청의 p99 지연을 보호하는 것이 목적입니다.
+
+사용 예시:
+    scheduler = UpstreamScheduler({"alpha_vantage": ProviderBudget(5, burst=10)})
+    bars = await scheduler.submit(
+        "alpha_vantage", ("daily", "AAPL"), lambda: fetch_daily("AAPL")
+    )
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any
+
+from ..protos.services.market_data.v1 import market_data_service_pb2 as md_pb2
+
+
+class Priority(IntEnum):
+    """요청 우선순위 (값이 작을수록 먼저 처리)"""
+
+    INTERACTIVE = 0
+    WARM = 1
+    BATCH = 2
+
+
+@dataclass
+class ProviderBudget:
+    """제공자별 요청 예산"""
+
+    rate_per_second: float
+    # 기본값은 reserve_fraction 만큼 남기고도 warm/batch 가 토큰을 쓸 수 있는 크기
+    burst: float = 5.0
+    # interactive 요청을 위해 남겨두는 버킷 비율 (warm/batch는 이 아래로 소진 불가)
+    reserve_fraction: float = 0.2
+    max_in_flight: int | None = None
+    # max_in_flight 중 interactive 전용 슬롯 수 (warm/batch 는 나머지만 사용)
+    reserved_in_flight: int = 1
+
+
+class TokenBucket:
+    """토큰 버킷 레이트 리미터"""
+
+    def __init__(
+        self,
+        rate_per_second: float,
+        burst: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.rate = rate_per_second
+        self.capacity = burst
+        self._clock = clock
+        self._tokens = burst
+        self._updated = clock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = max(0.0, now - self._updated)
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    @property
+    def available(self) -> float:
+        """현재 사용 가능한 토큰 수"""
+        self._refill()
+        return self._tokens
+
+    def try_acquire(self, amount: float = 1.0, floor: float = 0.0) -> bool:
+        """잔여 토큰이 floor 이상 유지되는 경우에만 토큰 획득"""
+        self._refill()
+        if self._tokens - amount < floor:
+            return False
+        self._tokens -= amount
+        return True
+
+    def wait_time(self, amount: float = 1.0, floor: float = 0.0) -> float:
+        """토큰 획득이 가능해질 때까지 남은 시간(초)"""
+        self._refill()
+        deficit = amount + floor - self._tokens
+        if deficit <= 0:
+            return 0.0
+        return deficit / self.rate if self.rate > 0 else float("inf")
+
+
+@dataclass
+class _PendingCall:
+    """대기 중인 업스트림 호출"""
+
+    key: Hashable
+    call: Callable[[], Awaitable[Any]]
+    priority: Priority
+    future: asyncio.Future
+    enqueued_at: float
+
+
+@dataclass
+class _PriorityCounters:
+    """우선순위별 누적 통계"""
+
+    dispatched: int = 0
+    waits_ms: deque = field(default_factory=lambda: deque(maxlen=2048))
+    latencies_ms: deque = field(default_factory=lambda: deque(maxlen=2048))
+
+
+class _ProviderLane:
+    """제공자 하나의 큐와 예산 상태"""
+
+    def __init__(self, name: str, budget: ProviderBudget, clock: Callable[[], float]):
+        self.name = name
+        self.budget = budget
+        self.bucket = TokenBucket(budget.rate_per_second, budget.burst, clock)
+        self.queues: dict[Priority, deque[_PendingCall]] = {p: deque() for p in Priority}
+        self.counters = {p: _PriorityCounters() for p in Priority}
+        self.queued: dict[Hashable, _PendingCall] = {}
+        self.futures: dict[Hashable, asyncio.Future] = {}
+        self.wakeup = asyncio.Event()
+        self.in_flight = 0
+        self.coalesced = 0
+        self.errors = 0
+        self.task: asyncio.Task | None = None
+        self.running: set[asyncio.Task] = set()
+
+    def head(self) -> _PendingCall | None:
+        for priority in Priority:
+            if self.queues[priority]:
+                return self.queues[priority][0]
+        return None
+
+    def floor_for(self, priority: Priority) -> float:
+        if priority == Priority.INTERACTIVE:
+            return 0.0
+        # 버킷 상한(burst)에서 토큰 1 개를 쓰고도 floor 이상이어야 하므로 burst - 1 로 제한
+        # (burst 가 작은 기본 예산에서도 warm/batch 요청이 영원히 대기하지 않도록)
+        reserve = self.budget.reserve_fraction * self.budget.burst
+        return max(0.0, min(reserve, self.budget.burst - 1.0))
+
+    def in_flight_limit(self, priority: Priority) -> int | None:
+        limit = self.budget.max_in_flight
+        if limit is None or priority == Priority.INTERACTIVE:
+            return limit
+        # warm/batch 도 최소 한 슬롯은 쓸 수 있도록 예약 슬롯을 limit - 1 로 제한
+        return limit - max(0, min(self.budget.reserved_in_flight, limit - 1))
+
+
+def _percentile(values: deque, q: float) -> float:
+    """nearest-rank 백분위수"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, math.ceil(q / 100.0 * len(ordered)) - 1)
+    return float(ordered[rank])
+
+
+class UpstreamScheduler:
+    """제공자별 예산/우선순위/요청 병합을 적용하는 비동기 업스트림 스케줄러"""
+
+    def __init__(
+        self,
+        budgets: dict[str, ProviderBudget],
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._clock = clock
+        self._budgets = dict(budgets)
+        self._lanes: dict[str, _ProviderLane] = {}
+
+    def _lane(self, provider: str) -> _ProviderLane:
+        lane = self._lanes.get(provider)
+        if lane is None:
+            if provider not in self._budgets:
+                raise KeyError(f"등록되지 않은 제공자: {provider}")
+            lane = _ProviderLane(provider, self._budgets[provider], self._clock)
+            self._lanes[provider] = lane
+        if lane.task is None or lane.task.done():
+            lane.task = asyncio.get_running_loop().create_task(self._dispatch(lane))
+        return lane
+
+    async def submit(
+        self,
+        provider: str,
+        key: Hashable,
+        call: Callable[[], Awaitable[Any]],
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> Any:
+        """업스트림 호출 예약 (동일 key 요청은 하나의 호출로 병합)"""
+        lane = self._lane(provider)
+
+        future = lane.futures.get(key)
+        if future is not None:
+            lane.coalesced += 1
+            pending = lane.queued.get(key)
+            if pending is not None and priority < pending.priority:
+                # 더 급한 요청이 합류하면 대기 중인 호출의 우선순위를 올림
+                lane.queues[pending.priority].remove(pending)
+                pending.priority = priority
+                lane.queues[priority].append(pending)
+                lane.wakeup.set()
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        pending = _PendingCall(key, call, priority, future, self._clock())
+        lane.futures[key] = future
+        lane.queued[key] = pending
+        lane.queues[priority].append(pending)
+        lane.wakeup.set()
+        return await asyncio.shield(future)
+
+    async def _dispatch(self, lane: _ProviderLane) -> None:
+        """토큰 예산에 맞춰 우선순위 순으로 호출을 내보내는 루프"""
+        while True:
+            pending = lane.head()
+            limit = None if pending is None else lane.in_flight_limit(pending.priority)
+            if pending is None or (limit is not None and lane.in_flight >= limit):
+                lane.wakeup.clear()
+                await lane.wakeup.wait()
+                continue
+
+            floor = lane.floor_for(pending.priority)
+            if not lane.bucket.try_acquire(1.0, floor):
+                # 토큰 대기 중에도 더 높은 우선순위 요청이 도착하면 즉시 재평가
+                lane.wakeup.clear()
+                try:
+                    await asyncio.wait_for(
+                        lane.wakeup.wait(), lane.bucket.wait_time(1.0, floor)
+                    )
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            lane.queues[pending.priority].popleft()
+            del lane.queued[pending.key]
+            counters = lane.counters[pending.priority]
+            counters.dispatched += 1
+            counters.waits_ms.append((self._clock() - pending.enqueued_at) * 1000.0)
+            lane.in_flight += 1
+            task = asyncio.get_running_loop().create_task(self._run(lane, pending))
+            lane.running.add(task)
+            task.add_done_callback(lane.running.discard)
+
+    async def _run(self, lane: _ProviderLane, pending: _PendingCall) -> None:
+        started = self._clock()
+        try:
+            result = await pending.call()
+        except Exception as e:
+            lane.errors += 1
+            if not pending.future.done():
+                pending.future.set_exception(e)
+        else:
+            if not pending.future.done():
+                pending.future.set_result(result)
+        finally:
+            lane.counters[pending.priority].latencies_ms.append(
+                (self._clock() - started) * 1000.0
+            )
+            lane.in_flight -= 1
+            lane.futures.pop(pending.key, None)
+            lane.wakeup.set()
+
+    def queue_depth(self, provider: str, priority: Priority | None = None) -> int:
+        """대기 중인 요청 수"""
+        lane = self._lanes.get(provider)
+        if lane is None:
+            return 0
+        if priority is not None:
+            return len(lane.queues[priority])
+        return sum(len(q) for q in lane.queues.values())
+
+    def stats(self, provider: str | None = None) -> md_pb2.UpstreamStats:
+        """GetUpstreamStats 응답 생성"""
+        response = md_pb2.UpstreamStats()
+        for name, budget in self._budgets.items():
+            if provider and name != provider:
+                continue
+            lane = self._lanes.get(name)
+            entry = response.providers.add(
+                provider=name,
+                rate_per_second=budget.rate_per_second,
+                burst=budget.burst,
+                tokens_available=lane.bucket.available if lane else budget.burst,
+                in_flight=lane.in_flight if lane else 0,
+                coalesced=lane.coalesced if lane else 0,
+                errors=lane.errors if lane else 0,
+            )
+            for priority in Priority:
+                item = entry.priorities.add(priority=priority.name.lower())
+                if lane is None:
+                    continue
+                counters = lane.counters[priority]
+                item.queue_depth = len(lane.queues[priority])
+                item.dispatched = counters.dispatched
+                item.wait_ms_p50 = _percentile(counters.waits_ms, 50)
+                item.wait_ms_p99 = _percentile(counters.waits_ms, 99)
+                item.latency_ms_p50 = _percentile(counters.latencies_ms, 50)
+                item.latency_ms_p99 = _percentile(counters.latencies_ms, 99)
+        return response
+
+    def features(self) -> dict[str, str]:
+        """ServiceInfo.features 에 노출할 요약 값"""
+        features: dict[str, str] = {}
+        for entry in self.stats().providers:
+            prefix = f"upstream.{entry.provider}"
+            features[f"{prefix}.rate_per_second"] = f"{entry.rate_per_second:g}"
+            features[f"{prefix}.in_flight"] = str(entry.in_flight)
+            for item in entry.priorities:
+                features[f"{prefix}.{item.priority}.queue_depth"] = str(item.queue_depth)
+                features[f"{prefix}.{item.priority}.wait_ms_p99"] = f"{item.wait_ms_p99:.1f}"
+        return features
+
+    async def close(self) -> None:
+        """디스패처 종료, 대기 요청 및 진행 중인 호출 취소"""
+        tasks: list[asyncio.Task] = []
+        for lane in self._lanes.values():
+            if lane.task is not None:
+                lane.task.cancel()
+                tasks.append(lane.task)
+            for future in lane.futures.values():
+                if not future.done():
+                    future.cancel()
+            for task in lane.running:
+                task.cancel()
+            tasks.extend(lane.running)
+            for queue in lane.queues.values():
+                queue.clear()
+            lane.queued.clear()
+        await asyncio.gather(*tasks, return_exceptions=True)
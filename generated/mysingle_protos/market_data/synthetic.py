@@ -0,0 +1,803 @@
+"""
+합성(synthetic) MarketDataService 대역 서버.
+
+실제 서비스와 업스트림 제공자 없이 MarketDataServiceStub 소비자를 부하 테스트하기 위한
+MarketDataServiceServicer 구현입니다. 시드로부터 결정적인 봉/시세/기업 개요/실적/옵션 체인을
+생성하며, RPC별 지연 분포, 오류율, 페이로드 크기를 설정할 수 있습니다.
+
+사용 예시 (프로세스 내부):
+    with serve_in_background(SyntheticConfig(seed=7, error_rate=0.01)) as server:
+        channel = grpc.insecure_channel(server.address)
+        stub = md_grpc.MarketDataServiceStub(channel)
+        stub.GetDailyOHLCV(md_pb2.GetDailyOHLCVRequest(symbol="AAPL"))
+
+사용 예시 (로컬 서버):
+    python -m mysingle_protos.market_data.synthetic --port 50051 --latency-ms 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import math
+import re
+import threading
+import time
+import zlib
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from functools import lru_cache
+
+import grpc
+import numpy as np
+
+from ..protos.services.market_data.v1 import market_data_service_pb2 as md_pb2
+from ..protos.services.market_data.v1 import market_data_service_pb2_grpc as md_grpc
+from .resample import (
+    DEFAULT_LIVE_TTL_SECONDS,
+    Interval,
+    OHLCVArrays,
+    ResampledBarCache,
+    parse_timestamps,
+    resample,
+    resample_response,
+)
+from .scheduler import Priority, ProviderBudget, UpstreamScheduler
+
+SERVICE_NAME = "market-data-synthetic"
+PROVIDER = "synthetic"
+COMPACT_BARS = 100
+
+_SESSION_OPEN = np.timedelta64(9 * 3600 + 30 * 60, "s")
+_SESSION_SECONDS = 390 * 60
+_CONTRACT_RE = re.compile(r"^([A-Z.]+)(\d{6})([CP])(\d{8})$")
+
+# 여러 심볼을 다루는 RPC는 batch 우선순위로 업스트림 예산을 사용
+_BATCH_RPCS = {"BatchGetDailyOHLCV", "BatchGetQuote"}
+
+
+@dataclass
+class LatencyProfile:
+    """RPC 지연 분포 (fixed / uniform / lognormal, 단위 ms)"""
+
+    median_ms: float = 0.0
+    distribution: str = "lognormal"
+    # lognormal: sigma, uniform: median 대비 ±폭 비율
+    spread: float = 0.5
+
+    def sample(self, rng: np.random.Generator) -> float:
+        """지연 시간 샘플 (초)"""
+        if self.median_ms <= 0:
+            return 0.0
+        if self.distribution == "fixed":
+            value = self.median_ms
+        elif self.distribution == "uniform":
+            value = rng.uniform(
+                self.median_ms * (1 - self.spread), self.median_ms * (1 + self.spread)
+            )
+        elif self.distribution == "lognormal":
+            value = self.median_ms * math.exp(rng.normal(0.0, self.spread))
+        else:
+            raise ValueError(f"지원하지 않는 지연 분포: {self.distribution}")
+        return max(0.0, value) / 1000.0
+
+
+@dataclass
+class SyntheticConfig:
+    """합성 서버 설정"""
+
+    seed: int = 0
+    # 생성 데이터의 마지막 거래일 (벽시계와 무관하게 결정적인 결과를 위해 고정)
+    end_date: str = "2024-12-31"
+    # 페이로드 크기: 일봉 이력 길이, 장중 봉 일수, 옵션 만기/행사가 수
+    history_bars: int = 1260
+    intraday_days: int = 5
+    option_expirations: int = 4
+    option_strikes: int = 21
+    # RPC 이름별 지연 분포 ("*" 는 기본값)
+    latency: dict[str, LatencyProfile] = field(default_factory=dict)
+    error_rate: float = 0.0
+    error_code: grpc.StatusCode = grpc.StatusCode.UNAVAILABLE
+    # 배치 RPC 내 심볼 단위 오류율 (심볼별로 결정적)
+    symbol_error_rate: float = 0.0
+    # 설정 시 지연 시뮬레이션을 업스트림 스케줄러 예산 아래에서 수행
+    upstream: ProviderBudget | None = None
+    resample_cache_entries: int = 1024
+    # end_date 가 없거나 오늘 이후인 리샘플 응답의 캐시 유효 시간
+    resample_cache_live_ttl_seconds: float = DEFAULT_LIVE_TTL_SECONDS
+
+    def latency_for(self, rpc: str) -> LatencyProfile:
+        """RPC 지연 분포 조회"""
+        return self.latency.get(rpc) or self.latency.get("*") or LatencyProfile()
+
+
+def _symbol_seed(seed: int, symbol: str, *salt: int) -> list[int]:
+    return [seed, zlib.crc32(symbol.upper().encode("utf-8")), *salt]
+
+
+def _business_days(end: np.datetime64, count: int) -> np.ndarray:
+    last = np.busday_offset(end, 0, roll="backward")
+    return np.busday_offset(last, np.arange(-count + 1, 1))
+
+
+def _random_walk(
+    rng: np.random.Generator, n: int, start: float, volatility: float
+) -> OHLCVArrays:
+    """기하 랜덤 워크 기반 OHLCV 배열 (timestamp 는 호출 측에서 채움)"""
+    log_returns = rng.normal(0.0002, volatility, n)
+    close = start * np.exp(np.cumsum(log_returns))
+    open_ = np.concatenate(([start], close[:-1])) * np.exp(rng.normal(0.0, volatility / 4, n))
+    wick = np.abs(rng.normal(0.0, volatility / 2, (2, n)))
+    high = np.maximum(open_, close) * np.exp(wick[0])
+    low = np.minimum(open_, close) * np.exp(-wick[1])
+    volume = rng.lognormal(13.0, 0.6, n).astype(np.int64)
+    nan = np.full(n, np.nan)
+    return OHLCVArrays(
+        timestamp=np.empty(n, dtype="datetime64[s]"),
+        open=np.round(open_, 4),
+        high=np.round(high, 4),
+        low=np.round(low, 4),
+        close=np.round(close, 4),
+        volume=volume,
+        adjusted_close=nan,
+        dividend_amount=nan.copy(),
+        split_coefficient=nan.copy(),
+    )
+
+
+def _norm_cdf(x: np.ndarray) -> np.ndarray:
+    return 0.5 * (1.0 + np.vectorize(math.erf)(x / math.sqrt(2.0)))
+
+
+def _norm_pdf(x: np.ndarray) -> np.ndarray:
+    return np.exp(-0.5 * x * x) / math.sqrt(2.0 * math.pi)
+
+
+class SyntheticMarketData:
+    """시드 기반 결정적 합성 시장 데이터 생성기"""
+
+    def __init__(self, config: SyntheticConfig | None = None) -> None:
+        self.config = config or SyntheticConfig()
+        self._end = np.datetime64(self.config.end_date, "D")
+        self.daily = lru_cache(maxsize=4096)(self._daily)
+        self.intraday = lru_cache(maxsize=1024)(self._intraday)
+
+    def _rng(self, symbol: str, *salt: int) -> np.random.Generator:
+        return np.random.default_rng(_symbol_seed(self.config.seed, symbol, *salt))
+
+    def start_price(self, symbol: str) -> float:
+        """심볼별 시작 가격"""
+        return float(self._rng(symbol, 0).uniform(10.0, 500.0))
+
+    def _daily(self, symbol: str) -> OHLCVArrays:
+        n = self.config.history_bars
+        data = _random_walk(self._rng(symbol, 1), n, self.start_price(symbol), 0.02)
+        data.timestamp = _business_days(self._end, n).astype("datetime64[s]")
+        data.adjusted_close = data.close.copy()
+        data.dividend_amount = np.zeros(n)
+        data.split_coefficient = np.ones(n)
+        return data
+
+    def _intraday(self, symbol: str, interval: str) -> OHLCVArrays:
+        step = Interval.parse(interval).seconds
+        if step is None or step >= 86400:
+            raise ValueError(f"장중 간격이 아닙니다: {interval}")
+        per_day = _SESSION_SECONDS // step
+        days = _business_days(self._end, self.config.intraday_days).astype("datetime64[s]")
+        offsets = _SESSION_OPEN + np.arange(per_day) * np.timedelta64(step, "s")
+        n = per_day * len(days)
+        start = float(self.daily(symbol).close[-len(days) - 1]) if len(days) else 100.0
+        data = _random_walk(self._rng(symbol, 2, step), n, start, 0.02 / math.sqrt(per_day))
+        data.timestamp = (days[:, None] + offsets[None, :]).ravel()
+        return data
+
+    def ohlcv(
+        self,
+        symbol: str,
+        interval: str = "1d",
+        start_date: str | None = None,
+        end_date: str | None = None,
+        adjusted: bool = False,
+        outputsize: str | None = None,
+    ) -> OHLCVArrays:
+        """간격/기간 조건에 맞는 봉 배열"""
+        target = Interval.parse(interval)
+        if target.is_intraday:
+            data = self.intraday(symbol, str(target))
+        else:
+            data = self.daily(symbol)
+            if target.unit != "d" or target.count != 1:
+                data = resample(data, target)
+
+        mask = np.ones(len(data), dtype=bool)
+        if start_date:
+            mask &= data.timestamp >= parse_timestamps([start_date])[0]
+        if end_date:
+            # 날짜만 지정된 경우 해당 일자 전체 포함
+            end = parse_timestamps([end_date])[0]
+            if len(end_date) <= 10:
+                end = end + np.timedelta64(86399, "s")
+            mask &= data.timestamp <= end
+        index = np.flatnonzero(mask)
+        if outputsize == "compact":
+            index = index[-COMPACT_BARS:]
+        data = data.take(index)
+
+        if not adjusted:
+            nan = np.full(len(data), np.nan)
+            data.adjusted_close = nan
+            data.dividend_amount = nan
+            data.split_coefficient = nan
+        return data
+
+    def symbol_error(self, symbol: str) -> str | None:
+        """배치 RPC 심볼 단위 합성 오류 (심볼별로 결정적)"""
+        if self.config.symbol_error_rate <= 0:
+            return None
+        if self._rng(symbol, 3).random() < self.config.symbol_error_rate:
+            return f"synthetic upstream error for {symbol}"
+        return None
+
+    def quote(self, symbol: str) -> md_pb2.QuoteData:
+        """마지막 두 일봉 기준 시세"""
+        data = self.daily(symbol)
+        last = len(data) - 1
+        price = float(data.close[last])
+        previous = float(data.close[last - 1]) if last > 0 else float(data.open[last])
+        change = price - previous
+        return md_pb2.QuoteData(
+            symbol=symbol.upper(),
+            open=float(data.open[last]),
+            high=float(data.high[last]),
+            low=float(data.low[last]),
+            price=price,
+            volume=int(data.volume[last]),
+            latest_trading_day=str(data.timestamp[last].astype("datetime64[D]")),
+            previous_close=previous,
+            change=round(change, 4),
+            change_percent=round(change / previous * 100.0, 4) if previous else 0.0,
+        )
+
+    def overview(self, symbol: str) -> md_pb2.CompanyOverview:
+        """기업 개요"""
+        rng = self._rng(symbol, 4)
+        quote = self.quote(symbol)
+        shares = int(rng.uniform(5e7, 5e9))
+        eps = round(float(rng.uniform(0.5, 15.0)), 2)
+        closes = self.daily(symbol).close
+        sectors = ("TECHNOLOGY", "HEALTHCARE", "FINANCIALS", "ENERGY", "INDUSTRIALS")
+        return md_pb2.CompanyOverview(
+            symbol=symbol.upper(),
+            asset_type="Common Stock",
+            name=f"{symbol.upper()} Synthetic Corp",
+            description=f"Synthetic company generated for {symbol.upper()}.",
+            cik=str(int(rng.integers(10**5, 10**7))),
+            exchange="NASDAQ",
+            currency="USD",
+            country="USA",
+            sector=sectors[int(rng.integers(len(sectors)))],
+            industry="SYNTHETIC",
+            address="1 Synthetic Way, Testville, USA",
+            fiscal_year_end="December",
+            latest_quarter=self.config.end_date,
+            market_capitalization=int(shares * quote.price),
+            ebitda=str(int(shares * eps * 1.4)),
+            pe_ratio=round(quote.price / eps, 2),
+            peg_ratio=round(float(rng.uniform(0.5, 3.0)), 2),
+            book_value=round(float(rng.uniform(5, 80)), 2),
+            dividend_per_share=round(float(rng.uniform(0, 4)), 2),
+            dividend_yield=round(float(rng.uniform(0, 0.04)), 4),
+            eps=eps,
+            revenue_per_share_ttm=round(eps * float(rng.uniform(3, 10)), 2),
+            profit_margin=round(float(rng.uniform(0.02, 0.35)), 4),
+            operating_margin_ttm=round(float(rng.uniform(0.05, 0.4)), 4),
+            return_on_assets_ttm=round(float(rng.uniform(0.01, 0.2)), 4),
+            return_on_equity_ttm=round(float(rng.uniform(0.05, 0.4)), 4),
+            revenue_ttm=round(shares * eps * float(rng.uniform(3, 10)), 0),
+            gross_profit_ttm=round(shares * eps * float(rng.uniform(1.5, 4)), 0),
+            diluted_eps_ttm=round(eps * 0.98, 2),
+            quarterly_earnings_growth_yoy=round(float(rng.normal(0.05, 0.1)), 4),
+            quarterly_revenue_growth_yoy=round(float(rng.normal(0.05, 0.08)), 4),
+            analyst_target_price=round(quote.price * float(rng.uniform(0.9, 1.3)), 2),
+            trailing_pe=round(quote.price / eps, 2),
+            forward_pe=round(quote.price / (eps * 1.1), 2),
+            price_to_sales_ratio_ttm=round(float(rng.uniform(0.5, 15)), 2),
+            price_to_book_ratio=round(float(rng.uniform(0.8, 20)), 2),
+            ev_to_revenue=round(float(rng.uniform(0.5, 15)), 2),
+            ev_to_ebitda=round(float(rng.uniform(4, 40)), 2),
+            beta=round(float(rng.uniform(0.4, 2.0)), 3),
+            week_52_high=f"{float(closes[-252:].max()):.2f}",
+            week_52_low=f"{float(closes[-252:].min()):.2f}",
+            day_50_moving_average=f"{float(closes[-50:].mean()):.2f}",
+            day_200_moving_average=f"{float(closes[-200:].mean()):.2f}",
+            shares_outstanding=shares,
+            dividend_date=self.config.end_date,
+            ex_dividend_date=self.config.end_date,
+        )
+
+    def earnings(self, symbol: str) -> md_pb2.EarningsResponse:
+        """연간/분기 실적"""
+        rng = self._rng(symbol, 5)
+        end = date.fromisoformat(self.config.end_date)
+        response = md_pb2.EarningsResponse(symbol=symbol.upper())
+        base = float(rng.uniform(0.2, 4.0))
+        for i in range(12):
+            quarter_end = date(end.year, ((end.month - 1) // 3) * 3 + 1, 1) - timedelta(
+                days=1 + 91 * i
+            )
+            estimated = round(base * (1 + 0.02 * (12 - i)), 2)
+            reported = round(estimated * (1 + float(rng.normal(0.02, 0.05))), 2)
+            surprise = round(reported - estimated, 4)
+            response.quarterly_earnings.add(
+                fiscal_date_ending=quarter_end.isoformat(),
+                reported_eps=reported,
+                estimated_eps=estimated,
+                surprise=surprise,
+                surprise_percentage=round(surprise / estimated * 100.0, 4),
+            )
+        for year in range(3):
+            quarters = response.quarterly_earnings[year * 4 : year * 4 + 4]
+            response.annual_earnings.add(
+                fiscal_date_ending=f"{end.year - 1 - year}-12-31",
+                reported_eps=round(sum(q.reported_eps for q in quarters), 2),
+            )
+        return response
+
+    def option_chain(self, symbol: str, as_of: str | None = None) -> list[md_pb2.OptionContract]:
+        """만기 x 행사가 x (콜/풋) 옵션 체인 (Black-Scholes 가격/그릭스)"""
+        symbol = symbol.upper()
+        day = np.datetime64(as_of or self.config.end_date, "D")
+        closes = self.daily(symbol)
+        index = int(np.searchsorted(closes.timestamp.astype("datetime64[D]"), day, "right")) - 1
+        spot = float(closes.close[max(index, 0)])
+
+        # 매주 금요일 만기
+        first_friday = np.busday_offset(day, 1, roll="forward", weekmask="Fri")
+        expirations = first_friday + np.arange(self.config.option_expirations) * 7
+        moneyness = np.linspace(0.8, 1.2, self.config.option_strikes)
+        strikes = np.round(spot * moneyness, 2)
+        rng = self._rng(symbol, 6, int(day.astype(np.int64)))
+        base_vol = float(rng.uniform(0.15, 0.6))
+
+        exp_grid, strike_grid = np.meshgrid(expirations, strikes, indexing="ij")
+        t = np.maximum((exp_grid - day).astype(np.float64), 1.0) / 365.0
+        k = strike_grid.astype(np.float64)
+        iv = base_vol * (1.0 + 0.8 * (k / spot - 1.0) ** 2)
+        rate = 0.04
+        sqrt_t = np.sqrt(t)
+        d1 = (np.log(spot / k) + (rate + 0.5 * iv * iv) * t) / (iv * sqrt_t)
+        d2 = d1 - iv * sqrt_t
+        discount = np.exp(-rate * t)
+        nd1, nd2 = _norm_cdf(d1), _norm_cdf(d2)
+        pdf = _norm_pdf(d1)
+        gamma = pdf / (spot * iv * sqrt_t)
+        vega = spot * pdf * sqrt_t / 100.0
+        sides = {
+            "call": (
+                spot * nd1 - k * discount * nd2,
+                nd1,
+                (-spot * pdf * iv / (2 * sqrt_t) - rate * k * discount * nd2) / 365.0,
+                k * t * discount * nd2 / 100.0,
+            ),
+            "put": (
+                k * discount * (1 - nd2) - spot * (1 - nd1),
+                nd1 - 1.0,
+                (-spot * pdf * iv / (2 * sqrt_t) + rate * k * discount * (1 - nd2)) / 365.0,
+                -k * t * discount * (1 - nd2) / 100.0,
+            ),
+        }
+        volume = rng.integers(0, 5000, (2,) + t.shape)
+        open_interest = rng.integers(0, 50000, (2,) + t.shape)
+
+        contracts: list[md_pb2.OptionContract] = []
+        as_of_str = str(day)
+        for e, expiration in enumerate(expirations):
+            expiration_str = str(expiration)
+            yymmdd = expiration_str[2:].replace("-", "")
+            for s in range(len(strikes)):
+                for side, (price, delta, theta, rho) in enumerate(sides.values()):
+                    mark = max(float(price[e, s]), 0.01)
+                    type_ = "call" if side == 0 else "put"
+                    contracts.append(
+                        md_pb2.OptionContract(
+                            contract_id=(
+                                f"{symbol}{yymmdd}{type_[0].upper()}"
+                                f"{int(round(strikes[s] * 1000)):08d}"
+                            ),
+                            symbol=symbol,
+                            expiration=expiration_str,
+                            strike=float(strikes[s]),
+                            type=type_,
+                            last=round(mark, 2),
+                            mark=round(mark, 2),
+                            bid=round(mark * 0.98, 2),
+                            bid_size=float(volume[side, e, s] % 100 + 1),
+                            ask=round(mark * 1.02, 2),
+                            ask_size=float(open_interest[side, e, s] % 100 + 1),
+                            volume=int(volume[side, e, s]),
+                            open_interest=int(open_interest[side, e, s]),
+                            date=as_of_str,
+                            implied_volatility=round(float(iv[e, s]), 4),
+                            delta=round(float(delta[e, s]), 4),
+                            gamma=round(float(gamma[e, s]), 6),
+                            theta=round(float(theta[e, s]), 4),
+                            vega=round(float(vega[e, s]), 4),
+                            rho=round(float(rho[e, s]), 4),
+                        )
+                    )
+        return contracts
+
+
+class SyntheticMarketDataServicer(md_grpc.MarketDataServiceServicer):
+    """합성 데이터 기반 MarketDataService 구현 (grpc.aio 서버용)"""
+
+    def __init__(self, config: SyntheticConfig | None = None) -> None:
+        self.config = config or SyntheticConfig()
+        self.data = SyntheticMarketData(self.config)
+        self.resample_cache = ResampledBarCache(
+            self.config.resample_cache_entries, self.config.resample_cache_live_ttl_seconds
+        )
+        self.scheduler = (
+            UpstreamScheduler({PROVIDER: self.config.upstream}) if self.config.upstream else None
+        )
+        self._rng = np.random.default_rng([self.config.seed, 0x5EED])
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+        self.calls: dict[str, int] = {}
+
+    async def _simulate(self, rpc: str, request, context: grpc.aio.ServicerContext) -> None:
+        """지연 및 오류 주입 (업스트림 예산 설정 시 스케줄러 경유)"""
+        with self._lock:
+            self.calls[rpc] = self.calls.get(rpc, 0) + 1
+            delay = self.config.latency_for(rpc).sample(self._rng)
+            failed = self._rng.random() < self.config.error_rate
+
+        if self.scheduler is not None:
+            priority = Priority.BATCH if rpc in _BATCH_RPCS else Priority.INTERACTIVE
+            await self.scheduler.submit(
+                PROVIDER,
+                (rpc, request.SerializeToString(deterministic=True)),
+                lambda: asyncio.sleep(delay),
+                priority,
+            )
+        elif delay:
+            await asyncio.sleep(delay)
+
+        if failed:
+            await context.abort(self.config.error_code, f"synthetic {rpc} failure")
+
+    def _ohlcv_response(
+        self, symbol: str, interval: str, request, outputsize: str | None = None
+    ) -> md_pb2.OHLCVResponse:
+        data = self.data.ohlcv(
+            symbol,
+            interval,
+            request.start_date if request.HasField("start_date") else None,
+            request.end_date if request.HasField("end_date") else None,
+            request.adjusted if request.HasField("adjusted") else False,
+            outputsize,
+        )
+        bars = data.to_bars(intraday=Interval.parse(interval).is_intraday)
+        return md_pb2.OHLCVResponse(
+            symbol=symbol.upper(),
+            interval=interval,
+            bars=bars,
+            count=len(bars),
+            cached=False,
+            source=PROVIDER,
+        )
+
+    async def _invalid(self, context: grpc.aio.ServicerContext, error: Exception) -> None:
+        await context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(error))
+
+    # ========== Service Management ==========
+
+    async def HealthCheck(self, request, context):
+        return md_pb2.HealthCheckResponse(
+            status="healthy",
+            service=SERVICE_NAME,
+            version="synthetic",
+            uptime_seconds=int(time.monotonic() - self._started),
+            cache_size=len(self.resample_cache),
+            data_sources={PROVIDER: 1},
+        )
+
+    async def GetServiceInfo(self, request, context):
+        features = {
+            "synthetic.seed": str(self.config.seed),
+            "synthetic.history_bars": str(self.config.history_bars),
+            "synthetic.error_rate": f"{self.config.error_rate:g}",
+        }
+        if self.scheduler is not None:
+            features.update(self.scheduler.features())
+        return md_pb2.ServiceInfo(
+            service_name=SERVICE_NAME,
+            version="synthetic",
+            environment="test",
+            supported_assets=["stocks", "options"],
+            data_providers=[PROVIDER],
+            features=features,
+        )
+
+    async def GetCacheStats(self, request, context):
+        cache = self.resample_cache
+        return md_pb2.CacheStats(
+            total_entries=len(cache),
+            total_size_bytes=cache.size_bytes(),
+            hit_rate=cache.hit_rate,
+            hits=cache.hits,
+            misses=cache.misses,
+            entries_by_domain={"resampled_ohlcv": len(cache)},
+        )
+
+    async def GetUpstreamStats(self, request, context):
+        if self.scheduler is None:
+            return md_pb2.UpstreamStats()
+        return self.scheduler.stats(request.provider if request.HasField("provider") else None)
+
+    # ========== Stock Time Series ==========
+
+    async def GetDailyOHLCV(self, request, context):
+        await self._simulate("GetDailyOHLCV", request, context)
+        outputsize = request.outputsize if request.HasField("outputsize") else None
+        return self._ohlcv_response(request.symbol, "1d", request, outputsize)
+
+    async def GetIntradayOHLCV(self, request, context):
+        await self._simulate("GetIntradayOHLCV", request, context)
+        interval = request.interval if request.HasField("interval") else "5min"
+        outputsize = request.outputsize if request.HasField("outputsize") else None
+        try:
+            return self._ohlcv_response(request.symbol, interval, request, outputsize)
+        except ValueError as e:
+            await self._invalid(context, e)
+
+    async def GetWeeklyOHLCV(self, request, context):
+        await self._simulate("GetWeeklyOHLCV", request, context)
+        return self._ohlcv_response(request.symbol, "1w", request)
+
+    async def GetMonthlyOHLCV(self, request, context):
+        await self._simulate("GetMonthlyOHLCV", request, context)
+        return self._ohlcv_response(request.symbol, "1mo", request)
+
+    async def GetQuote(self, request, context):
+        await self._simulate("GetQuote", request, context)
+        return md_pb2.QuoteResponse(quote=self.data.quote(request.symbol), cached=False)
+
+    async def SearchSymbols(self, request, context):
+        await self._simulate("SearchSymbols", request, context)
+        keyword = re.sub(r"[^A-Z]", "", request.keywords.upper())[:5] or "SYN"
+        response = md_pb2.SearchSymbolsResponse()
+        for i, suffix in enumerate(("", "A", "B", "X", "Y")):
+            response.results.add(
+                symbol=f"{keyword}{suffix}",
+                name=f"{keyword}{suffix} Synthetic Corp",
+                type="Equity",
+                region="United States",
+                market_open="09:30",
+                market_close="16:00",
+                timezone="UTC-04",
+                currency="USD",
+                match_score=round(1.0 - 0.15 * i, 4),
+            )
+        response.count = len(response.results)
+        return response
+
+    async def BatchGetDailyOHLCV(self, request, context):
+        await self._simulate("BatchGetDailyOHLCV", request, context)
+        response = md_pb2.BatchGetDailyOHLCVResponse(total_symbols=len(request.symbols))
+        for symbol in request.symbols:
+            error = self.data.symbol_error(symbol)
+            if error:
+                response.data.add(symbol=symbol.upper(), error=error)
+                response.error_count += 1
+                continue
+            bars = self._ohlcv_response(symbol, "1d", request).bars
+            response.data.add(symbol=symbol.upper(), bars=bars, count=len(bars))
+            response.success_count += 1
+        return response
+
+    async def BatchGetQuote(self, request, context):
+        await self._simulate("BatchGetQuote", request, context)
+        response = md_pb2.BatchGetQuoteResponse(total_symbols=len(request.symbols))
+        for symbol in request.symbols:
+            error = self.data.symbol_error(symbol)
+            if error:
+                response.data.add(symbol=symbol.upper(), error=error)
+                response.error_count += 1
+                continue
+            response.data.add(symbol=symbol.upper(), quote=self.data.quote(symbol))
+            response.success_count += 1
+        return response
+
+    async def GetResampledOHLCV(self, request, context):
+        try:
+            # 캐시 키 계산에서 interval 을 파싱하므로 잘못된 interval 도 INVALID_ARGUMENT
+            cached = self.resample_cache.get(request)
+            if cached is not None:
+                return cached
+            await self._simulate("GetResampledOHLCV", request, context)
+            source = self._ohlcv_response(request.symbol, request.source_interval, request)
+            response = resample_response(
+                source,
+                request.interval,
+                request.source_interval,
+                request.anchor if request.HasField("anchor") else None,
+                request.drop_partial if request.HasField("drop_partial") else False,
+            )
+        except ValueError as e:
+            await self._invalid(context, e)
+        self.resample_cache.put(request, response)
+        return response
+
+    # ========== Fundamental Data ==========
+
+    async def GetCompanyOverview(self, request, context):
+        await self._simulate("GetCompanyOverview", request, context)
+        return md_pb2.CompanyOverviewResponse(
+            overview=self.data.overview(request.symbol), cached=False
+        )
+
+    async def GetEarnings(self, request, context):
+        await self._simulate("GetEarnings", request, context)
+        return self.data.earnings(request.symbol)
+
+    # ========== Options Data ==========
+
+    async def GetOptionsChain(self, request, context):
+        await self._simulate("GetOptionsChain", request, context)
+        contracts = self.data.option_chain(
+            request.symbol, request.date if request.HasField("date") else None
+        )
+        return md_pb2.OptionsChainResponse(
+            symbol=request.symbol.upper(), contracts=contracts, count=len(contracts)
+        )
+
+    async def GetHistoricalOptions(self, request, context):
+        await self._simulate("GetHistoricalOptions", request, context)
+        as_of = request.date if request.HasField("date") else self.config.end_date
+        contracts = self.data.option_chain(request.symbol, as_of)
+        return md_pb2.HistoricalOptionsResponse(
+            symbol=request.symbol.upper(), date=as_of, contracts=contracts, count=len(contracts)
+        )
+
+    async def GetOptionContract(self, request, context):
+        await self._simulate("GetOptionContract", request, context)
+        match = _CONTRACT_RE.match(request.contract_id.upper())
+        if match is None:
+            await context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT, f"잘못된 계약 ID: {request.contract_id}"
+            )
+        for contract in self.data.option_chain(match.group(1)):
+            if contract.contract_id == request.contract_id.upper():
+                return md_pb2.OptionContractResponse(contract=contract, cached=False)
+        await context.abort(grpc.StatusCode.NOT_FOUND, f"계약 없음: {request.contract_id}")
+
+
+async def start_server(
+    servicer: SyntheticMarketDataServicer | None = None,
+    address: str = "127.0.0.1:0",
+) -> tuple[grpc.aio.Server, int]:
+    """현재 이벤트 루프에서 합성 서버 시작 (포트 0 이면 임의 포트)"""
+    server = grpc.aio.server()
+    md_grpc.add_MarketDataServiceServicer_to_server(
+        servicer or SyntheticMarketDataServicer(), server
+    )
+    port = server.add_insecure_port(address)
+    await server.start()
+    return server, port
+
+
+class BackgroundServer:
+    """별도 스레드 이벤트 루프에서 실행되는 합성 서버 (동기 클라이언트 벤치마크용)"""
+
+    def __init__(
+        self,
+        config: SyntheticConfig | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self.servicer = SyntheticMarketDataServicer(config)
+        self.host = host
+        self.port = port
+        self._loop = asyncio.new_event_loop()
+        self._server: grpc.aio.Server | None = None
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+
+    @property
+    def address(self) -> str:
+        """클라이언트 접속 주소"""
+        return f"{self.host}:{self.port}"
+
+    def start(self) -> BackgroundServer:
+        """서버 시작"""
+        self._thread.start()
+        future = asyncio.run_coroutine_threadsafe(
+            start_server(self.servicer, f"{self.host}:{self.port}"), self._loop
+        )
+        self._server, self.port = future.result()
+        return self
+
+    async def _shutdown(self, grace: float | None) -> None:
+        # 루프를 닫기 전에 gRPC 서버, 업스트림 스케줄러, 남은 태스크를 모두 정리
+        if self._server is not None:
+            await self._server.stop(grace)
+            self._server = None
+        if self.servicer.scheduler is not None:
+            await self.servicer.scheduler.close()
+        current = asyncio.current_task()
+        tasks = [task for task in asyncio.all_tasks() if task is not current]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await self._loop.shutdown_asyncgens()
+
+    def stop(self, grace: float | None = None) -> None:
+        """서버 및 이벤트 루프 종료"""
+        if self._thread.is_alive():
+            asyncio.run_coroutine_threadsafe(self._shutdown(grace), self._loop).result()
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+        self._loop.close()
+
+    def __enter__(self) -> BackgroundServer:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+
+def serve_in_background(
+    config: SyntheticConfig | None = None, host: str = "127.0.0.1", port: int = 0
+) -> BackgroundServer:
+    """백그라운드 스레드에서 합성 서버 시작"""
+    return BackgroundServer(config, host, port).start()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="합성 MarketDataService 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=50051)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--end-date", default="2024-12-31")
+    parser.add_argument("--history-bars", type=int, default=1260)
+    parser.add_argument("--intraday-days", type=int, default=5)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="기본 지연 중앙값")
+    parser.add_argument(
+        "--latency-distribution", default="lognormal", choices=("fixed", "uniform", "lognormal")
+    )
+    parser.add_argument("--latency-spread", type=float, default=0.5)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--symbol-error-rate", type=float, default=0.0)
+    parser.add_argument("--upstream-rate", type=float, default=None, help="업스트림 초당 요청 예산")
+    parser.add_argument("--upstream-burst", type=float, default=5.0)
+    args = parser.parse_args()
+
+    config = SyntheticConfig(
+        seed=args.seed,
+        end_date=args.end_date,
+        history_bars=args.history_bars,
+        intraday_days=args.intraday_days,
+        latency={
+            "*": LatencyProfile(args.latency_ms, args.latency_distribution, args.latency_spread)
+        },
+        error_rate=args.error_rate,
+        symbol_error_rate=args.symbol_error_rate,
+        upstream=(
+            ProviderBudget(args.upstream_rate, burst=args.upstream_burst)
+            if args.upstream_rate
+            else None
+        ),
+    )
+
+    async def _serve() -> None:
+        server, port = await start_server(
+            SyntheticMarketDataServicer(config), f"{args.host}:{args.port}"
+        )
+        print(f"synthetic market data server listening on {args.host}:{port}")
+        await server.wait_for_termination()
+
+    asyncio.run(_serve())
+
+
+if __name__ == "__main__":
+    main()
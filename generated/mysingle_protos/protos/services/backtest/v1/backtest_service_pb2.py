@@ -25,59 +25,159 @@ _sym_db = _symbol_database.Default()
 from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n2protos/services/backtest/v1/backtest_service.proto\x12\x08\x62\x61\x63ktest\x1a\x1fgoogle/protobuf/timestamp.proto\"\xd4\x01\n\x16\x45xecuteBacktestRequest\x12\x17\n\x07user_id\x18\x01 \x01(\tR\x06userId\x12\x1f\n\x0bstrategy_id\x18\x02 \x01(\tR\nstrategyId\x12\x35\n\x14strategy_version_seq\x18\x03 \x01(\x05H\x00R\x12strategyVersionSeq\x88\x01\x01\x12\x30\n\x06\x63onfig\x18\x04 \x01(\x0b\x32\x18.backtest.BacktestConfigR\x06\x63onfigB\x17\n\x15_strategy_version_seq\"\xcb\x05\n\x0e\x42\x61\x63ktestConfig\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x1a\n\x08interval\x18\x02 \x01(\tR\x08interval\x12\x1d\n\nstart_date\x18\x03 \x01(\tR\tstartDate\x12\x19\n\x08\x65nd_date\x18\x04 \x01(\tR\x07\x65ndDate\x12\'\n\x0finitial_capital\x18\x05 \x01(\x01R\x0einitialCapital\x12&\n\x0cslippage_bps\x18\x06 \x01(\x01H\x00R\x0bslippageBps\x88\x01\x01\x12\x35\n\x14\x63ommission_per_trade\x18\x07 \x01(\x01H\x01R\x12\x63ommissionPerTrade\x88\x01\x01\x12\'\n\rstop_loss_pct\x18\x08 \x01(\x01H\x02R\x0bstopLossPct\x88\x01\x01\x12+\n\x0ftake_profit_pct\x18\t \x01(\x01H\x03R\rtakeProfitPct\x88\x01\x01\x12/\n\x11max_position_size\x18\n \x01(\x01H\x04R\x0fmaxPositionSize\x88\x01\x01\x12<\n\x06params\x18\x0b \x03(\x0b\x32$.backtest.BacktestConfig.ParamsEntryR\x06params\x12?\n\x19snapshot_interval_seconds\x18\x0c \x01(\x05H\x05R\x17snapshotIntervalSeconds\x88\x01\x01\x1a\x39\n\x0bParamsEntry\x12\x10\n\x03key\x18\x01 \x01(\tR\x03key\x12\x14\n\x05value\x18\x02 \x01(\tR\x05value:\x02\x38\x01\x42\x0f\n\r_slippage_bpsB\x17\n\x15_commission_per_tradeB\x10\n\x0e_stop_loss_pctB\x12\n\x10_take_profit_pctB\x14\n\x12_max_position_sizeB\x1c\n\x1a_snapshot_interval_seconds\"T\n\x18GetBacktestResultRequest\x12\x1f\n\x0b\x62\x61\x63ktest_id\x18\x01 \x01(\tR\nbacktestId\x12\x17\n\x07user_id\x18\x02 \x01(\tR\x06userId\"Q\n\x15StreamProgressRequest\x12\x1f\n\x0b\x62\x61\x63ktest_id\x18\x01 \x01(\tR\nbacktestId\x12\x17\n\x07user_id\x18\x02 \x01(\tR\x06userId\"M\n\x11GetMetricsRequest\x12\x1f\n\x0b\x62\x61\x63ktest_id\x18\x01 \x01(\tR\nbacktestId\x12\x17\n\x07user_id\x18\x02 \x01(\tR\x06userId\"\xd4\x01\n\x14ListBacktestsRequest\x12\x17\n\x07user_id\x18\x01 \x01(\tR\x06userId\x12$\n\x0bstrategy_id\x18\x02 \x01(\tH\x00R\nstrategyId\x88\x01\x01\x12\x1b\n\x06status\x18\x03 \x01(\tH\x01R\x06status\x88\x01\x01\x12\x19\n\x05limit\x18\x04 \x01(\x05H\x02R\x05limit\x88\x01\x01\x12\x17\n\x04skip\x18\x05 \x01(\x05H\x03R\x04skip\x88\x01\x01\x42\x0e\n\x0c_strategy_idB\t\n\x07_statusB\x08\n\x06_limitB\x07\n\x05_skip\"Q\n\x15\x43\x61ncelBacktestRequest\x12\x1f\n\x0b\x62\x61\x63ktest_id\x18\x01 \x01(\tR\nbacktestId\x12\x17\n\x07user_id\x18\x02 \x01(\tR\x06userId\"\x14\n\x12HealthCheckRequest\"\xa7\x01\n\x17\x45xecuteBacktestResponse\x12\x1f\n\x0b\x62\x61\x63ktest_id\x18\x01 \x01(\tR\nbacktestId\x12\x16\n\x06status\x18\x02 \x01(\tR\x06status\x12\x18\n\x07message\x18\x03 \x01(\tR\x07message\x12\x39\n\ncreated_at\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\tcreatedAt\"\xec\x04\n\x16\x42\x61\x63ktestResultResponse\x12\x1f\n\x0b\x62\x61\x63ktest_id\x18\x01 \x01(\tR\nbacktestId\x12\x1f\n\x0bstrategy_id\x18\x02 \x01(\tR\nstrategyId\x12\x35\n\x14strategy_version_seq\x18\x03 \x01(\x05H\x00R\x12strategyVersionSeq\x88\x01\x01\x12\x16\n\x06status\x18\x04 \x01(\tR\x06status\x12;\n\x07metrics\x18\x05 \x01(\x0b\x32\x1c.backtest.PerformanceMetricsH\x01R\x07metrics\x88\x01\x01\x12\'\n\x06trades\x18\x06 \x03(\x0b\x32\x0f.backtest.TradeR\x06trades\x12\x38\n\x0c\x65quity_curve\x18\x07 \x03(\x0b\x32\x15.backtest.EquityPointR\x0b\x65quityCurve\x12\x30\n\x06\x63onfig\x18\x08 \x01(\x0b\x32\x18.backtest.BacktestConfigR\x06\x63onfig\x12\x39\n\ncreated_at\x18\t \x01(\x0b\x32\x1a.google.protobuf.TimestampR\tcreatedAt\x12\x42\n\x0c\x63ompleted_at\x18\n \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x02R\x0b\x63ompletedAt\x88\x01\x01\x12(\n\rerror_message\x18\x0b \x01(\tH\x03R\x0c\x65rrorMessage\x88\x01\x01\x42\x17\n\x15_strategy_version_seqB\n\n\x08_metricsB\x0f\n\r_completed_atB\x10\n\x0e_error_message\"\xa0\x02\n\x0eProgressUpdate\x12\x1f\n\x0b\x62\x61\x63ktest_id\x18\x01 \x01(\tR\nbacktestId\x12\x16\n\x06status\x18\x02 \x01(\tR\x06status\x12!\n\x0cprogress_pct\x18\x03 \x01(\x01R\x0bprogressPct\x12\x18\n\x07message\x18\x04 \x01(\tR\x07message\x12\x38\n\ttimestamp\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\ttimestamp\x12J\n\x0f\x63urrent_metrics\x18\x06 \x01(\x0b\x32\x1c.backtest.PerformanceMetricsH\x00R\x0e\x63urrentMetrics\x88\x01\x01\x42\x12\n\x10_current_metrics\"\xab\x01\n\x0fMetricsResponse\x12\x1f\n\x0b\x62\x61\x63ktest_id\x18\x01 \x01(\tR\nbacktestId\x12\x36\n\x07metrics\x18\x02 \x01(\x0b\x32\x1c.backtest.PerformanceMetricsR\x07metrics\x12?\n\rcalculated_at\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\x0c\x63\x61lculatedAt\"q\n\x15ListBacktestsResponse\x12\x37\n\tbacktests\x18\x01 \x03(\x0b\x32\x19.backtest.BacktestSummaryR\tbacktests\x12\x1f\n\x0btotal_count\x18\x02 \x01(\x05R\ntotalCount\"\xc8\x03\n\x0f\x42\x61\x63ktestSummary\x12\x1f\n\x0b\x62\x61\x63ktest_id\x18\x01 \x01(\tR\nbacktestId\x12\x1f\n\x0bstrategy_id\x18\x02 \x01(\tR\nstrategyId\x12\x35\n\x14strategy_version_seq\x18\x03 \x01(\x05H\x00R\x12strategyVersionSeq\x88\x01\x01\x12\x16\n\x06status\x18\x04 \x01(\tR\x06status\x12\x16\n\x06symbol\x18\x05 \x01(\tR\x06symbol\x12\x1a\n\x08interval\x18\x06 \x01(\tR\x08interval\x12\x39\n\ncreated_at\x18\x07 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\tcreatedAt\x12\x42\n\x0c\x63ompleted_at\x18\x08 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x01R\x0b\x63ompletedAt\x88\x01\x01\x12;\n\x07metrics\x18\t \x01(\x0b\x32\x1c.backtest.PerformanceMetricsH\x02R\x07metrics\x88\x01\x01\x42\x17\n\x15_strategy_version_seqB\x0f\n\r_completed_atB\n\n\x08_metrics\"k\n\x16\x43\x61ncelBacktestResponse\x12\x1f\n\x0b\x62\x61\x63ktest_id\x18\x01 \x01(\tR\nbacktestId\x12\x16\n\x06status\x18\x02 \x01(\tR\x06status\x12\x18\n\x07message\x18\x03 \x01(\tR\x07message\"\xa6\x02\n\x13HealthCheckResponse\x12\x16\n\x06status\x18\x01 \x01(\tR\x06status\x12!\n\x0cservice_name\x18\x02 \x01(\tR\x0bserviceName\x12\x18\n\x07version\x18\x03 \x01(\tR\x07version\x12\x38\n\ttimestamp\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\ttimestamp\x12\x44\n\x07\x64\x65tails\x18\x05 \x03(\x0b\x32*.backtest.HealthCheckResponse.DetailsEntryR\x07\x64\x65tails\x1a:\n\x0c\x44\x65tailsEntry\x12\x10\n\x03key\x18\x01 \x01(\tR\x03key\x12\x14\n\x05value\x18\x02 \x01(\tR\x05value:\x02\x38\x01\"\x89\x06\n\x12PerformanceMetrics\x12!\n\x0ctotal_return\x18\x01 \x01(\x01R\x0btotalReturn\x12#\n\rannual_return\x18\x02 \x01(\x01R\x0c\x61nnualReturn\x12!\n\x0csharpe_ratio\x18\x03 \x01(\x01R\x0bsharpeRatio\x12#\n\rsortino_ratio\x18\x04 \x01(\x01R\x0csortinoRatio\x12!\n\x0cmax_drawdown\x18\x05 \x01(\x01R\x0bmaxDrawdown\x12\x1e\n\nvolatility\x18\x06 \x01(\x01R\nvolatility\x12!\n\x0ctotal_trades\x18\x07 \x01(\x05R\x0btotalTrades\x12%\n\x0ewinning_trades\x18\x08 \x01(\x05R\rwinningTrades\x12#\n\rlosing_trades\x18\t \x01(\x05R\x0closingTrades\x12\x19\n\x08win_rate\x18\n \x01(\x01R\x07winRate\x12#\n\rprofit_factor\x18\x0b \x01(\x01R\x0cprofitFactor\x12\x1f\n\x0b\x61verage_win\x18\x0c \x01(\x01R\naverageWin\x12!\n\x0c\x61verage_loss\x18\r \x01(\x01R\x0b\x61verageLoss\x12\x1f\n\x0blargest_win\x18\x0e \x01(\x01R\nlargestWin\x12!\n\x0clargest_loss\x18\x0f \x01(\x01R\x0blargestLoss\x12?\n\x1c\x61verage_holding_period_hours\x18\x10 \x01(\x01R\x19\x61verageHoldingPeriodHours\x12\x30\n\x14max_consecutive_wins\x18\x11 \x01(\x01R\x12maxConsecutiveWins\x12\x34\n\x16max_consecutive_losses\x18\x12 \x01(\x01R\x14maxConsecutiveLosses\x12!\n\x0c\x66inal_equity\x18\x13 \x01(\x01R\x0b\x66inalEquity\x12\x1d\n\ntotal_fees\x18\x14 \x01(\x01R\ttotalFees\"\xc0\x02\n\x05Trade\x12\x38\n\ttimestamp\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\ttimestamp\x12\x16\n\x06symbol\x18\x02 \x01(\tR\x06symbol\x12\x12\n\x04side\x18\x03 \x01(\tR\x04side\x12\x1a\n\x08quantity\x18\x04 \x01(\x01R\x08quantity\x12\x14\n\x05price\x18\x05 \x01(\x01R\x05price\x12\x10\n\x03pnl\x18\x06 \x01(\x01R\x03pnl\x12\x1e\n\ncommission\x18\x07 \x01(\x01R\ncommission\x12\x1e\n\x08trade_id\x18\x08 \x01(\tH\x00R\x07tradeId\x88\x01\x01\x12,\n\x0fportfolio_value\x18\t \x01(\x01H\x01R\x0eportfolioValue\x88\x01\x01\x42\x0b\n\t_trade_idB\x12\n\x10_portfolio_value\"\xb8\x01\n\x0b\x45quityPoint\x12\x38\n\ttimestamp\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\ttimestamp\x12\x16\n\x06\x65quity\x18\x02 \x01(\x01R\x06\x65quity\x12\x1a\n\x08\x64rawdown\x18\x03 \x01(\x01R\x08\x64rawdown\x12\x12\n\x04\x63\x61sh\x18\x04 \x01(\x01R\x04\x63\x61sh\x12\'\n\x0fpositions_value\x18\x05 \x01(\x01R\x0epositionsValue2\xdc\x04\n\x0f\x42\x61\x63ktestService\x12V\n\x0f\x45xecuteBacktest\x12 .backtest.ExecuteBacktestRequest\x1a!.backtest.ExecuteBacktestResponse\x12Y\n\x11GetBacktestResult\x12\".backtest.GetBacktestResultRequest\x1a .backtest.BacktestResultResponse\x12U\n\x16StreamBacktestProgress\x12\x1f.backtest.StreamProgressRequest\x1a\x18.backtest.ProgressUpdate0\x01\x12L\n\x12GetBacktestMetrics\x12\x1b.backtest.GetMetricsRequest\x1a\x19.backtest.MetricsResponse\x12P\n\rListBacktests\x12\x1e.backtest.ListBacktestsRequest\x1a\x1f.backtest.ListBacktestsResponse\x12S\n\x0e\x43\x61ncelBacktest\x12\x1f.backtest.CancelBacktestRequest\x1a .backtest.CancelBacktestResponse\x12J\n\x0bHealthCheck\x12\x1c.backtest.HealthCheckRequest\x1a\x1d.backtest.HealthCheckResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n2protos/services/backtest/v1/backtest_service.proto\x12\x08\x62\x61\x63ktest\x1a\x1fgoogle/protobuf/timestamp.proto\"\xf2\x02\n\x16\x45xecuteBacktestRequest\x12\x17\n\x07user_id\x18\x01 \x01(\tR\x06userId\x12\x1f\n\x0bstrategy_id\x18\x02 \x01(\tR\nstrategyId\x12\x35\n\x14strategy_version_seq\x18\x03 \x01(\x05H\x00R\x12strategyVersionSeq\x88\x01\x01\x12\x30\n\x06\x63onfig\x18\x04 \x01(\x0b\x32\x18.backtest.BacktestConfigR\x06\x63onfig\x12/\n\x04lane\x18\x05 \x01(\x0e\x32\x16.backtest.BacktestLaneH\x01R\x04lane\x88\x01\x01\x12\x1f\n\x08priority\x18\x06 \x01(\x05H\x02R\x08priority\x88\x01\x01\x12$\n\x0b\x66orce_rerun\x18\x07 \x01(\x08H\x03R\nforceRerun\x88\x01\x01\x42\x17\n\x15_strategy_version_seqB\x07\n\x05_laneB\x0b\n\t_priorityB\x0e\n\x0c_force_rerun\"\xbf\x03\n\x1b\x45xecuteBacktestSweepRequest\x12\x17\n\x07user_id\x18\x01 \x01(\tR\x06userId\x12\x1f\n\x0bstrategy_id\x18\x02 \x01(\tR\nstrategyId\x12\x35\n\x14strategy_version_seq\x18\x03 \x01(\x05H\x00R\x12strategyVersionSeq\x88\x01\x01\x12\x39\n\x0b\x62\x61se_config\x18\x04 \x01(\x0b\x32\x18.backtest.BacktestConfigR\nbaseConfig\x12+\n\x04grid\x18\x05 \x03(\x0b\x32\x17.backtest.ParameterAxisR\x04grid\x12\x32\n\x08variants\x18\x06 \x03(\x0b\x32\x16.backtest.ParameterSetR\x08variants\x12,\n\x0fmax_parallelism\x18\x07 \x01(\x05H\x01R\x0emaxParallelism\x88\x01\x01\x12/\n\x04lane\x18\x08 \x01(\x0e\x32\x16.backtest.BacktestLaneH\x02R\x04lane\x88\x01\x01\x42\x17\n\x15_strategy_version_seqB\x12\n\x10_max_parallelismB\x07\n\x05_lane\";\n\rParameterAxis\x12\x12\n\x04name\x18\x01 \x01(\tR\x04name\x12\x16\n\x06values\x18\x02 \x03(\tR\x06values\"\x85\x01\n\x0cParameterSet\x12:\n\x06params\x18\x01 \x03(\x0b\x32\".backtest.ParameterSet.ParamsEntryR\x06params\x1a\x39\n\x0bParamsEntry\x12\x10\n\x03key\x18\x01 \x01(\tR\x03key\x12\x14\n\x05value\x18\x02 \x01(\tR\x05value:\x02\x38\x01\"\xbd\t\n\x0e\x42\x61\x63ktestConfig\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x1a\n\x08interval\x18\x02 \x01(\tR\x08interval\x12\x1d\n\nstart_date\x18\x03 \x01(\tR\tstartDate\x12\x19\n\x08\x65nd_date\x18\x04 \x01(\tR\x07\x65ndDate\x12\'\n\x0finitial_capital\x18\x05 \x01(\x01R\x0einitialCapital\x12&\n\x0cslippage_bps\x18\x06 \x01(\x01H\x00R\x0bslippageBps\x88\x01\x01\x12\x35\n\x14\x63ommission_per_trade\x18\x07 \x01(\x01H\x01R\x12\x63ommissionPerTrade\x88\x01\x01\x12\'\n\rstop_loss_pct\x18\x08 \x01(\x01H\x02R\x0bstopLossPct\x88\x01\x01\x12+\n\x0ftake_profit_pct\x18\t \x01(\x01H\x03R\rtakeProfitPct\x88\x01\x01\x12/\n\x11max_position_size\x18\n \x01(\x01H\x04R\x0fmaxPositionSize\x88\x01\x01\x12<\n\x06params\x18\x0b \x03(\x0b\x32$.backtest.BacktestConfig.ParamsEntryR\x06params\x12?\n\x19snapshot_interval_seconds\x18\x0c \x01(\x05H\x05R\x17snapshotIntervalSeconds\x88\x01\x01\x12\x30\n\x06\x61ssets\x18\r \x03(\x0b\x32\x18.backtest.PortfolioAssetR\x06\x61ssets\x12?\n\nallocation\x18\x0e \x01(\x0e\x32\x1a.backtest.AllocationMethodH\x06R\nallocation\x88\x01\x01\x12;\n\x17rebalance_interval_bars\x18\x0f \x01(\x05H\x07R\x15rebalanceIntervalBars\x88\x01\x01\x12\x34\n\x13rebalance_threshold\x18\x10 \x01(\x01H\x08R\x12rebalanceThreshold\x88\x01\x01\x12=\n\x18volatility_lookback_bars\x18\x11 \x01(\x05H\tR\x16volatilityLookbackBars\x88\x01\x01\x12%\n\x0bparallelism\x18\x12 \x01(\x05H\nR\x0bparallelism\x88\x01\x01\x12$\n\x0bwarmup_bars\x18\x13 \x01(\x05H\x0bR\nwarmupBars\x88\x01\x01\x1a\x39\n\x0bParamsEntry\x12\x10\n\x03key\x18\x01 \x01(\tR\x03key\x12\x14\n\x05value\x18\x02 \x01(\tR\x05value:\x02\x38\x01\x42\x0f\n\r_slippage_bpsB\x17\n\x15_commission_per_tradeB\x10\n\x0e_stop_loss_pctB\x12\n\x10_take_profit_pctB\x14\n\x12_max_position_sizeB\x1c\n\x1a_snapshot_interval_secondsB\r\n\x0b_allocationB\x1a\n\x18_rebalance_interval_barsB\x16\n\x14_rebalance_thresholdB\x1b\n\x19_volatility_lookback_barsB\x0e\n\x0c_parallelismB\x0e\n\x0c_warmup_bars\"\x83\x01\n\x0ePortfolioAsset\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x1b\n\x06weight\x18\x02 \x01(\x01H\x00R\x06weight\x88\x01\x01\x12\"\n\nmax_weight\x18\x03 \x01(\x01H\x01R\tmaxWeight\x88\x01\x01\x42\t\n\x07_weightB\r\n\x0b_max_weight\"\xb3\x02\n\x18GetBacktestResultRequest\x12\x1f\n\x0b\x62\x61\x63ktest_id\x18\x01 \x01(\tR\nbacktestId\x12\x17\n\x07user_id\x18\x02 \x01(\tR\x06userId\x12\"\n\nmax_points\x18\x03 \x01(\x05H\x00R\tmaxPoints\x88\x01\x01\x12L\n\x11\x64ownsample_method\x18\x04 \x01(\x0e\x32\x1a.backtest.DownsampleMethodH\x01R\x10\x64ownsampleMethod\x88\x01\x01\x12\x39\n\x08\x65ncoding\x18\x05 \x01(\x0e\x32\x18.backtest.ResultEncodingH\x02R\x08\x65ncoding\x88\x01\x01\x42\r\n\x0b_max_pointsB\x14\n\x12_downsample_methodB\x0b\n\t_encoding\"\xf7\x02\n\x1bStreamBacktestResultRequest\x12\x1f\n\x0b\x62\x61\x63ktest_id\x18\x01 \x01(\tR\nbacktestId\x12\x17\n\x07user_id\x18\x02 \x01(\tR\x06userId\x12\x30\n\x12max_rows_per_chunk\x18\x03 \x01(\x05H\x00R\x0fmaxRowsPerChunk\x88\x01\x01\x12*\n\x0einclude_trades\x18\x04 \x01(\x08H\x01R\rincludeTrades\x88\x01\x01\x12\x35\n\x14include_equity_curve\x18\x05 \x01(\x08H\x02R\x12includeEquityCurve\x88\x01\x01\x12\x39\n\x08\x65ncoding\x18\x06 \x01(\x0e\x32\x18.backtest.ResultEncodingH\x03R\x08\x65ncoding\x88\x01\x01\x42\x15\n\x13_max_rows_per_chunkB\x11\n\x0f_include_tradesB\x17\n\x15_include_equity_curveB\x0b\n\t_encoding\"\x8b\x02\n ExportBacktestResultArrowRequest\x12\x1f\n\x0b\x62\x61\x63ktest_id\x18\x01 \x01(\tR\nbacktestId\x12\x17\n\x07user_id\x18\x02 \x01(\tR\x06userId\x12-\n\x06tables\x18\x03 \x03(\x0e\x32\x15.backtest.ResultTableR\x06tables\x12\x30\n\x12max_rows_per_batch\x18\x04 \x01(\x05H\x00R\x0fmaxRowsPerBatch\x88\x01\x01\x12%\n\x0b\x63ompression\x18\x05 \x01(\tH\x01R\x0b\x63ompression\x88\x01\x01\x42\x15\n\x13_max_rows_per_batchB\x0e\n\x0c_compression\"\xf0\x05\n\x12QueryTradesRequest\x12\x1f\n\x0b\x62\x61\x63ktest_id\x18\x01 \x01(\tR\nbacktestId\x12\x17\n\x07user_id\x18\x02 \x01(\tR\x06userId\x12>\n\nstart_time\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x00R\tstartTime\x88\x01\x01\x12:\n\x08\x65nd_time\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x01R\x07\x65ndTime\x88\x01\x01\x12,\n\x04side\x18\x05 \x01(\x0e\x32\x13.backtest.TradeSideH\x02R\x04side\x88\x01\x01\x12\x18\n\x07symbols\x18\x06 \x03(\tR\x07symbols\x12\x1c\n\x07min_pnl\x18\x07 \x01(\x01H\x03R\x06minPnl\x88\x01\x01\x12\x1c\n\x07max_pnl\x18\x08 \x01(\x01H\x04R\x06maxPnl\x88\x01\x01\x12\x36\n\x07sort_by\x18\t \x01(\x0e\x32\x18.backtest.TradeSortFieldH\x05R\x06sortBy\x88\x01\x01\x12#\n\ndescending\x18\n \x01(\x08H\x06R\ndescending\x88\x01\x01\x12\x19\n\x05limit\x18\x0b \x01(\x05H\x07R\x05limit\x88\x01\x01\x12\"\n\npage_token\x18\x0c \x01(\tH\x08R\tpageToken\x88\x01\x01\x12\x39\n\x08\x65ncoding\x18\r \x01(\x0e\x32\x18.backtest.ResultEncodingH\tR\x08\x65ncoding\x88\x01\x01\x12\x33\n\x13include_total_count\x18\x0e \x01(\x08H\nR\x11includeTotalCount\x88\x01\x01\x42\r\n\x0b_start_timeB\x0b\n\t_end_timeB\x07\n\x05_sideB\n\n\x08_min_pnlB\n\n\x08_max_pnlB\n\n\x08_sort_byB\r\n\x0b_descendingB\x08\n\x06_limitB\r\n\x0b_page_tokenB\x0b\n\t_encodingB\x16\n\x14_include_total_count\"\xe1\x02\n\x15StreamProgressRequest\x12\x1f\n\x0b\x62\x61\x63ktest_id\x18\x01 \x01(\tR\nbacktestId\x12\x17\n\x07user_id\x18\x02 \x01(\tR\x06userId\x12-\n\x10resume_after_seq\x18\x03 \x01(\x03H\x00R\x0eresumeAfterSeq\x88\x01\x01\x12+\n\x0fmin_interval_ms\x18\x04 \x01(\x05H\x01R\rminIntervalMs\x88\x01\x01\x12\x31\n\x12min_progress_delta\x18\x05 \x01(\x01H\x02R\x10minProgressDelta\x88\x01\x01\x12+\n\x0fmetrics_every_n\x18\x06 \x01(\x05H\x03R\rmetricsEveryN\x88\x01\x01\x42\x13\n\x11_resume_after_seqB\x12\n\x10_min_interval_msB\x15\n\x13_min_progress_deltaB\x12\n\x10_metrics_every_n\"\xae\x03\n\x15WatchBacktestsRequest\x12\x17\n\x07user_id\x18\x01 \x01(\tR\x06userId\x12(\n\x10\x61\x64\x64_backtest_ids\x18\x02 \x03(\tR\x0e\x61\x64\x64\x42\x61\x63ktestIds\x12.\n\x13remove_backtest_ids\x18\x03 \x03(\tR\x11removeBacktestIds\x12$\n\x0bstrategy_id\x18\x04 \x01(\tH\x00R\nstrategyId\x88\x01\x01\x12 \n\twatch_all\x18\x05 \x01(\x08H\x01R\x08watchAll\x88\x01\x01\x12(\n\rclear_filters\x18\x06 \x01(\x08H\x02R\x0c\x63learFilters\x88\x01\x01\x12+\n\x0fmin_interval_ms\x18\x07 \x01(\x05H\x03R\rminIntervalMs\x88\x01\x01\x12+\n\x0fmetrics_every_n\x18\x08 \x01(\x05H\x04R\rmetricsEveryN\x88\x01\x01\x42\x0e\n\x0c_strategy_idB\x0c\n\n_watch_allB\x10\n\x0e_clear_filtersB\x12\n\x10_min_interval_msB\x12\n\x10_metrics_every_n\"\x8a\x03\n\x17\x43ompareBacktestsRequest\x12\x17\n\x07user_id\x18\x01 \x01(\tR\x06userId\x12!\n\x0c\x62\x61\x63ktest_ids\x18\x02 \x03(\tR\x0b\x62\x61\x63ktestIds\x12$\n\x0b\x62\x61seline_id\x18\x03 \x01(\tH\x00R\nbaselineId\x88\x01\x01\x12\"\n\nmax_points\x18\x04 \x01(\x05H\x01R\tmaxPoints\x88\x01\x01\x12\x32\n\x12\x63orrelation_window\x18\x05 \x01(\x05H\x02R\x11\x63orrelationWindow\x88\x01\x01\x12!\n\tnormalize\x18\x06 \x01(\x08H\x03R\tnormalize\x88\x01\x01\x12\x35\n\x14overlap_tolerance_ms\x18\x07 \x01(\x03H\x04R\x12overlapToleranceMs\x88\x01\x01\x42\x0e\n\x0c_baseline_idB\r\n\x0b_max_pointsB\x15\n\x13_correlation_windowB\x0c\n\n_normalizeB\x17\n\x15_overlap_tolerance_ms\"\xe2\x02\n\x14RunMonteCarloRequest\x12\x17\n\x07user_id\x18\x01 \x01(\tR\x06userId\x12\x1f\n\x0b\x62\x61\x63ktest_id\x18\x02 \x01(\tR\nbacktestId\x12#\n\niterations\x18\x03 \x01(\x05H\x00R\niterations\x88\x01\x01\x12\x32\n\x06method\x18\x04 \x01(\x0e\x32\x1a.backtest.MonteCarloMethodR\x06method\x12\x17\n\x04seed\x18\x05 \x01(\x03H\x01R\x04seed\x88\x01\x01\x12\"\n\nblock_size\x18\x06 \x01(\x05H\x02R\tblockSize\x88\x01\x01\x12 \n\x0bpercentiles\x18\x07 \x03(\x01R\x0bpercentiles\x12\"\n\nmax_points\x18\x08 \x01(\x05H\x03R\tmaxPoints\x88\x01\x01\x42\r\n\x0b_iterationsB\x07\n\x05_seedB\r\n\x0b_block_sizeB\r\n\x0b_max_points\"M\n\x11GetMetricsRequest\x12\x1f\n\x0b\x62\x61\x63ktest_id\x18\x01 \x01(\tR\nbacktestId\x12\x17\n\x07user_id\x18\x02 \x01(\tR\x06userId\"\x85\x02\n\x18GetRollingMetricsRequest\x12\x1f\n\x0b\x62\x61\x63ktest_id\x18\x01 \x01(\tR\nbacktestId\x12\x17\n\x07user_id\x18\x02 \x01(\tR\x06userId\x12\x18\n\x07windows\x18\x03 \x03(\x05R\x07windows\x12\"\n\nmax_points\x18\x04 \x01(\x05H\x00R\tmaxPoints\x88\x01\x01\x12L\n\x11\x64ownsample_method\x18\x05 \x01(\x0e\x32\x1a.backtest.DownsampleMethodH\x01R\x10\x64ownsampleMethod\x88\x01\x01\x42\r\n\x0b_max_pointsB\x14\n\x12_downsample_method\"\xad\x04\n\x14ListBacktestsRequest\x12\x17\n\x07user_id\x18\x01 \x01(\tR\x06userId\x12$\n\x0bstrategy_id\x18\x02 \x01(\tH\x00R\nstrategyId\x88\x01\x01\x12\x1b\n\x06status\x18\x03 \x01(\tH\x01R\x06status\x88\x01\x01\x12\x19\n\x05limit\x18\x04 \x01(\x05H\x02R\x05limit\x88\x01\x01\x12\x17\n\x04skip\x18\x05 \x01(\x05H\x03R\x04skip\x88\x01\x01\x12\"\n\nmax_points\x18\x06 \x01(\x05H\x04R\tmaxPoints\x88\x01\x01\x12L\n\x11\x64ownsample_method\x18\x07 \x01(\x0e\x32\x1a.backtest.DownsampleMethodH\x05R\x10\x64ownsampleMethod\x88\x01\x01\x12\"\n\npage_token\x18\x08 \x01(\tH\x06R\tpageToken\x88\x01\x01\x12,\n\x0finclude_metrics\x18\t \x01(\x08H\x07R\x0eincludeMetrics\x88\x01\x01\x12\x33\n\x13include_total_count\x18\n \x01(\x08H\x08R\x11includeTotalCount\x88\x01\x01\x42\x0e\n\x0c_strategy_idB\t\n\x07_statusB\x08\n\x06_limitB\x07\n\x05_skipB\r\n\x0b_max_pointsB\x14\n\x12_downsample_methodB\r\n\x0b_page_tokenB\x12\n\x10_include_metricsB\x16\n\x14_include_total_count\"Q\n\x15\x43\x61ncelBacktestRequest\x12\x1f\n\x0b\x62\x61\x63ktest_id\x18\x01 \x01(\tR\nbacktestId\x12\x17\n\x07user_id\x18\x02 \x01(\tR\x06userId\"\xb9\x01\n\x15ResumeBacktestRequest\x12\x1f\n\x0b\x62\x61\x63ktest_id\x18\x01 \x01(\tR\nbacktestId\x12\x17\n\x07user_id\x18\x02 \x01(\tR\x06userId\x12/\n\x04lane\x18\x03 \x01(\x0e\x32\x16.backtest.BacktestLaneH\x00R\x04lane\x88\x01\x01\x12\x1f\n\x08priority\x18\x04 \x01(\x05H\x01R\x08priority\x88\x01\x01\x42\x07\n\x05_laneB\x0b\n\t_priority\"P\n\x14GetQueueStatsRequest\x12/\n\x04lane\x18\x01 \x01(\x0e\x32\x16.backtest.BacktestLaneH\x00R\x04lane\x88\x01\x01\x42\x07\n\x05_lane\"\x14\n\x12HealthCheckRequest\"\xae\x02\n\x17\x45xecuteBacktestResponse\x12\x1f\n\x0b\x62\x61\x63ktest_id\x18\x01 \x01(\tR\nbacktestId\x12\x16\n\x06status\x18\x02 \x01(\tR\x06status\x12\x18\n\x07message\x18\x03 \x01(\tR\x07message\x12\x39\n\ncreated_at\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\tcreatedAt\x12*\n\x04lane\x18\x05 \x01(\x0e\x32\x16.backtest.BacktestLaneR\x04lane\x12*\n\x0equeue_position\x18\x06 \x01(\x05H\x00R\rqueuePosition\x88\x01\x01\x12\x1a\n\x08memoized\x18\x07 \x01(\x08R\x08memoizedB\x11\n\x0f_queue_position\"\xda\x01\n\x1c\x45xecuteBacktestSweepResponse\x12\x19\n\x08sweep_id\x18\x01 \x01(\tR\x07sweepId\x12\x16\n\x06status\x18\x02 \x01(\tR\x06status\x12\x18\n\x07message\x18\x03 \x01(\tR\x07message\x12\x32\n\x08variants\x18\x04 \x03(\x0b\x32\x16.backtest.SweepVariantR\x08variants\x12\x39\n\ncreated_at\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\tcreatedAt\"\xbc\x01\n\x0cSweepVariant\x12\x14\n\x05index\x18\x01 \x01(\x05R\x05index\x12\x1f\n\x0b\x62\x61\x63ktest_id\x18\x02 \x01(\tR\nbacktestId\x12:\n\x06params\x18\x03 \x03(\x0b\x32\".backtest.SweepVariant.ParamsEntryR\x06params\x1a\x39\n\x0bParamsEntry\x12\x10\n\x03key\x18\x01 \x01(\tR\x03key\x12\x14\n\x05value\x18\x02 \x01(\tR\x05value:\x02\x38\x01\"\xd4\x06\n\x16\x42\x61\x63ktestResultResponse\x12\x1f\n\x0b\x62\x61\x63ktest_id\x18\x01 \x01(\tR\nbacktestId\x12\x1f\n\x0bstrategy_id\x18\x02 \x01(\tR\nstrategyId\x12\x35\n\x14strategy_version_seq\x18\x03 \x01(\x05H\x00R\x12strategyVersionSeq\x88\x01\x01\x12\x16\n\x06status\x18\x04 \x01(\tR\x06status\x12;\n\x07metrics\x18\x05 \x01(\x0b\x32\x1c.backtest.PerformanceMetricsH\x01R\x07metrics\x88\x01\x01\x12\'\n\x06trades\x18\x06 \x03(\x0b\x32\x0f.backtest.TradeR\x06trades\x12\x38\n\x0c\x65quity_curve\x18\x07 \x03(\x0b\x32\x15.backtest.EquityPointR\x0b\x65quityCurve\x12\x30\n\x06\x63onfig\x18\x08 \x01(\x0b\x32\x18.backtest.BacktestConfigR\x06\x63onfig\x12\x39\n\ncreated_at\x18\t \x01(\x0b\x32\x1a.google.protobuf.TimestampR\tcreatedAt\x12\x42\n\x0c\x63ompleted_at\x18\n \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x02R\x0b\x63ompletedAt\x88\x01\x01\x12(\n\rerror_message\x18\x0b \x01(\tH\x03R\x0c\x65rrorMessage\x88\x01\x01\x12@\n\rtrade_columns\x18\x0c \x01(\x0b\x32\x16.backtest.TradeColumnsH\x04R\x0ctradeColumns\x88\x01\x01\x12\x43\n\x0e\x65quity_columns\x18\r \x01(\x0b\x32\x17.backtest.EquityColumnsH\x05R\requityColumns\x88\x01\x01\x12:\n\rasset_results\x18\x0e \x03(\x0b\x32\x15.backtest.AssetResultR\x0c\x61ssetResultsB\x17\n\x15_strategy_version_seqB\n\n\x08_metricsB\x0f\n\r_completed_atB\x10\n\x0e_error_messageB\x10\n\x0e_trade_columnsB\x11\n\x0f_equity_columns\"\xe1\x01\n\x13\x42\x61\x63ktestResultChunk\x12\x10\n\x03seq\x18\x01 \x01(\x03R\x03seq\x12\x38\n\x06header\x18\x02 \x01(\x0b\x32\x1e.backtest.BacktestResultHeaderH\x00R\x06header\x12.\n\x06trades\x18\x03 \x01(\x0b\x32\x14.backtest.TradeChunkH\x00R\x06trades\x12/\n\x06\x65quity\x18\x04 \x01(\x0b\x32\x15.backtest.EquityChunkH\x00R\x06\x65quity\x12\x12\n\x04last\x18\x05 \x01(\x08R\x04lastB\t\n\x07payload\"\x96\x05\n\x14\x42\x61\x63ktestResultHeader\x12\x1f\n\x0b\x62\x61\x63ktest_id\x18\x01 \x01(\tR\nbacktestId\x12\x1f\n\x0bstrategy_id\x18\x02 \x01(\tR\nstrategyId\x12\x35\n\x14strategy_version_seq\x18\x03 \x01(\x05H\x00R\x12strategyVersionSeq\x88\x01\x01\x12\x16\n\x06status\x18\x04 \x01(\tR\x06status\x12;\n\x07metrics\x18\x05 \x01(\x0b\x32\x1c.backtest.PerformanceMetricsH\x01R\x07metrics\x88\x01\x01\x12\x30\n\x06\x63onfig\x18\x06 \x01(\x0b\x32\x18.backtest.BacktestConfigR\x06\x63onfig\x12\x39\n\ncreated_at\x18\x07 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\tcreatedAt\x12\x42\n\x0c\x63ompleted_at\x18\x08 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x02R\x0b\x63ompletedAt\x88\x01\x01\x12(\n\rerror_message\x18\t \x01(\tH\x03R\x0c\x65rrorMessage\x88\x01\x01\x12!\n\x0ctotal_trades\x18\n \x01(\x03R\x0btotalTrades\x12.\n\x13total_equity_points\x18\x0b \x01(\x03R\x11totalEquityPoints\x12:\n\rasset_results\x18\x0c \x03(\x0b\x32\x15.backtest.AssetResultR\x0c\x61ssetResultsB\x17\n\x15_strategy_version_seqB\n\n\x08_metricsB\x0f\n\r_completed_atB\x10\n\x0e_error_message\"\x90\x01\n\nTradeChunk\x12\x16\n\x06offset\x18\x01 \x01(\x03R\x06offset\x12\'\n\x06trades\x18\x02 \x03(\x0b\x32\x0f.backtest.TradeR\x06trades\x12\x35\n\x07\x63olumns\x18\x03 \x01(\x0b\x32\x16.backtest.TradeColumnsH\x00R\x07\x63olumns\x88\x01\x01\x42\n\n\x08_columns\"\x98\x01\n\x0b\x45quityChunk\x12\x16\n\x06offset\x18\x01 \x01(\x03R\x06offset\x12-\n\x06points\x18\x02 \x03(\x0b\x32\x15.backtest.EquityPointR\x06points\x12\x36\n\x07\x63olumns\x18\x03 \x01(\x0b\x32\x17.backtest.EquityColumnsH\x00R\x07\x63olumns\x88\x01\x01\x42\n\n\x08_columns\"\xb1\x01\n\x15\x41rrowRecordBatchChunk\x12+\n\x05table\x18\x01 \x01(\x0e\x32\x15.backtest.ResultTableR\x05table\x12\x1d\n\nrow_offset\x18\x02 \x01(\x03R\trowOffset\x12\x19\n\x08num_rows\x18\x03 \x01(\x03R\x07numRows\x12\x1d\n\nipc_stream\x18\x04 \x01(\x0cR\tipcStream\x12\x12\n\x04last\x18\x05 \x01(\x08R\x04last\"\x9d\x02\n\x13QueryTradesResponse\x12\x1f\n\x0b\x62\x61\x63ktest_id\x18\x01 \x01(\tR\nbacktestId\x12\'\n\x06trades\x18\x02 \x03(\x0b\x32\x0f.backtest.TradeR\x06trades\x12@\n\rtrade_columns\x18\x03 \x01(\x0b\x32\x16.backtest.TradeColumnsH\x00R\x0ctradeColumns\x88\x01\x01\x12\x1f\n\x0btrade_index\x18\x04 \x03(\x03R\ntradeIndex\x12\x1f\n\x0btotal_count\x18\x05 \x01(\x03R\ntotalCount\x12&\n\x0fnext_page_token\x18\x06 \x01(\tR\rnextPageTokenB\x10\n\x0e_trade_columns\"\xb2\x02\n\x0eProgressUpdate\x12\x1f\n\x0b\x62\x61\x63ktest_id\x18\x01 \x01(\tR\nbacktestId\x12\x16\n\x06status\x18\x02 \x01(\tR\x06status\x12!\n\x0cprogress_pct\x18\x03 \x01(\x01R\x0bprogressPct\x12\x18\n\x07message\x18\x04 \x01(\tR\x07message\x12\x38\n\ttimestamp\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\ttimestamp\x12J\n\x0f\x63urrent_metrics\x18\x06 \x01(\x0b\x32\x1c.backtest.PerformanceMetricsH\x00R\x0e\x63urrentMetrics\x88\x01\x01\x12\x10\n\x03seq\x18\x07 \x01(\x03R\x03seqB\x12\n\x10_current_metrics\"\x85\x01\n\x16WatchBacktestsResponse\x12\x32\n\x07updates\x18\x01 \x03(\x0b\x32\x18.backtest.ProgressUpdateR\x07updates\x12\x1a\n\x08watching\x18\x02 \x03(\tR\x08watching\x12\x1b\n\tnot_found\x18\x03 \x03(\tR\x08notFound\"\xe6\x02\n\x18\x43ompareBacktestsResponse\x12!\n\x0c\x62\x61\x63ktest_ids\x18\x01 \x03(\tR\x0b\x62\x61\x63ktestIds\x12\x1f\n\x0b\x62\x61seline_id\x18\x02 \x01(\tR\nbaselineId\x12!\n\x0ctimestamp_ns\x18\x03 \x03(\x10R\x0btimestampNs\x12/\n\x06\x65quity\x18\x04 \x03(\x0b\x32\x17.backtest.AlignedSeriesR\x06\x65quity\x12\x34\n\x07metrics\x18\x05 \x03(\x0b\x32\x1a.backtest.MetricComparisonR\x07metrics\x12=\n\x0c\x63orrelations\x18\x06 \x03(\x0b\x32\x19.backtest.PairCorrelationR\x0c\x63orrelations\x12=\n\x0etrade_overlaps\x18\x07 \x03(\x0b\x32\x16.backtest.TradeOverlapR\rtradeOverlaps\"\x93\x04\n\x12MonteCarloResponse\x12\x1f\n\x0b\x62\x61\x63ktest_id\x18\x01 \x01(\tR\nbacktestId\x12\x32\n\x06method\x18\x02 \x01(\x0e\x32\x1a.backtest.MonteCarloMethodR\x06method\x12\x1e\n\niterations\x18\x03 \x01(\x05R\niterations\x12\x12\n\x04seed\x18\x04 \x01(\x03R\x04seed\x12 \n\x0bpercentiles\x18\x05 \x03(\x01R\x0bpercentiles\x12\x14\n\x05steps\x18\x06 \x03(\x05R\x05steps\x12;\n\x0c\x65quity_bands\x18\x07 \x03(\x0b\x32\x18.backtest.PercentileBandR\x0b\x65quityBands\x12!\n\x0cmax_drawdown\x18\x08 \x03(\x01R\x0bmaxDrawdown\x12!\n\x0c\x66inal_equity\x18\t \x03(\x01R\x0b\x66inalEquity\x12!\n\x0ctotal_return\x18\n \x03(\x01R\x0btotalReturn\x12.\n\x13probability_of_loss\x18\x0b \x01(\x01R\x11probabilityOfLoss\x12\x32\n\x15original_max_drawdown\x18\x0c \x01(\x01R\x13originalMaxDrawdown\x12\x32\n\x15original_final_equity\x18\r \x01(\x01R\x13originalFinalEquity\"\xab\x01\n\x0fMetricsResponse\x12\x1f\n\x0b\x62\x61\x63ktest_id\x18\x01 \x01(\tR\nbacktestId\x12\x36\n\x07metrics\x18\x02 \x01(\x0b\x32\x1c.backtest.PerformanceMetricsR\x07metrics\x12?\n\rcalculated_at\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\x0c\x63\x61lculatedAt\"\xbd\x01\n\x16RollingMetricsResponse\x12\x1f\n\x0b\x62\x61\x63ktest_id\x18\x01 \x01(\tR\nbacktestId\x12!\n\x0ctimestamp_ns\x18\x02 \x03(\x10R\x0btimestampNs\x12\x35\n\x06series\x18\x03 \x03(\x0b\x32\x1d.backtest.RollingWindowSeriesR\x06series\x12(\n\x10periods_per_year\x18\x04 \x01(\x01R\x0eperiodsPerYear\"\x99\x01\n\x15ListBacktestsResponse\x12\x37\n\tbacktests\x18\x01 \x03(\x0b\x32\x19.backtest.BacktestSummaryR\tbacktests\x12\x1f\n\x0btotal_count\x18\x02 \x01(\x05R\ntotalCount\x12&\n\x0fnext_page_token\x18\x03 \x01(\tR\rnextPageToken\"\x82\x04\n\x0f\x42\x61\x63ktestSummary\x12\x1f\n\x0b\x62\x61\x63ktest_id\x18\x01 \x01(\tR\nbacktestId\x12\x1f\n\x0bstrategy_id\x18\x02 \x01(\tR\nstrategyId\x12\x35\n\x14strategy_version_seq\x18\x03 \x01(\x05H\x00R\x12strategyVersionSeq\x88\x01\x01\x12\x16\n\x06status\x18\x04 \x01(\tR\x06status\x12\x16\n\x06symbol\x18\x05 \x01(\tR\x06symbol\x12\x1a\n\x08interval\x18\x06 \x01(\tR\x08interval\x12\x39\n\ncreated_at\x18\x07 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\tcreatedAt\x12\x42\n\x0c\x63ompleted_at\x18\x08 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x01R\x0b\x63ompletedAt\x88\x01\x01\x12;\n\x07metrics\x18\t \x01(\x0b\x32\x1c.backtest.PerformanceMetricsH\x02R\x07metrics\x88\x01\x01\x12\x38\n\x0c\x65quity_curve\x18\n \x03(\x0b\x32\x15.backtest.EquityPointR\x0b\x65quityCurveB\x17\n\x15_strategy_version_seqB\x0f\n\r_completed_atB\n\n\x08_metrics\"k\n\x16\x43\x61ncelBacktestResponse\x12\x1f\n\x0b\x62\x61\x63ktest_id\x18\x01 \x01(\tR\nbacktestId\x12\x16\n\x06status\x18\x02 \x01(\tR\x06status\x12\x18\n\x07message\x18\x03 \x01(\tR\x07message\"\x86\x03\n\x16ResumeBacktestResponse\x12\x1f\n\x0b\x62\x61\x63ktest_id\x18\x01 \x01(\tR\nbacktestId\x12\x16\n\x06status\x18\x02 \x01(\tR\x06status\x12\x18\n\x07message\x18\x03 \x01(\tR\x07message\x12*\n\x04lane\x18\x04 \x01(\x0e\x32\x16.backtest.BacktestLaneR\x04lane\x12*\n\x0equeue_position\x18\x05 \x01(\x05H\x00R\rqueuePosition\x88\x01\x01\x12(\n\x10resumed_from_bar\x18\x06 \x01(\x03R\x0eresumedFromBar\x12(\n\x10resumed_from_pct\x18\x07 \x01(\x01R\x0eresumedFromPct\x12\x19\n\x08last_seq\x18\x08 \x01(\x03R\x07lastSeq\x12?\n\rcheckpoint_at\x18\t \x01(\x0b\x32\x1a.google.protobuf.TimestampR\x0c\x63heckpointAtB\x11\n\x0f_queue_position\"\xb9\x02\n\nQueueStats\x12)\n\x05lanes\x18\x01 \x03(\x0b\x32\x13.backtest.LaneStatsR\x05lanes\x12\x18\n\x07workers\x18\x02 \x01(\x05R\x07workers\x12!\n\x0c\x62usy_workers\x18\x03 \x01(\x05R\x0b\x62usyWorkers\x12@\n\x1creserved_interactive_workers\x18\x04 \x01(\x05R\x1areservedInteractiveWorkers\x12 \n\x0butilization\x18\x05 \x01(\x01R\x0butilization\x12%\n\x0ewindow_seconds\x18\x06 \x01(\x01R\rwindowSeconds\x12\x38\n\ttimestamp\x18\x07 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\ttimestamp\"\xa6\x02\n\x13HealthCheckResponse\x12\x16\n\x06status\x18\x01 \x01(\tR\x06status\x12!\n\x0cservice_name\x18\x02 \x01(\tR\x0bserviceName\x12\x18\n\x07version\x18\x03 \x01(\tR\x07version\x12\x38\n\ttimestamp\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\ttimestamp\x12\x44\n\x07\x64\x65tails\x18\x05 \x03(\x0b\x32*.backtest.HealthCheckResponse.DetailsEntryR\x07\x64\x65tails\x1a:\n\x0c\x44\x65tailsEntry\x12\x10\n\x03key\x18\x01 \x01(\tR\x03key\x12\x14\n\x05value\x18\x02 \x01(\tR\x05value:\x02\x38\x01\"H\n\x0ePercentileBand\x12\x1e\n\npercentile\x18\x01 \x01(\x01R\npercentile\x12\x16\n\x06values\x18\x02 \x03(\x01R\x06values\"H\n\rAlignedSeries\x12\x1f\n\x0b\x62\x61\x63ktest_id\x18\x01 \x01(\tR\nbacktestId\x12\x16\n\x06values\x18\x02 \x03(\x01R\x06values\"\x9f\x01\n\x10MetricComparison\x12\x1f\n\x0b\x62\x61\x63ktest_id\x18\x01 \x01(\tR\nbacktestId\x12\x36\n\x07metrics\x18\x02 \x01(\x0b\x32\x1c.backtest.PerformanceMetricsR\x07metrics\x12\x32\n\x05\x64\x65lta\x18\x03 \x01(\x0b\x32\x1c.backtest.PerformanceMetricsR\x05\x64\x65lta\"\x8d\x01\n\x0fPairCorrelation\x12\"\n\rbacktest_id_a\x18\x01 \x01(\tR\x0b\x62\x61\x63ktestIdA\x12\"\n\rbacktest_id_b\x18\x02 \x01(\tR\x0b\x62\x61\x63ktestIdB\x12\x18\n\x07rolling\x18\x03 \x03(\x01R\x07rolling\x12\x18\n\x07overall\x18\x04 \x01(\x01R\x07overall\"\xbe\x01\n\x0cTradeOverlap\x12\"\n\rbacktest_id_a\x18\x01 \x01(\tR\x0b\x62\x61\x63ktestIdA\x12\"\n\rbacktest_id_b\x18\x02 \x01(\tR\x0b\x62\x61\x63ktestIdB\x12\x19\n\x08trades_a\x18\x03 \x01(\x05R\x07tradesA\x12\x19\n\x08trades_b\x18\x04 \x01(\x05R\x07tradesB\x12\x16\n\x06shared\x18\x05 \x01(\x05R\x06shared\x12\x18\n\x07jaccard\x18\x06 \x01(\x01R\x07jaccard\"\xa7\x01\n\x13RollingWindowSeries\x12\x16\n\x06window\x18\x01 \x01(\x05R\x06window\x12!\n\x0csharpe_ratio\x18\x02 \x03(\x01R\x0bsharpeRatio\x12\x1e\n\nvolatility\x18\x03 \x03(\x01R\nvolatility\x12\x1a\n\x08\x64rawdown\x18\x04 \x03(\x01R\x08\x64rawdown\x12\x19\n\x08win_rate\x18\x05 \x03(\x01R\x07winRate\"\xa2\x05\n\x12\x42\x61\x63ktestCheckpoint\x12\x1f\n\x0b\x62\x61\x63ktest_id\x18\x01 \x01(\tR\nbacktestId\x12\x17\n\x07user_id\x18\x02 \x01(\tR\x06userId\x12\x1f\n\x0bstrategy_id\x18\x03 \x01(\tR\nstrategyId\x12\x35\n\x14strategy_version_seq\x18\x04 \x01(\x05H\x00R\x12strategyVersionSeq\x88\x01\x01\x12\x30\n\x06\x63onfig\x18\x05 \x01(\x0b\x32\x18.backtest.BacktestConfigR\x06\x63onfig\x12@\n\x0ejob_created_at\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\x0cjobCreatedAt\x12\x1b\n\tbars_done\x18\x07 \x01(\x03R\x08\x62\x61rsDone\x12\x1d\n\ntotal_bars\x18\x08 \x01(\x03R\ttotalBars\x12!\n\x0cprogress_pct\x18\t \x01(\x01R\x0bprogressPct\x12\x39\n\x0blast_update\x18\n \x01(\x0b\x32\x18.backtest.ProgressUpdateR\nlastUpdate\x12\x39\n\ncreated_at\x18\x0b \x01(\x0b\x32\x1a.google.protobuf.TimestampR\tcreatedAt\x12!\n\x0cstate_format\x18\x0c \x01(\tR\x0bstateFormat\x12\x14\n\x05state\x18\r \x01(\x0cR\x05state\x12\x19\n\x08owner_id\x18\x0e \x01(\tR\x07ownerId\x12\x44\n\x10lease_expires_at\x18\x0f \x01(\x0b\x32\x1a.google.protobuf.TimestampR\x0eleaseExpiresAtB\x17\n\x15_strategy_version_seq\"\xcd\x02\n\tLaneStats\x12*\n\x04lane\x18\x01 \x01(\x0e\x32\x16.backtest.BacktestLaneR\x04lane\x12\x1f\n\x0bqueue_depth\x18\x02 \x01(\x05R\nqueueDepth\x12\x18\n\x07running\x18\x03 \x01(\x05R\x07running\x12!\n\x0cqueued_users\x18\x04 \x01(\x05R\x0bqueuedUsers\x12\x18\n\x07started\x18\x05 \x01(\x03R\x07started\x12\x1a\n\x08\x66inished\x18\x06 \x01(\x03R\x08\x66inished\x12\x1e\n\x0bwait_ms_p50\x18\x07 \x01(\x01R\twaitMsP50\x12\x1e\n\x0bwait_ms_p95\x18\x08 \x01(\x01R\twaitMsP95\x12\x1e\n\x0bwait_ms_p99\x18\t \x01(\x01R\twaitMsP99\x12 \n\x0butilization\x18\n \x01(\x01R\x0butilization\"\x97\x02\n\x0b\x41ssetResult\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x36\n\x07metrics\x18\x02 \x01(\x0b\x32\x1c.backtest.PerformanceMetricsR\x07metrics\x12\x1f\n\x0b\x66inal_value\x18\x03 \x01(\x01R\nfinalValue\x12!\n\x0c\x66inal_weight\x18\x04 \x01(\x01R\x0b\x66inalWeight\x12\x10\n\x03pnl\x18\x05 \x01(\x01R\x03pnl\x12\x1d\n\ntotal_fees\x18\x06 \x01(\x01R\ttotalFees\x12\x1f\n\x0btrade_count\x18\x07 \x01(\x05R\ntradeCount\x12\"\n\x0c\x63ontribution\x18\x08 \x01(\x01R\x0c\x63ontribution\"\x89\x06\n\x12PerformanceMetrics\x12!\n\x0ctotal_return\x18\x01 \x01(\x01R\x0btotalReturn\x12#\n\rannual_return\x18\x02 \x01(\x01R\x0c\x61nnualReturn\x12!\n\x0csharpe_ratio\x18\x03 \x01(\x01R\x0bsharpeRatio\x12#\n\rsortino_ratio\x18\x04 \x01(\x01R\x0csortinoRatio\x12!\n\x0cmax_drawdown\x18\x05 \x01(\x01R\x0bmaxDrawdown\x12\x1e\n\nvolatility\x18\x06 \x01(\x01R\nvolatility\x12!\n\x0ctotal_trades\x18\x07 \x01(\x05R\x0btotalTrades\x12%\n\x0ewinning_trades\x18\x08 \x01(\x05R\rwinningTrades\x12#\n\rlosing_trades\x18\t \x01(\x05R\x0closingTrades\x12\x19\n\x08win_rate\x18\n \x01(\x01R\x07winRate\x12#\n\rprofit_factor\x18\x0b \x01(\x01R\x0cprofitFactor\x12\x1f\n\x0b\x61verage_win\x18\x0c \x01(\x01R\naverageWin\x12!\n\x0c\x61verage_loss\x18\r \x01(\x01R\x0b\x61verageLoss\x12\x1f\n\x0blargest_win\x18\x0e \x01(\x01R\nlargestWin\x12!\n\x0clargest_loss\x18\x0f \x01(\x01R\x0blargestLoss\x12?\n\x1c\x61verage_holding_period_hours\x18\x10 \x01(\x01R\x19\x61verageHoldingPeriodHours\x12\x30\n\x14max_consecutive_wins\x18\x11 \x01(\x01R\x12maxConsecutiveWins\x12\x34\n\x16max_consecutive_losses\x18\x12 \x01(\x01R\x14maxConsecutiveLosses\x12!\n\x0c\x66inal_equity\x18\x13 \x01(\x01R\x0b\x66inalEquity\x12\x1d\n\ntotal_fees\x18\x14 \x01(\x01R\ttotalFees\"\xc0\x02\n\x05Trade\x12\x38\n\ttimestamp\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\ttimestamp\x12\x16\n\x06symbol\x18\x02 \x01(\tR\x06symbol\x12\x12\n\x04side\x18\x03 \x01(\tR\x04side\x12\x1a\n\x08quantity\x18\x04 \x01(\x01R\x08quantity\x12\x14\n\x05price\x18\x05 \x01(\x01R\x05price\x12\x10\n\x03pnl\x18\x06 \x01(\x01R\x03pnl\x12\x1e\n\ncommission\x18\x07 \x01(\x01R\ncommission\x12\x1e\n\x08trade_id\x18\x08 \x01(\tH\x00R\x07tradeId\x88\x01\x01\x12,\n\x0fportfolio_value\x18\t \x01(\x01H\x01R\x0eportfolioValue\x88\x01\x01\x42\x0b\n\t_trade_idB\x12\n\x10_portfolio_value\"\xbf\x02\n\x0cTradeColumns\x12!\n\x0ctimestamp_ns\x18\x01 \x03(\x10R\x0btimestampNs\x12!\n\x0csymbol_index\x18\x02 \x03(\x05R\x0bsymbolIndex\x12\x18\n\x07symbols\x18\x03 \x03(\tR\x07symbols\x12\'\n\x04side\x18\x04 \x03(\x0e\x32\x13.backtest.TradeSideR\x04side\x12\x1a\n\x08quantity\x18\x05 \x03(\x01R\x08quantity\x12\x14\n\x05price\x18\x06 \x03(\x01R\x05price\x12\x10\n\x03pnl\x18\x07 \x03(\x01R\x03pnl\x12\x1e\n\ncommission\x18\x08 \x03(\x01R\ncommission\x12\'\n\x0fportfolio_value\x18\t \x03(\x01R\x0eportfolioValue\x12\x19\n\x08trade_id\x18\n \x03(\tR\x07tradeId\"\xa3\x01\n\rEquityColumns\x12!\n\x0ctimestamp_ns\x18\x01 \x03(\x10R\x0btimestampNs\x12\x16\n\x06\x65quity\x18\x02 \x03(\x01R\x06\x65quity\x12\x1a\n\x08\x64rawdown\x18\x03 \x03(\x01R\x08\x64rawdown\x12\x12\n\x04\x63\x61sh\x18\x04 \x03(\x01R\x04\x63\x61sh\x12\'\n\x0fpositions_value\x18\x05 \x03(\x01R\x0epositionsValue\"\xb8\x01\n\x0b\x45quityPoint\x12\x38\n\ttimestamp\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\ttimestamp\x12\x16\n\x06\x65quity\x18\x02 \x01(\x01R\x06\x65quity\x12\x1a\n\x08\x64rawdown\x18\x03 \x01(\x01R\x08\x64rawdown\x12\x12\n\x04\x63\x61sh\x18\x04 \x01(\x01R\x04\x63\x61sh\x12\'\n\x0fpositions_value\x18\x05 \x01(\x01R\x0epositionsValue*\x8c\x01\n\x10\x44ownsampleMethod\x12!\n\x1d\x44OWNSAMPLE_METHOD_UNSPECIFIED\x10\x00\x12\x1a\n\x16\x44OWNSAMPLE_METHOD_LTTB\x10\x01\x12\x1d\n\x19\x44OWNSAMPLE_METHOD_MIN_MAX\x10\x02\x12\x1a\n\x16\x44OWNSAMPLE_METHOD_LAST\x10\x03*i\n\x0eResultEncoding\x12\x1f\n\x1bRESULT_ENCODING_UNSPECIFIED\x10\x00\x12\x18\n\x14RESULT_ENCODING_ROWS\x10\x01\x12\x1c\n\x18RESULT_ENCODING_COLUMNAR\x10\x02*P\n\tTradeSide\x12\x1a\n\x16TRADE_SIDE_UNSPECIFIED\x10\x00\x12\x12\n\x0eTRADE_SIDE_BUY\x10\x01\x12\x13\n\x0fTRADE_SIDE_SELL\x10\x02*\xcd\x01\n\x0eTradeSortField\x12 \n\x1cTRADE_SORT_FIELD_UNSPECIFIED\x10\x00\x12\x1e\n\x1aTRADE_SORT_FIELD_TIMESTAMP\x10\x01\x12\x18\n\x14TRADE_SORT_FIELD_PNL\x10\x02\x12\x1d\n\x19TRADE_SORT_FIELD_QUANTITY\x10\x03\x12\x1a\n\x16TRADE_SORT_FIELD_PRICE\x10\x04\x12$\n TRADE_SORT_FIELD_PORTFOLIO_VALUE\x10\x05*e\n\x0c\x42\x61\x63ktestLane\x12\x1d\n\x19\x42\x41\x43KTEST_LANE_UNSPECIFIED\x10\x00\x12\x1d\n\x19\x42\x41\x43KTEST_LANE_INTERACTIVE\x10\x01\x12\x17\n\x13\x42\x41\x43KTEST_LANE_BATCH\x10\x02*\xa7\x01\n\x10\x41llocationMethod\x12!\n\x1d\x41LLOCATION_METHOD_UNSPECIFIED\x10\x00\x12\"\n\x1e\x41LLOCATION_METHOD_EQUAL_WEIGHT\x10\x01\x12\"\n\x1e\x41LLOCATION_METHOD_FIXED_WEIGHT\x10\x02\x12(\n$ALLOCATION_METHOD_INVERSE_VOLATILITY\x10\x03*c\n\x0bResultTable\x12\x1c\n\x18RESULT_TABLE_UNSPECIFIED\x10\x00\x12\x17\n\x13RESULT_TABLE_TRADES\x10\x01\x12\x1d\n\x19RESULT_TABLE_EQUITY_CURVE\x10\x02*\xae\x01\n\x10MonteCarloMethod\x12\"\n\x1eMONTE_CARLO_METHOD_UNSPECIFIED\x10\x00\x12$\n MONTE_CARLO_METHOD_TRADE_SHUFFLE\x10\x01\x12&\n\"MONTE_CARLO_METHOD_BLOCK_BOOTSTRAP\x10\x02\x12(\n$MONTE_CARLO_METHOD_RETURN_RESAMPLING\x10\x03\x32\xab\x0c\n\x0f\x42\x61\x63ktestService\x12V\n\x0f\x45xecuteBacktest\x12 .backtest.ExecuteBacktestRequest\x1a!.backtest.ExecuteBacktestResponse\x12\x65\n\x14\x45xecuteBacktestSweep\x12%.backtest.ExecuteBacktestSweepRequest\x1a&.backtest.ExecuteBacktestSweepResponse\x12Y\n\x11GetBacktestResult\x12\".backtest.GetBacktestResultRequest\x1a .backtest.BacktestResultResponse\x12^\n\x14StreamBacktestResult\x12%.backtest.StreamBacktestResultRequest\x1a\x1d.backtest.BacktestResultChunk0\x01\x12j\n\x19\x45xportBacktestResultArrow\x12*.backtest.ExportBacktestResultArrowRequest\x1a\x1f.backtest.ArrowRecordBatchChunk0\x01\x12J\n\x0bQueryTrades\x12\x1c.backtest.QueryTradesRequest\x1a\x1d.backtest.QueryTradesResponse\x12U\n\x16StreamBacktestProgress\x12\x1f.backtest.StreamProgressRequest\x1a\x18.backtest.ProgressUpdate0\x01\x12W\n\x0eWatchBacktests\x12\x1f.backtest.WatchBacktestsRequest\x1a .backtest.WatchBacktestsResponse(\x01\x30\x01\x12Y\n\x10\x43ompareBacktests\x12!.backtest.CompareBacktestsRequest\x1a\".backtest.CompareBacktestsResponse\x12M\n\rRunMonteCarlo\x12\x1e.backtest.RunMonteCarloRequest\x1a\x1c.backtest.MonteCarloResponse\x12L\n\x12GetBacktestMetrics\x12\x1b.backtest.GetMetricsRequest\x1a\x19.backtest.MetricsResponse\x12Y\n\x11GetRollingMetrics\x12\".backtest.GetRollingMetricsRequest\x1a .backtest.RollingMetricsResponse\x12P\n\rListBacktests\x12\x1e.backtest.ListBacktestsRequest\x1a\x1f.backtest.ListBacktestsResponse\x12T\n\x0f\x45xportBacktests\x12\x1e.backtest.ListBacktestsRequest\x1a\x1f.backtest.ListBacktestsResponse0\x01\x12S\n\x0e\x43\x61ncelBacktest\x12\x1f.backtest.CancelBacktestRequest\x1a .backtest.CancelBacktestResponse\x12S\n\x0eResumeBacktest\x12\x1f.backtest.ResumeBacktestRequest\x1a .backtest.ResumeBacktestResponse\x12\x45\n\rGetQueueStats\x12\x1e.backtest.GetQueueStatsRequest\x1a\x14.backtest.QueueStats\x12J\n\x0bHealthCheck\x12\x1c.backtest.HealthCheckRequest\x1a\x1d.backtest.HealthCheckResponseb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'protos.services.backtest.v1.backtest_service_pb2', _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
+  _globals['_PARAMETERSET_PARAMSENTRY']._loaded_options = None
+  _globals['_PARAMETERSET_PARAMSENTRY']._serialized_options = b'8\001'
   _globals['_BACKTESTCONFIG_PARAMSENTRY']._loaded_options = None
   _globals['_BACKTESTCONFIG_PARAMSENTRY']._serialized_options = b'8\001'
+  _globals['_SWEEPVARIANT_PARAMSENTRY']._loaded_options = None
+  _globals['_SWEEPVARIANT_PARAMSENTRY']._serialized_options = b'8\001'
   _globals['_HEALTHCHECKRESPONSE_DETAILSENTRY']._loaded_options = None
   _globals['_HEALTHCHECKRESPONSE_DETAILSENTRY']._serialized_options = b'8\001'
+  _globals['_DOWNSAMPLEMETHOD']._serialized_start=17621
+  _globals['_DOWNSAMPLEMETHOD']._serialized_end=17761
+  _globals['_RESULTENCODING']._serialized_start=17763
+  _globals['_RESULTENCODING']._serialized_end=17868
+  _globals['_TRADESIDE']._serialized_start=17870
+  _globals['_TRADESIDE']._serialized_end=17950
+  _globals['_TRADESORTFIELD']._serialized_start=17953
+  _globals['_TRADESORTFIELD']._serialized_end=18158
+  _globals['_BACKTESTLANE']._serialized_start=18160
+  _globals['_BACKTESTLANE']._serialized_end=18261
+  _globals['_ALLOCATIONMETHOD']._serialized_start=18264
+  _globals['_ALLOCATIONMETHOD']._serialized_end=18431
+  _globals['_RESULTTABLE']._serialized_start=18433
+  _globals['_RESULTTABLE']._serialized_end=18532
+  _globals['_MONTECARLOMETHOD']._serialized_start=18535
+  _globals['_MONTECARLOMETHOD']._serialized_end=18709
   _globals['_EXECUTEBACKTESTREQUEST']._serialized_start=98
-  _globals['_EXECUTEBACKTESTREQUEST']._serialized_end=310
-  _globals['_BACKTESTCONFIG']._serialized_start=313
-  _globals['_BACKTESTCONFIG']._serialized_end=1028
-  _globals['_BACKTESTCONFIG_PARAMSENTRY']._serialized_start=839
-  _globals['_BACKTESTCONFIG_PARAMSENTRY']._serialized_end=896
-  _globals['_GETBACKTESTRESULTREQUEST']._serialized_start=1030
-  _globals['_GETBACKTESTRESULTREQUEST']._serialized_end=1114
-  _globals['_STREAMPROGRESSREQUEST']._serialized_start=1116
-  _globals['_STREAMPROGRESSREQUEST']._serialized_end=1197
-  _globals['_GETMETRICSREQUEST']._serialized_start=1199
-  _globals['_GETMETRICSREQUEST']._serialized_end=1276
-  _globals['_LISTBACKTESTSREQUEST']._serialized_start=1279
-  _globals['_LISTBACKTESTSREQUEST']._serialized_end=1491
-  _globals['_CANCELBACKTESTREQUEST']._serialized_start=1493
-  _globals['_CANCELBACKTESTREQUEST']._serialized_end=1574
-  _globals['_HEALTHCHECKREQUEST']._serialized_start=1576
-  _globals['_HEALTHCHECKREQUEST']._serialized_end=1596
-  _globals['_EXECUTEBACKTESTRESPONSE']._serialized_start=1599
-  _globals['_EXECUTEBACKTESTRESPONSE']._serialized_end=1766
-  _globals['_BACKTESTRESULTRESPONSE']._serialized_start=1769
-  _globals['_BACKTESTRESULTRESPONSE']._serialized_end=2389
-  _globals['_PROGRESSUPDATE']._serialized_start=2392
-  _globals['_PROGRESSUPDATE']._serialized_end=2680
-  _globals['_METRICSRESPONSE']._serialized_start=2683
-  _globals['_METRICSRESPONSE']._serialized_end=2854
-  _globals['_LISTBACKTESTSRESPONSE']._serialized_start=2856
-  _globals['_LISTBACKTESTSRESPONSE']._serialized_end=2969
-  _globals['_BACKTESTSUMMARY']._serialized_start=2972
-  _globals['_BACKTESTSUMMARY']._serialized_end=3428
-  _globals['_CANCELBACKTESTRESPONSE']._serialized_start=3430
-  _globals['_CANCELBACKTESTRESPONSE']._serialized_end=3537
-  _globals['_HEALTHCHECKRESPONSE']._serialized_start=3540
-  _globals['_HEALTHCHECKRESPONSE']._serialized_end=3834
-  _globals['_HEALTHCHECKRESPONSE_DETAILSENTRY']._serialized_start=3776
-  _globals['_HEALTHCHECKRESPONSE_DETAILSENTRY']._serialized_end=3834
-  _globals['_PERFORMANCEMETRICS']._serialized_start=3837
-  _globals['_PERFORMANCEMETRICS']._serialized_end=4614
-  _globals['_TRADE']._serialized_start=4617
-  _globals['_TRADE']._serialized_end=4937
-  _globals['_EQUITYPOINT']._serialized_start=4940
-  _globals['_EQUITYPOINT']._serialized_end=5124
-  _globals['_BACKTESTSERVICE']._serialized_start=5127
-  _globals['_BACKTESTSERVICE']._serialized_end=5731
+  _globals['_EXECUTEBACKTESTREQUEST']._serialized_end=468
+  _globals['_EXECUTEBACKTESTSWEEPREQUEST']._serialized_start=471
+  _globals['_EXECUTEBACKTESTSWEEPREQUEST']._serialized_end=918
+  _globals['_PARAMETERAXIS']._serialized_start=920
+  _globals['_PARAMETERAXIS']._serialized_end=979
+  _globals['_PARAMETERSET']._serialized_start=982
+  _globals['_PARAMETERSET']._serialized_end=1115
+  _globals['_PARAMETERSET_PARAMSENTRY']._serialized_start=1058
+  _globals['_PARAMETERSET_PARAMSENTRY']._serialized_end=1115
+  _globals['_BACKTESTCONFIG']._serialized_start=1118
+  _globals['_BACKTESTCONFIG']._serialized_end=2331
+  _globals['_BACKTESTCONFIG_PARAMSENTRY']._serialized_start=1058
+  _globals['_BACKTESTCONFIG_PARAMSENTRY']._serialized_end=1115
+  _globals['_PORTFOLIOASSET']._serialized_start=2334
+  _globals['_PORTFOLIOASSET']._serialized_end=2465
+  _globals['_GETBACKTESTRESULTREQUEST']._serialized_start=2468
+  _globals['_GETBACKTESTRESULTREQUEST']._serialized_end=2775
+  _globals['_STREAMBACKTESTRESULTREQUEST']._serialized_start=2778
+  _globals['_STREAMBACKTESTRESULTREQUEST']._serialized_end=3153
+  _globals['_EXPORTBACKTESTRESULTARROWREQUEST']._serialized_start=3156
+  _globals['_EXPORTBACKTESTRESULTARROWREQUEST']._serialized_end=3423
+  _globals['_QUERYTRADESREQUEST']._serialized_start=3426
+  _globals['_QUERYTRADESREQUEST']._serialized_end=4178
+  _globals['_STREAMPROGRESSREQUEST']._serialized_start=4181
+  _globals['_STREAMPROGRESSREQUEST']._serialized_end=4534
+  _globals['_WATCHBACKTESTSREQUEST']._serialized_start=4537
+  _globals['_WATCHBACKTESTSREQUEST']._serialized_end=4967
+  _globals['_COMPAREBACKTESTSREQUEST']._serialized_start=4970
+  _globals['_COMPAREBACKTESTSREQUEST']._serialized_end=5364
+  _globals['_RUNMONTECARLOREQUEST']._serialized_start=5367
+  _globals['_RUNMONTECARLOREQUEST']._serialized_end=5721
+  _globals['_GETMETRICSREQUEST']._serialized_start=5723
+  _globals['_GETMETRICSREQUEST']._serialized_end=5800
+  _globals['_GETROLLINGMETRICSREQUEST']._serialized_start=5803
+  _globals['_GETROLLINGMETRICSREQUEST']._serialized_end=6064
+  _globals['_LISTBACKTESTSREQUEST']._serialized_start=6067
+  _globals['_LISTBACKTESTSREQUEST']._serialized_end=6624
+  _globals['_CANCELBACKTESTREQUEST']._serialized_start=6626
+  _globals['_CANCELBACKTESTREQUEST']._serialized_end=6707
+  _globals['_RESUMEBACKTESTREQUEST']._serialized_start=6710
+  _globals['_RESUMEBACKTESTREQUEST']._serialized_end=6895
+  _globals['_GETQUEUESTATSREQUEST']._serialized_start=6897
+  _globals['_GETQUEUESTATSREQUEST']._serialized_end=6977
+  _globals['_HEALTHCHECKREQUEST']._serialized_start=6979
+  _globals['_HEALTHCHECKREQUEST']._serialized_end=6999
+  _globals['_EXECUTEBACKTESTRESPONSE']._serialized_start=7002
+  _globals['_EXECUTEBACKTESTRESPONSE']._serialized_end=7304
+  _globals['_EXECUTEBACKTESTSWEEPRESPONSE']._serialized_start=7307
+  _globals['_EXECUTEBACKTESTSWEEPRESPONSE']._serialized_end=7525
+  _globals['_SWEEPVARIANT']._serialized_start=7528
+  _globals['_SWEEPVARIANT']._serialized_end=7716
+  _globals['_SWEEPVARIANT_PARAMSENTRY']._serialized_start=1058
+  _globals['_SWEEPVARIANT_PARAMSENTRY']._serialized_end=1115
+  _globals['_BACKTESTRESULTRESPONSE']._serialized_start=7719
+  _globals['_BACKTESTRESULTRESPONSE']._serialized_end=8571
+  _globals['_BACKTESTRESULTCHUNK']._serialized_start=8574
+  _globals['_BACKTESTRESULTCHUNK']._serialized_end=8799
+  _globals['_BACKTESTRESULTHEADER']._serialized_start=8802
+  _globals['_BACKTESTRESULTHEADER']._serialized_end=9464
+  _globals['_TRADECHUNK']._serialized_start=9467
+  _globals['_TRADECHUNK']._serialized_end=9611
+  _globals['_EQUITYCHUNK']._serialized_start=9614
+  _globals['_EQUITYCHUNK']._serialized_end=9766
+  _globals['_ARROWRECORDBATCHCHUNK']._serialized_start=9769
+  _globals['_ARROWRECORDBATCHCHUNK']._serialized_end=9946
+  _globals['_QUERYTRADESRESPONSE']._serialized_start=9949
+  _globals['_QUERYTRADESRESPONSE']._serialized_end=10234
+  _globals['_PROGRESSUPDATE']._serialized_start=10237
+  _globals['_PROGRESSUPDATE']._serialized_end=10543
+  _globals['_WATCHBACKTESTSRESPONSE']._serialized_start=10546
+  _globals['_WATCHBACKTESTSRESPONSE']._serialized_end=10679
+  _globals['_COMPAREBACKTESTSRESPONSE']._serialized_start=10682
+  _globals['_COMPAREBACKTESTSRESPONSE']._serialized_end=11040
+  _globals['_MONTECARLORESPONSE']._serialized_start=11043
+  _globals['_MONTECARLORESPONSE']._serialized_end=11574
+  _globals['_METRICSRESPONSE']._serialized_start=11577
+  _globals['_METRICSRESPONSE']._serialized_end=11748
+  _globals['_ROLLINGMETRICSRESPONSE']._serialized_start=11751
+  _globals['_ROLLINGMETRICSRESPONSE']._serialized_end=11940
+  _globals['_LISTBACKTESTSRESPONSE']._serialized_start=11943
+  _globals['_LISTBACKTESTSRESPONSE']._serialized_end=12096
+  _globals['_BACKTESTSUMMARY']._serialized_start=12099
+  _globals['_BACKTESTSUMMARY']._serialized_end=12613
+  _globals['_CANCELBACKTESTRESPONSE']._serialized_start=12615
+  _globals['_CANCELBACKTESTRESPONSE']._serialized_end=12722
+  _globals['_RESUMEBACKTESTRESPONSE']._serialized_start=12725
+  _globals['_RESUMEBACKTESTRESPONSE']._serialized_end=13115
+  _globals['_QUEUESTATS']._serialized_start=13118
+  _globals['_QUEUESTATS']._serialized_end=13431
+  _globals['_HEALTHCHECKRESPONSE']._serialized_start=13434
+  _globals['_HEALTHCHECKRESPONSE']._serialized_end=13728
+  _globals['_HEALTHCHECKRESPONSE_DETAILSENTRY']._serialized_start=13670
+  _globals['_HEALTHCHECKRESPONSE_DETAILSENTRY']._serialized_end=13728
+  _globals['_PERCENTILEBAND']._serialized_start=13730
+  _globals['_PERCENTILEBAND']._serialized_end=13802
+  _globals['_ALIGNEDSERIES']._serialized_start=13804
+  _globals['_ALIGNEDSERIES']._serialized_end=13876
+  _globals['_METRICCOMPARISON']._serialized_start=13879
+  _globals['_METRICCOMPARISON']._serialized_end=14038
+  _globals['_PAIRCORRELATION']._serialized_start=14041
+  _globals['_PAIRCORRELATION']._serialized_end=14182
+  _globals['_TRADEOVERLAP']._serialized_start=14185
+  _globals['_TRADEOVERLAP']._serialized_end=14375
+  _globals['_ROLLINGWINDOWSERIES']._serialized_start=14378
+  _globals['_ROLLINGWINDOWSERIES']._serialized_end=14545
+  _globals['_BACKTESTCHECKPOINT']._serialized_start=14548
+  _globals['_BACKTESTCHECKPOINT']._serialized_end=15222
+  _globals['_LANESTATS']._serialized_start=15225
+  _globals['_LANESTATS']._serialized_end=15558
+  _globals['_ASSETRESULT']._serialized_start=15561
+  _globals['_ASSETRESULT']._serialized_end=15840
+  _globals['_PERFORMANCEMETRICS']._serialized_start=15843
+  _globals['_PERFORMANCEMETRICS']._serialized_end=16620
+  _globals['_TRADE']._serialized_start=16623
+  _globals['_TRADE']._serialized_end=16943
+  _globals['_TRADECOLUMNS']._serialized_start=16946
+  _globals['_TRADECOLUMNS']._serialized_end=17265
+  _globals['_EQUITYCOLUMNS']._serialized_start=17268
+  _globals['_EQUITYCOLUMNS']._serialized_end=17431
+  _globals['_EQUITYPOINT']._serialized_start=17434
+  _globals['_EQUITYPOINT']._serialized_end=17618
+  _globals['_BACKTESTSERVICE']._serialized_start=18712
+  _globals['_BACKTESTSERVICE']._serialized_end=20291
 # @@protoc_insertion_point(module_scope)
@@ -2,7 +2,7 @@
 """Client and server classes corresponding to protobuf-defined services."""
 import grpc
 
-from protos.services.backtest.v1 import backtest_service_pb2 as protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2
+from mysingle_protos.protos.services.backtest.v1 import backtest_service_pb2 as protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2
 
 
 class BacktestServiceStub(object):
@@ -20,31 +20,86 @@ class BacktestServiceStub(object):
                 request_serializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.ExecuteBacktestRequest.SerializeToString,
                 response_deserializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.ExecuteBacktestResponse.FromString,
                 _registered_method=True)
+        self.ExecuteBacktestSweep = channel.unary_unary(
+                '/backtest.BacktestService/ExecuteBacktestSweep',
+                request_serializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.ExecuteBacktestSweepRequest.SerializeToString,
+                response_deserializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.ExecuteBacktestSweepResponse.FromString,
+                _registered_method=True)
         self.GetBacktestResult = channel.unary_unary(
                 '/backtest.BacktestService/GetBacktestResult',
                 request_serializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.GetBacktestResultRequest.SerializeToString,
                 response_deserializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.BacktestResultResponse.FromString,
                 _registered_method=True)
+        self.StreamBacktestResult = channel.unary_stream(
+                '/backtest.BacktestService/StreamBacktestResult',
+                request_serializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.StreamBacktestResultRequest.SerializeToString,
+                response_deserializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.BacktestResultChunk.FromString,
+                _registered_method=True)
+        self.ExportBacktestResultArrow = channel.unary_stream(
+                '/backtest.BacktestService/ExportBacktestResultArrow',
+                request_serializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.ExportBacktestResultArrowRequest.SerializeToString,
+                response_deserializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.ArrowRecordBatchChunk.FromString,
+                _registered_method=True)
+        self.QueryTrades = channel.unary_unary(
+                '/backtest.BacktestService/QueryTrades',
+                request_serializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.QueryTradesRequest.SerializeToString,
+                response_deserializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.QueryTradesResponse.FromString,
+                _registered_method=True)
         self.StreamBacktestProgress = channel.unary_stream(
                 '/backtest.BacktestService/StreamBacktestProgress',
                 request_serializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.StreamProgressRequest.SerializeToString,
                 response_deserializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.ProgressUpdate.FromString,
                 _registered_method=True)
+        self.WatchBacktests = channel.stream_stream(
+                '/backtest.BacktestService/WatchBacktests',
+                request_serializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.WatchBacktestsRequest.SerializeToString,
+                response_deserializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.WatchBacktestsResponse.FromString,
+                _registered_method=True)
+        self.CompareBacktests = channel.unary_unary(
+                '/backtest.BacktestService/CompareBacktests',
+                request_serializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.CompareBacktestsRequest.SerializeToString,
+                response_deserializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.CompareBacktestsResponse.FromString,
+                _registered_method=True)
+        self.RunMonteCarlo = channel.unary_unary(
+                '/backtest.BacktestService/RunMonteCarlo',
+                request_serializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.RunMonteCarloRequest.SerializeToString,
+                response_deserializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.MonteCarloResponse.FromString,
+                _registered_method=True)
         self.GetBacktestMetrics = channel.unary_unary(
                 '/backtest.BacktestService/GetBacktestMetrics',
                 request_serializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.GetMetricsRequest.SerializeToString,
                 response_deserializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.MetricsResponse.FromString,
                 _registered_method=True)
+        self.GetRollingMetrics = channel.unary_unary(
+                '/backtest.BacktestService/GetRollingMetrics',
+                request_serializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.GetRollingMetricsRequest.SerializeToString,
+                response_deserializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.RollingMetricsResponse.FromString,
+                _registered_method=True)
         self.ListBacktests = channel.unary_unary(
                 '/backtest.BacktestService/ListBacktests',
                 request_serializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.ListBacktestsRequest.SerializeToString,
                 response_deserializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.ListBacktestsResponse.FromString,
                 _registered_method=True)
+        self.ExportBacktests = channel.unary_stream(
+                '/backtest.BacktestService/ExportBacktests',
+                request_serializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.ListBacktestsRequest.SerializeToString,
+                response_deserializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.ListBacktestsResponse.FromString,
+                _registered_method=True)
         self.CancelBacktest = channel.unary_unary(
                 '/backtest.BacktestService/CancelBacktest',
                 request_serializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.CancelBacktestRequest.SerializeToString,
                 response_deserializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.CancelBacktestResponse.FromString,
                 _registered_method=True)
+        self.ResumeBacktest = channel.unary_unary(
+                '/backtest.BacktestService/ResumeBacktest',
+                request_serializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.ResumeBacktestRequest.SerializeToString,
+                response_deserializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.ResumeBacktestResponse.FromString,
+                _registered_method=True)
+        self.GetQueueStats = channel.unary_unary(
+                '/backtest.BacktestService/GetQueueStats',
+                request_serializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.GetQueueStatsRequest.SerializeToString,
+                response_deserializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.QueueStats.FromString,
+                _registered_method=True)
         self.HealthCheck = channel.unary_unary(
                 '/backtest.BacktestService/HealthCheck',
                 request_serializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.HealthCheckRequest.SerializeToString,
@@ -63,6 +118,13 @@ class BacktestServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def ExecuteBacktestSweep(self, request, context):
+        """Execute a parameter sweep (market data loaded and strategy compiled once for all variants)
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def GetBacktestResult(self, request, context):
         """Get backtest result by ID
         """
@@ -70,6 +132,27 @@ class BacktestServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def StreamBacktestResult(self, request, context):
+        """Stream backtest result as a header frame followed by bounded-size trade/equity chunks
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ExportBacktestResultArrow(self, request, context):
+        """Export trades / equity curve as Arrow IPC record batches (schemas derived from Trade / EquityPoint)
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def QueryTrades(self, request, context):
+        """Query trades of a completed backtest (time range, side, symbol and PnL filters, sorted, cursor-paginated)
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def StreamBacktestProgress(self, request, context):
         """Stream backtest progress updates
         """
@@ -77,6 +160,27 @@ class BacktestServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def WatchBacktests(self, request_iterator, context):
+        """Watch progress of many backtests on one bidirectional stream (subscriptions can be added/removed)
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def CompareBacktests(self, request, context):
+        """Compare several backtests (aligned equity curves, metric deltas, rolling correlation, trade overlap)
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def RunMonteCarlo(self, request, context):
+        """Run Monte Carlo resampling of a completed backtest (percentile bands over all iterations)
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def GetBacktestMetrics(self, request, context):
         """Get backtest metrics
         """
@@ -84,6 +188,13 @@ class BacktestServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetRollingMetrics(self, request, context):
+        """Get rolling Sharpe / volatility / drawdown / win rate series for several windows of a completed backtest
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def ListBacktests(self, request, context):
         """List backtests for a user
         """
@@ -91,6 +202,13 @@ class BacktestServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def ExportBacktests(self, request, context):
+        """Export all backtests matching the filter as a stream of pages (resumable via next_page_token)
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def CancelBacktest(self, request, context):
         """Cancel a running backtest
         """
@@ -98,6 +216,20 @@ class BacktestServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def ResumeBacktest(self, request, context):
+        """Resume an interrupted, failed or cancelled backtest from its last checkpoint (on any worker)
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetQueueStats(self, request, context):
+        """Get job queue statistics per scheduling lane
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def HealthCheck(self, request, context):
         """Health check
         """
@@ -113,31 +245,86 @@ def add_BacktestServiceServicer_to_server(servicer, server):
                     request_deserializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.ExecuteBacktestRequest.FromString,
                     response_serializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.ExecuteBacktestResponse.SerializeToString,
             ),
+            'ExecuteBacktestSweep': grpc.unary_unary_rpc_method_handler(
+                    servicer.ExecuteBacktestSweep,
+                    request_deserializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.ExecuteBacktestSweepRequest.FromString,
+                    response_serializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.ExecuteBacktestSweepResponse.SerializeToString,
+            ),
             'GetBacktestResult': grpc.unary_unary_rpc_method_handler(
                     servicer.GetBacktestResult,
                     request_deserializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.GetBacktestResultRequest.FromString,
                     response_serializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.BacktestResultResponse.SerializeToString,
             ),
+            'StreamBacktestResult': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamBacktestResult,
+                    request_deserializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.StreamBacktestResultRequest.FromString,
+                    response_serializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.BacktestResultChunk.SerializeToString,
+            ),
+            'ExportBacktestResultArrow': grpc.unary_stream_rpc_method_handler(
+                    servicer.ExportBacktestResultArrow,
+                    request_deserializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.ExportBacktestResultArrowRequest.FromString,
+                    response_serializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.ArrowRecordBatchChunk.SerializeToString,
+            ),
+            'QueryTrades': grpc.unary_unary_rpc_method_handler(
+                    servicer.QueryTrades,
+                    request_deserializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.QueryTradesRequest.FromString,
+                    response_serializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.QueryTradesResponse.SerializeToString,
+            ),
             'StreamBacktestProgress': grpc.unary_stream_rpc_method_handler(
                     servicer.StreamBacktestProgress,
                     request_deserializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.StreamProgressRequest.FromString,
                     response_serializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.ProgressUpdate.SerializeToString,
             ),
+            'WatchBacktests': grpc.stream_stream_rpc_method_handler(
+                    servicer.WatchBacktests,
+                    request_deserializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.WatchBacktestsRequest.FromString,
+                    response_serializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.WatchBacktestsResponse.SerializeToString,
+            ),
+            'CompareBacktests': grpc.unary_unary_rpc_method_handler(
+                    servicer.CompareBacktests,
+                    request_deserializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.CompareBacktestsRequest.FromString,
+                    response_serializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.CompareBacktestsResponse.SerializeToString,
+            ),
+            'RunMonteCarlo': grpc.unary_unary_rpc_method_handler(
+                    servicer.RunMonteCarlo,
+                    request_deserializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.RunMonteCarloRequest.FromString,
+                    response_serializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.MonteCarloResponse.SerializeToString,
+            ),
             'GetBacktestMetrics': grpc.unary_unary_rpc_method_handler(
                     servicer.GetBacktestMetrics,
                     request_deserializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.GetMetricsRequest.FromString,
                     response_serializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.MetricsResponse.SerializeToString,
             ),
+            'GetRollingMetrics': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetRollingMetrics,
+                    request_deserializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.GetRollingMetricsRequest.FromString,
+                    response_serializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.RollingMetricsResponse.SerializeToString,
+            ),
             'ListBacktests': grpc.unary_unary_rpc_method_handler(
                     servicer.ListBacktests,
                     request_deserializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.ListBacktestsRequest.FromString,
                     response_serializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.ListBacktestsResponse.SerializeToString,
             ),
+            'ExportBacktests': grpc.unary_stream_rpc_method_handler(
+                    servicer.ExportBacktests,
+                    request_deserializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.ListBacktestsRequest.FromString,
+                    response_serializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.ListBacktestsResponse.SerializeToString,
+            ),
             'CancelBacktest': grpc.unary_unary_rpc_method_handler(
                     servicer.CancelBacktest,
                     request_deserializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.CancelBacktestRequest.FromString,
                     response_serializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.CancelBacktestResponse.SerializeToString,
             ),
+            'ResumeBacktest': grpc.unary_unary_rpc_method_handler(
+                    servicer.ResumeBacktest,
+                    request_deserializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.ResumeBacktestRequest.FromString,
+                    response_serializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.ResumeBacktestResponse.SerializeToString,
+            ),
+            'GetQueueStats': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetQueueStats,
+                    request_deserializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.GetQueueStatsRequest.FromString,
+                    response_serializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.QueueStats.SerializeToString,
+            ),
             'HealthCheck': grpc.unary_unary_rpc_method_handler(
                     servicer.HealthCheck,
                     request_deserializer=protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.HealthCheckRequest.FromString,
@@ -182,6 +369,33 @@ class BacktestService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def ExecuteBacktestSweep(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/backtest.BacktestService/ExecuteBacktestSweep',
+            protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.ExecuteBacktestSweepRequest.SerializeToString,
+            protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.ExecuteBacktestSweepResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def GetBacktestResult(request,
             target,
@@ -209,6 +423,87 @@ class BacktestService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def StreamBacktestResult(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/backtest.BacktestService/StreamBacktestResult',
+            protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.StreamBacktestResultRequest.SerializeToString,
+            protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.BacktestResultChunk.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ExportBacktestResultArrow(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/backtest.BacktestService/ExportBacktestResultArrow',
+            protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.ExportBacktestResultArrowRequest.SerializeToString,
+            protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.ArrowRecordBatchChunk.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def QueryTrades(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/backtest.BacktestService/QueryTrades',
+            protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.QueryTradesRequest.SerializeToString,
+            protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.QueryTradesResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def StreamBacktestProgress(request,
             target,
@@ -236,6 +531,87 @@ class BacktestService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def WatchBacktests(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(
+            request_iterator,
+            target,
+            '/backtest.BacktestService/WatchBacktests',
+            protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.WatchBacktestsRequest.SerializeToString,
+            protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.WatchBacktestsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def CompareBacktests(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/backtest.BacktestService/CompareBacktests',
+            protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.CompareBacktestsRequest.SerializeToString,
+            protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.CompareBacktestsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def RunMonteCarlo(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/backtest.BacktestService/RunMonteCarlo',
+            protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.RunMonteCarloRequest.SerializeToString,
+            protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.MonteCarloResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def GetBacktestMetrics(request,
             target,
@@ -263,6 +639,33 @@ class BacktestService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def GetRollingMetrics(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/backtest.BacktestService/GetRollingMetrics',
+            protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.GetRollingMetricsRequest.SerializeToString,
+            protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.RollingMetricsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def ListBacktests(request,
             target,
@@ -290,6 +693,33 @@ class BacktestService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def ExportBacktests(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/backtest.BacktestService/ExportBacktests',
+            protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.ListBacktestsRequest.SerializeToString,
+            protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.ListBacktestsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def CancelBacktest(request,
             target,
@@ -317,6 +747,60 @@ class BacktestService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def ResumeBacktest(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/backtest.BacktestService/ResumeBacktest',
+            protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.ResumeBacktestRequest.SerializeToString,
+            protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.ResumeBacktestResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetQueueStats(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/backtest.BacktestService/GetQueueStats',
+            protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.GetQueueStatsRequest.SerializeToString,
+            protos_dot_services_dot_backtest_dot_v1_dot_backtest__service__pb2.QueueStats.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def HealthCheck(request,
             target,
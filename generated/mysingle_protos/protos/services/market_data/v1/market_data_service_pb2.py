@@ -24,7 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n8protos/services/market_data/v1/market_data_service.proto\x12\x0bmarket_data\"\xd9\x02\n\x08OHLCVBar\x12\x1c\n\ttimestamp\x18\x01 \x01(\tR\ttimestamp\x12\x12\n\x04open\x18\x02 \x01(\x01R\x04open\x12\x12\n\x04high\x18\x03 \x01(\x01R\x04high\x12\x10\n\x03low\x18\x04 \x01(\x01R\x03low\x12\x14\n\x05\x63lose\x18\x05 \x01(\x01R\x05\x63lose\x12\x16\n\x06volume\x18\x06 \x01(\x03R\x06volume\x12*\n\x0e\x61\x64justed_close\x18\x07 \x01(\x01H\x00R\radjustedClose\x88\x01\x01\x12,\n\x0f\x64ividend_amount\x18\x08 \x01(\x01H\x01R\x0e\x64ividendAmount\x88\x01\x01\x12\x30\n\x11split_coefficient\x18\t \x01(\x01H\x02R\x10splitCoefficient\x88\x01\x01\x42\x11\n\x0f_adjusted_closeB\x12\n\x10_dividend_amountB\x14\n\x12_split_coefficient\"t\n\nPagination\x12\x12\n\x04page\x18\x01 \x01(\x05R\x04page\x12\x1b\n\tpage_size\x18\x02 \x01(\x05R\x08pageSize\x12\x14\n\x05total\x18\x03 \x01(\x05R\x05total\x12\x1f\n\x0btotal_pages\x18\x04 \x01(\x05R\ntotalPages\"\xf0\x01\n\x14GetDailyOHLCVRequest\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\"\n\nstart_date\x18\x02 \x01(\tH\x00R\tstartDate\x88\x01\x01\x12\x1e\n\x08\x65nd_date\x18\x03 \x01(\tH\x01R\x07\x65ndDate\x88\x01\x01\x12#\n\noutputsize\x18\x04 \x01(\tH\x02R\noutputsize\x88\x01\x01\x12\x1f\n\x08\x61\x64justed\x18\x05 \x01(\x08H\x03R\x08\x61\x64justed\x88\x01\x01\x42\r\n\x0b_start_dateB\x0b\n\t_end_dateB\r\n\x0b_outputsizeB\x0b\n\t_adjusted\"\xc6\x02\n\x17GetIntradayOHLCVRequest\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x1f\n\x08interval\x18\x02 \x01(\tH\x00R\x08interval\x88\x01\x01\x12\"\n\nstart_date\x18\x03 \x01(\tH\x01R\tstartDate\x88\x01\x01\x12\x1e\n\x08\x65nd_date\x18\x04 \x01(\tH\x02R\x07\x65ndDate\x88\x01\x01\x12#\n\noutputsize\x18\x05 \x01(\tH\x03R\noutputsize\x88\x01\x01\x12\x1f\n\x08\x61\x64justed\x18\x06 \x01(\x08H\x04R\x08\x61\x64justed\x88\x01\x01\x12\x19\n\x05month\x18\x07 \x01(\tH\x05R\x05month\x88\x01\x01\x42\x0b\n\t_intervalB\r\n\x0b_start_dateB\x0b\n\t_end_dateB\r\n\x0b_outputsizeB\x0b\n\t_adjustedB\x08\n\x06_month\"\xbd\x01\n\x15GetWeeklyOHLCVRequest\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\"\n\nstart_date\x18\x02 \x01(\tH\x00R\tstartDate\x88\x01\x01\x12\x1e\n\x08\x65nd_date\x18\x03 \x01(\tH\x01R\x07\x65ndDate\x88\x01\x01\x12\x1f\n\x08\x61\x64justed\x18\x04 \x01(\x08H\x02R\x08\x61\x64justed\x88\x01\x01\x42\r\n\x0b_start_dateB\x0b\n\t_end_dateB\x0b\n\t_adjusted\"\xbe\x01\n\x16GetMonthlyOHLCVRequest\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\"\n\nstart_date\x18\x02 \x01(\tH\x00R\tstartDate\x88\x01\x01\x12\x1e\n\x08\x65nd_date\x18\x03 \x01(\tH\x01R\x07\x65ndDate\x88\x01\x01\x12\x1f\n\x08\x61\x64justed\x18\x04 \x01(\x08H\x02R\x08\x61\x64justed\x88\x01\x01\x42\r\n\x0b_start_dateB\x0b\n\t_end_dateB\x0b\n\t_adjusted\"\xf6\x01\n\rOHLCVResponse\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x1a\n\x08interval\x18\x02 \x01(\tR\x08interval\x12)\n\x04\x62\x61rs\x18\x03 \x03(\x0b\x32\x15.market_data.OHLCVBarR\x04\x62\x61rs\x12\x14\n\x05\x63ount\x18\x04 \x01(\x05R\x05\x63ount\x12\x16\n\x06\x63\x61\x63hed\x18\x05 \x01(\x08R\x06\x63\x61\x63hed\x12\x16\n\x06source\x18\x06 \x01(\tR\x06source\x12,\n\x0f\x63\x61\x63he_timestamp\x18\x07 \x01(\tH\x00R\x0e\x63\x61\x63heTimestamp\x88\x01\x01\x42\x12\n\x10_cache_timestamp\")\n\x0fGetQuoteRequest\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\"\x9f\x02\n\tQuoteData\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x12\n\x04open\x18\x02 \x01(\x01R\x04open\x12\x12\n\x04high\x18\x03 \x01(\x01R\x04high\x12\x10\n\x03low\x18\x04 \x01(\x01R\x03low\x12\x14\n\x05price\x18\x05 \x01(\x01R\x05price\x12\x16\n\x06volume\x18\x06 \x01(\x03R\x06volume\x12,\n\x12latest_trading_day\x18\x07 \x01(\tR\x10latestTradingDay\x12%\n\x0eprevious_close\x18\x08 \x01(\x01R\rpreviousClose\x12\x16\n\x06\x63hange\x18\t \x01(\x01R\x06\x63hange\x12%\n\x0e\x63hange_percent\x18\n \x01(\x01R\rchangePercent\"\x97\x01\n\rQuoteResponse\x12,\n\x05quote\x18\x01 \x01(\x0b\x32\x16.market_data.QuoteDataR\x05quote\x12\x16\n\x06\x63\x61\x63hed\x18\x02 \x01(\x08R\x06\x63\x61\x63hed\x12,\n\x0f\x63\x61\x63he_timestamp\x18\x03 \x01(\tH\x00R\x0e\x63\x61\x63heTimestamp\x88\x01\x01\x42\x12\n\x10_cache_timestamp\"2\n\x14SearchSymbolsRequest\x12\x1a\n\x08keywords\x18\x01 \x01(\tR\x08keywords\"\x89\x02\n\x12SymbolSearchResult\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x12\n\x04name\x18\x02 \x01(\tR\x04name\x12\x12\n\x04type\x18\x03 \x01(\tR\x04type\x12\x16\n\x06region\x18\x04 \x01(\tR\x06region\x12\x1f\n\x0bmarket_open\x18\x05 \x01(\tR\nmarketOpen\x12!\n\x0cmarket_close\x18\x06 \x01(\tR\x0bmarketClose\x12\x1a\n\x08timezone\x18\x07 \x01(\tR\x08timezone\x12\x1a\n\x08\x63urrency\x18\x08 \x01(\tR\x08\x63urrency\x12\x1f\n\x0bmatch_score\x18\t \x01(\x01R\nmatchScore\"h\n\x15SearchSymbolsResponse\x12\x39\n\x07results\x18\x01 \x03(\x0b\x32\x1f.market_data.SymbolSearchResultR\x07results\x12\x14\n\x05\x63ount\x18\x02 \x01(\x05R\x05\x63ount\"\xc3\x01\n\x19\x42\x61tchGetDailyOHLCVRequest\x12\x18\n\x07symbols\x18\x01 \x03(\tR\x07symbols\x12\"\n\nstart_date\x18\x02 \x01(\tH\x00R\tstartDate\x88\x01\x01\x12\x1e\n\x08\x65nd_date\x18\x03 \x01(\tH\x01R\x07\x65ndDate\x88\x01\x01\x12\x1f\n\x08\x61\x64justed\x18\x04 \x01(\x08H\x02R\x08\x61\x64justed\x88\x01\x01\x42\r\n\x0b_start_dateB\x0b\n\t_end_dateB\x0b\n\t_adjusted\"\xa7\x01\n\x0fSymbolOHLCVData\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12)\n\x04\x62\x61rs\x18\x02 \x03(\x0b\x32\x15.market_data.OHLCVBarR\x04\x62\x61rs\x12\x14\n\x05\x63ount\x18\x03 \x01(\x05R\x05\x63ount\x12\x16\n\x06\x63\x61\x63hed\x18\x04 \x01(\x08R\x06\x63\x61\x63hed\x12\x19\n\x05\x65rror\x18\x05 \x01(\tH\x00R\x05\x65rror\x88\x01\x01\x42\x08\n\x06_error\"\xb9\x01\n\x1a\x42\x61tchGetDailyOHLCVResponse\x12\x30\n\x04\x64\x61ta\x18\x01 \x03(\x0b\x32\x1c.market_data.SymbolOHLCVDataR\x04\x64\x61ta\x12#\n\rtotal_symbols\x18\x02 \x01(\x05R\x0ctotalSymbols\x12#\n\rsuccess_count\x18\x03 \x01(\x05R\x0csuccessCount\x12\x1f\n\x0b\x65rror_count\x18\x04 \x01(\x05R\nerrorCount\"0\n\x14\x42\x61tchGetQuoteRequest\x12\x18\n\x07symbols\x18\x01 \x03(\tR\x07symbols\"\xa3\x01\n\x0fSymbolQuoteData\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x31\n\x05quote\x18\x02 \x01(\x0b\x32\x16.market_data.QuoteDataH\x00R\x05quote\x88\x01\x01\x12\x16\n\x06\x63\x61\x63hed\x18\x03 \x01(\x08R\x06\x63\x61\x63hed\x12\x19\n\x05\x65rror\x18\x04 \x01(\tH\x01R\x05\x65rror\x88\x01\x01\x42\x08\n\x06_quoteB\x08\n\x06_error\"\xb4\x01\n\x15\x42\x61tchGetQuoteResponse\x12\x30\n\x04\x64\x61ta\x18\x01 \x03(\x0b\x32\x1c.market_data.SymbolQuoteDataR\x04\x64\x61ta\x12#\n\rtotal_symbols\x18\x02 \x01(\x05R\x0ctotalSymbols\x12#\n\rsuccess_count\x18\x03 \x01(\x05R\x0csuccessCount\x12\x1f\n\x0b\x65rror_count\x18\x04 \x01(\x05R\nerrorCount\"\xe8\x01\n\x14GetForexDailyRequest\x12\x1f\n\x0b\x66rom_symbol\x18\x01 \x01(\tR\nfromSymbol\x12\x1b\n\tto_symbol\x18\x02 \x01(\tR\x08toSymbol\x12\"\n\nstart_date\x18\x03 \x01(\tH\x00R\tstartDate\x88\x01\x01\x12\x1e\n\x08\x65nd_date\x18\x04 \x01(\tH\x01R\x07\x65ndDate\x88\x01\x01\x12#\n\noutputsize\x18\x05 \x01(\tH\x02R\noutputsize\x88\x01\x01\x42\r\n\x0b_start_dateB\x0b\n\t_end_dateB\r\n\x0b_outputsize\"\x99\x02\n\x17GetForexIntradayRequest\x12\x1f\n\x0b\x66rom_symbol\x18\x01 \x01(\tR\nfromSymbol\x12\x1b\n\tto_symbol\x18\x02 \x01(\tR\x08toSymbol\x12\x1f\n\x08interval\x18\x03 \x01(\tH\x00R\x08interval\x88\x01\x01\x12\"\n\nstart_date\x18\x04 \x01(\tH\x01R\tstartDate\x88\x01\x01\x12\x1e\n\x08\x65nd_date\x18\x05 \x01(\tH\x02R\x07\x65ndDate\x88\x01\x01\x12#\n\noutputsize\x18\x06 \x01(\tH\x03R\noutputsize\x88\x01\x01\x42\x0b\n\t_intervalB\r\n\x0b_start_dateB\x0b\n\t_end_dateB\r\n\x0b_outputsize\"\xb5\x01\n\x15GetForexWeeklyRequest\x12\x1f\n\x0b\x66rom_symbol\x18\x01 \x01(\tR\nfromSymbol\x12\x1b\n\tto_symbol\x18\x02 \x01(\tR\x08toSymbol\x12\"\n\nstart_date\x18\x03 \x01(\tH\x00R\tstartDate\x88\x01\x01\x12\x1e\n\x08\x65nd_date\x18\x04 \x01(\tH\x01R\x07\x65ndDate\x88\x01\x01\x42\r\n\x0b_start_dateB\x0b\n\t_end_date\"\xb6\x01\n\x16GetForexMonthlyRequest\x12\x1f\n\x0b\x66rom_symbol\x18\x01 \x01(\tR\nfromSymbol\x12\x1b\n\tto_symbol\x18\x02 \x01(\tR\x08toSymbol\x12\"\n\nstart_date\x18\x03 \x01(\tH\x00R\tstartDate\x88\x01\x01\x12\x1e\n\x08\x65nd_date\x18\x04 \x01(\tH\x01R\x07\x65ndDate\x88\x01\x01\x42\r\n\x0b_start_dateB\x0b\n\t_end_date\"\x84\x02\n\rForexResponse\x12\x1f\n\x0b\x66rom_symbol\x18\x01 \x01(\tR\nfromSymbol\x12\x1b\n\tto_symbol\x18\x02 \x01(\tR\x08toSymbol\x12\x1a\n\x08interval\x18\x03 \x01(\tR\x08interval\x12)\n\x04\x62\x61rs\x18\x04 \x03(\x0b\x32\x15.market_data.OHLCVBarR\x04\x62\x61rs\x12\x14\n\x05\x63ount\x18\x05 \x01(\x05R\x05\x63ount\x12\x16\n\x06\x63\x61\x63hed\x18\x06 \x01(\x08R\x06\x63\x61\x63hed\x12,\n\x0f\x63\x61\x63he_timestamp\x18\x07 \x01(\tH\x00R\x0e\x63\x61\x63heTimestamp\x88\x01\x01\x42\x12\n\x10_cache_timestamp\"[\n\x13GetForexRateRequest\x12#\n\rfrom_currency\x18\x01 \x01(\tR\x0c\x66romCurrency\x12\x1f\n\x0bto_currency\x18\x02 \x01(\tR\ntoCurrency\"\xe2\x02\n\rForexRateData\x12,\n\x12\x66rom_currency_code\x18\x01 \x01(\tR\x10\x66romCurrencyCode\x12,\n\x12\x66rom_currency_name\x18\x02 \x01(\tR\x10\x66romCurrencyName\x12(\n\x10to_currency_code\x18\x03 \x01(\tR\x0etoCurrencyCode\x12(\n\x10to_currency_name\x18\x04 \x01(\tR\x0etoCurrencyName\x12#\n\rexchange_rate\x18\x05 \x01(\x01R\x0c\x65xchangeRate\x12%\n\x0elast_refreshed\x18\x06 \x01(\tR\rlastRefreshed\x12\x1b\n\ttime_zone\x18\x07 \x01(\tR\x08timeZone\x12\x1b\n\tbid_price\x18\x08 \x01(\x01R\x08\x62idPrice\x12\x1b\n\task_price\x18\t \x01(\x01R\x08\x61skPrice\"\x9d\x01\n\x11\x46orexRateResponse\x12.\n\x04rate\x18\x01 \x01(\x0b\x32\x1a.market_data.ForexRateDataR\x04rate\x12\x16\n\x06\x63\x61\x63hed\x18\x02 \x01(\x08R\x06\x63\x61\x63hed\x12,\n\x0f\x63\x61\x63he_timestamp\x18\x03 \x01(\tH\x00R\x0e\x63\x61\x63heTimestamp\x88\x01\x01\x42\x12\n\x10_cache_timestamp\"\x17\n\x15ListForexPairsRequest\"]\n\tForexPair\x12\x1f\n\x0b\x66rom_symbol\x18\x01 \x01(\tR\nfromSymbol\x12\x1b\n\tto_symbol\x18\x02 \x01(\tR\x08toSymbol\x12\x12\n\x04name\x18\x03 \x01(\tR\x04name\"\\\n\x16ListForexPairsResponse\x12,\n\x05pairs\x18\x01 \x03(\x0b\x32\x16.market_data.ForexPairR\x05pairs\x12\x14\n\x05\x63ount\x18\x02 \x01(\x05R\x05\x63ount\"\xa7\x01\n\x15GetCryptoDailyRequest\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x16\n\x06market\x18\x02 \x01(\tR\x06market\x12\"\n\nstart_date\x18\x03 \x01(\tH\x00R\tstartDate\x88\x01\x01\x12\x1e\n\x08\x65nd_date\x18\x04 \x01(\tH\x01R\x07\x65ndDate\x88\x01\x01\x42\r\n\x0b_start_dateB\x0b\n\t_end_date\"\x8c\x02\n\x18GetCryptoIntradayRequest\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x16\n\x06market\x18\x02 \x01(\tR\x06market\x12\x1f\n\x08interval\x18\x03 \x01(\tH\x00R\x08interval\x88\x01\x01\x12\"\n\nstart_date\x18\x04 \x01(\tH\x01R\tstartDate\x88\x01\x01\x12\x1e\n\x08\x65nd_date\x18\x05 \x01(\tH\x02R\x07\x65ndDate\x88\x01\x01\x12#\n\noutputsize\x18\x06 \x01(\tH\x03R\noutputsize\x88\x01\x01\x42\x0b\n\t_intervalB\r\n\x0b_start_dateB\x0b\n\t_end_dateB\r\n\x0b_outputsize\"\xa8\x01\n\x16GetCryptoWeeklyRequest\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x16\n\x06market\x18\x02 \x01(\tR\x06market\x12\"\n\nstart_date\x18\x03 \x01(\tH\x00R\tstartDate\x88\x01\x01\x12\x1e\n\x08\x65nd_date\x18\x04 \x01(\tH\x01R\x07\x65ndDate\x88\x01\x01\x42\r\n\x0b_start_dateB\x0b\n\t_end_date\"\xa9\x01\n\x17GetCryptoMonthlyRequest\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x16\n\x06market\x18\x02 \x01(\tR\x06market\x12\"\n\nstart_date\x18\x03 \x01(\tH\x00R\tstartDate\x88\x01\x01\x12\x1e\n\x08\x65nd_date\x18\x04 \x01(\tH\x01R\x07\x65ndDate\x88\x01\x01\x42\r\n\x0b_start_dateB\x0b\n\t_end_date\"\xf7\x01\n\x0e\x43ryptoResponse\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x16\n\x06market\x18\x02 \x01(\tR\x06market\x12\x1a\n\x08interval\x18\x03 \x01(\tR\x08interval\x12)\n\x04\x62\x61rs\x18\x04 \x03(\x0b\x32\x15.market_data.OHLCVBarR\x04\x62\x61rs\x12\x14\n\x05\x63ount\x18\x05 \x01(\x05R\x05\x63ount\x12\x16\n\x06\x63\x61\x63hed\x18\x06 \x01(\x08R\x06\x63\x61\x63hed\x12,\n\x0f\x63\x61\x63he_timestamp\x18\x07 \x01(\tH\x00R\x0e\x63\x61\x63heTimestamp\x88\x01\x01\x42\x12\n\x10_cache_timestamp\"\x1a\n\x18ListCryptoSymbolsRequest\":\n\x0c\x43ryptoSymbol\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x12\n\x04name\x18\x02 \x01(\tR\x04name\"f\n\x19ListCryptoSymbolsResponse\x12\x33\n\x07symbols\x18\x01 \x03(\x0b\x32\x19.market_data.CryptoSymbolR\x07symbols\x12\x14\n\x05\x63ount\x18\x02 \x01(\x05R\x05\x63ount\"K\n\x17\x42\x61tchCryptoQuoteRequest\x12\x18\n\x07symbols\x18\x01 \x03(\tR\x07symbols\x12\x16\n\x06market\x18\x02 \x01(\tR\x06market\"\xb9\x01\n\x0f\x43ryptoQuoteData\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x16\n\x06market\x18\x02 \x01(\tR\x06market\x12\x14\n\x05price\x18\x03 \x01(\x01R\x05price\x12\x16\n\x06volume\x18\x04 \x01(\x03R\x06volume\x12%\n\x0e\x63hange_percent\x18\x05 \x01(\x01R\rchangePercent\x12!\n\x0clast_updated\x18\x06 \x01(\tR\x0blastUpdated\"f\n\x18\x42\x61tchCryptoQuoteResponse\x12\x34\n\x06quotes\x18\x01 \x03(\x0b\x32\x1c.market_data.CryptoQuoteDataR\x06quotes\x12\x14\n\x05\x63ount\x18\x02 \x01(\x05R\x05\x63ount\"3\n\x19GetCompanyOverviewRequest\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\"\xc8\r\n\x0f\x43ompanyOverview\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x1d\n\nasset_type\x18\x02 \x01(\tR\tassetType\x12\x12\n\x04name\x18\x03 \x01(\tR\x04name\x12 \n\x0b\x64\x65scription\x18\x04 \x01(\tR\x0b\x64\x65scription\x12\x10\n\x03\x63ik\x18\x05 \x01(\tR\x03\x63ik\x12\x1a\n\x08\x65xchange\x18\x06 \x01(\tR\x08\x65xchange\x12\x1a\n\x08\x63urrency\x18\x07 \x01(\tR\x08\x63urrency\x12\x18\n\x07\x63ountry\x18\x08 \x01(\tR\x07\x63ountry\x12\x16\n\x06sector\x18\t \x01(\tR\x06sector\x12\x1a\n\x08industry\x18\n \x01(\tR\x08industry\x12\x18\n\x07\x61\x64\x64ress\x18\x0b \x01(\tR\x07\x61\x64\x64ress\x12&\n\x0f\x66iscal_year_end\x18\x0c \x01(\tR\rfiscalYearEnd\x12%\n\x0elatest_quarter\x18\r \x01(\tR\rlatestQuarter\x12\x33\n\x15market_capitalization\x18\x0e \x01(\x03R\x14marketCapitalization\x12\x16\n\x06\x65\x62itda\x18\x0f \x01(\tR\x06\x65\x62itda\x12\x19\n\x08pe_ratio\x18\x10 \x01(\x01R\x07peRatio\x12\x1b\n\tpeg_ratio\x18\x11 \x01(\x01R\x08pegRatio\x12\x1d\n\nbook_value\x18\x12 \x01(\x01R\tbookValue\x12,\n\x12\x64ividend_per_share\x18\x13 \x01(\x01R\x10\x64ividendPerShare\x12%\n\x0e\x64ividend_yield\x18\x14 \x01(\x01R\rdividendYield\x12\x10\n\x03\x65ps\x18\x15 \x01(\x01R\x03\x65ps\x12\x31\n\x15revenue_per_share_ttm\x18\x16 \x01(\x01R\x12revenuePerShareTtm\x12#\n\rprofit_margin\x18\x17 \x01(\x01R\x0cprofitMargin\x12\x30\n\x14operating_margin_ttm\x18\x18 \x01(\x01R\x12operatingMarginTtm\x12/\n\x14return_on_assets_ttm\x18\x19 \x01(\x01R\x11returnOnAssetsTtm\x12/\n\x14return_on_equity_ttm\x18\x1a \x01(\x01R\x11returnOnEquityTtm\x12\x1f\n\x0brevenue_ttm\x18\x1b \x01(\x01R\nrevenueTtm\x12(\n\x10gross_profit_ttm\x18\x1c \x01(\x01R\x0egrossProfitTtm\x12&\n\x0f\x64iluted_eps_ttm\x18\x1d \x01(\x01R\rdilutedEpsTtm\x12\x41\n\x1dquarterly_earnings_growth_yoy\x18\x1e \x01(\x01R\x1aquarterlyEarningsGrowthYoy\x12?\n\x1cquarterly_revenue_growth_yoy\x18\x1f \x01(\x01R\x19quarterlyRevenueGrowthYoy\x12\x30\n\x14\x61nalyst_target_price\x18  \x01(\x01R\x12\x61nalystTargetPrice\x12\x1f\n\x0btrailing_pe\x18! \x01(\x01R\ntrailingPe\x12\x1d\n\nforward_pe\x18\" \x01(\x01R\tforwardPe\x12\x36\n\x18price_to_sales_ratio_ttm\x18# \x01(\x01R\x14priceToSalesRatioTtm\x12-\n\x13price_to_book_ratio\x18$ \x01(\x01R\x10priceToBookRatio\x12\"\n\rev_to_revenue\x18% \x01(\x01R\x0b\x65vToRevenue\x12 \n\x0c\x65v_to_ebitda\x18& \x01(\x01R\nevToEbitda\x12\x12\n\x04\x62\x65ta\x18\' \x01(\x01R\x04\x62\x65ta\x12 \n\x0cweek_52_high\x18( \x01(\tR\nweek52High\x12\x1e\n\x0bweek_52_low\x18) \x01(\tR\tweek52Low\x12\x31\n\x15\x64\x61y_50_moving_average\x18* \x01(\tR\x12\x64\x61y50MovingAverage\x12\x33\n\x16\x64\x61y_200_moving_average\x18+ \x01(\tR\x13\x64\x61y200MovingAverage\x12-\n\x12shares_outstanding\x18, \x01(\x03R\x11sharesOutstanding\x12#\n\rdividend_date\x18- \x01(\tR\x0c\x64ividendDate\x12(\n\x10\x65x_dividend_date\x18. \x01(\tR\x0e\x65xDividendDate\"\xad\x01\n\x17\x43ompanyOverviewResponse\x12\x38\n\x08overview\x18\x01 \x01(\x0b\x32\x1c.market_data.CompanyOverviewR\x08overview\x12\x16\n\x06\x63\x61\x63hed\x18\x02 \x01(\x08R\x06\x63\x61\x63hed\x12,\n\x0f\x63\x61\x63he_timestamp\x18\x03 \x01(\tH\x00R\x0e\x63\x61\x63heTimestamp\x88\x01\x01\x42\x12\n\x10_cache_timestamp\"3\n\x19GetIncomeStatementRequest\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\"\x87\n\n\x0fIncomeStatement\x12,\n\x12\x66iscal_date_ending\x18\x01 \x01(\tR\x10\x66iscalDateEnding\x12+\n\x11reported_currency\x18\x02 \x01(\tR\x10reportedCurrency\x12!\n\x0cgross_profit\x18\x03 \x01(\x03R\x0bgrossProfit\x12#\n\rtotal_revenue\x18\x04 \x01(\x03R\x0ctotalRevenue\x12&\n\x0f\x63ost_of_revenue\x18\x05 \x01(\x03R\rcostOfRevenue\x12\x43\n\x1f\x63ost_of_goods_and_services_sold\x18\x06 \x01(\x03R\x1a\x63ostOfGoodsAndServicesSold\x12)\n\x10operating_income\x18\x07 \x01(\x03R\x0foperatingIncome\x12K\n\"selling_general_and_administrative\x18\x08 \x01(\x03R\x1fsellingGeneralAndAdministrative\x12\x38\n\x18research_and_development\x18\t \x01(\x03R\x16researchAndDevelopment\x12-\n\x12operating_expenses\x18\n \x01(\x03R\x11operatingExpenses\x12\x32\n\x15investment_income_net\x18\x0b \x01(\x03R\x13investmentIncomeNet\x12.\n\x13net_interest_income\x18\x0c \x01(\x03R\x11netInterestIncome\x12\'\n\x0finterest_income\x18\r \x01(\x03R\x0einterestIncome\x12)\n\x10interest_expense\x18\x0e \x01(\x03R\x0finterestExpense\x12.\n\x13non_interest_income\x18\x0f \x01(\x03R\x11nonInterestIncome\x12;\n\x1aother_non_operating_income\x18\x10 \x01(\x03R\x17otherNonOperatingIncome\x12\"\n\x0c\x64\x65preciation\x18\x11 \x01(\x03R\x0c\x64\x65preciation\x12\x42\n\x1d\x64\x65preciation_and_amortization\x18\x12 \x01(\x03R\x1b\x64\x65preciationAndAmortization\x12*\n\x11income_before_tax\x18\x13 \x01(\x03R\x0fincomeBeforeTax\x12,\n\x12income_tax_expense\x18\x14 \x01(\x03R\x10incomeTaxExpense\x12\x39\n\x19interest_and_debt_expense\x18\x15 \x01(\x03R\x16interestAndDebtExpense\x12P\n%net_income_from_continuing_operations\x18\x16 \x01(\x03R!netIncomeFromContinuingOperations\x12\x44\n\x1f\x63omprehensive_income_net_of_tax\x18\x17 \x01(\x03R\x1b\x63omprehensiveIncomeNetOfTax\x12\x12\n\x04\x65\x62it\x18\x18 \x01(\x03R\x04\x65\x62it\x12\x16\n\x06\x65\x62itda\x18\x19 \x01(\x03R\x06\x65\x62itda\x12\x1d\n\nnet_income\x18\x1a \x01(\x03R\tnetIncome\"\x9b\x02\n\x17IncomeStatementResponse\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x43\n\x0e\x61nnual_reports\x18\x02 \x03(\x0b\x32\x1c.market_data.IncomeStatementR\rannualReports\x12I\n\x11quarterly_reports\x18\x03 \x03(\x0b\x32\x1c.market_data.IncomeStatementR\x10quarterlyReports\x12\x16\n\x06\x63\x61\x63hed\x18\x04 \x01(\x08R\x06\x63\x61\x63hed\x12,\n\x0f\x63\x61\x63he_timestamp\x18\x05 \x01(\tH\x00R\x0e\x63\x61\x63heTimestamp\x88\x01\x01\x42\x12\n\x10_cache_timestamp\"0\n\x16GetBalanceSheetRequest\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\"\xf6\x0f\n\x0c\x42\x61lanceSheet\x12,\n\x12\x66iscal_date_ending\x18\x01 \x01(\tR\x10\x66iscalDateEnding\x12+\n\x11reported_currency\x18\x02 \x01(\tR\x10reportedCurrency\x12!\n\x0ctotal_assets\x18\x03 \x01(\x03R\x0btotalAssets\x12\x30\n\x14total_current_assets\x18\x04 \x01(\x03R\x12totalCurrentAssets\x12Z\n+cash_and_cash_equivalents_at_carrying_value\x18\x05 \x01(\x03R%cashAndCashEquivalentsAtCarryingValue\x12\x44\n\x1f\x63\x61sh_and_short_term_investments\x18\x06 \x01(\x03R\x1b\x63\x61shAndShortTermInvestments\x12\x1c\n\tinventory\x18\x07 \x01(\x03R\tinventory\x12\x36\n\x17\x63urrent_net_receivables\x18\x08 \x01(\x03R\x15\x63urrentNetReceivables\x12\x37\n\x18total_non_current_assets\x18\t \x01(\x03R\x15totalNonCurrentAssets\x12\x38\n\x18property_plant_equipment\x18\n \x01(\x03R\x16propertyPlantEquipment\x12Y\n)accumulated_depreciation_amortization_ppe\x18\x0b \x01(\x03R&accumulatedDepreciationAmortizationPpe\x12+\n\x11intangible_assets\x18\x0c \x01(\x03R\x10intangibleAssets\x12O\n$intangible_assets_excluding_goodwill\x18\r \x01(\x03R!intangibleAssetsExcludingGoodwill\x12\x1a\n\x08goodwill\x18\x0e \x01(\x03R\x08goodwill\x12 \n\x0binvestments\x18\x0f \x01(\x03R\x0binvestments\x12\x32\n\x15long_term_investments\x18\x10 \x01(\x03R\x13longTermInvestments\x12\x34\n\x16short_term_investments\x18\x11 \x01(\x03R\x14shortTermInvestments\x12\x30\n\x14other_current_assets\x18\x12 \x01(\x03R\x12otherCurrentAssets\x12\x37\n\x18other_non_current_assets\x18\x13 \x01(\x03R\x15otherNonCurrentAssets\x12+\n\x11total_liabilities\x18\x14 \x01(\x03R\x10totalLiabilities\x12:\n\x19total_current_liabilities\x18\x15 \x01(\x03R\x17totalCurrentLiabilities\x12\x38\n\x18\x63urrent_accounts_payable\x18\x16 \x01(\x03R\x16\x63urrentAccountsPayable\x12)\n\x10\x64\x65\x66\x65rred_revenue\x18\x17 \x01(\x03R\x0f\x64\x65\x66\x65rredRevenue\x12!\n\x0c\x63urrent_debt\x18\x18 \x01(\x03R\x0b\x63urrentDebt\x12&\n\x0fshort_term_debt\x18\x19 \x01(\x03R\rshortTermDebt\x12\x41\n\x1dtotal_non_current_liabilities\x18\x1a \x01(\x03R\x1atotalNonCurrentLiabilities\x12:\n\x19\x63\x61pital_lease_obligations\x18\x1b \x01(\x03R\x17\x63\x61pitalLeaseObligations\x12$\n\x0elong_term_debt\x18\x1c \x01(\x03R\x0clongTermDebt\x12\x33\n\x16\x63urrent_long_term_debt\x18\x1d \x01(\x03R\x13\x63urrentLongTermDebt\x12\x39\n\x19long_term_debt_noncurrent\x18\x1e \x01(\x03R\x16longTermDebtNoncurrent\x12:\n\x1ashort_long_term_debt_total\x18\x1f \x01(\x03R\x16shortLongTermDebtTotal\x12:\n\x19other_current_liabilities\x18  \x01(\x03R\x17otherCurrentLiabilities\x12\x41\n\x1dother_non_current_liabilities\x18! \x01(\x03R\x1aotherNonCurrentLiabilities\x12\x38\n\x18total_shareholder_equity\x18\" \x01(\x03R\x16totalShareholderEquity\x12%\n\x0etreasury_stock\x18# \x01(\x03R\rtreasuryStock\x12+\n\x11retained_earnings\x18$ \x01(\x03R\x10retainedEarnings\x12!\n\x0c\x63ommon_stock\x18% \x01(\x03R\x0b\x63ommonStock\x12\x45\n\x1f\x63ommon_stock_shares_outstanding\x18& \x01(\x03R\x1c\x63ommonStockSharesOutstanding\"\x92\x02\n\x14\x42\x61lanceSheetResponse\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12@\n\x0e\x61nnual_reports\x18\x02 \x03(\x0b\x32\x19.market_data.BalanceSheetR\rannualReports\x12\x46\n\x11quarterly_reports\x18\x03 \x03(\x0b\x32\x19.market_data.BalanceSheetR\x10quarterlyReports\x12\x16\n\x06\x63\x61\x63hed\x18\x04 \x01(\x08R\x06\x63\x61\x63hed\x12,\n\x0f\x63\x61\x63he_timestamp\x18\x05 \x01(\tH\x00R\x0e\x63\x61\x63heTimestamp\x88\x01\x01\x42\x12\n\x10_cache_timestamp\",\n\x12GetCashFlowRequest\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\"\xab\x0f\n\x08\x43\x61shFlow\x12,\n\x12\x66iscal_date_ending\x18\x01 \x01(\tR\x10\x66iscalDateEnding\x12+\n\x11reported_currency\x18\x02 \x01(\tR\x10reportedCurrency\x12-\n\x12operating_cashflow\x18\x03 \x01(\x03R\x11operatingCashflow\x12I\n!payments_for_operating_activities\x18\x04 \x01(\x03R\x1epaymentsForOperatingActivities\x12K\n\"proceeds_from_operating_activities\x18\x05 \x01(\x03R\x1fproceedsFromOperatingActivities\x12\x45\n\x1f\x63hange_in_operating_liabilities\x18\x06 \x01(\x03R\x1c\x63hangeInOperatingLiabilities\x12;\n\x1a\x63hange_in_operating_assets\x18\x07 \x01(\x03R\x17\x63hangeInOperatingAssets\x12U\n\'depreciation_depletion_and_amortization\x18\x08 \x01(\x03R$depreciationDepletionAndAmortization\x12\x31\n\x14\x63\x61pital_expenditures\x18\t \x01(\x03R\x13\x63\x61pitalExpenditures\x12\x32\n\x15\x63hange_in_receivables\x18\n \x01(\x03R\x13\x63hangeInReceivables\x12.\n\x13\x63hange_in_inventory\x18\x0b \x01(\x03R\x11\x63hangeInInventory\x12\x1f\n\x0bprofit_loss\x18\x0c \x01(\x03R\nprofitLoss\x12\x38\n\x18\x63\x61shflow_from_investment\x18\r \x01(\x03R\x16\x63\x61shflowFromInvestment\x12\x36\n\x17\x63\x61shflow_from_financing\x18\x0e \x01(\x03R\x15\x63\x61shflowFromFinancing\x12Z\n+proceeds_from_repayments_of_short_term_debt\x18\x0f \x01(\x03R%proceedsFromRepaymentsOfShortTermDebt\x12S\n\'payments_for_repurchase_of_common_stock\x18\x10 \x01(\x03R\"paymentsForRepurchaseOfCommonStock\x12H\n!payments_for_repurchase_of_equity\x18\x11 \x01(\x03R\x1dpaymentsForRepurchaseOfEquity\x12Y\n*payments_for_repurchase_of_preferred_stock\x18\x12 \x01(\x03R%paymentsForRepurchaseOfPreferredStock\x12\'\n\x0f\x64ividend_payout\x18\x13 \x01(\x03R\x0e\x64ividendPayout\x12?\n\x1c\x64ividend_payout_common_stock\x18\x14 \x01(\x03R\x19\x64ividendPayoutCommonStock\x12\x45\n\x1f\x64ividend_payout_preferred_stock\x18\x15 \x01(\x03R\x1c\x64ividendPayoutPreferredStock\x12Q\n&proceeds_from_issuance_of_common_stock\x18\x16 \x01(\x03R!proceedsFromIssuanceOfCommonStock\x12\x86\x01\nCproceeds_from_issuance_of_long_term_debt_and_capital_securities_net\x18\x17 \x01(\x03R9proceedsFromIssuanceOfLongTermDebtAndCapitalSecuritiesNet\x12W\n)proceeds_from_issuance_of_preferred_stock\x18\x18 \x01(\x03R$proceedsFromIssuanceOfPreferredStock\x12J\n\"proceeds_from_repurchase_of_equity\x18\x19 \x01(\x03R\x1eproceedsFromRepurchaseOfEquity\x12M\n$proceeds_from_sale_of_treasury_stock\x18\x1a \x01(\x03R\x1fproceedsFromSaleOfTreasuryStock\x12K\n#change_in_cash_and_cash_equivalents\x18\x1b \x01(\x03R\x1e\x63hangeInCashAndCashEquivalents\x12\x35\n\x17\x63hange_in_exchange_rate\x18\x1c \x01(\x03R\x14\x63hangeInExchangeRate\x12\x1d\n\nnet_income\x18\x1d \x01(\x03R\tnetIncome\"\x86\x02\n\x10\x43\x61shFlowResponse\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12<\n\x0e\x61nnual_reports\x18\x02 \x03(\x0b\x32\x15.market_data.CashFlowR\rannualReports\x12\x42\n\x11quarterly_reports\x18\x03 \x03(\x0b\x32\x15.market_data.CashFlowR\x10quarterlyReports\x12\x16\n\x06\x63\x61\x63hed\x18\x04 \x01(\x08R\x06\x63\x61\x63hed\x12,\n\x0f\x63\x61\x63he_timestamp\x18\x05 \x01(\tH\x00R\x0e\x63\x61\x63heTimestamp\x88\x01\x01\x42\x12\n\x10_cache_timestamp\",\n\x12GetEarningsRequest\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\"\x97\x02\n\x0c\x45\x61rningsData\x12,\n\x12\x66iscal_date_ending\x18\x01 \x01(\tR\x10\x66iscalDateEnding\x12!\n\x0creported_eps\x18\x02 \x01(\x01R\x0breportedEps\x12(\n\restimated_eps\x18\x03 \x01(\x01H\x00R\x0c\x65stimatedEps\x88\x01\x01\x12\x1f\n\x08surprise\x18\x04 \x01(\x01H\x01R\x08surprise\x88\x01\x01\x12\x34\n\x13surprise_percentage\x18\x05 \x01(\x01H\x02R\x12surprisePercentage\x88\x01\x01\x42\x10\n\x0e_estimated_epsB\x0b\n\t_surpriseB\x16\n\x14_surprise_percentage\"\x92\x02\n\x10\x45\x61rningsResponse\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x42\n\x0f\x61nnual_earnings\x18\x02 \x03(\x0b\x32\x19.market_data.EarningsDataR\x0e\x61nnualEarnings\x12H\n\x12quarterly_earnings\x18\x03 \x03(\x0b\x32\x19.market_data.EarningsDataR\x11quarterlyEarnings\x12\x16\n\x06\x63\x61\x63hed\x18\x04 \x01(\x08R\x06\x63\x61\x63hed\x12,\n\x0f\x63\x61\x63he_timestamp\x18\x05 \x01(\tH\x00R\x0e\x63\x61\x63heTimestamp\x88\x01\x01\x42\x12\n\x10_cache_timestamp\"o\n\x1aGetEarningsCalendarRequest\x12\x1b\n\x06symbol\x18\x01 \x01(\tH\x00R\x06symbol\x88\x01\x01\x12\x1d\n\x07horizon\x18\x02 \x01(\tH\x01R\x07horizon\x88\x01\x01\x42\t\n\x07_symbolB\n\n\x08_horizon\"\xf8\x01\n\x15\x45\x61rningsCalendarEvent\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x12\n\x04name\x18\x02 \x01(\tR\x04name\x12\x1f\n\x0breport_date\x18\x03 \x01(\tR\nreportDate\x12\x31\n\x12\x66iscal_date_ending\x18\x04 \x01(\x01H\x00R\x10\x66iscalDateEnding\x88\x01\x01\x12\x1f\n\x08\x65stimate\x18\x05 \x01(\x01H\x01R\x08\x65stimate\x88\x01\x01\x12\x1a\n\x08\x63urrency\x18\x06 \x01(\tR\x08\x63urrencyB\x15\n\x13_fiscal_date_endingB\x0b\n\t_estimate\"\xc6\x01\n\x18\x45\x61rningsCalendarResponse\x12:\n\x06\x65vents\x18\x01 \x03(\x0b\x32\".market_data.EarningsCalendarEventR\x06\x65vents\x12\x14\n\x05\x63ount\x18\x02 \x01(\x05R\x05\x63ount\x12\x16\n\x06\x63\x61\x63hed\x18\x03 \x01(\x08R\x06\x63\x61\x63hed\x12,\n\x0f\x63\x61\x63he_timestamp\x18\x04 \x01(\tH\x00R\x0e\x63\x61\x63heTimestamp\x88\x01\x01\x42\x12\n\x10_cache_timestamp\"\x17\n\x15GetIPOCalendarRequest\"\xdb\x01\n\x08IPOEvent\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x12\n\x04name\x18\x02 \x01(\tR\x04name\x12\x19\n\x08ipo_date\x18\x03 \x01(\tR\x07ipoDate\x12&\n\x0fprice_range_low\x18\x04 \x01(\tR\rpriceRangeLow\x12(\n\x10price_range_high\x18\x05 \x01(\tR\x0epriceRangeHigh\x12\x1a\n\x08\x63urrency\x18\x06 \x01(\tR\x08\x63urrency\x12\x1a\n\x08\x65xchange\x18\x07 \x01(\tR\x08\x65xchange\"\xb4\x01\n\x13IPOCalendarResponse\x12-\n\x06\x65vents\x18\x01 \x03(\x0b\x32\x15.market_data.IPOEventR\x06\x65vents\x12\x14\n\x05\x63ount\x18\x02 \x01(\x05R\x05\x63ount\x12\x16\n\x06\x63\x61\x63hed\x18\x03 \x01(\x08R\x06\x63\x61\x63hed\x12,\n\x0f\x63\x61\x63he_timestamp\x18\x04 \x01(\tH\x00R\x0e\x63\x61\x63heTimestamp\x88\x01\x01\x42\x12\n\x10_cache_timestamp\".\n\x14GetETFProfileRequest\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\"\xe3\x03\n\nETFProfile\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x1f\n\x0b\x61sset_class\x18\x02 \x01(\tR\nassetClass\x12(\n\x10\x61sset_class_size\x18\x03 \x01(\tR\x0e\x61ssetClassSize\x12*\n\x11\x61sset_class_style\x18\x04 \x01(\tR\x0f\x61ssetClassStyle\x12\x1d\n\nbrand_name\x18\x05 \x01(\tR\tbrandName\x12\x1a\n\x08\x63\x61tegory\x18\x06 \x01(\tR\x08\x63\x61tegory\x12\x14\n\x05\x66ocus\x18\x07 \x01(\tR\x05\x66ocus\x12\x14\n\x05niche\x18\x08 \x01(\tR\x05niche\x12\x1a\n\x08strategy\x18\t \x01(\tR\x08strategy\x12\x1c\n\tdeveloper\x18\n \x01(\tR\tdeveloper\x12#\n\rindex_tracked\x18\x0b \x01(\tR\x0cindexTracked\x12\x16\n\x06issuer\x18\x0c \x01(\tR\x06issuer\x12%\n\x0einception_date\x18\r \x01(\tR\rinceptionDate\x12\x1f\n\x0b\x64\x61ta_source\x18\x0e \x01(\tR\ndataSource\x12 \n\x0b\x64\x65scription\x18\x0f \x01(\tR\x0b\x64\x65scription\"\xa1\x01\n\x12\x45TFProfileResponse\x12\x31\n\x07profile\x18\x01 \x01(\x0b\x32\x17.market_data.ETFProfileR\x07profile\x12\x16\n\x06\x63\x61\x63hed\x18\x02 \x01(\x08R\x06\x63\x61\x63hed\x12,\n\x0f\x63\x61\x63he_timestamp\x18\x03 \x01(\tH\x00R\x0e\x63\x61\x63heTimestamp\x88\x01\x01\x42\x12\n\x10_cache_timestamp\"-\n\x13GetDividendsRequest\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\"\x84\x02\n\x0c\x44ividendData\x12(\n\x10\x65x_dividend_date\x18\x01 \x01(\tR\x0e\x65xDividendDate\x12\x16\n\x06\x61mount\x18\x02 \x01(\x01R\x06\x61mount\x12.\n\x10\x64\x65\x63laration_date\x18\x03 \x01(\tH\x00R\x0f\x64\x65\x63larationDate\x88\x01\x01\x12$\n\x0brecord_date\x18\x04 \x01(\tH\x01R\nrecordDate\x88\x01\x01\x12&\n\x0cpayment_date\x18\x05 \x01(\tH\x02R\x0bpaymentDate\x88\x01\x01\x42\x13\n\x11_declaration_dateB\x0e\n\x0c_record_dateB\x0f\n\r_payment_date\"\xd4\x01\n\x11\x44ividendsResponse\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x37\n\tdividends\x18\x02 \x03(\x0b\x32\x19.market_data.DividendDataR\tdividends\x12\x14\n\x05\x63ount\x18\x03 \x01(\x05R\x05\x63ount\x12\x16\n\x06\x63\x61\x63hed\x18\x04 \x01(\x08R\x06\x63\x61\x63hed\x12,\n\x0f\x63\x61\x63he_timestamp\x18\x05 \x01(\tH\x00R\x0e\x63\x61\x63heTimestamp\x88\x01\x01\x42\x12\n\x10_cache_timestamp\"*\n\x10GetSplitsRequest\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\"L\n\tSplitData\x12\x12\n\x04\x64\x61te\x18\x01 \x01(\tR\x04\x64\x61te\x12+\n\x11split_coefficient\x18\x02 \x01(\x01R\x10splitCoefficient\"\xc8\x01\n\x0eSplitsResponse\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12.\n\x06splits\x18\x02 \x03(\x0b\x32\x16.market_data.SplitDataR\x06splits\x12\x14\n\x05\x63ount\x18\x03 \x01(\x05R\x05\x63ount\x12\x16\n\x06\x63\x61\x63hed\x18\x04 \x01(\x08R\x06\x63\x61\x63hed\x12,\n\x0f\x63\x61\x63he_timestamp\x18\x05 \x01(\tH\x00R\x0e\x63\x61\x63heTimestamp\x88\x01\x01\x42\x12\n\x10_cache_timestamp\"\x84\x02\n\x0eGetNewsRequest\x12\x1d\n\x07tickers\x18\x01 \x01(\tH\x00R\x07tickers\x88\x01\x01\x12\x1b\n\x06topics\x18\x02 \x01(\tH\x01R\x06topics\x88\x01\x01\x12 \n\ttime_from\x18\x03 \x01(\tH\x02R\x08timeFrom\x88\x01\x01\x12\x1c\n\x07time_to\x18\x04 \x01(\tH\x03R\x06timeTo\x88\x01\x01\x12\x17\n\x04sort\x18\x05 \x01(\tH\x04R\x04sort\x88\x01\x01\x12\x19\n\x05limit\x18\x06 \x01(\x05H\x05R\x05limit\x88\x01\x01\x42\n\n\x08_tickersB\t\n\x07_topicsB\x0c\n\n_time_fromB\n\n\x08_time_toB\x07\n\x05_sortB\x08\n\x06_limit\"\x90\x04\n\x0bNewsArticle\x12\x14\n\x05title\x18\x01 \x01(\tR\x05title\x12\x10\n\x03url\x18\x02 \x01(\tR\x03url\x12%\n\x0etime_published\x18\x03 \x01(\tR\rtimePublished\x12\x18\n\x07\x61uthors\x18\x04 \x03(\tR\x07\x61uthors\x12\x18\n\x07summary\x18\x05 \x01(\tR\x07summary\x12!\n\x0c\x62\x61nner_image\x18\x06 \x01(\tR\x0b\x62\x61nnerImage\x12\x16\n\x06source\x18\x07 \x01(\tR\x06source\x12\x34\n\x16\x63\x61tegory_within_source\x18\x08 \x01(\tR\x14\x63\x61tegoryWithinSource\x12#\n\rsource_domain\x18\t \x01(\tR\x0csourceDomain\x12/\n\x06topics\x18\n \x03(\x0b\x32\x17.market_data.NewsTickerR\x06topics\x12\x36\n\x17overall_sentiment_score\x18\x0b \x01(\x01R\x15overallSentimentScore\x12\x36\n\x17overall_sentiment_label\x18\x0c \x01(\tR\x15overallSentimentLabel\x12G\n\x10ticker_sentiment\x18\r \x03(\x0b\x32\x1c.market_data.TickerSentimentR\x0ftickerSentiment\"K\n\nNewsTicker\x12\x14\n\x05topic\x18\x01 \x01(\tR\x05topic\x12\'\n\x0frelevance_score\x18\x02 \x01(\x01R\x0erelevanceScore\"\xbe\x01\n\x0fTickerSentiment\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\x12\'\n\x0frelevance_score\x18\x02 \x01(\x01R\x0erelevanceScore\x12\x34\n\x16ticker_sentiment_score\x18\x03 \x01(\x01R\x14tickerSentimentScore\x12\x34\n\x16ticker_sentiment_label\x18\x04 \x01(\tR\x14tickerSentimentLabel\"\xb0\x02\n\x0cNewsResponse\x12\x34\n\x08\x61rticles\x18\x01 \x03(\x0b\x32\x18.market_data.NewsArticleR\x08\x61rticles\x12\x14\n\x05\x63ount\x18\x02 \x01(\x05R\x05\x63ount\x12<\n\x1asentiment_score_definition\x18\x03 \x01(\tR\x18sentimentScoreDefinition\x12<\n\x1arelevance_score_definition\x18\x04 \x01(\tR\x18relevanceScoreDefinition\x12\x16\n\x06\x63\x61\x63hed\x18\x05 \x01(\x08R\x06\x63\x61\x63hed\x12,\n\x0f\x63\x61\x63he_timestamp\x18\x06 \x01(\tH\x00R\x0e\x63\x61\x63heTimestamp\x88\x01\x01\x42\x12\n\x10_cache_timestamp\"\x1c\n\x1aGetTopGainersLosersRequest\"\xa4\x01\n\nStockMover\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\x12\x14\n\x05price\x18\x02 \x01(\x01R\x05price\x12#\n\rchange_amount\x18\x03 \x01(\x01R\x0c\x63hangeAmount\x12+\n\x11\x63hange_percentage\x18\x04 \x01(\x01R\x10\x63hangePercentage\x12\x16\n\x06volume\x18\x05 \x01(\x03R\x06volume\"\xd4\x02\n\x18TopGainersLosersResponse\x12\x38\n\x0btop_gainers\x18\x01 \x03(\x0b\x32\x17.market_data.StockMoverR\ntopGainers\x12\x36\n\ntop_losers\x18\x02 \x03(\x0b\x32\x17.market_data.StockMoverR\ttopLosers\x12I\n\x14most_actively_traded\x18\x03 \x03(\x0b\x32\x17.market_data.StockMoverR\x12mostActivelyTraded\x12!\n\x0clast_updated\x18\x04 \x01(\tR\x0blastUpdated\x12\x16\n\x06\x63\x61\x63hed\x18\x05 \x01(\x08R\x06\x63\x61\x63hed\x12,\n\x0f\x63\x61\x63he_timestamp\x18\x06 \x01(\tH\x00R\x0e\x63\x61\x63heTimestamp\x88\x01\x01\x42\x12\n\x10_cache_timestamp\"2\n\x18GetAnalystRatingsRequest\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\"\x97\x01\n\rAnalystRating\x12!\n\x0c\x61nalyst_firm\x18\x01 \x01(\tR\x0b\x61nalystFirm\x12\x16\n\x06rating\x18\x02 \x01(\tR\x06rating\x12&\n\x0ctarget_price\x18\x03 \x01(\x01H\x00R\x0btargetPrice\x88\x01\x01\x12\x12\n\x04\x64\x61te\x18\x04 \x01(\tR\x04\x64\x61teB\x0f\n\r_target_price\"\xd6\x01\n\x16\x41nalystRatingsResponse\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x34\n\x07ratings\x18\x02 \x03(\x0b\x32\x1a.market_data.AnalystRatingR\x07ratings\x12\x14\n\x05\x63ount\x18\x03 \x01(\x05R\x05\x63ount\x12\x16\n\x06\x63\x61\x63hed\x18\x04 \x01(\x08R\x06\x63\x61\x63hed\x12,\n\x0f\x63\x61\x63he_timestamp\x18\x05 \x01(\tH\x00R\x0e\x63\x61\x63heTimestamp\x88\x01\x01\x42\x12\n\x10_cache_timestamp\"7\n\x1dGetInsiderTransactionsRequest\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\"\x98\x02\n\x12InsiderTransaction\x12!\n\x0cinsider_name\x18\x01 \x01(\tR\x0binsiderName\x12\x1a\n\x08position\x18\x02 \x01(\tR\x08position\x12)\n\x10transaction_type\x18\x03 \x01(\tR\x0ftransactionType\x12)\n\x10transaction_date\x18\x04 \x01(\tR\x0ftransactionDate\x12\x16\n\x06shares\x18\x05 \x01(\x05R\x06shares\x12+\n\x0fprice_per_share\x18\x06 \x01(\x01H\x00R\rpricePerShare\x88\x01\x01\x12\x14\n\x05value\x18\x07 \x01(\x03R\x05valueB\x12\n\x10_price_per_share\"\xea\x01\n\x1bInsiderTransactionsResponse\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x43\n\x0ctransactions\x18\x02 \x03(\x0b\x32\x1f.market_data.InsiderTransactionR\x0ctransactions\x12\x14\n\x05\x63ount\x18\x03 \x01(\x05R\x05\x63ount\x12\x16\n\x06\x63\x61\x63hed\x18\x04 \x01(\x08R\x06\x63\x61\x63hed\x12,\n\x0f\x63\x61\x63he_timestamp\x18\x05 \x01(\tH\x00R\x0e\x63\x61\x63heTimestamp\x88\x01\x01\x42\x12\n\x10_cache_timestamp\"\x83\x01\n\x1cGetEarningsTranscriptRequest\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x17\n\x04year\x18\x02 \x01(\tH\x00R\x04year\x88\x01\x01\x12\x1d\n\x07quarter\x18\x03 \x01(\tH\x01R\x07quarter\x88\x01\x01\x42\x07\n\x05_yearB\n\n\x08_quarter\"\x8e\x01\n\x12\x45\x61rningsTranscript\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x18\n\x07quarter\x18\x02 \x01(\tR\x07quarter\x12\x12\n\x04year\x18\x03 \x01(\tR\x04year\x12\x1e\n\ntranscript\x18\x04 \x01(\tR\ntranscript\x12\x12\n\x04\x64\x61te\x18\x05 \x01(\tR\x04\x64\x61te\"\xab\x01\n\x1a\x45\x61rningsTranscriptResponse\x12\x33\n\x04\x64\x61ta\x18\x01 \x01(\x0b\x32\x1f.market_data.EarningsTranscriptR\x04\x64\x61ta\x12\x16\n\x06\x63\x61\x63hed\x18\x02 \x01(\x08R\x06\x63\x61\x63hed\x12,\n\x0f\x63\x61\x63he_timestamp\x18\x03 \x01(\tH\x00R\x0e\x63\x61\x63heTimestamp\x88\x01\x01\x42\x12\n\x10_cache_timestamp\"=\n\rGetGDPRequest\x12\x1f\n\x08interval\x18\x01 \x01(\tH\x00R\x08interval\x88\x01\x01\x42\x0b\n\t_interval\"=\n\x11\x45\x63onomicDataPoint\x12\x12\n\x04\x64\x61te\x18\x01 \x01(\tR\x04\x64\x61te\x12\x14\n\x05value\x18\x02 \x01(\x01R\x05value\"\x83\x02\n\x19\x45\x63onomicIndicatorResponse\x12\x12\n\x04name\x18\x01 \x01(\tR\x04name\x12\x1a\n\x08interval\x18\x02 \x01(\tR\x08interval\x12\x12\n\x04unit\x18\x03 \x01(\tR\x04unit\x12\x32\n\x04\x64\x61ta\x18\x04 \x03(\x0b\x32\x1e.market_data.EconomicDataPointR\x04\x64\x61ta\x12\x14\n\x05\x63ount\x18\x05 \x01(\x05R\x05\x63ount\x12\x16\n\x06\x63\x61\x63hed\x18\x06 \x01(\x08R\x06\x63\x61\x63hed\x12,\n\x0f\x63\x61\x63he_timestamp\x18\x07 \x01(\tH\x00R\x0e\x63\x61\x63heTimestamp\x88\x01\x01\x42\x12\n\x10_cache_timestamp\"\x18\n\x16GetGDPPerCapitaRequest\"\x15\n\x13GetInflationRequest\"=\n\rGetCPIRequest\x12\x1f\n\x08interval\x18\x01 \x01(\tH\x00R\x08interval\x88\x01\x01\x42\x0b\n\t_interval\"J\n\x1aGetFederalFundsRateRequest\x12\x1f\n\x08interval\x18\x01 \x01(\tH\x00R\x08interval\x88\x01\x01\x42\x0b\n\t_interval\"u\n\x17GetTreasuryYieldRequest\x12\x1f\n\x08interval\x18\x01 \x01(\tH\x00R\x08interval\x88\x01\x01\x12\x1f\n\x08maturity\x18\x02 \x01(\tH\x01R\x08maturity\x88\x01\x01\x42\x0b\n\t_intervalB\x0b\n\t_maturity\"\x17\n\x15GetRetailSalesRequest\"\x14\n\x12GetDurablesRequest\"\x18\n\x16GetUnemploymentRequest\"\x1a\n\x18GetNonfarmPayrollRequest\"a\n\x13GetCommodityRequest\x12\x1c\n\tcommodity\x18\x01 \x01(\tR\tcommodity\x12\x1f\n\x08interval\x18\x02 \x01(\tH\x00R\x08interval\x88\x01\x01\x42\x0b\n\t_interval\"\xfb\x01\n\x11\x43ommodityResponse\x12\x12\n\x04name\x18\x01 \x01(\tR\x04name\x12\x1a\n\x08interval\x18\x02 \x01(\tR\x08interval\x12\x12\n\x04unit\x18\x03 \x01(\tR\x04unit\x12\x32\n\x04\x64\x61ta\x18\x04 \x03(\x0b\x32\x1e.market_data.EconomicDataPointR\x04\x64\x61ta\x12\x14\n\x05\x63ount\x18\x05 \x01(\x05R\x05\x63ount\x12\x16\n\x06\x63\x61\x63hed\x18\x06 \x01(\x08R\x06\x63\x61\x63hed\x12,\n\x0f\x63\x61\x63he_timestamp\x18\x07 \x01(\tH\x00R\x0e\x63\x61\x63heTimestamp\x88\x01\x01\x42\x12\n\x10_cache_timestamp\"H\n\x18GetAllCommoditiesRequest\x12\x1f\n\x08interval\x18\x01 \x01(\tH\x00R\x08interval\x88\x01\x01\x42\x0b\n\t_interval\"\xc0\x02\n\x16\x41llCommoditiesResponse\x12V\n\x0b\x63ommodities\x18\x01 \x03(\x0b\x32\x34.market_data.AllCommoditiesResponse.CommoditiesEntryR\x0b\x63ommodities\x12\x14\n\x05\x63ount\x18\x02 \x01(\x05R\x05\x63ount\x12\x16\n\x06\x63\x61\x63hed\x18\x03 \x01(\x08R\x06\x63\x61\x63hed\x12,\n\x0f\x63\x61\x63he_timestamp\x18\x04 \x01(\tH\x00R\x0e\x63\x61\x63heTimestamp\x88\x01\x01\x1a^\n\x10\x43ommoditiesEntry\x12\x10\n\x03key\x18\x01 \x01(\tR\x03key\x12\x34\n\x05value\x18\x02 \x01(\x0b\x32\x1e.market_data.CommodityResponseR\x05value:\x02\x38\x01\x42\x12\n\x10_cache_timestamp\"R\n\x16GetOptionsChainRequest\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x17\n\x04\x64\x61te\x18\x02 \x01(\tH\x00R\x04\x64\x61te\x88\x01\x01\x42\x07\n\x05_date\"\xf2\x05\n\x0eOptionContract\x12\x1f\n\x0b\x63ontract_id\x18\x01 \x01(\tR\ncontractId\x12\x16\n\x06symbol\x18\x02 \x01(\tR\x06symbol\x12\x1e\n\nexpiration\x18\x03 \x01(\tR\nexpiration\x12\x16\n\x06strike\x18\x04 \x01(\x01R\x06strike\x12\x12\n\x04type\x18\x05 \x01(\tR\x04type\x12\x17\n\x04last\x18\x06 \x01(\x01H\x00R\x04last\x88\x01\x01\x12\x17\n\x04mark\x18\x07 \x01(\x01H\x01R\x04mark\x88\x01\x01\x12\x15\n\x03\x62id\x18\x08 \x01(\x01H\x02R\x03\x62id\x88\x01\x01\x12\x1e\n\x08\x62id_size\x18\t \x01(\x01H\x03R\x07\x62idSize\x88\x01\x01\x12\x15\n\x03\x61sk\x18\n \x01(\x01H\x04R\x03\x61sk\x88\x01\x01\x12\x1e\n\x08\x61sk_size\x18\x0b \x01(\x01H\x05R\x07\x61skSize\x88\x01\x01\x12\x1b\n\x06volume\x18\x0c \x01(\x03H\x06R\x06volume\x88\x01\x01\x12(\n\ropen_interest\x18\r \x01(\x03H\x07R\x0copenInterest\x88\x01\x01\x12\x17\n\x04\x64\x61te\x18\x0e \x01(\tH\x08R\x04\x64\x61te\x88\x01\x01\x12\x32\n\x12implied_volatility\x18\x0f \x01(\x01H\tR\x11impliedVolatility\x88\x01\x01\x12\x19\n\x05\x64\x65lta\x18\x10 \x01(\x01H\nR\x05\x64\x65lta\x88\x01\x01\x12\x19\n\x05gamma\x18\x11 \x01(\x01H\x0bR\x05gamma\x88\x01\x01\x12\x19\n\x05theta\x18\x12 \x01(\x01H\x0cR\x05theta\x88\x01\x01\x12\x17\n\x04vega\x18\x13 \x01(\x01H\rR\x04vega\x88\x01\x01\x12\x15\n\x03rho\x18\x14 \x01(\x01H\x0eR\x03rho\x88\x01\x01\x42\x07\n\x05_lastB\x07\n\x05_markB\x06\n\x04_bidB\x0b\n\t_bid_sizeB\x06\n\x04_askB\x0b\n\t_ask_sizeB\t\n\x07_volumeB\x10\n\x0e_open_interestB\x07\n\x05_dateB\x15\n\x13_implied_volatilityB\x08\n\x06_deltaB\x08\n\x06_gammaB\x08\n\x06_thetaB\x07\n\x05_vegaB\x06\n\x04_rho\"\xd9\x01\n\x14OptionsChainResponse\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x39\n\tcontracts\x18\x02 \x03(\x0b\x32\x1b.market_data.OptionContractR\tcontracts\x12\x14\n\x05\x63ount\x18\x03 \x01(\x05R\x05\x63ount\x12\x16\n\x06\x63\x61\x63hed\x18\x04 \x01(\x08R\x06\x63\x61\x63hed\x12,\n\x0f\x63\x61\x63he_timestamp\x18\x05 \x01(\tH\x00R\x0e\x63\x61\x63heTimestamp\x88\x01\x01\x42\x12\n\x10_cache_timestamp\"W\n\x1bGetHistoricalOptionsRequest\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x17\n\x04\x64\x61te\x18\x02 \x01(\tH\x00R\x04\x64\x61te\x88\x01\x01\x42\x07\n\x05_date\"\xf2\x01\n\x19HistoricalOptionsResponse\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x12\n\x04\x64\x61te\x18\x02 \x01(\tR\x04\x64\x61te\x12\x39\n\tcontracts\x18\x03 \x03(\x0b\x32\x1b.market_data.OptionContractR\tcontracts\x12\x14\n\x05\x63ount\x18\x04 \x01(\x05R\x05\x63ount\x12\x16\n\x06\x63\x61\x63hed\x18\x05 \x01(\x08R\x06\x63\x61\x63hed\x12,\n\x0f\x63\x61\x63he_timestamp\x18\x06 \x01(\tH\x00R\x0e\x63\x61\x63heTimestamp\x88\x01\x01\x42\x12\n\x10_cache_timestamp\";\n\x18GetOptionContractRequest\x12\x1f\n\x0b\x63ontract_id\x18\x01 \x01(\tR\ncontractId\"\xab\x01\n\x16OptionContractResponse\x12\x37\n\x08\x63ontract\x18\x01 \x01(\x0b\x32\x1b.market_data.OptionContractR\x08\x63ontract\x12\x16\n\x06\x63\x61\x63hed\x18\x02 \x01(\x08R\x06\x63\x61\x63hed\x12,\n\x0f\x63\x61\x63he_timestamp\x18\x03 \x01(\tH\x00R\x0e\x63\x61\x63heTimestamp\x88\x01\x01\x42\x12\n\x10_cache_timestamp\"\x14\n\x12HealthCheckRequest\"\xbd\x02\n\x13HealthCheckResponse\x12\x16\n\x06status\x18\x01 \x01(\tR\x06status\x12\x18\n\x07service\x18\x02 \x01(\tR\x07service\x12\x18\n\x07version\x18\x03 \x01(\tR\x07version\x12%\n\x0euptime_seconds\x18\x04 \x01(\x03R\ruptimeSeconds\x12\x1d\n\ncache_size\x18\x05 \x01(\x03R\tcacheSize\x12T\n\x0c\x64\x61ta_sources\x18\x06 \x03(\x0b\x32\x31.market_data.HealthCheckResponse.DataSourcesEntryR\x0b\x64\x61taSources\x1a>\n\x10\x44\x61taSourcesEntry\x12\x10\n\x03key\x18\x01 \x01(\tR\x03key\x12\x14\n\x05value\x18\x02 \x01(\x05R\x05value:\x02\x38\x01\"\x17\n\x15GetServiceInfoRequest\"\xbf\x02\n\x0bServiceInfo\x12!\n\x0cservice_name\x18\x01 \x01(\tR\x0bserviceName\x12\x18\n\x07version\x18\x02 \x01(\tR\x07version\x12 \n\x0b\x65nvironment\x18\x03 \x01(\tR\x0b\x65nvironment\x12)\n\x10supported_assets\x18\x04 \x03(\tR\x0fsupportedAssets\x12%\n\x0e\x64\x61ta_providers\x18\x05 \x03(\tR\rdataProviders\x12\x42\n\x08\x66\x65\x61tures\x18\x06 \x03(\x0b\x32&.market_data.ServiceInfo.FeaturesEntryR\x08\x66\x65\x61tures\x1a;\n\rFeaturesEntry\x12\x10\n\x03key\x18\x01 \x01(\tR\x03key\x12\x14\n\x05value\x18\x02 \x01(\tR\x05value:\x02\x38\x01\"\x16\n\x14GetCacheStatsRequest\"\xc0\x02\n\nCacheStats\x12#\n\rtotal_entries\x18\x01 \x01(\x03R\x0ctotalEntries\x12(\n\x10total_size_bytes\x18\x02 \x01(\x03R\x0etotalSizeBytes\x12\x19\n\x08hit_rate\x18\x03 \x01(\x01R\x07hitRate\x12\x12\n\x04hits\x18\x04 \x01(\x03R\x04hits\x12\x16\n\x06misses\x18\x05 \x01(\x03R\x06misses\x12X\n\x11\x65ntries_by_domain\x18\x06 \x03(\x0b\x32,.market_data.CacheStats.EntriesByDomainEntryR\x0f\x65ntriesByDomain\x1a\x42\n\x14\x45ntriesByDomainEntry\x12\x10\n\x03key\x18\x01 \x01(\tR\x03key\x12\x14\n\x05value\x18\x02 \x01(\x03R\x05value:\x02\x38\x01\x32\x8c%\n\x11MarketDataService\x12P\n\x0bHealthCheck\x12\x1f.market_data.HealthCheckRequest\x1a .market_data.HealthCheckResponse\x12N\n\x0eGetServiceInfo\x12\".market_data.GetServiceInfoRequest\x1a\x18.market_data.ServiceInfo\x12K\n\rGetCacheStats\x12!.market_data.GetCacheStatsRequest\x1a\x17.market_data.CacheStats\x12N\n\rGetDailyOHLCV\x12!.market_data.GetDailyOHLCVRequest\x1a\x1a.market_data.OHLCVResponse\x12T\n\x10GetIntradayOHLCV\x12$.market_data.GetIntradayOHLCVRequest\x1a\x1a.market_data.OHLCVResponse\x12P\n\x0eGetWeeklyOHLCV\x12\".market_data.GetWeeklyOHLCVRequest\x1a\x1a.market_data.OHLCVResponse\x12R\n\x0fGetMonthlyOHLCV\x12#.market_data.GetMonthlyOHLCVRequest\x1a\x1a.market_data.OHLCVResponse\x12\x44\n\x08GetQuote\x12\x1c.market_data.GetQuoteRequest\x1a\x1a.market_data.QuoteResponse\x12V\n\rSearchSymbols\x12!.market_data.SearchSymbolsRequest\x1a\".market_data.SearchSymbolsResponse\x12\x65\n\x12\x42\x61tchGetDailyOHLCV\x12&.market_data.BatchGetDailyOHLCVRequest\x1a\'.market_data.BatchGetDailyOHLCVResponse\x12V\n\rBatchGetQuote\x12!.market_data.BatchGetQuoteRequest\x1a\".market_data.BatchGetQuoteResponse\x12N\n\rGetForexDaily\x12!.market_data.GetForexDailyRequest\x1a\x1a.market_data.ForexResponse\x12T\n\x10GetForexIntraday\x12$.market_data.GetForexIntradayRequest\x1a\x1a.market_data.ForexResponse\x12P\n\x0eGetForexWeekly\x12\".market_data.GetForexWeeklyRequest\x1a\x1a.market_data.ForexResponse\x12R\n\x0fGetForexMonthly\x12#.market_data.GetForexMonthlyRequest\x1a\x1a.market_data.ForexResponse\x12P\n\x0cGetForexRate\x12 .market_data.GetForexRateRequest\x1a\x1e.market_data.ForexRateResponse\x12Y\n\x0eListForexPairs\x12\".market_data.ListForexPairsRequest\x1a#.market_data.ListForexPairsResponse\x12Q\n\x0eGetCryptoDaily\x12\".market_data.GetCryptoDailyRequest\x1a\x1b.market_data.CryptoResponse\x12W\n\x11GetCryptoIntraday\x12%.market_data.GetCryptoIntradayRequest\x1a\x1b.market_data.CryptoResponse\x12S\n\x0fGetCryptoWeekly\x12#.market_data.GetCryptoWeeklyRequest\x1a\x1b.market_data.CryptoResponse\x12U\n\x10GetCryptoMonthly\x12$.market_data.GetCryptoMonthlyRequest\x1a\x1b.market_data.CryptoResponse\x12\x62\n\x11ListCryptoSymbols\x12%.market_data.ListCryptoSymbolsRequest\x1a&.market_data.ListCryptoSymbolsResponse\x12_\n\x10\x42\x61tchCryptoQuote\x12$.market_data.BatchCryptoQuoteRequest\x1a%.market_data.BatchCryptoQuoteResponse\x12\x62\n\x12GetCompanyOverview\x12&.market_data.GetCompanyOverviewRequest\x1a$.market_data.CompanyOverviewResponse\x12\x62\n\x12GetIncomeStatement\x12&.market_data.GetIncomeStatementRequest\x1a$.market_data.IncomeStatementResponse\x12Y\n\x0fGetBalanceSheet\x12#.market_data.GetBalanceSheetRequest\x1a!.market_data.BalanceSheetResponse\x12M\n\x0bGetCashFlow\x12\x1f.market_data.GetCashFlowRequest\x1a\x1d.market_data.CashFlowResponse\x12M\n\x0bGetEarnings\x12\x1f.market_data.GetEarningsRequest\x1a\x1d.market_data.EarningsResponse\x12\x65\n\x13GetEarningsCalendar\x12\'.market_data.GetEarningsCalendarRequest\x1a%.market_data.EarningsCalendarResponse\x12V\n\x0eGetIPOCalendar\x12\".market_data.GetIPOCalendarRequest\x1a .market_data.IPOCalendarResponse\x12S\n\rGetETFProfile\x12!.market_data.GetETFProfileRequest\x1a\x1f.market_data.ETFProfileResponse\x12P\n\x0cGetDividends\x12 .market_data.GetDividendsRequest\x1a\x1e.market_data.DividendsResponse\x12G\n\tGetSplits\x12\x1d.market_data.GetSplitsRequest\x1a\x1b.market_data.SplitsResponse\x12\x41\n\x07GetNews\x12\x1b.market_data.GetNewsRequest\x1a\x19.market_data.NewsResponse\x12\x65\n\x13GetTopGainersLosers\x12\'.market_data.GetTopGainersLosersRequest\x1a%.market_data.TopGainersLosersResponse\x12_\n\x11GetAnalystRatings\x12%.market_data.GetAnalystRatingsRequest\x1a#.market_data.AnalystRatingsResponse\x12n\n\x16GetInsiderTransactions\x12*.market_data.GetInsiderTransactionsRequest\x1a(.market_data.InsiderTransactionsResponse\x12k\n\x15GetEarningsTranscript\x12).market_data.GetEarningsTranscriptRequest\x1a\'.market_data.EarningsTranscriptResponse\x12L\n\x06GetGDP\x12\x1a.market_data.GetGDPRequest\x1a&.market_data.EconomicIndicatorResponse\x12^\n\x0fGetGDPPerCapita\x12#.market_data.GetGDPPerCapitaRequest\x1a&.market_data.EconomicIndicatorResponse\x12X\n\x0cGetInflation\x12 .market_data.GetInflationRequest\x1a&.market_data.EconomicIndicatorResponse\x12L\n\x06GetCPI\x12\x1a.market_data.GetCPIRequest\x1a&.market_data.EconomicIndicatorResponse\x12\x66\n\x13GetFederalFundsRate\x12\'.market_data.GetFederalFundsRateRequest\x1a&.market_data.EconomicIndicatorResponse\x12`\n\x10GetTreasuryYield\x12$.market_data.GetTreasuryYieldRequest\x1a&.market_data.EconomicIndicatorResponse\x12\\\n\x0eGetRetailSales\x12\".market_data.GetRetailSalesRequest\x1a&.market_data.EconomicIndicatorResponse\x12V\n\x0bGetDurables\x12\x1f.market_data.GetDurablesRequest\x1a&.market_data.EconomicIndicatorResponse\x12^\n\x0fGetUnemployment\x12#.market_data.GetUnemploymentRequest\x1a&.market_data.EconomicIndicatorResponse\x12\x62\n\x11GetNonfarmPayroll\x12%.market_data.GetNonfarmPayrollRequest\x1a&.market_data.EconomicIndicatorResponse\x12P\n\x0cGetCommodity\x12 .market_data.GetCommodityRequest\x1a\x1e.market_data.CommodityResponse\x12_\n\x11GetAllCommodities\x12%.market_data.GetAllCommoditiesRequest\x1a#.market_data.AllCommoditiesResponse\x12Y\n\x0fGetOptionsChain\x12#.market_data.GetOptionsChainRequest\x1a!.market_data.OptionsChainResponse\x12h\n\x14GetHistoricalOptions\x12(.market_data.GetHistoricalOptionsRequest\x1a&.market_data.HistoricalOptionsResponse\x12_\n\x11GetOptionContract\x12%.market_data.GetOptionContractRequest\x1a#.market_data.OptionContractResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n8protos/services/market_data/v1/market_data_service.proto\x12\x0bmarket_data\"\xd9\x02\n\x08OHLCVBar\x12\x1c\n\ttimestamp\x18\x01 \x01(\tR\ttimestamp\x12\x12\n\x04open\x18\x02 \x01(\x01R\x04open\x12\x12\n\x04high\x18\x03 \x01(\x01R\x04high\x12\x10\n\x03low\x18\x04 \x01(\x01R\x03low\x12\x14\n\x05\x63lose\x18\x05 \x01(\x01R\x05\x63lose\x12\x16\n\x06volume\x18\x06 \x01(\x03R\x06volume\x12*\n\x0e\x61\x64justed_close\x18\x07 \x01(\x01H\x00R\radjustedClose\x88\x01\x01\x12,\n\x0f\x64ividend_amount\x18\x08 \x01(\x01H\x01R\x0e\x64ividendAmount\x88\x01\x01\x12\x30\n\x11split_coefficient\x18\t \x01(\x01H\x02R\x10splitCoefficient\x88\x01\x01\x42\x11\n\x0f_adjusted_closeB\x12\n\x10_dividend_amountB\x14\n\x12_split_coefficient\"t\n\nPagination\x12\x12\n\x04page\x18\x01 \x01(\x05R\x04page\x12\x1b\n\tpage_size\x18\x02 \x01(\x05R\x08pageSize\x12\x14\n\x05total\x18\x03 \x01(\x05R\x05total\x12\x1f\n\x0btotal_pages\x18\x04 \x01(\x05R\ntotalPages\"\xf0\x01\n\x14GetDailyOHLCVRequest\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\"\n\nstart_date\x18\x02 \x01(\tH\x00R\tstartDate\x88\x01\x01\x12\x1e\n\x08\x65nd_date\x18\x03 \x01(\tH\x01R\x07\x65ndDate\x88\x01\x01\x12#\n\noutputsize\x18\x04 \x01(\tH\x02R\noutputsize\x88\x01\x01\x12\x1f\n\x08\x61\x64justed\x18\x05 \x01(\x08H\x03R\x08\x61\x64justed\x88\x01\x01\x42\r\n\x0b_start_dateB\x0b\n\t_end_dateB\r\n\x0b_outputsizeB\x0b\n\t_adjusted\"\xc6\x02\n\x17GetIntradayOHLCVRequest\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x1f\n\x08interval\x18\x02 \x01(\tH\x00R\x08interval\x88\x01\x01\x12\"\n\nstart_date\x18\x03 \x01(\tH\x01R\tstartDate\x88\x01\x01\x12\x1e\n\x08\x65nd_date\x18\x04 \x01(\tH\x02R\x07\x65ndDate\x88\x01\x01\x12#\n\noutputsize\x18\x05 \x01(\tH\x03R\noutputsize\x88\x01\x01\x12\x1f\n\x08\x61\x64justed\x18\x06 \x01(\x08H\x04R\x08\x61\x64justed\x88\x01\x01\x12\x19\n\x05month\x18\x07 \x01(\tH\x05R\x05month\x88\x01\x01\x42\x0b\n\t_intervalB\r\n\x0b_start_dateB\x0b\n\t_end_dateB\r\n\x0b_outputsizeB\x0b\n\t_adjustedB\x08\n\x06_month\"\xbd\x01\n\x15GetWeeklyOHLCVRequest\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\"\n\nstart_date\x18\x02 \x01(\tH\x00R\tstartDate\x88\x01\x01\x12\x1e\n\x08\x65nd_date\x18\x03 \x01(\tH\x01R\x07\x65ndDate\x88\x01\x01\x12\x1f\n\x08\x61\x64justed\x18\x04 \x01(\x08H\x02R\x08\x61\x64justed\x88\x01\x01\x42\r\n\x0b_start_dateB\x0b\n\t_end_dateB\x0b\n\t_adjusted\"\xbe\x01\n\x16GetMonthlyOHLCVRequest\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\"\n\nstart_date\x18\x02 \x01(\tH\x00R\tstartDate\x88\x01\x01\x12\x1e\n\x08\x65nd_date\x18\x03 \x01(\tH\x01R\x07\x65ndDate\x88\x01\x01\x12\x1f\n\x08\x61\x64justed\x18\x04 \x01(\x08H\x02R\x08\x61\x64justed\x88\x01\x01\x42\r\n\x0b_start_dateB\x0b\n\t_end_dateB\x0b\n\t_adjusted\"\xf6\x01\n\rOHLCVResponse\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x1a\n\x08interval\x18\x02 \x01(\tR\x08interval\x12)\n\x04\x62\x61rs\x18\x03 \x03(\x0b\x32\x15.market_data.OHLCVBarR\x04\x62\x61rs\x12\x14\n\x05\x63ount\x18\x04 \x01(\x05R\x05\x63ount\x12\x16\n\x06\x63\x61\x63hed\x18\x05 \x01(\x08R\x06\x63\x61\x63hed\x12\x16\n\x06source\x18\x06 \x01(\tR\x06source\x12,\n\x0f\x63\x61\x63he_timestamp\x18\x07 \x01(\tH\x00R\x0e\x63\x61\x63heTimestamp\x88\x01\x01\x42\x12\n\x10_cache_timestamp\")\n\x0fGetQuoteRequest\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\"\x9f\x02\n\tQuoteData\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x12\n\x04open\x18\x02 \x01(\x01R\x04open\x12\x12\n\x04high\x18\x03 \x01(\x01R\x04high\x12\x10\n\x03low\x18\x04 \x01(\x01R\x03low\x12\x14\n\x05price\x18\x05 \x01(\x01R\x05price\x12\x16\n\x06volume\x18\x06 \x01(\x03R\x06volume\x12,\n\x12latest_trading_day\x18\x07 \x01(\tR\x10latestTradingDay\x12%\n\x0eprevious_close\x18\x08 \x01(\x01R\rpreviousClose\x12\x16\n\x06\x63hange\x18\t \x01(\x01R\x06\x63hange\x12%\n\x0e\x63hange_percent\x18\n \x01(\x01R\rchangePercent\"\x97\x01\n\rQuoteResponse\x12,\n\x05quote\x18\x01 \x01(\x0b\x32\x16.market_data.QuoteDataR\x05quote\x12\x16\n\x06\x63\x61\x63hed\x18\x02 \x01(\x08R\x06\x63\x61\x63hed\x12,\n\x0f\x63\x61\x63he_timestamp\x18\x03 \x01(\tH\x00R\x0e\x63\x61\x63heTimestamp\x88\x01\x01\x42\x12\n\x10_cache_timestamp\"2\n\x14SearchSymbolsRequest\x12\x1a\n\x08keywords\x18\x01 \x01(\tR\x08keywords\"\x89\x02\n\x12SymbolSearchResult\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x12\n\x04name\x18\x02 \x01(\tR\x04name\x12\x12\n\x04type\x18\x03 \x01(\tR\x04type\x12\x16\n\x06region\x18\x04 \x01(\tR\x06region\x12\x1f\n\x0bmarket_open\x18\x05 \x01(\tR\nmarketOpen\x12!\n\x0cmarket_close\x18\x06 \x01(\tR\x0bmarketClose\x12\x1a\n\x08timezone\x18\x07 \x01(\tR\x08timezone\x12\x1a\n\x08\x63urrency\x18\x08 \x01(\tR\x08\x63urrency\x12\x1f\n\x0bmatch_score\x18\t \x01(\x01R\nmatchScore\"h\n\x15SearchSymbolsResponse\x12\x39\n\x07results\x18\x01 \x03(\x0b\x32\x1f.market_data.SymbolSearchResultR\x07results\x12\x14\n\x05\x63ount\x18\x02 \x01(\x05R\x05\x63ount\"\xc3\x01\n\x19\x42\x61tchGetDailyOHLCVRequest\x12\x18\n\x07symbols\x18\x01 \x03(\tR\x07symbols\x12\"\n\nstart_date\x18\x02 \x01(\tH\x00R\tstartDate\x88\x01\x01\x12\x1e\n\x08\x65nd_date\x18\x03 \x01(\tH\x01R\x07\x65ndDate\x88\x01\x01\x12\x1f\n\x08\x61\x64justed\x18\x04 \x01(\x08H\x02R\x08\x61\x64justed\x88\x01\x01\x42\r\n\x0b_start_dateB\x0b\n\t_end_dateB\x0b\n\t_adjusted\"\xa7\x01\n\x0fSymbolOHLCVData\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12)\n\x04\x62\x61rs\x18\x02 \x03(\x0b\x32\x15.market_data.OHLCVBarR\x04\x62\x61rs\x12\x14\n\x05\x63ount\x18\x03 \x01(\x05R\x05\x63ount\x12\x16\n\x06\x63\x61\x63hed\x18\x04 \x01(\x08R\x06\x63\x61\x63hed\x12\x19\n\x05\x65rror\x18\x05 \x01(\tH\x00R\x05\x65rror\x88\x01\x01\x42\x08\n\x06_error\"\xb9\x01\n\x1a\x42\x61tchGetDailyOHLCVResponse\x12\x30\n\x04\x64\x61ta\x18\x01 \x03(\x0b\x32\x1c.market_data.SymbolOHLCVDataR\x04\x64\x61ta\x12#\n\rtotal_symbols\x18\x02 \x01(\x05R\x0ctotalSymbols\x12#\n\rsuccess_count\x18\x03 \x01(\x05R\x0csuccessCount\x12\x1f\n\x0b\x65rror_count\x18\x04 \x01(\x05R\nerrorCount\"0\n\x14\x42\x61tchGetQuoteRequest\x12\x18\n\x07symbols\x18\x01 \x03(\tR\x07symbols\"\xa3\x01\n\x0fSymbolQuoteData\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x31\n\x05quote\x18\x02 \x01(\x0b\x32\x16.market_data.QuoteDataH\x00R\x05quote\x88\x01\x01\x12\x16\n\x06\x63\x61\x63hed\x18\x03 \x01(\x08R\x06\x63\x61\x63hed\x12\x19\n\x05\x65rror\x18\x04 \x01(\tH\x01R\x05\x65rror\x88\x01\x01\x42\x08\n\x06_quoteB\x08\n\x06_error\"\xb4\x01\n\x15\x42\x61tchGetQuoteResponse\x12\x30\n\x04\x64\x61ta\x18\x01 \x03(\x0b\x32\x1c.market_data.SymbolQuoteDataR\x04\x64\x61ta\x12#\n\rtotal_symbols\x18\x02 \x01(\x05R\x0ctotalSymbols\x12#\n\rsuccess_count\x18\x03 \x01(\x05R\x0csuccessCount\x12\x1f\n\x0b\x65rror_count\x18\x04 \x01(\x05R\nerrorCount\"\xe6\x02\n\x18GetResampledOHLCVRequest\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x1a\n\x08interval\x18\x02 \x01(\tR\x08interval\x12\'\n\x0fsource_interval\x18\x03 \x01(\tR\x0esourceInterval\x12\"\n\nstart_date\x18\x04 \x01(\tH\x00R\tstartDate\x88\x01\x01\x12\x1e\n\x08\x65nd_date\x18\x05 \x01(\tH\x01R\x07\x65ndDate\x88\x01\x01\x12\x1f\n\x08\x61\x64justed\x18\x06 \x01(\x08H\x02R\x08\x61\x64justed\x88\x01\x01\x12\x1b\n\x06\x61nchor\x18\x07 \x01(\tH\x03R\x06\x61nchor\x88\x01\x01\x12&\n\x0c\x64rop_partial\x18\x08 \x01(\x08H\x04R\x0b\x64ropPartial\x88\x01\x01\x42\r\n\x0b_start_dateB\x0b\n\t_end_dateB\x0b\n\t_adjustedB\t\n\x07_anchorB\x0f\n\r_drop_partial\"\xe8\x01\n\x14GetForexDailyRequest\x12\x1f\n\x0b\x66rom_symbol\x18\x01 \x01(\tR\nfromSymbol\x12\x1b\n\tto_symbol\x18\x02 \x01(\tR\x08toSymbol\x12\"\n\nstart_date\x18\x03 \x01(\tH\x00R\tstartDate\x88\x01\x01\x12\x1e\n\x08\x65nd_date\x18\x04 \x01(\tH\x01R\x07\x65ndDate\x88\x01\x01\x12#\n\noutputsize\x18\x05 \x01(\tH\x02R\noutputsize\x88\x01\x01\x42\r\n\x0b_start_dateB\x0b\n\t_end_dateB\r\n\x0b_outputsize\"\x99\x02\n\x17GetForexIntradayRequest\x12\x1f\n\x0b\x66rom_symbol\x18\x01 \x01(\tR\nfromSymbol\x12\x1b\n\tto_symbol\x18\x02 \x01(\tR\x08toSymbol\x12\x1f\n\x08interval\x18\x03 \x01(\tH\x00R\x08interval\x88\x01\x01\x12\"\n\nstart_date\x18\x04 \x01(\tH\x01R\tstartDate\x88\x01\x01\x12\x1e\n\x08\x65nd_date\x18\x05 \x01(\tH\x02R\x07\x65ndDate\x88\x01\x01\x12#\n\noutputsize\x18\x06 \x01(\tH\x03R\noutputsize\x88\x01\x01\x42\x0b\n\t_intervalB\r\n\x0b_start_dateB\x0b\n\t_end_dateB\r\n\x0b_outputsize\"\xb5\x01\n\x15GetForexWeeklyRequest\x12\x1f\n\x0b\x66rom_symbol\x18\x01 \x01(\tR\nfromSymbol\x12\x1b\n\tto_symbol\x18\x02 \x01(\tR\x08toSymbol\x12\"\n\nstart_date\x18\x03 \x01(\tH\x00R\tstartDate\x88\x01\x01\x12\x1e\n\x08\x65nd_date\x18\x04 \x01(\tH\x01R\x07\x65ndDate\x88\x01\x01\x42\r\n\x0b_start_dateB\x0b\n\t_end_date\"\xb6\x01\n\x16GetForexMonthlyRequest\x12\x1f\n\x0b\x66rom_symbol\x18\x01 \x01(\tR\nfromSymbol\x12\x1b\n\tto_symbol\x18\x02 \x01(\tR\x08toSymbol\x12\"\n\nstart_date\x18\x03 \x01(\tH\x00R\tstartDate\x88\x01\x01\x12\x1e\n\x08\x65nd_date\x18\x04 \x01(\tH\x01R\x07\x65ndDate\x88\x01\x01\x42\r\n\x0b_start_dateB\x0b\n\t_end_date\"\x84\x02\n\rForexResponse\x12\x1f\n\x0b\x66rom_symbol\x18\x01 \x01(\tR\nfromSymbol\x12\x1b\n\tto_symbol\x18\x02 \x01(\tR\x08toSymbol\x12\x1a\n\x08interval\x18\x03 \x01(\tR\x08interval\x12)\n\x04\x62\x61rs\x18\x04 \x03(\x0b\x32\x15.market_data.OHLCVBarR\x04\x62\x61rs\x12\x14\n\x05\x63ount\x18\x05 \x01(\x05R\x05\x63ount\x12\x16\n\x06\x63\x61\x63hed\x18\x06 \x01(\x08R\x06\x63\x61\x63hed\x12,\n\x0f\x63\x61\x63he_timestamp\x18\x07 \x01(\tH\x00R\x0e\x63\x61\x63heTimestamp\x88\x01\x01\x42\x12\n\x10_cache_timestamp\"[\n\x13GetForexRateRequest\x12#\n\rfrom_currency\x18\x01 \x01(\tR\x0c\x66romCurrency\x12\x1f\n\x0bto_currency\x18\x02 \x01(\tR\ntoCurrency\"\xe2\x02\n\rForexRateData\x12,\n\x12\x66rom_currency_code\x18\x01 \x01(\tR\x10\x66romCurrencyCode\x12,\n\x12\x66rom_currency_name\x18\x02 \x01(\tR\x10\x66romCurrencyName\x12(\n\x10to_currency_code\x18\x03 \x01(\tR\x0etoCurrencyCode\x12(\n\x10to_currency_name\x18\x04 \x01(\tR\x0etoCurrencyName\x12#\n\rexchange_rate\x18\x05 \x01(\x01R\x0c\x65xchangeRate\x12%\n\x0elast_refreshed\x18\x06 \x01(\tR\rlastRefreshed\x12\x1b\n\ttime_zone\x18\x07 \x01(\tR\x08timeZone\x12\x1b\n\tbid_price\x18\x08 \x01(\x01R\x08\x62idPrice\x12\x1b\n\task_price\x18\t \x01(\x01R\x08\x61skPrice\"\x9d\x01\n\x11\x46orexRateResponse\x12.\n\x04rate\x18\x01 \x01(\x0b\x32\x1a.market_data.ForexRateDataR\x04rate\x12\x16\n\x06\x63\x61\x63hed\x18\x02 \x01(\x08R\x06\x63\x61\x63hed\x12,\n\x0f\x63\x61\x63he_timestamp\x18\x03 \x01(\tH\x00R\x0e\x63\x61\x63heTimestamp\x88\x01\x01\x42\x12\n\x10_cache_timestamp\"\x17\n\x15ListForexPairsRequest\"]\n\tForexPair\x12\x1f\n\x0b\x66rom_symbol\x18\x01 \x01(\tR\nfromSymbol\x12\x1b\n\tto_symbol\x18\x02 \x01(\tR\x08toSymbol\x12\x12\n\x04name\x18\x03 \x01(\tR\x04name\"\\\n\x16ListForexPairsResponse\x12,\n\x05pairs\x18\x01 \x03(\x0b\x32\x16.market_data.ForexPairR\x05pairs\x12\x14\n\x05\x63ount\x18\x02 \x01(\x05R\x05\x63ount\"\xa7\x01\n\x15GetCryptoDailyRequest\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x16\n\x06market\x18\x02 \x01(\tR\x06market\x12\"\n\nstart_date\x18\x03 \x01(\tH\x00R\tstartDate\x88\x01\x01\x12\x1e\n\x08\x65nd_date\x18\x04 \x01(\tH\x01R\x07\x65ndDate\x88\x01\x01\x42\r\n\x0b_start_dateB\x0b\n\t_end_date\"\x8c\x02\n\x18GetCryptoIntradayRequest\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x16\n\x06market\x18\x02 \x01(\tR\x06market\x12\x1f\n\x08interval\x18\x03 \x01(\tH\x00R\x08interval\x88\x01\x01\x12\"\n\nstart_date\x18\x04 \x01(\tH\x01R\tstartDate\x88\x01\x01\x12\x1e\n\x08\x65nd_date\x18\x05 \x01(\tH\x02R\x07\x65ndDate\x88\x01\x01\x12#\n\noutputsize\x18\x06 \x01(\tH\x03R\noutputsize\x88\x01\x01\x42\x0b\n\t_intervalB\r\n\x0b_start_dateB\x0b\n\t_end_dateB\r\n\x0b_outputsize\"\xa8\x01\n\x16GetCryptoWeeklyRequest\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x16\n\x06market\x18\x02 \x01(\tR\x06market\x12\"\n\nstart_date\x18\x03 \x01(\tH\x00R\tstartDate\x88\x01\x01\x12\x1e\n\x08\x65nd_date\x18\x04 \x01(\tH\x01R\x07\x65ndDate\x88\x01\x01\x42\r\n\x0b_start_dateB\x0b\n\t_end_date\"\xa9\x01\n\x17GetCryptoMonthlyRequest\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x16\n\x06market\x18\x02 \x01(\tR\x06market\x12\"\n\nstart_date\x18\x03 \x01(\tH\x00R\tstartDate\x88\x01\x01\x12\x1e\n\x08\x65nd_date\x18\x04 \x01(\tH\x01R\x07\x65ndDate\x88\x01\x01\x42\r\n\x0b_start_dateB\x0b\n\t_end_date\"\xf7\x01\n\x0e\x43ryptoResponse\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x16\n\x06market\x18\x02 \x01(\tR\x06market\x12\x1a\n\x08interval\x18\x03 \x01(\tR\x08interval\x12)\n\x04\x62\x61rs\x18\x04 \x03(\x0b\x32\x15.market_data.OHLCVBarR\x04\x62\x61rs\x12\x14\n\x05\x63ount\x18\x05 \x01(\x05R\x05\x63ount\x12\x16\n\x06\x63\x61\x63hed\x18\x06 \x01(\x08R\x06\x63\x61\x63hed\x12,\n\x0f\x63\x61\x63he_timestamp\x18\x07 \x01(\tH\x00R\x0e\x63\x61\x63heTimestamp\x88\x01\x01\x42\x12\n\x10_cache_timestamp\"\x1a\n\x18ListCryptoSymbolsRequest\":\n\x0c\x43ryptoSymbol\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x12\n\x04name\x18\x02 \x01(\tR\x04name\"f\n\x19ListCryptoSymbolsResponse\x12\x33\n\x07symbols\x18\x01 \x03(\x0b\x32\x19.market_data.CryptoSymbolR\x07symbols\x12\x14\n\x05\x63ount\x18\x02 \x01(\x05R\x05\x63ount\"K\n\x17\x42\x61tchCryptoQuoteRequest\x12\x18\n\x07symbols\x18\x01 \x03(\tR\x07symbols\x12\x16\n\x06market\x18\x02 \x01(\tR\x06market\"\xb9\x01\n\x0f\x43ryptoQuoteData\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x16\n\x06market\x18\x02 \x01(\tR\x06market\x12\x14\n\x05price\x18\x03 \x01(\x01R\x05price\x12\x16\n\x06volume\x18\x04 \x01(\x03R\x06volume\x12%\n\x0e\x63hange_percent\x18\x05 \x01(\x01R\rchangePercent\x12!\n\x0clast_updated\x18\x06 \x01(\tR\x0blastUpdated\"f\n\x18\x42\x61tchCryptoQuoteResponse\x12\x34\n\x06quotes\x18\x01 \x03(\x0b\x32\x1c.market_data.CryptoQuoteDataR\x06quotes\x12\x14\n\x05\x63ount\x18\x02 \x01(\x05R\x05\x63ount\"3\n\x19GetCompanyOverviewRequest\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\"\xc8\r\n\x0f\x43ompanyOverview\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x1d\n\nasset_type\x18\x02 \x01(\tR\tassetType\x12\x12\n\x04name\x18\x03 \x01(\tR\x04name\x12 \n\x0b\x64\x65scription\x18\x04 \x01(\tR\x0b\x64\x65scription\x12\x10\n\x03\x63ik\x18\x05 \x01(\tR\x03\x63ik\x12\x1a\n\x08\x65xchange\x18\x06 \x01(\tR\x08\x65xchange\x12\x1a\n\x08\x63urrency\x18\x07 \x01(\tR\x08\x63urrency\x12\x18\n\x07\x63ountry\x18\x08 \x01(\tR\x07\x63ountry\x12\x16\n\x06sector\x18\t \x01(\tR\x06sector\x12\x1a\n\x08industry\x18\n \x01(\tR\x08industry\x12\x18\n\x07\x61\x64\x64ress\x18\x0b \x01(\tR\x07\x61\x64\x64ress\x12&\n\x0f\x66iscal_year_end\x18\x0c \x01(\tR\rfiscalYearEnd\x12%\n\x0elatest_quarter\x18\r \x01(\tR\rlatestQuarter\x12\x33\n\x15market_capitalization\x18\x0e \x01(\x03R\x14marketCapitalization\x12\x16\n\x06\x65\x62itda\x18\x0f \x01(\tR\x06\x65\x62itda\x12\x19\n\x08pe_ratio\x18\x10 \x01(\x01R\x07peRatio\x12\x1b\n\tpeg_ratio\x18\x11 \x01(\x01R\x08pegRatio\x12\x1d\n\nbook_value\x18\x12 \x01(\x01R\tbookValue\x12,\n\x12\x64ividend_per_share\x18\x13 \x01(\x01R\x10\x64ividendPerShare\x12%\n\x0e\x64ividend_yield\x18\x14 \x01(\x01R\rdividendYield\x12\x10\n\x03\x65ps\x18\x15 \x01(\x01R\x03\x65ps\x12\x31\n\x15revenue_per_share_ttm\x18\x16 \x01(\x01R\x12revenuePerShareTtm\x12#\n\rprofit_margin\x18\x17 \x01(\x01R\x0cprofitMargin\x12\x30\n\x14operating_margin_ttm\x18\x18 \x01(\x01R\x12operatingMarginTtm\x12/\n\x14return_on_assets_ttm\x18\x19 \x01(\x01R\x11returnOnAssetsTtm\x12/\n\x14return_on_equity_ttm\x18\x1a \x01(\x01R\x11returnOnEquityTtm\x12\x1f\n\x0brevenue_ttm\x18\x1b \x01(\x01R\nrevenueTtm\x12(\n\x10gross_profit_ttm\x18\x1c \x01(\x01R\x0egrossProfitTtm\x12&\n\x0f\x64iluted_eps_ttm\x18\x1d \x01(\x01R\rdilutedEpsTtm\x12\x41\n\x1dquarterly_earnings_growth_yoy\x18\x1e \x01(\x01R\x1aquarterlyEarningsGrowthYoy\x12?\n\x1cquarterly_revenue_growth_yoy\x18\x1f \x01(\x01R\x19quarterlyRevenueGrowthYoy\x12\x30\n\x14\x61nalyst_target_price\x18  \x01(\x01R\x12\x61nalystTargetPrice\x12\x1f\n\x0btrailing_pe\x18! \x01(\x01R\ntrailingPe\x12\x1d\n\nforward_pe\x18\" \x01(\x01R\tforwardPe\x12\x36\n\x18price_to_sales_ratio_ttm\x18# \x01(\x01R\x14priceToSalesRatioTtm\x12-\n\x13price_to_book_ratio\x18$ \x01(\x01R\x10priceToBookRatio\x12\"\n\rev_to_revenue\x18% \x01(\x01R\x0b\x65vToRevenue\x12 \n\x0c\x65v_to_ebitda\x18& \x01(\x01R\nevToEbitda\x12\x12\n\x04\x62\x65ta\x18\' \x01(\x01R\x04\x62\x65ta\x12 \n\x0cweek_52_high\x18( \x01(\tR\nweek52High\x12\x1e\n\x0bweek_52_low\x18) \x01(\tR\tweek52Low\x12\x31\n\x15\x64\x61y_50_moving_average\x18* \x01(\tR\x12\x64\x61y50MovingAverage\x12\x33\n\x16\x64\x61y_200_moving_average\x18+ \x01(\tR\x13\x64\x61y200MovingAverage\x12-\n\x12shares_outstanding\x18, \x01(\x03R\x11sharesOutstanding\x12#\n\rdividend_date\x18- \x01(\tR\x0c\x64ividendDate\x12(\n\x10\x65x_dividend_date\x18. \x01(\tR\x0e\x65xDividendDate\"\xad\x01\n\x17\x43ompanyOverviewResponse\x12\x38\n\x08overview\x18\x01 \x01(\x0b\x32\x1c.market_data.CompanyOverviewR\x08overview\x12\x16\n\x06\x63\x61\x63hed\x18\x02 \x01(\x08R\x06\x63\x61\x63hed\x12,\n\x0f\x63\x61\x63he_timestamp\x18\x03 \x01(\tH\x00R\x0e\x63\x61\x63heTimestamp\x88\x01\x01\x42\x12\n\x10_cache_timestamp\"3\n\x19GetIncomeStatementRequest\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\"\x87\n\n\x0fIncomeStatement\x12,\n\x12\x66iscal_date_ending\x18\x01 \x01(\tR\x10\x66iscalDateEnding\x12+\n\x11reported_currency\x18\x02 \x01(\tR\x10reportedCurrency\x12!\n\x0cgross_profit\x18\x03 \x01(\x03R\x0bgrossProfit\x12#\n\rtotal_revenue\x18\x04 \x01(\x03R\x0ctotalRevenue\x12&\n\x0f\x63ost_of_revenue\x18\x05 \x01(\x03R\rcostOfRevenue\x12\x43\n\x1f\x63ost_of_goods_and_services_sold\x18\x06 \x01(\x03R\x1a\x63ostOfGoodsAndServicesSold\x12)\n\x10operating_income\x18\x07 \x01(\x03R\x0foperatingIncome\x12K\n\"selling_general_and_administrative\x18\x08 \x01(\x03R\x1fsellingGeneralAndAdministrative\x12\x38\n\x18research_and_development\x18\t \x01(\x03R\x16researchAndDevelopment\x12-\n\x12operating_expenses\x18\n \x01(\x03R\x11operatingExpenses\x12\x32\n\x15investment_income_net\x18\x0b \x01(\x03R\x13investmentIncomeNet\x12.\n\x13net_interest_income\x18\x0c \x01(\x03R\x11netInterestIncome\x12\'\n\x0finterest_income\x18\r \x01(\x03R\x0einterestIncome\x12)\n\x10interest_expense\x18\x0e \x01(\x03R\x0finterestExpense\x12.\n\x13non_interest_income\x18\x0f \x01(\x03R\x11nonInterestIncome\x12;\n\x1aother_non_operating_income\x18\x10 \x01(\x03R\x17otherNonOperatingIncome\x12\"\n\x0c\x64\x65preciation\x18\x11 \x01(\x03R\x0c\x64\x65preciation\x12\x42\n\x1d\x64\x65preciation_and_amortization\x18\x12 \x01(\x03R\x1b\x64\x65preciationAndAmortization\x12*\n\x11income_before_tax\x18\x13 \x01(\x03R\x0fincomeBeforeTax\x12,\n\x12income_tax_expense\x18\x14 \x01(\x03R\x10incomeTaxExpense\x12\x39\n\x19interest_and_debt_expense\x18\x15 \x01(\x03R\x16interestAndDebtExpense\x12P\n%net_income_from_continuing_operations\x18\x16 \x01(\x03R!netIncomeFromContinuingOperations\x12\x44\n\x1f\x63omprehensive_income_net_of_tax\x18\x17 \x01(\x03R\x1b\x63omprehensiveIncomeNetOfTax\x12\x12\n\x04\x65\x62it\x18\x18 \x01(\x03R\x04\x65\x62it\x12\x16\n\x06\x65\x62itda\x18\x19 \x01(\x03R\x06\x65\x62itda\x12\x1d\n\nnet_income\x18\x1a \x01(\x03R\tnetIncome\"\x9b\x02\n\x17IncomeStatementResponse\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x43\n\x0e\x61nnual_reports\x18\x02 \x03(\x0b\x32\x1c.market_data.IncomeStatementR\rannualReports\x12I\n\x11quarterly_reports\x18\x03 \x03(\x0b\x32\x1c.market_data.IncomeStatementR\x10quarterlyReports\x12\x16\n\x06\x63\x61\x63hed\x18\x04 \x01(\x08R\x06\x63\x61\x63hed\x12,\n\x0f\x63\x61\x63he_timestamp\x18\x05 \x01(\tH\x00R\x0e\x63\x61\x63heTimestamp\x88\x01\x01\x42\x12\n\x10_cache_timestamp\"0\n\x16GetBalanceSheetRequest\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\"\xf6\x0f\n\x0c\x42\x61lanceSheet\x12,\n\x12\x66iscal_date_ending\x18\x01 \x01(\tR\x10\x66iscalDateEnding\x12+\n\x11reported_currency\x18\x02 \x01(\tR\x10reportedCurrency\x12!\n\x0ctotal_assets\x18\x03 \x01(\x03R\x0btotalAssets\x12\x30\n\x14total_current_assets\x18\x04 \x01(\x03R\x12totalCurrentAssets\x12Z\n+cash_and_cash_equivalents_at_carrying_value\x18\x05 \x01(\x03R%cashAndCashEquivalentsAtCarryingValue\x12\x44\n\x1f\x63\x61sh_and_short_term_investments\x18\x06 \x01(\x03R\x1b\x63\x61shAndShortTermInvestments\x12\x1c\n\tinventory\x18\x07 \x01(\x03R\tinventory\x12\x36\n\x17\x63urrent_net_receivables\x18\x08 \x01(\x03R\x15\x63urrentNetReceivables\x12\x37\n\x18total_non_current_assets\x18\t \x01(\x03R\x15totalNonCurrentAssets\x12\x38\n\x18property_plant_equipment\x18\n \x01(\x03R\x16propertyPlantEquipment\x12Y\n)accumulated_depreciation_amortization_ppe\x18\x0b \x01(\x03R&accumulatedDepreciationAmortizationPpe\x12+\n\x11intangible_assets\x18\x0c \x01(\x03R\x10intangibleAssets\x12O\n$intangible_assets_excluding_goodwill\x18\r \x01(\x03R!intangibleAssetsExcludingGoodwill\x12\x1a\n\x08goodwill\x18\x0e \x01(\x03R\x08goodwill\x12 \n\x0binvestments\x18\x0f \x01(\x03R\x0binvestments\x12\x32\n\x15long_term_investments\x18\x10 \x01(\x03R\x13longTermInvestments\x12\x34\n\x16short_term_investments\x18\x11 \x01(\x03R\x14shortTermInvestments\x12\x30\n\x14other_current_assets\x18\x12 \x01(\x03R\x12otherCurrentAssets\x12\x37\n\x18other_non_current_assets\x18\x13 \x01(\x03R\x15otherNonCurrentAssets\x12+\n\x11total_liabilities\x18\x14 \x01(\x03R\x10totalLiabilities\x12:\n\x19total_current_liabilities\x18\x15 \x01(\x03R\x17totalCurrentLiabilities\x12\x38\n\x18\x63urrent_accounts_payable\x18\x16 \x01(\x03R\x16\x63urrentAccountsPayable\x12)\n\x10\x64\x65\x66\x65rred_revenue\x18\x17 \x01(\x03R\x0f\x64\x65\x66\x65rredRevenue\x12!\n\x0c\x63urrent_debt\x18\x18 \x01(\x03R\x0b\x63urrentDebt\x12&\n\x0fshort_term_debt\x18\x19 \x01(\x03R\rshortTermDebt\x12\x41\n\x1dtotal_non_current_liabilities\x18\x1a \x01(\x03R\x1atotalNonCurrentLiabilities\x12:\n\x19\x63\x61pital_lease_obligations\x18\x1b \x01(\x03R\x17\x63\x61pitalLeaseObligations\x12$\n\x0elong_term_debt\x18\x1c \x01(\x03R\x0clongTermDebt\x12\x33\n\x16\x63urrent_long_term_debt\x18\x1d \x01(\x03R\x13\x63urrentLongTermDebt\x12\x39\n\x19long_term_debt_noncurrent\x18\x1e \x01(\x03R\x16longTermDebtNoncurrent\x12:\n\x1ashort_long_term_debt_total\x18\x1f \x01(\x03R\x16shortLongTermDebtTotal\x12:\n\x19other_current_liabilities\x18  \x01(\x03R\x17otherCurrentLiabilities\x12\x41\n\x1dother_non_current_liabilities\x18! \x01(\x03R\x1aotherNonCurrentLiabilities\x12\x38\n\x18total_shareholder_equity\x18\" \x01(\x03R\x16totalShareholderEquity\x12%\n\x0etreasury_stock\x18# \x01(\x03R\rtreasuryStock\x12+\n\x11retained_earnings\x18$ \x01(\x03R\x10retainedEarnings\x12!\n\x0c\x63ommon_stock\x18% \x01(\x03R\x0b\x63ommonStock\x12\x45\n\x1f\x63ommon_stock_shares_outstanding\x18& \x01(\x03R\x1c\x63ommonStockSharesOutstanding\"\x92\x02\n\x14\x42\x61lanceSheetResponse\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12@\n\x0e\x61nnual_reports\x18\x02 \x03(\x0b\x32\x19.market_data.BalanceSheetR\rannualReports\x12\x46\n\x11quarterly_reports\x18\x03 \x03(\x0b\x32\x19.market_data.BalanceSheetR\x10quarterlyReports\x12\x16\n\x06\x63\x61\x63hed\x18\x04 \x01(\x08R\x06\x63\x61\x63hed\x12,\n\x0f\x63\x61\x63he_timestamp\x18\x05 \x01(\tH\x00R\x0e\x63\x61\x63heTimestamp\x88\x01\x01\x42\x12\n\x10_cache_timestamp\",\n\x12GetCashFlowRequest\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\"\xab\x0f\n\x08\x43\x61shFlow\x12,\n\x12\x66iscal_date_ending\x18\x01 \x01(\tR\x10\x66iscalDateEnding\x12+\n\x11reported_currency\x18\x02 \x01(\tR\x10reportedCurrency\x12-\n\x12operating_cashflow\x18\x03 \x01(\x03R\x11operatingCashflow\x12I\n!payments_for_operating_activities\x18\x04 \x01(\x03R\x1epaymentsForOperatingActivities\x12K\n\"proceeds_from_operating_activities\x18\x05 \x01(\x03R\x1fproceedsFromOperatingActivities\x12\x45\n\x1f\x63hange_in_operating_liabilities\x18\x06 \x01(\x03R\x1c\x63hangeInOperatingLiabilities\x12;\n\x1a\x63hange_in_operating_assets\x18\x07 \x01(\x03R\x17\x63hangeInOperatingAssets\x12U\n\'depreciation_depletion_and_amortization\x18\x08 \x01(\x03R$depreciationDepletionAndAmortization\x12\x31\n\x14\x63\x61pital_expenditures\x18\t \x01(\x03R\x13\x63\x61pitalExpenditures\x12\x32\n\x15\x63hange_in_receivables\x18\n \x01(\x03R\x13\x63hangeInReceivables\x12.\n\x13\x63hange_in_inventory\x18\x0b \x01(\x03R\x11\x63hangeInInventory\x12\x1f\n\x0bprofit_loss\x18\x0c \x01(\x03R\nprofitLoss\x12\x38\n\x18\x63\x61shflow_from_investment\x18\r \x01(\x03R\x16\x63\x61shflowFromInvestment\x12\x36\n\x17\x63\x61shflow_from_financing\x18\x0e \x01(\x03R\x15\x63\x61shflowFromFinancing\x12Z\n+proceeds_from_repayments_of_short_term_debt\x18\x0f \x01(\x03R%proceedsFromRepaymentsOfShortTermDebt\x12S\n\'payments_for_repurchase_of_common_stock\x18\x10 \x01(\x03R\"paymentsForRepurchaseOfCommonStock\x12H\n!payments_for_repurchase_of_equity\x18\x11 \x01(\x03R\x1dpaymentsForRepurchaseOfEquity\x12Y\n*payments_for_repurchase_of_preferred_stock\x18\x12 \x01(\x03R%paymentsForRepurchaseOfPreferredStock\x12\'\n\x0f\x64ividend_payout\x18\x13 \x01(\x03R\x0e\x64ividendPayout\x12?\n\x1c\x64ividend_payout_common_stock\x18\x14 \x01(\x03R\x19\x64ividendPayoutCommonStock\x12\x45\n\x1f\x64ividend_payout_preferred_stock\x18\x15 \x01(\x03R\x1c\x64ividendPayoutPreferredStock\x12Q\n&proceeds_from_issuance_of_common_stock\x18\x16 \x01(\x03R!proceedsFromIssuanceOfCommonStock\x12\x86\x01\nCproceeds_from_issuance_of_long_term_debt_and_capital_securities_net\x18\x17 \x01(\x03R9proceedsFromIssuanceOfLongTermDebtAndCapitalSecuritiesNet\x12W\n)proceeds_from_issuance_of_preferred_stock\x18\x18 \x01(\x03R$proceedsFromIssuanceOfPreferredStock\x12J\n\"proceeds_from_repurchase_of_equity\x18\x19 \x01(\x03R\x1eproceedsFromRepurchaseOfEquity\x12M\n$proceeds_from_sale_of_treasury_stock\x18\x1a \x01(\x03R\x1fproceedsFromSaleOfTreasuryStock\x12K\n#change_in_cash_and_cash_equivalents\x18\x1b \x01(\x03R\x1e\x63hangeInCashAndCashEquivalents\x12\x35\n\x17\x63hange_in_exchange_rate\x18\x1c \x01(\x03R\x14\x63hangeInExchangeRate\x12\x1d\n\nnet_income\x18\x1d \x01(\x03R\tnetIncome\"\x86\x02\n\x10\x43\x61shFlowResponse\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12<\n\x0e\x61nnual_reports\x18\x02 \x03(\x0b\x32\x15.market_data.CashFlowR\rannualReports\x12\x42\n\x11quarterly_reports\x18\x03 \x03(\x0b\x32\x15.market_data.CashFlowR\x10quarterlyReports\x12\x16\n\x06\x63\x61\x63hed\x18\x04 \x01(\x08R\x06\x63\x61\x63hed\x12,\n\x0f\x63\x61\x63he_timestamp\x18\x05 \x01(\tH\x00R\x0e\x63\x61\x63heTimestamp\x88\x01\x01\x42\x12\n\x10_cache_timestamp\",\n\x12GetEarningsRequest\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\"\x97\x02\n\x0c\x45\x61rningsData\x12,\n\x12\x66iscal_date_ending\x18\x01 \x01(\tR\x10\x66iscalDateEnding\x12!\n\x0creported_eps\x18\x02 \x01(\x01R\x0breportedEps\x12(\n\restimated_eps\x18\x03 \x01(\x01H\x00R\x0c\x65stimatedEps\x88\x01\x01\x12\x1f\n\x08surprise\x18\x04 \x01(\x01H\x01R\x08surprise\x88\x01\x01\x12\x34\n\x13surprise_percentage\x18\x05 \x01(\x01H\x02R\x12surprisePercentage\x88\x01\x01\x42\x10\n\x0e_estimated_epsB\x0b\n\t_surpriseB\x16\n\x14_surprise_percentage\"\x92\x02\n\x10\x45\x61rningsResponse\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x42\n\x0f\x61nnual_earnings\x18\x02 \x03(\x0b\x32\x19.market_data.EarningsDataR\x0e\x61nnualEarnings\x12H\n\x12quarterly_earnings\x18\x03 \x03(\x0b\x32\x19.market_data.EarningsDataR\x11quarterlyEarnings\x12\x16\n\x06\x63\x61\x63hed\x18\x04 \x01(\x08R\x06\x63\x61\x63hed\x12,\n\x0f\x63\x61\x63he_timestamp\x18\x05 \x01(\tH\x00R\x0e\x63\x61\x63heTimestamp\x88\x01\x01\x42\x12\n\x10_cache_timestamp\"o\n\x1aGetEarningsCalendarRequest\x12\x1b\n\x06symbol\x18\x01 \x01(\tH\x00R\x06symbol\x88\x01\x01\x12\x1d\n\x07horizon\x18\x02 \x01(\tH\x01R\x07horizon\x88\x01\x01\x42\t\n\x07_symbolB\n\n\x08_horizon\"\xf8\x01\n\x15\x45\x61rningsCalendarEvent\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x12\n\x04name\x18\x02 \x01(\tR\x04name\x12\x1f\n\x0breport_date\x18\x03 \x01(\tR\nreportDate\x12\x31\n\x12\x66iscal_date_ending\x18\x04 \x01(\x01H\x00R\x10\x66iscalDateEnding\x88\x01\x01\x12\x1f\n\x08\x65stimate\x18\x05 \x01(\x01H\x01R\x08\x65stimate\x88\x01\x01\x12\x1a\n\x08\x63urrency\x18\x06 \x01(\tR\x08\x63urrencyB\x15\n\x13_fiscal_date_endingB\x0b\n\t_estimate\"\xc6\x01\n\x18\x45\x61rningsCalendarResponse\x12:\n\x06\x65vents\x18\x01 \x03(\x0b\x32\".market_data.EarningsCalendarEventR\x06\x65vents\x12\x14\n\x05\x63ount\x18\x02 \x01(\x05R\x05\x63ount\x12\x16\n\x06\x63\x61\x63hed\x18\x03 \x01(\x08R\x06\x63\x61\x63hed\x12,\n\x0f\x63\x61\x63he_timestamp\x18\x04 \x01(\tH\x00R\x0e\x63\x61\x63heTimestamp\x88\x01\x01\x42\x12\n\x10_cache_timestamp\"\x17\n\x15GetIPOCalendarRequest\"\xdb\x01\n\x08IPOEvent\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x12\n\x04name\x18\x02 \x01(\tR\x04name\x12\x19\n\x08ipo_date\x18\x03 \x01(\tR\x07ipoDate\x12&\n\x0fprice_range_low\x18\x04 \x01(\tR\rpriceRangeLow\x12(\n\x10price_range_high\x18\x05 \x01(\tR\x0epriceRangeHigh\x12\x1a\n\x08\x63urrency\x18\x06 \x01(\tR\x08\x63urrency\x12\x1a\n\x08\x65xchange\x18\x07 \x01(\tR\x08\x65xchange\"\xb4\x01\n\x13IPOCalendarResponse\x12-\n\x06\x65vents\x18\x01 \x03(\x0b\x32\x15.market_data.IPOEventR\x06\x65vents\x12\x14\n\x05\x63ount\x18\x02 \x01(\x05R\x05\x63ount\x12\x16\n\x06\x63\x61\x63hed\x18\x03 \x01(\x08R\x06\x63\x61\x63hed\x12,\n\x0f\x63\x61\x63he_timestamp\x18\x04 \x01(\tH\x00R\x0e\x63\x61\x63heTimestamp\x88\x01\x01\x42\x12\n\x10_cache_timestamp\".\n\x14GetETFProfileRequest\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\"\xe3\x03\n\nETFProfile\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x1f\n\x0b\x61sset_class\x18\x02 \x01(\tR\nassetClass\x12(\n\x10\x61sset_class_size\x18\x03 \x01(\tR\x0e\x61ssetClassSize\x12*\n\x11\x61sset_class_style\x18\x04 \x01(\tR\x0f\x61ssetClassStyle\x12\x1d\n\nbrand_name\x18\x05 \x01(\tR\tbrandName\x12\x1a\n\x08\x63\x61tegory\x18\x06 \x01(\tR\x08\x63\x61tegory\x12\x14\n\x05\x66ocus\x18\x07 \x01(\tR\x05\x66ocus\x12\x14\n\x05niche\x18\x08 \x01(\tR\x05niche\x12\x1a\n\x08strategy\x18\t \x01(\tR\x08strategy\x12\x1c\n\tdeveloper\x18\n \x01(\tR\tdeveloper\x12#\n\rindex_tracked\x18\x0b \x01(\tR\x0cindexTracked\x12\x16\n\x06issuer\x18\x0c \x01(\tR\x06issuer\x12%\n\x0einception_date\x18\r \x01(\tR\rinceptionDate\x12\x1f\n\x0b\x64\x61ta_source\x18\x0e \x01(\tR\ndataSource\x12 \n\x0b\x64\x65scription\x18\x0f \x01(\tR\x0b\x64\x65scription\"\xa1\x01\n\x12\x45TFProfileResponse\x12\x31\n\x07profile\x18\x01 \x01(\x0b\x32\x17.market_data.ETFProfileR\x07profile\x12\x16\n\x06\x63\x61\x63hed\x18\x02 \x01(\x08R\x06\x63\x61\x63hed\x12,\n\x0f\x63\x61\x63he_timestamp\x18\x03 \x01(\tH\x00R\x0e\x63\x61\x63heTimestamp\x88\x01\x01\x42\x12\n\x10_cache_timestamp\"-\n\x13GetDividendsRequest\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\"\x84\x02\n\x0c\x44ividendData\x12(\n\x10\x65x_dividend_date\x18\x01 \x01(\tR\x0e\x65xDividendDate\x12\x16\n\x06\x61mount\x18\x02 \x01(\x01R\x06\x61mount\x12.\n\x10\x64\x65\x63laration_date\x18\x03 \x01(\tH\x00R\x0f\x64\x65\x63larationDate\x88\x01\x01\x12$\n\x0brecord_date\x18\x04 \x01(\tH\x01R\nrecordDate\x88\x01\x01\x12&\n\x0cpayment_date\x18\x05 \x01(\tH\x02R\x0bpaymentDate\x88\x01\x01\x42\x13\n\x11_declaration_dateB\x0e\n\x0c_record_dateB\x0f\n\r_payment_date\"\xd4\x01\n\x11\x44ividendsResponse\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x37\n\tdividends\x18\x02 \x03(\x0b\x32\x19.market_data.DividendDataR\tdividends\x12\x14\n\x05\x63ount\x18\x03 \x01(\x05R\x05\x63ount\x12\x16\n\x06\x63\x61\x63hed\x18\x04 \x01(\x08R\x06\x63\x61\x63hed\x12,\n\x0f\x63\x61\x63he_timestamp\x18\x05 \x01(\tH\x00R\x0e\x63\x61\x63heTimestamp\x88\x01\x01\x42\x12\n\x10_cache_timestamp\"*\n\x10GetSplitsRequest\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\"L\n\tSplitData\x12\x12\n\x04\x64\x61te\x18\x01 \x01(\tR\x04\x64\x61te\x12+\n\x11split_coefficient\x18\x02 \x01(\x01R\x10splitCoefficient\"\xc8\x01\n\x0eSplitsResponse\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12.\n\x06splits\x18\x02 \x03(\x0b\x32\x16.market_data.SplitDataR\x06splits\x12\x14\n\x05\x63ount\x18\x03 \x01(\x05R\x05\x63ount\x12\x16\n\x06\x63\x61\x63hed\x18\x04 \x01(\x08R\x06\x63\x61\x63hed\x12,\n\x0f\x63\x61\x63he_timestamp\x18\x05 \x01(\tH\x00R\x0e\x63\x61\x63heTimestamp\x88\x01\x01\x42\x12\n\x10_cache_timestamp\"\x84\x02\n\x0eGetNewsRequest\x12\x1d\n\x07tickers\x18\x01 \x01(\tH\x00R\x07tickers\x88\x01\x01\x12\x1b\n\x06topics\x18\x02 \x01(\tH\x01R\x06topics\x88\x01\x01\x12 \n\ttime_from\x18\x03 \x01(\tH\x02R\x08timeFrom\x88\x01\x01\x12\x1c\n\x07time_to\x18\x04 \x01(\tH\x03R\x06timeTo\x88\x01\x01\x12\x17\n\x04sort\x18\x05 \x01(\tH\x04R\x04sort\x88\x01\x01\x12\x19\n\x05limit\x18\x06 \x01(\x05H\x05R\x05limit\x88\x01\x01\x42\n\n\x08_tickersB\t\n\x07_topicsB\x0c\n\n_time_fromB\n\n\x08_time_toB\x07\n\x05_sortB\x08\n\x06_limit\"\x90\x04\n\x0bNewsArticle\x12\x14\n\x05title\x18\x01 \x01(\tR\x05title\x12\x10\n\x03url\x18\x02 \x01(\tR\x03url\x12%\n\x0etime_published\x18\x03 \x01(\tR\rtimePublished\x12\x18\n\x07\x61uthors\x18\x04 \x03(\tR\x07\x61uthors\x12\x18\n\x07summary\x18\x05 \x01(\tR\x07summary\x12!\n\x0c\x62\x61nner_image\x18\x06 \x01(\tR\x0b\x62\x61nnerImage\x12\x16\n\x06source\x18\x07 \x01(\tR\x06source\x12\x34\n\x16\x63\x61tegory_within_source\x18\x08 \x01(\tR\x14\x63\x61tegoryWithinSource\x12#\n\rsource_domain\x18\t \x01(\tR\x0csourceDomain\x12/\n\x06topics\x18\n \x03(\x0b\x32\x17.market_data.NewsTickerR\x06topics\x12\x36\n\x17overall_sentiment_score\x18\x0b \x01(\x01R\x15overallSentimentScore\x12\x36\n\x17overall_sentiment_label\x18\x0c \x01(\tR\x15overallSentimentLabel\x12G\n\x10ticker_sentiment\x18\r \x03(\x0b\x32\x1c.market_data.TickerSentimentR\x0ftickerSentiment\"K\n\nNewsTicker\x12\x14\n\x05topic\x18\x01 \x01(\tR\x05topic\x12\'\n\x0frelevance_score\x18\x02 \x01(\x01R\x0erelevanceScore\"\xbe\x01\n\x0fTickerSentiment\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\x12\'\n\x0frelevance_score\x18\x02 \x01(\x01R\x0erelevanceScore\x12\x34\n\x16ticker_sentiment_score\x18\x03 \x01(\x01R\x14tickerSentimentScore\x12\x34\n\x16ticker_sentiment_label\x18\x04 \x01(\tR\x14tickerSentimentLabel\"\xb0\x02\n\x0cNewsResponse\x12\x34\n\x08\x61rticles\x18\x01 \x03(\x0b\x32\x18.market_data.NewsArticleR\x08\x61rticles\x12\x14\n\x05\x63ount\x18\x02 \x01(\x05R\x05\x63ount\x12<\n\x1asentiment_score_definition\x18\x03 \x01(\tR\x18sentimentScoreDefinition\x12<\n\x1arelevance_score_definition\x18\x04 \x01(\tR\x18relevanceScoreDefinition\x12\x16\n\x06\x63\x61\x63hed\x18\x05 \x01(\x08R\x06\x63\x61\x63hed\x12,\n\x0f\x63\x61\x63he_timestamp\x18\x06 \x01(\tH\x00R\x0e\x63\x61\x63heTimestamp\x88\x01\x01\x42\x12\n\x10_cache_timestamp\"\x1c\n\x1aGetTopGainersLosersRequest\"\xa4\x01\n\nStockMover\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\x12\x14\n\x05price\x18\x02 \x01(\x01R\x05price\x12#\n\rchange_amount\x18\x03 \x01(\x01R\x0c\x63hangeAmount\x12+\n\x11\x63hange_percentage\x18\x04 \x01(\x01R\x10\x63hangePercentage\x12\x16\n\x06volume\x18\x05 \x01(\x03R\x06volume\"\xd4\x02\n\x18TopGainersLosersResponse\x12\x38\n\x0btop_gainers\x18\x01 \x03(\x0b\x32\x17.market_data.StockMoverR\ntopGainers\x12\x36\n\ntop_losers\x18\x02 \x03(\x0b\x32\x17.market_data.StockMoverR\ttopLosers\x12I\n\x14most_actively_traded\x18\x03 \x03(\x0b\x32\x17.market_data.StockMoverR\x12mostActivelyTraded\x12!\n\x0clast_updated\x18\x04 \x01(\tR\x0blastUpdated\x12\x16\n\x06\x63\x61\x63hed\x18\x05 \x01(\x08R\x06\x63\x61\x63hed\x12,\n\x0f\x63\x61\x63he_timestamp\x18\x06 \x01(\tH\x00R\x0e\x63\x61\x63heTimestamp\x88\x01\x01\x42\x12\n\x10_cache_timestamp\"2\n\x18GetAnalystRatingsRequest\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\"\x97\x01\n\rAnalystRating\x12!\n\x0c\x61nalyst_firm\x18\x01 \x01(\tR\x0b\x61nalystFirm\x12\x16\n\x06rating\x18\x02 \x01(\tR\x06rating\x12&\n\x0ctarget_price\x18\x03 \x01(\x01H\x00R\x0btargetPrice\x88\x01\x01\x12\x12\n\x04\x64\x61te\x18\x04 \x01(\tR\x04\x64\x61teB\x0f\n\r_target_price\"\xd6\x01\n\x16\x41nalystRatingsResponse\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x34\n\x07ratings\x18\x02 \x03(\x0b\x32\x1a.market_data.AnalystRatingR\x07ratings\x12\x14\n\x05\x63ount\x18\x03 \x01(\x05R\x05\x63ount\x12\x16\n\x06\x63\x61\x63hed\x18\x04 \x01(\x08R\x06\x63\x61\x63hed\x12,\n\x0f\x63\x61\x63he_timestamp\x18\x05 \x01(\tH\x00R\x0e\x63\x61\x63heTimestamp\x88\x01\x01\x42\x12\n\x10_cache_timestamp\"7\n\x1dGetInsiderTransactionsRequest\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\"\x98\x02\n\x12InsiderTransaction\x12!\n\x0cinsider_name\x18\x01 \x01(\tR\x0binsiderName\x12\x1a\n\x08position\x18\x02 \x01(\tR\x08position\x12)\n\x10transaction_type\x18\x03 \x01(\tR\x0ftransactionType\x12)\n\x10transaction_date\x18\x04 \x01(\tR\x0ftransactionDate\x12\x16\n\x06shares\x18\x05 \x01(\x05R\x06shares\x12+\n\x0fprice_per_share\x18\x06 \x01(\x01H\x00R\rpricePerShare\x88\x01\x01\x12\x14\n\x05value\x18\x07 \x01(\x03R\x05valueB\x12\n\x10_price_per_share\"\xea\x01\n\x1bInsiderTransactionsResponse\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x43\n\x0ctransactions\x18\x02 \x03(\x0b\x32\x1f.market_data.InsiderTransactionR\x0ctransactions\x12\x14\n\x05\x63ount\x18\x03 \x01(\x05R\x05\x63ount\x12\x16\n\x06\x63\x61\x63hed\x18\x04 \x01(\x08R\x06\x63\x61\x63hed\x12,\n\x0f\x63\x61\x63he_timestamp\x18\x05 \x01(\tH\x00R\x0e\x63\x61\x63heTimestamp\x88\x01\x01\x42\x12\n\x10_cache_timestamp\"\x83\x01\n\x1cGetEarningsTranscriptRequest\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x17\n\x04year\x18\x02 \x01(\tH\x00R\x04year\x88\x01\x01\x12\x1d\n\x07quarter\x18\x03 \x01(\tH\x01R\x07quarter\x88\x01\x01\x42\x07\n\x05_yearB\n\n\x08_quarter\"\x8e\x01\n\x12\x45\x61rningsTranscript\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x18\n\x07quarter\x18\x02 \x01(\tR\x07quarter\x12\x12\n\x04year\x18\x03 \x01(\tR\x04year\x12\x1e\n\ntranscript\x18\x04 \x01(\tR\ntranscript\x12\x12\n\x04\x64\x61te\x18\x05 \x01(\tR\x04\x64\x61te\"\xab\x01\n\x1a\x45\x61rningsTranscriptResponse\x12\x33\n\x04\x64\x61ta\x18\x01 \x01(\x0b\x32\x1f.market_data.EarningsTranscriptR\x04\x64\x61ta\x12\x16\n\x06\x63\x61\x63hed\x18\x02 \x01(\x08R\x06\x63\x61\x63hed\x12,\n\x0f\x63\x61\x63he_timestamp\x18\x03 \x01(\tH\x00R\x0e\x63\x61\x63heTimestamp\x88\x01\x01\x42\x12\n\x10_cache_timestamp\"=\n\rGetGDPRequest\x12\x1f\n\x08interval\x18\x01 \x01(\tH\x00R\x08interval\x88\x01\x01\x42\x0b\n\t_interval\"=\n\x11\x45\x63onomicDataPoint\x12\x12\n\x04\x64\x61te\x18\x01 \x01(\tR\x04\x64\x61te\x12\x14\n\x05value\x18\x02 \x01(\x01R\x05value\"\x83\x02\n\x19\x45\x63onomicIndicatorResponse\x12\x12\n\x04name\x18\x01 \x01(\tR\x04name\x12\x1a\n\x08interval\x18\x02 \x01(\tR\x08interval\x12\x12\n\x04unit\x18\x03 \x01(\tR\x04unit\x12\x32\n\x04\x64\x61ta\x18\x04 \x03(\x0b\x32\x1e.market_data.EconomicDataPointR\x04\x64\x61ta\x12\x14\n\x05\x63ount\x18\x05 \x01(\x05R\x05\x63ount\x12\x16\n\x06\x63\x61\x63hed\x18\x06 \x01(\x08R\x06\x63\x61\x63hed\x12,\n\x0f\x63\x61\x63he_timestamp\x18\x07 \x01(\tH\x00R\x0e\x63\x61\x63heTimestamp\x88\x01\x01\x42\x12\n\x10_cache_timestamp\"\x18\n\x16GetGDPPerCapitaRequest\"\x15\n\x13GetInflationRequest\"=\n\rGetCPIRequest\x12\x1f\n\x08interval\x18\x01 \x01(\tH\x00R\x08interval\x88\x01\x01\x42\x0b\n\t_interval\"J\n\x1aGetFederalFundsRateRequest\x12\x1f\n\x08interval\x18\x01 \x01(\tH\x00R\x08interval\x88\x01\x01\x42\x0b\n\t_interval\"u\n\x17GetTreasuryYieldRequest\x12\x1f\n\x08interval\x18\x01 \x01(\tH\x00R\x08interval\x88\x01\x01\x12\x1f\n\x08maturity\x18\x02 \x01(\tH\x01R\x08maturity\x88\x01\x01\x42\x0b\n\t_intervalB\x0b\n\t_maturity\"\x17\n\x15GetRetailSalesRequest\"\x14\n\x12GetDurablesRequest\"\x18\n\x16GetUnemploymentRequest\"\x1a\n\x18GetNonfarmPayrollRequest\"a\n\x13GetCommodityRequest\x12\x1c\n\tcommodity\x18\x01 \x01(\tR\tcommodity\x12\x1f\n\x08interval\x18\x02 \x01(\tH\x00R\x08interval\x88\x01\x01\x42\x0b\n\t_interval\"\xfb\x01\n\x11\x43ommodityResponse\x12\x12\n\x04name\x18\x01 \x01(\tR\x04name\x12\x1a\n\x08interval\x18\x02 \x01(\tR\x08interval\x12\x12\n\x04unit\x18\x03 \x01(\tR\x04unit\x12\x32\n\x04\x64\x61ta\x18\x04 \x03(\x0b\x32\x1e.market_data.EconomicDataPointR\x04\x64\x61ta\x12\x14\n\x05\x63ount\x18\x05 \x01(\x05R\x05\x63ount\x12\x16\n\x06\x63\x61\x63hed\x18\x06 \x01(\x08R\x06\x63\x61\x63hed\x12,\n\x0f\x63\x61\x63he_timestamp\x18\x07 \x01(\tH\x00R\x0e\x63\x61\x63heTimestamp\x88\x01\x01\x42\x12\n\x10_cache_timestamp\"H\n\x18GetAllCommoditiesRequest\x12\x1f\n\x08interval\x18\x01 \x01(\tH\x00R\x08interval\x88\x01\x01\x42\x0b\n\t_interval\"\xc0\x02\n\x16\x41llCommoditiesResponse\x12V\n\x0b\x63ommodities\x18\x01 \x03(\x0b\x32\x34.market_data.AllCommoditiesResponse.CommoditiesEntryR\x0b\x63ommodities\x12\x14\n\x05\x63ount\x18\x02 \x01(\x05R\x05\x63ount\x12\x16\n\x06\x63\x61\x63hed\x18\x03 \x01(\x08R\x06\x63\x61\x63hed\x12,\n\x0f\x63\x61\x63he_timestamp\x18\x04 \x01(\tH\x00R\x0e\x63\x61\x63heTimestamp\x88\x01\x01\x1a^\n\x10\x43ommoditiesEntry\x12\x10\n\x03key\x18\x01 \x01(\tR\x03key\x12\x34\n\x05value\x18\x02 \x01(\x0b\x32\x1e.market_data.CommodityResponseR\x05value:\x02\x38\x01\x42\x12\n\x10_cache_timestamp\"R\n\x16GetOptionsChainRequest\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x17\n\x04\x64\x61te\x18\x02 \x01(\tH\x00R\x04\x64\x61te\x88\x01\x01\x42\x07\n\x05_date\"\xf2\x05\n\x0eOptionContract\x12\x1f\n\x0b\x63ontract_id\x18\x01 \x01(\tR\ncontractId\x12\x16\n\x06symbol\x18\x02 \x01(\tR\x06symbol\x12\x1e\n\nexpiration\x18\x03 \x01(\tR\nexpiration\x12\x16\n\x06strike\x18\x04 \x01(\x01R\x06strike\x12\x12\n\x04type\x18\x05 \x01(\tR\x04type\x12\x17\n\x04last\x18\x06 \x01(\x01H\x00R\x04last\x88\x01\x01\x12\x17\n\x04mark\x18\x07 \x01(\x01H\x01R\x04mark\x88\x01\x01\x12\x15\n\x03\x62id\x18\x08 \x01(\x01H\x02R\x03\x62id\x88\x01\x01\x12\x1e\n\x08\x62id_size\x18\t \x01(\x01H\x03R\x07\x62idSize\x88\x01\x01\x12\x15\n\x03\x61sk\x18\n \x01(\x01H\x04R\x03\x61sk\x88\x01\x01\x12\x1e\n\x08\x61sk_size\x18\x0b \x01(\x01H\x05R\x07\x61skSize\x88\x01\x01\x12\x1b\n\x06volume\x18\x0c \x01(\x03H\x06R\x06volume\x88\x01\x01\x12(\n\ropen_interest\x18\r \x01(\x03H\x07R\x0copenInterest\x88\x01\x01\x12\x17\n\x04\x64\x61te\x18\x0e \x01(\tH\x08R\x04\x64\x61te\x88\x01\x01\x12\x32\n\x12implied_volatility\x18\x0f \x01(\x01H\tR\x11impliedVolatility\x88\x01\x01\x12\x19\n\x05\x64\x65lta\x18\x10 \x01(\x01H\nR\x05\x64\x65lta\x88\x01\x01\x12\x19\n\x05gamma\x18\x11 \x01(\x01H\x0bR\x05gamma\x88\x01\x01\x12\x19\n\x05theta\x18\x12 \x01(\x01H\x0cR\x05theta\x88\x01\x01\x12\x17\n\x04vega\x18\x13 \x01(\x01H\rR\x04vega\x88\x01\x01\x12\x15\n\x03rho\x18\x14 \x01(\x01H\x0eR\x03rho\x88\x01\x01\x42\x07\n\x05_lastB\x07\n\x05_markB\x06\n\x04_bidB\x0b\n\t_bid_sizeB\x06\n\x04_askB\x0b\n\t_ask_sizeB\t\n\x07_volumeB\x10\n\x0e_open_interestB\x07\n\x05_dateB\x15\n\x13_implied_volatilityB\x08\n\x06_deltaB\x08\n\x06_gammaB\x08\n\x06_thetaB\x07\n\x05_vegaB\x06\n\x04_rho\"\xd9\x01\n\x14OptionsChainResponse\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x39\n\tcontracts\x18\x02 \x03(\x0b\x32\x1b.market_data.OptionContractR\tcontracts\x12\x14\n\x05\x63ount\x18\x03 \x01(\x05R\x05\x63ount\x12\x16\n\x06\x63\x61\x63hed\x18\x04 \x01(\x08R\x06\x63\x61\x63hed\x12,\n\x0f\x63\x61\x63he_timestamp\x18\x05 \x01(\tH\x00R\x0e\x63\x61\x63heTimestamp\x88\x01\x01\x42\x12\n\x10_cache_timestamp\"W\n\x1bGetHistoricalOptionsRequest\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x17\n\x04\x64\x61te\x18\x02 \x01(\tH\x00R\x04\x64\x61te\x88\x01\x01\x42\x07\n\x05_date\"\xf2\x01\n\x19HistoricalOptionsResponse\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x12\n\x04\x64\x61te\x18\x02 \x01(\tR\x04\x64\x61te\x12\x39\n\tcontracts\x18\x03 \x03(\x0b\x32\x1b.market_data.OptionContractR\tcontracts\x12\x14\n\x05\x63ount\x18\x04 \x01(\x05R\x05\x63ount\x12\x16\n\x06\x63\x61\x63hed\x18\x05 \x01(\x08R\x06\x63\x61\x63hed\x12,\n\x0f\x63\x61\x63he_timestamp\x18\x06 \x01(\tH\x00R\x0e\x63\x61\x63heTimestamp\x88\x01\x01\x42\x12\n\x10_cache_timestamp\";\n\x18GetOptionContractRequest\x12\x1f\n\x0b\x63ontract_id\x18\x01 \x01(\tR\ncontractId\"\xab\x01\n\x16OptionContractResponse\x12\x37\n\x08\x63ontract\x18\x01 \x01(\x0b\x32\x1b.market_data.OptionContractR\x08\x63ontract\x12\x16\n\x06\x63\x61\x63hed\x18\x02 \x01(\x08R\x06\x63\x61\x63hed\x12,\n\x0f\x63\x61\x63he_timestamp\x18\x03 \x01(\tH\x00R\x0e\x63\x61\x63heTimestamp\x88\x01\x01\x42\x12\n\x10_cache_timestamp\"\x14\n\x12HealthCheckRequest\"\xbd\x02\n\x13HealthCheckResponse\x12\x16\n\x06status\x18\x01 \x01(\tR\x06status\x12\x18\n\x07service\x18\x02 \x01(\tR\x07service\x12\x18\n\x07version\x18\x03 \x01(\tR\x07version\x12%\n\x0euptime_seconds\x18\x04 \x01(\x03R\ruptimeSeconds\x12\x1d\n\ncache_size\x18\x05 \x01(\x03R\tcacheSize\x12T\n\x0c\x64\x61ta_sources\x18\x06 \x03(\x0b\x32\x31.market_data.HealthCheckResponse.DataSourcesEntryR\x0b\x64\x61taSources\x1a>\n\x10\x44\x61taSourcesEntry\x12\x10\n\x03key\x18\x01 \x01(\tR\x03key\x12\x14\n\x05value\x18\x02 \x01(\x05R\x05value:\x02\x38\x01\"\x17\n\x15GetServiceInfoRequest\"\xbf\x02\n\x0bServiceInfo\x12!\n\x0cservice_name\x18\x01 \x01(\tR\x0bserviceName\x12\x18\n\x07version\x18\x02 \x01(\tR\x07version\x12 \n\x0b\x65nvironment\x18\x03 \x01(\tR\x0b\x65nvironment\x12)\n\x10supported_assets\x18\x04 \x03(\tR\x0fsupportedAssets\x12%\n\x0e\x64\x61ta_providers\x18\x05 \x03(\tR\rdataProviders\x12\x42\n\x08\x66\x65\x61tures\x18\x06 \x03(\x0b\x32&.market_data.ServiceInfo.FeaturesEntryR\x08\x66\x65\x61tures\x1a;\n\rFeaturesEntry\x12\x10\n\x03key\x18\x01 \x01(\tR\x03key\x12\x14\n\x05value\x18\x02 \x01(\tR\x05value:\x02\x38\x01\"\x16\n\x14GetCacheStatsRequest\"\xc0\x02\n\nCacheStats\x12#\n\rtotal_entries\x18\x01 \x01(\x03R\x0ctotalEntries\x12(\n\x10total_size_bytes\x18\x02 \x01(\x03R\x0etotalSizeBytes\x12\x19\n\x08hit_rate\x18\x03 \x01(\x01R\x07hitRate\x12\x12\n\x04hits\x18\x04 \x01(\x03R\x04hits\x12\x16\n\x06misses\x18\x05 \x01(\x03R\x06misses\x12X\n\x11\x65ntries_by_domain\x18\x06 \x03(\x0b\x32,.market_data.CacheStats.EntriesByDomainEntryR\x0f\x65ntriesByDomain\x1a\x42\n\x14\x45ntriesByDomainEntry\x12\x10\n\x03key\x18\x01 \x01(\tR\x03key\x12\x14\n\x05value\x18\x02 \x01(\x03R\x05value:\x02\x38\x01\"G\n\x17GetUpstreamStatsRequest\x12\x1f\n\x08provider\x18\x01 \x01(\tH\x00R\x08provider\x88\x01\x01\x42\x0b\n\t_provider\"\x80\x02\n\x15UpstreamPriorityStats\x12\x1a\n\x08priority\x18\x01 \x01(\tR\x08priority\x12\x1f\n\x0bqueue_depth\x18\x02 \x01(\x05R\nqueueDepth\x12\x1e\n\ndispatched\x18\x03 \x01(\x03R\ndispatched\x12\x1e\n\x0bwait_ms_p50\x18\x04 \x01(\x01R\twaitMsP50\x12\x1e\n\x0bwait_ms_p99\x18\x05 \x01(\x01R\twaitMsP99\x12$\n\x0elatency_ms_p50\x18\x06 \x01(\x01R\x0clatencyMsP50\x12$\n\x0elatency_ms_p99\x18\x07 \x01(\x01R\x0clatencyMsP99\"\xb3\x02\n\x15UpstreamProviderStats\x12\x1a\n\x08provider\x18\x01 \x01(\tR\x08provider\x12&\n\x0frate_per_second\x18\x02 \x01(\x01R\rratePerSecond\x12\x14\n\x05\x62urst\x18\x03 \x01(\x01R\x05\x62urst\x12)\n\x10tokens_available\x18\x04 \x01(\x01R\x0ftokensAvailable\x12\x1b\n\tin_flight\x18\x05 \x01(\x05R\x08inFlight\x12\x1c\n\tcoalesced\x18\x06 \x01(\x03R\tcoalesced\x12\x16\n\x06\x65rrors\x18\x07 \x01(\x03R\x06\x65rrors\x12\x42\n\npriorities\x18\x08 \x03(\x0b\x32\".market_data.UpstreamPriorityStatsR\npriorities\"Q\n\rUpstreamStats\x12@\n\tproviders\x18\x01 \x03(\x0b\x32\".market_data.UpstreamProviderStatsR\tproviders2\xba&\n\x11MarketDataService\x12P\n\x0bHealthCheck\x12\x1f.market_data.HealthCheckRequest\x1a .market_data.HealthCheckResponse\x12N\n\x0eGetServiceInfo\x12\".market_data.GetServiceInfoRequest\x1a\x18.market_data.ServiceInfo\x12K\n\rGetCacheStats\x12!.market_data.GetCacheStatsRequest\x1a\x17.market_data.CacheStats\x12T\n\x10GetUpstreamStats\x12$.market_data.GetUpstreamStatsRequest\x1a\x1a.market_data.UpstreamStats\x12N\n\rGetDailyOHLCV\x12!.market_data.GetDailyOHLCVRequest\x1a\x1a.market_data.OHLCVResponse\x12T\n\x10GetIntradayOHLCV\x12$.market_data.GetIntradayOHLCVRequest\x1a\x1a.market_data.OHLCVResponse\x12P\n\x0eGetWeeklyOHLCV\x12\".market_data.GetWeeklyOHLCVRequest\x1a\x1a.market_data.OHLCVResponse\x12R\n\x0fGetMonthlyOHLCV\x12#.market_data.GetMonthlyOHLCVRequest\x1a\x1a.market_data.OHLCVResponse\x12\x44\n\x08GetQuote\x12\x1c.market_data.GetQuoteRequest\x1a\x1a.market_data.QuoteResponse\x12V\n\rSearchSymbols\x12!.market_data.SearchSymbolsRequest\x1a\".market_data.SearchSymbolsResponse\x12\x65\n\x12\x42\x61tchGetDailyOHLCV\x12&.market_data.BatchGetDailyOHLCVRequest\x1a\'.market_data.BatchGetDailyOHLCVResponse\x12V\n\rBatchGetQuote\x12!.market_data.BatchGetQuoteRequest\x1a\".market_data.BatchGetQuoteResponse\x12V\n\x11GetResampledOHLCV\x12%.market_data.GetResampledOHLCVRequest\x1a\x1a.market_data.OHLCVResponse\x12N\n\rGetForexDaily\x12!.market_data.GetForexDailyRequest\x1a\x1a.market_data.ForexResponse\x12T\n\x10GetForexIntraday\x12$.market_data.GetForexIntradayRequest\x1a\x1a.market_data.ForexResponse\x12P\n\x0eGetForexWeekly\x12\".market_data.GetForexWeeklyRequest\x1a\x1a.market_data.ForexResponse\x12R\n\x0fGetForexMonthly\x12#.market_data.GetForexMonthlyRequest\x1a\x1a.market_data.ForexResponse\x12P\n\x0cGetForexRate\x12 .market_data.GetForexRateRequest\x1a\x1e.market_data.ForexRateResponse\x12Y\n\x0eListForexPairs\x12\".market_data.ListForexPairsRequest\x1a#.market_data.ListForexPairsResponse\x12Q\n\x0eGetCryptoDaily\x12\".market_data.GetCryptoDailyRequest\x1a\x1b.market_data.CryptoResponse\x12W\n\x11GetCryptoIntraday\x12%.market_data.GetCryptoIntradayRequest\x1a\x1b.market_data.CryptoResponse\x12S\n\x0fGetCryptoWeekly\x12#.market_data.GetCryptoWeeklyRequest\x1a\x1b.market_data.CryptoResponse\x12U\n\x10GetCryptoMonthly\x12$.market_data.GetCryptoMonthlyRequest\x1a\x1b.market_data.CryptoResponse\x12\x62\n\x11ListCryptoSymbols\x12%.market_data.ListCryptoSymbolsRequest\x1a&.market_data.ListCryptoSymbolsResponse\x12_\n\x10\x42\x61tchCryptoQuote\x12$.market_data.BatchCryptoQuoteRequest\x1a%.market_data.BatchCryptoQuoteResponse\x12\x62\n\x12GetCompanyOverview\x12&.market_data.GetCompanyOverviewRequest\x1a$.market_data.CompanyOverviewResponse\x12\x62\n\x12GetIncomeStatement\x12&.market_data.GetIncomeStatementRequest\x1a$.market_data.IncomeStatementResponse\x12Y\n\x0fGetBalanceSheet\x12#.market_data.GetBalanceSheetRequest\x1a!.market_data.BalanceSheetResponse\x12M\n\x0bGetCashFlow\x12\x1f.market_data.GetCashFlowRequest\x1a\x1d.market_data.CashFlowResponse\x12M\n\x0bGetEarnings\x12\x1f.market_data.GetEarningsRequest\x1a\x1d.market_data.EarningsResponse\x12\x65\n\x13GetEarningsCalendar\x12\'.market_data.GetEarningsCalendarRequest\x1a%.market_data.EarningsCalendarResponse\x12V\n\x0eGetIPOCalendar\x12\".market_data.GetIPOCalendarRequest\x1a .market_data.IPOCalendarResponse\x12S\n\rGetETFProfile\x12!.market_data.GetETFProfileRequest\x1a\x1f.market_data.ETFProfileResponse\x12P\n\x0cGetDividends\x12 .market_data.GetDividendsRequest\x1a\x1e.market_data.DividendsResponse\x12G\n\tGetSplits\x12\x1d.market_data.GetSplitsRequest\x1a\x1b.market_data.SplitsResponse\x12\x41\n\x07GetNews\x12\x1b.market_data.GetNewsRequest\x1a\x19.market_data.NewsResponse\x12\x65\n\x13GetTopGainersLosers\x12\'.market_data.GetTopGainersLosersRequest\x1a%.market_data.TopGainersLosersResponse\x12_\n\x11GetAnalystRatings\x12%.market_data.GetAnalystRatingsRequest\x1a#.market_data.AnalystRatingsResponse\x12n\n\x16GetInsiderTransactions\x12*.market_data.GetInsiderTransactionsRequest\x1a(.market_data.InsiderTransactionsResponse\x12k\n\x15GetEarningsTranscript\x12).market_data.GetEarningsTranscriptRequest\x1a\'.market_data.EarningsTranscriptResponse\x12L\n\x06GetGDP\x12\x1a.market_data.GetGDPRequest\x1a&.market_data.EconomicIndicatorResponse\x12^\n\x0fGetGDPPerCapita\x12#.market_data.GetGDPPerCapitaRequest\x1a&.market_data.EconomicIndicatorResponse\x12X\n\x0cGetInflation\x12 .market_data.GetInflationRequest\x1a&.market_data.EconomicIndicatorResponse\x12L\n\x06GetCPI\x12\x1a.market_data.GetCPIRequest\x1a&.market_data.EconomicIndicatorResponse\x12\x66\n\x13GetFederalFundsRate\x12\'.market_data.GetFederalFundsRateRequest\x1a&.market_data.EconomicIndicatorResponse\x12`\n\x10GetTreasuryYield\x12$.market_data.GetTreasuryYieldRequest\x1a&.market_data.EconomicIndicatorResponse\x12\\\n\x0eGetRetailSales\x12\".market_data.GetRetailSalesRequest\x1a&.market_data.EconomicIndicatorResponse\x12V\n\x0bGetDurables\x12\x1f.market_data.GetDurablesRequest\x1a&.market_data.EconomicIndicatorResponse\x12^\n\x0fGetUnemployment\x12#.market_data.GetUnemploymentRequest\x1a&.market_data.EconomicIndicatorResponse\x12\x62\n\x11GetNonfarmPayroll\x12%.market_data.GetNonfarmPayrollRequest\x1a&.market_data.EconomicIndicatorResponse\x12P\n\x0cGetCommodity\x12 .market_data.GetCommodityRequest\x1a\x1e.market_data.CommodityResponse\x12_\n\x11GetAllCommodities\x12%.market_data.GetAllCommoditiesRequest\x1a#.market_data.AllCommoditiesResponse\x12Y\n\x0fGetOptionsChain\x12#.market_data.GetOptionsChainRequest\x1a!.market_data.OptionsChainResponse\x12h\n\x14GetHistoricalOptions\x12(.market_data.GetHistoricalOptionsRequest\x1a&.market_data.HistoricalOptionsResponse\x12_\n\x11GetOptionContract\x12%.market_data.GetOptionContractRequest\x1a#.market_data.OptionContractResponseb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -77,210 +77,220 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_SYMBOLQUOTEDATA']._serialized_end=3428
   _globals['_BATCHGETQUOTERESPONSE']._serialized_start=3431
   _globals['_BATCHGETQUOTERESPONSE']._serialized_end=3611
-  _globals['_GETFOREXDAILYREQUEST']._serialized_start=3614
-  _globals['_GETFOREXDAILYREQUEST']._serialized_end=3846
-  _globals['_GETFOREXINTRADAYREQUEST']._serialized_start=3849
-  _globals['_GETFOREXINTRADAYREQUEST']._serialized_end=4130
-  _globals['_GETFOREXWEEKLYREQUEST']._serialized_start=4133
-  _globals['_GETFOREXWEEKLYREQUEST']._serialized_end=4314
-  _globals['_GETFOREXMONTHLYREQUEST']._serialized_start=4317
-  _globals['_GETFOREXMONTHLYREQUEST']._serialized_end=4499
-  _globals['_FOREXRESPONSE']._serialized_start=4502
-  _globals['_FOREXRESPONSE']._serialized_end=4762
-  _globals['_GETFOREXRATEREQUEST']._serialized_start=4764
-  _globals['_GETFOREXRATEREQUEST']._serialized_end=4855
-  _globals['_FOREXRATEDATA']._serialized_start=4858
-  _globals['_FOREXRATEDATA']._serialized_end=5212
-  _globals['_FOREXRATERESPONSE']._serialized_start=5215
-  _globals['_FOREXRATERESPONSE']._serialized_end=5372
-  _globals['_LISTFOREXPAIRSREQUEST']._serialized_start=5374
-  _globals['_LISTFOREXPAIRSREQUEST']._serialized_end=5397
-  _globals['_FOREXPAIR']._serialized_start=5399
-  _globals['_FOREXPAIR']._serialized_end=5492
-  _globals['_LISTFOREXPAIRSRESPONSE']._serialized_start=5494
-  _globals['_LISTFOREXPAIRSRESPONSE']._serialized_end=5586
-  _globals['_GETCRYPTODAILYREQUEST']._serialized_start=5589
-  _globals['_GETCRYPTODAILYREQUEST']._serialized_end=5756
-  _globals['_GETCRYPTOINTRADAYREQUEST']._serialized_start=5759
-  _globals['_GETCRYPTOINTRADAYREQUEST']._serialized_end=6027
-  _globals['_GETCRYPTOWEEKLYREQUEST']._serialized_start=6030
-  _globals['_GETCRYPTOWEEKLYREQUEST']._serialized_end=6198
-  _globals['_GETCRYPTOMONTHLYREQUEST']._serialized_start=6201
-  _globals['_GETCRYPTOMONTHLYREQUEST']._serialized_end=6370
-  _globals['_CRYPTORESPONSE']._serialized_start=6373
-  _globals['_CRYPTORESPONSE']._serialized_end=6620
-  _globals['_LISTCRYPTOSYMBOLSREQUEST']._serialized_start=6622
-  _globals['_LISTCRYPTOSYMBOLSREQUEST']._serialized_end=6648
-  _globals['_CRYPTOSYMBOL']._serialized_start=6650
-  _globals['_CRYPTOSYMBOL']._serialized_end=6708
-  _globals['_LISTCRYPTOSYMBOLSRESPONSE']._serialized_start=6710
-  _globals['_LISTCRYPTOSYMBOLSRESPONSE']._serialized_end=6812
-  _globals['_BATCHCRYPTOQUOTEREQUEST']._serialized_start=6814
-  _globals['_BATCHCRYPTOQUOTEREQUEST']._serialized_end=6889
-  _globals['_CRYPTOQUOTEDATA']._serialized_start=6892
-  _globals['_CRYPTOQUOTEDATA']._serialized_end=7077
-  _globals['_BATCHCRYPTOQUOTERESPONSE']._serialized_start=7079
-  _globals['_BATCHCRYPTOQUOTERESPONSE']._serialized_end=7181
-  _globals['_GETCOMPANYOVERVIEWREQUEST']._serialized_start=7183
-  _globals['_GETCOMPANYOVERVIEWREQUEST']._serialized_end=7234
-  _globals['_COMPANYOVERVIEW']._serialized_start=7237
-  _globals['_COMPANYOVERVIEW']._serialized_end=8973
-  _globals['_COMPANYOVERVIEWRESPONSE']._serialized_start=8976
-  _globals['_COMPANYOVERVIEWRESPONSE']._serialized_end=9149
-  _globals['_GETINCOMESTATEMENTREQUEST']._serialized_start=9151
-  _globals['_GETINCOMESTATEMENTREQUEST']._serialized_end=9202
-  _globals['_INCOMESTATEMENT']._serialized_start=9205
-  _globals['_INCOMESTATEMENT']._serialized_end=10492
-  _globals['_INCOMESTATEMENTRESPONSE']._serialized_start=10495
-  _globals['_INCOMESTATEMENTRESPONSE']._serialized_end=10778
-  _globals['_GETBALANCESHEETREQUEST']._serialized_start=10780
-  _globals['_GETBALANCESHEETREQUEST']._serialized_end=10828
-  _globals['_BALANCESHEET']._serialized_start=10831
-  _globals['_BALANCESHEET']._serialized_end=12869
-  _globals['_BALANCESHEETRESPONSE']._serialized_start=12872
-  _globals['_BALANCESHEETRESPONSE']._serialized_end=13146
-  _globals['_GETCASHFLOWREQUEST']._serialized_start=13148
-  _globals['_GETCASHFLOWREQUEST']._serialized_end=13192
-  _globals['_CASHFLOW']._serialized_start=13195
-  _globals['_CASHFLOW']._serialized_end=15158
-  _globals['_CASHFLOWRESPONSE']._serialized_start=15161
-  _globals['_CASHFLOWRESPONSE']._serialized_end=15423
-  _globals['_GETEARNINGSREQUEST']._serialized_start=15425
-  _globals['_GETEARNINGSREQUEST']._serialized_end=15469
-  _globals['_EARNINGSDATA']._serialized_start=15472
-  _globals['_EARNINGSDATA']._serialized_end=15751
-  _globals['_EARNINGSRESPONSE']._serialized_start=15754
-  _globals['_EARNINGSRESPONSE']._serialized_end=16028
-  _globals['_GETEARNINGSCALENDARREQUEST']._serialized_start=16030
-  _globals['_GETEARNINGSCALENDARREQUEST']._serialized_end=16141
-  _globals['_EARNINGSCALENDAREVENT']._serialized_start=16144
-  _globals['_EARNINGSCALENDAREVENT']._serialized_end=16392
-  _globals['_EARNINGSCALENDARRESPONSE']._serialized_start=16395
-  _globals['_EARNINGSCALENDARRESPONSE']._serialized_end=16593
-  _globals['_GETIPOCALENDARREQUEST']._serialized_start=16595
-  _globals['_GETIPOCALENDARREQUEST']._serialized_end=16618
-  _globals['_IPOEVENT']._serialized_start=16621
-  _globals['_IPOEVENT']._serialized_end=16840
-  _globals['_IPOCALENDARRESPONSE']._serialized_start=16843
-  _globals['_IPOCALENDARRESPONSE']._serialized_end=17023
-  _globals['_GETETFPROFILEREQUEST']._serialized_start=17025
-  _globals['_GETETFPROFILEREQUEST']._serialized_end=17071
-  _globals['_ETFPROFILE']._serialized_start=17074
-  _globals['_ETFPROFILE']._serialized_end=17557
-  _globals['_ETFPROFILERESPONSE']._serialized_start=17560
-  _globals['_ETFPROFILERESPONSE']._serialized_end=17721
-  _globals['_GETDIVIDENDSREQUEST']._serialized_start=17723
-  _globals['_GETDIVIDENDSREQUEST']._serialized_end=17768
-  _globals['_DIVIDENDDATA']._serialized_start=17771
-  _globals['_DIVIDENDDATA']._serialized_end=18031
-  _globals['_DIVIDENDSRESPONSE']._serialized_start=18034
-  _globals['_DIVIDENDSRESPONSE']._serialized_end=18246
-  _globals['_GETSPLITSREQUEST']._serialized_start=18248
-  _globals['_GETSPLITSREQUEST']._serialized_end=18290
-  _globals['_SPLITDATA']._serialized_start=18292
-  _globals['_SPLITDATA']._serialized_end=18368
-  _globals['_SPLITSRESPONSE']._serialized_start=18371
-  _globals['_SPLITSRESPONSE']._serialized_end=18571
-  _globals['_GETNEWSREQUEST']._serialized_start=18574
-  _globals['_GETNEWSREQUEST']._serialized_end=18834
-  _globals['_NEWSARTICLE']._serialized_start=18837
-  _globals['_NEWSARTICLE']._serialized_end=19365
-  _globals['_NEWSTICKER']._serialized_start=19367
-  _globals['_NEWSTICKER']._serialized_end=19442
-  _globals['_TICKERSENTIMENT']._serialized_start=19445
-  _globals['_TICKERSENTIMENT']._serialized_end=19635
-  _globals['_NEWSRESPONSE']._serialized_start=19638
-  _globals['_NEWSRESPONSE']._serialized_end=19942
-  _globals['_GETTOPGAINERSLOSERSREQUEST']._serialized_start=19944
-  _globals['_GETTOPGAINERSLOSERSREQUEST']._serialized_end=19972
-  _globals['_STOCKMOVER']._serialized_start=19975
-  _globals['_STOCKMOVER']._serialized_end=20139
-  _globals['_TOPGAINERSLOSERSRESPONSE']._serialized_start=20142
-  _globals['_TOPGAINERSLOSERSRESPONSE']._serialized_end=20482
-  _globals['_GETANALYSTRATINGSREQUEST']._serialized_start=20484
-  _globals['_GETANALYSTRATINGSREQUEST']._serialized_end=20534
-  _globals['_ANALYSTRATING']._serialized_start=20537
-  _globals['_ANALYSTRATING']._serialized_end=20688
-  _globals['_ANALYSTRATINGSRESPONSE']._serialized_start=20691
-  _globals['_ANALYSTRATINGSRESPONSE']._serialized_end=20905
-  _globals['_GETINSIDERTRANSACTIONSREQUEST']._serialized_start=20907
-  _globals['_GETINSIDERTRANSACTIONSREQUEST']._serialized_end=20962
-  _globals['_INSIDERTRANSACTION']._serialized_start=20965
-  _globals['_INSIDERTRANSACTION']._serialized_end=21245
-  _globals['_INSIDERTRANSACTIONSRESPONSE']._serialized_start=21248
-  _globals['_INSIDERTRANSACTIONSRESPONSE']._serialized_end=21482
-  _globals['_GETEARNINGSTRANSCRIPTREQUEST']._serialized_start=21485
-  _globals['_GETEARNINGSTRANSCRIPTREQUEST']._serialized_end=21616
-  _globals['_EARNINGSTRANSCRIPT']._serialized_start=21619
-  _globals['_EARNINGSTRANSCRIPT']._serialized_end=21761
-  _globals['_EARNINGSTRANSCRIPTRESPONSE']._serialized_start=21764
-  _globals['_EARNINGSTRANSCRIPTRESPONSE']._serialized_end=21935
-  _globals['_GETGDPREQUEST']._serialized_start=21937
-  _globals['_GETGDPREQUEST']._serialized_end=21998
-  _globals['_ECONOMICDATAPOINT']._serialized_start=22000
-  _globals['_ECONOMICDATAPOINT']._serialized_end=22061
-  _globals['_ECONOMICINDICATORRESPONSE']._serialized_start=22064
-  _globals['_ECONOMICINDICATORRESPONSE']._serialized_end=22323
-  _globals['_GETGDPPERCAPITAREQUEST']._serialized_start=22325
-  _globals['_GETGDPPERCAPITAREQUEST']._serialized_end=22349
-  _globals['_GETINFLATIONREQUEST']._serialized_start=22351
-  _globals['_GETINFLATIONREQUEST']._serialized_end=22372
-  _globals['_GETCPIREQUEST']._serialized_start=22374
-  _globals['_GETCPIREQUEST']._serialized_end=22435
-  _globals['_GETFEDERALFUNDSRATEREQUEST']._serialized_start=22437
-  _globals['_GETFEDERALFUNDSRATEREQUEST']._serialized_end=22511
-  _globals['_GETTREASURYYIELDREQUEST']._serialized_start=22513
-  _globals['_GETTREASURYYIELDREQUEST']._serialized_end=22630
-  _globals['_GETRETAILSALESREQUEST']._serialized_start=22632
-  _globals['_GETRETAILSALESREQUEST']._serialized_end=22655
-  _globals['_GETDURABLESREQUEST']._serialized_start=22657
-  _globals['_GETDURABLESREQUEST']._serialized_end=22677
-  _globals['_GETUNEMPLOYMENTREQUEST']._serialized_start=22679
-  _globals['_GETUNEMPLOYMENTREQUEST']._serialized_end=22703
-  _globals['_GETNONFARMPAYROLLREQUEST']._serialized_start=22705
-  _globals['_GETNONFARMPAYROLLREQUEST']._serialized_end=22731
-  _globals['_GETCOMMODITYREQUEST']._serialized_start=22733
-  _globals['_GETCOMMODITYREQUEST']._serialized_end=22830
-  _globals['_COMMODITYRESPONSE']._serialized_start=22833
-  _globals['_COMMODITYRESPONSE']._serialized_end=23084
-  _globals['_GETALLCOMMODITIESREQUEST']._serialized_start=23086
-  _globals['_GETALLCOMMODITIESREQUEST']._serialized_end=23158
-  _globals['_ALLCOMMODITIESRESPONSE']._serialized_start=23161
-  _globals['_ALLCOMMODITIESRESPONSE']._serialized_end=23481
-  _globals['_ALLCOMMODITIESRESPONSE_COMMODITIESENTRY']._serialized_start=23367
-  _globals['_ALLCOMMODITIESRESPONSE_COMMODITIESENTRY']._serialized_end=23461
-  _globals['_GETOPTIONSCHAINREQUEST']._serialized_start=23483
-  _globals['_GETOPTIONSCHAINREQUEST']._serialized_end=23565
-  _globals['_OPTIONCONTRACT']._serialized_start=23568
-  _globals['_OPTIONCONTRACT']._serialized_end=24322
-  _globals['_OPTIONSCHAINRESPONSE']._serialized_start=24325
-  _globals['_OPTIONSCHAINRESPONSE']._serialized_end=24542
-  _globals['_GETHISTORICALOPTIONSREQUEST']._serialized_start=24544
-  _globals['_GETHISTORICALOPTIONSREQUEST']._serialized_end=24631
-  _globals['_HISTORICALOPTIONSRESPONSE']._serialized_start=24634
-  _globals['_HISTORICALOPTIONSRESPONSE']._serialized_end=24876
-  _globals['_GETOPTIONCONTRACTREQUEST']._serialized_start=24878
-  _globals['_GETOPTIONCONTRACTREQUEST']._serialized_end=24937
-  _globals['_OPTIONCONTRACTRESPONSE']._serialized_start=24940
-  _globals['_OPTIONCONTRACTRESPONSE']._serialized_end=25111
-  _globals['_HEALTHCHECKREQUEST']._serialized_start=25113
-  _globals['_HEALTHCHECKREQUEST']._serialized_end=25133
-  _globals['_HEALTHCHECKRESPONSE']._serialized_start=25136
-  _globals['_HEALTHCHECKRESPONSE']._serialized_end=25453
-  _globals['_HEALTHCHECKRESPONSE_DATASOURCESENTRY']._serialized_start=25391
-  _globals['_HEALTHCHECKRESPONSE_DATASOURCESENTRY']._serialized_end=25453
-  _globals['_GETSERVICEINFOREQUEST']._serialized_start=25455
-  _globals['_GETSERVICEINFOREQUEST']._serialized_end=25478
-  _globals['_SERVICEINFO']._serialized_start=25481
-  _globals['_SERVICEINFO']._serialized_end=25800
-  _globals['_SERVICEINFO_FEATURESENTRY']._serialized_start=25741
-  _globals['_SERVICEINFO_FEATURESENTRY']._serialized_end=25800
-  _globals['_GETCACHESTATSREQUEST']._serialized_start=25802
-  _globals['_GETCACHESTATSREQUEST']._serialized_end=25824
-  _globals['_CACHESTATS']._serialized_start=25827
-  _globals['_CACHESTATS']._serialized_end=26147
-  _globals['_CACHESTATS_ENTRIESBYDOMAINENTRY']._serialized_start=26081
-  _globals['_CACHESTATS_ENTRIESBYDOMAINENTRY']._serialized_end=26147
-  _globals['_MARKETDATASERVICE']._serialized_start=26150
-  _globals['_MARKETDATASERVICE']._serialized_end=30898
+  _globals['_GETRESAMPLEDOHLCVREQUEST']._serialized_start=3614
+  _globals['_GETRESAMPLEDOHLCVREQUEST']._serialized_end=3972
+  _globals['_GETFOREXDAILYREQUEST']._serialized_start=3975
+  _globals['_GETFOREXDAILYREQUEST']._serialized_end=4207
+  _globals['_GETFOREXINTRADAYREQUEST']._serialized_start=4210
+  _globals['_GETFOREXINTRADAYREQUEST']._serialized_end=4491
+  _globals['_GETFOREXWEEKLYREQUEST']._serialized_start=4494
+  _globals['_GETFOREXWEEKLYREQUEST']._serialized_end=4675
+  _globals['_GETFOREXMONTHLYREQUEST']._serialized_start=4678
+  _globals['_GETFOREXMONTHLYREQUEST']._serialized_end=4860
+  _globals['_FOREXRESPONSE']._serialized_start=4863
+  _globals['_FOREXRESPONSE']._serialized_end=5123
+  _globals['_GETFOREXRATEREQUEST']._serialized_start=5125
+  _globals['_GETFOREXRATEREQUEST']._serialized_end=5216
+  _globals['_FOREXRATEDATA']._serialized_start=5219
+  _globals['_FOREXRATEDATA']._serialized_end=5573
+  _globals['_FOREXRATERESPONSE']._serialized_start=5576
+  _globals['_FOREXRATERESPONSE']._serialized_end=5733
+  _globals['_LISTFOREXPAIRSREQUEST']._serialized_start=5735
+  _globals['_LISTFOREXPAIRSREQUEST']._serialized_end=5758
+  _globals['_FOREXPAIR']._serialized_start=5760
+  _globals['_FOREXPAIR']._serialized_end=5853
+  _globals['_LISTFOREXPAIRSRESPONSE']._serialized_start=5855
+  _globals['_LISTFOREXPAIRSRESPONSE']._serialized_end=5947
+  _globals['_GETCRYPTODAILYREQUEST']._serialized_start=5950
+  _globals['_GETCRYPTODAILYREQUEST']._serialized_end=6117
+  _globals['_GETCRYPTOINTRADAYREQUEST']._serialized_start=6120
+  _globals['_GETCRYPTOINTRADAYREQUEST']._serialized_end=6388
+  _globals['_GETCRYPTOWEEKLYREQUEST']._serialized_start=6391
+  _globals['_GETCRYPTOWEEKLYREQUEST']._serialized_end=6559
+  _globals['_GETCRYPTOMONTHLYREQUEST']._serialized_start=6562
+  _globals['_GETCRYPTOMONTHLYREQUEST']._serialized_end=6731
+  _globals['_CRYPTORESPONSE']._serialized_start=6734
+  _globals['_CRYPTORESPONSE']._serialized_end=6981
+  _globals['_LISTCRYPTOSYMBOLSREQUEST']._serialized_start=6983
+  _globals['_LISTCRYPTOSYMBOLSREQUEST']._serialized_end=7009
+  _globals['_CRYPTOSYMBOL']._serialized_start=7011
+  _globals['_CRYPTOSYMBOL']._serialized_end=7069
+  _globals['_LISTCRYPTOSYMBOLSRESPONSE']._serialized_start=7071
+  _globals['_LISTCRYPTOSYMBOLSRESPONSE']._serialized_end=7173
+  _globals['_BATCHCRYPTOQUOTEREQUEST']._serialized_start=7175
+  _globals['_BATCHCRYPTOQUOTEREQUEST']._serialized_end=7250
+  _globals['_CRYPTOQUOTEDATA']._serialized_start=7253
+  _globals['_CRYPTOQUOTEDATA']._serialized_end=7438
+  _globals['_BATCHCRYPTOQUOTERESPONSE']._serialized_start=7440
+  _globals['_BATCHCRYPTOQUOTERESPONSE']._serialized_end=7542
+  _globals['_GETCOMPANYOVERVIEWREQUEST']._serialized_start=7544
+  _globals['_GETCOMPANYOVERVIEWREQUEST']._serialized_end=7595
+  _globals['_COMPANYOVERVIEW']._serialized_start=7598
+  _globals['_COMPANYOVERVIEW']._serialized_end=9334
+  _globals['_COMPANYOVERVIEWRESPONSE']._serialized_start=9337
+  _globals['_COMPANYOVERVIEWRESPONSE']._serialized_end=9510
+  _globals['_GETINCOMESTATEMENTREQUEST']._serialized_start=9512
+  _globals['_GETINCOMESTATEMENTREQUEST']._serialized_end=9563
+  _globals['_INCOMESTATEMENT']._serialized_start=9566
+  _globals['_INCOMESTATEMENT']._serialized_end=10853
+  _globals['_INCOMESTATEMENTRESPONSE']._serialized_start=10856
+  _globals['_INCOMESTATEMENTRESPONSE']._serialized_end=11139
+  _globals['_GETBALANCESHEETREQUEST']._serialized_start=11141
+  _globals['_GETBALANCESHEETREQUEST']._serialized_end=11189
+  _globals['_BALANCESHEET']._serialized_start=11192
+  _globals['_BALANCESHEET']._serialized_end=13230
+  _globals['_BALANCESHEETRESPONSE']._serialized_start=13233
+  _globals['_BALANCESHEETRESPONSE']._serialized_end=13507
+  _globals['_GETCASHFLOWREQUEST']._serialized_start=13509
+  _globals['_GETCASHFLOWREQUEST']._serialized_end=13553
+  _globals['_CASHFLOW']._serialized_start=13556
+  _globals['_CASHFLOW']._serialized_end=15519
+  _globals['_CASHFLOWRESPONSE']._serialized_start=15522
+  _globals['_CASHFLOWRESPONSE']._serialized_end=15784
+  _globals['_GETEARNINGSREQUEST']._serialized_start=15786
+  _globals['_GETEARNINGSREQUEST']._serialized_end=15830
+  _globals['_EARNINGSDATA']._serialized_start=15833
+  _globals['_EARNINGSDATA']._serialized_end=16112
+  _globals['_EARNINGSRESPONSE']._serialized_start=16115
+  _globals['_EARNINGSRESPONSE']._serialized_end=16389
+  _globals['_GETEARNINGSCALENDARREQUEST']._serialized_start=16391
+  _globals['_GETEARNINGSCALENDARREQUEST']._serialized_end=16502
+  _globals['_EARNINGSCALENDAREVENT']._serialized_start=16505
+  _globals['_EARNINGSCALENDAREVENT']._serialized_end=16753
+  _globals['_EARNINGSCALENDARRESPONSE']._serialized_start=16756
+  _globals['_EARNINGSCALENDARRESPONSE']._serialized_end=16954
+  _globals['_GETIPOCALENDARREQUEST']._serialized_start=16956
+  _globals['_GETIPOCALENDARREQUEST']._serialized_end=16979
+  _globals['_IPOEVENT']._serialized_start=16982
+  _globals['_IPOEVENT']._serialized_end=17201
+  _globals['_IPOCALENDARRESPONSE']._serialized_start=17204
+  _globals['_IPOCALENDARRESPONSE']._serialized_end=17384
+  _globals['_GETETFPROFILEREQUEST']._serialized_start=17386
+  _globals['_GETETFPROFILEREQUEST']._serialized_end=17432
+  _globals['_ETFPROFILE']._serialized_start=17435
+  _globals['_ETFPROFILE']._serialized_end=17918
+  _globals['_ETFPROFILERESPONSE']._serialized_start=17921
+  _globals['_ETFPROFILERESPONSE']._serialized_end=18082
+  _globals['_GETDIVIDENDSREQUEST']._serialized_start=18084
+  _globals['_GETDIVIDENDSREQUEST']._serialized_end=18129
+  _globals['_DIVIDENDDATA']._serialized_start=18132
+  _globals['_DIVIDENDDATA']._serialized_end=18392
+  _globals['_DIVIDENDSRESPONSE']._serialized_start=18395
+  _globals['_DIVIDENDSRESPONSE']._serialized_end=18607
+  _globals['_GETSPLITSREQUEST']._serialized_start=18609
+  _globals['_GETSPLITSREQUEST']._serialized_end=18651
+  _globals['_SPLITDATA']._serialized_start=18653
+  _globals['_SPLITDATA']._serialized_end=18729
+  _globals['_SPLITSRESPONSE']._serialized_start=18732
+  _globals['_SPLITSRESPONSE']._serialized_end=18932
+  _globals['_GETNEWSREQUEST']._serialized_start=18935
+  _globals['_GETNEWSREQUEST']._serialized_end=19195
+  _globals['_NEWSARTICLE']._serialized_start=19198
+  _globals['_NEWSARTICLE']._serialized_end=19726
+  _globals['_NEWSTICKER']._serialized_start=19728
+  _globals['_NEWSTICKER']._serialized_end=19803
+  _globals['_TICKERSENTIMENT']._serialized_start=19806
+  _globals['_TICKERSENTIMENT']._serialized_end=19996
+  _globals['_NEWSRESPONSE']._serialized_start=19999
+  _globals['_NEWSRESPONSE']._serialized_end=20303
+  _globals['_GETTOPGAINERSLOSERSREQUEST']._serialized_start=20305
+  _globals['_GETTOPGAINERSLOSERSREQUEST']._serialized_end=20333
+  _globals['_STOCKMOVER']._serialized_start=20336
+  _globals['_STOCKMOVER']._serialized_end=20500
+  _globals['_TOPGAINERSLOSERSRESPONSE']._serialized_start=20503
+  _globals['_TOPGAINERSLOSERSRESPONSE']._serialized_end=20843
+  _globals['_GETANALYSTRATINGSREQUEST']._serialized_start=20845
+  _globals['_GETANALYSTRATINGSREQUEST']._serialized_end=20895
+  _globals['_ANALYSTRATING']._serialized_start=20898
+  _globals['_ANALYSTRATING']._serialized_end=21049
+  _globals['_ANALYSTRATINGSRESPONSE']._serialized_start=21052
+  _globals['_ANALYSTRATINGSRESPONSE']._serialized_end=21266
+  _globals['_GETINSIDERTRANSACTIONSREQUEST']._serialized_start=21268
+  _globals['_GETINSIDERTRANSACTIONSREQUEST']._serialized_end=21323
+  _globals['_INSIDERTRANSACTION']._serialized_start=21326
+  _globals['_INSIDERTRANSACTION']._serialized_end=21606
+  _globals['_INSIDERTRANSACTIONSRESPONSE']._serialized_start=21609
+  _globals['_INSIDERTRANSACTIONSRESPONSE']._serialized_end=21843
+  _globals['_GETEARNINGSTRANSCRIPTREQUEST']._serialized_start=21846
+  _globals['_GETEARNINGSTRANSCRIPTREQUEST']._serialized_end=21977
+  _globals['_EARNINGSTRANSCRIPT']._serialized_start=21980
+  _globals['_EARNINGSTRANSCRIPT']._serialized_end=22122
+  _globals['_EARNINGSTRANSCRIPTRESPONSE']._serialized_start=22125
+  _globals['_EARNINGSTRANSCRIPTRESPONSE']._serialized_end=22296
+  _globals['_GETGDPREQUEST']._serialized_start=22298
+  _globals['_GETGDPREQUEST']._serialized_end=22359
+  _globals['_ECONOMICDATAPOINT']._serialized_start=22361
+  _globals['_ECONOMICDATAPOINT']._serialized_end=22422
+  _globals['_ECONOMICINDICATORRESPONSE']._serialized_start=22425
+  _globals['_ECONOMICINDICATORRESPONSE']._serialized_end=22684
+  _globals['_GETGDPPERCAPITAREQUEST']._serialized_start=22686
+  _globals['_GETGDPPERCAPITAREQUEST']._serialized_end=22710
+  _globals['_GETINFLATIONREQUEST']._serialized_start=22712
+  _globals['_GETINFLATIONREQUEST']._serialized_end=22733
+  _globals['_GETCPIREQUEST']._serialized_start=22735
+  _globals['_GETCPIREQUEST']._serialized_end=22796
+  _globals['_GETFEDERALFUNDSRATEREQUEST']._serialized_start=22798
+  _globals['_GETFEDERALFUNDSRATEREQUEST']._serialized_end=22872
+  _globals['_GETTREASURYYIELDREQUEST']._serialized_start=22874
+  _globals['_GETTREASURYYIELDREQUEST']._serialized_end=22991
+  _globals['_GETRETAILSALESREQUEST']._serialized_start=22993
+  _globals['_GETRETAILSALESREQUEST']._serialized_end=23016
+  _globals['_GETDURABLESREQUEST']._serialized_start=23018
+  _globals['_GETDURABLESREQUEST']._serialized_end=23038
+  _globals['_GETUNEMPLOYMENTREQUEST']._serialized_start=23040
+  _globals['_GETUNEMPLOYMENTREQUEST']._serialized_end=23064
+  _globals['_GETNONFARMPAYROLLREQUEST']._serialized_start=23066
+  _globals['_GETNONFARMPAYROLLREQUEST']._serialized_end=23092
+  _globals['_GETCOMMODITYREQUEST']._serialized_start=23094
+  _globals['_GETCOMMODITYREQUEST']._serialized_end=23191
+  _globals['_COMMODITYRESPONSE']._serialized_start=23194
+  _globals['_COMMODITYRESPONSE']._serialized_end=23445
+  _globals['_GETALLCOMMODITIESREQUEST']._serialized_start=23447
+  _globals['_GETALLCOMMODITIESREQUEST']._serialized_end=23519
+  _globals['_ALLCOMMODITIESRESPONSE']._serialized_start=23522
+  _globals['_ALLCOMMODITIESRESPONSE']._serialized_end=23842
+  _globals['_ALLCOMMODITIESRESPONSE_COMMODITIESENTRY']._serialized_start=23728
+  _globals['_ALLCOMMODITIESRESPONSE_COMMODITIESENTRY']._serialized_end=23822
+  _globals['_GETOPTIONSCHAINREQUEST']._serialized_start=23844
+  _globals['_GETOPTIONSCHAINREQUEST']._serialized_end=23926
+  _globals['_OPTIONCONTRACT']._serialized_start=23929
+  _globals['_OPTIONCONTRACT']._serialized_end=24683
+  _globals['_OPTIONSCHAINRESPONSE']._serialized_start=24686
+  _globals['_OPTIONSCHAINRESPONSE']._serialized_end=24903
+  _globals['_GETHISTORICALOPTIONSREQUEST']._serialized_start=24905
+  _globals['_GETHISTORICALOPTIONSREQUEST']._serialized_end=24992
+  _globals['_HISTORICALOPTIONSRESPONSE']._serialized_start=24995
+  _globals['_HISTORICALOPTIONSRESPONSE']._serialized_end=25237
+  _globals['_GETOPTIONCONTRACTREQUEST']._serialized_start=25239
+  _globals['_GETOPTIONCONTRACTREQUEST']._serialized_end=25298
+  _globals['_OPTIONCONTRACTRESPONSE']._serialized_start=25301
+  _globals['_OPTIONCONTRACTRESPONSE']._serialized_end=25472
+  _globals['_HEALTHCHECKREQUEST']._serialized_start=25474
+  _globals['_HEALTHCHECKREQUEST']._serialized_end=25494
+  _globals['_HEALTHCHECKRESPONSE']._serialized_start=25497
+  _globals['_HEALTHCHECKRESPONSE']._serialized_end=25814
+  _globals['_HEALTHCHECKRESPONSE_DATASOURCESENTRY']._serialized_start=25752
+  _globals['_HEALTHCHECKRESPONSE_DATASOURCESENTRY']._serialized_end=25814
+  _globals['_GETSERVICEINFOREQUEST']._serialized_start=25816
+  _globals['_GETSERVICEINFOREQUEST']._serialized_end=25839
+  _globals['_SERVICEINFO']._serialized_start=25842
+  _globals['_SERVICEINFO']._serialized_end=26161
+  _globals['_SERVICEINFO_FEATURESENTRY']._serialized_start=26102
+  _globals['_SERVICEINFO_FEATURESENTRY']._serialized_end=26161
+  _globals['_GETCACHESTATSREQUEST']._serialized_start=26163
+  _globals['_GETCACHESTATSREQUEST']._serialized_end=26185
+  _globals['_CACHESTATS']._serialized_start=26188
+  _globals['_CACHESTATS']._serialized_end=26508
+  _globals['_CACHESTATS_ENTRIESBYDOMAINENTRY']._serialized_start=26442
+  _globals['_CACHESTATS_ENTRIESBYDOMAINENTRY']._serialized_end=26508
+  _globals['_GETUPSTREAMSTATSREQUEST']._serialized_start=26510
+  _globals['_GETUPSTREAMSTATSREQUEST']._serialized_end=26581
+  _globals['_UPSTREAMPRIORITYSTATS']._serialized_start=26584
+  _globals['_UPSTREAMPRIORITYSTATS']._serialized_end=26840
+  _globals['_UPSTREAMPROVIDERSTATS']._serialized_start=26843
+  _globals['_UPSTREAMPROVIDERSTATS']._serialized_end=27150
+  _globals['_UPSTREAMSTATS']._serialized_start=27152
+  _globals['_UPSTREAMSTATS']._serialized_end=27233
+  _globals['_MARKETDATASERVICE']._serialized_start=27236
+  _globals['_MARKETDATASERVICE']._serialized_end=32158
 # @@protoc_insertion_point(module_scope)
@@ -2,7 +2,7 @@
 """Client and server classes corresponding to protobuf-defined services."""
 import grpc
 
-from protos.services.market_data.v1 import market_data_service_pb2 as protos_dot_services_dot_market__data_dot_v1_dot_market__data__service__pb2
+from mysingle_protos.protos.services.market_data.v1 import market_data_service_pb2 as protos_dot_services_dot_market__data_dot_v1_dot_market__data__service__pb2
 
 
 class MarketDataServiceStub(object):
@@ -33,6 +33,11 @@ class MarketDataServiceStub(object):
                 request_serializer=protos_dot_services_dot_market__data_dot_v1_dot_market__data__service__pb2.GetCacheStatsRequest.SerializeToString,
                 response_deserializer=protos_dot_services_dot_market__data_dot_v1_dot_market__data__service__pb2.CacheStats.FromString,
                 _registered_method=True)
+        self.GetUpstreamStats = channel.unary_unary(
+                '/market_data.MarketDataService/GetUpstreamStats',
+                request_serializer=protos_dot_services_dot_market__data_dot_v1_dot_market__data__service__pb2.GetUpstreamStatsRequest.SerializeToString,
+                response_deserializer=protos_dot_services_dot_market__data_dot_v1_dot_market__data__service__pb2.UpstreamStats.FromString,
+                _registered_method=True)
         self.GetDailyOHLCV = channel.unary_unary(
                 '/market_data.MarketDataService/GetDailyOHLCV',
                 request_serializer=protos_dot_services_dot_market__data_dot_v1_dot_market__data__service__pb2.GetDailyOHLCVRequest.SerializeToString,
@@ -73,6 +78,11 @@ class MarketDataServiceStub(object):
                 request_serializer=protos_dot_services_dot_market__data_dot_v1_dot_market__data__service__pb2.BatchGetQuoteRequest.SerializeToString,
                 response_deserializer=protos_dot_services_dot_market__data_dot_v1_dot_market__data__service__pb2.BatchGetQuoteResponse.FromString,
                 _registered_method=True)
+        self.GetResampledOHLCV = channel.unary_unary(
+                '/market_data.MarketDataService/GetResampledOHLCV',
+                request_serializer=protos_dot_services_dot_market__data_dot_v1_dot_market__data__service__pb2.GetResampledOHLCVRequest.SerializeToString,
+                response_deserializer=protos_dot_services_dot_market__data_dot_v1_dot_market__data__service__pb2.OHLCVResponse.FromString,
+                _registered_method=True)
         self.GetForexDaily = channel.unary_unary(
                 '/market_data.MarketDataService/GetForexDaily',
                 request_serializer=protos_dot_services_dot_market__data_dot_v1_dot_market__data__service__pb2.GetForexDailyRequest.SerializeToString,
@@ -314,6 +324,14 @@ class MarketDataServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetUpstreamStats(self, request, context):
+        """Upstream provider rate budget / queue statistics
+        GetUpstreamStats RPC.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def GetDailyOHLCV(self, request, context):
         """Stock Domain
         GetDailyOHLCV RPC.
@@ -372,6 +390,14 @@ class MarketDataServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetResampledOHLCV(self, request, context):
+        """Server-side resampling to custom intervals (cached per request)
+        GetResampledOHLCV RPC.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def GetForexDaily(self, request, context):
         """Forex Domain
         GetForexDaily RPC.
@@ -691,6 +717,11 @@ def add_MarketDataServiceServicer_to_server(servicer, server):
                     request_deserializer=protos_dot_services_dot_market__data_dot_v1_dot_market__data__service__pb2.GetCacheStatsRequest.FromString,
                     response_serializer=protos_dot_services_dot_market__data_dot_v1_dot_market__data__service__pb2.CacheStats.SerializeToString,
             ),
+            'GetUpstreamStats': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetUpstreamStats,
+                    request_deserializer=protos_dot_services_dot_market__data_dot_v1_dot_market__data__service__pb2.GetUpstreamStatsRequest.FromString,
+                    response_serializer=protos_dot_services_dot_market__data_dot_v1_dot_market__data__service__pb2.UpstreamStats.SerializeToString,
+            ),
             'GetDailyOHLCV': grpc.unary_unary_rpc_method_handler(
                     servicer.GetDailyOHLCV,
                     request_deserializer=protos_dot_services_dot_market__data_dot_v1_dot_market__data__service__pb2.GetDailyOHLCVRequest.FromString,
@@ -731,6 +762,11 @@ def add_MarketDataServiceServicer_to_server(servicer, server):
                     request_deserializer=protos_dot_services_dot_market__data_dot_v1_dot_market__data__service__pb2.BatchGetQuoteRequest.FromString,
                     response_serializer=protos_dot_services_dot_market__data_dot_v1_dot_market__data__service__pb2.BatchGetQuoteResponse.SerializeToString,
             ),
+            'GetResampledOHLCV': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetResampledOHLCV,
+                    request_deserializer=protos_dot_services_dot_market__data_dot_v1_dot_market__data__service__pb2.GetResampledOHLCVRequest.FromString,
+                    response_serializer=protos_dot_services_dot_market__data_dot_v1_dot_market__data__service__pb2.OHLCVResponse.SerializeToString,
+            ),
             'GetForexDaily': grpc.unary_unary_rpc_method_handler(
                     servicer.GetForexDaily,
                     request_deserializer=protos_dot_services_dot_market__data_dot_v1_dot_market__data__service__pb2.GetForexDailyRequest.FromString,
@@ -1037,6 +1073,33 @@ class MarketDataService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def GetUpstreamStats(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/market_data.MarketDataService/GetUpstreamStats',
+            protos_dot_services_dot_market__data_dot_v1_dot_market__data__service__pb2.GetUpstreamStatsRequest.SerializeToString,
+            protos_dot_services_dot_market__data_dot_v1_dot_market__data__service__pb2.UpstreamStats.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def GetDailyOHLCV(request,
             target,
@@ -1253,6 +1316,33 @@ class MarketDataService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def GetResampledOHLCV(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/market_data.MarketDataService/GetResampledOHLCV',
+            protos_dot_services_dot_market__data_dot_v1_dot_market__data__service__pb2.GetResampledOHLCVRequest.SerializeToString,
+            protos_dot_services_dot_market__data_dot_v1_dot_market__data__service__pb2.OHLCVResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def GetForexDaily(request,
             target,
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import pytest
+
+from mysingle_protos.market_data.archive import (
+    COMPRESSION_CODES,
+    ArchiveReader,
+    ArchiveWriter,
+)
+from mysingle_protos.protos.services.market_data.v1 import market_data_service_pb2 as md_pb2
+
+
+def snapshot(n_symbols: int = 40) -> list[md_pb2.SymbolOHLCVData]:
+    items = []
+    for i in range(n_symbols):
+        item = md_pb2.SymbolOHLCVData(symbol=f"SYM{i:03d}", cached=i % 2 == 0)
+        # 0 봉, 1 봉, 수백 봉 (varint 길이 1~3 바이트)
+        for day in range((i * 37) % 300 if i % 7 else i % 2):
+            item.bars.add(
+                timestamp=f"2024-01-{day % 28 + 1:02d}",
+                open=100.0 + i,
+                high=101.0 + i + day / 1000,
+                low=99.0 + i,
+                close=100.5 + i,
+                volume=1_000 * day + i,
+            )
+        item.count = len(item.bars)
+        items.append(item)
+    items.append(md_pb2.SymbolOHLCVData(symbol="삼성전자.KS", count=0))
+    return items
+
+
+@pytest.mark.parametrize("compression", sorted(COMPRESSION_CODES))
+@pytest.mark.parametrize("block_size", [1, 4096, 1 << 24])
+def test_round_trip(tmp_path, compression: str, block_size: int) -> None:
+    items = snapshot()
+    path = tmp_path / "snapshot.msa"
+    with ArchiveWriter(path, compression=compression, block_size=block_size) as writer:
+        for item in items:
+            writer.write(item)
+
+    with ArchiveReader(path, block_cache_size=2) as reader:
+        assert reader.compression == compression
+        assert len(reader) == len(items)
+        assert reader.symbols() == [item.symbol for item in items]
+        assert "SYM000" in reader and "NOPE" not in reader
+        for item in items:
+            assert reader.get(item.symbol) == item
+            assert reader.get_serialized(item.symbol) == item.SerializeToString()
+        # 블록 캐시 크기 제한
+        assert len(reader._blocks) <= 2
+        # 요청 순서 유지, 중복 요청 허용
+        wanted = ["SYM010", "삼성전자.KS", "SYM001", "SYM010"]
+        by_symbol = {item.symbol: item for item in items}
+        assert reader.read(wanted) == [by_symbol[s] for s in wanted]
+        assert list(reader) == items
+
+
+def test_write_serialized_and_empty_archive(tmp_path) -> None:
+    path = tmp_path / "empty.msa"
+    ArchiveWriter(path, compression="zlib").close()
+    with ArchiveReader(path) as reader:
+        assert len(reader) == 0 and list(reader) == [] and reader.read([]) == []
+
+    item = snapshot(3)[2]
+    path = tmp_path / "one.msa"
+    with ArchiveWriter(path) as writer:
+        writer.write_serialized(item.symbol, item.SerializeToString())
+    with ArchiveReader(path) as reader:
+        assert reader.get(item.symbol) == item
+        with pytest.raises(KeyError):
+            reader.get("SYM999")
+
+
+def test_writer_rejects_bad_input(tmp_path) -> None:
+    with pytest.raises(ValueError):
+        ArchiveWriter(tmp_path / "x.msa", compression="zstd")
+    writer = ArchiveWriter(tmp_path / "dup.msa")
+    writer.write(md_pb2.SymbolOHLCVData(symbol="AAPL"))
+    with pytest.raises(ValueError):
+        writer.write(md_pb2.SymbolOHLCVData(symbol="AAPL"))
+    writer.close()
+    # 두 번 닫아도 안전
+    writer.close()
+
+
+def test_reader_rejects_invalid_files(tmp_path) -> None:
+    path = tmp_path / "snapshot.msa"
+    with ArchiveWriter(path, compression="zlib") as writer:
+        for item in snapshot(5):
+            writer.write(item)
+    data = path.read_bytes()
+
+    cases = {
+        "magic.msa": b"NOTOHLCV" + data[8:],
+        "version.msa": data[:8] + b"\x09\x00" + data[10:],
+        "compression.msa": data[:10] + b"\x07\x00" + data[12:],
+        "footer.msa": data[:-1] + b"\x00",
+        "truncated.msa": data[: len(data) // 2],
+        "header-only.msa": data[:16],
+        "tiny.msa": data[:4],
+    }
+    for name, content in cases.items():
+        (tmp_path / name).write_bytes(content)
+        with pytest.raises(ValueError):
+            ArchiveReader(tmp_path / name)
+
+    # 예외로 끝난 작성은 footer 가 없어 읽을 수 없음
+    broken = tmp_path / "broken.msa"
+    with pytest.raises(RuntimeError):
+        with ArchiveWriter(broken) as writer:
+            writer.write(snapshot(1)[0])
+            raise RuntimeError("중단")
+    with pytest.raises(ValueError):
+        ArchiveReader(broken)
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import math
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+
+from mysingle_protos.backtest.arrow import (  # noqa: E402
+    EQUITY_SCHEMA,
+    TRADE_SCHEMA,
+    export_arrow,
+    iter_arrow_chunks,
+    message_schema,
+    read_arrow_chunks,
+    result_batches,
+)
+from mysingle_protos.backtest.columnar import to_columnar  # noqa: E402
+from mysingle_protos.protos.services.backtest.v1 import backtest_service_pb2 as bt_pb2  # noqa: E402
+
+TRADES = bt_pb2.RESULT_TABLE_TRADES
+EQUITY = bt_pb2.RESULT_TABLE_EQUITY_CURVE
+
+
+def row_result(n_trades: int = 5, n_points: int = 7):
+    result = bt_pb2.BacktestResultResponse(backtest_id="bt-1", status="completed")
+    for i in range(n_trades):
+        trade = result.trades.add(
+            symbol=("AAPL", "MSFT", "005930")[i % 3],
+            side="BUY" if i % 2 == 0 else "SELL",
+            quantity=10.0 + i,
+            price=100.0 + i / 3,
+            pnl=(-1) ** i * 2.5,
+            commission=1.0,
+            trade_id=f"t-{i}" if i % 4 else "",
+        )
+        trade.timestamp.FromNanoseconds(1_700_000_000_000_000_000 + i * 60_000_000_123)
+        if i % 3:
+            trade.portfolio_value = 1e5 + i
+    for i in range(n_points):
+        point = result.equity_curve.add(
+            equity=1e5 + i * 10.5, drawdown=-i / 7, cash=5e4 - i, positions_value=5e4 + i * 11.5
+        )
+        point.timestamp.FromNanoseconds(1_700_000_000_000_000_000 + i * 86_400_000_000_000)
+    return result
+
+
+def epoch_ns(table) -> list[int]:
+    return table.column("timestamp").cast(pa.int64()).to_pylist()
+
+
+def assert_tables_match_rows(result, tables) -> None:
+    # ns 타임스탬프는 datetime 변환 없이 int64 로 비교
+    trades = tables[TRADES].drop_columns(["timestamp"]).to_pylist()
+    assert epoch_ns(tables[TRADES]) == [row.timestamp.ToNanoseconds() for row in result.trades]
+    assert len(trades) == len(result.trades)
+    for got, row in zip(trades, result.trades):
+        assert (got["symbol"], got["side"]) == (row.symbol, row.side)
+        for name in ("quantity", "price", "pnl", "commission"):
+            assert got[name] == getattr(row, name)
+        # 빈 trade_id / 없는 portfolio_value 는 null
+        assert got["trade_id"] == (row.trade_id or None)
+        expected = row.portfolio_value if row.HasField("portfolio_value") else None
+        assert got["portfolio_value"] == expected
+
+    equity = tables[EQUITY].drop_columns(["timestamp"]).to_pylist()
+    assert epoch_ns(tables[EQUITY]) == [p.timestamp.ToNanoseconds() for p in result.equity_curve]
+    assert len(equity) == len(result.equity_curve)
+    for got, point in zip(equity, result.equity_curve):
+        for name in ("equity", "drawdown", "cash", "positions_value"):
+            assert got[name] == getattr(point, name)
+
+
+def test_schemas_follow_descriptors() -> None:
+    assert TRADE_SCHEMA.names == [f.name for f in bt_pb2.Trade.DESCRIPTOR.fields]
+    assert EQUITY_SCHEMA.names == [f.name for f in bt_pb2.EquityPoint.DESCRIPTOR.fields]
+    assert TRADE_SCHEMA.metadata[b"proto.message"] == bt_pb2.Trade.DESCRIPTOR.full_name.encode()
+    assert TRADE_SCHEMA.field("timestamp").type == pa.timestamp("ns", tz="UTC")
+    assert TRADE_SCHEMA.field("symbol").type == pa.dictionary(pa.int32(), pa.string())
+    assert TRADE_SCHEMA.field("side").type == pa.dictionary(pa.int32(), pa.string())
+    assert TRADE_SCHEMA.field("quantity").type == pa.float64()
+    for field in bt_pb2.Trade.DESCRIPTOR.fields:
+        arrow_field = TRADE_SCHEMA.field(field.name)
+        assert arrow_field.metadata[b"proto.number"] == str(field.number).encode()
+        assert arrow_field.nullable == field.has_presence
+    assert TRADE_SCHEMA.field("portfolio_value").nullable
+    assert not EQUITY_SCHEMA.field("equity").nullable
+
+    with pytest.raises(ValueError):
+        message_schema(bt_pb2.BacktestResultResponse.DESCRIPTOR)
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_round_trip_rows_and_columns(columnar: bool) -> None:
+    result = row_result()
+    source = to_columnar(result) if columnar else result
+    tables = read_arrow_chunks(iter_arrow_chunks(source))
+    assert set(tables) == {TRADES, EQUITY}
+    assert tables[TRADES].schema.equals(TRADE_SCHEMA)
+    assert tables[EQUITY].schema.equals(EQUITY_SCHEMA)
+    assert_tables_match_rows(result, tables)
+
+
+@pytest.mark.parametrize("rows", [1, 2, 3, 7, 100])
+def test_chunking_preserves_order(rows: int) -> None:
+    result = row_result(n_trades=10, n_points=7)
+    chunks = list(iter_arrow_chunks(result, tables=[EQUITY, TRADES], max_rows_per_batch=rows))
+    # 요청한 테이블 순서, 테이블마다 연속된 row_offset, 마지막 청크만 last
+    expected = [EQUITY] * math.ceil(7 / rows) + [TRADES] * math.ceil(10 / rows)
+    assert [c.table for c in chunks] == expected
+    for table, total in ((EQUITY, 7), (TRADES, 10)):
+        offsets = [(c.row_offset, c.num_rows) for c in chunks if c.table == table]
+        assert offsets[0][0] == 0 and sum(n for _, n in offsets) == total
+        assert all(a + n == b for (a, n), (b, _) in zip(offsets, offsets[1:]))
+        assert all(n <= rows for _, n in offsets)
+    assert [c.last for c in chunks] == [False] * (len(chunks) - 1) + [True]
+    assert_tables_match_rows(result, read_arrow_chunks(chunks))
+
+
+def test_single_table_and_empty_result() -> None:
+    chunks = list(iter_arrow_chunks(row_result(), tables=[TRADES]))
+    assert [c.table for c in chunks] == [TRADES]
+
+    # 빈 테이블도 스키마를 담은 청크 1 개
+    chunks = list(iter_arrow_chunks(bt_pb2.BacktestResultResponse(backtest_id="bt-0")))
+    assert [(c.table, c.num_rows) for c in chunks] == [(TRADES, 0), (EQUITY, 0)]
+    tables = read_arrow_chunks(chunks)
+    assert tables[TRADES].num_rows == 0 and tables[TRADES].schema.equals(TRADE_SCHEMA)
+    assert tables[EQUITY].num_rows == 0 and tables[EQUITY].schema.equals(EQUITY_SCHEMA)
+
+    trades, equity = result_batches(row_result(n_trades=0, n_points=3))
+    assert (trades.num_rows, equity.num_rows) == (0, 3)
+
+
+@pytest.mark.parametrize("compression", ["zstd", "LZ4", "none"])
+def test_compressed_streams(compression: str) -> None:
+    result = row_result(n_trades=50, n_points=50)
+    chunks = iter_arrow_chunks(result, max_rows_per_batch=16, compression=compression)
+    assert_tables_match_rows(result, read_arrow_chunks(chunks))
+
+
+def test_invalid_requests() -> None:
+    result = row_result()
+    with pytest.raises(ValueError):
+        list(iter_arrow_chunks(result, max_rows_per_batch=-1))
+    with pytest.raises(ValueError):
+        list(iter_arrow_chunks(result, compression="snappy"))
+    with pytest.raises(ValueError):
+        list(iter_arrow_chunks(result, tables=[bt_pb2.RESULT_TABLE_UNSPECIFIED]))
+
+    chunks = list(iter_arrow_chunks(result, tables=[TRADES], max_rows_per_batch=2))
+    with pytest.raises(ValueError):
+        read_arrow_chunks([chunks[0], chunks[2]])
+    # last 이후 청크는 읽지 않음
+    tables = read_arrow_chunks([*chunks, bt_pb2.ArrowRecordBatchChunk(ipc_stream=b"junk")])
+    assert tables[TRADES].num_rows == len(result.trades)
+
+
+def test_export_arrow_uses_stub() -> None:
+    result = row_result()
+    calls = []
+
+    class FakeStub:
+        def ExportBacktestResultArrow(self, request, timeout=None):  # noqa: N802
+            calls.append((request.backtest_id, timeout))
+            return iter_arrow_chunks(result, request.tables, request.max_rows_per_batch)
+
+    request = bt_pb2.ExportBacktestResultArrowRequest(backtest_id="bt-1", max_rows_per_batch=2)
+    tables = export_arrow(FakeStub(), request, timeout=3.0)
+    assert calls == [("bt-1", 3.0)]
+    assert_tables_match_rows(result, tables)
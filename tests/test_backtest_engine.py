@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import gc
+import time
+
+import grpc
+
+from mysingle_protos.backtest.engine import EngineConfig, serve_in_background
+from mysingle_protos.backtest.progress import follow_progress
+from mysingle_protos.market_data.synthetic import SyntheticConfig
+from mysingle_protos.protos.services.backtest.v1 import backtest_service_pb2 as bt_pb2
+from mysingle_protos.protos.services.backtest.v1 import backtest_service_pb2_grpc as bt_grpc
+
+CONFIG = bt_pb2.BacktestConfig(
+    symbol="AAPL", interval="1d", initial_capital=100_000.0, params={"fast": "5", "slow": "20"}
+)
+
+
+def test_failure_while_building_result_finishes_job_as_failed() -> None:
+    engine = EngineConfig(market_data=SyntheticConfig(history_bars=500))
+    with serve_in_background(engine) as server:
+
+        def broken_delete(backtest_id: str) -> None:
+            raise OSError("checkpoint store unavailable")
+
+        server.servicer.checkpoints.delete = broken_delete
+        with grpc.insecure_channel(server.address) as channel:
+            stub = bt_grpc.BacktestServiceStub(channel)
+            job = stub.ExecuteBacktest(
+                bt_pb2.ExecuteBacktestRequest(
+                    user_id="u1", strategy_id="sma_crossover", config=CONFIG
+                )
+            )
+            request = bt_pb2.GetBacktestResultRequest(backtest_id=job.backtest_id, user_id="u1")
+            deadline = time.monotonic() + 10
+            while (result := stub.GetBacktestResult(request)).status in ("queued", "running"):
+                assert time.monotonic() < deadline, "job never finished"
+                time.sleep(0.01)
+            progress = bt_pb2.StreamProgressRequest(backtest_id=job.backtest_id, user_id="u1")
+            updates = list(follow_progress(stub, progress))
+
+    assert updates[-1].status == "failed"
+    assert result.status == "failed"
+    assert "checkpoint store unavailable" in result.error_message
+
+
+def test_stop_with_running_job_shuts_down_cleanly(caplog, capfd) -> None:
+    engine = EngineConfig(
+        progress_interval_seconds=0.05, market_data=SyntheticConfig(history_bars=50_000)
+    )
+    server = serve_in_background(engine)
+    with grpc.insecure_channel(server.address) as channel:
+        stub = bt_grpc.BacktestServiceStub(channel)
+        job = stub.ExecuteBacktest(
+            bt_pb2.ExecuteBacktestRequest(user_id="u1", strategy_id="sma_crossover", config=CONFIG)
+        )
+        progress = bt_pb2.StreamProgressRequest(backtest_id=job.backtest_id, user_id="u1")
+        next(iter(stub.StreamBacktestProgress(progress)))
+        # 작업과 스트림이 살아 있는 상태에서 종료
+        server.stop()
+    gc.collect()
+    assert server.servicer.scheduler.busy == 0
+    assert "Task was destroyed" not in caplog.text + capfd.readouterr().err
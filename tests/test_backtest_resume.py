@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import grpc
+import pytest
+
+from mysingle_protos.backtest.engine import EngineConfig, serve_in_background
+from mysingle_protos.backtest.progress import follow_progress
+from mysingle_protos.market_data.synthetic import SyntheticConfig
+from mysingle_protos.protos.services.backtest.v1 import backtest_service_pb2 as bt_pb2
+from mysingle_protos.protos.services.backtest.v1 import backtest_service_pb2_grpc as bt_grpc
+
+CONFIG = bt_pb2.BacktestConfig(
+    symbol="AAPL",
+    interval="1d",
+    initial_capital=100_000.0,
+    commission_per_trade=1.0,
+    params={"fast": "10", "slow": "30"},
+)
+
+
+@pytest.fixture
+def stub():
+    engine = EngineConfig(
+        progress_updates=20,
+        progress_interval_seconds=0.02,
+        market_data=SyntheticConfig(history_bars=2000),
+    )
+    with serve_in_background(engine) as server:
+        with grpc.insecure_channel(server.address) as channel:
+            yield bt_grpc.BacktestServiceStub(channel)
+
+
+def wait_for_status(stub, backtest_id: str, status: str) -> None:
+    request = bt_pb2.GetBacktestResultRequest(backtest_id=backtest_id, user_id="u1")
+    deadline = time.monotonic() + 10
+    while stub.GetBacktestResult(request).status != status:
+        assert time.monotonic() < deadline, f"{backtest_id} did not reach {status}"
+        time.sleep(0.01)
+
+
+def test_resumed_backtest_replays_with_continuous_seq(stub) -> None:
+    job = stub.ExecuteBacktest(
+        bt_pb2.ExecuteBacktestRequest(user_id="u1", strategy_id="sma_crossover", config=CONFIG)
+    )
+    progress = bt_pb2.StreamProgressRequest(backtest_id=job.backtest_id, user_id="u1")
+    for update in follow_progress(stub, progress):
+        if update.progress_pct >= 20.0:
+            break
+    stub.CancelBacktest(bt_pb2.CancelBacktestRequest(backtest_id=job.backtest_id, user_id="u1"))
+    wait_for_status(stub, job.backtest_id, "cancelled")
+
+    resumed = stub.ResumeBacktest(
+        bt_pb2.ResumeBacktestRequest(backtest_id=job.backtest_id, user_id="u1")
+    )
+    wait_for_status(stub, job.backtest_id, "completed")
+
+    replay = list(follow_progress(stub, progress))
+    seqs = [update.seq for update in replay]
+    statuses = [update.status for update in replay]
+    assert statuses[-1] == "completed"
+    assert "cancelled" not in statuses
+    assert seqs == sorted(seqs)
+    assert seqs[-1] > resumed.last_seq
+
+    # 재개 직전 seq 부터 이어 받으면 재개 이후 이벤트만 받음
+    tail = list(
+        follow_progress(
+            stub,
+            bt_pb2.StreamProgressRequest(
+                backtest_id=job.backtest_id, user_id="u1", resume_after_seq=resumed.last_seq
+            ),
+        )
+    )
+    assert [u.seq for u in tail] == list(range(resumed.last_seq + 1, seqs[-1] + 1))
+    assert tail[-1].status == "completed"
+
+
+def shared_engine(directory: Path) -> EngineConfig:
+    return EngineConfig(
+        progress_updates=40,
+        progress_interval_seconds=0.05,
+        checkpoint_dir=str(directory),
+        checkpoint_interval_seconds=0.0,
+        checkpoint_lease_seconds=0.6,
+        market_data=SyntheticConfig(history_bars=2000),
+    )
+
+
+def wait_for_progress(stub, backtest_id: str, pct: float) -> None:
+    progress = bt_pb2.StreamProgressRequest(backtest_id=backtest_id, user_id="u1")
+    for update in follow_progress(stub, progress):
+        if update.progress_pct >= pct:
+            return
+    raise AssertionError(f"{backtest_id} finished before {pct}%")
+
+
+def resume(stub, backtest_id: str) -> bt_pb2.ResumeBacktestResponse:
+    return stub.ResumeBacktest(bt_pb2.ResumeBacktestRequest(backtest_id=backtest_id, user_id="u1"))
+
+
+def test_running_backtest_is_not_taken_over_by_another_worker(tmp_path: Path) -> None:
+    with (
+        serve_in_background(shared_engine(tmp_path)) as a,
+        serve_in_background(shared_engine(tmp_path)) as b,
+        grpc.insecure_channel(a.address) as channel_a,
+        grpc.insecure_channel(b.address) as channel_b,
+    ):
+        stub_a = bt_grpc.BacktestServiceStub(channel_a)
+        stub_b = bt_grpc.BacktestServiceStub(channel_b)
+        job = stub_a.ExecuteBacktest(
+            bt_pb2.ExecuteBacktestRequest(user_id="u1", strategy_id="sma_crossover", config=CONFIG)
+        )
+        wait_for_progress(stub_a, job.backtest_id, 10.0)
+        # 리스 길이보다 오래 실행 중이어도 A 가 갱신하므로 B 는 넘겨받지 못함
+        time.sleep(0.8)
+        with pytest.raises(grpc.RpcError) as raised:
+            resume(stub_b, job.backtest_id)
+        assert raised.value.code() == grpc.StatusCode.FAILED_PRECONDITION
+
+        # 취소하면 리스가 풀려 B 가 바로 재개
+        stub_a.CancelBacktest(
+            bt_pb2.CancelBacktestRequest(backtest_id=job.backtest_id, user_id="u1")
+        )
+        wait_for_status(stub_a, job.backtest_id, "cancelled")
+        assert resume(stub_b, job.backtest_id).resumed_from_bar > 0
+        wait_for_status(stub_b, job.backtest_id, "completed")
+        assert not list(tmp_path.glob("*.ckpt"))
+
+
+def test_backtest_of_stopped_worker_is_taken_over_after_lease_expires(tmp_path: Path) -> None:
+    a = serve_in_background(shared_engine(tmp_path))
+    with grpc.insecure_channel(a.address) as channel_a:
+        stub_a = bt_grpc.BacktestServiceStub(channel_a)
+        job = stub_a.ExecuteBacktest(
+            bt_pb2.ExecuteBacktestRequest(user_id="u1", strategy_id="sma_crossover", config=CONFIG)
+        )
+        wait_for_progress(stub_a, job.backtest_id, 10.0)
+        a.stop()
+
+    with serve_in_background(shared_engine(tmp_path)) as b:
+        with grpc.insecure_channel(b.address) as channel_b:
+            stub_b = bt_grpc.BacktestServiceStub(channel_b)
+            with pytest.raises(grpc.RpcError) as raised:
+                resume(stub_b, job.backtest_id)
+            assert raised.value.code() == grpc.StatusCode.FAILED_PRECONDITION
+            time.sleep(0.7)
+            assert resume(stub_b, job.backtest_id).resumed_from_bar > 0
+            wait_for_status(stub_b, job.backtest_id, "completed")
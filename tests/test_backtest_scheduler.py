@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from mysingle_protos.backtest.scheduler import BacktestScheduler, Lane
+
+
+def run(coro):
+    return asyncio.run(asyncio.wait_for(coro, timeout=10))
+
+
+class Jobs:
+    """시작 순서를 기록하고 release 전까지 끝나지 않는 작업"""
+
+    def __init__(self) -> None:
+        self.started: list[str] = []
+        self.gates: dict[str, asyncio.Event] = {}
+
+    def __call__(self, name: str):
+        self.gates[name] = asyncio.Event()
+
+        async def job() -> str:
+            self.started.append(name)
+            await self.gates[name].wait()
+            return name
+
+        return job
+
+    async def release(self, name: str) -> None:
+        self.gates[name].set()
+        await asyncio.sleep(0)
+
+
+def test_reserved_worker_is_kept_for_interactive() -> None:
+    async def main() -> None:
+        scheduler = BacktestScheduler(workers=2, reserved_interactive=1)
+        jobs = Jobs()
+        scheduler.submit("b1", "u1", jobs("b1"), Lane.BATCH)
+        scheduler.submit("b2", "u1", jobs("b2"), Lane.BATCH)
+        await asyncio.sleep(0)
+        assert jobs.started == ["b1"]
+        assert scheduler.position("b2") == 0
+
+        future = scheduler.submit("i1", "u1", jobs("i1"), Lane.INTERACTIVE)
+        await asyncio.sleep(0)
+        assert jobs.started == ["b1", "i1"]
+        await jobs.release("i1")
+        assert await future == "i1"
+        await scheduler.close()
+
+    run(main())
+
+
+def test_interactive_lane_and_priority_order() -> None:
+    async def main() -> None:
+        scheduler = BacktestScheduler(workers=1, reserved_interactive=0)
+        jobs = Jobs()
+        scheduler.submit("first", "u1", jobs("first"))
+        scheduler.submit("batch", "u1", jobs("batch"), Lane.BATCH, priority=9)
+        scheduler.submit("low", "u1", jobs("low"), priority=1)
+        scheduler.submit("high", "u1", jobs("high"), priority=9)
+        scheduler.submit("default", "u1", jobs("default"))
+        for name in ("first", "high", "default", "low", "batch"):
+            await asyncio.sleep(0)
+            assert jobs.started[-1] == name
+            await jobs.release(name)
+        await scheduler.close()
+
+    run(main())
+
+
+def test_user_with_fewest_running_jobs_goes_first() -> None:
+    async def main() -> None:
+        scheduler = BacktestScheduler(workers=2, reserved_interactive=0)
+        jobs = Jobs()
+        for name in ("a1", "a2", "a3", "a4"):
+            scheduler.submit(name, "alice", jobs(name))
+        scheduler.submit("b1", "bob", jobs("b1"))
+        await asyncio.sleep(0)
+        assert jobs.started == ["a1", "a2"]
+        # alice 가 먼저 예약했지만 실행 중인 작업이 없는 bob 이 비는 워커를 받음
+        await jobs.release("a1")
+        await asyncio.sleep(0)
+        assert jobs.started == ["a1", "a2", "b1"]
+        await jobs.release("b1")
+        await asyncio.sleep(0)
+        assert jobs.started == ["a1", "a2", "b1", "a3"]
+        await scheduler.close()
+
+    run(main())
+
+
+def test_close_cancels_queued_and_running_jobs() -> None:
+    async def main() -> None:
+        scheduler = BacktestScheduler(workers=1, reserved_interactive=0)
+        jobs = Jobs()
+        running = scheduler.submit("r", "u1", jobs("r"))
+        queued = scheduler.submit("q", "u1", jobs("q"))
+        await asyncio.sleep(0)
+        await scheduler.close()
+        assert queued.cancelled() and running.cancelled()
+        assert scheduler.busy == 0
+        assert jobs.started == ["r"]
+
+    run(main())
+
+
+def test_submit_rejects_duplicates_and_bad_priority() -> None:
+    async def main() -> None:
+        scheduler = BacktestScheduler(workers=1, reserved_interactive=0)
+        scheduler.submit("x", "u1", Jobs()("x"))
+        with pytest.raises(ValueError):
+            scheduler.submit("x", "u1", Jobs()("x"))
+        with pytest.raises(ValueError):
+            scheduler.submit("y", "u1", Jobs()("y"), priority=10)
+        await scheduler.close()
+
+    run(main())
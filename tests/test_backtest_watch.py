@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import asyncio
+
+import grpc
+
+from mysingle_protos.backtest.engine import EngineConfig, serve_in_background
+from mysingle_protos.backtest.watch import BacktestWatch, ProgressHub
+from mysingle_protos.market_data.synthetic import SyntheticConfig
+from mysingle_protos.protos.services.backtest.v1 import backtest_service_pb2 as bt_pb2
+from mysingle_protos.protos.services.backtest.v1 import backtest_service_pb2_grpc as bt_grpc
+
+
+async def one_shot(*requests: bt_pb2.WatchBacktestsRequest):
+    for request in requests:
+        yield request
+
+
+def run(coro):
+    return asyncio.run(asyncio.wait_for(coro, timeout=5))
+
+
+def test_half_closed_watch_streams_until_terminal() -> None:
+    async def main() -> list[bt_pb2.WatchBacktestsResponse]:
+        hub = ProgressHub()
+        hub.register("bt-1", "u1")
+        hub.publish("bt-1", bt_pb2.ProgressUpdate(status="running"))
+        request = bt_pb2.WatchBacktestsRequest(
+            user_id="u1", add_backtest_ids=["bt-1"], min_interval_ms=0
+        )
+        responses: list[bt_pb2.WatchBacktestsResponse] = []
+
+        async def consume() -> None:
+            async for response in BacktestWatch(hub).serve(one_shot(request)):
+                responses.append(response)
+
+        consumer = asyncio.ensure_future(consume())
+        await asyncio.sleep(0.01)
+        assert not consumer.done()
+        hub.publish("bt-1", bt_pb2.ProgressUpdate(status="running", progress_pct=50.0))
+        await asyncio.sleep(0.01)
+        hub.publish("bt-1", bt_pb2.ProgressUpdate(status="completed", progress_pct=100.0))
+        await consumer
+        return responses
+
+    responses = run(main())
+    assert list(responses[0].watching) == ["bt-1"]
+    statuses = [u.status for r in responses for u in r.updates]
+    assert statuses[-1] == "completed"
+    assert "running" in statuses
+
+
+def test_half_closed_watch_of_finished_backtest_ends_after_snapshot() -> None:
+    async def main() -> list[str]:
+        hub = ProgressHub()
+        hub.register("bt-1", "u1")
+        hub.publish("bt-1", bt_pb2.ProgressUpdate(status="failed"))
+        request = bt_pb2.WatchBacktestsRequest(user_id="u1", add_backtest_ids=["bt-1"])
+        return [
+            u.status async for r in BacktestWatch(hub).serve(one_shot(request)) for u in r.updates
+        ]
+
+    assert run(main()) == ["failed"]
+
+
+def test_one_shot_grpc_subscription_follows_backtest_to_completion() -> None:
+    engine = EngineConfig(
+        progress_updates=10,
+        progress_interval_seconds=0.02,
+        market_data=SyntheticConfig(history_bars=1000),
+    )
+    config = bt_pb2.BacktestConfig(
+        symbol="AAPL", interval="1d", initial_capital=100_000.0, params={"fast": "5", "slow": "20"}
+    )
+    with serve_in_background(engine) as server:
+        with grpc.insecure_channel(server.address) as channel:
+            stub = bt_grpc.BacktestServiceStub(channel)
+            job = stub.ExecuteBacktest(
+                bt_pb2.ExecuteBacktestRequest(
+                    user_id="u1", strategy_id="sma_crossover", config=config
+                )
+            )
+            request = bt_pb2.WatchBacktestsRequest(
+                user_id="u1", add_backtest_ids=[job.backtest_id], min_interval_ms=0
+            )
+            responses = list(stub.WatchBacktests(iter([request]), timeout=10))
+
+    updates = [u for r in responses for u in r.updates]
+    assert updates[-1].status == "completed"
+    assert updates[-1].progress_pct == 100.0
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from mysingle_protos.backtest.checkpoint import (
+    CheckpointStore,
+    held_by_other,
+    make_checkpoint,
+    release_lease,
+    stamp_lease,
+)
+from mysingle_protos.protos.services.backtest.v1 import backtest_service_pb2 as bt_pb2
+
+
+def checkpoint(backtest_id: str) -> bt_pb2.BacktestCheckpoint:
+    return make_checkpoint(
+        backtest_id,
+        "u1",
+        "sma_crossover",
+        bt_pb2.BacktestConfig(symbol="AAPL", initial_capital=100_000.0),
+        0,
+        None,
+        bars_done=10,
+        total_bars=100,
+    )
+
+
+@pytest.mark.parametrize("directory", [None, "disk"])
+def test_save_and_load_round_trip(tmp_path: Path, directory: str | None) -> None:
+    store = CheckpointStore(tmp_path / directory if directory else None)
+    store.save(checkpoint("bt-1"))
+
+    loaded = store.load("bt-1")
+    assert loaded is not None
+    assert loaded.bars_done == 10
+    assert store.load("bt-2") is None
+    assert (store.stats.loads, store.stats.misses) == (1, 1)
+
+
+@pytest.mark.parametrize("payload", [b"\xff\xff\xff", b"\x0a\x05ab"])
+def test_corrupted_checkpoint_loads_as_missing(tmp_path: Path, payload: bytes) -> None:
+    store = CheckpointStore(tmp_path)
+    store.save(checkpoint("bt-1"))
+    (path,) = tmp_path.glob("*.ckpt")
+    path.write_bytes(payload)
+
+    assert store.load("bt-1") is None
+    assert store.stats.misses == 1
+
+
+def test_lease_is_held_only_by_other_fresh_owner() -> None:
+    ckpt = stamp_lease(checkpoint("bt-1"), "worker-a", 30.0, now_ns=0)
+    assert held_by_other(ckpt, "worker-b", now_ns=10**9)
+    assert not held_by_other(ckpt, "worker-a", now_ns=10**9)
+    # 만료된 리스와 해제된 리스는 넘겨받을 수 있음
+    assert not held_by_other(ckpt, "worker-b", now_ns=31 * 10**9)
+    assert not held_by_other(release_lease(ckpt), "worker-b", now_ns=10**9)
+
+
+@pytest.mark.parametrize("directory", [None, "disk"])
+def test_prune_removes_old_checkpoints_without_lease(tmp_path: Path, directory: str | None) -> None:
+    store = CheckpointStore(tmp_path / directory if directory else None)
+    old, leased, recent = checkpoint("old"), checkpoint("leased"), checkpoint("recent")
+    for ckpt in (old, leased):
+        ckpt.created_at.FromSeconds(1_000)
+    store.save(old)
+    store.save(stamp_lease(leased, "worker-a", 60.0, now_ns=10_000 * 10**9))
+    store.save(recent)
+
+    now_ns = 10_030 * 10**9
+    assert store.prune(3600.0, now_ns=now_ns) == 1
+    assert store.load("old") is None
+    assert store.load("leased") is not None
+    assert store.load("recent") is not None
+    # 리스가 만료되면 삭제
+    assert store.prune(3600.0, now_ns=now_ns + 60 * 10**9) == 1
+    assert store.load("leased") is None
+    assert len(store) == 1
+
+
+def test_prune_removes_old_corrupted_files(tmp_path: Path) -> None:
+    store = CheckpointStore(tmp_path)
+    store.save(checkpoint("bt-1"))
+    (path,) = tmp_path.glob("*.ckpt")
+    path.write_bytes(b"\xff\xff")
+    os.utime(path, ns=(0, 0))
+
+    assert store.prune(3600.0) == 1
+    assert len(store) == 0
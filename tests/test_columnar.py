@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+
+from mysingle_protos.backtest.columnar import (
+    equity_columns,
+    equity_view,
+    result_views,
+    to_columnar,
+    trade_columns,
+    trade_view,
+)
+from mysingle_protos.backtest.stream import EQUITY_DTYPE, SIDE_CODES, TRADE_DTYPE
+from mysingle_protos.protos.services.backtest.v1 import backtest_service_pb2 as bt_pb2
+
+
+def row_result(n_trades: int = 5, n_points: int = 7, symbols=("AAPL", "MSFT")):
+    result = bt_pb2.BacktestResultResponse(backtest_id="bt-1", status="completed")
+    for i in range(n_trades):
+        trade = result.trades.add(
+            symbol=symbols[i % len(symbols)],
+            side="BUY" if i % 2 == 0 else "SELL",
+            quantity=10.0 + i,
+            price=100.0 + i / 3,
+            pnl=0.0 if i % 2 == 0 else (-1) ** i * 2.5,
+            commission=1.0,
+            trade_id=f"t-{i}",
+        )
+        trade.timestamp.FromNanoseconds(1_700_000_000_000_000_000 + i * 60_000_000_123)
+        if i % 3:
+            trade.portfolio_value = 1e5 + i
+    for i in range(n_points):
+        point = result.equity_curve.add(
+            equity=1e5 + i * 10.5, drawdown=-i / 7, cash=5e4 - i, positions_value=5e4 + i * 11.5
+        )
+        point.timestamp.FromNanoseconds(1_700_000_000_000_000_000 + i * 86_400_000_000_000)
+    return result
+
+
+def assert_views_match_rows(result, trades, equity) -> None:
+    assert len(trades) == len(result.trades)
+    for i, row in enumerate(result.trades):
+        assert trades.timestamp[i] == row.timestamp.ToNanoseconds()
+        assert trades.symbols[trades.symbol[i]] == row.symbol
+        assert trades.side[i] == bt_pb2.TradeSide.Value(f"TRADE_SIDE_{row.side}")
+        for name in ("quantity", "price", "pnl", "commission"):
+            assert getattr(trades, name)[i] == getattr(row, name)
+        if row.HasField("portfolio_value"):
+            assert trades.portfolio_value[i] == row.portfolio_value
+        else:
+            assert math.isnan(trades.portfolio_value[i])
+    assert trades.trade_id == [row.trade_id for row in result.trades]
+    assert list(trades.trade_symbols()) == [row.symbol for row in result.trades]
+
+    assert len(equity) == len(result.equity_curve)
+    for i, point in enumerate(result.equity_curve):
+        assert equity.timestamp[i] == point.timestamp.ToNanoseconds()
+        for name in ("equity", "drawdown", "cash", "positions_value"):
+            assert getattr(equity, name)[i] == getattr(point, name)
+
+
+def test_rows_round_trip_through_message_and_bytes() -> None:
+    result = row_result()
+    columnar = to_columnar(result)
+    assert not columnar.trades and not columnar.equity_curve
+    assert (columnar.backtest_id, columnar.status) == ("bt-1", "completed")
+
+    assert_views_match_rows(result, *result_views(columnar))
+    data = columnar.SerializeToString()
+    trades, equity = result_views(data)
+    assert_views_match_rows(result, trades, equity)
+    # 수신 바이트를 공유하는 읽기 전용 뷰
+    assert not equity.equity.flags.writeable and not equity.equity.flags.owndata
+    assert not trades.price.flags.owndata
+
+
+def test_empty_results() -> None:
+    columnar = to_columnar(bt_pb2.BacktestResultResponse(backtest_id="bt-1"))
+    assert result_views(columnar) == (None, None)
+    assert result_views(columnar.SerializeToString()) == (None, None)
+
+    trades = trade_view(trade_columns(np.empty(0, dtype=TRADE_DTYPE), []))
+    equity = equity_view(equity_columns(np.empty(0, dtype=EQUITY_DTYPE)))
+    assert len(trades) == len(equity) == 0
+    assert trades.trade_id == [] and trades.symbols == []
+    assert len(trades.to_records()) == len(equity.to_records()) == 0
+
+
+def test_trade_ids_are_all_or_nothing() -> None:
+    result = row_result(n_trades=3)
+    for trade in result.trades:
+        trade.ClearField("trade_id")
+    assert trade_view(to_columnar(result).trade_columns).trade_id == []
+
+    result.trades[1].trade_id = "only-one"
+    assert trade_view(to_columnar(result).trade_columns).trade_id == ["", "only-one", ""]
+
+
+def test_records_round_trip() -> None:
+    rng = np.random.default_rng(0)
+    trades = np.zeros(50, dtype=TRADE_DTYPE)
+    trades["timestamp"] = np.sort(rng.integers(0, 10**18, 50))
+    trades["symbol"] = rng.integers(0, 3, 50)
+    trades["side"] = rng.choice([SIDE_CODES["BUY"], SIDE_CODES["SELL"]], 50)
+    for name in ("quantity", "price", "pnl", "commission", "portfolio_value"):
+        trades[name] = rng.normal(size=50)
+    equity = np.zeros(50, dtype=EQUITY_DTYPE)
+    equity["timestamp"] = trades["timestamp"]
+    for name in ("equity", "drawdown", "cash", "positions_value"):
+        equity[name] = rng.normal(size=50)
+
+    view = trade_view(trade_columns(trades, ["A", "B", "C"]).SerializeToString())
+    np.testing.assert_array_equal(view.to_records(), trades)
+    # 다른 심볼 사전 코드로 재매핑
+    codes = {"C": 0}
+    remapped = view.to_records(codes)
+    assert codes == {"C": 0, "A": 1, "B": 2}
+    np.testing.assert_array_equal(remapped["symbol"], np.array([1, 2, 0])[trades["symbol"]])
+    np.testing.assert_array_equal(equity_view(equity_columns(equity)).to_records(), equity)
+
+
+def test_multi_byte_symbol_indexes() -> None:
+    symbols = [f"S{i:03d}" for i in range(300)]
+    result = row_result(n_trades=300, n_points=0, symbols=symbols)
+    trades, _ = result_views(to_columnar(result).SerializeToString())
+    assert list(trades.trade_symbols()) == symbols
+
+
+def test_split_and_unpacked_encodings() -> None:
+    def part(*values):
+        zeros = [0.0] * len(values)
+        return bt_pb2.EquityColumns(
+            timestamp_ns=[int(v) for v in values], equity=values,
+            drawdown=zeros, cash=zeros, positions_value=zeros,
+        ).SerializeToString()
+
+    # 같은 packed 필드가 두 번 나뉘어 와도 이어 붙임
+    view = equity_view(part(1.0, 2.0) + part(3.0))
+    np.testing.assert_array_equal(view.timestamp, [1, 2, 3])
+    np.testing.assert_array_equal(view.equity, [1.0, 2.0, 3.0])
+
+    # 비패킹 인코딩: 필드 2 (double) 를 값마다 fixed64 로 기록
+    unpacked = bt_pb2.EquityColumns(
+        timestamp_ns=[1, 2], drawdown=[0.0, 0.0], cash=[0.0, 0.0], positions_value=[0.0, 0.0]
+    ).SerializeToString()
+    for value in (1.5, 2.5):
+        unpacked += bytes([2 << 3 | 1]) + np.float64(value).tobytes()
+    view = equity_view(unpacked)
+    np.testing.assert_array_equal(view.equity, [1.5, 2.5])
+
+
+def test_invalid_bytes_raise_value_error() -> None:
+    data = equity_columns(np.zeros(4, dtype=EQUITY_DTYPE)).SerializeToString()
+    with pytest.raises(ValueError):
+        equity_view(data[:-3])
+    with pytest.raises(ValueError):
+        equity_view(bt_pb2.EquityColumns(timestamp_ns=[1, 2], equity=[1.0]))
+    bad_index = bt_pb2.TradeColumns(timestamp_ns=[1], symbol_index=[2], symbols=["A"])
+    with pytest.raises(ValueError):
+        trade_view(bad_index)
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from mysingle_protos.backtest.downsample import (
+    METHODS,
+    downsample_indices,
+    drawdown_extremes,
+    min_max_indices,
+)
+
+DAY_NS = 86_400 * 1_000_000_000
+
+
+def curve(n: int, seed: int) -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    equity = 100_000.0 * np.exp(np.cumsum(rng.normal(0.0, 0.01, n)))
+    return np.arange(n, dtype=np.int64) * DAY_NS, equity
+
+
+@pytest.mark.parametrize("method", METHODS)
+@pytest.mark.parametrize("max_points", [1, 2, 3, 5, 6, 7, 10, 11, 50, 999])
+def test_result_never_exceeds_max_points(method: str, max_points: int) -> None:
+    for seed in range(5):
+        timestamp, equity = curve(1000, seed)
+        index = downsample_indices(timestamp, equity, max_points, method)
+        assert 0 < len(index) <= max_points
+        assert np.all(np.diff(index) > 0)
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_anchors_are_kept_by_priority(method: str) -> None:
+    timestamp, equity = curve(1000, 7)
+    peak, trough = drawdown_extremes(equity)
+
+    assert set(downsample_indices(timestamp, equity, 2, method)) == {0, 999}
+    assert {0, 999, trough} <= set(downsample_indices(timestamp, equity, 3, method))
+    full = set(downsample_indices(timestamp, equity, 100, method))
+    assert {0, 999, peak, trough, int(np.argmax(equity)), int(np.argmin(equity))} <= full
+
+
+def test_no_downsampling_when_curve_fits() -> None:
+    timestamp, equity = curve(50, 0)
+    assert np.array_equal(downsample_indices(timestamp, equity, 50), np.arange(50))
+    assert np.array_equal(downsample_indices(timestamp, equity, None), np.arange(50))
+    assert np.array_equal(downsample_indices(timestamp, equity, 0), np.arange(50))
+
+
+@pytest.mark.parametrize("n_out", [0, 1, 2, 3, 4, 9, 10])
+def test_min_max_indices_respects_n_out(n_out: int) -> None:
+    _, equity = curve(500, 3)
+    assert len(min_max_indices(equity, n_out)) <= n_out
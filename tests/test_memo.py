@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import pytest
+
+from mysingle_protos.backtest.memo import (
+    BacktestMemo,
+    MemoStats,
+    canonical_config,
+    memo_key,
+    memoized_response,
+)
+from mysingle_protos.protos.services.backtest.v1 import backtest_service_pb2 as bt_pb2
+
+
+def make_config(params: dict[str, str] | None = None, **kwargs) -> bt_pb2.BacktestConfig:
+    config = bt_pb2.BacktestConfig(
+        symbol="AAPL",
+        interval="1d",
+        start_date="2024-01-01",
+        end_date="2024-06-30",
+        initial_capital=1e5,
+        **kwargs,
+    )
+    for name, value in (params or {}).items():
+        config.params[name] = value
+    return config
+
+
+def test_key_is_stable() -> None:
+    config = make_config({"fast": "5", "slow": "20"}, slippage_bps=2.0)
+    key = memo_key("u-1", config, "code-hash", "engine-1")
+    # 프로세스/버전이 바뀌어도 같은 입력은 같은 키 (저장된 키가 무효화되지 않도록 고정)
+    assert key == "99019f103907fcb100c732a8a90f2f75e8862d93a219048be88b31f70d52976a"
+    # map 삽입 순서와 무관
+    reordered = make_config({"slow": "20", "fast": "5"}, slippage_bps=2.0)
+    assert canonical_config(reordered) == canonical_config(config)
+    assert memo_key("u-1", reordered, "code-hash", "engine-1") == key
+    # 복사본/역직렬화된 설정도 같은 키
+    parsed = bt_pb2.BacktestConfig.FromString(config.SerializeToString())
+    assert memo_key("u-1", parsed, "code-hash", "engine-1") == key
+
+
+def test_key_changes_with_inputs() -> None:
+    config = make_config({"fast": "5"})
+    base = memo_key("u-1", config, "code-hash", "engine-1")
+    others = [
+        memo_key("u-2", config, "code-hash", "engine-1"),
+        memo_key("u-1", config, "other-hash", "engine-1"),
+        memo_key("u-1", config, "code-hash", "engine-2"),
+        memo_key("u-1", config, "code-hash"),
+        memo_key("u-1", make_config({"fast": "6"}), "code-hash", "engine-1"),
+        # optional 필드는 기본값을 명시해도 존재 여부가 키에 반영
+        memo_key("u-1", make_config({"fast": "5"}, stop_loss_pct=0.0), "code-hash", "engine-1"),
+    ]
+    assert len({base, *others}) == len(others) + 1
+    # 길이 접두로 경계가 구분되어 이어 붙인 문자열이 같아도 충돌하지 않음
+    assert memo_key("ab", config, "c") != memo_key("a", config, "bc")
+    assert memo_key("u", config, "h", "") != memo_key("u", config, "h", "\x00")
+    with pytest.raises(ValueError):
+        memo_key("u-1", config, "")
+
+
+def test_lookup_and_stats() -> None:
+    memo = BacktestMemo(max_entries=10)
+    assert memo.lookup("k1") is None
+    memo.record("k1", "bt-1")
+    assert memo.lookup("k1") == "bt-1"
+    memo.skip()
+    assert memo.stats == MemoStats(hits=1, misses=1, forced=1, stores=1, evictions=0)
+    assert memo.stats.hit_rate == 0.5
+    assert memo.stats.details()["memo_hit_rate"] == "0.5000"
+    assert MemoStats().hit_rate == 0.0
+
+    # 같은 키는 최신 backtest_id 로 교체, 이전 id 를 forget 해도 영향 없음
+    memo.record("k1", "bt-2")
+    memo.forget("bt-1")
+    assert memo.lookup("k1") == "bt-2" and len(memo) == 1
+    memo.forget("bt-2")
+    assert memo.lookup("k1") is None and len(memo) == 0
+    memo.forget("missing")
+
+    with pytest.raises(ValueError):
+        BacktestMemo(max_entries=0)
+
+
+def test_lru_eviction() -> None:
+    memo = BacktestMemo(max_entries=3)
+    for i in range(3):
+        memo.record(f"k{i}", f"bt-{i}")
+    # k0 을 최근 사용으로 만들면 가장 오래된 k1 이 밀려남
+    assert memo.lookup("k0") == "bt-0"
+    memo.record("k3", "bt-3")
+    assert memo.lookup("k1") is None
+    assert [memo.lookup(f"k{i}") for i in (0, 2, 3)] == ["bt-0", "bt-2", "bt-3"]
+    assert (len(memo), memo.stats.evictions) == (3, 1)
+
+    # 기존 키 재기록도 최근 사용으로 갱신되고 제거 건수는 늘지 않음
+    memo.record("k0", "bt-0b")
+    memo.record("k4", "bt-4")
+    assert memo.lookup("k2") is None and memo.lookup("k0") == "bt-0b"
+    assert memo.stats.evictions == 2
+    # 밀려난 항목의 역색인도 정리되어 forget 이 다른 키를 지우지 않음
+    memo.forget("bt-1")
+    memo.forget("bt-0")
+    assert len(memo) == 3
+
+
+def test_memoized_response() -> None:
+    response = memoized_response("bt-9", bt_pb2.BACKTEST_LANE_UNSPECIFIED)
+    assert (response.backtest_id, response.status, response.memoized) == (
+        "bt-9",
+        "completed",
+        True,
+    )
+    assert response.created_at.seconds > 0
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import math
+import statistics
+
+import numpy as np
+import pytest
+
+from mysingle_protos.backtest.metrics import (
+    NS_PER_HOUR,
+    NS_PER_YEAR,
+    apply_fee_rate,
+    compute_metrics,
+    holding_periods_ns,
+    rolling_metrics,
+)
+from mysingle_protos.backtest.stream import EQUITY_DTYPE, SIDE_CODES, TRADE_DTYPE
+
+BUY, SELL = SIDE_CODES["BUY"], SIDE_CODES["SELL"]
+
+
+def make_equity(values, step_ns: int) -> np.ndarray:
+    equity = np.zeros(len(values), dtype=EQUITY_DTYPE)
+    equity["timestamp"] = np.arange(len(values), dtype=np.int64) * step_ns
+    equity["equity"] = values
+    equity["cash"] = values
+    return equity
+
+
+def make_trades(rows) -> np.ndarray:
+    """(timestamp, symbol, side, quantity, price, pnl) 행"""
+    trades = np.zeros(len(rows), dtype=TRADE_DTYPE)
+    for i, (timestamp, symbol, side, quantity, price, pnl) in enumerate(rows):
+        trades[i] = (timestamp, symbol, side, quantity, price, pnl, 0.0, 0.0)
+    return trades
+
+
+def test_compute_metrics_on_known_curve() -> None:
+    # 4 바가 정확히 1년에 걸치므로 연환산 수익률 == 총수익률, 연간 주기 수 == 3
+    equity = make_equity([100.0, 110.0, 99.0, 121.0], NS_PER_YEAR // 3)
+    trades = make_trades(
+        [
+            (0, 0, BUY, 10, 10.0, 0.0),
+            (1, 0, SELL, 10, 12.0, 20.0),
+            (2, 0, BUY, 5, 10.0, 0.0),
+            (3, 0, SELL, 5, 9.0, -5.0),
+            (4, 0, BUY, 5, 10.0, 0.0),
+            (5, 0, SELL, 5, 11.0, 5.0),
+        ]
+    )
+    metrics = compute_metrics(equity, trades)
+
+    returns = [0.1, -0.1, 121.0 / 99.0 - 1.0]
+    std = statistics.stdev(returns)
+    assert metrics.total_return == pytest.approx(21.0)
+    assert metrics.annual_return == pytest.approx(21.0, rel=1e-6)
+    assert metrics.max_drawdown == pytest.approx(-10.0)
+    assert metrics.final_equity == 121.0
+    assert metrics.volatility == pytest.approx(std * math.sqrt(3))
+    assert metrics.sharpe_ratio == pytest.approx(statistics.mean(returns) / std * math.sqrt(3))
+    downside = math.sqrt(0.01 / 3)
+    assert metrics.sortino_ratio == pytest.approx(
+        statistics.mean(returns) / downside * math.sqrt(3)
+    )
+    assert metrics.total_trades == 3
+    assert (metrics.winning_trades, metrics.losing_trades) == (2, 1)
+    assert metrics.win_rate == pytest.approx(200.0 / 3)
+    assert metrics.profit_factor == pytest.approx(5.0)
+    assert metrics.average_win == pytest.approx(12.5)
+    assert metrics.largest_loss == pytest.approx(-5.0)
+    assert metrics.max_consecutive_wins == 1
+
+
+def test_short_span_with_large_gain_does_not_overflow() -> None:
+    # 1분봉 60 개에서 30% 수익: growth ** (1 / years) 는 OverflowError
+    values = np.linspace(100.0, 130.0, 60)
+    metrics = compute_metrics(make_equity(values, 60 * 10**9))
+    assert metrics.total_return == pytest.approx(30.0)
+    assert metrics.annual_return == math.inf
+
+
+def test_annual_return_for_half_year() -> None:
+    equity = make_equity([100.0, 110.0], NS_PER_YEAR // 2)
+    metrics = compute_metrics(equity)
+    assert metrics.annual_return == pytest.approx((1.1**2 - 1.0) * 100.0, rel=1e-6)
+
+
+def test_holding_periods_are_fifo_weighted_per_symbol() -> None:
+    h = NS_PER_HOUR
+    trades = make_trades(
+        [
+            (0, 0, BUY, 10, 1.0, 0.0),
+            (5 * h, 1, BUY, 4, 1.0, 0.0),
+            (10 * h, 0, BUY, 10, 1.0, 0.0),
+            (20 * h, 0, SELL, 15, 1.0, 0.0),
+            (25 * h, 1, SELL, 4, 1.0, 0.0),
+            (30 * h, 0, SELL, 5, 1.0, 0.0),
+            (40 * h, 0, SELL, 5, 1.0, 0.0),
+        ]
+    )
+    periods = holding_periods_ns(trades) / h
+    # 첫 매도: 첫 로트 10 주 20시간 + 둘째 로트 5 주 10시간
+    assert periods[0] == pytest.approx((10 * 20 + 5 * 10) / 15)
+    assert periods[1] == pytest.approx(20.0)
+    assert periods[2] == pytest.approx(20.0)
+    # 보유분이 없는 매도
+    assert math.isnan(periods[3])
+
+
+def test_apply_fee_rate_shifts_pnl_and_equity_after_each_trade() -> None:
+    equity = make_equity([1000.0, 1000.0, 1020.0, 1020.0], 10)
+    trades = make_trades([(10, 0, BUY, 10, 10.0, 0.0), (25, 0, SELL, 10, 12.0, 20.0)])
+    adjusted, shifted = apply_fee_rate(trades, equity, fee_rate=0.01)
+
+    np.testing.assert_allclose(adjusted["commission"], [1.0, 1.2])
+    np.testing.assert_allclose(adjusted["pnl"], [0.0, 18.8])
+    np.testing.assert_allclose(adjusted["portfolio_value"], [-1.0, -2.2])
+    np.testing.assert_allclose(shifted["equity"], [1000.0, 999.0, 1019.0, 1017.8])
+    np.testing.assert_allclose(shifted["cash"], shifted["equity"])
+    assert shifted["drawdown"][1] == pytest.approx(-0.1)
+    # 원본은 그대로
+    assert trades["commission"].sum() == 0.0
+
+
+@pytest.mark.parametrize(("window", "step"), [(2, 1), (10, 3), (50, 7)])
+def test_rolling_metrics_matches_window_loop(window: int, step: int) -> None:
+    rng = np.random.default_rng(window)
+    values = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.02, 300)))
+    equity = make_equity(values, 86_400 * 10**9)
+    rolling = rolling_metrics(equity, window, step, risk_free_rate=0.02, ppy=252.0)
+
+    ends = range(window - 1, len(values), step)
+    assert len(rolling) == len(ends)
+    for row, end in zip(rolling, ends):
+        part = equity[end - window + 1 : end + 1]
+        expected = compute_metrics(part, risk_free_rate=0.02, ppy=252.0)
+        assert row["timestamp"] == part["timestamp"][-1]
+        assert row["total_return"] == pytest.approx(expected.total_return)
+        assert row["max_drawdown"] == pytest.approx(expected.max_drawdown, abs=1e-12)
+        if window > 2:
+            assert row["volatility"] == pytest.approx(expected.volatility, rel=1e-6)
+            assert row["sharpe_ratio"] == pytest.approx(expected.sharpe_ratio, rel=1e-6)
+            assert row["sortino_ratio"] == pytest.approx(expected.sortino_ratio, rel=1e-6)
+
+
+def test_rolling_metrics_validates_arguments() -> None:
+    equity = make_equity([1.0, 2.0, 3.0], 1)
+    with pytest.raises(ValueError):
+        rolling_metrics(equity, 1)
+    with pytest.raises(ValueError):
+        rolling_metrics(equity, 2, step=0)
+    assert len(rolling_metrics(equity, 5)) == 0
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import grpc
+import numpy as np
+import pytest
+
+from mysingle_protos.backtest.engine import EngineConfig, serve_in_background
+from mysingle_protos.backtest.montecarlo import MAX_POINTS, monte_carlo
+from mysingle_protos.backtest.progress import follow_progress
+from mysingle_protos.market_data.synthetic import SyntheticConfig
+from mysingle_protos.protos.services.backtest.v1 import backtest_service_pb2 as bt_pb2
+from mysingle_protos.protos.services.backtest.v1 import backtest_service_pb2_grpc as bt_grpc
+
+SHUFFLE = bt_pb2.MONTE_CARLO_METHOD_TRADE_SHUFFLE
+PNL = np.array([10.0, -5.0, 20.0, -15.0, 5.0, 8.0, -3.0])
+
+
+def test_seed_makes_results_reproducible() -> None:
+    a = monte_carlo(PNL, bt_pb2.MONTE_CARLO_METHOD_BLOCK_BOOTSTRAP, 100.0, 500, seed=7)
+    b = monte_carlo(PNL, bt_pb2.MONTE_CARLO_METHOD_BLOCK_BOOTSTRAP, 100.0, 500, seed=7)
+    np.testing.assert_array_equal(a.bands, b.bands)
+    np.testing.assert_array_equal(a.max_drawdown, b.max_drawdown)
+
+
+def test_trade_shuffle_keeps_final_equity() -> None:
+    result = monte_carlo(PNL, SHUFFLE, 100.0, 200, seed=1)
+    np.testing.assert_allclose(result.final_equity, 100.0 + PNL.sum())
+    assert result.original_final_equity == pytest.approx(100.0 + PNL.sum())
+    assert result.probability_of_loss == 0.0
+
+
+@pytest.mark.parametrize("max_points", [1, MAX_POINTS + 1])
+def test_max_points_is_bounded(max_points: int) -> None:
+    with pytest.raises(ValueError):
+        monte_carlo(PNL, SHUFFLE, 100.0, 10, max_points=max_points)
+    result = monte_carlo(PNL, SHUFFLE, 100.0, 10, max_points=MAX_POINTS)
+    assert len(result.steps) == len(PNL) + 1
+
+
+def test_run_monte_carlo_rpc() -> None:
+    engine = EngineConfig(market_data=SyntheticConfig(history_bars=500))
+    config = bt_pb2.BacktestConfig(
+        symbol="AAPL", interval="1d", initial_capital=100_000.0, params={"fast": "5", "slow": "20"}
+    )
+    with serve_in_background(engine) as server:
+        with grpc.insecure_channel(server.address) as channel:
+            stub = bt_grpc.BacktestServiceStub(channel)
+            job = stub.ExecuteBacktest(
+                bt_pb2.ExecuteBacktestRequest(
+                    user_id="u1", strategy_id="sma_crossover", config=config
+                )
+            )
+            progress = bt_pb2.StreamProgressRequest(backtest_id=job.backtest_id, user_id="u1")
+            assert list(follow_progress(stub, progress))[-1].status == "completed"
+
+            request = bt_pb2.RunMonteCarloRequest(
+                user_id="u1", backtest_id=job.backtest_id, iterations=200, seed=3
+            )
+            first = stub.RunMonteCarlo(request)
+            assert first == stub.RunMonteCarlo(request)
+            request.max_points = MAX_POINTS + 1
+            with pytest.raises(grpc.RpcError) as raised:
+                stub.RunMonteCarlo(request)
+            assert raised.value.code() == grpc.StatusCode.INVALID_ARGUMENT
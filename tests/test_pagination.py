@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import base64
+
+import pytest
+
+from mysingle_protos.backtest import tradeindex
+from mysingle_protos.backtest.pagination import (
+    MAX_LIMIT,
+    PageCursor,
+    SummaryIndex,
+    decode_page_token,
+    encode_page_token,
+    iter_backtests,
+    sort_key,
+)
+from mysingle_protos.protos.services.backtest.v1 import backtest_service_pb2 as bt_pb2
+
+STRATEGIES = ("s-a", "s-b")
+STATUSES = ("completed", "failed", "cancelled")
+
+
+def summaries(n: int = 97) -> list[bt_pb2.BacktestSummary]:
+    rows = []
+    for i in range(n):
+        summary = bt_pb2.BacktestSummary(
+            backtest_id=f"bt-{(i * 37) % n:04d}",
+            strategy_id=STRATEGIES[i % 2],
+            status=STATUSES[i % 3],
+        )
+        # 같은 created_at 이 여러 개 (backtest_id 로 순서 결정)
+        summary.created_at.FromNanoseconds(1_700_000_000_000_000_000 + (i // 4) * 1_000)
+        summary.metrics.total_return = i
+        for j in range(5):
+            summary.equity_curve.add(equity=100.0 + j).timestamp.FromNanoseconds(j)
+        rows.append(summary)
+    return rows
+
+
+def expected(rows, request: bt_pb2.ListBacktestsRequest) -> list[str]:
+    """요청에 맞는 요약 ID (최신순, 동률은 backtest_id 내림차순)"""
+    kept = [
+        s
+        for s in rows
+        if (not request.HasField("strategy_id") or s.strategy_id == request.strategy_id)
+        and (not request.HasField("status") or s.status == request.status)
+    ]
+    return [s.backtest_id for s in sorted(kept, key=sort_key, reverse=True)]
+
+
+def collect(index: SummaryIndex, request: bt_pb2.ListBacktestsRequest) -> list[str]:
+    ids = []
+    for _ in range(len(index) + 1):
+        page = index.page(request)
+        assert len(page.backtests) <= request.limit
+        if not request.HasField("include_total_count"):
+            assert page.total_count == len(expected(index._rows, request))
+        ids += [s.backtest_id for s in page.backtests]
+        if not page.next_page_token:
+            return ids
+        request.page_token = page.next_page_token
+        request.include_total_count = False
+    raise AssertionError("페이지가 끝나지 않습니다")
+
+
+@pytest.mark.parametrize("limit", [1, 4, 7, 96, 97, 200])
+@pytest.mark.parametrize(
+    "filters",
+    [{}, {"strategy_id": "s-a"}, {"status": "failed"}, {"strategy_id": "s-b", "status": "x"}],
+)
+def test_pages_return_each_row_once_newest_first(limit: int, filters: dict) -> None:
+    rows = summaries()
+    index = SummaryIndex(rows)
+    request = bt_pb2.ListBacktestsRequest(user_id="u", limit=limit, **filters)
+    ids = collect(index, request)
+    assert ids == expected(rows, request)
+    assert len(ids) == len(set(ids))
+
+
+def test_export_matches_paging() -> None:
+    rows = summaries(1234)
+    index = SummaryIndex(rows)
+    request = bt_pb2.ListBacktestsRequest(user_id="u", status="completed", skip=3)
+    pages = list(index.export(request))
+    assert len(pages) == 1 or all(len(p.backtests) == 500 for p in pages[:-1])
+    ids = [s.backtest_id for page in pages for s in page.backtests]
+    # export 는 skip 을 무시
+    assert ids == expected(rows, request)
+    assert pages[0].total_count == len(ids)
+    assert all(not p.HasField("total_count") or p.total_count == 0 for p in pages[1:])
+
+
+def test_skip_and_limit() -> None:
+    rows = summaries()
+    index = SummaryIndex(rows)
+    request = bt_pb2.ListBacktestsRequest(user_id="u", skip=10, limit=5)
+    page = index.page(request)
+    assert [s.backtest_id for s in page.backtests] == expected(rows, request)[10:15]
+    assert len(index.page(bt_pb2.ListBacktestsRequest()).backtests) == 50
+
+    index = SummaryIndex(summaries(MAX_LIMIT + 5))
+    page = index.page(bt_pb2.ListBacktestsRequest(limit=MAX_LIMIT * 10))
+    assert len(page.backtests) == MAX_LIMIT and page.next_page_token
+    with pytest.raises(ValueError):
+        index.page(bt_pb2.ListBacktestsRequest(limit=0))
+
+
+def test_keyset_cursor_survives_changes_between_pages() -> None:
+    rows = summaries(40)
+    index = SummaryIndex(rows)
+    request = bt_pb2.ListBacktestsRequest(user_id="u", limit=10)
+    first = index.page(request)
+    seen = [s.backtest_id for s in first.backtests]
+    # 이미 본 항목 삭제 + 더 최신 항목 추가: 다음 페이지는 밀리거나 겹치지 않음
+    index.remove(seen[0])
+    newer = bt_pb2.BacktestSummary(backtest_id="bt-new")
+    newer.created_at.FromNanoseconds(2_000_000_000_000_000_000)
+    index.put(newer)
+    request.page_token = first.next_page_token
+    request.include_total_count = False
+    rest = collect(index, request)
+    assert seen + rest == expected(rows, request)
+    assert "bt-new" not in rest
+
+
+def test_projection() -> None:
+    index = SummaryIndex(summaries(3))
+    page = index.page(bt_pb2.ListBacktestsRequest(include_metrics=False, max_points=2))
+    assert all(not s.HasField("metrics") and len(s.equity_curve) == 2 for s in page.backtests)
+    page = index.page(bt_pb2.ListBacktestsRequest())
+    assert all(s.HasField("metrics") and not s.equity_curve for s in page.backtests)
+    # 원본은 바뀌지 않음
+    assert all(len(s.equity_curve) == 5 for s in index._rows)
+
+
+def test_token_rejects_other_filters_and_tampering() -> None:
+    index = SummaryIndex(summaries())
+    request = bt_pb2.ListBacktestsRequest(user_id="u", strategy_id="s-a", limit=5)
+    token = index.page(request).next_page_token
+    assert decode_page_token(token, request) == sort_key(index.page(request).backtests[-1])
+
+    for changed in (
+        bt_pb2.ListBacktestsRequest(user_id="u", strategy_id="s-b"),
+        bt_pb2.ListBacktestsRequest(user_id="u"),
+        bt_pb2.ListBacktestsRequest(user_id="v", strategy_id="s-a"),
+        bt_pb2.ListBacktestsRequest(user_id="u", strategy_id="s-a", status="failed"),
+    ):
+        changed.page_token = token
+        with pytest.raises(ValueError):
+            index.page(changed)
+
+    raw = bytearray(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+    bad_version = bytes([raw[0] + 1]) + bytes(raw[1:])
+    bad_fingerprint = bytes(raw[:9]) + bytes([raw[9] ^ 0xFF]) + bytes(raw[10:])
+    for bad in (
+        "not a token!",
+        token[:6],
+        base64.urlsafe_b64encode(bad_version).decode(),
+        base64.urlsafe_b64encode(bad_fingerprint).decode(),
+        base64.urlsafe_b64encode(b"\x01\xff\xfe").decode(),
+    ):
+        request.page_token = bad
+        with pytest.raises(ValueError):
+            index.page(request)
+
+    # QueryTrades 가 발급한 토큰
+    trade_request = bt_pb2.QueryTradesRequest(backtest_id="bt-0001", user_id="u")
+    request.page_token = tradeindex.encode_page_token(3, trade_request)
+    with pytest.raises(ValueError):
+        index.page(request)
+
+
+def test_token_round_trip() -> None:
+    request = bt_pb2.ListBacktestsRequest(user_id="u", status="completed")
+    cursor = sort_key(summaries(1)[0])
+    assert decode_page_token(encode_page_token(cursor, request), request) == cursor
+    # 비 ASCII backtest_id 와 0 이전 시각
+    cursor = PageCursor(-5, "백테스트-1")
+    assert decode_page_token(encode_page_token(cursor, request), request) == cursor
+
+
+class _Future:
+    def __init__(self, value) -> None:
+        self.value = value
+        self.cancelled = False
+
+    def result(self):
+        return self.value
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+
+class _Method:
+    def __init__(self, index: SummaryIndex) -> None:
+        self.index = index
+        self.requests: list[bt_pb2.ListBacktestsRequest] = []
+        self.futures: list[_Future] = []
+
+    def future(self, request, timeout=None) -> _Future:
+        self.requests.append(request)
+        self.futures.append(_Future(self.index.page(request)))
+        return self.futures[-1]
+
+
+class _Stub:
+    def __init__(self, index: SummaryIndex) -> None:
+        self.ListBacktests = _Method(index)
+
+
+def test_iter_backtests_prefetches_and_cancels() -> None:
+    rows = summaries()
+    stub = _Stub(SummaryIndex(rows))
+    request = bt_pb2.ListBacktestsRequest(user_id="u", limit=10, skip=2)
+    ids = [s.backtest_id for s in iter_backtests(stub, request)]
+    assert ids == expected(rows, request)[2:]
+    assert all(not r.HasField("skip") for r in stub.ListBacktests.requests[1:])
+
+    stub = _Stub(SummaryIndex(rows))
+    backtests = iter_backtests(stub, bt_pb2.ListBacktestsRequest(user_id="u", limit=10))
+    next(backtests)
+    # 첫 페이지 처리 중 다음 페이지가 이미 요청됨, 중단하면 취소
+    assert len(stub.ListBacktests.futures) == 2
+    backtests.close()
+    assert stub.ListBacktests.futures[-1].cancelled
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from mysingle_protos.backtest.portfolio import (
+    align_closes,
+    run_portfolio,
+    simulate_portfolio,
+    target_weights,
+)
+from mysingle_protos.backtest.stream import SIDE_CODES
+from mysingle_protos.protos.services.backtest.v1 import backtest_service_pb2 as bt_pb2
+
+DAY_NS = 86_400 * 1_000_000_000
+
+
+def random_closes(n_bars: int, n_assets: int, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    returns = rng.normal(0.0, 0.03, (n_bars, n_assets))
+    return 100.0 * np.exp(np.cumsum(returns, axis=0))
+
+
+def config(symbols, **kwargs) -> bt_pb2.BacktestConfig:
+    return bt_pb2.BacktestConfig(
+        assets=[bt_pb2.PortfolioAsset(symbol=s) for s in symbols],
+        initial_capital=100_000.0,
+        **kwargs,
+    )
+
+
+def trade_bars(result) -> list[int]:
+    timestamps = result.equity["timestamp"]
+    return sorted(set(np.searchsorted(timestamps, result.trades["timestamp"]).tolist()))
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize(
+    "options",
+    [
+        {},
+        {"rebalance_interval_bars": 7},
+        {"rebalance_threshold": 0.02},
+        {"allocation": bt_pb2.ALLOCATION_METHOD_INVERSE_VOLATILITY, "rebalance_interval_bars": 3},
+    ],
+)
+def test_asset_pnl_adds_up_and_cash_stays_non_negative(seed: int, options: dict) -> None:
+    close = random_closes(200, 4, seed)
+    # 늦게 상장한 자산
+    close[:40, 3] = np.nan
+    timestamp = np.arange(200, dtype=np.int64) * DAY_NS
+    cfg = config("ABCD", commission_per_trade=25.0, slippage_bps=30.0, **options)
+    result = run_portfolio(cfg, timestamp, close)
+    equity = result.equity
+
+    assert (equity["cash"] >= 0).all()
+    np.testing.assert_allclose(equity["equity"], equity["cash"] + equity["positions_value"])
+    # 자산별 누적 손익 합 == 포트폴리오 손익
+    np.testing.assert_allclose(
+        result.pnl.sum(axis=1), equity["equity"] - cfg.initial_capital, atol=1e-6
+    )
+    assets = result.asset_results()
+    assert sum(a.pnl for a in assets) == pytest.approx(result.metrics().final_equity - 1e5)
+    assert sum(a.contribution for a in assets) == pytest.approx(
+        result.metrics().total_return, abs=1e-9
+    )
+    assert sum(a.trade_count for a in assets) == len(result.trades)
+    assert sum(a.total_fees for a in assets) == pytest.approx(25.0 * len(result.trades))
+    # 체결 직후 평가액은 그 바의 포트폴리오 자산과 같음
+    bars = np.searchsorted(equity["timestamp"], result.trades["timestamp"])
+    np.testing.assert_allclose(result.trades["portfolio_value"], equity["equity"][bars])
+
+
+def test_fees_never_overdraw_cash() -> None:
+    close = random_closes(60, 3, 7)
+    weights = np.full(close.shape, 1.0 / 3)
+    timestamp = np.arange(60, dtype=np.int64)
+    for commission, slippage in ((0.0, 500.0), (300.0, 100.0), (2_000.0, 0.0)):
+        result = simulate_portfolio(
+            timestamp,
+            close,
+            weights,
+            list("ABC"),
+            10_000.0,
+            commission_per_trade=commission,
+            slippage_bps=slippage,
+            rebalance_interval_bars=1,
+        )
+        assert (result.equity["cash"] >= -1e-9).all(), (commission, slippage)
+        assert (result.positions >= 0).all()
+
+
+def test_interval_rebalancing_trades_only_on_schedule() -> None:
+    close = random_closes(50, 2, 1)
+    timestamp = np.arange(50, dtype=np.int64) * DAY_NS
+    for interval, expected in ((0, [0]), (10, [0, 10, 20, 30, 40]), (1, list(range(50)))):
+        result = run_portfolio(config("AB", rebalance_interval_bars=interval), timestamp, close)
+        assert trade_bars(result) == expected
+        # 리밸런싱 바의 가중치는 목표 (슬리피지/수수료 없음)
+        weights = result.values[expected] / result.equity["equity"][expected, None]
+        np.testing.assert_allclose(weights, 0.5)
+
+
+def test_threshold_rebalancing_fires_on_first_drift() -> None:
+    close = random_closes(300, 3, 2)
+    timestamp = np.arange(300, dtype=np.int64) * DAY_NS
+    result = run_portfolio(config("ABC", rebalance_threshold=0.05), timestamp, close)
+    bars = trade_bars(result)
+    assert bars[0] == 0 and len(bars) > 2
+
+    # 리밸런싱 사이 바는 직전 보유량 기준 이탈이 threshold 이하, 리밸런싱 바는 초과
+    for start, stop in zip(bars, bars[1:] + [300]):
+        held = result.positions[start]
+        values = close[start + 1 : stop + 1] * held
+        drift = np.abs(values / values.sum(axis=1, keepdims=True) - 1.0 / 3).max(axis=1)
+        assert (drift[: stop - start - 1] <= 0.05).all()
+        if stop < 300:
+            assert drift[-1] > 0.05
+            assert (result.positions[start:stop] == held).all()
+
+
+def test_late_listing() -> None:
+    timestamp = np.arange(30, dtype=np.int64) * DAY_NS
+    listed = 12
+    a = np.linspace(100.0, 130.0, 30)
+    b = np.linspace(50.0, 40.0, 30 - listed)
+    timestamp, close = align_closes({"A": (timestamp, a), "B": (timestamp[listed:], b)})
+    assert np.isnan(close[:listed, 1]).all() and np.isfinite(close[listed:]).all()
+
+    weights = target_weights(config("AB"), close)
+    np.testing.assert_allclose(weights[:listed], [[1.0, 0.0]] * listed)
+    np.testing.assert_allclose(weights[listed:], 0.5)
+
+    # 상장 전에는 보유/평가액이 0, 상장 후 첫 리밸런싱에서 매수
+    for options, first_buy in (
+        ({"rebalance_interval_bars": 5}, 15),
+        ({"rebalance_threshold": 0.1}, listed),
+        ({}, None),
+    ):
+        result = run_portfolio(config("AB", **options), timestamp, close)
+        assert (result.values[:listed, 1] == 0).all()
+        buys = result.trades[(result.trades["symbol"] == 1)]
+        if first_buy is None:
+            assert len(buys) == 0
+            continue
+        assert buys[0]["side"] == SIDE_CODES["BUY"]
+        assert buys[0]["timestamp"] == timestamp[first_buy]
+        assert result.positions[first_buy - 1, 1] == 0 < result.positions[first_buy, 1]
+        # sleeve 기준 금액은 첫 목표 배분액
+        assert result.allocations[1] == pytest.approx(0.5 * 100_000.0)
+
+
+def test_fixed_weights_leave_cash_and_respect_caps() -> None:
+    close = random_closes(20, 2, 3)
+    timestamp = np.arange(20, dtype=np.int64) * DAY_NS
+    cfg = bt_pb2.BacktestConfig(
+        assets=[
+            bt_pb2.PortfolioAsset(symbol="A", weight=0.5, max_weight=0.3),
+            bt_pb2.PortfolioAsset(symbol="B", weight=0.2),
+        ],
+        initial_capital=1_000.0,
+    )
+    result = run_portfolio(cfg, timestamp, close)
+    assert result.values[0] / result.equity["equity"][0] == pytest.approx([0.3, 0.2])
+    assert result.equity["cash"][0] == pytest.approx(500.0)
+
+    cfg.assets[1].weight = 0.8
+    with pytest.raises(ValueError):
+        target_weights(cfg, close)
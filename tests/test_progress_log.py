@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import asyncio
+
+from mysingle_protos.backtest.progress import ProgressLog
+from mysingle_protos.protos.services.backtest.v1 import backtest_service_pb2 as bt_pb2
+
+
+def update(status: str, pct: float = 0.0) -> bt_pb2.ProgressUpdate:
+    return bt_pb2.ProgressUpdate(status=status, progress_pct=pct)
+
+
+async def collect(log: ProgressLog, resume_after_seq: int = 0) -> list[tuple[int, str]]:
+    return [(u.seq, u.status) async for u in log.follow(resume_after_seq)]
+
+
+def run(coro):
+    return asyncio.run(asyncio.wait_for(coro, timeout=5))
+
+
+def test_replay_stops_at_terminal_update() -> None:
+    async def main() -> list[tuple[int, str]]:
+        log = ProgressLog("bt")
+        log.publish(update("running"))
+        log.publish(update("running", 50.0))
+        log.publish(update("completed", 100.0))
+        return await collect(log)
+
+    assert run(main()) == [(1, "running"), (2, "running"), (3, "completed")]
+
+
+def test_replay_skips_terminal_update_replaced_by_resume() -> None:
+    async def main() -> tuple[list, list]:
+        log = ProgressLog("bt")
+        log.publish(update("running"))
+        log.publish(update("cancelled"))
+        log.reopen()
+        log.publish(update("running", 10.0))
+        log.publish(update("completed", 100.0))
+        return await collect(log), await collect(log, resume_after_seq=1)
+
+    replay, resumed = run(main())
+    assert replay == [(1, "running"), (3, "running"), (4, "completed")]
+    assert resumed == [(3, "running"), (4, "completed")]
+
+
+def test_follower_waits_through_reopened_log() -> None:
+    async def main() -> list[tuple[int, str]]:
+        log = ProgressLog("bt")
+        log.publish(update("running"))
+        log.publish(update("failed"))
+        log.reopen()
+        follower = asyncio.ensure_future(collect(log))
+        await asyncio.sleep(0.01)
+        assert not follower.done()
+        log.publish(update("running", 50.0))
+        log.publish(update("completed", 100.0))
+        return await follower
+
+    assert run(main()) == [(1, "running"), (3, "running"), (4, "completed")]
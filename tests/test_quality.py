@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from mysingle_protos.market_data.quality import (
+    ALWAYS_OPEN_CALENDAR,
+    TradingCalendar,
+    scan,
+    scan_arrays,
+)
+from mysingle_protos.market_data.resample import Interval
+from mysingle_protos.protos.services.market_data.v1 import market_data_service_pb2 as md_pb2
+
+
+def business_days(count: int, start: str = "2024-01-01") -> np.ndarray:
+    days = np.busday_offset(np.datetime64(start), np.arange(count), roll="forward")
+    return days.astype("datetime64[s]")
+
+
+def random_walk(count: int, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.01, count)))
+
+
+def scan_closes(closes: list[np.ndarray], interval: str = "1d", **kwargs):
+    lengths = np.array([len(c) for c in closes], dtype=np.int64)
+    close = np.concatenate(closes)
+    timestamp = np.concatenate([business_days(len(c)) for c in closes])
+    symbols = [f"S{i}" for i in range(len(closes))]
+    high, low = close * 1.01, close * 0.99
+    return scan_arrays(
+        symbols, lengths, timestamp, high, low, close, Interval.parse(interval), **kwargs
+    )
+
+
+@pytest.mark.parametrize("length", [8, 16, 27, 250])
+def test_spike_in_short_history_is_detected(length: int) -> None:
+    # 평균/표준편차 z-score 로는 28 개 미만 수익률에서 z=5 에 도달할 수 없음
+    close = random_walk(length, seed=length)
+    close[length // 2 :] *= 1.5
+    report = scan_closes([close])
+    np.testing.assert_array_equal(report.positions("S0", "spikes"), [length // 2])
+
+
+def test_several_spikes_do_not_mask_each_other() -> None:
+    close = random_walk(120, seed=1)
+    for start in (20, 50, 80, 81):
+        close[start:] *= 1.3 if start % 2 else 0.7
+    report = scan_closes([close, random_walk(300, seed=2)])
+    np.testing.assert_array_equal(report.positions("S0", "spikes"), [20, 50, 80, 81])
+    assert report["S1"].spikes == 0
+
+
+def test_random_walks_have_no_spikes() -> None:
+    report = scan_closes([random_walk(n, seed=n) for n in (4, 30, 500, 2000)])
+    assert report.counts["spikes"].sum() == 0
+    assert report.ok and report.flagged() == []
+
+
+def test_flat_prices_use_standard_deviation_fallback() -> None:
+    # 수익률 대부분이 0 이면 MAD 가 0
+    close = np.full(200, 50.0)
+    close[100:] = 52.0
+    close[150:] = 51.0
+    report = scan_closes([close, np.full(30, 10.0)])
+    assert report["S0"].spikes == 2
+    assert report["S1"].spikes == 0
+
+
+def test_structural_issues() -> None:
+    # 월요일 2024-01-01 부터: 01-04 누락, 01-03 중복, 01-05 다음에 01-03 (역순), high < low
+    timestamp = np.array(
+        ["2024-01-01", "2024-01-02", "2024-01-03", "2024-01-03", "2024-01-05", "2024-01-03"],
+        dtype="datetime64[s]",
+    )
+    close = np.full(6, 10.0)
+    high, low = close + 1.0, close - 1.0
+    high[1], low[1] = 9.0, 11.0
+    report = scan_arrays(
+        ["A", "B"], np.array([4, 2]), timestamp, high, low, close, Interval.parse("1d")
+    )
+    assert report["A"].duplicates == 1 and report["A"].high_below_low == 1
+    assert report["A"].missing_sessions == 0
+    # B: 01-03 -> 01-05 는 정렬 후 01-04 누락, 역순 1 건
+    assert (report["B"].non_monotonic, report["B"].missing_sessions) == (1, 1)
+    np.testing.assert_array_equal(report.positions("A", "duplicates"), [3])
+    np.testing.assert_array_equal(report.positions("B", "non_monotonic"), [1])
+    assert [item.symbol for item in report.flagged()] == ["A", "B"]
+    assert report.summary() == {
+        "missing_sessions": 1,
+        "duplicates": 1,
+        "non_monotonic": 1,
+        "high_below_low": 1,
+        "spikes": 0,
+        "symbols": 2,
+        "flagged_symbols": 2,
+        "bars": 6,
+    }
+
+
+@pytest.mark.parametrize(
+    ("interval", "stamps", "calendar", "missing"),
+    [
+        # 금 -> 월 은 주말만 건너뜀, 금 -> 수 는 월/화 누락
+        ("1d", ["2024-01-05", "2024-01-08", "2024-01-10"], None, 1),
+        ("1d", ["2024-01-05", "2024-01-08"], ALWAYS_OPEN_CALENDAR, 2),
+        ("1d", ["2024-12-24", "2024-12-26"], TradingCalendar(holidays=("2024-12-25",)), 0),
+        ("60min", ["2024-01-02T10:00", "2024-01-02T11:00", "2024-01-02T14:00"], None, 2),
+        # 장 마감 후 다음 거래일 개장은 누락 아님, 거래일 하나를 건너뛰면 1
+        ("60min", ["2024-01-02T15:00", "2024-01-03T09:00", "2024-01-05T09:00"], None, 1),
+        ("1w", ["2024-01-01", "2024-01-12", "2024-01-29"], None, 2),
+        ("1mo", ["2024-01-31", "2024-02-01", "2024-05-01"], None, 2),
+    ],
+)
+def test_missing_sessions(interval: str, stamps: list[str], calendar, missing: int) -> None:
+    timestamp = np.array(stamps, dtype="datetime64[s]")
+    close = np.full(len(stamps), 10.0)
+    kwargs = {"calendar": calendar} if calendar else {}
+    lengths = np.array([len(stamps)])
+    report = scan_arrays(
+        ["A"], lengths, timestamp, close, close, close, Interval.parse(interval), **kwargs
+    )
+    assert report["A"].missing_sessions == missing
+
+
+def test_scan_messages() -> None:
+    days = np.datetime_as_string(business_days(40), unit="D").tolist()
+    closes = np.linspace(100.0, 130.0, 40)
+    closes[30:] *= 2.0
+    batch = md_pb2.BatchGetDailyOHLCVResponse()
+    for symbol in ("AAA", "BBB"):
+        item = batch.data.add(symbol=symbol)
+        for day, close in zip(days, closes if symbol == "AAA" else closes[:30]):
+            item.bars.add(timestamp=day, open=close, high=close, low=close, close=close)
+    item = batch.data.add(symbol="EMPTY")
+
+    report = scan(batch)
+    assert report.symbols == ["AAA", "BBB", "EMPTY"]
+    assert report.bars.tolist() == [40, 30, 0]
+    np.testing.assert_array_equal(report.positions("AAA", "spikes"), [30])
+    assert report["BBB"].ok and report["EMPTY"].ok
+
+    # 응답의 interval 사용 (주봉이면 연속 거래일이 누락 아님)
+    response = md_pb2.OHLCVResponse(symbol="AAA", interval="1w", bars=batch.data[0].bars[:3])
+    assert scan(response)["AAA"].missing_sessions == 0
+    assert scan(response, interval="1d")["AAA"].missing_sessions == 0
+    assert scan([]).summary()["symbols"] == 0
@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import time
+
+import numpy as np
+import pytest
+
+from mysingle_protos.market_data.resample import (
+    Interval,
+    OHLCVArrays,
+    ResampledBarCache,
+    bucket_end,
+    bucket_starts,
+    check_compatible,
+    is_live,
+    parse_timestamps,
+    request_key,
+    resample,
+)
+from mysingle_protos.protos.services.market_data.v1 import market_data_service_pb2 as md_pb2
+
+
+def stamps(*values: str) -> np.ndarray:
+    return np.array(values, dtype="datetime64[s]")
+
+
+def arrays(timestamps: np.ndarray, **columns) -> OHLCVArrays:
+    n = len(timestamps)
+    close = np.asarray(columns.get("close", np.arange(1.0, n + 1)), dtype=np.float64)
+    nan = np.full(n, np.nan)
+    return OHLCVArrays(
+        timestamp=timestamps,
+        open=np.asarray(columns.get("open", close - 0.5)),
+        high=np.asarray(columns.get("high", close + 1.0)),
+        low=np.asarray(columns.get("low", close - 1.0)),
+        close=close,
+        volume=np.asarray(columns.get("volume", np.full(n, 10)), dtype=np.int64),
+        adjusted_close=np.asarray(columns.get("adjusted_close", close)),
+        dividend_amount=np.asarray(columns.get("dividend_amount", nan)),
+        split_coefficient=np.asarray(columns.get("split_coefficient", nan)),
+    )
+
+
+@pytest.mark.parametrize(
+    ("expr", "expected"),
+    [
+        ("90min", Interval(90, "min")),
+        ("15m", Interval(15, "min")),
+        (" 4H ", Interval(4, "h")),
+        ("1wk", Interval(1, "w")),
+        ("3mo", Interval(3, "mo")),
+    ],
+)
+def test_interval_parse(expr: str, expected: Interval) -> None:
+    assert Interval.parse(expr) == expected
+    assert Interval.parse(str(expected)) == expected
+
+
+@pytest.mark.parametrize("expr", ["", "0d", "-1d", "1y", "d", "1.5h", "4 hours"])
+def test_interval_parse_rejects(expr: str) -> None:
+    with pytest.raises(ValueError):
+        Interval.parse(expr)
+
+
+def test_interval_properties_and_compatibility() -> None:
+    assert Interval.parse("90min").seconds == 5400 and Interval.parse("90min").is_intraday
+    assert not Interval.parse("1d").is_intraday and Interval.parse("1d").seconds == 86400
+    assert Interval.parse("2mo").seconds is None and not Interval.parse("2mo").is_intraday
+
+    for source, target in (("60min", "4h"), ("1d", "2w"), ("1d", "3mo"), ("1mo", "3mo")):
+        check_compatible(Interval.parse(source), Interval.parse(target))
+    for source, target in (("1d", "4h"), ("7min", "1h"), ("1w", "1mo"), ("2mo", "3mo")):
+        with pytest.raises(ValueError):
+            check_compatible(Interval.parse(source), Interval.parse(target))
+
+
+def test_bucket_edges() -> None:
+    # 경계 시각은 새 버킷의 시작
+    values = stamps("2024-03-01T03:59:59", "2024-03-01T04:00:00", "2024-03-01T07:59:59")
+    np.testing.assert_array_equal(
+        bucket_starts(values, Interval.parse("4h")),
+        stamps("2024-03-01T00:00:00", "2024-03-01T04:00:00", "2024-03-01T04:00:00"),
+    )
+    # 주간 버킷은 월요일 시작 (2024-03-04 는 월요일)
+    values = stamps("2024-03-03T23:59:59", "2024-03-04T00:00:00", "2024-03-10T12:00:00")
+    np.testing.assert_array_equal(
+        bucket_starts(values, Interval.parse("1w")),
+        stamps("2024-02-26", "2024-03-04", "2024-03-04"),
+    )
+    # 분기 버킷은 1970-01 기준 3 개월 단위
+    values = stamps("2024-03-31T23:59:59", "2024-04-01", "2024-06-30", "2024-07-01")
+    np.testing.assert_array_equal(
+        bucket_starts(values, Interval.parse("3mo")),
+        stamps("2024-01-01", "2024-04-01", "2024-04-01", "2024-07-01"),
+    )
+    assert bucket_end(stamps("2024-11-01")[0], Interval.parse("3mo")) == stamps("2025-02-01")[0]
+    assert bucket_end(stamps("2024-03-04")[0], Interval.parse("2w")) == stamps("2024-03-18")[0]
+
+    # anchor 로 버킷 위상 이동
+    anchor = stamps("2024-03-01T01:30:00")[0]
+    values = stamps("2024-03-01T01:29:59", "2024-03-01T01:30:00")
+    np.testing.assert_array_equal(
+        bucket_starts(values, Interval(2, "h"), anchor),
+        stamps("2024-02-29T23:30:00", "2024-03-01T01:30:00"),
+    )
+
+
+def test_resample_aggregates_each_bucket() -> None:
+    data = arrays(
+        stamps("2024-03-01T00:00", "2024-03-01T01:00", "2024-03-01T02:00", "2024-03-01T05:00"),
+        open=[1.0, 2.0, 3.0, 4.0],
+        high=[5.0, 9.0, 6.0, 7.0],
+        low=[0.5, 0.1, 0.7, 3.0],
+        close=[1.5, 2.5, 3.5, 4.5],
+        volume=[10, 20, 30, 40],
+        dividend_amount=[np.nan, 0.2, 0.3, np.nan],
+        split_coefficient=[2.0, np.nan, 3.0, np.nan],
+    )
+    out = resample(data, Interval.parse("4h"))
+    np.testing.assert_array_equal(out.timestamp, stamps("2024-03-01T00:00", "2024-03-01T04:00"))
+    np.testing.assert_array_equal(out.open, [1.0, 4.0])
+    np.testing.assert_array_equal(out.high, [9.0, 7.0])
+    np.testing.assert_array_equal(out.low, [0.1, 3.0])
+    np.testing.assert_array_equal(out.close, [3.5, 4.5])
+    np.testing.assert_array_equal(out.volume, [60, 40])
+    np.testing.assert_array_equal(out.adjusted_close, [3.5, 4.5])
+    # 결측만 있는 버킷은 NaN, 배당은 합, 분할 계수는 곱
+    np.testing.assert_array_equal(out.dividend_amount, [0.5, np.nan])
+    np.testing.assert_array_equal(out.split_coefficient, [6.0, np.nan])
+
+    # 역순 입력은 정렬 후 같은 결과
+    shuffled = resample(data.take(np.array([3, 1, 0, 2])), Interval.parse("4h"))
+    np.testing.assert_array_equal(shuffled.close, out.close)
+    assert len(resample(data.take(np.zeros(0, dtype=np.int64)), Interval.parse("4h"))) == 0
+
+
+def test_drop_partial_uses_bucket_end() -> None:
+    data = arrays(stamps("2024-03-04", "2024-03-05", "2024-03-11", "2024-03-12"))
+    week = Interval.parse("1w")
+    # 마지막 버킷 종료(2024-03-18)가 as_of 와 같으면 완성된 버킷
+    assert len(resample(data, week, drop_partial=True, as_of=stamps("2024-03-18")[0])) == 2
+    kept = resample(data, week, drop_partial=True, as_of=stamps("2024-03-17T23:59:59")[0])
+    np.testing.assert_array_equal(kept.timestamp, stamps("2024-03-04"))
+    assert len(resample(data, week, as_of=stamps("2024-03-12")[0])) == 2
+
+
+def test_timestamps_and_bars_round_trip() -> None:
+    parsed = parse_timestamps(["2024-03-01T09:30:00+09:00", "2024-03-01T00:30:00Z"])
+    np.testing.assert_array_equal(parsed, stamps("2024-03-01T00:30:00", "2024-03-01T00:30:00"))
+    assert len(parse_timestamps([])) == 0
+
+    data = arrays(
+        stamps("2024-03-01T00:00", "2024-03-01T01:00"),
+        dividend_amount=[np.nan, 0.25],
+    )
+    bars = data.to_bars()
+    assert bars[0].timestamp == "2024-03-01T00:00:00"
+    assert not bars[0].HasField("dividend_amount") and bars[1].dividend_amount == 0.25
+    again = OHLCVArrays.from_bars(bars)
+    for name in OHLCVArrays.__dataclass_fields__:
+        np.testing.assert_array_equal(getattr(again, name), getattr(data, name))
+    assert [b.timestamp for b in data.to_bars(intraday=False)] == ["2024-03-01", "2024-03-01"]
+
+
+def request(**kwargs) -> md_pb2.GetResampledOHLCVRequest:
+    fields = {"symbol": "aapl", "interval": "2w", "source_interval": "1d", **kwargs}
+    return md_pb2.GetResampledOHLCVRequest(**fields)
+
+
+def test_request_key_normalizes_equivalent_requests() -> None:
+    assert request_key(request()) == request_key(request(symbol="AAPL", interval=" 2W "))
+    assert request_key(request(source_interval="1d")) != request_key(request(source_interval="1w"))
+    assert request_key(request(drop_partial=False)) == request_key(request())
+    assert request_key(request(end_date="2024-01-01")) != request_key(request())
+    with pytest.raises(ValueError):
+        request_key(request(interval="banana"))
+
+
+def test_live_requests() -> None:
+    assert is_live(request())
+    assert is_live(request(end_date="2024-06-30"), today="2024-06-30")
+    assert not is_live(request(end_date="2024-06-29"), today="2024-06-30")
+    assert not is_live(request(end_date="2024-06-29T23:59:59"), today="2024-06-30")
+
+
+def test_cache_expires_open_ended_entries_only() -> None:
+    response = md_pb2.OHLCVResponse(symbol="AAPL", interval="2w", count=1)
+    closed = request(end_date="2020-01-31")
+    cache = ResampledBarCache(live_ttl_seconds=0.05)
+    cache.put(closed, response)
+    cache.put(request(), response)
+    cache.put(request(end_date="2999-01-01"), response)
+    assert len(cache) == 3
+    hit = cache.get(request())
+    assert hit.cached and hit.cache_timestamp and hit.symbol == "AAPL"
+
+    time.sleep(0.06)
+    assert cache.get(request()) is None
+    assert cache.get(request(end_date="2999-01-01")) is None
+    assert cache.get(closed).cached
+    assert len(cache) == 1
+    assert (cache.hits, cache.misses) == (2, 2)
+
+    # TTL 0 이면 열린 구간은 저장하지 않음
+    cache = ResampledBarCache(live_ttl_seconds=0)
+    cache.put(request(), response)
+    cache.put(closed, response)
+    assert len(cache) == 1 and cache.get(request()) is None
+
+
+def test_cache_lru_eviction() -> None:
+    cache = ResampledBarCache(max_entries=2)
+    keys = [request(end_date=f"2020-01-0{i}") for i in range(1, 4)]
+    for key in keys[:2]:
+        cache.put(key, md_pb2.OHLCVResponse(symbol=key.end_date))
+    # 조회한 항목은 최근 사용으로 이동
+    assert cache.get(keys[0]) is not None
+    cache.put(keys[2], md_pb2.OHLCVResponse(symbol=keys[2].end_date))
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]).symbol == "2020-01-01"
+    assert cache.get(keys[2]).symbol == "2020-01-03"
+    assert cache.size_bytes() == sum(
+        len(md_pb2.OHLCVResponse(symbol=k.end_date).SerializeToString()) for k in keys[::2]
+    )
+    assert cache.hit_rate == pytest.approx(3 / 4)
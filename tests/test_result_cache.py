@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from mysingle_protos.backtest.cache import ResultCache
+from mysingle_protos.protos.services.backtest.v1 import backtest_service_pb2 as bt_pb2
+
+
+@pytest.mark.parametrize("status", ["queued", "running", "failed", "cancelled"])
+def test_non_completed_results_are_not_cached(tmp_path: Path, status: str) -> None:
+    cache = ResultCache(tmp_path)
+    request = bt_pb2.GetBacktestResultRequest(backtest_id="bt-1", user_id="u1")
+    response = bt_pb2.BacktestResultResponse(backtest_id="bt-1", status=status)
+
+    assert not cache.put(request, response)
+    assert cache.get(request) is None
+    assert cache.stats.bypassed == 1
+
+
+def test_completed_result_round_trips(tmp_path: Path) -> None:
+    request = bt_pb2.GetBacktestResultRequest(backtest_id="bt-1", user_id="u1")
+    response = bt_pb2.BacktestResultResponse(backtest_id="bt-1", status="completed")
+    assert ResultCache(tmp_path).put(request, response)
+
+    # 새 인스턴스는 디스크에서 읽음
+    reopened = ResultCache(tmp_path)
+    assert reopened.get(request) == response
+    assert reopened.stats.disk_hits == 1
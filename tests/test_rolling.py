@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+
+from mysingle_protos.backtest.metrics import compute_metrics, rolling_max, rolling_metrics
+from mysingle_protos.backtest.rolling import MAX_WINDOWS, RollingSeries, request_windows
+from mysingle_protos.backtest.stream import EQUITY_DTYPE, SIDE_CODES, TRADE_DTYPE
+from mysingle_protos.protos.services.backtest.v1 import backtest_service_pb2 as bt_pb2
+
+DAY = 86_400 * 10**9
+
+
+def random_result(seed: int, n: int = 400) -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    equity = np.zeros(n, dtype=EQUITY_DTYPE)
+    equity["timestamp"] = np.arange(n, dtype=np.int64) * DAY
+    equity["equity"] = 1e4 * np.exp(np.cumsum(rng.normal(0.0, 0.01, n)))
+    trades = np.zeros(60, dtype=TRADE_DTYPE)
+    # 바 사이 시각에 체결된 거래 포함 (다음 바에 배정)
+    trades["timestamp"] = np.sort(rng.integers(0, (n + 5) * DAY, 60))
+    trades["side"] = rng.choice([SIDE_CODES["BUY"], SIDE_CODES["SELL"]], 60)
+    trades["pnl"] = rng.normal(0.0, 10.0, 60)
+    return equity, trades
+
+
+def loop_win_rate(equity: np.ndarray, trades: np.ndarray, start: int, end: int) -> float:
+    timestamp = equity["timestamp"]
+    lo = timestamp[start - 1] if start > 0 else -math.inf
+    sells = trades[
+        (trades["side"] == SIDE_CODES["SELL"])
+        & (trades["timestamp"] > lo)
+        & (trades["timestamp"] <= timestamp[end])
+    ]
+    return float((sells["pnl"] > 0).mean() * 100.0) if len(sells) else math.nan
+
+
+@pytest.mark.parametrize("window", [2, 7, 60])
+def test_series_matches_window_loop(window: int) -> None:
+    equity, trades = random_result(window)
+    series = RollingSeries(equity, trades).series(window)
+    ppy = 365.25
+
+    assert len(series) == len(equity)
+    for name in series.dtype.names:
+        assert np.isnan(series[name][: window - 1]).all()
+    for end in range(window - 1, len(equity)):
+        start = end - window + 1
+        part = equity[start : end + 1]
+        expected = compute_metrics(part, ppy=ppy)
+        row = series[end]
+        if window > 2:
+            assert row["sharpe_ratio"] == pytest.approx(expected.sharpe_ratio, rel=1e-6)
+            assert row["volatility"] == pytest.approx(expected.volatility, rel=1e-6)
+        values = part["equity"]
+        assert row["drawdown"] == pytest.approx((values[-1] / values.max() - 1.0) * 100.0)
+        np.testing.assert_equal(row["win_rate"], loop_win_rate(equity, trades, start, end))
+
+
+def test_rolling_metrics_without_trades_or_max_drawdown() -> None:
+    equity, _ = random_result(1)
+    rows = rolling_metrics(equity, 20, with_max_drawdown=False)
+    assert np.isnan(rows["win_rate"]).all()
+    assert np.isnan(rows["max_drawdown"]).all()
+    # 윈도 안 최대 낙폭은 윈도 끝 낙폭보다 깊거나 같음
+    full = rolling_metrics(equity, 20)
+    assert (full["max_drawdown"] <= full["drawdown"] + 1e-12).all()
+
+
+@pytest.mark.parametrize("n", [1, 5, 17, 64])
+@pytest.mark.parametrize("window", [1, 3, 8])
+def test_rolling_max_matches_loop(n: int, window: int) -> None:
+    values = np.random.default_rng(n).normal(size=n)
+    out = rolling_max(values, window)
+    for i in range(n):
+        expected = values[i - window + 1 : i + 1].max() if i >= window - 1 else np.nan
+        np.testing.assert_equal(out[i], expected)
+
+
+def test_response_aligns_windows_on_downsampled_axis() -> None:
+    equity, trades = random_result(3)
+    rolling = RollingSeries(equity, trades, "bt-1")
+    request = bt_pb2.GetRollingMetricsRequest(windows=[60, 20, 60], max_points=50)
+    response = rolling.response(request)
+
+    assert [series.window for series in response.series] == [60, 20]
+    assert 0 < len(response.timestamp_ns) <= 50
+    index = np.searchsorted(equity["timestamp"], response.timestamp_ns)
+    for series in response.series:
+        expected = rolling.series(series.window)[index]
+        np.testing.assert_array_equal(np.asarray(series.sharpe_ratio), expected["sharpe_ratio"])
+        np.testing.assert_array_equal(np.asarray(series.win_rate), expected["win_rate"])
+
+
+def test_request_windows_defaults_and_validation() -> None:
+    assert request_windows(bt_pb2.GetRollingMetricsRequest()) == [20, 60]
+    with pytest.raises(ValueError):
+        request_windows(bt_pb2.GetRollingMetricsRequest(windows=[1]))
+    with pytest.raises(ValueError):
+        request_windows(bt_pb2.GetRollingMetricsRequest(windows=range(2, MAX_WINDOWS + 3)))
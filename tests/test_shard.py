@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from mysingle_protos.backtest.engine import buy_and_hold, run_backtest, sma_crossover
+from mysingle_protos.backtest.shard import plan_shards, run_sharded
+from mysingle_protos.protos.services.backtest.v1 import backtest_service_pb2 as bt_pb2
+
+
+def random_case(seed: int, parallelism: int):
+    rng = np.random.default_rng(seed)
+    n = int(rng.integers(200, 3000))
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.02, n)))
+    timestamp = np.arange(n, dtype=np.int64) * 86_400 * 10**9
+    fast = int(rng.integers(1, 10))
+    slow = int(rng.integers(fast + 1, 60))
+    config = bt_pb2.BacktestConfig(
+        symbol="X",
+        initial_capital=float(rng.choice([1e4, 100.0, 5.0])),
+        slippage_bps=float(rng.choice([0.0, 5.0])),
+        commission_per_trade=float(rng.choice([0.0, 1.0, 3.0])),
+        params={"fast": str(fast), "slow": str(slow)},
+        parallelism=parallelism,
+    )
+    if rng.random() < 0.5:
+        config.stop_loss_pct = float(rng.uniform(1, 10))
+    if rng.random() < 0.5:
+        config.take_profit_pct = float(rng.uniform(1, 20))
+    if rng.random() < 0.3:
+        config.max_position_size = float(rng.uniform(10, 100))
+    return config, timestamp, close, slow
+
+
+def assert_same_result(a, b) -> None:
+    assert len(a.trades) == len(b.trades)
+    np.testing.assert_array_equal(a.trades["timestamp"], b.trades["timestamp"])
+    for field in ("quantity", "price", "pnl", "portfolio_value", "commission"):
+        np.testing.assert_allclose(a.trades[field], b.trades[field], rtol=1e-9, atol=1e-9)
+    for field in ("equity", "cash"):
+        np.testing.assert_allclose(a.equity[field], b.equity[field], rtol=1e-9, atol=1e-9)
+    np.testing.assert_allclose(a.equity["drawdown"], b.equity["drawdown"], atol=1e-7)
+    np.testing.assert_allclose(a.positions, b.positions, rtol=1e-9, atol=1e-12)
+
+
+@pytest.mark.parametrize("parallelism", [2, 3, 4, 7])
+@pytest.mark.parametrize("seed", range(8))
+def test_sharded_run_matches_sequential_run(seed: int, parallelism: int) -> None:
+    config, timestamp, close, slow = random_case(seed, parallelism)
+    expected = run_backtest(config, timestamp, close, sma_crossover)
+    actual = run_sharded(config, timestamp, close, sma_crossover, min_lookback=slow)
+    assert_same_result(expected, actual)
+
+
+@pytest.mark.parametrize("parallelism", [2, 5])
+def test_sharded_run_without_lookback_matches_sequential_run(parallelism: int) -> None:
+    # min_lookback 을 모르면 샤드마다 처음부터 warm-up
+    config, timestamp, close, _ = random_case(100 + parallelism, parallelism)
+    for signal in (sma_crossover, buy_and_hold):
+        expected = run_backtest(config, timestamp, close, signal)
+        assert_same_result(expected, run_sharded(config, timestamp, close, signal))
+
+
+def test_plan_shards_covers_every_bar_once() -> None:
+    for total, parallelism in [(10, 3), (5, 8), (1000, 4)]:
+        shards = plan_shards(total, parallelism, warmup_bars=20)
+        assert shards[0].start == 0 and shards[-1].end == total
+        assert all(a.end == b.start for a, b in zip(shards, shards[1:]))
+        assert all(s.warmup_start == max(0, s.start - 20) for s in shards)
+    assert plan_shards(0, 4, None) == []
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+
+from mysingle_protos.backtest.stream import (
+    MAX_ROWS_PER_CHUNK,
+    collect_result,
+    iter_result_chunks,
+    load_result,
+    write_result,
+)
+from mysingle_protos.protos.services.backtest.v1 import backtest_service_pb2 as bt_pb2
+
+COLUMNAR = bt_pb2.RESULT_ENCODING_COLUMNAR
+
+
+def make_result(n_trades: int = 23, n_points: int = 31) -> bt_pb2.BacktestResultResponse:
+    result = bt_pb2.BacktestResultResponse(
+        backtest_id="bt-1", strategy_id="s-1", status="completed", strategy_version_seq=3
+    )
+    result.metrics.total_return = 12.5
+    result.created_at.FromNanoseconds(1_700_000_000_000_000_000)
+    result.config.symbol = "AAPL"
+    for i in range(n_trades):
+        # 청크마다 다른 심볼 순서 (columnar 청크별 심볼 테이블 재매핑)
+        trade = result.trades.add(
+            symbol=("AAPL", "MSFT", "005930.KS")[(i * i) % 3],
+            side="buy" if i % 2 == 0 else "SELL",
+            quantity=i + 1.0,
+            price=100.0 + i,
+            pnl=i * 0.5 - 3,
+            commission=0.1,
+        )
+        trade.timestamp.FromNanoseconds(1_700_000_000_000_000_000 + i * 1_000_000_007)
+        if i % 4:
+            trade.portfolio_value = 1e4 + i
+    for i in range(n_points):
+        point = result.equity_curve.add(
+            equity=1e4 + i, drawdown=-i / 10, cash=5e3, positions_value=5e3 + i
+        )
+        point.timestamp.FromNanoseconds(1_700_000_000_000_000_000 + i * 60_000_000_000)
+    return result
+
+
+def assert_matches(streamed, result: bt_pb2.BacktestResultResponse) -> None:
+    assert len(streamed.trades) == len(result.trades)
+    symbols = streamed.trade_symbols()
+    for i, trade in enumerate(result.trades):
+        row = streamed.trades[i]
+        assert row["timestamp"] == trade.timestamp.ToNanoseconds()
+        assert symbols[i] == trade.symbol
+        assert row["side"] == (1 if trade.side.upper() == "BUY" else -1)
+        assert (row["quantity"], row["price"], row["pnl"]) == (
+            trade.quantity,
+            trade.price,
+            trade.pnl,
+        )
+        if trade.HasField("portfolio_value"):
+            assert row["portfolio_value"] == trade.portfolio_value
+        else:
+            assert math.isnan(row["portfolio_value"])
+    assert len(streamed.equity) == len(result.equity_curve)
+    for i, point in enumerate(result.equity_curve):
+        row = streamed.equity[i]
+        assert row["timestamp"] == point.timestamp.ToNanoseconds()
+        assert (row["equity"], row["drawdown"], row["cash"], row["positions_value"]) == (
+            point.equity,
+            point.drawdown,
+            point.cash,
+            point.positions_value,
+        )
+
+
+@pytest.mark.parametrize("encoding", [None, COLUMNAR])
+@pytest.mark.parametrize("rows", [1, 7, 23, 31, None])
+def test_chunks_round_trip(encoding, rows) -> None:
+    result = make_result()
+    chunks = list(iter_result_chunks(result, rows, encoding=encoding))
+
+    expected = 1 + math.ceil(23 / (rows or 10_000)) + math.ceil(31 / (rows or 10_000))
+    assert [c.seq for c in chunks] == list(range(expected))
+    assert [c.last for c in chunks] == [False] * (expected - 1) + [True]
+    assert [c.WhichOneof("payload") for c in chunks[:1]] == ["header"]
+
+    streamed = collect_result(chunks)
+    assert_matches(streamed, result)
+    header = streamed.header
+    assert (header.backtest_id, header.strategy_version_seq, header.config.symbol) == (
+        "bt-1",
+        3,
+        "AAPL",
+    )
+    assert header.metrics.total_return == 12.5
+    assert (header.total_trades, header.total_equity_points) == (23, 31)
+    np.testing.assert_array_equal(
+        streamed.equity_timestamps.astype(np.int64), streamed.equity["timestamp"]
+    )
+
+
+def test_include_flags_and_empty_results() -> None:
+    result = make_result()
+    only_equity = list(iter_result_chunks(result, 10, include_trades=False))
+    streamed = collect_result(only_equity)
+    assert len(streamed.trades) == 0 and streamed.header.total_trades == 0
+    assert len(streamed.equity) == 31
+
+    chunks = list(iter_result_chunks(result, include_trades=False, include_equity_curve=False))
+    assert len(chunks) == 1 and chunks[0].last
+
+    empty = bt_pb2.BacktestResultResponse(backtest_id="bt-2", status="failed")
+    empty.error_message = "boom"
+    streamed = collect_result(iter_result_chunks(empty, encoding=COLUMNAR))
+    assert streamed.header.error_message == "boom"
+    assert len(streamed.trades) == len(streamed.equity) == 0 and streamed.symbols == []
+
+
+def test_chunk_size_limits() -> None:
+    result = make_result(n_trades=0, n_points=MAX_ROWS_PER_CHUNK + 1)
+    chunks = list(iter_result_chunks(result, MAX_ROWS_PER_CHUNK * 10))
+    assert [len(c.equity.points) for c in chunks[1:]] == [MAX_ROWS_PER_CHUNK, 1]
+    with pytest.raises(ValueError):
+        next(iter_result_chunks(result, -1))
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_write_and_load(tmp_path, mmap: bool) -> None:
+    result = make_result()
+    written = write_result(iter_result_chunks(result, 5, encoding=COLUMNAR), tmp_path / "bt-1")
+    loaded = load_result(tmp_path / "bt-1", mmap=mmap)
+    assert isinstance(loaded.equity, np.memmap) == mmap
+    assert loaded.header == written.header
+    assert loaded.symbols == written.symbols
+    assert_matches(loaded, result)
+
+
+def corrupt(chunks, index: int, **changes):
+    chunks = [bt_pb2.BacktestResultChunk.FromString(c.SerializeToString()) for c in chunks]
+    for name, value in changes.items():
+        if name == "offset":
+            chunks[index].trades.offset = value
+        else:
+            setattr(chunks[index], name, value)
+    return chunks
+
+
+def test_invalid_streams() -> None:
+    chunks = list(iter_result_chunks(make_result(), 10))
+    extra_header = bt_pb2.BacktestResultChunk(seq=len(chunks), header=chunks[0].header)
+    streams = [
+        [],
+        chunks[1:],
+        chunks[:2] + chunks[3:],
+        chunks[:-1],
+        chunks[:-1] + [corrupt(chunks, -1, last=False)[-1], extra_header],
+        chunks + [extra_header],
+        corrupt(chunks, 0, seq=1),
+        corrupt(chunks, 2, offset=0),
+        corrupt(chunks, 1, offset=10),
+        corrupt(chunks, 2, last=True),
+    ]
+    for stream in streams:
+        with pytest.raises(ValueError):
+            collect_result(stream)
+
+    # 헤더의 total 보다 적은 행
+    short = corrupt(chunks, 0)
+    short[0].header.total_trades = 40
+    with pytest.raises(ValueError):
+        collect_result(short)
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from mysingle_protos.backtest.sweep import (
+    MAX_VARIANTS,
+    SharedArrays,
+    expand_variants,
+    run_sweep,
+    sweep_response,
+)
+from mysingle_protos.protos.services.backtest.v1 import backtest_service_pb2 as bt_pb2
+
+
+def sweep_request(**kwargs) -> bt_pb2.ExecuteBacktestSweepRequest:
+    request = bt_pb2.ExecuteBacktestSweepRequest(user_id="u", strategy_id="s", **kwargs)
+    request.base_config.symbol = "AAPL"
+    request.base_config.initial_capital = 1e4
+    request.base_config.params.update({"fast": "5", "slow": "20"})
+    return request
+
+
+def test_grid_product_and_explicit_variants() -> None:
+    request = sweep_request(
+        grid=[
+            bt_pb2.ParameterAxis(name="fast", values=["5", "10"]),
+            bt_pb2.ParameterAxis(name="slow", values=["20", "50", "100"]),
+            bt_pb2.ParameterAxis(name="unused"),
+        ],
+        variants=[bt_pb2.ParameterSet(params={"fast": "3", "stop": "0.1"})],
+    )
+    variants = expand_variants(request)
+    params = [p for p, _ in variants]
+    # 그리드 곱(마지막 축이 가장 빠르게 변함) 다음 명시적 변형, 기본 params 위에 덮어씀
+    assert params[:3] == [
+        {"fast": "5", "slow": "20"},
+        {"fast": "5", "slow": "50"},
+        {"fast": "5", "slow": "100"},
+    ]
+    assert len(params) == 7
+    assert params[-1] == {"fast": "3", "slow": "20", "stop": "0.1"}
+    for p, config in variants:
+        assert dict(config.params) == p
+        assert (config.symbol, config.initial_capital) == ("AAPL", 1e4)
+    # 기본 설정은 바뀌지 않음
+    assert dict(request.base_config.params) == {"fast": "5", "slow": "20"}
+
+
+def test_duplicate_variants_are_removed() -> None:
+    request = sweep_request(
+        grid=[
+            bt_pb2.ParameterAxis(name="fast", values=["5", "10", "5"]),
+        ],
+        variants=[
+            # 기본값과 같은 값을 명시한 변형 == 그리드의 fast=5
+            bt_pb2.ParameterSet(params={"fast": "5", "slow": "20"}),
+            bt_pb2.ParameterSet(params={"slow": "20", "fast": "10"}),
+            bt_pb2.ParameterSet(params={"fast": "7"}),
+            bt_pb2.ParameterSet(params={"fast": "7"}),
+        ],
+    )
+    assert [p["fast"] for p, _ in expand_variants(request)] == ["5", "10", "7"]
+
+    # 그리드/변형이 없으면 기본 설정 하나
+    (only,) = expand_variants(sweep_request())
+    assert only[0] == {"fast": "5", "slow": "20"}
+    # 빈 변형은 기본 설정과 같음
+    request = sweep_request(variants=[bt_pb2.ParameterSet(), bt_pb2.ParameterSet()])
+    assert len(expand_variants(request)) == 1
+
+
+def test_invalid_grids() -> None:
+    with pytest.raises(ValueError):
+        expand_variants(
+            sweep_request(
+                grid=[
+                    bt_pb2.ParameterAxis(name="fast", values=["1"]),
+                    bt_pb2.ParameterAxis(name="fast", values=["2"]),
+                ]
+            )
+        )
+    values = [str(i) for i in range(101)]
+    with pytest.raises(ValueError):
+        expand_variants(
+            sweep_request(
+                grid=[
+                    bt_pb2.ParameterAxis(name="a", values=values),
+                    bt_pb2.ParameterAxis(name="b", values=values),
+                ]
+            )
+        )
+    variants = [bt_pb2.ParameterSet(params={"x": str(i)}) for i in range(MAX_VARIANTS + 1)]
+    with pytest.raises(ValueError):
+        expand_variants(sweep_request(variants=variants))
+
+
+def mean_close(data, context, config):
+    """공유 배열 평균 * 파라미터 (프로세스 모드용 모듈 수준 함수)"""
+    if config.params["fast"] == "boom":
+        raise RuntimeError("bad variant")
+    assert not data["close"].flags.writeable or context == "threads"
+    return float(data["close"].mean()) * int(config.params["fast"]), context
+
+
+@pytest.mark.parametrize("use_processes", [False, True])
+def test_run_sweep(use_processes: bool) -> None:
+    request = sweep_request(grid=[bt_pb2.ParameterAxis(name="fast", values=["1", "2", "boom"])])
+    configs = [config for _, config in expand_variants(request)]
+    close = np.arange(10.0)
+    context = "processes" if use_processes else "threads"
+    outcomes = sorted(
+        run_sweep(
+            mean_close,
+            configs,
+            {"close": close},
+            context=context,
+            max_workers=2,
+            use_processes=use_processes,
+        ),
+        key=lambda outcome: outcome.index,
+    )
+    assert [o.index for o in outcomes] == [0, 1, 2]
+    assert outcomes[0].result == (4.5, context) and outcomes[1].result == (9.0, context)
+    assert not outcomes[2].ok and outcomes[2].error == "RuntimeError: bad variant"
+    assert list(run_sweep(mean_close, [], use_processes=use_processes)) == []
+
+
+def test_shared_arrays_round_trip() -> None:
+    arrays = {"a": np.arange(6, dtype=np.int32).reshape(2, 3), "empty": np.zeros(0)}
+    handle, blocks = SharedArrays.create(arrays)
+    try:
+        views, attached = handle.attach()
+        np.testing.assert_array_equal(views["a"], arrays["a"])
+        assert views["empty"].shape == (0,) and not views["a"].flags.writeable
+        del views
+        for block in attached:
+            block.close()
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+
+def test_sweep_response() -> None:
+    variants = expand_variants(
+        sweep_request(grid=[bt_pb2.ParameterAxis(name="fast", values=["1", "2"])])
+    )
+    response = sweep_response("sw-1", variants, ["bt-a", "bt-b"])
+    assert (response.sweep_id, response.status, response.message) == (
+        "sw-1",
+        "queued",
+        "2 variants scheduled",
+    )
+    assert [(v.index, v.backtest_id, v.params["fast"]) for v in response.variants] == [
+        (0, "bt-a", "1"),
+        (1, "bt-b", "2"),
+    ]
+    assert response.created_at.seconds > 0
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import grpc
+import pytest
+
+from mysingle_protos.market_data.synthetic import serve_in_background
+from mysingle_protos.protos.services.market_data.v1 import market_data_service_pb2 as md_pb2
+from mysingle_protos.protos.services.market_data.v1 import market_data_service_pb2_grpc as md_grpc
+
+
+@pytest.fixture(scope="module")
+def stub():
+    with serve_in_background() as server:
+        with grpc.insecure_channel(server.address) as channel:
+            yield md_grpc.MarketDataServiceStub(channel)
+
+
+@pytest.mark.parametrize(
+    ("interval", "source_interval"),
+    [("banana", "1d"), ("2h", "1d"), ("4h", "7min")],
+)
+def test_invalid_intervals_are_invalid_argument(stub, interval: str, source_interval: str) -> None:
+    request = md_pb2.GetResampledOHLCVRequest(
+        symbol="AAPL", interval=interval, source_interval=source_interval
+    )
+    with pytest.raises(grpc.RpcError) as raised:
+        stub.GetResampledOHLCV(request)
+    assert raised.value.code() == grpc.StatusCode.INVALID_ARGUMENT
+
+
+def test_repeated_request_is_served_from_cache(stub) -> None:
+    request = md_pb2.GetResampledOHLCVRequest(symbol="MSFT", interval="2w", source_interval="1d")
+    first = stub.GetResampledOHLCV(request)
+    second = stub.GetResampledOHLCV(request)
+    assert not first.cached
+    assert second.cached
+    assert list(second.bars) == list(first.bars)
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import gc
+import time
+
+import grpc
+
+from mysingle_protos.market_data.scheduler import ProviderBudget
+from mysingle_protos.market_data.synthetic import (
+    LatencyProfile,
+    SyntheticConfig,
+    serve_in_background,
+)
+from mysingle_protos.protos.services.market_data.v1 import market_data_service_pb2 as md_pb2
+from mysingle_protos.protos.services.market_data.v1 import market_data_service_pb2_grpc as md_grpc
+
+
+def test_stop_with_calls_in_flight_shuts_down_cleanly(caplog, capfd) -> None:
+    config = SyntheticConfig(
+        latency={"*": LatencyProfile(median_ms=5_000.0, distribution="fixed")},
+        upstream=ProviderBudget(rate_per_second=1.0, burst=1.0),
+    )
+    server = serve_in_background(config)
+    with grpc.insecure_channel(server.address) as channel:
+        stub = md_grpc.MarketDataServiceStub(channel)
+        # 하나는 업스트림 호출 중, 나머지는 예산 대기 중인 상태에서 종료
+        calls = [
+            stub.GetQuote.future(md_pb2.GetQuoteRequest(symbol=symbol))
+            for symbol in ("AAPL", "MSFT", "NVDA")
+        ]
+        time.sleep(0.2)
+        started = time.monotonic()
+        server.stop(grace=0)
+        assert time.monotonic() - started < 2.0
+        for call in calls:
+            assert call.exception() is not None
+    del server
+    gc.collect()
+    assert "Task was destroyed" not in caplog.text + capfd.readouterr().err
@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import base64
+
+import numpy as np
+import pytest
+
+from mysingle_protos.backtest import pagination
+from mysingle_protos.backtest.columnar import trade_view
+from mysingle_protos.backtest.stream import SIDE_CODES, TRADE_DTYPE
+from mysingle_protos.backtest.tradeindex import (
+    MAX_LIMIT,
+    TradeIndex,
+    decode_page_token,
+    encode_page_token,
+    iter_trades,
+)
+from mysingle_protos.protos.services.backtest.v1 import backtest_service_pb2 as bt_pb2
+
+SYMBOLS = ["A", "B", "C"]
+COLUMNS = {
+    bt_pb2.TRADE_SORT_FIELD_TIMESTAMP: "timestamp",
+    bt_pb2.TRADE_SORT_FIELD_PNL: "pnl",
+    bt_pb2.TRADE_SORT_FIELD_QUANTITY: "quantity",
+    bt_pb2.TRADE_SORT_FIELD_PRICE: "price",
+    bt_pb2.TRADE_SORT_FIELD_PORTFOLIO_VALUE: "portfolio_value",
+}
+
+
+def make_trades(n: int, seed: int = 0, ordered: bool = True) -> np.ndarray:
+    """타임스탬프/값 동률이 많은 거래 배열"""
+    rng = np.random.default_rng(seed)
+    trades = np.zeros(n, dtype=TRADE_DTYPE)
+    timestamps = rng.integers(0, n // 4 + 2, n)
+    trades["timestamp"] = np.sort(timestamps) if ordered else timestamps
+    trades["symbol"] = rng.integers(0, len(SYMBOLS), n)
+    trades["side"] = rng.choice([SIDE_CODES["BUY"], SIDE_CODES["SELL"]], n)
+    for name in ("quantity", "price", "pnl", "commission", "portfolio_value"):
+        trades[name] = rng.integers(-5, 5, n).astype(float)
+    return trades
+
+
+def expected(trades: np.ndarray, request: bt_pb2.QueryTradesRequest) -> list[int]:
+    """전수 조사 기준: 조건에 맞는 체결 순서를 정렬 키 순으로 (동률은 체결 순서)"""
+    mask = np.ones(len(trades), dtype=bool)
+    if request.HasField("start_time"):
+        mask &= trades["timestamp"] >= request.start_time.ToNanoseconds()
+    if request.HasField("end_time"):
+        mask &= trades["timestamp"] < request.end_time.ToNanoseconds()
+    if request.side:
+        buy = request.side == bt_pb2.TRADE_SIDE_BUY
+        mask &= trades["side"] == SIDE_CODES["BUY" if buy else "SELL"]
+    if request.symbols:
+        codes = [i for i, symbol in enumerate(SYMBOLS) if symbol in request.symbols]
+        mask &= np.isin(trades["symbol"], codes)
+    if request.HasField("min_pnl"):
+        mask &= trades["pnl"] >= request.min_pnl
+    if request.HasField("max_pnl"):
+        mask &= trades["pnl"] <= request.max_pnl
+    positions = np.nonzero(mask)[0]
+    values = trades[COLUMNS[request.sort_by or bt_pb2.TRADE_SORT_FIELD_TIMESTAMP]][positions]
+    return positions[np.lexsort((positions, -values if request.descending else values))].tolist()
+
+
+def collect(index: TradeIndex, request: bt_pb2.QueryTradesRequest) -> list[int]:
+    positions = []
+    for _ in range(len(index) + 1):
+        page = index.query(request)
+        assert len(page.trade_index) <= request.limit
+        if not request.HasField("include_total_count"):
+            assert page.total_count == len(expected(index.trades, request))
+        positions += page.trade_index
+        if not page.next_page_token:
+            return positions
+        request.page_token = page.next_page_token
+        request.include_total_count = False
+    raise AssertionError("페이지가 끝나지 않습니다")
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_random_queries_page_every_trade_once(ordered: bool) -> None:
+    rng = np.random.default_rng(1)
+    for trial in range(60):
+        trades = make_trades(int(rng.integers(0, 600)), seed=trial, ordered=ordered)
+        index = TradeIndex(trades, SYMBOLS, "bt-1")
+        span = len(trades) // 4 + 3
+        for _ in range(4):
+            request = bt_pb2.QueryTradesRequest(
+                backtest_id="bt-1",
+                limit=int(rng.choice([1, 7, 100, 5000])),
+                descending=bool(rng.random() < 0.5),
+            )
+            if rng.random() < 0.5:
+                request.start_time.FromNanoseconds(int(rng.integers(0, span)))
+            if rng.random() < 0.5:
+                request.end_time.FromNanoseconds(int(rng.integers(0, span)))
+            if rng.random() < 0.4:
+                request.side = int(rng.integers(1, 3))
+            if rng.random() < 0.4:
+                request.symbols.extend(rng.choice(SYMBOLS + ["Z"], 2).tolist())
+            if rng.random() < 0.4:
+                request.min_pnl = float(rng.integers(-5, 1))
+            if rng.random() < 0.4:
+                request.max_pnl = float(rng.integers(0, 5))
+            if sort_by := int(rng.integers(0, 6)):
+                request.sort_by = sort_by
+            assert collect(index, request) == expected(trades, request)
+
+
+@pytest.mark.parametrize("descending", [False, True])
+def test_time_bounds_with_duplicate_timestamps(descending: bool) -> None:
+    trades = np.zeros(12, dtype=TRADE_DTYPE)
+    trades["timestamp"] = [10, 10, 10, 20, 20, 20, 20, 30, 30, 30, 40, 40]
+    trades["pnl"] = np.arange(12)
+    trades["side"] = SIDE_CODES["BUY"]
+    index = TradeIndex(trades, SYMBOLS)
+    request = bt_pb2.QueryTradesRequest(limit=2, descending=descending)
+    # 시작은 포함, 끝은 제외
+    request.start_time.FromNanoseconds(20)
+    request.end_time.FromNanoseconds(40)
+    positions = collect(index, request)
+    assert positions == ([7, 8, 9, 3, 4, 5, 6] if descending else [3, 4, 5, 6, 7, 8, 9])
+    request.ClearField("page_token")
+    request.ClearField("include_total_count")
+    request.end_time.FromNanoseconds(20)
+    assert collect(index, request) == []
+
+
+def test_descending_ties_keep_execution_order() -> None:
+    trades = np.zeros(9, dtype=TRADE_DTYPE)
+    trades["pnl"] = [1, 3, 1, 3, 2, 3, 1, 2, 3]
+    trades["side"] = SIDE_CODES["SELL"]
+    index = TradeIndex(trades, SYMBOLS)
+    request = bt_pb2.QueryTradesRequest(
+        sort_by=bt_pb2.TRADE_SORT_FIELD_PNL, descending=True, limit=2
+    )
+    assert collect(index, request) == [1, 3, 5, 8, 4, 7, 0, 2, 6]
+
+
+def test_encodings_carry_the_same_trades() -> None:
+    trades = make_trades(50)
+    index = TradeIndex(trades, SYMBOLS, "bt-1")
+    request = bt_pb2.QueryTradesRequest(side=bt_pb2.TRADE_SIDE_SELL, limit=20)
+    rows = index.query(request)
+    assert len(rows.trades) == len(rows.trade_index)
+    for trade, position in zip(rows.trades, rows.trade_index):
+        row = trades[position]
+        assert trade.timestamp.ToNanoseconds() == row["timestamp"]
+        assert (trade.symbol, trade.side) == (SYMBOLS[row["symbol"]], "SELL")
+        assert (trade.pnl, trade.price) == (row["pnl"], row["price"])
+
+    request.encoding = bt_pb2.RESULT_ENCODING_COLUMNAR
+    columns = index.query(request)
+    assert not columns.trades and list(columns.trade_index) == list(rows.trade_index)
+    view = trade_view(columns.trade_columns)
+    np.testing.assert_array_equal(view.to_records(), trades[list(rows.trade_index)])
+    # encoding 은 지문에 포함되지 않음
+    request.page_token = rows.next_page_token
+    assert index.query(request).trade_index
+
+
+def test_invalid_requests() -> None:
+    index = TradeIndex(make_trades(10), SYMBOLS)
+    for request in (
+        bt_pb2.QueryTradesRequest(limit=0),
+        bt_pb2.QueryTradesRequest(sort_by=99),
+        bt_pb2.QueryTradesRequest(min_pnl=1.0, max_pnl=0.0),
+    ):
+        with pytest.raises(ValueError):
+            index.query(request)
+    big = TradeIndex(make_trades(MAX_LIMIT + 10), SYMBOLS)
+    page = big.query(bt_pb2.QueryTradesRequest(limit=MAX_LIMIT * 2))
+    assert len(page.trade_index) == MAX_LIMIT and page.next_page_token
+
+
+def test_token_rejects_other_queries_and_tampering() -> None:
+    trades = make_trades(100)
+    index = TradeIndex(trades, SYMBOLS, "bt-1")
+    request = bt_pb2.QueryTradesRequest(
+        backtest_id="bt-1", user_id="u", sort_by=bt_pb2.TRADE_SORT_FIELD_PNL, limit=5
+    )
+    token = index.query(request).next_page_token
+    assert decode_page_token(token, request) == index.query(request).trade_index[-1]
+
+    for changes in (
+        {"backtest_id": "bt-2"},
+        {"descending": True},
+        {"sort_by": bt_pb2.TRADE_SORT_FIELD_PRICE},
+        {"min_pnl": -1.0},
+        {"symbols": ["A"]},
+        {"side": bt_pb2.TRADE_SIDE_BUY},
+    ):
+        changed = bt_pb2.QueryTradesRequest()
+        changed.CopyFrom(request)
+        for name, value in changes.items():
+            if name == "symbols":
+                changed.symbols.extend(value)
+            else:
+                setattr(changed, name, value)
+        changed.page_token = token
+        with pytest.raises(ValueError):
+            index.query(changed)
+
+    # user_id / limit 는 지문에 포함되지 않음
+    same = bt_pb2.QueryTradesRequest()
+    same.CopyFrom(request)
+    same.user_id, same.limit, same.page_token = "v", 50, token
+    assert index.query(same).trade_index
+
+    raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+    bad_version = bytes([raw[0] + 1]) + raw[1:]
+    bad_fingerprint = raw[:1] + bytes([raw[1] ^ 0xFF]) + raw[2:]
+    summary_request = bt_pb2.ListBacktestsRequest(user_id="u")
+    for bad in (
+        "not a token!",
+        token[:10],
+        token + "AAAA",
+        base64.urlsafe_b64encode(bad_version).decode(),
+        base64.urlsafe_b64encode(bad_fingerprint).decode(),
+        # 범위를 벗어난 체결 순서 / 다른 백테스트 크기
+        encode_page_token(len(trades), request),
+        encode_page_token(-1, request),
+        # ListBacktests 가 발급한 토큰
+        pagination.encode_page_token(pagination.PageCursor(5, "bt-1"), summary_request),
+    ):
+        request.page_token = bad
+        with pytest.raises(ValueError):
+            index.query(request)
+
+
+class _Stub:
+    def __init__(self, index: TradeIndex) -> None:
+        self.index = index
+        self.requests: list[bt_pb2.QueryTradesRequest] = []
+
+    def QueryTrades(self, request, timeout=None):
+        self.requests.append(bt_pb2.QueryTradesRequest())
+        self.requests[-1].CopyFrom(request)
+        return self.index.query(request)
+
+
+def test_iter_trades() -> None:
+    trades = make_trades(230)
+    stub = _Stub(TradeIndex(trades, SYMBOLS, "bt-1"))
+    request = bt_pb2.QueryTradesRequest(
+        backtest_id="bt-1", limit=50, encoding=bt_pb2.RESULT_ENCODING_COLUMNAR
+    )
+    got = list(iter_trades(stub, request))
+    assert [t.timestamp.ToNanoseconds() for t in got] == trades["timestamp"].tolist()
+    assert len(stub.requests) == 5
+    assert all(not r.HasField("encoding") for r in stub.requests)
+    assert all(r.include_total_count is False for r in stub.requests[1:])
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from mysingle_protos.market_data.scheduler import Priority, ProviderBudget, UpstreamScheduler
+
+
+def run(coro):
+    return asyncio.run(asyncio.wait_for(coro, timeout=10))
+
+
+@pytest.mark.parametrize("priority", list(Priority))
+def test_every_priority_completes_with_default_budget(priority: Priority) -> None:
+    async def main() -> list[str]:
+        scheduler = UpstreamScheduler({"p": ProviderBudget(50.0)})
+        try:
+            results = []
+            for i in range(3):
+                call = lambda i=i: asyncio.sleep(0, f"r{i}")  # noqa: E731
+                results.append(await scheduler.submit("p", i, call, priority))
+            return results
+        finally:
+            await scheduler.close()
+
+    assert run(main()) == ["r0", "r1", "r2"]
+
+
+@pytest.mark.parametrize("burst", [1.0, 1.1, 1.25, 2.0, 10.0])
+def test_batch_completes_for_small_bursts(burst: float) -> None:
+    async def main() -> str:
+        scheduler = UpstreamScheduler({"p": ProviderBudget(100.0, burst=burst)})
+        try:
+            return await scheduler.submit(
+                "p", "k", lambda: asyncio.sleep(0, "ok"), Priority.BATCH
+            )
+        finally:
+            await scheduler.close()
+
+    assert run(main()) == "ok"
+
+
+def test_interactive_overtakes_queued_batch() -> None:
+    async def main() -> list[str]:
+        scheduler = UpstreamScheduler({"p": ProviderBudget(20.0, burst=1.0)})
+        order: list[str] = []
+
+        def call(name: str):
+            async def fetch() -> str:
+                order.append(name)
+                return name
+
+            return fetch
+
+        try:
+            # 버킷을 비운 뒤 batch 를 먼저, interactive 를 나중에 대기열에 넣음
+            await scheduler.submit("p", "first", call("first"))
+            batch = asyncio.ensure_future(
+                scheduler.submit("p", "batch", call("batch"), Priority.BATCH)
+            )
+            await asyncio.sleep(0)
+            interactive = asyncio.ensure_future(
+                scheduler.submit("p", "interactive", call("interactive"))
+            )
+            await asyncio.gather(batch, interactive)
+            return order
+        finally:
+            await scheduler.close()
+
+    assert run(main()) == ["first", "interactive", "batch"]
+
+
+def test_identical_keys_are_coalesced() -> None:
+    async def main() -> tuple[list[str], int]:
+        scheduler = UpstreamScheduler({"p": ProviderBudget(100.0, burst=5.0)})
+        calls = 0
+
+        async def fetch() -> str:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "bars"
+
+        try:
+            results = await asyncio.gather(
+                *(scheduler.submit("p", ("daily", "AAPL"), fetch, p) for p in Priority)
+            )
+            return results, calls
+        finally:
+            await scheduler.close()
+
+    results, calls = run(main())
+    assert results == ["bars"] * len(Priority)
+    assert calls == 1
+
+
+def test_close_cancels_calls_in_flight() -> None:
+    async def main() -> None:
+        scheduler = UpstreamScheduler({"p": ProviderBudget(100.0, burst=2.0)})
+        started = asyncio.Event()
+
+        async def slow() -> str:
+            started.set()
+            await asyncio.sleep(60)
+            return "late"
+
+        running = asyncio.ensure_future(scheduler.submit("p", "slow", slow))
+        queued = asyncio.ensure_future(
+            scheduler.submit("p", "queued", lambda: asyncio.sleep(0), Priority.BATCH)
+        )
+        await started.wait()
+        await scheduler.close()
+        for call in (running, queued):
+            with pytest.raises(asyncio.CancelledError):
+                await call
+        assert scheduler.stats().providers[0].in_flight == 0
+
+    run(main())
+
+
+def test_default_budget_holds_tokens_back_for_interactive() -> None:
+    async def main() -> None:
+        scheduler = UpstreamScheduler({"p": ProviderBudget(0.5)})
+        started: list[str] = []
+
+        def call(name: str):
+            async def fetch() -> str:
+                started.append(name)
+                return name
+
+            return fetch
+
+        try:
+            batch = [
+                asyncio.ensure_future(scheduler.submit("p", i, call(f"b{i}"), Priority.BATCH))
+                for i in range(10)
+            ]
+            await asyncio.sleep(0.05)
+            # burst 5 중 reserve 1 토큰은 batch 가 쓰지 못함
+            assert len(started) == 4
+            interactive = scheduler.submit("p", "i", call("i"))
+            assert await asyncio.wait_for(interactive, 0.5) == "i"
+        finally:
+            await scheduler.close()
+        await asyncio.gather(*batch, return_exceptions=True)
+
+    run(main())
+
+
+def test_in_flight_slot_is_reserved_for_interactive() -> None:
+    async def main() -> None:
+        scheduler = UpstreamScheduler({"p": ProviderBudget(1000.0, max_in_flight=2)})
+        release = asyncio.Event()
+        started: list[str] = []
+
+        def call(name: str):
+            async def fetch() -> str:
+                started.append(name)
+                if name.startswith("b"):
+                    await release.wait()
+                return name
+
+            return fetch
+
+        try:
+            batch = [
+                asyncio.ensure_future(scheduler.submit("p", i, call(f"b{i}"), Priority.BATCH))
+                for i in range(3)
+            ]
+            await asyncio.sleep(0.05)
+            assert started == ["b0"]
+            # batch 가 슬롯을 막고 있어도 interactive 는 예약 슬롯으로 바로 실행
+            interactive = scheduler.submit("p", "i", call("i"))
+            assert await asyncio.wait_for(interactive, 0.5) == "i"
+            release.set()
+            assert await asyncio.gather(*batch) == ["b0", "b1", "b2"]
+        finally:
+            await scheduler.close()
+
+    run(main())
+
+
+def test_single_slot_budget_still_runs_batch() -> None:
+    async def main() -> str:
+        budget = ProviderBudget(1000.0, max_in_flight=1)
+        scheduler = UpstreamScheduler({"p": budget})
+        try:
+            return await scheduler.submit("p", "k", lambda: asyncio.sleep(0, "ok"), Priority.BATCH)
+        finally:
+            await scheduler.close()
+
+    assert run(main()) == "ok"